@@ -0,0 +1,52 @@
+import argparse
+import collections
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.analysis import Analyzer, covers, overlaps  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def pairwise(analyzer, sample):
+    start = time.perf_counter()
+
+    for rule in analyzer.rules[-sample:]:
+        for other in analyzer.rules[:rule.position]:
+            covers(other, rule) or overlaps(other, rule)
+
+    return (time.perf_counter() - start) / sample * len(analyzer.rules) / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shadowed, redundant and correlated rule detection')
+    parser.add_argument('--rules', type=int, default=50000)
+    parser.add_argument('--sample', type=int, default=20)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(args.rules))
+    chain = rule_set['filter']['FORWARD']
+
+    start = time.perf_counter()
+    analyzer = Analyzer(chain)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    anomalies = analyzer.anomalies()
+    analysis_time = time.perf_counter() - start
+
+    print('{} rules, {}'.format(args.rules, dict(collections.Counter(anomaly.kind for anomaly in anomalies))))
+    print('{:<28} {:>10}'.format('step', 'seconds'))
+    print('{:<28} {:>10.2f}'.format('index build', build_time))
+    print('{:<28} {:>10.2f}'.format('analysis', analysis_time))
+    print('{:<28} {:>10.2f}'.format('pairwise (extrapolated)', pairwise(analyzer, args.sample)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.batch import BatchTranslator, find_hosts  # noqa: E402
+from synthetic import write_dump  # noqa: E402
+
+SINGLE = 'import sys; from firewall_translator.batch import translate; translate(sys.argv[1], sys.argv[2])'
+
+
+def per_process(hosts):
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+
+    for host, path in hosts:
+        subprocess.run([sys.executable, '-c', SINGLE, host, path], check=True, env=environment)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='One process per host versus a batch worker pool')
+    parser.add_argument('--hosts', type=int, default=100)
+    parser.add_argument('--rules', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(args.hosts):
+            write_dump(os.path.join(directory, 'host{:05}.txt'.format(index)), args.rules)
+
+        hosts = find_hosts([directory])
+
+        start = time.perf_counter()
+        per_process(hosts)
+        processes = time.perf_counter() - start
+
+        report = BatchTranslator(args.workers).run(hosts)
+
+    print('{} hosts x {} rules, {} workers on {} cores'.format(args.hosts, args.rules, args.workers, os.cpu_count()))
+    print('{:<18} {:>8.2f} s  {:>8.1f} hosts/s'.format('process per host', processes, args.hosts / processes))
+    print('{:<18} {:>8.2f} s  {:>8.1f} hosts/s'.format('batch', report.seconds, report.hosts_per_second))
+
+
+if __name__ == '__main__':
+    main()
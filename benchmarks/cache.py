@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.cache import ParseCache  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import write_dump  # noqa: E402
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def parse(file_path):
+    rule_set = RuleSet()
+    rule_set.read_from_file(file_path)
+    return rule_set
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse an iptables-save dump with and without the parse cache')
+    parser.add_argument('--rules', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'dump.txt')
+        write_dump(file_path, args.rules)
+        parse_cache = ParseCache(os.path.join(directory, 'cache'))
+
+        parsed, parse_time = timed(parse, file_path)
+        cold, cold_time = timed(parse_cache.read_from_file, file_path)
+        warm, warm_time = timed(parse_cache.read_from_file, file_path)
+        size = parse_cache.entries()[0].size
+
+    if str(warm) != str(parsed):
+        raise RuntimeError('Cached rule set differs from the parsed one')
+
+    print('{} rules, {:.1f} MiB cache entry'.format(args.rules, size / 2 ** 20))
+    print('{:<10} {:>8.2f} s'.format('parse', parse_time))
+    print('{:<10} {:>8.2f} s'.format('miss', cold_time))
+    print('{:<10} {:>8.2f} s  ({:.1f}x)'.format('hit', warm_time, parse_time / warm_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.classifier import Classifier, Packet  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+INTERFACES = ['internet', 'lan', 'wan']
+
+
+def random_packet(generator, rules):
+    index = generator.randrange(rules)
+    return Packet(
+        generator.choice(INTERFACES),
+        generator.choice(INTERFACES),
+        '10.{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255, index & 255),
+        '10.{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255, generator.randrange(256)),
+        generator.choice(['tcp', 'udp', 'icmp']),
+        generator.randrange(1024, 65536),
+        1 + index % 65535,
+    )
+
+
+def measure(classifier, packets):
+    start = time.perf_counter()
+    for packet in packets:
+        classifier.evaluate('FORWARD', packet)
+    return (time.perf_counter() - start) / len(packets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Packet classification latency on a synthetic chain')
+    parser.add_argument('--rules', type=int, default=50000)
+    parser.add_argument('--packets', type=int, default=2000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(args.rules))
+
+    generator = random.Random(0)
+    packets = [random_packet(generator, args.rules) for _ in range(args.packets)]
+
+    indexed = Classifier(rule_set)
+    start = time.perf_counter()
+    indexed.compile('FORWARD')
+    compile_time = time.perf_counter() - start
+
+    linear = Classifier(rule_set, indexed=False)
+    linear.compile('FORWARD')
+
+    for packet in packets[:50]:
+        assert repr(indexed.evaluate('FORWARD', packet)) == repr(linear.evaluate('FORWARD', packet))
+
+    print('{} rules in FORWARD, compiled in {:.2f} s'.format(args.rules, compile_time))
+    print('{:<10} {:>14}'.format('mode', 'ms/packet'))
+    print('{:<10} {:>14.4f}'.format('indexed', measure(indexed, packets) * 1000))
+    print('{:<10} {:>14.4f}'.format('linear', measure(linear, packets[:max(1, args.packets // 20)]) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import collections
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.columnar import INTERFACE_OPTIONS, ColumnarRuleSet  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def parse(lines):
+    rule_set = RuleSet()
+    rule_set.read_lines(lines)
+    return rule_set
+
+
+def count_by_action(rule_set):
+    return collections.Counter(rule.action for table in rule_set for chain in table for rule in chain)
+
+
+def count_by_interface(rule_set):
+    counts = collections.Counter()
+
+    for table in rule_set:
+        for chain in table:
+            for rule in chain:
+                counts.update(set(value for option, value in rule.match_params if option in INTERFACE_OPTIONS))
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare rule set statistics on objects and on columns')
+    parser.add_argument('--rules', type=int, default=200000)
+    args = parser.parse_args()
+
+    lines = list(dump_lines(args.rules))
+
+    tracemalloc.start()
+    rule_set = parse(lines)
+    objects_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    columns, build_time = timed(ColumnarRuleSet, rule_set)
+    restored, restore_time = timed(columns.to_rule_set)
+
+    if str(restored) != str(rule_set):
+        raise RuntimeError('Columnar round trip differs from the parsed rule set')
+
+    print('{} rules'.format(args.rules))
+    print('objects {:>8.1f} MiB, {:.0f} bytes/rule'.format(objects_size / 2 ** 20, objects_size / args.rules))
+    print('columns {:>8.1f} MiB, {:.0f} bytes/rule'.format(columns.nbytes / 2 ** 20, columns.nbytes / args.rules))
+    print('to columns {:.2f} s, to objects {:.2f} s'.format(build_time, restore_time))
+    print('{:<20} {:>8} {:>8}'.format('query', 'objects', 'columns'))
+
+    for name, naive, vectorized in [
+        ('count by action', count_by_action, columns.count_by_action),
+        ('count by interface', count_by_interface, columns.count_by_interface),
+    ]:
+        expected, naive_time = timed(naive, rule_set)
+        result, vectorized_time = timed(vectorized)
+
+        if result != dict(expected):
+            raise RuntimeError('{} differs between objects and columns'.format(name))
+
+        print('{:<20} {:>7.3f}s {:>7.3f}s  ({:.0f}x)'.format(name, naive_time, vectorized_time,
+                                                           naive_time / vectorized_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.diff import diff  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def edited_lines(count, edits, seed):
+    generator = random.Random(seed)
+    lines = list(dump_lines(count))
+    first = lines.index('COMMIT') - count
+    live = count
+
+    for _ in range(edits):
+        operation = generator.randrange(3) if live else 0
+
+        if operation == 0:
+            lines.insert(generator.randrange(first, first + live + 1),
+                         '-A FORWARD -s 192.168.{}.{}/32 -j DROP'.format(generator.randrange(256),
+                                                                        generator.randrange(256)))
+            live += 1
+        elif operation == 1:
+            del lines[generator.randrange(first, first + live)]
+            live -= 1
+        else:
+            rule = lines.pop(generator.randrange(first, first + live))
+            lines.insert(generator.randrange(first, first + live), rule)
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two rule sets with one large chain')
+    parser.add_argument('--rules', type=int, default=100000)
+    parser.add_argument('--edits', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    old = RuleSet()
+    old.read_lines(dump_lines(args.rules))
+
+    print('{} rules'.format(args.rules))
+    print('{:>8} {:>10} {:>10}'.format('edits', 'commands', 'seconds'))
+
+    for edits in args.edits:
+        new = RuleSet()
+        new.read_lines(edited_lines(args.rules, edits, args.seed))
+
+        start = time.perf_counter()
+        commands = diff(old, new).commands()
+        elapsed = time.perf_counter() - start
+
+        print('{:>8} {:>10} {:>10.2f}'.format(edits, len(commands), elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import compileall
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+
+PROBE = '''
+import sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+with open('/proc/self/status') as f:
+    rss = [line.split()[1] for line in f if line.startswith('VmRSS:')][0]
+print(elapsed, rss)
+'''
+
+
+def write_eager_module(directory):
+    from firewall_translator import iana
+
+    with open(os.path.join(directory, 'eager_iana.py'), 'w') as f:
+        f.write('from firewall_translator.generic import Protocol, Service\n\n')
+        f.write('PROTOCOLS = {\n')
+        for name, protocol in sorted(iana.PROTOCOLS.items()):
+            f.write('    \'{}\': Protocol({}, \'{}\'),\n'.format(name, protocol.number, name))
+        f.write('}\n')
+        f.write('SERVICES = {\n')
+        for protocol, services in sorted(iana.SERVICES.items()):
+            f.write('    \'{}\': {{\n'.format(protocol))
+            for name, service in sorted(services.items()):
+                f.write('        \'{}\': Service(PROTOCOLS[\'{}\'], {}, \'{}\'),\n'.format(
+                    name, protocol, service.number, name))
+            f.write('    },\n')
+        f.write('}\n')
+
+
+def measure(statement, path):
+    times = []
+    rss = []
+
+    for _ in range(RUNS):
+        output = subprocess.check_output(
+            [sys.executable, '-c', PROBE.format(path=path, statement=statement)], cwd=ROOT)
+        elapsed, maxrss = output.split()
+        times.append(float(elapsed))
+        rss.append(int(maxrss))
+
+    return min(times), min(rss)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, ROOT)
+        write_eager_module(directory)
+        compileall.compile_dir(directory, quiet=1)
+        compileall.compile_dir(os.path.join(ROOT, 'firewall_translator'), quiet=1)
+
+        cases = [
+            ('baseline (generic only)', 'import firewall_translator.generic', ROOT),
+            ('eager literal module', 'import eager_iana; eager_iana.SERVICES["tcp"]["https"]', directory),
+            ('lazy registry', 'from firewall_translator import iana; iana.SERVICES["tcp"]["https"]', ROOT),
+            ('lazy registry, .py fallback',
+             'from firewall_translator import iana\n'
+             'iana.ServiceRegistries(iana.load_module()[1])["tcp"]["https"]', ROOT),
+            ('lazy registry, all loaded',
+             'from firewall_translator import iana\n'
+             'for s in iana.SERVICES.values(): list(s.values())', ROOT),
+        ]
+
+        print('{:<30} {:>12} {:>12}'.format('case', 'import ms', 'RSS KiB'))
+        for name, statement, path in cases:
+            elapsed, maxrss = measure(statement, path)
+            print('{:<30} {:>12.2f} {:>12}'.format(name, elapsed * 1000, maxrss))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def load(count):
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(count))
+    return rule_set
+
+
+def pairwise(rules, others):
+    others = [str(other) for other in others]
+    return sum(1 for rule in rules if str(rule) in others)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Deduplicate and intersect rule sets through rule identity')
+    parser.add_argument('--rules', type=int, default=200000)
+    parser.add_argument('--sample', type=int, default=2000)
+    args = parser.parse_args()
+
+    first = load(args.rules)
+    second = load(args.rules // 2)
+
+    start = time.perf_counter()
+    common = first.intersection(second)
+    intersected = time.perf_counter() - start
+
+    start = time.perf_counter()
+    removed = first.deduplicate()
+    deduplicated = time.perf_counter() - start
+
+    rules = first['filter']['FORWARD'].rules
+    others = second['filter']['FORWARD'].rules
+    start = time.perf_counter()
+    pairwise(rules[-args.sample:], others)
+    naive = (time.perf_counter() - start) * len(rules) / args.sample
+
+    print('{} and {} rules'.format(args.rules, args.rules // 2))
+    print('{:<24} {:>10.2f} s  {} common rules'.format('intersection', intersected,
+                                                        len(common['filter']['FORWARD'])))
+    print('{:<24} {:>10.2f} s  {} duplicates removed'.format('deduplicate', deduplicated, removed))
+    print('{:<24} {:>10.0f} s  (estimated)'.format('pairwise intersection', naive))
+
+
+if __name__ == '__main__':
+    main()
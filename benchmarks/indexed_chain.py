@@ -0,0 +1,101 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import Chain, IndexedChain, Rule, RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def edits(rules, count, seed):
+    generator = random.Random(seed)
+    size = len(rules)
+    operations = []
+
+    for index in range(count):
+        operation = generator.choice(['insert', 'delete', 'replace', 'find'])
+        rule = Rule.from_cli('-s 192.168.{}.{}/32 -j DROP'.format(index // 256 % 256, index % 256))
+
+        if operation == 'insert':
+            operations.append((operation, generator.randrange(size + 1), rule))
+            size += 1
+        elif operation == 'delete':
+            operations.append((operation, None, rules[generator.randrange(len(rules))]))
+        elif operation == 'replace':
+            operations.append((operation, generator.randrange(size), rule))
+        else:
+            operations.append((operation, None, rules[generator.randrange(len(rules))]))
+
+    return operations
+
+
+def apply(chain, operations):
+    for operation, position, rule in operations:
+        if operation == 'insert':
+            chain.insert(rule, position)
+        elif operation == 'replace':
+            chain[min(position, len(chain) - 1)] = rule
+        else:
+            try:
+                if operation == 'find':
+                    chain.index(rule)
+                else:
+                    chain.delete(rule)
+            except ValueError:
+                pass
+
+
+def drain(chain, seed):
+    generator = random.Random(seed)
+
+    for _ in range(len(chain) * 9 // 10):
+        del chain[generator.randrange(len(chain))]
+
+    for position in range(len(chain)):
+        chain.position(chain.handle(position))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply random edits to a large chain')
+    parser.add_argument('--rules', type=int, default=100000)
+    parser.add_argument('--edits', type=int, default=10000)
+    parser.add_argument('--sample', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(args.rules))
+    rules = rule_set['filter']['FORWARD'].rules
+    operations = edits(rules, args.edits, args.seed)
+
+    print('{} rules, {} edits'.format(args.rules, args.edits))
+
+    start = time.perf_counter()
+    chain = IndexedChain('FORWARD', list(rules))
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    apply(chain, operations)
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    apply(Chain('FORWARD', list(rules)), operations[:args.sample])
+    plain = (time.perf_counter() - start) * args.edits / args.sample
+
+    start = time.perf_counter()
+    drain(chain, args.seed)
+    drained = time.perf_counter() - start
+
+    print('{:<14} {:>10.2f} s  (+{:.2f} s to build)'.format('IndexedChain', indexed, built))
+    print('{:<14} {:>10.2f} s  (estimated from {} edits)'.format('Chain', plain, args.sample))
+    print('{:<14} {:>10.2f} s  (delete 90%, then look up every rule; {} blocks left)'.format('drain', drained,
+                                                                                       len(chain.blocks)))
+
+
+if __name__ == '__main__':
+    main()
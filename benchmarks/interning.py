@@ -0,0 +1,53 @@
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RULES = 100000
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.generic import Action, Interface, Protocol  # noqa: E402
+
+INTERFACES = ['lan', 'wan', 'internet', 'dmz']
+PROTOCOLS = [(6, 'tcp'), (17, 'udp'), (1, 'icmp')]
+ACTIONS = [(True, False, False), (False, False, False), (False, True, False)]
+
+
+def build(interface, protocol, action):
+    model = []
+
+    for index in range(RULES):
+        model.append((
+            interface(INTERFACES[index % 4]),
+            interface(INTERFACES[(index + 1) % 4]),
+            protocol(*PROTOCOLS[index % 3]),
+            action(*ACTIONS[index % 3]),
+        ))
+
+    return model
+
+
+def measure(interface, protocol, action):
+    gc.collect()
+    tracemalloc.start()
+    model = build(interface, protocol, action)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del model
+    return size
+
+
+def main():
+    fresh = measure(Interface, Protocol, Action)
+    interned = measure(Interface.intern, Protocol.intern, Action.intern)
+
+    print('{} rules, 2 interfaces + protocol + action each'.format(RULES))
+    print('{:<12} {:>12} {:>12}'.format('case', 'MiB', 'bytes/rule'))
+    print('{:<12} {:>12.1f} {:>12.1f}'.format('fresh', fresh / 2 ** 20, fresh / RULES))
+    print('{:<12} {:>12.1f} {:>12.1f}'.format('interned', interned / 2 ** 20, interned / RULES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.ipsets import extract_sets, restore_script  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+
+
+def blocklist_lines(count, seed=0):
+    generator = random.Random(seed)
+
+    yield '*filter'
+    yield ':INPUT DROP [0:0]'
+    yield '-A INPUT -i lo -j ACCEPT'
+
+    for address in generator.sample(range(1 << 24, 224 << 24), count):
+        yield '-A INPUT -s {}.{}.{}.{}/32 -j DROP'.format(address >> 24, address >> 16 & 255, address >> 8 & 255,
+                                                           address & 255)
+
+    for port in [22, 80, 443]:
+        yield '-A INPUT -p tcp -m tcp --dport {} -j ACCEPT'.format(port)
+
+    yield 'COMMIT'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Modeled evaluation cost of an address blocklist before and after '
+                                                 'ipset extraction')
+    parser.add_argument('--addresses', type=int, default=20000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(blocklist_lines(args.addresses))
+
+    start = time.perf_counter()
+    extraction, = [extraction for extraction in extract_sets(rule_set) if extraction.chain.name == 'INPUT']
+    extract_time = time.perf_counter() - start
+    script = restore_script([extraction])
+
+    print('{} -> {} rules, {} set(s), {} script lines, extracted in {:.2f} s'.format(
+        len(extraction.chain), len(extraction.extracted), len(extraction.sets), script.count('\n'), extract_time))
+    print('{:<8} {:>12} {:>12}'.format('', 'worst', 'average'))
+    print('{:<8} {:>12} {:>12.1f}'.format('before', extraction.before.worst, extraction.before.average))
+    print('{:<8} {:>12} {:>12.1f}'.format('after', extraction.after.worst, extraction.after.average))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import datetime
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COUNT = 100000
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator import generic  # noqa: E402
+
+DATE = datetime.datetime(2018, 1, 24)
+TIME = datetime.time(8, 0)
+
+CASES = [
+    (generic.Action, lambda i: (True, False, False)),
+    (generic.Interface, lambda i: ('lan',)),
+    (generic.IPAddress, lambda i: ('10.{}.{}.0/24'.format(i >> 8 & 255, i & 255),)),
+    (generic.Protocol, lambda i: (6, 'tcp')),
+    (generic.Service, lambda i: (None, i & 65535, 'service')),
+    (generic.AbsoluteTimeRange, lambda i: (DATE, DATE)),
+    (generic.PeriodicTimeRange, lambda i: (TIME, TIME)),
+]
+
+
+def unslotted(cls):
+    namespace = {key: value for key, value in vars(cls).items() if key != '__slots__' and key not in cls.__slots__}
+    return type(cls.__name__, (), namespace)
+
+
+def bytes_per_object(cls, arguments):
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(*arguments(i)) for i in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / COUNT - 8
+
+
+def main():
+    print('{:<20} {:>14} {:>14}'.format('class', '__dict__ B/obj', 'slots B/obj'))
+
+    for cls, arguments in CASES:
+        before = bytes_per_object(unslotted(cls), arguments)
+        after = bytes_per_object(cls, arguments)
+        print('{:<20} {:>14.1f} {:>14.1f}'.format(cls.__name__, before, after))
+
+
+if __name__ == '__main__':
+    main()
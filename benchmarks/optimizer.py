@@ -0,0 +1,68 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from firewall_translator.optimizer import Optimizer  # noqa: E402
+
+
+def generated_lines(count, seed=0):
+    generator = random.Random(seed)
+    lines = 0
+
+    yield '*filter'
+    yield ':FORWARD DROP [0:0]'
+
+    while lines < count:
+        block = generator.randrange(1 << 16)
+        run = generator.choice([4, 8, 16, 32])
+
+        if generator.random() < 0.5:
+            port = generator.choice([22, 80, 443, 3306])
+            for host in range(run):
+                yield '-A FORWARD -d 10.{}.{}.{}/32 -i internet -o lan -p tcp -m tcp --dport {} -j ACCEPT'.format(
+                    block >> 8, block & 255, host, port)
+        else:
+            start = generator.randrange(1024, 60000)
+            for port in range(start, start + run):
+                yield '-A FORWARD -s 10.{}.{}.0/24 -i lan -o internet -p udp -m udp --dport {} -j ACCEPT'.format(
+                    block >> 8, block & 255, port)
+
+        yield '-A FORWARD -s 10.{}.{}.0/24 -j LOG'.format(block >> 8, block & 255)
+        lines += run + 1
+
+    yield 'COMMIT'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CIDR and port aggregation on a generated chain')
+    parser.add_argument('--rules', type=int, default=50000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(generated_lines(args.rules))
+    chain = rule_set['filter']['FORWARD']
+
+    start = time.perf_counter()
+    optimization = Optimizer().optimize(chain)
+    optimize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    optimization.verify()
+    verify_time = time.perf_counter() - start
+
+    print('{} -> {} rules in {:.2f} s, verified in {:.2f} s'.format(len(chain), len(optimization.optimized),
+                                                                     optimize_time, verify_time))
+    print('{:<8} {:>12} {:>12}'.format('', 'worst', 'average'))
+    print('{:<8} {:>12} {:>12.1f}'.format('before', optimization.before.worst, optimization.before.average))
+    print('{:<8} {:>12} {:>12.1f}'.format('after', optimization.after.worst, optimization.after.average))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import rule_lines  # noqa: E402
+
+
+def dump_lines(count, tables):
+    lines = []
+
+    for table in tables:
+        lines.append('*{}'.format(table))
+        lines.append(':FORWARD ACCEPT [0:0]')
+        lines.extend(rule_lines(count))
+        lines.append('COMMIT')
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serial versus per-table parallel parsing')
+    parser.add_argument('--rules', type=int, default=200000, help='rules per table')
+    parser.add_argument('--tables', nargs='+', default=['filter', 'nat', 'mangle'])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    lines = dump_lines(args.rules, args.tables)
+
+    start = time.perf_counter()
+    serial = RuleSet()
+    serial.read_lines(lines)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = RuleSet()
+    parallel.read_parallel(lines, args.workers)
+    parallel_time = time.perf_counter() - start
+
+    if str(parallel) != str(serial):
+        raise RuntimeError('Parallel parse differs from serial parse')
+
+    print('{} tables x {} rules, {} workers on {} cores'.format(len(args.tables), args.rules, args.workers,
+                                                                os.cpu_count()))
+    print('{:<10} {:>10.2f} s'.format('serial', serial_time))
+    print('{:<10} {:>10.2f} s  ({:.2f}x)'.format('parallel', parallel_time, serial_time / parallel_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from synthetic import write_dump
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import sys, time
+sys.path.insert(0, {root!r})
+from firewall_translator.iptables import RuleSet
+rule_set = RuleSet()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+with open('/proc/self/status') as f:
+    status = dict(line.split(':', 1) for line in f)
+print(elapsed, status['VmRSS'].split()[0], status['VmHWM'].split()[0])
+'''
+
+CASES = [
+    ('read(f.read())', 'with open({path!r}) as f: rule_set.read(f.read())'),
+    ('read_from_file (streaming)', 'rule_set.read_from_file({path!r})'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Peak RSS of parsing a synthetic iptables-save dump')
+    parser.add_argument('--rules', type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'iptables-save.txt')
+        write_dump(path, args.rules)
+
+        print('{} rules, {:.1f} MiB dump'.format(args.rules, os.path.getsize(path) / 2 ** 20))
+        print('{:<28} {:>10} {:>14} {:>14}'.format('case', 'seconds', 'model RSS MiB', 'peak RSS MiB'))
+
+        for name, statement in CASES:
+            output = subprocess.check_output([sys.executable, '-c', PROBE.format(
+                root=ROOT, statement=statement.format(path=path))])
+            elapsed, rss, hwm = output.split()
+            print('{:<28} {:>10.2f} {:>14.1f} {:>14.1f}'.format(name, float(elapsed), int(rss) / 1024, int(hwm) / 1024))
+
+
+if __name__ == '__main__':
+    main()
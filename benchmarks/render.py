@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def joined(rule_set, f):
+    f.write(str(rule_set))
+    f.write('\n')
+
+
+def streamed(rule_set, f):
+    rule_set.write(f)
+
+
+def measure(render, rule_set):
+    with open(os.devnull, 'w') as f:
+        tracemalloc.start()
+        start = time.perf_counter()
+        render(rule_set, f)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Peak memory of rendering iptables-restore output')
+    parser.add_argument('--rules', type=int, default=1000000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(args.rules))
+
+    print('{} rules'.format(args.rules))
+    print('{:<10} {:>10} {:>14}'.format('mode', 'seconds', 'peak MiB'))
+
+    for name, render in [('str()', joined), ('write()', streamed)]:
+        elapsed, peak = measure(render, rule_set)
+        print('{:<10} {:>10.2f} {:>14.2f}'.format(name, elapsed, peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE = os.path.join(ROOT, 'example', 'iptables-save.txt')
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import Rule, tokenize  # noqa: E402
+
+
+class BaselineRule:
+    match_params = None
+    action = None
+    action_params = None
+
+    def __init__(self, match_params=None, action=None, action_params=None):
+        self.match_params = match_params
+        self.action = action
+        self.action_params = action_params
+
+
+def split_zip(line):
+    operation, rule = line.split(' ', 1)
+    chain, rule = rule.split(' ', 1)
+
+    if '-j' in rule:
+        match_params, action = rule.split('-j')
+    else:
+        match_params = rule
+        action = None
+
+    match_params = match_params.strip().split(' ')
+    match_params = dict(zip(match_params[::2], match_params[1::2]))
+
+    action_params = None
+
+    if action:
+        action = action.strip()
+        if ' ' in action:
+            action, action_params = action.split(' ', 1)
+
+    if action_params:
+        action_params = action_params.strip().split(' ')
+        action_params = dict(zip(action_params[::2], action_params[1::2]))
+
+    return chain, match_params, action, action_params
+
+
+def tokenize_rule(line):
+    tokens = tokenize(line)
+    return tokens[0][1], Rule.from_tokens(tokens[1:])
+
+
+def split_zip_rule(line):
+    chain, match_params, action, action_params = split_zip(line)
+    return chain, BaselineRule(match_params, action, action_params)
+
+
+def measure(function, lines):
+    start = time.perf_counter()
+    for line in lines:
+        function(line)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rule line tokenizer throughput')
+    parser.add_argument('--lines', type=int, default=1000000)
+    args = parser.parse_args()
+
+    with open(EXAMPLE) as f:
+        rules = [line.rstrip('\n') for line in f if line.startswith('-A ')]
+
+    lines = list(itertools.islice(itertools.cycle(rules), args.lines))
+
+    print('{} rule lines'.format(len(lines)))
+    print('{:<28} {:>10} {:>12}'.format('case', 'seconds', 'lines/s'))
+
+    for name, function in [('split/zip', split_zip), ('tokenize', tokenize),
+                           ('split/zip + old Rule', split_zip_rule), ('tokenize + Rule', tokenize_rule)]:
+        elapsed = min(measure(function, lines) for _ in range(5))
+        print('{:<28} {:>10.2f} {:>12.0f}'.format(name, elapsed, len(lines) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import os
+import pickle
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator import serialize  # noqa: E402
+from firewall_translator.iptables import RuleSet, gc_paused  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def touch(rule_set):
+    for table in rule_set:
+        for chain in table:
+            chain.rules
+
+    return rule_set
+
+
+def pickle_dumps(rule_set):
+    return pickle.dumps(rule_set, pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_loads_paused(data):
+    with gc_paused():
+        return pickle.loads(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the binary rule set encoding against pickle')
+    parser.add_argument('--rules', type=int, default=100000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(list(dump_lines(args.rules)))
+    expected = str(rule_set)
+
+    print('{} rules'.format(args.rules))
+    print('{:<16} {:>8} {:>8} {:>8} {:>14}'.format('', 'MiB', 'dump s', 'load s', 'load + rules s'))
+
+    encodings = [
+        ('pickle', pickle_dumps, pickle.loads),
+        ('pickle, gc off', pickle_dumps, pickle_loads_paused),
+        ('serialize', serialize.dumps, serialize.loads),
+    ]
+    load_times = {}
+
+    for name, dumps, loads in encodings:
+        data, dump_time = timed(dumps, rule_set)
+        loaded, load_time = timed(loads, data)
+        loaded, touch_time = timed(touch, loaded)
+
+        if str(loaded) != expected:
+            raise RuntimeError('{} round trip differs from the original rule set'.format(name))
+
+        load_times[name] = load_time, load_time + touch_time
+        print('{:<16} {:>8.1f} {:>8.2f} {:>8.2f} {:>14.2f}'.format(name, len(data) / 2 ** 20, dump_time, load_time,
+                                                                   load_time + touch_time))
+
+    for index, label in enumerate(['load', 'load + rules']):
+        print('{} speedup {:.1f}x over pickle, {:.1f}x over pickle with gc off'.format(
+            label, load_times['pickle'][index] / load_times['serialize'][index],
+            load_times['pickle, gc off'][index] / load_times['serialize'][index]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from firewall_translator.splitter import ChainSplitter  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rule evaluations per packet before and after chain splitting')
+    parser.add_argument('--rules', type=int, default=20000)
+    parser.add_argument('--prefix-length', type=int, default=24)
+    args = parser.parse_args()
+
+    print('{:<24} {:>8} {:>10} {:>12} {:>10}'.format('splitter', 'chains', 'worst', 'average', 'seconds'))
+
+    for splitter in [ChainSplitter(), ChainSplitter(prefix_length=args.prefix_length)]:
+        rule_set = RuleSet()
+        rule_set.read_lines(dump_lines(args.rules))
+
+        start = time.perf_counter()
+        split = splitter.split(rule_set['filter'], 'FORWARD')
+        elapsed = time.perf_counter() - start
+
+        print('{:<24} {:>8} {:>10} {:>12.1f} {:>10.2f}'.format('before', 1, split.before.worst, split.before.average,
+                                                               0))
+        print('{:<24} {:>8} {:>10} {:>12.1f} {:>10.2f}'.format(' '.join(splitter.options), len(split.chains) + 1,
+                                                               split.after.worst, split.after.average, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+
+def parse(count, interned):
+    rule_set = RuleSet()
+
+    if not interned:
+        rule_set.symbols = None
+
+    rule_set.read_lines(dump_lines(count))
+    return rule_set
+
+
+def measure(count, interned):
+    gc.collect()
+    start = time.perf_counter()
+    rule_set = parse(count, interned)
+    seconds = time.perf_counter() - start
+
+    del rule_set
+    gc.collect()
+
+    tracemalloc.start()
+    rule_set = parse(count, interned)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return rule_set, size, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure parsed rule set memory with and without interning')
+    parser.add_argument('--rules', type=int, default=1000000)
+    args = parser.parse_args()
+
+    print('{} rules'.format(args.rules))
+    print('{:<10} {:>10} {:>10} {:>8}'.format('', 'MiB', 'bytes/rule', 'parse s'))
+
+    sizes = {}
+    times = {}
+
+    for name, interned in [('fresh', False), ('interned', True)]:
+        rule_set, size, seconds = measure(args.rules, interned)
+        sizes[name] = size
+        times[name] = seconds
+        print('{:<10} {:>10.1f} {:>10.0f} {:>8.2f}'.format(name, size / 2 ** 20, size / args.rules, seconds))
+
+        if interned:
+            print('{:<10} {} symbols, {} pairs'.format('', len(rule_set.symbols), len(rule_set.symbols.pairs)))
+
+        del rule_set
+
+    print('interning saves {:.0f}% of memory, parse time {:.2f}x'.format(
+        100 - 100.0 * sizes['interned'] / sizes['fresh'], times['interned'] / times['fresh']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import itertools
+
+RULES = [
+    '-A FORWARD -d 10.{a}.{b}.{c}/32 -i internet -o lan -p tcp -m tcp --dport {port} -j ACCEPT',
+    '-A FORWARD -d 10.{a}.{b}.{c}/32 -i internet -o lan -p udp -m udp --dport {port} -j ACCEPT',
+    '-A FORWARD -s 172.16.{b}.0/24 -d 10.{a}.{b}.0/24 -i lan -o wan -j ACCEPT',
+    '-A FORWARD -s 10.{a}.{b}.{c}/32 -i lan -o internet -p tcp -m tcp --dport {port} -j ACCEPT',
+    '-A FORWARD -i lan -o internet -p udp -m udp --dport {port} -j REJECT --reject-with icmp-port-unreachable',
+    '-A FORWARD -s 10.{a}.{b}.0/24 -i lan -o internet -j ACCEPT',
+]
+
+
+def rule_lines(count):
+    for index, template in zip(range(count), itertools.cycle(RULES)):
+        yield template.format(a=index >> 16 & 255, b=index >> 8 & 255, c=index & 255, port=1 + index % 65535)
+
+
+def dump_lines(count):
+    yield '# Generated by iptables-save v1.6.1'
+    yield '*filter'
+    yield ':INPUT ACCEPT [0:0]'
+    yield ':FORWARD DROP [0:0]'
+    yield ':OUTPUT ACCEPT [0:0]'
+
+    for line in rule_lines(count):
+        yield line
+
+    yield 'COMMIT'
+    yield '# Completed'
+
+
+def write_dump(file_path, count):
+    with open(file_path, 'w') as f:
+        for line in dump_lines(count):
+            f.write(line)
+            f.write('\n')
@@ -0,0 +1,70 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+from firewall_translator.classifier import Classifier, Packet  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from firewall_translator.vectorized import BatchClassifier  # noqa: E402
+from synthetic import dump_lines  # noqa: E402
+
+INTERFACES = numpy.array(['internet', 'lan', 'wan'])
+
+
+def flows(count, rules, seed=0):
+    generator = numpy.random.default_rng(seed)
+    index = generator.integers(0, rules, count)
+
+    return {
+        'in_iface': INTERFACES[generator.integers(0, 3, count)],
+        'out_iface': INTERFACES[generator.integers(0, 3, count)],
+        'src': (10 << 24 | (index & 0xffffff)).astype(numpy.uint32),
+        'dst': (10 << 24 | (index & 0xffff00) | generator.integers(0, 256, count)).astype(numpy.uint32),
+        'proto': generator.choice(numpy.array([1, 6, 17], dtype=numpy.int16), count),
+        'sport': generator.integers(1024, 65536, count).astype(numpy.int32),
+        'dport': (1 + index % 65535).astype(numpy.int32),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized batch classification throughput')
+    parser.add_argument('--rules', type=int, default=1000)
+    parser.add_argument('--packets', type=int, default=1000000)
+    args = parser.parse_args()
+
+    rule_set = RuleSet()
+    rule_set.read_lines(dump_lines(args.rules))
+    columns = flows(args.packets, args.rules)
+
+    batch = BatchClassifier(rule_set)
+    batch.compile('FORWARD')
+    start = time.perf_counter()
+    result = batch.evaluate('FORWARD', **columns)
+    batch_time = time.perf_counter() - start
+
+    sample = min(args.packets, 20000)
+    classifier = Classifier(rule_set)
+    classifier.compile('FORWARD')
+    packets = [Packet(*[columns[field][index].item() for field in
+                        ['in_iface', 'out_iface', 'src', 'dst', 'proto', 'sport', 'dport']]) for index in range(sample)]
+
+    start = time.perf_counter()
+    verdicts = [classifier.evaluate('FORWARD', packet) for packet in packets]
+    single_time = (time.perf_counter() - start) / sample * args.packets
+
+    assert [verdict.action for verdict in verdicts] == result.verdicts[:sample].tolist()
+
+    print('{} rules, {} packets, verdicts {}'.format(args.rules, args.packets, result.counts()))
+    print('{:<26} {:>10} {:>14}'.format('mode', 'seconds', 'packets/s'))
+    print('{:<26} {:>10.2f} {:>14.0f}'.format('batch (numpy)', batch_time, args.packets / batch_time))
+    print('{:<26} {:>10.2f} {:>14.0f}'.format('per packet (extrapolated)', single_time, args.packets / single_time))
+
+
+if __name__ == '__main__':
+    main()
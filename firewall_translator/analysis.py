@@ -0,0 +1,366 @@
+import bisect
+
+from firewall_translator.classifier import (FIELDS, CompiledRule, ExactIndex, PrefixIndex, RangeIndex, bit_mask,
+                                           expand, lowest_bit)
+from firewall_translator.iptables import TERMINAL
+
+
+def value_covers(field, outer, inner):
+    if field == 'src' or field == 'dst':
+        return outer.version == inner.version and inner.subnet_of(outer)
+
+    if field == 'sport' or field == 'dport':
+        return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+    if field == 'in_iface' or field == 'out_iface':
+        if outer.endswith('+'):
+            return inner.startswith(outer[:-1])
+
+        return inner == outer
+
+    return inner == outer
+
+
+def value_overlaps(field, first, second):
+    if field == 'src' or field == 'dst':
+        return first.version == second.version and first.overlaps(second)
+
+    if field == 'sport' or field == 'dport':
+        return first[0] <= second[1] and second[0] <= first[1]
+
+    if field == 'in_iface' or field == 'out_iface':
+        if first.endswith('+'):
+            return value_covers(field, first, second) or value_covers(field, second, first)
+
+        return value_covers(field, second, first)
+
+    return first == second
+
+
+def values_cover(field, outer, inner):
+    return all(any(value_covers(field, value, other) for value in outer) for other in inner)
+
+
+def values_overlap(field, first, second):
+    return any(value_overlaps(field, value, other) for value in first for other in second)
+
+
+def covers(outer, inner):
+    for field, (negated, values) in outer.constraints.items():
+        constraint = inner.constraints.get(field)
+
+        if constraint is None or constraint[0] and not negated:
+            return False
+
+        if negated:
+            if constraint[0]:
+                if not values_cover(field, constraint[1], values):
+                    return False
+
+            elif values_overlap(field, values, constraint[1]):
+                return False
+
+        elif not values_cover(field, values, constraint[1]):
+            return False
+
+    return True
+
+
+def overlaps(first, second):
+    for field, (negated, values) in first.constraints.items():
+        constraint = second.constraints.get(field)
+
+        if constraint is None or negated and constraint[0]:
+            continue
+
+        if negated:
+            if values_cover(field, values, constraint[1]):
+                return False
+
+        elif constraint[0]:
+            if values_cover(field, constraint[1], values):
+                return False
+
+        elif not values_overlap(field, values, constraint[1]):
+            return False
+
+    return True
+
+
+def outcome(rule):
+    return rule.action, rule.action_params, rule.goto
+
+
+class ExactCover(ExactIndex):
+    def cover(self, value):
+        if not (isinstance(value, str) and value.endswith('+')):
+            return self.lookup(value)
+
+        mask = 0
+
+        for prefix, postings in self.patterns:
+            if value.startswith(prefix):
+                mask |= expand(postings)
+
+        return mask
+
+    def overlap(self, value):
+        if not (isinstance(value, str) and value.endswith('+')):
+            return self.lookup(value)
+
+        value = value[:-1]
+        mask = 0
+
+        for name, postings in self.values.items():
+            if name.startswith(value):
+                mask |= expand(postings)
+
+        for prefix, postings in self.patterns:
+            if prefix.startswith(value) or value.startswith(prefix):
+                mask |= expand(postings)
+
+        return mask
+
+
+class PrefixCover(PrefixIndex):
+    inside = None
+
+    def finalize(self):
+        super(PrefixCover, self).finalize()
+        self.inside = {}
+
+    def cover(self, network):
+        return self.lookup(network)
+
+    def overlap(self, network):
+        try:
+            inside = self.inside[network]
+        except KeyError:
+            node = self.trie.find(network)
+            inside = 0
+
+            if node is not None:
+                for node in self.trie.walk(node):
+                    inside |= expand(node.values[0])
+
+            self.inside[network] = inside
+
+        return self.lookup(network) | inside
+
+
+class RangeCover(RangeIndex):
+    starts = None
+    positions = None
+
+    def finalize(self):
+        starts = [(start, position) for start, stop, position in self.ranges]
+        starts.extend((port, position) for port, positions in self.ports.items() for position in positions)
+        starts.sort()
+
+        self.starts = [start for start, position in starts]
+        self.positions = [position for start, position in starts]
+
+        super(RangeCover, self).finalize()
+
+    def cover(self, port_range):
+        return self.lookup(port_range[0]) & self.lookup(port_range[1])
+
+    def overlap(self, port_range):
+        start, stop = port_range
+        low = bisect.bisect_left(self.starts, start)
+        high = bisect.bisect_right(self.starts, stop)
+
+        return self.lookup(start) | bit_mask(self.positions[low:high])
+
+
+COVERS = {
+    'in_iface': ExactCover,
+    'out_iface': ExactCover,
+    'src': PrefixCover,
+    'dst': PrefixCover,
+    'proto': ExactCover,
+    'sport': RangeCover,
+    'dport': RangeCover,
+}
+
+
+class FieldCover:
+    field = None
+    any = 0
+    negated = 0
+    positive = None
+
+    def __init__(self, field, rules):
+        self.field = field
+        self.positive = COVERS[field]()
+
+        for rule in rules:
+            constraint = rule.constraints.get(field)
+
+            if constraint is None:
+                self.any |= 1 << rule.position
+                continue
+
+            negated, values = constraint
+
+            if negated:
+                self.negated |= 1 << rule.position
+                continue
+
+            for value in values:
+                self.positive.add(value, rule.position)
+
+        self.positive.finalize()
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.field)
+
+    def cover(self, constraint):
+        if constraint is None:
+            return self.any
+
+        negated, values = constraint
+
+        if negated:
+            return self.any | self.negated
+
+        mask = -1
+        for value in values:
+            mask &= self.positive.cover(value)
+
+        return self.any | self.negated | mask
+
+    def overlap(self, constraint):
+        if constraint is None or constraint[0]:
+            return -1
+
+        mask = self.any | self.negated
+        for value in constraint[1]:
+            mask |= self.positive.overlap(value)
+
+        return mask
+
+
+class Anomaly:
+    __slots__ = ('kind', 'chain', 'position', 'rule', 'other_position', 'other_rule')
+
+    def __init__(self, kind, chain, position, rule, other_position, other_rule):
+        self.kind = kind
+        self.chain = chain
+        self.position = position
+        self.rule = rule
+        self.other_position = other_position
+        self.other_rule = other_rule
+
+    def __repr__(self):
+        return '<{} {} {}:{} by {}>'.format(self.__class__.__name__, self.kind, self.chain, self.position,
+                                            self.other_position)
+
+
+class Analyzer:
+    chain = None
+    rules = None
+    fields = None
+    final = 0
+    outcomes = None
+    found = None
+
+    def __init__(self, chain):
+        self.chain = chain
+        self.rules = [CompiledRule(rule, position) for position, rule in enumerate(chain)]
+        self.fields = [(field, FieldCover(field, self.rules)) for field in FIELDS]
+        self.final = bit_mask(rule.position for rule in self.rules if self.is_final(rule))
+
+        outcomes = {}
+        for rule in self.rules:
+            outcomes.setdefault(outcome(rule.rule), []).append(rule.position)
+        self.outcomes = {key: bit_mask(positions) for key, positions in outcomes.items()}
+
+    def __repr__(self):
+        return '<{} {} {} rules>'.format(self.__class__.__name__, self.chain.name, len(self.rules))
+
+    @staticmethod
+    def is_final(rule):
+        target = rule.rule.action
+        return rule.supported and (target in TERMINAL or target == 'RETURN' or rule.rule.goto)
+
+    def covered_by(self, rule):
+        mask = self.final & ((1 << rule.position) - 1)
+
+        for field, index in self.fields:
+            if not mask:
+                return None
+
+            mask &= index.cover(rule.constraints.get(field))
+
+        while mask:
+            position = lowest_bit(mask)
+
+            if covers(self.rules[position], rule):
+                return position
+
+            mask &= mask - 1
+
+        return None
+
+    def correlated_with(self, rule):
+        if not self.is_final(rule):
+            return
+
+        mask = self.final & ((1 << rule.position) - 1) & ~self.outcomes[outcome(rule.rule)]
+
+        for field, index in self.fields:
+            if not mask:
+                return
+
+            mask &= index.overlap(rule.constraints.get(field))
+
+        while mask:
+            position = lowest_bit(mask)
+            other = self.rules[position]
+
+            if overlaps(other, rule) and not covers(other, rule) and not covers(rule, other):
+                yield position
+
+            mask &= mask - 1
+
+    def anomalies(self):
+        if self.found is not None:
+            return self.found
+
+        found = self.found = []
+
+        for rule in self.rules:
+            position = self.covered_by(rule)
+
+            if position is not None:
+                other = self.rules[position].rule
+                kind = 'redundant' if outcome(other) == outcome(rule.rule) else 'shadowed'
+                found.append(Anomaly(kind, self.chain.name, rule.position, rule.rule, position, other))
+                continue
+
+            position = next(self.correlated_with(rule), None)
+
+            if position is not None:
+                found.append(Anomaly('correlated', self.chain.name, rule.position, rule.rule, position,
+                                     self.rules[position].rule))
+
+        return found
+
+    def shadowed(self):
+        return [anomaly for anomaly in self.anomalies() if anomaly.kind == 'shadowed']
+
+    def redundant(self):
+        return [anomaly for anomaly in self.anomalies() if anomaly.kind == 'redundant']
+
+    def correlated(self):
+        return [anomaly for anomaly in self.anomalies() if anomaly.kind == 'correlated']
+
+
+def analyze(rule_set, table='filter'):
+    found = []
+
+    for chain in rule_set[table]:
+        found.extend(Analyzer(chain).anomalies())
+
+    return found
@@ -0,0 +1,244 @@
+import argparse
+import concurrent.futures
+import gc
+import multiprocessing
+import os
+import sys
+import time
+
+from firewall_translator import analysis, iana, optimizer
+from firewall_translator.cache import ParseCache
+from firewall_translator.iptables import RuleSet
+
+
+def read_manifest(file_path):
+    hosts = []
+    base = os.path.dirname(file_path)
+
+    with open(file_path) as r:
+        for line in r:
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+
+            words = line.split(None, 1)
+
+            if len(words) == 1:
+                path = words[0]
+                host = os.path.splitext(os.path.basename(path))[0]
+            else:
+                host, path = words
+
+            hosts.append((host, os.path.join(base, path)))
+
+    return hosts
+
+
+def find_hosts(sources):
+    hosts = []
+
+    for source in sources:
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                path = os.path.join(source, name)
+
+                if os.path.isfile(path) and not name.startswith('.'):
+                    hosts.append((os.path.splitext(name)[0], path))
+        else:
+            hosts.extend(read_manifest(source))
+
+    return hosts
+
+
+def check_outputs(hosts):
+    paths = {}
+
+    for host, path in hosts:
+        if host in paths:
+            raise ValueError('Hosts {} and {} would both write {}.rules'.format(paths[host], path, host))
+
+        paths[host] = path
+
+
+class HostResult:
+    __slots__ = ('host', 'path', 'tables', 'rules', 'optimized', 'anomalies', 'output', 'seconds', 'error')
+
+    def __init__(self, host, path):
+        self.host = host
+        self.path = path
+        self.tables = 0
+        self.rules = 0
+        self.optimized = None
+        self.anomalies = None
+        self.output = None
+        self.seconds = 0.0
+        self.error = None
+
+    def __repr__(self):
+        return '<{} {} {} rules{}>'.format(self.__class__.__name__, self.host, self.rules,
+                                          ' failed' if self.error else '')
+
+    def __str__(self):
+        if self.error is not None:
+            return '{} FAILED {}'.format(self.host, self.error)
+
+        string = ['{} {} tables {} rules'.format(self.host, self.tables, self.rules)]
+
+        if self.optimized is not None:
+            string.append('-> {} rules'.format(self.optimized))
+
+        if self.anomalies is not None:
+            string.append('{} anomalies'.format(self.anomalies))
+
+        string.append('{:.3f}s'.format(self.seconds))
+        return ' '.join(string)
+
+
+def translate(host, path, output=None, optimize=False, analyze=False, cache=None):
+    result = HostResult(host, path)
+    start = time.perf_counter()
+
+    try:
+        if cache is None:
+            rule_set = RuleSet()
+            rule_set.read_from_file(path)
+        else:
+            rule_set = ParseCache(cache).read_from_file(path)
+
+        result.tables = len(rule_set)
+        result.rules = sum(len(chain) for table in rule_set for chain in table)
+
+        if analyze:
+            result.anomalies = len(analysis.analyze(rule_set))
+
+        if optimize:
+            optimizer.optimize(rule_set)
+            result.optimized = sum(len(chain) for table in rule_set for chain in table)
+
+        if output is not None:
+            result.output = os.path.join(output, '{}.rules'.format(host))
+            rule_set.write_to_file(result.output)
+
+    except Exception as error:
+        result.error = '{}: {}'.format(error.__class__.__name__, error)
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def translate_job(job):
+    return translate(*job)
+
+
+class BatchReport:
+    results = None
+    workers = None
+    seconds = 0.0
+
+    def __init__(self, results, workers, seconds):
+        self.results = results
+        self.workers = workers
+        self.seconds = seconds
+
+    def __repr__(self):
+        return '<{} {} hosts, {} failed>'.format(self.__class__.__name__, len(self.results), len(self.failed))
+
+    def __str__(self):
+        string = [str(result) for result in self.results]
+        string.append('{} hosts, {} failed, {} rules in {:.2f}s with {} workers'.format(
+            len(self.results), len(self.failed), self.rules, self.seconds, self.workers))
+        string.append('{:.1f} hosts/s, {:.0f} rules/s, {:.2f}s of host time ({:.1f}x)'.format(
+            self.hosts_per_second, self.rules_per_second, self.host_seconds,
+            self.host_seconds / self.seconds if self.seconds else 0.0))
+
+        return '\n'.join(string)
+
+    @property
+    def failed(self):
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def rules(self):
+        return sum(result.rules for result in self.results)
+
+    @property
+    def host_seconds(self):
+        return sum(result.seconds for result in self.results)
+
+    @property
+    def hosts_per_second(self):
+        return len(self.results) / self.seconds if self.seconds else 0.0
+
+    @property
+    def rules_per_second(self):
+        return self.rules / self.seconds if self.seconds else 0.0
+
+
+class BatchTranslator:
+    workers = None
+    output = None
+    optimize = False
+    analyze = False
+    chunk_size = 1
+    cache = None
+
+    def __init__(self, workers=None, output=None, optimize=False, analyze=False, chunk_size=1, cache=None):
+        self.workers = workers or os.cpu_count()
+        self.output = output
+        self.optimize = optimize
+        self.analyze = analyze
+        self.chunk_size = chunk_size
+        self.cache = cache
+
+    def __repr__(self):
+        return '<{} {} workers>'.format(self.__class__.__name__, self.workers)
+
+    def run(self, hosts):
+        start = time.perf_counter()
+        jobs = [(host, path, self.output, self.optimize, self.analyze, self.cache) for host, path in hosts]
+
+        if self.output is not None:
+            check_outputs(hosts)
+            os.makedirs(self.output, exist_ok=True)
+
+        if self.workers == 1 or len(jobs) < 2:
+            results = [translate_job(job) for job in jobs]
+        else:
+            iana.preload()
+            gc.freeze()
+
+            try:
+                with concurrent.futures.ProcessPoolExecutor(self.workers, multiprocessing.get_context('fork')) as pool:
+                    results = list(pool.map(translate_job, jobs, chunksize=self.chunk_size))
+            finally:
+                gc.unfreeze()
+
+        return BatchReport(results, self.workers, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Translate iptables-save dumps for many hosts')
+    parser.add_argument('sources', nargs='+', help='directories of dumps or manifest files')
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    parser.add_argument('-o', '--output', default=None, help='directory for the translated rule sets')
+    parser.add_argument('--optimize', action='store_true')
+    parser.add_argument('--analyze', action='store_true')
+    parser.add_argument('--cache', default=None, help='directory for the parse cache')
+    parser.add_argument('--chunk-size', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    translator = BatchTranslator(args.workers, args.output, args.optimize, args.analyze, args.chunk_size,
+                                 args.cache)
+
+    try:
+        report = translator.run(find_hosts(args.sources))
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(report)
+
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import tempfile
+
+from firewall_translator import __version__, serialize
+from firewall_translator.iptables import RuleSet
+
+CACHE_FORMAT = 3
+SUFFIX = '.ruleset'
+
+
+def content_key(data):
+    digest = hashlib.sha256('{}\0{}\0'.format(__version__, CACHE_FORMAT).encode())
+    digest.update(data)
+
+    return digest.hexdigest()
+
+
+class CacheEntry:
+    __slots__ = ('path', 'size', 'used')
+
+    def __init__(self, path, size, used):
+        self.path = path
+        self.size = size
+        self.used = used
+
+    def __repr__(self):
+        return '<{} {} {} bytes>'.format(self.__class__.__name__, os.path.basename(self.path), self.size)
+
+
+class ParseCache:
+    directory = None
+    max_size = None
+    max_entries = None
+    hits = 0
+    misses = 0
+
+    def __init__(self, directory, max_size=256 * 2 ** 20, max_entries=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_entries = max_entries
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return '<{} {} {} hits, {} misses>'.format(self.__class__.__name__, self.directory, self.hits, self.misses)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def entries(self):
+        entries = []
+
+        for name in os.listdir(self.directory):
+            if not name.endswith(SUFFIX):
+                continue
+
+            path = os.path.join(self.directory, name)
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            entries.append(CacheEntry(path, stat.st_size, stat.st_mtime))
+
+        entries.sort(key=lambda entry: entry.used)
+        return entries
+
+    def get(self, key):
+        path = self.path(key)
+
+        try:
+            with open(path, 'rb') as r:
+                rule_set = serialize.load(r)
+        except FileNotFoundError:
+            return None
+        except (IndexError, ValueError):
+            self.discard(path)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return rule_set
+
+    def put(self, key, rule_set):
+        descriptor, temporary = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=self.directory)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as w:
+                serialize.dump(rule_set, w)
+
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            self.discard(temporary)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        entries = self.entries()
+        size = sum(entry.size for entry in entries)
+        count = len(entries)
+
+        for entry in entries:
+            if (self.max_size is None or size <= self.max_size) and \
+                    (self.max_entries is None or count <= self.max_entries):
+                break
+
+            self.discard(entry.path)
+            size -= entry.size
+            count -= 1
+
+    @staticmethod
+    def discard(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def read(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+
+        key = content_key(data)
+        rule_set = self.get(key)
+
+        if rule_set is not None:
+            self.hits += 1
+            return rule_set
+
+        self.misses += 1
+        rule_set = RuleSet()
+        rule_set.read_lines(data.decode().splitlines())
+        self.put(key, rule_set)
+
+        return rule_set
+
+    def read_from_file(self, file):
+        with open(file, 'rb') as r:
+            return self.read(r.read())
@@ -0,0 +1,500 @@
+import bisect
+import ipaddress
+
+from firewall_translator import iana
+from firewall_translator.iptables import TERMINAL
+from firewall_translator.trie import PrefixTrie, to_network
+
+FIELDS = ('in_iface', 'out_iface', 'src', 'dst', 'proto', 'sport', 'dport')
+
+OPTIONS = {
+    '-i': 'in_iface',
+    '--in-interface': 'in_iface',
+    '-o': 'out_iface',
+    '--out-interface': 'out_iface',
+    '-s': 'src',
+    '--source': 'src',
+    '--src': 'src',
+    '-d': 'dst',
+    '--destination': 'dst',
+    '--dst': 'dst',
+    '-p': 'proto',
+    '--protocol': 'proto',
+    '--sport': 'sport',
+    '--source-port': 'sport',
+    '--sports': 'sport',
+    '--source-ports': 'sport',
+    '--dport': 'dport',
+    '--destination-port': 'dport',
+    '--dports': 'dport',
+    '--destination-ports': 'dport',
+}
+
+IGNORED = frozenset(['-m', '--match', '--comment'])
+
+MAX_DEPTH = 256
+POSTINGS_MASK = 16
+
+
+def bit_mask(positions):
+    mask = 0
+
+    for position in positions:
+        mask |= 1 << position
+
+    return mask
+
+
+def compact(positions):
+    if len(positions) >= POSTINGS_MASK:
+        return bit_mask(positions)
+
+    return tuple(positions)
+
+
+def expand(postings):
+    if postings.__class__ is int:
+        return postings
+
+    return bit_mask(postings)
+
+
+def lowest_bit(mask):
+    return (mask & -mask).bit_length() - 1
+
+
+def parse_protocol(value):
+    if value == 'all' or value == '0':
+        return None
+
+    return iana.get_protocol(value).number
+
+
+def parse_port(value, protocol):
+    if value.isdigit():
+        return int(value)
+
+    for name in [protocol, 'tcp', 'udp']:
+        if name in iana.SERVICES and value in iana.SERVICES[name]:
+            return iana.SERVICES[name][value].number
+
+    raise ValueError('Unknown port {}'.format(value))
+
+
+def parse_ports(value, protocol):
+    ranges = []
+
+    for port in value.split(','):
+        if ':' in port:
+            start, stop = port.split(':', 1)
+            ranges.append((parse_port(start, protocol) if start else 0,
+                           parse_port(stop, protocol) if stop else 65535))
+        else:
+            port = parse_port(port, protocol)
+            ranges.append((port, port))
+
+    return ranges
+
+
+def parse_values(field, value, protocol):
+    if not isinstance(value, str):
+        raise ValueError('Unexpected value {!r}'.format(value))
+
+    if field == 'src' or field == 'dst':
+        return [to_network(address) for address in value.split(',')]
+
+    if field == 'proto':
+        number = parse_protocol(value)
+        return None if number is None else [number]
+
+    if field == 'sport' or field == 'dport':
+        return parse_ports(value, protocol)
+
+    return [value]
+
+
+def to_address(address):
+    if address is None or isinstance(address, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+        return address
+
+    return ipaddress.ip_address(address)
+
+
+class Packet:
+    __slots__ = FIELDS
+
+    def __init__(self, in_iface=None, out_iface=None, src=None, dst=None, proto=None, sport=None, dport=None):
+        self.in_iface = in_iface
+        self.out_iface = out_iface
+        self.src = to_address(src)
+        self.dst = to_address(dst)
+        self.proto = None if proto is None else iana.get_protocol(proto).number
+        self.sport = None if sport is None else int(sport)
+        self.dport = None if dport is None else int(dport)
+
+    def __repr__(self):
+        fields = ['{}={}'.format(field, getattr(self, field)) for field in FIELDS if getattr(self, field) is not None]
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(fields))
+
+
+class Verdict:
+    __slots__ = ('action', 'chain', 'position', 'rule')
+
+    def __init__(self, action, chain, position=None, rule=None):
+        self.action = action
+        self.chain = chain
+        self.position = position
+        self.rule = rule
+
+    def __repr__(self):
+        if self.rule is None:
+            return '<{} {} {}:policy>'.format(self.__class__.__name__, self.action, self.chain)
+
+        return '<{} {} {}:{}>'.format(self.__class__.__name__, self.action, self.chain, self.position)
+
+
+class CompiledRule:
+    __slots__ = ('rule', 'position', 'constraints', 'supported')
+
+    def __init__(self, rule, position):
+        self.rule = rule
+        self.position = position
+        self.constraints = {}
+        self.supported = True
+
+        protocol = rule.get('-p')
+
+        for option, value in rule.match_params:
+            negated = option.startswith('! ')
+            if negated:
+                option = option[2:]
+
+            field = OPTIONS.get(option)
+
+            if field is None:
+                if option not in IGNORED:
+                    self.supported = False
+                continue
+
+            try:
+                values = parse_values(field, value, protocol)
+            except (KeyError, ValueError):
+                self.supported = False
+                continue
+
+            if values is not None:
+                self.constraints[field] = (negated, values)
+
+    def __repr__(self):
+        return '<{} {} {!r}>'.format(self.__class__.__name__, self.position, self.constraints)
+
+    def matches(self, packet):
+        for field, (negated, values) in self.constraints.items():
+            value = getattr(packet, field)
+
+            if value is None:
+                hit = False
+
+            elif field == 'in_iface' or field == 'out_iface':
+                hit = any(value.startswith(name[:-1]) if name.endswith('+') else value == name for name in values)
+
+            elif field == 'src' or field == 'dst':
+                hit = any(value in network for network in values)
+
+            elif field == 'proto':
+                hit = value in values
+
+            else:
+                hit = any(start <= value <= stop for start, stop in values)
+
+            if hit == negated:
+                return False
+
+        return True
+
+
+class ExactIndex:
+    values = None
+    patterns = None
+
+    def __init__(self):
+        self.values = {}
+        self.patterns = {}
+
+    def add(self, value, position):
+        if isinstance(value, str) and value.endswith('+'):
+            self.patterns.setdefault(value[:-1], []).append(position)
+        else:
+            self.values.setdefault(value, []).append(position)
+
+    def finalize(self):
+        self.values = {value: compact(positions) for value, positions in self.values.items()}
+        self.patterns = [(prefix, compact(positions)) for prefix, positions in self.patterns.items()]
+
+    def lookup(self, value):
+        if value is None:
+            return 0
+
+        postings = self.values.get(value)
+        mask = 0 if postings is None else expand(postings)
+
+        for prefix, postings in self.patterns:
+            if value.startswith(prefix):
+                mask |= expand(postings)
+
+        return mask
+
+
+class PrefixIndex:
+    trie = None
+
+    def __init__(self):
+        self.trie = PrefixTrie()
+
+    def add(self, network, position):
+        self.trie.insert(network, position)
+
+    def finalize(self):
+        for network, positions in self.trie:
+            positions[:] = [compact(positions)]
+
+    def lookup(self, address):
+        if address is None:
+            return 0
+
+        mask = 0
+
+        for network, postings in self.trie.covering(address):
+            mask |= expand(postings[0])
+
+        return mask
+
+
+class RangeIndex:
+    ports = None
+    ranges = None
+    boundaries = None
+    segments = None
+
+    def __init__(self):
+        self.ports = {}
+        self.ranges = []
+
+    def add(self, port_range, position):
+        start, stop = port_range
+
+        if start == stop:
+            self.ports.setdefault(start, []).append(position)
+        else:
+            self.ranges.append((start, stop, position))
+
+    def finalize(self):
+        self.ports = {port: compact(positions) for port, positions in self.ports.items()}
+
+        events = {}
+        for start, stop, position in self.ranges:
+            events.setdefault(start, []).append(position)
+            events.setdefault(stop + 1, []).append(~position)
+
+        self.boundaries = sorted(events)
+        self.segments = []
+        active = 0
+
+        for boundary in self.boundaries:
+            for position in events[boundary]:
+                if position >= 0:
+                    active |= 1 << position
+                else:
+                    active &= ~(1 << ~position)
+
+            self.segments.append(active)
+
+        self.ranges = None
+
+    def lookup(self, port):
+        if port is None:
+            return 0
+
+        postings = self.ports.get(port)
+        mask = 0 if postings is None else expand(postings)
+
+        segment = bisect.bisect_right(self.boundaries, port) - 1
+        if segment >= 0:
+            mask |= self.segments[segment]
+
+        return mask
+
+
+INDEXES = {
+    'in_iface': ExactIndex,
+    'out_iface': ExactIndex,
+    'src': PrefixIndex,
+    'dst': PrefixIndex,
+    'proto': ExactIndex,
+    'sport': RangeIndex,
+    'dport': RangeIndex,
+}
+
+
+class FieldIndex:
+    field = None
+    any = 0
+    negated = 0
+    positive = None
+    negative = None
+
+    def __init__(self, field, rules):
+        self.field = field
+        self.positive = INDEXES[field]()
+        self.negative = INDEXES[field]()
+
+        for rule in rules:
+            constraint = rule.constraints.get(field)
+
+            if constraint is None:
+                self.any |= 1 << rule.position
+                continue
+
+            negated, values = constraint
+            index = self.negative if negated else self.positive
+
+            if negated:
+                self.negated |= 1 << rule.position
+
+            for value in values:
+                index.add(value, rule.position)
+
+        self.positive.finalize()
+        self.negative.finalize()
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.field)
+
+    def match(self, value):
+        mask = self.any | self.positive.lookup(value)
+
+        if self.negated:
+            mask |= self.negated & ~self.negative.lookup(value)
+
+        return mask
+
+
+class CompiledChain:
+    chain = None
+    rules = None
+    allowed = 0
+    fields = None
+
+    def __init__(self, chain, assume_match=False):
+        self.chain = chain
+        self.rules = [CompiledRule(rule, position) for position, rule in enumerate(chain)]
+        self.allowed = bit_mask(rule.position for rule in self.rules if assume_match or rule.supported)
+        self.fields = [(field, FieldIndex(field, self.rules)) for field in FIELDS]
+
+    def __repr__(self):
+        return '<{} {} {} rules>'.format(self.__class__.__name__, self.chain.name, len(self.rules))
+
+    def first(self, packet, position):
+        for rule in self.rules[position:]:
+            if self.allowed >> rule.position & 1 and rule.matches(packet):
+                return rule.position
+
+        return None
+
+    def match(self, packet):
+        mask = self.allowed
+
+        for field, index in self.fields:
+            mask &= index.match(getattr(packet, field))
+
+            if not mask:
+                break
+
+        return mask
+
+
+class Classifier:
+    table = None
+    indexed = True
+    assume_match = False
+    compiled = None
+
+    def __init__(self, rule_set, table='filter', indexed=True, assume_match=False):
+        self.table = rule_set[table]
+        self.indexed = indexed
+        self.assume_match = assume_match
+        self.compiled = {}
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.table.name)
+
+    def classify(self, chain, in_iface=None, out_iface=None, src=None, dst=None, proto=None, sport=None, dport=None):
+        return self.evaluate(chain, Packet(in_iface, out_iface, src, dst, proto, sport, dport))
+
+    def compile(self, name):
+        try:
+            return self.compiled[name]
+        except KeyError:
+            compiled = self.compiled[name] = CompiledChain(self.table[name], self.assume_match)
+            return compiled
+
+    def evaluate(self, chain, packet):
+        start = self.table[chain]
+        masks = {}
+        stack = []
+        compiled = self.compile(chain)
+        position = 0
+
+        while True:
+            index = self.next_match(compiled, packet, position, masks)
+
+            if index is None:
+                if stack:
+                    compiled, position = stack.pop()
+                    continue
+
+                return Verdict(start.action, start.name)
+
+            rule = compiled.rules[index].rule
+            target = rule.action
+
+            if target in TERMINAL:
+                return Verdict(target, compiled.chain.name, index, rule)
+
+            if target == 'RETURN':
+                if stack:
+                    compiled, position = stack.pop()
+                    continue
+
+                return Verdict(start.action, start.name)
+
+            if target in self.table.chains:
+                if not rule.goto:
+                    if len(stack) >= MAX_DEPTH:
+                        raise RuntimeError('Chain recursion deeper than {} in {}'.format(MAX_DEPTH, chain))
+
+                    stack.append((compiled, index + 1))
+
+                compiled = self.compile(target)
+                position = 0
+                continue
+
+            position = index + 1
+
+    def next_match(self, compiled, packet, position, masks):
+        if not self.indexed:
+            return compiled.first(packet, position)
+
+        name = compiled.chain.name
+
+        try:
+            mask = masks[name]
+        except KeyError:
+            mask = masks[name] = compiled.match(packet)
+
+        mask &= ~((1 << position) - 1)
+
+        if not mask:
+            return None
+
+        return lowest_bit(mask)
@@ -0,0 +1,298 @@
+import array
+
+import numpy
+
+from firewall_translator.iptables import Chain, Rule, RuleSet, Table, gc_paused
+
+INTERFACE_OPTIONS = ('-i', '-o', '! -i', '! -o')
+
+
+class SymbolIds:
+    symbols = None
+    ids = None
+    pairs = None
+
+    def __contains__(self, symbol):
+        return symbol in self.ids
+
+    def __getitem__(self, symbol_id):
+        return self.symbols[symbol_id]
+
+    def __init__(self):
+        self.symbols = [None]
+        self.ids = {None: 0}
+        self.pairs = {}
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return '<{} {} symbols>'.format(self.__class__.__name__, len(self.symbols))
+
+    def add(self, symbol):
+        try:
+            return self.ids[symbol]
+        except KeyError:
+            symbol_id = self.ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            return symbol_id
+
+    def add_pair(self, pair):
+        try:
+            return self.pairs[pair]
+        except KeyError:
+            symbol_ids = self.pairs[pair] = (self.add(pair[0]), self.add(pair[1]))
+            return symbol_ids
+
+    def id(self, symbol):
+        return self.ids.get(symbol, -1)
+
+    def lookup(self, symbol_ids):
+        return [self.symbols[symbol_id] for symbol_id in symbol_ids]
+
+
+def id_array(values):
+    return numpy.frombuffer(values, dtype=numpy.int32) if len(values) else numpy.zeros(0, dtype=numpy.int32)
+
+
+def counter_array(values):
+    return numpy.frombuffer(values, dtype=numpy.uint64) if len(values) else numpy.zeros(0, dtype=numpy.uint64)
+
+
+def distinct(keys, presorted=False):
+    keys = keys if presorted else numpy.sort(keys)
+    return keys[numpy.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+
+
+def groups(keys):
+    order = numpy.argsort(keys, kind='stable')
+    ordered = keys[order]
+    starts = numpy.flatnonzero(numpy.concatenate(([True], ordered[1:] != ordered[:-1]))) if len(keys) else \
+        numpy.zeros(0, dtype=numpy.intp)
+
+    return ordered[starts], order, starts
+
+
+class ColumnarRuleSet:
+    symbols = None
+    tables = None
+    chain_tables = None
+    chain_names = None
+    chain_actions = None
+    chain_packets = None
+    chain_bytes = None
+    rule_chains = None
+    actions = None
+    gotos = None
+    counted = None
+    packets = None
+    bytes = None
+    match_rules = None
+    match_options = None
+    match_values = None
+    param_rules = None
+    param_options = None
+    param_values = None
+
+    def __init__(self, rule_set=None):
+        self.symbols = SymbolIds()
+
+        if rule_set is None:
+            rule_set = RuleSet({})
+
+        self.load(rule_set)
+
+    def __len__(self):
+        return len(self.actions)
+
+    def __repr__(self):
+        return '<{} {} tables, {} chains, {} rules, {} symbols>'.format(
+            self.__class__.__name__, len(self.tables), len(self.chain_names), len(self.actions), len(self.symbols))
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in (
+            'tables', 'chain_tables', 'chain_names', 'chain_actions', 'chain_packets', 'chain_bytes',
+            'rule_chains', 'actions', 'gotos', 'counted', 'packets', 'bytes',
+            'match_rules', 'match_options', 'match_values', 'param_rules', 'param_options', 'param_values'))
+
+    def load(self, rule_set):
+        add = self.symbols.add
+        add_pair = self.symbols.add_pair
+        tables = array.array('i')
+        chain_tables = array.array('i')
+        chain_names = array.array('i')
+        chain_actions = array.array('i')
+        chain_counters = array.array('Q')
+        rule_chains = array.array('i')
+        actions = array.array('i')
+        gotos = array.array('b')
+        counted = array.array('b')
+        counters = array.array('Q')
+        match_rules = array.array('i')
+        matches = array.array('i')
+        param_rules = array.array('i')
+        params = array.array('i')
+        row = 0
+
+        for table in rule_set:
+            tables.append(add(table.name))
+
+            for chain in table:
+                chain_tables.append(len(tables) - 1)
+                chain_names.append(add(chain.name))
+                chain_actions.append(add(chain.action))
+                chain_counters.extend((chain.packets, chain.bytes))
+                chain_id = len(chain_names) - 1
+
+                for rule in chain:
+                    rule_chains.append(chain_id)
+                    actions.append(add(rule.action))
+                    gotos.append(1 if rule.goto else 0)
+
+                    if rule.counters is None:
+                        counted.append(0)
+                        counters.extend((0, 0))
+                    else:
+                        counted.append(1)
+                        counters.extend(rule.counters)
+
+                    for pair in rule.match_params:
+                        match_rules.append(row)
+                        matches.extend(add_pair(pair))
+
+                    for pair in rule.action_params:
+                        param_rules.append(row)
+                        params.extend(add_pair(pair))
+
+                    row += 1
+
+        self.tables = id_array(tables)
+        self.chain_tables = id_array(chain_tables)
+        self.chain_names = id_array(chain_names)
+        self.chain_actions = id_array(chain_actions)
+        self.chain_packets, self.chain_bytes = counter_array(chain_counters).reshape(-1, 2).T
+        self.rule_chains = id_array(rule_chains)
+        self.actions = id_array(actions)
+        self.gotos = numpy.frombuffer(gotos, dtype=numpy.bool_) if len(gotos) else numpy.zeros(0, dtype=bool)
+        self.counted = numpy.frombuffer(counted, dtype=numpy.bool_) if len(counted) else numpy.zeros(0, dtype=bool)
+        self.packets, self.bytes = counter_array(counters).reshape(-1, 2).T
+        self.match_rules = id_array(match_rules)
+        self.match_options, self.match_values = id_array(matches).reshape(-1, 2).T
+        self.param_rules = id_array(param_rules)
+        self.param_options, self.param_values = id_array(params).reshape(-1, 2).T
+
+    def pairs(self, rules, options, values):
+        symbols = self.symbols.symbols
+        interned = {}
+        offsets = numpy.searchsorted(rules, numpy.arange(len(self) + 1)).tolist()
+        items = []
+
+        for key in zip(options.tolist(), values.tolist()):
+            try:
+                items.append(interned[key])
+            except KeyError:
+                item = interned[key] = (symbols[key[0]], symbols[key[1]])
+                items.append(item)
+
+        return [tuple(items[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+    def to_rule_set(self):
+        symbols = self.symbols.symbols
+
+        with gc_paused():
+            matches = self.pairs(self.match_rules, self.match_options, self.match_values)
+            params = self.pairs(self.param_rules, self.param_options, self.param_values)
+            counters = [(packets, octets) if counted else None for counted, packets, octets in
+                        zip(self.counted.tolist(), self.packets.tolist(), self.bytes.tolist())]
+            rules = list(map(Rule, matches, self.symbols.lookup(self.actions.tolist()), params,
+                             self.gotos.tolist(), counters))
+
+            tables = [Table(symbols[name]) for name in self.tables.tolist()]
+            offsets = numpy.searchsorted(self.rule_chains, numpy.arange(len(self.chain_names) + 1)).tolist()
+
+            for chain_id, (table, name, action, packets, octets) in enumerate(zip(
+                    self.chain_tables.tolist(), self.chain_names.tolist(), self.chain_actions.tolist(),
+                    self.chain_packets.tolist(), self.chain_bytes.tolist())):
+                chain = Chain(symbols[name], rules[offsets[chain_id]:offsets[chain_id + 1]], symbols[action])
+                chain.packets, chain.bytes = packets, octets
+                tables[table][chain.name] = chain
+
+        return RuleSet({table.name: table for table in tables})
+
+    def rule(self, row):
+        start, end = numpy.searchsorted(self.match_rules, [row, row + 1])
+        param_start, param_end = numpy.searchsorted(self.param_rules, [row, row + 1])
+        symbols = self.symbols.symbols
+
+        return Rule([(symbols[option], symbols[value]) for option, value in
+                     zip(self.match_options[start:end].tolist(), self.match_values[start:end].tolist())],
+                    symbols[self.actions[row]],
+                    [(symbols[option], symbols[value]) for option, value in
+                     zip(self.param_options[param_start:param_end].tolist(),
+                         self.param_values[param_start:param_end].tolist())],
+                    bool(self.gotos[row]),
+                    (int(self.packets[row]), int(self.bytes[row])) if self.counted[row] else None)
+
+    def chain_rows(self, table, chain):
+        table_ids = numpy.flatnonzero(self.tables == self.symbols.id(table))
+        chain_ids = numpy.flatnonzero(numpy.isin(self.chain_tables, table_ids) &
+                                      (self.chain_names == self.symbols.id(chain)))
+
+        return numpy.flatnonzero(numpy.isin(self.rule_chains, chain_ids))
+
+    def option_mask(self, options):
+        if isinstance(options, str):
+            options = [options]
+
+        return numpy.isin(self.match_options, [self.symbols.id(option) for option in options])
+
+    def matching(self, option, value=None):
+        mask = self.option_mask(option)
+
+        if value is not None:
+            mask &= self.match_values == self.symbols.id(value)
+
+        return distinct(self.match_rules[mask], True)
+
+    def count(self, ids):
+        counts = numpy.bincount(ids, minlength=len(self.symbols))
+        present = numpy.flatnonzero(counts)
+
+        return dict(zip(self.symbols.lookup(present.tolist()), counts[present].tolist()))
+
+    def count_by_action(self, rows=None):
+        return self.count(self.actions if rows is None else self.actions[rows])
+
+    def count_by_option(self, option):
+        mask = self.option_mask(option)
+        keys = self.match_rules[mask].astype(numpy.int64) * len(self.symbols) + self.match_values[mask]
+        return self.count(distinct(keys) % len(self.symbols))
+
+    def count_by_interface(self, options=INTERFACE_OPTIONS):
+        return self.count_by_option(options)
+
+    def count_by_chain(self):
+        counts = numpy.bincount(self.rule_chains, minlength=len(self.chain_names)).tolist()
+        symbols = self.symbols.symbols
+        tables = self.tables.tolist()
+
+        return {(symbols[tables[table]], symbols[name]): count for table, name, count in
+                zip(self.chain_tables.tolist(), self.chain_names.tolist(), counts)}
+
+    def group_by_action(self, rows=None):
+        actions = self.actions if rows is None else self.actions[rows]
+        rows = numpy.arange(len(self)) if rows is None else numpy.asarray(rows)
+        keys, order, starts = groups(actions)
+
+        return dict(zip(self.symbols.lookup(keys.tolist()), numpy.split(rows[order], starts[1:])))
+
+    def counters_by_action(self):
+        if not len(self):
+            return {}
+
+        keys, order, starts = groups(self.actions)
+        packets = numpy.add.reduceat(self.packets[order], starts).tolist()
+        octets = numpy.add.reduceat(self.bytes[order], starts).tolist()
+
+        return dict(zip(self.symbols.lookup(keys.tolist()), zip(packets, octets)))
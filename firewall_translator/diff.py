@@ -0,0 +1,409 @@
+import bisect
+import collections
+
+from firewall_translator.iptables import Chain, Table
+
+MAX_EDITS = 1000
+
+
+def myers(a, b, max_edits=MAX_EDITS):
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(v.copy())
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or k != d and v[k - 1] < v[k + 1]:
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+
+            v[k] = x
+
+            if x >= n and y >= m:
+                return backtrack(trace, n, m)
+
+    return None
+
+
+def backtrack(trace, x, y):
+    steps = []
+
+    for d in range(len(trace) - 1, 0, -1):
+        v = trace[d]
+        k = x - y
+
+        if k == -d or k != d and v[k - 1] < v[k + 1]:
+            previous = k + 1
+        else:
+            previous = k - 1
+
+        previous_x = v[previous]
+        previous_y = previous_x - previous
+
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            steps.append(('equal', x, y))
+
+        if x == previous_x:
+            steps.append(('insert', x, previous_y))
+        else:
+            steps.append(('delete', previous_x, y))
+
+        x, y = previous_x, previous_y
+
+    while x > 0 and y > 0:
+        x -= 1
+        y -= 1
+        steps.append(('equal', x, y))
+
+    steps.reverse()
+    return steps
+
+
+def anchors(a, b):
+    counts = collections.Counter(a)
+    counts.subtract(collections.Counter(b) - collections.Counter(set(b)))
+    positions = {}
+
+    for j, key in enumerate(b):
+        positions[key] = j if key not in positions else None
+
+    pairs = [(i, positions[key]) for i, key in enumerate(a)
+             if counts[key] == 1 and positions.get(key) is not None]
+
+    tails = []
+    links = []
+    previous = []
+
+    for i, j in pairs:
+        index = bisect.bisect_left(tails, j)
+
+        if index == len(tails):
+            tails.append(j)
+            links.append(len(previous))
+        else:
+            tails[index] = j
+            links[index] = len(previous)
+
+        previous.append(links[index - 1] if index > 0 else None)
+
+    sequence = []
+    index = links[-1] if links else None
+
+    while index is not None:
+        sequence.append(pairs[index])
+        index = previous[index]
+
+    sequence.reverse()
+    return sequence
+
+
+def steps(a, b, max_edits=MAX_EDITS):
+    found = myers(a, b, max_edits)
+    if found is not None:
+        return found
+
+    found = []
+    start_a = start_b = 0
+
+    for i, j in anchors(a, b) + [(len(a), len(b))]:
+        gap = myers(a[start_a:i], b[start_b:j], max_edits)
+
+        if gap is None:
+            gap = [('delete', x, 0) for x in range(i - start_a)] + [('insert', 0, y) for y in range(j - start_b)]
+
+        found.extend((tag, x + start_a, y + start_b) for tag, x, y in gap)
+
+        if i < len(a):
+            found.append(('equal', i, j))
+
+        start_a, start_b = i + 1, j + 1
+
+    return found
+
+
+def opcodes(a, b, max_edits=MAX_EDITS):
+    prefix = 0
+    while prefix < len(a) and prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while suffix < len(a) - prefix and suffix < len(b) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    codes = []
+
+    if prefix:
+        codes.append(['equal', 0, prefix, 0, prefix])
+
+    for tag, x, y in steps(a[prefix:len(a) - suffix], b[prefix:len(b) - suffix], max_edits):
+        x += prefix
+        y += prefix
+
+        if codes and codes[-1][0] == tag:
+            codes[-1][2] += tag != 'insert'
+            codes[-1][4] += tag != 'delete'
+        elif tag == 'equal':
+            codes.append(['equal', x, x + 1, y, y + 1])
+        elif tag == 'delete':
+            codes.append(['delete', x, x + 1, y, y])
+        else:
+            codes.append(['insert', x, x, y, y + 1])
+
+    if suffix:
+        codes.append(['equal', len(a) - suffix, len(a), len(b) - suffix, len(b)])
+
+    return [tuple(code) for code in codes]
+
+
+class Edit:
+    __slots__ = ('operation', 'table', 'chain', 'position', 'rule')
+
+    def __init__(self, operation, table, chain, position=None, rule=None):
+        self.operation = operation
+        self.table = table
+        self.chain = chain
+        self.position = position
+        self.rule = rule
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.arguments())
+
+    def __str__(self):
+        return self.arguments()
+
+    def arguments(self):
+        if self.operation in ('-A', '-I', '-R'):
+            if self.position is None:
+                return '{} {} {}'.format(self.operation, self.chain, self.rule)
+
+            return '{} {} {} {}'.format(self.operation, self.chain, self.position, self.rule)
+
+        if self.operation == '-P':
+            return '-P {} {}'.format(self.chain, self.rule)
+
+        if self.operation == '-D':
+            return '-D {} {}'.format(self.chain, self.position)
+
+        return '{} {}'.format(self.operation, self.chain)
+
+    def apply(self, table):
+        if self.operation == '-N':
+            table.new_chain(self.chain)
+
+        elif self.operation == '-X':
+            table.delete_chain(self.chain)
+
+        elif self.operation == '-F':
+            del table[self.chain][:]
+
+        elif self.operation == '-P':
+            if self.chain not in table.chains:
+                table.new_chain(self.chain, action=self.rule)
+
+            table[self.chain].action = self.rule
+
+        elif self.operation == '-A':
+            table[self.chain].append(self.rule)
+
+        elif self.operation == '-I':
+            table[self.chain].insert(self.rule, self.position - 1)
+
+        elif self.operation == '-R':
+            table[self.chain][self.position - 1] = self.rule
+
+        elif self.operation == '-D':
+            del table[self.chain][self.position - 1]
+
+
+class ChainDiff:
+    table = None
+    chain = None
+    added = None
+    removed = None
+    moved = None
+    edits = None
+
+    def __init__(self, table, old, new, max_edits=MAX_EDITS):
+        self.table = table
+        self.chain = new.name
+        self.edits = []
+
+        keys = {}
+        a = [keys.setdefault(str(rule), len(keys)) for rule in old]
+        b = [keys.setdefault(str(rule), len(keys)) for rule in new]
+
+        all_deleted = []
+        all_inserted = []
+        deleted = []
+        inserted = []
+        position = 1
+        length = len(a)
+
+        for tag, i1, i2, j1, j2 in opcodes(a, b, max_edits) + [('equal', len(a), len(a), len(b), len(b))]:
+            if tag != 'equal':
+                deleted.extend(range(i1, i2))
+                inserted.extend(range(j1, j2))
+                continue
+
+            for index in inserted[:len(deleted)]:
+                self.edits.append(Edit('-R', table, self.chain, position, new[index]))
+                position += 1
+
+            for index in deleted[len(inserted):]:
+                self.edits.append(Edit('-D', table, self.chain, position))
+                length -= 1
+
+            for index in inserted[len(deleted):]:
+                if position > length:
+                    self.edits.append(Edit('-A', table, self.chain, None, new[index]))
+                else:
+                    self.edits.append(Edit('-I', table, self.chain, position, new[index]))
+
+                position += 1
+                length += 1
+
+            position += i2 - i1
+            all_deleted.extend(deleted)
+            all_inserted.extend(inserted)
+            deleted = []
+            inserted = []
+
+        moved = collections.Counter(a[index] for index in all_deleted) & \
+            collections.Counter(b[index] for index in all_inserted)
+
+        self.removed = [old[index] for index in take(all_deleted, a, moved, False)]
+        self.added = [new[index] for index in take(all_inserted, b, moved, False)]
+        self.moved = [new[index] for index in take(all_inserted, b, moved, True)]
+
+    def __len__(self):
+        return len(self.edits)
+
+    def __repr__(self):
+        return '<{} {}/{} +{} -{} ~{}>'.format(self.__class__.__name__, self.table, self.chain, len(self.added),
+                                               len(self.removed), len(self.moved))
+
+
+def take(indices, keys, counts, matching):
+    counts = collections.Counter(counts)
+    taken = []
+
+    for index in indices:
+        key = keys[index]
+
+        if counts[key] > 0:
+            counts[key] -= 1
+
+            if matching:
+                taken.append(index)
+
+        elif not matching:
+            taken.append(index)
+
+    return taken
+
+
+class RuleSetDiff:
+    old = None
+    new = None
+    chains = None
+    edits = None
+
+    def __init__(self, old, new, max_edits=MAX_EDITS):
+        self.old = old
+        self.new = new
+        self.chains = []
+        self.edits = []
+
+        for name in new.tables:
+            old_table = old.tables.get(name, Table(name))
+            self.diff_table(old_table, new[name], max_edits)
+
+        for name in old.tables:
+            if name not in new.tables:
+                self.diff_table(old[name], Table(name), max_edits)
+
+    def __len__(self):
+        return len(self.edits)
+
+    def __repr__(self):
+        return '<{} {} chains, {} edits>'.format(self.__class__.__name__, len(self.chains), len(self.edits))
+
+    def diff_table(self, old, new, max_edits):
+        edits = []
+        removed = []
+
+        for name, chain in new.chains.items():
+            if name not in old.chains and chain.action == '-':
+                edits.append(Edit('-N', new.name, name))
+
+        for name, chain in new.chains.items():
+            previous = old.chains.get(name)
+
+            if chain.action != '-' and (previous is None or previous.action != chain.action):
+                edits.append(Edit('-P', new.name, name, rule=chain.action))
+
+        for name, chain in new.chains.items():
+            chain_diff = ChainDiff(new.name, old.chains.get(name, Chain(name)), chain, max_edits)
+
+            if chain_diff.edits:
+                self.chains.append(chain_diff)
+                edits.extend(chain_diff.edits)
+
+        for name, chain in old.chains.items():
+            if name not in new.chains:
+                if len(chain):
+                    edits.append(Edit('-F', old.name, name))
+
+                if chain.action == '-':
+                    removed.append(Edit('-X', old.name, name))
+
+        self.edits.extend(edits + removed)
+
+    def apply(self, rule_set):
+        for edit in self.edits:
+            if edit.table not in rule_set.tables:
+                rule_set[edit.table] = Table(edit.table)
+
+            edit.apply(rule_set[edit.table])
+
+    def commands(self, program='iptables'):
+        return ['{} -t {} {}'.format(program, edit.table, edit.arguments()) for edit in self.edits]
+
+    def restore_script(self):
+        lines = []
+        table = None
+
+        for edit in self.edits:
+            if edit.table != table:
+                if table is not None:
+                    lines.append('COMMIT')
+
+                table = edit.table
+                lines.append('*{}'.format(table))
+
+            if edit.operation == '-N':
+                lines.append(':{} - [0:0]'.format(edit.chain))
+            elif edit.operation == '-P':
+                lines.append(self.new[edit.table][edit.chain].header())
+            else:
+                lines.append(edit.arguments())
+
+        if table is not None:
+            lines.append('COMMIT')
+
+        lines.append('')
+        return '\n'.join(lines)
+
+
+def diff(old, new, max_edits=MAX_EDITS):
+    return RuleSetDiff(old, new, max_edits)
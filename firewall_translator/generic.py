@@ -1,18 +1,51 @@
 import ipaddress
+import weakref
 
+INTERNED = weakref.WeakValueDictionary()
 
-class Action:
-    allow = False
-    log = False
-    reply = False
+
+def interned(cls, *args):
+    key = (cls,) + args
+
+    try:
+        return INTERNED[key]
+    except KeyError:
+        instance = INTERNED[key] = cls(*args)
+        return instance
+
+
+class Immutable:
+    __slots__ = ('__weakref__',)
+
+    def __delattr__(self, name):
+        raise AttributeError('{} is immutable'.format(self.__class__.__name__))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable'.format(self.__class__.__name__))
+
+
+class Action(Immutable):
+    __slots__ = ('allow', 'log', 'reply')
 
     def __init__(self, allow=False, reply=False, log=False):
         if allow and reply:
             raise NotImplementedError('ICMP reply not allowed when allowing traffic')
 
-        self.allow = allow
-        self.reply = reply
-        self.log = log
+        object.__setattr__(self, 'allow', allow)
+        object.__setattr__(self, 'reply', reply)
+        object.__setattr__(self, 'log', log)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self.allow, self.reply, self.log) == (other.allow, other.reply, other.log)
+
+    def __hash__(self):
+        return hash((self.allow, self.reply, self.log))
+
+    def __reduce__(self):
+        return self.__class__, (self.allow, self.reply, self.log)
 
     def __repr__(self):
         actions = []
@@ -46,12 +79,28 @@ class Action:
 
         return ' '.join(actions)
 
+    @classmethod
+    def intern(cls, allow=False, reply=False, log=False):
+        return interned(cls, allow, reply, log)
+
+
+class Interface(Immutable):
+    __slots__ = ('name',)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-class Interface:
-    name = None
+        return self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
 
     def __init__(self, name):
-        self.name = name
+        object.__setattr__(self, 'name', name)
+
+    def __reduce__(self):
+        return self.__class__, (self.name,)
 
     def __repr__(self):
         return '<{} {}>'.format(self.__class__.__name__, self.name)
@@ -59,16 +108,17 @@ class Interface:
     def __str__(self):
         return self.name
 
+    @classmethod
+    def intern(cls, name):
+        return interned(cls, name)
+
 
 class IPAddress:
-    address = None
-    name = None
+    __slots__ = ('address', 'name')
 
     def __init__(self, address, name=None):
         self.address = ipaddress.ip_interface(address).network
-
-        if name is not None:
-            self.name = name
+        self.name = name
 
     def __repr__(self):
         if self.name:
@@ -87,15 +137,24 @@ class NAT:
     pass
 
 
-class Protocol:
-    name = None
-    number = None
+class Protocol(Immutable):
+    __slots__ = ('name', 'number')
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self.number, self.name) == (other.number, other.name)
+
+    def __hash__(self):
+        return hash((self.number, self.name))
 
     def __init__(self, number, name=None):
-        self.number = number
+        object.__setattr__(self, 'number', number)
+        object.__setattr__(self, 'name', name)
 
-        if name is not None:
-            self.name = name
+    def __reduce__(self):
+        return self.__class__, (self.number, self.name)
 
     def __repr__(self):
         if self.name:
@@ -109,22 +168,22 @@ class Protocol:
 
         return 'ip/{}'.format(str(self.number))
 
+    @classmethod
+    def intern(cls, number, name=None):
+        return interned(cls, number, name)
+
 
 class Rule:
     pass
 
 
 class Service:
-    name = None
-    number = None
-    protocol = None
+    __slots__ = ('name', 'number', 'protocol')
 
     def __init__(self, protocol, number, name=None):
         self.protocol = protocol
         self.number = number
-
-        if name is not None:
-            self.name = name
+        self.name = name
 
     def __repr__(self):
         if self.name:
@@ -140,13 +199,14 @@ class Service:
 
 
 class TimeRange:
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError('Time range must be either absolute or periodic')
 
 
 class AbsoluteTimeRange(TimeRange):
-    start = None
-    stop = None
+    __slots__ = ('start', 'stop')
 
     # noinspection PyMissingConstructor
     def __init__(self, start, stop):
@@ -163,9 +223,7 @@ class AbsoluteTimeRange(TimeRange):
 
 
 class PeriodicTimeRange(TimeRange):
-    start = None
-    stop = None
-    weekdays = None
+    __slots__ = ('start', 'stop', 'weekdays')
 
     # noinspection PyMissingConstructor
     def __init__(self, start, stop,
@@ -1,11670 +1,336 @@
+import collections.abc
+import mmap
+import os
+import struct
+import sys
+
 from firewall_translator.generic import Protocol, Service
 
-PROTOCOLS = {
-    '3pc': Protocol(34, '3pc'),
-    'a/n': Protocol(107, 'a/n'),
-    'ah': Protocol(51, 'ah'),
-    'argus': Protocol(13, 'argus'),
-    'aris': Protocol(104, 'aris'),
-    'ax.25': Protocol(93, 'ax.25'),
-    'bbn-rcc-mon': Protocol(10, 'bbn-rcc-mon'),
-    'bna': Protocol(49, 'bna'),
-    'br-sat-mon': Protocol(76, 'br-sat-mon'),
-    'cbt': Protocol(7, 'cbt'),
-    'cftp': Protocol(62, 'cftp'),
-    'chaos': Protocol(16, 'chaos'),
-    'compaq-peer': Protocol(110, 'compaq-peer'),
-    'cphb': Protocol(73, 'cphb'),
-    'cpnx': Protocol(72, 'cpnx'),
-    'crtp': Protocol(126, 'crtp'),
-    'crudp': Protocol(127, 'crudp'),
-    'dccp': Protocol(33, 'dccp'),
-    'dcn-meas': Protocol(19, 'dcn-meas'),
-    'ddp': Protocol(37, 'ddp'),
-    'ddx': Protocol(116, 'ddx'),
-    'dgp': Protocol(86, 'dgp'),
-    'dsr': Protocol(48, 'dsr'),
-    'egp': Protocol(8, 'egp'),
-    'eigrp': Protocol(88, 'eigrp'),
-    'emcon': Protocol(14, 'emcon'),
-    'encap': Protocol(98, 'encap'),
-    'esp': Protocol(50, 'esp'),
-    'etherip': Protocol(97, 'etherip'),
-    'fc': Protocol(133, 'fc'),
-    'fire': Protocol(125, 'fire'),
-    'ggp': Protocol(3, 'ggp'),
-    'gmtp': Protocol(100, 'gmtp'),
-    'gre': Protocol(47, 'gre'),
-    'hip': Protocol(139, 'hip'),
-    'hmp': Protocol(20, 'hmp'),
-    'hopopt': Protocol(0, 'hopopt'),
-    'i-nlsp': Protocol(52, 'i-nlsp'),
-    'iatp': Protocol(117, 'iatp'),
-    'icmp': Protocol(1, 'icmp'),
-    'idpr': Protocol(35, 'idpr'),
-    'idpr-cmtp': Protocol(38, 'idpr-cmtp'),
-    'idrp': Protocol(45, 'idrp'),
-    'ifmp': Protocol(101, 'ifmp'),
-    'igmp': Protocol(2, 'igmp'),
-    'igp': Protocol(9, 'igp'),
-    'il': Protocol(40, 'il'),
-    'ipcomp': Protocol(108, 'ipcomp'),
-    'ipcv': Protocol(71, 'ipcv'),
-    'ipip': Protocol(94, 'ipip'),
-    'iplt': Protocol(129, 'iplt'),
-    'ippc': Protocol(67, 'ippc'),
-    'iptm': Protocol(84, 'iptm'),
-    'ipv4': Protocol(4, 'ipv4'),
-    'ipv6': Protocol(41, 'ipv6'),
-    'ipv6-frag': Protocol(44, 'ipv6-frag'),
-    'ipv6-icmp': Protocol(58, 'ipv6-icmp'),
-    'ipv6-nonxt': Protocol(59, 'ipv6-nonxt'),
-    'ipv6-opts': Protocol(60, 'ipv6-opts'),
-    'ipv6-route': Protocol(43, 'ipv6-route'),
-    'ipx-in-ip': Protocol(111, 'ipx-in-ip'),
-    'irtp': Protocol(28, 'irtp'),
-    'isis': Protocol(124, 'isis'),
-    'iso-ip': Protocol(80, 'iso-ip'),
-    'iso-tp4': Protocol(29, 'iso-tp4'),
-    'kryptolan': Protocol(65, 'kryptolan'),
-    'l2tp': Protocol(115, 'l2tp'),
-    'larp': Protocol(91, 'larp'),
-    'leaf-1': Protocol(25, 'leaf-1'),
-    'leaf-2': Protocol(26, 'leaf-2'),
-    'manet': Protocol(138, 'manet'),
-    'merit-inp': Protocol(32, 'merit-inp'),
-    'mfe-nsp': Protocol(31, 'mfe-nsp'),
-    'micp': Protocol(95, 'micp'),
-    'mobile': Protocol(55, 'mobile'),
-    'mobility': Protocol(135, 'mobility'),
-    'mpls-in-ip': Protocol(137, 'mpls-in-ip'),
-    'mtp': Protocol(92, 'mtp'),
-    'mux': Protocol(18, 'mux'),
-    'narp': Protocol(54, 'narp'),
-    'netblt': Protocol(30, 'netblt'),
-    'nsfnet-igp': Protocol(85, 'nsfnet-igp'),
-    'nvp-ii': Protocol(11, 'nvp-ii'),
-    'ospfigp': Protocol(89, 'ospfigp'),
-    'pgm': Protocol(113, 'pgm'),
-    'pim': Protocol(103, 'pim'),
-    'pipe': Protocol(131, 'pipe'),
-    'pnni': Protocol(102, 'pnni'),
-    'prm': Protocol(21, 'prm'),
-    'ptp': Protocol(123, 'ptp'),
-    'pup': Protocol(12, 'pup'),
-    'pvp': Protocol(75, 'pvp'),
-    'qnx': Protocol(106, 'qnx'),
-    'rdp': Protocol(27, 'rdp'),
-    'reserved': Protocol(255, 'reserved'),
-    'rohc': Protocol(142, 'rohc'),
-    'rsvp': Protocol(46, 'rsvp'),
-    'rsvp-e2e-ignore': Protocol(134, 'rsvp-e2e-ignore'),
-    'rvd': Protocol(66, 'rvd'),
-    'sat-expak': Protocol(64, 'sat-expak'),
-    'sat-mon': Protocol(69, 'sat-mon'),
-    'scc-sp': Protocol(96, 'scc-sp'),
-    'scps': Protocol(105, 'scps'),
-    'sctp': Protocol(132, 'sctp'),
-    'sdrp': Protocol(42, 'sdrp'),
-    'secure-vmtp': Protocol(82, 'secure-vmtp'),
-    'shim6': Protocol(140, 'shim6'),
-    'skip': Protocol(57, 'skip'),
-    'sm': Protocol(122, 'sm'),
-    'smp': Protocol(121, 'smp'),
-    'snp': Protocol(109, 'snp'),
-    'sprite-rpc': Protocol(90, 'sprite-rpc'),
-    'sps': Protocol(130, 'sps'),
-    'srp': Protocol(119, 'srp'),
-    'sscopmce': Protocol(128, 'sscopmce'),
-    'st': Protocol(5, 'st'),
-    'stp': Protocol(118, 'stp'),
-    'sun-nd': Protocol(77, 'sun-nd'),
-    'swipe': Protocol(53, 'swipe'),
-    'tcf': Protocol(87, 'tcf'),
-    'tcp': Protocol(6, 'tcp'),
-    'tlsp': Protocol(56, 'tlsp'),
-    'tp++': Protocol(39, 'tp++'),
-    'trunk-1': Protocol(23, 'trunk-1'),
-    'trunk-2': Protocol(24, 'trunk-2'),
-    'ttp': Protocol(84, 'ttp'),
-    'udp': Protocol(17, 'udp'),
-    'udplite': Protocol(136, 'udplite'),
-    'uti': Protocol(120, 'uti'),
-    'vines': Protocol(83, 'vines'),
-    'visa': Protocol(70, 'visa'),
-    'vmtp': Protocol(81, 'vmtp'),
-    'vrrp': Protocol(112, 'vrrp'),
-    'wb-expak': Protocol(79, 'wb-expak'),
-    'wb-mon': Protocol(78, 'wb-mon'),
-    'wesp': Protocol(141, 'wesp'),
-    'wsn': Protocol(74, 'wsn'),
-    'xnet': Protocol(15, 'xnet'),
-    'xns-idp': Protocol(22, 'xns-idp'),
-    'xtp': Protocol(36, 'xtp'),
-}
+SNAPSHOT_FILE = os.path.join(os.path.dirname(__file__), 'iana.dat')
+SNAPSHOT_MAGIC = b'IANA'
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct('<4sHHII')
+SNAPSHOT_GROUP = struct.Struct('<IIII')
+
+
+class Table(collections.abc.Mapping):
+    reverse = None
+
+    def names_for(self, number):
+        return self.reverse_index()[number]
+
+    def reverse_index(self):
+        if self.reverse is None:
+            reverse = {}
+            for name, number in sorted(self.items()):
+                reverse.setdefault(number, []).append(name)
+            self.reverse = reverse
+
+        return self.reverse
+
+
+class TextTable(Table):
+    data = None
+    numbers = None
+
+    def __getitem__(self, key):
+        return int(self.decode()[key])
+
+    def __init__(self, data):
+        self.data = data
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __len__(self):
+        return len(self.decode())
+
+    def decode(self):
+        if self.numbers is None:
+            fields = self.data.split()
+            self.numbers = dict(zip(fields[::2], fields[1::2]))
+            self.data = None
+
+        return self.numbers
+
+
+class SnapshotTable(Table):
+    data = None
+    pool = None
+    offsets = None
+    numbers = None
+    order = None
+    names = None
+
+    def __getitem__(self, key):
+        if self.names is not None:
+            return self.names[key]
+
+        try:
+            name = key.encode('ascii')
+        except (AttributeError, UnicodeEncodeError):
+            raise KeyError(key)
+
+        low, high = 0, len(self.numbers)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.name(middle)
+
+            if current < name:
+                low = middle + 1
+            elif current > name:
+                high = middle
+            else:
+                return self.numbers[middle]
+
+        raise KeyError(key)
+
+    def __init__(self, data, pool, offsets, numbers, order):
+        self.data = data
+        self.pool = pool
+        self.offsets = offsets
+        self.numbers = numbers
+        self.order = order
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def decode(self):
+        if self.names is None:
+            start = self.offsets[0]
+            pool = self.data[self.pool + start:self.pool + self.offsets[-1]].decode('ascii')
+            offsets = self.offsets.tolist()
+            names = [pool[offsets[index] - start:offsets[index + 1] - start] for index in range(len(self.numbers))]
+            self.names = dict(zip(names, self.numbers.tolist()))
+
+        return self.names
+
+    def name(self, index):
+        return self.data[self.pool + self.offsets[index]:self.pool + self.offsets[index + 1]]
+
+    def names_for(self, number):
+        if self.reverse is not None:
+            return self.reverse[number]
+
+        low, high = 0, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+
+            if self.numbers[self.order[middle]] < number:
+                low = middle + 1
+            else:
+                high = middle
+
+        names = []
+        while low < len(self.order) and self.numbers[self.order[low]] == number:
+            names.append(self.name(self.order[low]).decode('ascii'))
+            low += 1
+
+        if not names:
+            raise KeyError(number)
+
+        return names
+
+
+class Registry(collections.abc.Mapping):
+    table = None
+    objects = None
+
+    def __getitem__(self, key):
+        try:
+            return self.objects[key]
+        except KeyError:
+            number = self.table[key]
+
+        value = self.objects[key] = self.build(key, number)
+        return value
+
+    def __init__(self, table):
+        self.table = table
+        self.objects = {}
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def __repr__(self):
+        return '<{} {}/{} loaded>'.format(self.__class__.__name__, len(self.objects), len(self))
+
+    def build(self, name, number):
+        raise NotImplementedError
+
+
+class ProtocolRegistry(Registry):
+    def build(self, name, number):
+        return Protocol.intern(number, name)
+
+
+class ServiceRegistry(Registry):
+    protocol = None
+
+    def __init__(self, table, protocol):
+        super(ServiceRegistry, self).__init__(table)
+        self.protocol = protocol
+
+    def build(self, name, number):
+        return Service(PROTOCOLS[self.protocol], number, name)
+
+
+class ReverseRegistry(collections.abc.Mapping):
+    registry = None
+    objects = None
+
+    def __getitem__(self, key):
+        try:
+            return self.objects[key]
+        except KeyError:
+            names = self.registry.table.names_for(key)
+
+        value = self.objects[key] = self.build([self.registry[name] for name in names])
+        return value
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.objects = {}
+
+    def __iter__(self):
+        return iter(self.registry.table.reverse_index())
+
+    def __len__(self):
+        return len(self.registry.table.reverse_index())
+
+    def __repr__(self):
+        return '<{} {}/{} loaded>'.format(self.__class__.__name__, len(self.objects), len(self))
+
+    def build(self, values):
+        return values
+
+
+class ProtocolsByNumber(ReverseRegistry):
+    def build(self, values):
+        return values[0]
+
+
+class ServiceRegistries(collections.abc.Mapping):
+    tables = None
+    registries = None
+
+    def __getitem__(self, key):
+        try:
+            return self.registries[key]
+        except KeyError:
+            table = self.tables[key]
+
+        registry = self.registries[key] = ServiceRegistry(table, key)
+        return registry
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.registries = {}
+
+    def __iter__(self):
+        return iter(self.tables)
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, list(self.tables))
+
+
+class ServicesByNumber(ServiceRegistries):
+    def __getitem__(self, key):
+        try:
+            return self.registries[key]
+        except KeyError:
+            registry = SERVICES[key]
+
+        registry = self.registries[key] = ReverseRegistry(registry)
+        return registry
+
+    def __init__(self):
+        super(ServicesByNumber, self).__init__(SERVICES.tables)
+
+
+def load_snapshot(file_path):
+    with open(file_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, count, pool, pool_size = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError('{} is not a version {} IANA snapshot'.format(file_path, SNAPSHOT_VERSION))
+
+    if sys.byteorder != 'little':
+        raise ValueError('IANA snapshots can only be mapped on little-endian hosts')
+
+    view = memoryview(data)
+    tables = {}
+
+    for index in range(count):
+        name, name_size, size, records = SNAPSHOT_GROUP.unpack_from(
+            data, SNAPSHOT_HEADER.size + index * SNAPSHOT_GROUP.size)
+        numbers = records + 4 * (size + 1)
+        order = numbers + 2 * size
+        order += -order % 4
+
+        tables[data[pool + name:pool + name + name_size].decode('ascii')] = SnapshotTable(
+            data, pool, view[records:numbers].cast('I'), view[numbers:numbers + 2 * size].cast('H'),
+            view[order:order + 4 * size].cast('I'))
+
+    return tables.pop(''), tables
+
+
+def load_module():
+    from firewall_translator import iana_data
+
+    return TextTable(iana_data.PROTOCOLS), {protocol: TextTable(data) for protocol, data in iana_data.SERVICES.items()}
+
+
+def load():
+    try:
+        return load_snapshot(SNAPSHOT_FILE)
+    except (OSError, ValueError, struct.error):
+        return load_module()
+
+
+def preload():
+    for registry in (PROTOCOLS, PROTOCOLS_BY_NUMBER):
+        for key in registry:
+            registry[key]
+
+    for protocol in SERVICES:
+        for registry in (SERVICES[protocol], SERVICES_BY_NUMBER[protocol]):
+            for key in registry:
+                registry[key]
+
+
+def get_protocol(protocol):
+    if isinstance(protocol, Protocol):
+        protocol = protocol.name or protocol.number
+
+    if isinstance(protocol, int) or protocol.isdigit():
+        return PROTOCOLS_BY_NUMBER[int(protocol)]
+
+    return PROTOCOLS[protocol.lower()]
+
+
+def get_services(protocol, port):
+    protocol = get_protocol(protocol)
+
+    try:
+        return SERVICES_BY_NUMBER[protocol.name][int(port)]
+    except KeyError:
+        return []
+
+
+protocol_table, service_tables = load()
 
-SERVICES = {
-    'dccp': {
-        'avt-profile-1': Service(PROTOCOLS['dccp'], 5004, 'avt-profile-1'),
-        'avt-profile-2': Service(PROTOCOLS['dccp'], 5005, 'avt-profile-2'),
-        'discard': Service(PROTOCOLS['dccp'], 9, 'discard'),
-        'dtn-bundle': Service(PROTOCOLS['dccp'], 4556, 'dtn-bundle'),
-        'exp1': Service(PROTOCOLS['dccp'], 1021, 'exp1'),
-        'exp2': Service(PROTOCOLS['dccp'], 1022, 'exp2'),
-        'ltp-deepspace': Service(PROTOCOLS['dccp'], 1113, 'ltp-deepspace'),
-        'syslog-tls': Service(PROTOCOLS['dccp'], 6514, 'syslog-tls'),
-    },
-    'sctp': {
-        'a25-fap-fgw': Service(PROTOCOLS['sctp'], 4502, 'a25-fap-fgw'),
-        'ads-c': Service(PROTOCOLS['sctp'], 5913, 'ads-c'),
-        'ahsp': Service(PROTOCOLS['sctp'], 4333, 'ahsp'),
-        'amqp': Service(PROTOCOLS['sctp'], 5672, 'amqp'),
-        'asap-sctp': Service(PROTOCOLS['sctp'], 3863, 'asap-sctp'),
-        'asap-sctp-tls': Service(PROTOCOLS['sctp'], 3864, 'asap-sctp-tls'),
-        'aurora': Service(PROTOCOLS['sctp'], 9084, 'aurora'),
-        'bgp': Service(PROTOCOLS['sctp'], 179, 'bgp'),
-        'car': Service(PROTOCOLS['sctp'], 5090, 'car'),
-        'cisco-ipsla': Service(PROTOCOLS['sctp'], 1167, 'cisco-ipsla'),
-        'cm': Service(PROTOCOLS['sctp'], 5910, 'cm'),
-        'conductor-mpx': Service(PROTOCOLS['sctp'], 6970, 'conductor-mpx'),
-        'cpdlc': Service(PROTOCOLS['sctp'], 5911, 'cpdlc'),
-        'cxtp': Service(PROTOCOLS['sctp'], 5091, 'cxtp'),
-        'diameter': Service(PROTOCOLS['sctp'], 3868, 'diameter'),
-        'diameters': Service(PROTOCOLS['sctp'], 5868, 'diameters'),
-        'discard': Service(PROTOCOLS['sctp'], 9, 'discard'),
-        'enrp-sctp': Service(PROTOCOLS['sctp'], 9901, 'enrp-sctp'),
-        'enrp-sctp-tls': Service(PROTOCOLS['sctp'], 9902, 'enrp-sctp-tls'),
-        'exp1': Service(PROTOCOLS['sctp'], 1021, 'exp1'),
-        'exp2': Service(PROTOCOLS['sctp'], 1022, 'exp2'),
-        'f1-control': Service(PROTOCOLS['sctp'], 38472, 'f1-control'),
-        'fis': Service(PROTOCOLS['sctp'], 5912, 'fis'),
-        'frc-hp': Service(PROTOCOLS['sctp'], 6704, 'frc-hp'),
-        'frc-lp': Service(PROTOCOLS['sctp'], 6706, 'frc-lp'),
-        'frc-mp': Service(PROTOCOLS['sctp'], 6705, 'frc-mp'),
-        'ftp': Service(PROTOCOLS['sctp'], 21, 'ftp'),
-        'ftp-data': Service(PROTOCOLS['sctp'], 20, 'ftp-data'),
-        'h248-binary': Service(PROTOCOLS['sctp'], 2945, 'h248-binary'),
-        'h323hostcall': Service(PROTOCOLS['sctp'], 1720, 'h323hostcall'),
-        'http': Service(PROTOCOLS['sctp'], 80, 'http'),
-        'https': Service(PROTOCOLS['sctp'], 443, 'https'),
-        'ipfix': Service(PROTOCOLS['sctp'], 4739, 'ipfix'),
-        'ipfixs': Service(PROTOCOLS['sctp'], 4740, 'ipfixs'),
-        'itu-bicc-stc': Service(PROTOCOLS['sctp'], 3097, 'itu-bicc-stc'),
-        'iua': Service(PROTOCOLS['sctp'], 9900, 'iua'),
-        'iuhsctpassoc': Service(PROTOCOLS['sctp'], 29169, 'iuhsctpassoc'),
-        'lcs-ap': Service(PROTOCOLS['sctp'], 9082, 'lcs-ap'),
-        'm2ap': Service(PROTOCOLS['sctp'], 36443, 'm2ap'),
-        'm2pa': Service(PROTOCOLS['sctp'], 3565, 'm2pa'),
-        'm2ua': Service(PROTOCOLS['sctp'], 2904, 'm2ua'),
-        'm3ap': Service(PROTOCOLS['sctp'], 36444, 'm3ap'),
-        'm3ua': Service(PROTOCOLS['sctp'], 2905, 'm3ua'),
-        'megaco-h248': Service(PROTOCOLS['sctp'], 2944, 'megaco-h248'),
-        'nfapi': Service(PROTOCOLS['sctp'], 7701, 'nfapi'),
-        'nfs': Service(PROTOCOLS['sctp'], 2049, 'nfs'),
-        'nfsrdma': Service(PROTOCOLS['sctp'], 20049, 'nfsrdma'),
-        'ng-control': Service(PROTOCOLS['sctp'], 38412, 'ng-control'),
-        'noteza': Service(PROTOCOLS['sctp'], 5215, 'noteza'),
-        'nq-ap': Service(PROTOCOLS['sctp'], 36424, 'nq-ap'),
-        'osvr': Service(PROTOCOLS['sctp'], 7728, 'osvr'),
-        'pim-port': Service(PROTOCOLS['sctp'], 8471, 'pim-port'),
-        'rcip-itu': Service(PROTOCOLS['sctp'], 2225, 'rcip-itu'),
-        'rna': Service(PROTOCOLS['sctp'], 25471, 'rna'),
-        'rwp': Service(PROTOCOLS['sctp'], 30100, 'rwp'),
-        's1-control': Service(PROTOCOLS['sctp'], 36412, 's1-control'),
-        'sbcap': Service(PROTOCOLS['sctp'], 29168, 'sbcap'),
-        'sgsap': Service(PROTOCOLS['sctp'], 29118, 'sgsap'),
-        'simco': Service(PROTOCOLS['sctp'], 7626, 'simco'),
-        'sip': Service(PROTOCOLS['sctp'], 5060, 'sip'),
-        'sips': Service(PROTOCOLS['sctp'], 5061, 'sips'),
-        'slmap': Service(PROTOCOLS['sctp'], 36423, 'slmap'),
-        'smbdirect': Service(PROTOCOLS['sctp'], 5445, 'smbdirect'),
-        'ssh': Service(PROTOCOLS['sctp'], 22, 'ssh'),
-        'sua': Service(PROTOCOLS['sctp'], 14001, 'sua'),
-        'trinity-dist': Service(PROTOCOLS['sctp'], 4711, 'trinity-dist'),
-        'v5ua': Service(PROTOCOLS['sctp'], 5675, 'v5ua'),
-        'wmedistribution': Service(PROTOCOLS['sctp'], 11998, 'wmedistribution'),
-        'wmereceiving': Service(PROTOCOLS['sctp'], 11997, 'wmereceiving'),
-        'wmereporting': Service(PROTOCOLS['sctp'], 11999, 'wmereporting'),
-        'x2-control': Service(PROTOCOLS['sctp'], 36422, 'x2-control'),
-        'xn-control': Service(PROTOCOLS['sctp'], 38422, 'xn-control'),
-        'xw-control': Service(PROTOCOLS['sctp'], 36462, 'xw-control'),
-    },
-    'tcp': {
-        '1ci-smcs': Service(PROTOCOLS['tcp'], 3091, '1ci-smcs'),
-        '3com-amp3': Service(PROTOCOLS['tcp'], 629, '3com-amp3'),
-        '3com-net-mgmt': Service(PROTOCOLS['tcp'], 2391, '3com-net-mgmt'),
-        '3com-njack-1': Service(PROTOCOLS['tcp'], 5264, '3com-njack-1'),
-        '3com-njack-2': Service(PROTOCOLS['tcp'], 5265, '3com-njack-2'),
-        '3com-nsd': Service(PROTOCOLS['tcp'], 1742, '3com-nsd'),
-        '3com-tsmux': Service(PROTOCOLS['tcp'], 106, '3com-tsmux'),
-        '3com-webview': Service(PROTOCOLS['tcp'], 2339, '3com-webview'),
-        '3comfaxrpc': Service(PROTOCOLS['tcp'], 3446, '3comfaxrpc'),
-        '3comnetman': Service(PROTOCOLS['tcp'], 1181, '3comnetman'),
-        '3d-nfsd': Service(PROTOCOLS['tcp'], 2323, '3d-nfsd'),
-        '3ds-lm': Service(PROTOCOLS['tcp'], 1538, '3ds-lm'),
-        '3exmp': Service(PROTOCOLS['tcp'], 5221, '3exmp'),
-        '3gpp-cbsp': Service(PROTOCOLS['tcp'], 48049, '3gpp-cbsp'),
-        '3l-l1': Service(PROTOCOLS['tcp'], 1511, '3l-l1'),
-        '3link': Service(PROTOCOLS['tcp'], 15363, '3link'),
-        '3m-image-lm': Service(PROTOCOLS['tcp'], 1550, '3m-image-lm'),
-        '3par-evts': Service(PROTOCOLS['tcp'], 5781, '3par-evts'),
-        '3par-mgmt': Service(PROTOCOLS['tcp'], 5782, '3par-mgmt'),
-        '3par-mgmt-ssl': Service(PROTOCOLS['tcp'], 5783, '3par-mgmt-ssl'),
-        '3par-rcopy': Service(PROTOCOLS['tcp'], 5785, '3par-rcopy'),
-        '4-tieropmcli': Service(PROTOCOLS['tcp'], 2934, '4-tieropmcli'),
-        '4-tieropmgw': Service(PROTOCOLS['tcp'], 2933, '4-tieropmgw'),
-        '4talk': Service(PROTOCOLS['tcp'], 3284, '4talk'),
-        '5afe-dir': Service(PROTOCOLS['tcp'], 23294, '5afe-dir'),
-        '802-11-iapp': Service(PROTOCOLS['tcp'], 3517, '802-11-iapp'),
-        '914c-g': Service(PROTOCOLS['tcp'], 211, '914c-g'),
-        '914c/g': Service(PROTOCOLS['tcp'], 211, '914c/g'),
-        '9pfs': Service(PROTOCOLS['tcp'], 564, '9pfs'),
-        'a1-bs': Service(PROTOCOLS['tcp'], 5603, 'a1-bs'),
-        'a1-msc': Service(PROTOCOLS['tcp'], 5602, 'a1-msc'),
-        'a13-an': Service(PROTOCOLS['tcp'], 3125, 'a13-an'),
-        'a14': Service(PROTOCOLS['tcp'], 3597, 'a14'),
-        'a15': Service(PROTOCOLS['tcp'], 3598, 'a15'),
-        'a16-an-an': Service(PROTOCOLS['tcp'], 4598, 'a16-an-an'),
-        'a17-an-an': Service(PROTOCOLS['tcp'], 4599, 'a17-an-an'),
-        'a21-an-1xbs': Service(PROTOCOLS['tcp'], 4597, 'a21-an-1xbs'),
-        'a3-sdunode': Service(PROTOCOLS['tcp'], 5604, 'a3-sdunode'),
-        'a4-sdunode': Service(PROTOCOLS['tcp'], 5605, 'a4-sdunode'),
-        'aairnet-1': Service(PROTOCOLS['tcp'], 3618, 'aairnet-1'),
-        'aairnet-2': Service(PROTOCOLS['tcp'], 3619, 'aairnet-2'),
-        'aal-lm': Service(PROTOCOLS['tcp'], 1469, 'aal-lm'),
-        'aamp': Service(PROTOCOLS['tcp'], 3939, 'aamp'),
-        'aap': Service(PROTOCOLS['tcp'], 2878, 'aap'),
-        'aas': Service(PROTOCOLS['tcp'], 1601, 'aas'),
-        'abacus-remote': Service(PROTOCOLS['tcp'], 2894, 'abacus-remote'),
-        'abarsd': Service(PROTOCOLS['tcp'], 8402, 'abarsd'),
-        'abatemgr': Service(PROTOCOLS['tcp'], 3655, 'abatemgr'),
-        'abatjss': Service(PROTOCOLS['tcp'], 3656, 'abatjss'),
-        'abb-escp': Service(PROTOCOLS['tcp'], 6316, 'abb-escp'),
-        'abb-hw': Service(PROTOCOLS['tcp'], 10020, 'abb-hw'),
-        'abbaccuray': Service(PROTOCOLS['tcp'], 1546, 'abbaccuray'),
-        'abbs': Service(PROTOCOLS['tcp'], 4885, 'abbs'),
-        'abcsoftware': Service(PROTOCOLS['tcp'], 3996, 'abcsoftware'),
-        'abcvoice-port': Service(PROTOCOLS['tcp'], 3781, 'abcvoice-port'),
-        'abr-api': Service(PROTOCOLS['tcp'], 1954, 'abr-api'),
-        'abr-secure': Service(PROTOCOLS['tcp'], 1955, 'abr-secure'),
-        'ac-cluster': Service(PROTOCOLS['tcp'], 18463, 'ac-cluster'),
-        'ac-tech': Service(PROTOCOLS['tcp'], 2796, 'ac-tech'),
-        'acap': Service(PROTOCOLS['tcp'], 674, 'acap'),
-        'acas': Service(PROTOCOLS['tcp'], 62, 'acas'),
-        'acc-raid': Service(PROTOCOLS['tcp'], 2800, 'acc-raid'),
-        'accel': Service(PROTOCOLS['tcp'], 4108, 'accel'),
-        'accelenet': Service(PROTOCOLS['tcp'], 1182, 'accelenet'),
-        'accessbuilder': Service(PROTOCOLS['tcp'], 888, 'accessbuilder'),
-        'accessnetwork': Service(PROTOCOLS['tcp'], 699, 'accessnetwork'),
-        'accord-mgc': Service(PROTOCOLS['tcp'], 1205, 'accord-mgc'),
-        'acctopus-cc': Service(PROTOCOLS['tcp'], 6868, 'acctopus-cc'),
-        'accu-lmgr': Service(PROTOCOLS['tcp'], 7781, 'accu-lmgr'),
-        'accuracer': Service(PROTOCOLS['tcp'], 12007, 'accuracer'),
-        'accuracer-dbms': Service(PROTOCOLS['tcp'], 12008, 'accuracer-dbms'),
-        'acd-pm': Service(PROTOCOLS['tcp'], 8793, 'acd-pm'),
-        'ace-client': Service(PROTOCOLS['tcp'], 2334, 'ace-client'),
-        'ace-proxy': Service(PROTOCOLS['tcp'], 2335, 'ace-proxy'),
-        'ace-server': Service(PROTOCOLS['tcp'], 2475, 'ace-server'),
-        'ace-svr-prop': Service(PROTOCOLS['tcp'], 2476, 'ace-svr-prop'),
-        'aci': Service(PROTOCOLS['tcp'], 187, 'aci'),
-        'acis': Service(PROTOCOLS['tcp'], 9953, 'acis'),
-        'acl-manager': Service(PROTOCOLS['tcp'], 4013, 'acl-manager'),
-        'acme': Service(PROTOCOLS['tcp'], 9216, 'acme'),
-        'acms': Service(PROTOCOLS['tcp'], 3980, 'acms'),
-        'acmsoda': Service(PROTOCOLS['tcp'], 6969, 'acmsoda'),
-        'acnet': Service(PROTOCOLS['tcp'], 6801, 'acnet'),
-        'acp': Service(PROTOCOLS['tcp'], 599, 'acp'),
-        'acp-conduit': Service(PROTOCOLS['tcp'], 3823, 'acp-conduit'),
-        'acp-discovery': Service(PROTOCOLS['tcp'], 3822, 'acp-discovery'),
-        'acp-policy': Service(PROTOCOLS['tcp'], 3824, 'acp-policy'),
-        'acp-port': Service(PROTOCOLS['tcp'], 2071, 'acp-port'),
-        'acp-proto': Service(PROTOCOLS['tcp'], 4046, 'acp-proto'),
-        'acplt': Service(PROTOCOLS['tcp'], 7509, 'acplt'),
-        'acptsys': Service(PROTOCOLS['tcp'], 2149, 'acptsys'),
-        'acr-nema': Service(PROTOCOLS['tcp'], 104, 'acr-nema'),
-        'acter': Service(PROTOCOLS['tcp'], 4671, 'acter'),
-        'actifio-c2c': Service(PROTOCOLS['tcp'], 5103, 'actifio-c2c'),
-        'actifioreplic': Service(PROTOCOLS['tcp'], 5107, 'actifioreplic'),
-        'actifioudsagent': Service(PROTOCOLS['tcp'], 5106, 'actifioudsagent'),
-        'activememory': Service(PROTOCOLS['tcp'], 2859, 'activememory'),
-        'activesync': Service(PROTOCOLS['tcp'], 1034, 'activesync'),
-        'actnet': Service(PROTOCOLS['tcp'], 5411, 'actnet'),
-        'ada-cip': Service(PROTOCOLS['tcp'], 2085, 'ada-cip'),
-        'adap': Service(PROTOCOLS['tcp'], 6350, 'adap'),
-        'adapt-sna': Service(PROTOCOLS['tcp'], 1365, 'adapt-sna'),
-        'adaptecmgr': Service(PROTOCOLS['tcp'], 2521, 'adaptecmgr'),
-        'adcp': Service(PROTOCOLS['tcp'], 7508, 'adcp'),
-        'adi-gxp-srvprt': Service(PROTOCOLS['tcp'], 6769, 'adi-gxp-srvprt'),
-        'admind': Service(PROTOCOLS['tcp'], 8403, 'admind'),
-        'admins-lms': Service(PROTOCOLS['tcp'], 2692, 'admins-lms'),
-        'adobeserver-1': Service(PROTOCOLS['tcp'], 1102, 'adobeserver-1'),
-        'adobeserver-2': Service(PROTOCOLS['tcp'], 1103, 'adobeserver-2'),
-        'adobeserver-3': Service(PROTOCOLS['tcp'], 3703, 'adobeserver-3'),
-        'adobeserver-4': Service(PROTOCOLS['tcp'], 3704, 'adobeserver-4'),
-        'adobeserver-5': Service(PROTOCOLS['tcp'], 3705, 'adobeserver-5'),
-        'adrep': Service(PROTOCOLS['tcp'], 3954, 'adrep'),
-        'ads': Service(PROTOCOLS['tcp'], 2550, 'ads'),
-        'ads-c': Service(PROTOCOLS['tcp'], 5913, 'ads-c'),
-        'adtech-test': Service(PROTOCOLS['tcp'], 3357, 'adtech-test'),
-        'adtempusclient': Service(PROTOCOLS['tcp'], 3760, 'adtempusclient'),
-        'advant-lm': Service(PROTOCOLS['tcp'], 2295, 'advant-lm'),
-        'adws': Service(PROTOCOLS['tcp'], 9389, 'adws'),
-        'aed-512': Service(PROTOCOLS['tcp'], 149, 'aed-512'),
-        'aegate': Service(PROTOCOLS['tcp'], 4549, 'aegate'),
-        'aequus': Service(PROTOCOLS['tcp'], 23456, 'aequus'),
-        'aequus-alt': Service(PROTOCOLS['tcp'], 23457, 'aequus-alt'),
-        'aeroflight-ads': Service(PROTOCOLS['tcp'], 1218, 'aeroflight-ads'),
-        'aeroflight-ret': Service(PROTOCOLS['tcp'], 1219, 'aeroflight-ret'),
-        'aes-discovery': Service(PROTOCOLS['tcp'], 3224, 'aes-discovery'),
-        'af': Service(PROTOCOLS['tcp'], 1411, 'af'),
-        'afesc-mc': Service(PROTOCOLS['tcp'], 6628, 'afesc-mc'),
-        'affiliate': Service(PROTOCOLS['tcp'], 6579, 'affiliate'),
-        'afpovertcp': Service(PROTOCOLS['tcp'], 548, 'afpovertcp'),
-        'afrog': Service(PROTOCOLS['tcp'], 1042, 'afrog'),
-        'afs': Service(PROTOCOLS['tcp'], 1483, 'afs'),
-        'afs3-bos': Service(PROTOCOLS['tcp'], 7007, 'afs3-bos'),
-        'afs3-callback': Service(PROTOCOLS['tcp'], 7001, 'afs3-callback'),
-        'afs3-errors': Service(PROTOCOLS['tcp'], 7006, 'afs3-errors'),
-        'afs3-fileserver': Service(PROTOCOLS['tcp'], 7000, 'afs3-fileserver'),
-        'afs3-kaserver': Service(PROTOCOLS['tcp'], 7004, 'afs3-kaserver'),
-        'afs3-prserver': Service(PROTOCOLS['tcp'], 7002, 'afs3-prserver'),
-        'afs3-rmtsys': Service(PROTOCOLS['tcp'], 7009, 'afs3-rmtsys'),
-        'afs3-update': Service(PROTOCOLS['tcp'], 7008, 'afs3-update'),
-        'afs3-vlserver': Service(PROTOCOLS['tcp'], 7003, 'afs3-vlserver'),
-        'afs3-volser': Service(PROTOCOLS['tcp'], 7005, 'afs3-volser'),
-        'aftmux': Service(PROTOCOLS['tcp'], 3917, 'aftmux'),
-        'agcat': Service(PROTOCOLS['tcp'], 3915, 'agcat'),
-        'agentsease-db': Service(PROTOCOLS['tcp'], 3997, 'agentsease-db'),
-        'agentview': Service(PROTOCOLS['tcp'], 2331, 'agentview'),
-        'agentx': Service(PROTOCOLS['tcp'], 705, 'agentx'),
-        'agpolicy': Service(PROTOCOLS['tcp'], 38203, 'agpolicy'),
-        'agps-port': Service(PROTOCOLS['tcp'], 3425, 'agps-port'),
-        'agri-gateway': Service(PROTOCOLS['tcp'], 3026, 'agri-gateway'),
-        'agriserver': Service(PROTOCOLS['tcp'], 3021, 'agriserver'),
-        'agslb': Service(PROTOCOLS['tcp'], 4149, 'agslb'),
-        'ah-esp-encap': Service(PROTOCOLS['tcp'], 2070, 'ah-esp-encap'),
-        'ahsp': Service(PROTOCOLS['tcp'], 4333, 'ahsp'),
-        'aiagent': Service(PROTOCOLS['tcp'], 7738, 'aiagent'),
-        'aibkup': Service(PROTOCOLS['tcp'], 4071, 'aibkup'),
-        'aic-np': Service(PROTOCOLS['tcp'], 2785, 'aic-np'),
-        'aic-oncrpc': Service(PROTOCOLS['tcp'], 2786, 'aic-oncrpc'),
-        'aicc-cmi': Service(PROTOCOLS['tcp'], 3316, 'aicc-cmi'),
-        'aigairserver': Service(PROTOCOLS['tcp'], 21221, 'aigairserver'),
-        'ailith': Service(PROTOCOLS['tcp'], 17555, 'ailith'),
-        'aimpp-hello': Service(PROTOCOLS['tcp'], 2846, 'aimpp-hello'),
-        'aimpp-port-req': Service(PROTOCOLS['tcp'], 2847, 'aimpp-port-req'),
-        'aipn-auth': Service(PROTOCOLS['tcp'], 3833, 'aipn-auth'),
-        'aipn-reg': Service(PROTOCOLS['tcp'], 4113, 'aipn-reg'),
-        'aironetddp': Service(PROTOCOLS['tcp'], 2887, 'aironetddp'),
-        'airs': Service(PROTOCOLS['tcp'], 1481, 'airs'),
-        'airshot': Service(PROTOCOLS['tcp'], 3975, 'airshot'),
-        'airsync': Service(PROTOCOLS['tcp'], 2175, 'airsync'),
-        'aises': Service(PROTOCOLS['tcp'], 2783, 'aises'),
-        'aker-cdp': Service(PROTOCOLS['tcp'], 2473, 'aker-cdp'),
-        'alaris-disc': Service(PROTOCOLS['tcp'], 3613, 'alaris-disc'),
-        'alarm': Service(PROTOCOLS['tcp'], 2740, 'alarm'),
-        'alarm-clock-c': Service(PROTOCOLS['tcp'], 2668, 'alarm-clock-c'),
-        'alarm-clock-s': Service(PROTOCOLS['tcp'], 2667, 'alarm-clock-s'),
-        'alchemy': Service(PROTOCOLS['tcp'], 3234, 'alchemy'),
-        'alesquery': Service(PROTOCOLS['tcp'], 5074, 'alesquery'),
-        'alias': Service(PROTOCOLS['tcp'], 1187, 'alias'),
-        'alljoyn-stm': Service(PROTOCOLS['tcp'], 9955, 'alljoyn-stm'),
-        'allpeers': Service(PROTOCOLS['tcp'], 36001, 'allpeers'),
-        'allstorcns': Service(PROTOCOLS['tcp'], 2901, 'allstorcns'),
-        'almobile-system': Service(PROTOCOLS['tcp'], 9209, 'almobile-system'),
-        'alpes': Service(PROTOCOLS['tcp'], 463, 'alpes'),
-        'alpha-sms': Service(PROTOCOLS['tcp'], 1849, 'alpha-sms'),
-        'alphatech-lm': Service(PROTOCOLS['tcp'], 1653, 'alphatech-lm'),
-        'alta-ana-lm': Service(PROTOCOLS['tcp'], 1346, 'alta-ana-lm'),
-        'altalink': Service(PROTOCOLS['tcp'], 1845, 'altalink'),
-        'altav-remmgt': Service(PROTOCOLS['tcp'], 2456, 'altav-remmgt'),
-        'altav-tunnel': Service(PROTOCOLS['tcp'], 3265, 'altav-tunnel'),
-        'altbsdp': Service(PROTOCOLS['tcp'], 7799, 'altbsdp'),
-        'altcp': Service(PROTOCOLS['tcp'], 4165, 'altcp'),
-        'altova-lm': Service(PROTOCOLS['tcp'], 35355, 'altova-lm'),
-        'altovacentral': Service(PROTOCOLS['tcp'], 4689, 'altovacentral'),
-        'altserviceboot': Service(PROTOCOLS['tcp'], 4011, 'altserviceboot'),
-        'amahi-anywhere': Service(PROTOCOLS['tcp'], 4563, 'amahi-anywhere'),
-        'amanda': Service(PROTOCOLS['tcp'], 10080, 'amanda'),
-        'amberon': Service(PROTOCOLS['tcp'], 8301, 'amberon'),
-        'ambit-lm': Service(PROTOCOLS['tcp'], 6831, 'ambit-lm'),
-        'amc': Service(PROTOCOLS['tcp'], 5506, 'amc'),
-        'amcs': Service(PROTOCOLS['tcp'], 8766, 'amcs'),
-        'amdsched': Service(PROTOCOLS['tcp'], 1931, 'amdsched'),
-        'ami-control': Service(PROTOCOLS['tcp'], 2640, 'ami-control'),
-        'amicon-fpsu-ra': Service(PROTOCOLS['tcp'], 30003, 'amicon-fpsu-ra'),
-        'amiganetfs': Service(PROTOCOLS['tcp'], 2100, 'amiganetfs'),
-        'aminet': Service(PROTOCOLS['tcp'], 2639, 'aminet'),
-        'amp': Service(PROTOCOLS['tcp'], 3811, 'amp'),
-        'ampify': Service(PROTOCOLS['tcp'], 8040, 'ampify'),
-        'ampl-lic': Service(PROTOCOLS['tcp'], 5195, 'ampl-lic'),
-        'ampl-tableproxy': Service(PROTOCOLS['tcp'], 5196, 'ampl-tableproxy'),
-        'ampr-info': Service(PROTOCOLS['tcp'], 1535, 'ampr-info'),
-        'ampr-inter': Service(PROTOCOLS['tcp'], 1536, 'ampr-inter'),
-        'ampr-rcmd': Service(PROTOCOLS['tcp'], 459, 'ampr-rcmd'),
-        'amqp': Service(PROTOCOLS['tcp'], 5672, 'amqp'),
-        'amqps': Service(PROTOCOLS['tcp'], 5671, 'amqps'),
-        'ams': Service(PROTOCOLS['tcp'], 1037, 'ams'),
-        'amt': Service(PROTOCOLS['tcp'], 2268, 'amt'),
-        'amt-blc-port': Service(PROTOCOLS['tcp'], 2848, 'amt-blc-port'),
-        'amt-cnf-prot': Service(PROTOCOLS['tcp'], 3054, 'amt-cnf-prot'),
-        'amt-esd-prot': Service(PROTOCOLS['tcp'], 1082, 'amt-esd-prot'),
-        'amt-redir-tcp': Service(PROTOCOLS['tcp'], 16994, 'amt-redir-tcp'),
-        'amt-redir-tls': Service(PROTOCOLS['tcp'], 16995, 'amt-redir-tls'),
-        'amt-soap-http': Service(PROTOCOLS['tcp'], 16992, 'amt-soap-http'),
-        'amt-soap-https': Service(PROTOCOLS['tcp'], 16993, 'amt-soap-https'),
-        'amx-axbnet': Service(PROTOCOLS['tcp'], 1320, 'amx-axbnet'),
-        'amx-icsp': Service(PROTOCOLS['tcp'], 1319, 'amx-icsp'),
-        'amx-rms': Service(PROTOCOLS['tcp'], 3839, 'amx-rms'),
-        'amx-webadmin': Service(PROTOCOLS['tcp'], 2929, 'amx-webadmin'),
-        'amx-weblinx': Service(PROTOCOLS['tcp'], 2930, 'amx-weblinx'),
-        'an-pcp': Service(PROTOCOLS['tcp'], 3846, 'an-pcp'),
-        'and-lm': Service(PROTOCOLS['tcp'], 2646, 'and-lm'),
-        'anet': Service(PROTOCOLS['tcp'], 212, 'anet'),
-        'anet-b': Service(PROTOCOLS['tcp'], 3338, 'anet-b'),
-        'anet-h': Service(PROTOCOLS['tcp'], 3341, 'anet-h'),
-        'anet-l': Service(PROTOCOLS['tcp'], 3339, 'anet-l'),
-        'anet-m': Service(PROTOCOLS['tcp'], 3340, 'anet-m'),
-        'anoto-rendezv': Service(PROTOCOLS['tcp'], 3715, 'anoto-rendezv'),
-        'ans-console': Service(PROTOCOLS['tcp'], 3440, 'ans-console'),
-        'ansanotify': Service(PROTOCOLS['tcp'], 116, 'ansanotify'),
-        'ansatrader': Service(PROTOCOLS['tcp'], 124, 'ansatrader'),
-        'ansoft-lm-1': Service(PROTOCOLS['tcp'], 1083, 'ansoft-lm-1'),
-        'ansoft-lm-2': Service(PROTOCOLS['tcp'], 1084, 'ansoft-lm-2'),
-        'answersoft-lm': Service(PROTOCOLS['tcp'], 1781, 'answersoft-lm'),
-        'ansys-lm': Service(PROTOCOLS['tcp'], 1800, 'ansys-lm'),
-        'ansysli': Service(PROTOCOLS['tcp'], 2325, 'ansysli'),
-        'ansyslmd': Service(PROTOCOLS['tcp'], 1055, 'ansyslmd'),
-        'anthony-data': Service(PROTOCOLS['tcp'], 1206, 'anthony-data'),
-        'antidotemgrsvr': Service(PROTOCOLS['tcp'], 2247, 'antidotemgrsvr'),
-        'aocp': Service(PROTOCOLS['tcp'], 2712, 'aocp'),
-        'aodv': Service(PROTOCOLS['tcp'], 654, 'aodv'),
-        'aol': Service(PROTOCOLS['tcp'], 5190, 'aol'),
-        'aol-1': Service(PROTOCOLS['tcp'], 5191, 'aol-1'),
-        'aol-2': Service(PROTOCOLS['tcp'], 5192, 'aol-2'),
-        'aol-3': Service(PROTOCOLS['tcp'], 5193, 'aol-3'),
-        'ap': Service(PROTOCOLS['tcp'], 47806, 'ap'),
-        'apani1': Service(PROTOCOLS['tcp'], 9160, 'apani1'),
-        'apani2': Service(PROTOCOLS['tcp'], 9161, 'apani2'),
-        'apani3': Service(PROTOCOLS['tcp'], 9162, 'apani3'),
-        'apani4': Service(PROTOCOLS['tcp'], 9163, 'apani4'),
-        'apani5': Service(PROTOCOLS['tcp'], 9164, 'apani5'),
-        'apc-2160': Service(PROTOCOLS['tcp'], 2160, 'apc-2160'),
-        'apc-2161': Service(PROTOCOLS['tcp'], 2161, 'apc-2161'),
-        'apc-2260': Service(PROTOCOLS['tcp'], 2260, 'apc-2260'),
-        'apc-3052': Service(PROTOCOLS['tcp'], 3052, 'apc-3052'),
-        'apc-3506': Service(PROTOCOLS['tcp'], 3506, 'apc-3506'),
-        'apc-5454': Service(PROTOCOLS['tcp'], 5454, 'apc-5454'),
-        'apc-5455': Service(PROTOCOLS['tcp'], 5455, 'apc-5455'),
-        'apc-5456': Service(PROTOCOLS['tcp'], 5456, 'apc-5456'),
-        'apc-6547': Service(PROTOCOLS['tcp'], 6547, 'apc-6547'),
-        'apc-6548': Service(PROTOCOLS['tcp'], 6548, 'apc-6548'),
-        'apc-6549': Service(PROTOCOLS['tcp'], 6549, 'apc-6549'),
-        'apc-7845': Service(PROTOCOLS['tcp'], 7845, 'apc-7845'),
-        'apc-7846': Service(PROTOCOLS['tcp'], 7846, 'apc-7846'),
-        'apc-9950': Service(PROTOCOLS['tcp'], 9950, 'apc-9950'),
-        'apc-9951': Service(PROTOCOLS['tcp'], 9951, 'apc-9951'),
-        'apc-9952': Service(PROTOCOLS['tcp'], 9952, 'apc-9952'),
-        'apc-necmp': Service(PROTOCOLS['tcp'], 18888, 'apc-necmp'),
-        'apcupsd': Service(PROTOCOLS['tcp'], 3551, 'apcupsd'),
-        'apdap': Service(PROTOCOLS['tcp'], 3948, 'apdap'),
-        'apertus-ldp': Service(PROTOCOLS['tcp'], 539, 'apertus-ldp'),
-        'apex-edge': Service(PROTOCOLS['tcp'], 913, 'apex-edge'),
-        'apex-mesh': Service(PROTOCOLS['tcp'], 912, 'apex-mesh'),
-        'aplx': Service(PROTOCOLS['tcp'], 1134, 'aplx'),
-        'apm-link': Service(PROTOCOLS['tcp'], 32483, 'apm-link'),
-        'apocd': Service(PROTOCOLS['tcp'], 3809, 'apocd'),
-        'apogeex-port': Service(PROTOCOLS['tcp'], 3184, 'apogeex-port'),
-        'apollo-admin': Service(PROTOCOLS['tcp'], 8122, 'apollo-admin'),
-        'apollo-cc': Service(PROTOCOLS['tcp'], 2754, 'apollo-cc'),
-        'apollo-data': Service(PROTOCOLS['tcp'], 8121, 'apollo-data'),
-        'apollo-gms': Service(PROTOCOLS['tcp'], 2759, 'apollo-gms'),
-        'apollo-relay': Service(PROTOCOLS['tcp'], 10252, 'apollo-relay'),
-        'apollo-status': Service(PROTOCOLS['tcp'], 2758, 'apollo-status'),
-        'apparenet-as': Service(PROTOCOLS['tcp'], 3238, 'apparenet-as'),
-        'apparenet-tps': Service(PROTOCOLS['tcp'], 3237, 'apparenet-tps'),
-        'apparenet-ts': Service(PROTOCOLS['tcp'], 3236, 'apparenet-ts'),
-        'apparenet-ui': Service(PROTOCOLS['tcp'], 3239, 'apparenet-ui'),
-        'appiq-mgmt': Service(PROTOCOLS['tcp'], 4674, 'appiq-mgmt'),
-        'apple': Service(PROTOCOLS['tcp'], 3283, 'apple'),
-        'apple-licman': Service(PROTOCOLS['tcp'], 1381, 'apple-licman'),
-        'apple-sasl': Service(PROTOCOLS['tcp'], 3659, 'apple-sasl'),
-        'apple-vpns-rp': Service(PROTOCOLS['tcp'], 4112, 'apple-vpns-rp'),
-        'appleqtc': Service(PROTOCOLS['tcp'], 458, 'appleqtc'),
-        'appleqtcsrvr': Service(PROTOCOLS['tcp'], 545, 'appleqtcsrvr'),
-        'appleugcontrol': Service(PROTOCOLS['tcp'], 2336, 'appleugcontrol'),
-        'appliance-cfg': Service(PROTOCOLS['tcp'], 2898, 'appliance-cfg'),
-        'applus': Service(PROTOCOLS['tcp'], 2037, 'applus'),
-        'applusservice': Service(PROTOCOLS['tcp'], 4087, 'applusservice'),
-        'appman-server': Service(PROTOCOLS['tcp'], 3312, 'appman-server'),
-        'appserv-http': Service(PROTOCOLS['tcp'], 4848, 'appserv-http'),
-        'appserv-https': Service(PROTOCOLS['tcp'], 4849, 'appserv-https'),
-        'appss-lm': Service(PROTOCOLS['tcp'], 3879, 'appss-lm'),
-        'appswitch-emp': Service(PROTOCOLS['tcp'], 2616, 'appswitch-emp'),
-        'appworxsrv': Service(PROTOCOLS['tcp'], 2136, 'appworxsrv'),
-        'apri-lm': Service(PROTOCOLS['tcp'], 1447, 'apri-lm'),
-        'aprigo-cs': Service(PROTOCOLS['tcp'], 5086, 'aprigo-cs'),
-        'apsolab-col': Service(PROTOCOLS['tcp'], 5470, 'apsolab-col'),
-        'apsolab-cols': Service(PROTOCOLS['tcp'], 5471, 'apsolab-cols'),
-        'apsolab-data': Service(PROTOCOLS['tcp'], 5475, 'apsolab-data'),
-        'apsolab-tag': Service(PROTOCOLS['tcp'], 5472, 'apsolab-tag'),
-        'apsolab-tags': Service(PROTOCOLS['tcp'], 5473, 'apsolab-tags'),
-        'apw-registry': Service(PROTOCOLS['tcp'], 3758, 'apw-registry'),
-        'apwi-imserver': Service(PROTOCOLS['tcp'], 4391, 'apwi-imserver'),
-        'apwi-rxserver': Service(PROTOCOLS['tcp'], 4392, 'apwi-rxserver'),
-        'apwi-rxspooler': Service(PROTOCOLS['tcp'], 4393, 'apwi-rxspooler'),
-        'apx500api-1': Service(PROTOCOLS['tcp'], 2264, 'apx500api-1'),
-        'apx500api-2': Service(PROTOCOLS['tcp'], 2265, 'apx500api-2'),
-        'arbortext-lm': Service(PROTOCOLS['tcp'], 1557, 'arbortext-lm'),
-        'arcisdms': Service(PROTOCOLS['tcp'], 262, 'arcisdms'),
-        'arcp': Service(PROTOCOLS['tcp'], 7070, 'arcp'),
-        'arcpd': Service(PROTOCOLS['tcp'], 3513, 'arcpd'),
-        'ardt': Service(PROTOCOLS['tcp'], 1826, 'ardt'),
-        'ardus-cntl': Service(PROTOCOLS['tcp'], 1116, 'ardus-cntl'),
-        'ardus-mtrns': Service(PROTOCOLS['tcp'], 1117, 'ardus-mtrns'),
-        'ardus-trns': Service(PROTOCOLS['tcp'], 1115, 'ardus-trns'),
-        'ardusmul': Service(PROTOCOLS['tcp'], 1835, 'ardusmul'),
-        'ardusuni': Service(PROTOCOLS['tcp'], 1834, 'ardusuni'),
-        'areaguard-neo': Service(PROTOCOLS['tcp'], 23546, 'areaguard-neo'),
-        'arena-server': Service(PROTOCOLS['tcp'], 11321, 'arena-server'),
-        'arepa-cas': Service(PROTOCOLS['tcp'], 3030, 'arepa-cas'),
-        'arepa-raft': Service(PROTOCOLS['tcp'], 3025, 'arepa-raft'),
-        'argis-ds': Service(PROTOCOLS['tcp'], 2582, 'argis-ds'),
-        'argis-te': Service(PROTOCOLS['tcp'], 2581, 'argis-te'),
-        'aria': Service(PROTOCOLS['tcp'], 2624, 'aria'),
-        'ariel1': Service(PROTOCOLS['tcp'], 419, 'ariel1'),
-        'ariel2': Service(PROTOCOLS['tcp'], 421, 'ariel2'),
-        'ariel3': Service(PROTOCOLS['tcp'], 422, 'ariel3'),
-        'aries-kfinder': Service(PROTOCOLS['tcp'], 7570, 'aries-kfinder'),
-        'ariliamulti': Service(PROTOCOLS['tcp'], 3140, 'ariliamulti'),
-        'aritts': Service(PROTOCOLS['tcp'], 8423, 'aritts'),
-        'arkivio': Service(PROTOCOLS['tcp'], 3426, 'arkivio'),
-        'armadp': Service(PROTOCOLS['tcp'], 1913, 'armadp'),
-        'armcenterhttp': Service(PROTOCOLS['tcp'], 9294, 'armcenterhttp'),
-        'armcenterhttps': Service(PROTOCOLS['tcp'], 9295, 'armcenterhttps'),
-        'armi-server': Service(PROTOCOLS['tcp'], 3174, 'armi-server'),
-        'armtechdaemon': Service(PROTOCOLS['tcp'], 9292, 'armtechdaemon'),
-        'arns': Service(PROTOCOLS['tcp'], 384, 'arns'),
-        'array-manager': Service(PROTOCOLS['tcp'], 3726, 'array-manager'),
-        'ars-master': Service(PROTOCOLS['tcp'], 3176, 'ars-master'),
-        'ars-vista': Service(PROTOCOLS['tcp'], 27782, 'ars-vista'),
-        'artifact-msg': Service(PROTOCOLS['tcp'], 3518, 'artifact-msg'),
-        'aruba-server': Service(PROTOCOLS['tcp'], 7166, 'aruba-server'),
-        'as-debug': Service(PROTOCOLS['tcp'], 4026, 'as-debug'),
-        'as-servermap': Service(PROTOCOLS['tcp'], 449, 'as-servermap'),
-        'asa': Service(PROTOCOLS['tcp'], 386, 'asa'),
-        'asam': Service(PROTOCOLS['tcp'], 3451, 'asam'),
-        'asap-tcp': Service(PROTOCOLS['tcp'], 3863, 'asap-tcp'),
-        'asap-tcp-tls': Service(PROTOCOLS['tcp'], 3864, 'asap-tcp-tls'),
-        'asc-slmd': Service(PROTOCOLS['tcp'], 4448, 'asc-slmd'),
-        'asci-val': Service(PROTOCOLS['tcp'], 1560, 'asci-val'),
-        'asctrl-agent': Service(PROTOCOLS['tcp'], 5155, 'asctrl-agent'),
-        'asdis': Service(PROTOCOLS['tcp'], 2192, 'asdis'),
-        'asgcypresstcps': Service(PROTOCOLS['tcp'], 11489, 'asgcypresstcps'),
-        'asgenf': Service(PROTOCOLS['tcp'], 5727, 'asgenf'),
-        'asi': Service(PROTOCOLS['tcp'], 1827, 'asi'),
-        'asia': Service(PROTOCOLS['tcp'], 626, 'asia'),
-        'asip-webadmin': Service(PROTOCOLS['tcp'], 311, 'asip-webadmin'),
-        'asipregistry': Service(PROTOCOLS['tcp'], 687, 'asipregistry'),
-        'asmp': Service(PROTOCOLS['tcp'], 45000, 'asmp'),
-        'asmps': Service(PROTOCOLS['tcp'], 45001, 'asmps'),
-        'asnaacceler8db': Service(PROTOCOLS['tcp'], 5042, 'asnaacceler8db'),
-        'asoki-sma': Service(PROTOCOLS['tcp'], 3087, 'asoki-sma'),
-        'aspeclmd': Service(PROTOCOLS['tcp'], 1544, 'aspeclmd'),
-        'aspen-services': Service(PROTOCOLS['tcp'], 1749, 'aspen-services'),
-        'aspentec-lm': Service(PROTOCOLS['tcp'], 6142, 'aspentec-lm'),
-        'asprovatalk': Service(PROTOCOLS['tcp'], 1079, 'asprovatalk'),
-        'asr': Service(PROTOCOLS['tcp'], 7800, 'asr'),
-        'assuria-ins': Service(PROTOCOLS['tcp'], 4704, 'assuria-ins'),
-        'assuria-slm': Service(PROTOCOLS['tcp'], 4119, 'assuria-slm'),
-        'assyst-dr': Service(PROTOCOLS['tcp'], 4485, 'assyst-dr'),
-        'astergate': Service(PROTOCOLS['tcp'], 9106, 'astergate'),
-        'astergatefax': Service(PROTOCOLS['tcp'], 9107, 'astergatefax'),
-        'asterix': Service(PROTOCOLS['tcp'], 8600, 'asterix'),
-        'astrolink': Service(PROTOCOLS['tcp'], 27876, 'astrolink'),
-        'astromed-main': Service(PROTOCOLS['tcp'], 2864, 'astromed-main'),
-        'at-3': Service(PROTOCOLS['tcp'], 203, 'at-3'),
-        'at-5': Service(PROTOCOLS['tcp'], 205, 'at-5'),
-        'at-7': Service(PROTOCOLS['tcp'], 207, 'at-7'),
-        'at-8': Service(PROTOCOLS['tcp'], 208, 'at-8'),
-        'at-echo': Service(PROTOCOLS['tcp'], 204, 'at-echo'),
-        'at-nbp': Service(PROTOCOLS['tcp'], 202, 'at-nbp'),
-        'at-rtmp': Service(PROTOCOLS['tcp'], 201, 'at-rtmp'),
-        'at-zis': Service(PROTOCOLS['tcp'], 206, 'at-zis'),
-        'atc-appserver': Service(PROTOCOLS['tcp'], 1171, 'atc-appserver'),
-        'atc-lm': Service(PROTOCOLS['tcp'], 1170, 'atc-lm'),
-        'atex-elmd': Service(PROTOCOLS['tcp'], 1385, 'atex-elmd'),
-        'atex_elmd': Service(PROTOCOLS['tcp'], 1385, 'atex_elmd'),
-        'athand-mmp': Service(PROTOCOLS['tcp'], 20999, 'athand-mmp'),
-        'ati-ip-to-ncpe': Service(PROTOCOLS['tcp'], 3965, 'ati-ip-to-ncpe'),
-        'atlinks': Service(PROTOCOLS['tcp'], 4154, 'atlinks'),
-        'atm-uhas': Service(PROTOCOLS['tcp'], 11367, 'atm-uhas'),
-        'atm-zip-office': Service(PROTOCOLS['tcp'], 1520, 'atm-zip-office'),
-        'atmp': Service(PROTOCOLS['tcp'], 5150, 'atmp'),
-        'atmtcp': Service(PROTOCOLS['tcp'], 2812, 'atmtcp'),
-        'ats': Service(PROTOCOLS['tcp'], 2201, 'ats'),
-        'att-mt-sms': Service(PROTOCOLS['tcp'], 5586, 'att-mt-sms'),
-        'attachmate-g32': Service(PROTOCOLS['tcp'], 2317, 'attachmate-g32'),
-        'attachmate-s2s': Service(PROTOCOLS['tcp'], 2419, 'attachmate-s2s'),
-        'attachmate-uts': Service(PROTOCOLS['tcp'], 2304, 'attachmate-uts'),
-        'atul': Service(PROTOCOLS['tcp'], 7543, 'atul'),
-        'audio-activmail': Service(PROTOCOLS['tcp'], 1397, 'audio-activmail'),
-        'audiojuggler': Service(PROTOCOLS['tcp'], 3643, 'audiojuggler'),
-        'audit': Service(PROTOCOLS['tcp'], 182, 'audit'),
-        'audit-transfer': Service(PROTOCOLS['tcp'], 1146, 'audit-transfer'),
-        'auditd': Service(PROTOCOLS['tcp'], 48, 'auditd'),
-        'aura': Service(PROTOCOLS['tcp'], 2066, 'aura'),
-        'auriga-router': Service(PROTOCOLS['tcp'], 5680, 'auriga-router'),
-        'auris': Service(PROTOCOLS['tcp'], 2772, 'auris'),
-        'aurora': Service(PROTOCOLS['tcp'], 9084, 'aurora'),
-        'aurora-balaena': Service(PROTOCOLS['tcp'], 33123, 'aurora-balaena'),
-        'aurora-cmgr': Service(PROTOCOLS['tcp'], 364, 'aurora-cmgr'),
-        'aurp': Service(PROTOCOLS['tcp'], 387, 'aurp'),
-        'auth': Service(PROTOCOLS['tcp'], 113, 'auth'),
-        'authentx': Service(PROTOCOLS['tcp'], 5067, 'authentx'),
-        'autobuild': Service(PROTOCOLS['tcp'], 5115, 'autobuild'),
-        'autocueds': Service(PROTOCOLS['tcp'], 3437, 'autocueds'),
-        'autocuelog': Service(PROTOCOLS['tcp'], 3104, 'autocuelog'),
-        'autocuesmi': Service(PROTOCOLS['tcp'], 3103, 'autocuesmi'),
-        'autodesk-lm': Service(PROTOCOLS['tcp'], 1422, 'autodesk-lm'),
-        'autodesk-nlm': Service(PROTOCOLS['tcp'], 2080, 'autodesk-nlm'),
-        'autonoc': Service(PROTOCOLS['tcp'], 1140, 'autonoc'),
-        'autopac': Service(PROTOCOLS['tcp'], 4685, 'autopac'),
-        'autotrac-acp': Service(PROTOCOLS['tcp'], 31020, 'autotrac-acp'),
-        'av-emb-config': Service(PROTOCOLS['tcp'], 2050, 'av-emb-config'),
-        'availant-mgr': Service(PROTOCOLS['tcp'], 1122, 'availant-mgr'),
-        'avantageb2b': Service(PROTOCOLS['tcp'], 2131, 'avantageb2b'),
-        'avanti-cdp': Service(PROTOCOLS['tcp'], 4065, 'avanti-cdp'),
-        'avanti_cdp': Service(PROTOCOLS['tcp'], 4065, 'avanti_cdp'),
-        'avauthsrvprtcl': Service(PROTOCOLS['tcp'], 2068, 'avauthsrvprtcl'),
-        'avdecc': Service(PROTOCOLS['tcp'], 17221, 'avdecc'),
-        'avenue': Service(PROTOCOLS['tcp'], 2134, 'avenue'),
-        'avenyo': Service(PROTOCOLS['tcp'], 2992, 'avenyo'),
-        'avesterra': Service(PROTOCOLS['tcp'], 20057, 'avesterra'),
-        'avi-nms': Service(PROTOCOLS['tcp'], 4413, 'avi-nms'),
-        'avian': Service(PROTOCOLS['tcp'], 486, 'avian'),
-        'avinstalldisc': Service(PROTOCOLS['tcp'], 3502, 'avinstalldisc'),
-        'aviva-sna': Service(PROTOCOLS['tcp'], 2238, 'aviva-sna'),
-        'avocent-adsap': Service(PROTOCOLS['tcp'], 3871, 'avocent-adsap'),
-        'avocent-proxy': Service(PROTOCOLS['tcp'], 1078, 'avocent-proxy'),
-        'avsecuremgmt': Service(PROTOCOLS['tcp'], 3211, 'avsecuremgmt'),
-        'avt-profile-1': Service(PROTOCOLS['tcp'], 5004, 'avt-profile-1'),
-        'avt-profile-2': Service(PROTOCOLS['tcp'], 5005, 'avt-profile-2'),
-        'avtp': Service(PROTOCOLS['tcp'], 17220, 'avtp'),
-        'awacs-ice': Service(PROTOCOLS['tcp'], 4488, 'awacs-ice'),
-        'awg-proxy': Service(PROTOCOLS['tcp'], 3277, 'awg-proxy'),
-        'aws-brf': Service(PROTOCOLS['tcp'], 22800, 'aws-brf'),
-        'axio-disc': Service(PROTOCOLS['tcp'], 35100, 'axio-disc'),
-        'axis-wimp-port': Service(PROTOCOLS['tcp'], 10260, 'axis-wimp-port'),
-        'axon-lm': Service(PROTOCOLS['tcp'], 1548, 'axon-lm'),
-        'axon-tunnel': Service(PROTOCOLS['tcp'], 16665, 'axon-tunnel'),
-        'ayiya': Service(PROTOCOLS['tcp'], 5072, 'ayiya'),
-        'azeti': Service(PROTOCOLS['tcp'], 4192, 'azeti'),
-        'aztec': Service(PROTOCOLS['tcp'], 3512, 'aztec'),
-        'b-novative-ls': Service(PROTOCOLS['tcp'], 1896, 'b-novative-ls'),
-        'b2-license': Service(PROTOCOLS['tcp'], 2204, 'b2-license'),
-        'b2-runtime': Service(PROTOCOLS['tcp'], 2203, 'b2-runtime'),
-        'b2n': Service(PROTOCOLS['tcp'], 1179, 'b2n'),
-        'backburner': Service(PROTOCOLS['tcp'], 2635, 'backburner'),
-        'backroomnet': Service(PROTOCOLS['tcp'], 3387, 'backroomnet'),
-        'backup-express': Service(PROTOCOLS['tcp'], 6123, 'backup-express'),
-        'backupedge': Service(PROTOCOLS['tcp'], 3946, 'backupedge'),
-        'bacnet': Service(PROTOCOLS['tcp'], 47808, 'bacnet'),
-        'bacula-dir': Service(PROTOCOLS['tcp'], 9101, 'bacula-dir'),
-        'bacula-fd': Service(PROTOCOLS['tcp'], 9102, 'bacula-fd'),
-        'bacula-sd': Service(PROTOCOLS['tcp'], 9103, 'bacula-sd'),
-        'badm-priv': Service(PROTOCOLS['tcp'], 6505, 'badm-priv'),
-        'badm-pub': Service(PROTOCOLS['tcp'], 6506, 'badm-pub'),
-        'badm_priv': Service(PROTOCOLS['tcp'], 6505, 'badm_priv'),
-        'badm_pub': Service(PROTOCOLS['tcp'], 6506, 'badm_pub'),
-        'bandwiz-system': Service(PROTOCOLS['tcp'], 1929, 'bandwiz-system'),
-        'banyan-net': Service(PROTOCOLS['tcp'], 2708, 'banyan-net'),
-        'banyan-rpc': Service(PROTOCOLS['tcp'], 567, 'banyan-rpc'),
-        'banyan-vip': Service(PROTOCOLS['tcp'], 573, 'banyan-vip'),
-        'barracuda-bbs': Service(PROTOCOLS['tcp'], 5120, 'barracuda-bbs'),
-        'base': Service(PROTOCOLS['tcp'], 5429, 'base'),
-        'batman': Service(PROTOCOLS['tcp'], 4305, 'batman'),
-        'bb': Service(PROTOCOLS['tcp'], 1984, 'bb'),
-        'bbars': Service(PROTOCOLS['tcp'], 3327, 'bbars'),
-        'bbn-mmc': Service(PROTOCOLS['tcp'], 1347, 'bbn-mmc'),
-        'bbn-mmx': Service(PROTOCOLS['tcp'], 1348, 'bbn-mmx'),
-        'bccp': Service(PROTOCOLS['tcp'], 4175, 'bccp'),
-        'bcinameservice': Service(PROTOCOLS['tcp'], 3415, 'bcinameservice'),
-        'bcs': Service(PROTOCOLS['tcp'], 4677, 'bcs'),
-        'bcs-broker': Service(PROTOCOLS['tcp'], 1704, 'bcs-broker'),
-        'bcs-lmserver': Service(PROTOCOLS['tcp'], 1951, 'bcs-lmserver'),
-        'bcslogc': Service(PROTOCOLS['tcp'], 13216, 'bcslogc'),
-        'bctp': Service(PROTOCOLS['tcp'], 8999, 'bctp'),
-        'bctp-server': Service(PROTOCOLS['tcp'], 10107, 'bctp-server'),
-        'bdir-priv': Service(PROTOCOLS['tcp'], 6507, 'bdir-priv'),
-        'bdir-pub': Service(PROTOCOLS['tcp'], 6508, 'bdir-pub'),
-        'bdir_priv': Service(PROTOCOLS['tcp'], 6507, 'bdir_priv'),
-        'bdir_pub': Service(PROTOCOLS['tcp'], 6508, 'bdir_pub'),
-        'bdp': Service(PROTOCOLS['tcp'], 581, 'bdp'),
-        'beacon-port': Service(PROTOCOLS['tcp'], 3124, 'beacon-port'),
-        'beacon-port-2': Service(PROTOCOLS['tcp'], 4426, 'beacon-port-2'),
-        'bears-01': Service(PROTOCOLS['tcp'], 2852, 'bears-01'),
-        'bears-02': Service(PROTOCOLS['tcp'], 3146, 'bears-02'),
-        'beeyond': Service(PROTOCOLS['tcp'], 2414, 'beeyond'),
-        'beeyond-media': Service(PROTOCOLS['tcp'], 1943, 'beeyond-media'),
-        'beorl': Service(PROTOCOLS['tcp'], 5633, 'beorl'),
-        'berknet': Service(PROTOCOLS['tcp'], 2005, 'berknet'),
-        'besapi': Service(PROTOCOLS['tcp'], 3408, 'besapi'),
-        'beserver-msg-q': Service(PROTOCOLS['tcp'], 3527, 'beserver-msg-q'),
-        'bess': Service(PROTOCOLS['tcp'], 3960, 'bess'),
-        'bex-webadmin': Service(PROTOCOLS['tcp'], 6122, 'bex-webadmin'),
-        'bex-xr': Service(PROTOCOLS['tcp'], 15660, 'bex-xr'),
-        'beyond-remote': Service(PROTOCOLS['tcp'], 5424, 'beyond-remote'),
-        'bfd-control': Service(PROTOCOLS['tcp'], 3784, 'bfd-control'),
-        'bfd-echo': Service(PROTOCOLS['tcp'], 3785, 'bfd-echo'),
-        'bfd-multi-ctl': Service(PROTOCOLS['tcp'], 4784, 'bfd-multi-ctl'),
-        'bflckmgr': Service(PROTOCOLS['tcp'], 3966, 'bflckmgr'),
-        'bftp': Service(PROTOCOLS['tcp'], 152, 'bftp'),
-        'bgmp': Service(PROTOCOLS['tcp'], 264, 'bgmp'),
-        'bgp': Service(PROTOCOLS['tcp'], 179, 'bgp'),
-        'bgs-nsi': Service(PROTOCOLS['tcp'], 482, 'bgs-nsi'),
-        'bh611': Service(PROTOCOLS['tcp'], 354, 'bh611'),
-        'bhevent': Service(PROTOCOLS['tcp'], 357, 'bhevent'),
-        'bhfhs': Service(PROTOCOLS['tcp'], 248, 'bhfhs'),
-        'bhmds': Service(PROTOCOLS['tcp'], 310, 'bhmds'),
-        'bhoedap4': Service(PROTOCOLS['tcp'], 352, 'bhoedap4'),
-        'bhoetty': Service(PROTOCOLS['tcp'], 351, 'bhoetty'),
-        'biap-mp': Service(PROTOCOLS['tcp'], 1962, 'biap-mp'),
-        'biimenu': Service(PROTOCOLS['tcp'], 18000, 'biimenu'),
-        'bilobit': Service(PROTOCOLS['tcp'], 24577, 'bilobit'),
-        'bim-pem': Service(PROTOCOLS['tcp'], 3783, 'bim-pem'),
-        'binderysupport': Service(PROTOCOLS['tcp'], 2302, 'binderysupport'),
-        'bingbang': Service(PROTOCOLS['tcp'], 29999, 'bingbang'),
-        'binkp': Service(PROTOCOLS['tcp'], 24554, 'binkp'),
-        'bintec-admin': Service(PROTOCOLS['tcp'], 2107, 'bintec-admin'),
-        'bintec-capi': Service(PROTOCOLS['tcp'], 2662, 'bintec-capi'),
-        'bintec-tapi': Service(PROTOCOLS['tcp'], 2663, 'bintec-tapi'),
-        'biolink-auth': Service(PROTOCOLS['tcp'], 3411, 'biolink-auth'),
-        'bioserver': Service(PROTOCOLS['tcp'], 6946, 'bioserver'),
-        'biotic': Service(PROTOCOLS['tcp'], 5087, 'biotic'),
-        'bip': Service(PROTOCOLS['tcp'], 4376, 'bip'),
-        'bis-sync': Service(PROTOCOLS['tcp'], 5585, 'bis-sync'),
-        'bis-web': Service(PROTOCOLS['tcp'], 5584, 'bis-web'),
-        'bitforestsrv': Service(PROTOCOLS['tcp'], 5068, 'bitforestsrv'),
-        'bitspeer': Service(PROTOCOLS['tcp'], 2178, 'bitspeer'),
-        'bl-idm': Service(PROTOCOLS['tcp'], 142, 'bl-idm'),
-        'blackboard': Service(PROTOCOLS['tcp'], 2032, 'blackboard'),
-        'blackjack': Service(PROTOCOLS['tcp'], 1025, 'blackjack'),
-        'blaze': Service(PROTOCOLS['tcp'], 1150, 'blaze'),
-        'blizwow': Service(PROTOCOLS['tcp'], 3724, 'blizwow'),
-        'blockade': Service(PROTOCOLS['tcp'], 2911, 'blockade'),
-        'blockade-bpsp': Service(PROTOCOLS['tcp'], 2574, 'blockade-bpsp'),
-        'blocks': Service(PROTOCOLS['tcp'], 10288, 'blocks'),
-        'blp1': Service(PROTOCOLS['tcp'], 8194, 'blp1'),
-        'blp2': Service(PROTOCOLS['tcp'], 8195, 'blp2'),
-        'blp3': Service(PROTOCOLS['tcp'], 8292, 'blp3'),
-        'blp4': Service(PROTOCOLS['tcp'], 8294, 'blp4'),
-        'blp5': Service(PROTOCOLS['tcp'], 48129, 'blp5'),
-        'blueberry-lm': Service(PROTOCOLS['tcp'], 1432, 'blueberry-lm'),
-        'bluectrlproxy': Service(PROTOCOLS['tcp'], 2277, 'bluectrlproxy'),
-        'bluelance': Service(PROTOCOLS['tcp'], 2877, 'bluelance'),
-        'blwnkl-port': Service(PROTOCOLS['tcp'], 2625, 'blwnkl-port'),
-        'bmap': Service(PROTOCOLS['tcp'], 3421, 'bmap'),
-        'bmc-ar': Service(PROTOCOLS['tcp'], 2494, 'bmc-ar'),
-        'bmc-ctd-ldap': Service(PROTOCOLS['tcp'], 6301, 'bmc-ctd-ldap'),
-        'bmc-data-coll': Service(PROTOCOLS['tcp'], 3695, 'bmc-data-coll'),
-        'bmc-ea': Service(PROTOCOLS['tcp'], 3683, 'bmc-ea'),
-        'bmc-gms': Service(PROTOCOLS['tcp'], 10129, 'bmc-gms'),
-        'bmc-grx': Service(PROTOCOLS['tcp'], 6300, 'bmc-grx'),
-        'bmc-jmx-port': Service(PROTOCOLS['tcp'], 3604, 'bmc-jmx-port'),
-        'bmc-messaging': Service(PROTOCOLS['tcp'], 2059, 'bmc-messaging'),
-        'bmc-net-adm': Service(PROTOCOLS['tcp'], 1769, 'bmc-net-adm'),
-        'bmc-net-svc': Service(PROTOCOLS['tcp'], 1770, 'bmc-net-svc'),
-        'bmc-onekey': Service(PROTOCOLS['tcp'], 3561, 'bmc-onekey'),
-        'bmc-patroldb': Service(PROTOCOLS['tcp'], 1313, 'bmc-patroldb'),
-        'bmc-perf-agent': Service(PROTOCOLS['tcp'], 6767, 'bmc-perf-agent'),
-        'bmc-perf-mgrd': Service(PROTOCOLS['tcp'], 6768, 'bmc-perf-mgrd'),
-        'bmc-perf-sd': Service(PROTOCOLS['tcp'], 10128, 'bmc-perf-sd'),
-        'bmc-reporting': Service(PROTOCOLS['tcp'], 4568, 'bmc-reporting'),
-        'bmc_ctd_ldap': Service(PROTOCOLS['tcp'], 6301, 'bmc_ctd_ldap'),
-        'bmc_patroldb': Service(PROTOCOLS['tcp'], 1313, 'bmc_patroldb'),
-        'bmcpatrolagent': Service(PROTOCOLS['tcp'], 3181, 'bmcpatrolagent'),
-        'bmcpatrolrnvu': Service(PROTOCOLS['tcp'], 3182, 'bmcpatrolrnvu'),
-        'bmdss': Service(PROTOCOLS['tcp'], 13823, 'bmdss'),
-        'bmpp': Service(PROTOCOLS['tcp'], 632, 'bmpp'),
-        'bnet': Service(PROTOCOLS['tcp'], 415, 'bnet'),
-        'bnetfile': Service(PROTOCOLS['tcp'], 1120, 'bnetfile'),
-        'bnetgame': Service(PROTOCOLS['tcp'], 1119, 'bnetgame'),
-        'bnt-manager': Service(PROTOCOLS['tcp'], 3344, 'bnt-manager'),
-        'board-roar': Service(PROTOCOLS['tcp'], 9700, 'board-roar'),
-        'board-voip': Service(PROTOCOLS['tcp'], 9750, 'board-voip'),
-        'boinc-client': Service(PROTOCOLS['tcp'], 1043, 'boinc-client'),
-        'boks': Service(PROTOCOLS['tcp'], 6500, 'boks'),
-        'boks-clntd': Service(PROTOCOLS['tcp'], 6503, 'boks-clntd'),
-        'boks-servc': Service(PROTOCOLS['tcp'], 6501, 'boks-servc'),
-        'boks-servm': Service(PROTOCOLS['tcp'], 6502, 'boks-servm'),
-        'boks_clntd': Service(PROTOCOLS['tcp'], 6503, 'boks_clntd'),
-        'boks_servc': Service(PROTOCOLS['tcp'], 6501, 'boks_servc'),
-        'boks_servm': Service(PROTOCOLS['tcp'], 6502, 'boks_servm'),
-        'boldsoft-lm': Service(PROTOCOLS['tcp'], 2961, 'boldsoft-lm'),
-        'bolt': Service(PROTOCOLS['tcp'], 7687, 'bolt'),
-        'bones': Service(PROTOCOLS['tcp'], 4914, 'bones'),
-        'boomerang': Service(PROTOCOLS['tcp'], 1304, 'boomerang'),
-        'boosterware': Service(PROTOCOLS['tcp'], 2913, 'boosterware'),
-        'bootpc': Service(PROTOCOLS['tcp'], 68, 'bootpc'),
-        'bootps': Service(PROTOCOLS['tcp'], 67, 'bootps'),
-        'bootserver': Service(PROTOCOLS['tcp'], 2016, 'bootserver'),
-        'borland-dsj': Service(PROTOCOLS['tcp'], 707, 'borland-dsj'),
-        'boscap': Service(PROTOCOLS['tcp'], 2990, 'boscap'),
-        'bosswave': Service(PROTOCOLS['tcp'], 28589, 'bosswave'),
-        'bounzza': Service(PROTOCOLS['tcp'], 2218, 'bounzza'),
-        'boxbackupstore': Service(PROTOCOLS['tcp'], 4186, 'boxbackupstore'),
-        'boxp': Service(PROTOCOLS['tcp'], 9380, 'boxp'),
-        'bpcd': Service(PROTOCOLS['tcp'], 13782, 'bpcd'),
-        'bpcp-poll': Service(PROTOCOLS['tcp'], 2844, 'bpcp-poll'),
-        'bpcp-trap': Service(PROTOCOLS['tcp'], 2845, 'bpcp-trap'),
-        'bpdbm': Service(PROTOCOLS['tcp'], 13721, 'bpdbm'),
-        'bpjava-msvc': Service(PROTOCOLS['tcp'], 13722, 'bpjava-msvc'),
-        'bpmd': Service(PROTOCOLS['tcp'], 3593, 'bpmd'),
-        'bprd': Service(PROTOCOLS['tcp'], 13720, 'bprd'),
-        'br-channel': Service(PROTOCOLS['tcp'], 5425, 'br-channel'),
-        'brain': Service(PROTOCOLS['tcp'], 2169, 'brain'),
-        'brcd': Service(PROTOCOLS['tcp'], 1323, 'brcd'),
-        'brcd-vr-req': Service(PROTOCOLS['tcp'], 4415, 'brcd-vr-req'),
-        'brcm-comm-port': Service(PROTOCOLS['tcp'], 3188, 'brcm-comm-port'),
-        'brdptc': Service(PROTOCOLS['tcp'], 2155, 'brdptc'),
-        'bre': Service(PROTOCOLS['tcp'], 4096, 'bre'),
-        'brf-gw': Service(PROTOCOLS['tcp'], 22951, 'brf-gw'),
-        'bridgecontrol': Service(PROTOCOLS['tcp'], 1073, 'bridgecontrol'),
-        'brlp-0': Service(PROTOCOLS['tcp'], 4101, 'brlp-0'),
-        'brlp-1': Service(PROTOCOLS['tcp'], 4102, 'brlp-1'),
-        'brlp-2': Service(PROTOCOLS['tcp'], 4103, 'brlp-2'),
-        'brlp-3': Service(PROTOCOLS['tcp'], 4104, 'brlp-3'),
-        'broker-service': Service(PROTOCOLS['tcp'], 3014, 'broker-service'),
-        'broker_service': Service(PROTOCOLS['tcp'], 3014, 'broker_service'),
-        'brp': Service(PROTOCOLS['tcp'], 3043, 'brp'),
-        'bruce': Service(PROTOCOLS['tcp'], 2619, 'bruce'),
-        'brutus': Service(PROTOCOLS['tcp'], 2003, 'brutus'),
-        'brvread': Service(PROTOCOLS['tcp'], 1054, 'brvread'),
-        'bsfserver-zn': Service(PROTOCOLS['tcp'], 5320, 'bsfserver-zn'),
-        'bsfsvr-zn-ssl': Service(PROTOCOLS['tcp'], 5321, 'bsfsvr-zn-ssl'),
-        'bspne-pcc': Service(PROTOCOLS['tcp'], 1252, 'bspne-pcc'),
-        'bsquare-voip': Service(PROTOCOLS['tcp'], 1071, 'bsquare-voip'),
-        'btpp2audctr1': Service(PROTOCOLS['tcp'], 2536, 'btpp2audctr1'),
-        'btpp2sectrans': Service(PROTOCOLS['tcp'], 2444, 'btpp2sectrans'),
-        'btprjctrl': Service(PROTOCOLS['tcp'], 2803, 'btprjctrl'),
-        'btrieve': Service(PROTOCOLS['tcp'], 3351, 'btrieve'),
-        'bts-appserver': Service(PROTOCOLS['tcp'], 1961, 'bts-appserver'),
-        'bts-x73': Service(PROTOCOLS['tcp'], 3681, 'bts-x73'),
-        'buddy-draw': Service(PROTOCOLS['tcp'], 1854, 'buddy-draw'),
-        'bues-service': Service(PROTOCOLS['tcp'], 2446, 'bues-service'),
-        'bues_service': Service(PROTOCOLS['tcp'], 2446, 'bues_service'),
-        'bullant-rap': Service(PROTOCOLS['tcp'], 2965, 'bullant-rap'),
-        'bullant-srap': Service(PROTOCOLS['tcp'], 2964, 'bullant-srap'),
-        'burp': Service(PROTOCOLS['tcp'], 4971, 'burp'),
-        'busboy': Service(PROTOCOLS['tcp'], 998, 'busboy'),
-        'business': Service(PROTOCOLS['tcp'], 3107, 'business'),
-        'busycal': Service(PROTOCOLS['tcp'], 4990, 'busycal'),
-        'bv-agent': Service(PROTOCOLS['tcp'], 3993, 'bv-agent'),
-        'bv-ds': Service(PROTOCOLS['tcp'], 3992, 'bv-ds'),
-        'bv-is': Service(PROTOCOLS['tcp'], 3990, 'bv-is'),
-        'bv-queryengine': Service(PROTOCOLS['tcp'], 3989, 'bv-queryengine'),
-        'bv-smcsrv': Service(PROTOCOLS['tcp'], 3991, 'bv-smcsrv'),
-        'bvcdaemon-port': Service(PROTOCOLS['tcp'], 3626, 'bvcdaemon-port'),
-        'bvcontrol': Service(PROTOCOLS['tcp'], 1236, 'bvcontrol'),
-        'bveapi': Service(PROTOCOLS['tcp'], 10880, 'bveapi'),
-        'bvtsonar': Service(PROTOCOLS['tcp'], 1149, 'bvtsonar'),
-        'bxp': Service(PROTOCOLS['tcp'], 4027, 'bxp'),
-        'bytex': Service(PROTOCOLS['tcp'], 1375, 'bytex'),
-        'bzflag': Service(PROTOCOLS['tcp'], 5154, 'bzflag'),
-        'bzr': Service(PROTOCOLS['tcp'], 4155, 'bzr'),
-        'c-h-it-port': Service(PROTOCOLS['tcp'], 3778, 'c-h-it-port'),
-        'c1222-acse': Service(PROTOCOLS['tcp'], 1153, 'c1222-acse'),
-        'c3': Service(PROTOCOLS['tcp'], 2472, 'c3'),
-        'ca-1': Service(PROTOCOLS['tcp'], 5064, 'ca-1'),
-        'ca-2': Service(PROTOCOLS['tcp'], 5065, 'ca-2'),
-        'ca-audit-da': Service(PROTOCOLS['tcp'], 8025, 'ca-audit-da'),
-        'ca-audit-ds': Service(PROTOCOLS['tcp'], 8026, 'ca-audit-ds'),
-        'ca-idms': Service(PROTOCOLS['tcp'], 3709, 'ca-idms'),
-        'ca-web-update': Service(PROTOCOLS['tcp'], 14414, 'ca-web-update'),
-        'caaclang2': Service(PROTOCOLS['tcp'], 5249, 'caaclang2'),
-        'caacws': Service(PROTOCOLS['tcp'], 5248, 'caacws'),
-        'cab-protocol': Service(PROTOCOLS['tcp'], 595, 'cab-protocol'),
-        'cableport-ax': Service(PROTOCOLS['tcp'], 282, 'cableport-ax'),
-        'cabsm-comm': Service(PROTOCOLS['tcp'], 7161, 'cabsm-comm'),
-        'caci-lm': Service(PROTOCOLS['tcp'], 1554, 'caci-lm'),
-        'cacsambroker': Service(PROTOCOLS['tcp'], 7163, 'cacsambroker'),
-        'cadabra-lm': Service(PROTOCOLS['tcp'], 1563, 'cadabra-lm'),
-        'cadencecontrol': Service(PROTOCOLS['tcp'], 2318, 'cadencecontrol'),
-        'cadis-1': Service(PROTOCOLS['tcp'], 1441, 'cadis-1'),
-        'cadis-2': Service(PROTOCOLS['tcp'], 1442, 'cadis-2'),
-        'cadkey-licman': Service(PROTOCOLS['tcp'], 1399, 'cadkey-licman'),
-        'cadkey-tablet': Service(PROTOCOLS['tcp'], 1400, 'cadkey-tablet'),
-        'cadlock': Service(PROTOCOLS['tcp'], 770, 'cadlock'),
-        'cadlock2': Service(PROTOCOLS['tcp'], 1000, 'cadlock2'),
-        'cadsi-lm': Service(PROTOCOLS['tcp'], 1387, 'cadsi-lm'),
-        'cadsisvr': Service(PROTOCOLS['tcp'], 16789, 'cadsisvr'),
-        'cadview-3d': Service(PROTOCOLS['tcp'], 649, 'cadview-3d'),
-        'caerpc': Service(PROTOCOLS['tcp'], 42510, 'caerpc'),
-        'caevms': Service(PROTOCOLS['tcp'], 5251, 'caevms'),
-        'caicci': Service(PROTOCOLS['tcp'], 1721, 'caicci'),
-        'caiccipc': Service(PROTOCOLS['tcp'], 1202, 'caiccipc'),
-        'caids-sensor': Service(PROTOCOLS['tcp'], 1192, 'caids-sensor'),
-        'cailic': Service(PROTOCOLS['tcp'], 216, 'cailic'),
-        'caistoragemgr': Service(PROTOCOLS['tcp'], 7162, 'caistoragemgr'),
-        'cajo-discovery': Service(PROTOCOLS['tcp'], 1198, 'cajo-discovery'),
-        'cal': Service(PROTOCOLS['tcp'], 588, 'cal'),
-        'caldsoft-backup': Service(PROTOCOLS['tcp'], 22537, 'caldsoft-backup'),
-        'call-logging': Service(PROTOCOLS['tcp'], 2552, 'call-logging'),
-        'call-sig-trans': Service(PROTOCOLS['tcp'], 2517, 'call-sig-trans'),
-        'caller9': Service(PROTOCOLS['tcp'], 2906, 'caller9'),
-        'calltrax': Service(PROTOCOLS['tcp'], 3675, 'calltrax'),
-        'callwaveiam': Service(PROTOCOLS['tcp'], 9283, 'callwaveiam'),
-        'camac': Service(PROTOCOLS['tcp'], 3545, 'camac'),
-        'cambertx-lm': Service(PROTOCOLS['tcp'], 1734, 'cambertx-lm'),
-        'camp': Service(PROTOCOLS['tcp'], 4450, 'camp'),
-        'can-dch': Service(PROTOCOLS['tcp'], 1919, 'can-dch'),
-        'can-ferret': Service(PROTOCOLS['tcp'], 1920, 'can-ferret'),
-        'can-ferret-ssl': Service(PROTOCOLS['tcp'], 3661, 'can-ferret-ssl'),
-        'can-nds': Service(PROTOCOLS['tcp'], 1918, 'can-nds'),
-        'can-nds-ssl': Service(PROTOCOLS['tcp'], 3660, 'can-nds-ssl'),
-        'canditv': Service(PROTOCOLS['tcp'], 24676, 'canditv'),
-        'candp': Service(PROTOCOLS['tcp'], 42508, 'candp'),
-        'candrp': Service(PROTOCOLS['tcp'], 42509, 'candrp'),
-        'canex-watch': Service(PROTOCOLS['tcp'], 3583, 'canex-watch'),
-        'canit-store': Service(PROTOCOLS['tcp'], 6568, 'canit-store'),
-        'canit_store': Service(PROTOCOLS['tcp'], 6568, 'canit_store'),
-        'canocentral0': Service(PROTOCOLS['tcp'], 1871, 'canocentral0'),
-        'canocentral1': Service(PROTOCOLS['tcp'], 1872, 'canocentral1'),
-        'canon-bjnp1': Service(PROTOCOLS['tcp'], 8611, 'canon-bjnp1'),
-        'canon-bjnp2': Service(PROTOCOLS['tcp'], 8612, 'canon-bjnp2'),
-        'canon-bjnp3': Service(PROTOCOLS['tcp'], 8613, 'canon-bjnp3'),
-        'canon-bjnp4': Service(PROTOCOLS['tcp'], 8614, 'canon-bjnp4'),
-        'canon-capt': Service(PROTOCOLS['tcp'], 3756, 'canon-capt'),
-        'canon-mfnp': Service(PROTOCOLS['tcp'], 8610, 'canon-mfnp'),
-        'canto-roboflow': Service(PROTOCOLS['tcp'], 8998, 'canto-roboflow'),
-        'cap': Service(PROTOCOLS['tcp'], 1026, 'cap'),
-        'capfast-lmd': Service(PROTOCOLS['tcp'], 1756, 'capfast-lmd'),
-        'capioverlan': Service(PROTOCOLS['tcp'], 1147, 'capioverlan'),
-        'capmux': Service(PROTOCOLS['tcp'], 4728, 'capmux'),
-        'caps-lm': Service(PROTOCOLS['tcp'], 3290, 'caps-lm'),
-        'cardax': Service(PROTOCOLS['tcp'], 1072, 'cardax'),
-        'cardbox': Service(PROTOCOLS['tcp'], 3105, 'cardbox'),
-        'cardbox-http': Service(PROTOCOLS['tcp'], 3106, 'cardbox-http'),
-        'cardifftec-back': Service(PROTOCOLS['tcp'], 4573, 'cardifftec-back'),
-        'cardweb-io': Service(PROTOCOLS['tcp'], 9060, 'cardweb-io'),
-        'carrius-rshell': Service(PROTOCOLS['tcp'], 1197, 'carrius-rshell'),
-        'cart-o-rama': Service(PROTOCOLS['tcp'], 3292, 'cart-o-rama'),
-        'cartographerxmp': Service(PROTOCOLS['tcp'], 5270, 'cartographerxmp'),
-        'cas': Service(PROTOCOLS['tcp'], 2418, 'cas'),
-        'cas-mapi': Service(PROTOCOLS['tcp'], 3682, 'cas-mapi'),
-        'casanswmgmt': Service(PROTOCOLS['tcp'], 3669, 'casanswmgmt'),
-        'casp': Service(PROTOCOLS['tcp'], 1130, 'casp'),
-        'caspssl': Service(PROTOCOLS['tcp'], 1131, 'caspssl'),
-        'casrmagent': Service(PROTOCOLS['tcp'], 7167, 'casrmagent'),
-        'castorproxy': Service(PROTOCOLS['tcp'], 3450, 'castorproxy'),
-        'catalyst': Service(PROTOCOLS['tcp'], 2836, 'catalyst'),
-        'catchpole': Service(PROTOCOLS['tcp'], 1185, 'catchpole'),
-        'caupc-remote': Service(PROTOCOLS['tcp'], 2122, 'caupc-remote'),
-        'cautcpd': Service(PROTOCOLS['tcp'], 3061, 'cautcpd'),
-        'cawas': Service(PROTOCOLS['tcp'], 12168, 'cawas'),
-        'cba8': Service(PROTOCOLS['tcp'], 9593, 'cba8'),
-        'cbos-ip-port': Service(PROTOCOLS['tcp'], 3750, 'cbos-ip-port'),
-        'cbp': Service(PROTOCOLS['tcp'], 4419, 'cbp'),
-        'cbserver': Service(PROTOCOLS['tcp'], 3388, 'cbserver'),
-        'cbt': Service(PROTOCOLS['tcp'], 7777, 'cbt'),
-        'cbus': Service(PROTOCOLS['tcp'], 5550, 'cbus'),
-        'cc-tracking': Service(PROTOCOLS['tcp'], 4870, 'cc-tracking'),
-        'ccag-pib': Service(PROTOCOLS['tcp'], 7169, 'ccag-pib'),
-        'ccm-port': Service(PROTOCOLS['tcp'], 3575, 'ccm-port'),
-        'ccmad': Service(PROTOCOLS['tcp'], 3114, 'ccmad'),
-        'ccmail': Service(PROTOCOLS['tcp'], 3264, 'ccmail'),
-        'ccmcomm': Service(PROTOCOLS['tcp'], 3505, 'ccmcomm'),
-        'ccmrmi': Service(PROTOCOLS['tcp'], 3154, 'ccmrmi'),
-        'ccnx': Service(PROTOCOLS['tcp'], 9695, 'ccnx'),
-        'ccowcmr': Service(PROTOCOLS['tcp'], 2116, 'ccowcmr'),
-        'ccp': Service(PROTOCOLS['tcp'], 3947, 'ccp'),
-        'ccs-software': Service(PROTOCOLS['tcp'], 2734, 'ccs-software'),
-        'ccss-qmm': Service(PROTOCOLS['tcp'], 4969, 'ccss-qmm'),
-        'ccss-qsm': Service(PROTOCOLS['tcp'], 4970, 'ccss-qsm'),
-        'cctv-port': Service(PROTOCOLS['tcp'], 3559, 'cctv-port'),
-        'ccu-comm-1': Service(PROTOCOLS['tcp'], 4053, 'ccu-comm-1'),
-        'ccu-comm-2': Service(PROTOCOLS['tcp'], 4054, 'ccu-comm-2'),
-        'ccu-comm-3': Service(PROTOCOLS['tcp'], 4055, 'ccu-comm-3'),
-        'cd3o-protocol': Service(PROTOCOLS['tcp'], 3616, 'cd3o-protocol'),
-        'cdbroker': Service(PROTOCOLS['tcp'], 3376, 'cdbroker'),
-        'cdc': Service(PROTOCOLS['tcp'], 223, 'cdc'),
-        'cddbp': Service(PROTOCOLS['tcp'], 888, 'cddbp'),
-        'cddbp-alt': Service(PROTOCOLS['tcp'], 8880, 'cddbp-alt'),
-        'cdfunc': Service(PROTOCOLS['tcp'], 2045, 'cdfunc'),
-        'cdid': Service(PROTOCOLS['tcp'], 3315, 'cdid'),
-        'cdl-server': Service(PROTOCOLS['tcp'], 3056, 'cdl-server'),
-        'cdn': Service(PROTOCOLS['tcp'], 2412, 'cdn'),
-        'cds': Service(PROTOCOLS['tcp'], 4115, 'cds'),
-        'cecsvc': Service(PROTOCOLS['tcp'], 2571, 'cecsvc'),
-        'cedros-fds': Service(PROTOCOLS['tcp'], 4140, 'cedros-fds'),
-        'cedros_fds': Service(PROTOCOLS['tcp'], 4140, 'cedros_fds'),
-        'celatalk': Service(PROTOCOLS['tcp'], 3485, 'celatalk'),
-        'centerline': Service(PROTOCOLS['tcp'], 3987, 'centerline'),
-        'centra': Service(PROTOCOLS['tcp'], 1709, 'centra'),
-        'ceph': Service(PROTOCOLS['tcp'], 3300, 'ceph'),
-        'cequint-cityid': Service(PROTOCOLS['tcp'], 4074, 'cequint-cityid'),
-        'cera-bcm': Service(PROTOCOLS['tcp'], 1794, 'cera-bcm'),
-        'cernsysmgmtagt': Service(PROTOCOLS['tcp'], 3830, 'cernsysmgmtagt'),
-        'cert-initiator': Service(PROTOCOLS['tcp'], 1639, 'cert-initiator'),
-        'cert-responder': Service(PROTOCOLS['tcp'], 1640, 'cert-responder'),
-        'cesdcdman': Service(PROTOCOLS['tcp'], 2921, 'cesdcdman'),
-        'cesdcdtrn': Service(PROTOCOLS['tcp'], 2922, 'cesdcdtrn'),
-        'cesdinv': Service(PROTOCOLS['tcp'], 2856, 'cesdinv'),
-        'cfdptkt': Service(PROTOCOLS['tcp'], 120, 'cfdptkt'),
-        'cfengine': Service(PROTOCOLS['tcp'], 5308, 'cfengine'),
-        'cfs': Service(PROTOCOLS['tcp'], 7546, 'cfs'),
-        'cft-0': Service(PROTOCOLS['tcp'], 1761, 'cft-0'),
-        'cft-1': Service(PROTOCOLS['tcp'], 1762, 'cft-1'),
-        'cft-2': Service(PROTOCOLS['tcp'], 1763, 'cft-2'),
-        'cft-3': Service(PROTOCOLS['tcp'], 1764, 'cft-3'),
-        'cft-4': Service(PROTOCOLS['tcp'], 1765, 'cft-4'),
-        'cft-5': Service(PROTOCOLS['tcp'], 1766, 'cft-5'),
-        'cft-6': Service(PROTOCOLS['tcp'], 1767, 'cft-6'),
-        'cft-7': Service(PROTOCOLS['tcp'], 1768, 'cft-7'),
-        'cfw': Service(PROTOCOLS['tcp'], 7563, 'cfw'),
-        'cgi-starapi': Service(PROTOCOLS['tcp'], 3893, 'cgi-starapi'),
-        'cgms': Service(PROTOCOLS['tcp'], 3003, 'cgms'),
-        'cgn-config': Service(PROTOCOLS['tcp'], 2183, 'cgn-config'),
-        'cgn-stat': Service(PROTOCOLS['tcp'], 2182, 'cgn-stat'),
-        'chargen': Service(PROTOCOLS['tcp'], 19, 'chargen'),
-        'charsetmgr': Service(PROTOCOLS['tcp'], 3903, 'charsetmgr'),
-        'checkoutdb': Service(PROTOCOLS['tcp'], 5505, 'checkoutdb'),
-        'checkpoint-rtm': Service(PROTOCOLS['tcp'], 18241, 'checkpoint-rtm'),
-        'checksum': Service(PROTOCOLS['tcp'], 1386, 'checksum'),
-        'chevinservices': Service(PROTOCOLS['tcp'], 3349, 'chevinservices'),
-        'childkey-ctrl': Service(PROTOCOLS['tcp'], 1892, 'childkey-ctrl'),
-        'childkey-notif': Service(PROTOCOLS['tcp'], 1891, 'childkey-notif'),
-        'chimera-hwm': Service(PROTOCOLS['tcp'], 4009, 'chimera-hwm'),
-        'chip-lm': Service(PROTOCOLS['tcp'], 1572, 'chip-lm'),
-        'chipper': Service(PROTOCOLS['tcp'], 17219, 'chipper'),
-        'chmd': Service(PROTOCOLS['tcp'], 3099, 'chmd'),
-        'choiceview-agt': Service(PROTOCOLS['tcp'], 4314, 'choiceview-agt'),
-        'choiceview-clt': Service(PROTOCOLS['tcp'], 4316, 'choiceview-clt'),
-        'chromagrafx': Service(PROTOCOLS['tcp'], 1373, 'chromagrafx'),
-        'chshell': Service(PROTOCOLS['tcp'], 562, 'chshell'),
-        'ci3-software-1': Service(PROTOCOLS['tcp'], 1301, 'ci3-software-1'),
-        'ci3-software-2': Service(PROTOCOLS['tcp'], 1302, 'ci3-software-2'),
-        'cichild-lm': Service(PROTOCOLS['tcp'], 1523, 'cichild-lm'),
-        'cichlid': Service(PROTOCOLS['tcp'], 1377, 'cichlid'),
-        'cifs': Service(PROTOCOLS['tcp'], 3020, 'cifs'),
-        'cim-rs': Service(PROTOCOLS['tcp'], 5993, 'cim-rs'),
-        'cimple': Service(PROTOCOLS['tcp'], 10125, 'cimple'),
-        'cimplex': Service(PROTOCOLS['tcp'], 673, 'cimplex'),
-        'cimtrak': Service(PROTOCOLS['tcp'], 3749, 'cimtrak'),
-        'cindycollab': Service(PROTOCOLS['tcp'], 3770, 'cindycollab'),
-        'cinegrfx-elmd': Service(PROTOCOLS['tcp'], 2891, 'cinegrfx-elmd'),
-        'cinegrfx-lm': Service(PROTOCOLS['tcp'], 1743, 'cinegrfx-lm'),
-        'ciphire-data': Service(PROTOCOLS['tcp'], 3887, 'ciphire-data'),
-        'ciphire-serv': Service(PROTOCOLS['tcp'], 3888, 'ciphire-serv'),
-        'circle-x': Service(PROTOCOLS['tcp'], 2931, 'circle-x'),
-        'cis': Service(PROTOCOLS['tcp'], 22305, 'cis'),
-        'cis-secure': Service(PROTOCOLS['tcp'], 22343, 'cis-secure'),
-        'cisco-avp': Service(PROTOCOLS['tcp'], 8470, 'cisco-avp'),
-        'cisco-fna': Service(PROTOCOLS['tcp'], 130, 'cisco-fna'),
-        'cisco-ipsla': Service(PROTOCOLS['tcp'], 1167, 'cisco-ipsla'),
-        'cisco-net-mgmt': Service(PROTOCOLS['tcp'], 1741, 'cisco-net-mgmt'),
-        'cisco-sccp': Service(PROTOCOLS['tcp'], 2000, 'cisco-sccp'),
-        'cisco-snat': Service(PROTOCOLS['tcp'], 15555, 'cisco-snat'),
-        'cisco-sys': Service(PROTOCOLS['tcp'], 132, 'cisco-sys'),
-        'cisco-tdp': Service(PROTOCOLS['tcp'], 711, 'cisco-tdp'),
-        'cisco-tna': Service(PROTOCOLS['tcp'], 131, 'cisco-tna'),
-        'cisco-wafs': Service(PROTOCOLS['tcp'], 4050, 'cisco-wafs'),
-        'ciscocsdb': Service(PROTOCOLS['tcp'], 43441, 'ciscocsdb'),
-        'citadel': Service(PROTOCOLS['tcp'], 504, 'citadel'),
-        'citrix-rtmp': Service(PROTOCOLS['tcp'], 2897, 'citrix-rtmp'),
-        'citrixadmin': Service(PROTOCOLS['tcp'], 2513, 'citrixadmin'),
-        'citrixima': Service(PROTOCOLS['tcp'], 2512, 'citrixima'),
-        'citriximaclient': Service(PROTOCOLS['tcp'], 2598, 'citriximaclient'),
-        'citrixupp': Service(PROTOCOLS['tcp'], 7228, 'citrixupp'),
-        'citrixuppg': Service(PROTOCOLS['tcp'], 7229, 'citrixuppg'),
-        'citynl': Service(PROTOCOLS['tcp'], 1729, 'citynl'),
-        'citysearch': Service(PROTOCOLS['tcp'], 3974, 'citysearch'),
-        'cl-1': Service(PROTOCOLS['tcp'], 172, 'cl-1'),
-        'cl-db-attach': Service(PROTOCOLS['tcp'], 4135, 'cl-db-attach'),
-        'cl-db-remote': Service(PROTOCOLS['tcp'], 4137, 'cl-db-remote'),
-        'cl-db-request': Service(PROTOCOLS['tcp'], 4136, 'cl-db-request'),
-        'cl/1': Service(PROTOCOLS['tcp'], 172, 'cl/1'),
-        'clariion-evr01': Service(PROTOCOLS['tcp'], 6389, 'clariion-evr01'),
-        'classic': Service(PROTOCOLS['tcp'], 9087, 'classic'),
-        'cleanerliverc': Service(PROTOCOLS['tcp'], 3481, 'cleanerliverc'),
-        'clearcase': Service(PROTOCOLS['tcp'], 371, 'clearcase'),
-        'clearvisn': Service(PROTOCOLS['tcp'], 2052, 'clearvisn'),
-        'clever-ctrace': Service(PROTOCOLS['tcp'], 6687, 'clever-ctrace'),
-        'clever-tcpip': Service(PROTOCOLS['tcp'], 6688, 'clever-tcpip'),
-        'cleverdetect': Service(PROTOCOLS['tcp'], 6690, 'cleverdetect'),
-        'client-ctrl': Service(PROTOCOLS['tcp'], 3730, 'client-ctrl'),
-        'client-wakeup': Service(PROTOCOLS['tcp'], 9694, 'client-wakeup'),
-        'cloanto-lm': Service(PROTOCOLS['tcp'], 3397, 'cloanto-lm'),
-        'cloanto-net-1': Service(PROTOCOLS['tcp'], 356, 'cloanto-net-1'),
-        'close-combat': Service(PROTOCOLS['tcp'], 1944, 'close-combat'),
-        'cloudcheck': Service(PROTOCOLS['tcp'], 45514, 'cloudcheck'),
-        'clp': Service(PROTOCOLS['tcp'], 2567, 'clp'),
-        'cluster-disc': Service(PROTOCOLS['tcp'], 3374, 'cluster-disc'),
-        'clusterxl': Service(PROTOCOLS['tcp'], 18243, 'clusterxl'),
-        'clutild': Service(PROTOCOLS['tcp'], 7174, 'clutild'),
-        'clvm-cfg': Service(PROTOCOLS['tcp'], 1476, 'clvm-cfg'),
-        'cm': Service(PROTOCOLS['tcp'], 5910, 'cm'),
-        'cma': Service(PROTOCOLS['tcp'], 1050, 'cma'),
-        'cmadmin': Service(PROTOCOLS['tcp'], 2617, 'cmadmin'),
-        'cmc-port': Service(PROTOCOLS['tcp'], 3576, 'cmc-port'),
-        'cmip-agent': Service(PROTOCOLS['tcp'], 164, 'cmip-agent'),
-        'cmip-man': Service(PROTOCOLS['tcp'], 163, 'cmip-man'),
-        'cmmdriver': Service(PROTOCOLS['tcp'], 1294, 'cmmdriver'),
-        'cmtp-mgt': Service(PROTOCOLS['tcp'], 8501, 'cmtp-mgt'),
-        'cnap': Service(PROTOCOLS['tcp'], 7262, 'cnap'),
-        'cnckadserver': Service(PROTOCOLS['tcp'], 7168, 'cnckadserver'),
-        'cnhrp': Service(PROTOCOLS['tcp'], 1757, 'cnhrp'),
-        'cnrp': Service(PROTOCOLS['tcp'], 2757, 'cnrp'),
-        'cnrprotocol': Service(PROTOCOLS['tcp'], 1096, 'cnrprotocol'),
-        'cns-srv-port': Service(PROTOCOLS['tcp'], 2976, 'cns-srv-port'),
-        'coap': Service(PROTOCOLS['tcp'], 5683, 'coap'),
-        'coaps': Service(PROTOCOLS['tcp'], 5684, 'coaps'),
-        'coauthor': Service(PROTOCOLS['tcp'], 1529, 'coauthor'),
-        'cockroach': Service(PROTOCOLS['tcp'], 26257, 'cockroach'),
-        'codaauth2': Service(PROTOCOLS['tcp'], 370, 'codaauth2'),
-        'codasrv': Service(PROTOCOLS['tcp'], 2432, 'codasrv'),
-        'codasrv-se': Service(PROTOCOLS['tcp'], 2433, 'codasrv-se'),
-        'codemeter': Service(PROTOCOLS['tcp'], 22350, 'codemeter'),
-        'codemeter-cmwan': Service(PROTOCOLS['tcp'], 22351, 'codemeter-cmwan'),
-        'codima-rtp': Service(PROTOCOLS['tcp'], 2415, 'codima-rtp'),
-        'cogitate': Service(PROTOCOLS['tcp'], 3039, 'cogitate'),
-        'cognex-dataman': Service(PROTOCOLS['tcp'], 44444, 'cognex-dataman'),
-        'cognex-insight': Service(PROTOCOLS['tcp'], 1069, 'cognex-insight'),
-        'cognima': Service(PROTOCOLS['tcp'], 3779, 'cognima'),
-        'cogsys-lm': Service(PROTOCOLS['tcp'], 3377, 'cogsys-lm'),
-        'coherence': Service(PROTOCOLS['tcp'], 7574, 'coherence'),
-        'collaber': Service(PROTOCOLS['tcp'], 7689, 'collaber'),
-        'collaborator': Service(PROTOCOLS['tcp'], 622, 'collaborator'),
-        'colubris': Service(PROTOCOLS['tcp'], 3490, 'colubris'),
-        'com-bardac-dw': Service(PROTOCOLS['tcp'], 48556, 'com-bardac-dw'),
-        'combox-web-acc': Service(PROTOCOLS['tcp'], 2534, 'combox-web-acc'),
-        'comcam': Service(PROTOCOLS['tcp'], 2108, 'comcam'),
-        'comcam-io': Service(PROTOCOLS['tcp'], 3605, 'comcam-io'),
-        'commandport': Service(PROTOCOLS['tcp'], 3416, 'commandport'),
-        'commerce': Service(PROTOCOLS['tcp'], 542, 'commerce'),
-        'commlinx-avl': Service(PROTOCOLS['tcp'], 1190, 'commlinx-avl'),
-        'commonspace': Service(PROTOCOLS['tcp'], 1592, 'commonspace'),
-        'commplex-link': Service(PROTOCOLS['tcp'], 5001, 'commplex-link'),
-        'commplex-main': Service(PROTOCOLS['tcp'], 5000, 'commplex-main'),
-        'commtact-http': Service(PROTOCOLS['tcp'], 20002, 'commtact-http'),
-        'commtact-https': Service(PROTOCOLS['tcp'], 20003, 'commtact-https'),
-        'community': Service(PROTOCOLS['tcp'], 2459, 'community'),
-        'comotionback': Service(PROTOCOLS['tcp'], 2262, 'comotionback'),
-        'comotionmaster': Service(PROTOCOLS['tcp'], 2261, 'comotionmaster'),
-        'compaq-evm': Service(PROTOCOLS['tcp'], 619, 'compaq-evm'),
-        'compaq-https': Service(PROTOCOLS['tcp'], 2381, 'compaq-https'),
-        'compaq-scp': Service(PROTOCOLS['tcp'], 2766, 'compaq-scp'),
-        'compaq-wcp': Service(PROTOCOLS['tcp'], 2555, 'compaq-wcp'),
-        'composit-server': Service(PROTOCOLS['tcp'], 2417, 'composit-server'),
-        'compressnet': Service(PROTOCOLS['tcp'], 3, 'compressnet'),
-        'compx-lockview': Service(PROTOCOLS['tcp'], 4308, 'compx-lockview'),
-        'comscm': Service(PROTOCOLS['tcp'], 437, 'comscm'),
-        'con': Service(PROTOCOLS['tcp'], 759, 'con'),
-        'conclave-cpp': Service(PROTOCOLS['tcp'], 2491, 'conclave-cpp'),
-        'concomp1': Service(PROTOCOLS['tcp'], 1802, 'concomp1'),
-        'concurrent-lm': Service(PROTOCOLS['tcp'], 1648, 'concurrent-lm'),
-        'condor': Service(PROTOCOLS['tcp'], 9618, 'condor'),
-        'conductor': Service(PROTOCOLS['tcp'], 6970, 'conductor'),
-        'conf': Service(PROTOCOLS['tcp'], 2008, 'conf'),
-        'conference': Service(PROTOCOLS['tcp'], 531, 'conference'),
-        'conferencetalk': Service(PROTOCOLS['tcp'], 1713, 'conferencetalk'),
-        'config-port': Service(PROTOCOLS['tcp'], 3577, 'config-port'),
-        'confluent': Service(PROTOCOLS['tcp'], 1484, 'confluent'),
-        'connect': Service(PROTOCOLS['tcp'], 2137, 'connect'),
-        'connect-client': Service(PROTOCOLS['tcp'], 3441, 'connect-client'),
-        'connect-server': Service(PROTOCOLS['tcp'], 3442, 'connect-server'),
-        'connected': Service(PROTOCOLS['tcp'], 16384, 'connected'),
-        'connection': Service(PROTOCOLS['tcp'], 2607, 'connection'),
-        'connendp': Service(PROTOCOLS['tcp'], 693, 'connendp'),
-        'connlcli': Service(PROTOCOLS['tcp'], 1358, 'connlcli'),
-        'conspiracy': Service(PROTOCOLS['tcp'], 4692, 'conspiracy'),
-        'consul-insight': Service(PROTOCOLS['tcp'], 5992, 'consul-insight'),
-        'contamac-icm': Service(PROTOCOLS['tcp'], 4846, 'contamac-icm'),
-        'contamac_icm': Service(PROTOCOLS['tcp'], 4846, 'contamac_icm'),
-        'contclientms': Service(PROTOCOLS['tcp'], 4665, 'contclientms'),
-        'contentserver': Service(PROTOCOLS['tcp'], 3365, 'contentserver'),
-        'continuus': Service(PROTOCOLS['tcp'], 5412, 'continuus'),
-        'controlone-con': Service(PROTOCOLS['tcp'], 7551, 'controlone-con'),
-        'converge': Service(PROTOCOLS['tcp'], 4774, 'converge'),
-        'coord-svr': Service(PROTOCOLS['tcp'], 2565, 'coord-svr'),
-        'cops': Service(PROTOCOLS['tcp'], 3288, 'cops'),
-        'cops-tls': Service(PROTOCOLS['tcp'], 3183, 'cops-tls'),
-        'copy': Service(PROTOCOLS['tcp'], 8445, 'copy'),
-        'copycat': Service(PROTOCOLS['tcp'], 9093, 'copycat'),
-        'cora': Service(PROTOCOLS['tcp'], 19220, 'cora'),
-        'corba-iiop': Service(PROTOCOLS['tcp'], 683, 'corba-iiop'),
-        'corba-iiop-ssl': Service(PROTOCOLS['tcp'], 684, 'corba-iiop-ssl'),
-        'corbaloc': Service(PROTOCOLS['tcp'], 2809, 'corbaloc'),
-        'corel-vncadmin': Service(PROTOCOLS['tcp'], 2654, 'corel-vncadmin'),
-        'corel_vncadmin': Service(PROTOCOLS['tcp'], 2654, 'corel_vncadmin'),
-        'corelccam': Service(PROTOCOLS['tcp'], 4300, 'corelccam'),
-        'corelvideo': Service(PROTOCOLS['tcp'], 1566, 'corelvideo'),
-        'corerjd': Service(PROTOCOLS['tcp'], 284, 'corerjd'),
-        'cosir': Service(PROTOCOLS['tcp'], 10321, 'cosir'),
-        'cosmocall': Service(PROTOCOLS['tcp'], 2324, 'cosmocall'),
-        'couchdb': Service(PROTOCOLS['tcp'], 5984, 'couchdb'),
-        'courier': Service(PROTOCOLS['tcp'], 530, 'courier'),
-        'covia': Service(PROTOCOLS['tcp'], 64, 'covia'),
-        'cp-cluster': Service(PROTOCOLS['tcp'], 8116, 'cp-cluster'),
-        'cp-spxdpy': Service(PROTOCOLS['tcp'], 4378, 'cp-spxdpy'),
-        'cp-spxsvr': Service(PROTOCOLS['tcp'], 4377, 'cp-spxsvr'),
-        'cpdi-pidas-cm': Service(PROTOCOLS['tcp'], 3609, 'cpdi-pidas-cm'),
-        'cpdlc': Service(PROTOCOLS['tcp'], 5911, 'cpdlc'),
-        'cplscrambler-al': Service(PROTOCOLS['tcp'], 1088, 'cplscrambler-al'),
-        'cplscrambler-in': Service(PROTOCOLS['tcp'], 1087, 'cplscrambler-in'),
-        'cplscrambler-lg': Service(PROTOCOLS['tcp'], 1086, 'cplscrambler-lg'),
-        'cppdp': Service(PROTOCOLS['tcp'], 4051, 'cppdp'),
-        'cpq-tasksmart': Service(PROTOCOLS['tcp'], 3201, 'cpq-tasksmart'),
-        'cpq-wbem': Service(PROTOCOLS['tcp'], 2301, 'cpq-wbem'),
-        'cpqrpm-agent': Service(PROTOCOLS['tcp'], 3256, 'cpqrpm-agent'),
-        'cpqrpm-server': Service(PROTOCOLS['tcp'], 3257, 'cpqrpm-server'),
-        'cps': Service(PROTOCOLS['tcp'], 14250, 'cps'),
-        'cpscomm': Service(PROTOCOLS['tcp'], 5194, 'cpscomm'),
-        'cpudpencap': Service(PROTOCOLS['tcp'], 2746, 'cpudpencap'),
-        'cqg-netlan': Service(PROTOCOLS['tcp'], 2823, 'cqg-netlan'),
-        'cqg-netlan-1': Service(PROTOCOLS['tcp'], 2824, 'cqg-netlan-1'),
-        'cr-websystems': Service(PROTOCOLS['tcp'], 2314, 'cr-websystems'),
-        'creativepartnr': Service(PROTOCOLS['tcp'], 3366, 'creativepartnr'),
-        'creativeserver': Service(PROTOCOLS['tcp'], 3364, 'creativeserver'),
-        'cresco-control': Service(PROTOCOLS['tcp'], 38002, 'cresco-control'),
-        'crestron-cip': Service(PROTOCOLS['tcp'], 41794, 'crestron-cip'),
-        'crestron-cips': Service(PROTOCOLS['tcp'], 41796, 'crestron-cips'),
-        'crestron-ctp': Service(PROTOCOLS['tcp'], 41795, 'crestron-ctp'),
-        'crestron-ctps': Service(PROTOCOLS['tcp'], 41797, 'crestron-ctps'),
-        'crinis-hb': Service(PROTOCOLS['tcp'], 3818, 'crinis-hb'),
-        'crip': Service(PROTOCOLS['tcp'], 6253, 'crip'),
-        'crmsbits': Service(PROTOCOLS['tcp'], 2422, 'crmsbits'),
-        'crs': Service(PROTOCOLS['tcp'], 507, 'crs'),
-        'cruise-config': Service(PROTOCOLS['tcp'], 8378, 'cruise-config'),
-        'cruise-diags': Service(PROTOCOLS['tcp'], 8379, 'cruise-diags'),
-        'cruise-enum': Service(PROTOCOLS['tcp'], 8376, 'cruise-enum'),
-        'cruise-swroute': Service(PROTOCOLS['tcp'], 8377, 'cruise-swroute'),
-        'cruise-update': Service(PROTOCOLS['tcp'], 8380, 'cruise-update'),
-        'crusecontrol': Service(PROTOCOLS['tcp'], 5231, 'crusecontrol'),
-        'cryptoadmin': Service(PROTOCOLS['tcp'], 624, 'cryptoadmin'),
-        'cs-auth-svr': Service(PROTOCOLS['tcp'], 3113, 'cs-auth-svr'),
-        'cs-live': Service(PROTOCOLS['tcp'], 2129, 'cs-live'),
-        'cs-remote-db': Service(PROTOCOLS['tcp'], 3630, 'cs-remote-db'),
-        'cs-services': Service(PROTOCOLS['tcp'], 3631, 'cs-services'),
-        'csbphonemaster': Service(PROTOCOLS['tcp'], 1724, 'csbphonemaster'),
-        'csc-proxy': Service(PROTOCOLS['tcp'], 4187, 'csc-proxy'),
-        'csc_proxy': Service(PROTOCOLS['tcp'], 4187, 'csc_proxy'),
-        'csccfirewall': Service(PROTOCOLS['tcp'], 40843, 'csccfirewall'),
-        'csccredir': Service(PROTOCOLS['tcp'], 40842, 'csccredir'),
-        'cscp': Service(PROTOCOLS['tcp'], 40841, 'cscp'),
-        'csd-monitor': Service(PROTOCOLS['tcp'], 3072, 'csd-monitor'),
-        'csdm': Service(PROTOCOLS['tcp'], 1472, 'csdm'),
-        'csdmbase': Service(PROTOCOLS['tcp'], 1471, 'csdmbase'),
-        'csedaemon': Service(PROTOCOLS['tcp'], 5232, 'csedaemon'),
-        'csi-lfap': Service(PROTOCOLS['tcp'], 3145, 'csi-lfap'),
-        'csi-sgwp': Service(PROTOCOLS['tcp'], 348, 'csi-sgwp'),
-        'cslg': Service(PROTOCOLS['tcp'], 24754, 'cslg'),
-        'cslistener': Service(PROTOCOLS['tcp'], 9000, 'cslistener'),
-        'csms': Service(PROTOCOLS['tcp'], 3399, 'csms'),
-        'csms2': Service(PROTOCOLS['tcp'], 3400, 'csms2'),
-        'csnet-ns': Service(PROTOCOLS['tcp'], 105, 'csnet-ns'),
-        'csnotify': Service(PROTOCOLS['tcp'], 2955, 'csnotify'),
-        'cso': Service(PROTOCOLS['tcp'], 105, 'cso'),
-        'csoauth': Service(PROTOCOLS['tcp'], 7847, 'csoauth'),
-        'csoft-plusclnt': Service(PROTOCOLS['tcp'], 2699, 'csoft-plusclnt'),
-        'csoft-prev': Service(PROTOCOLS['tcp'], 3271, 'csoft-prev'),
-        'csoft1': Service(PROTOCOLS['tcp'], 1837, 'csoft1'),
-        'csoftragent': Service(PROTOCOLS['tcp'], 3004, 'csoftragent'),
-        'cspclmulti': Service(PROTOCOLS['tcp'], 2890, 'cspclmulti'),
-        'cspmlockmgr': Service(PROTOCOLS['tcp'], 1272, 'cspmlockmgr'),
-        'cspmulti': Service(PROTOCOLS['tcp'], 2807, 'cspmulti'),
-        'cspuni': Service(PROTOCOLS['tcp'], 2806, 'cspuni'),
-        'csregagent': Service(PROTOCOLS['tcp'], 3022, 'csregagent'),
-        'csrpc': Service(PROTOCOLS['tcp'], 5063, 'csrpc'),
-        'cssc': Service(PROTOCOLS['tcp'], 5637, 'cssc'),
-        'cssp': Service(PROTOCOLS['tcp'], 4078, 'cssp'),
-        'cst-port': Service(PROTOCOLS['tcp'], 3742, 'cst-port'),
-        'csvr': Service(PROTOCOLS['tcp'], 3417, 'csvr'),
-        'csvr-proxy': Service(PROTOCOLS['tcp'], 3190, 'csvr-proxy'),
-        'csvr-sslproxy': Service(PROTOCOLS['tcp'], 3191, 'csvr-sslproxy'),
-        'ct2nmcs': Service(PROTOCOLS['tcp'], 7023, 'ct2nmcs'),
-        'ctcd': Service(PROTOCOLS['tcp'], 1851, 'ctcd'),
-        'ctdb': Service(PROTOCOLS['tcp'], 4379, 'ctdb'),
-        'ctdhercules': Service(PROTOCOLS['tcp'], 3773, 'ctdhercules'),
-        'ctdp': Service(PROTOCOLS['tcp'], 7022, 'ctdp'),
-        'ctechlicensing': Service(PROTOCOLS['tcp'], 9346, 'ctechlicensing'),
-        'ctf': Service(PROTOCOLS['tcp'], 84, 'ctf'),
-        'cti-redwood': Service(PROTOCOLS['tcp'], 2563, 'cti-redwood'),
-        'ctiprogramload': Service(PROTOCOLS['tcp'], 4452, 'ctiprogramload'),
-        'ctisystemmsg': Service(PROTOCOLS['tcp'], 4451, 'ctisystemmsg'),
-        'ctlptc': Service(PROTOCOLS['tcp'], 2153, 'ctlptc'),
-        'ctp': Service(PROTOCOLS['tcp'], 3772, 'ctp'),
-        'ctp-state': Service(PROTOCOLS['tcp'], 4047, 'ctp-state'),
-        'ctsd': Service(PROTOCOLS['tcp'], 5137, 'ctsd'),
-        'ctt-broker': Service(PROTOCOLS['tcp'], 1932, 'ctt-broker'),
-        'ctx-bridge': Service(PROTOCOLS['tcp'], 3127, 'ctx-bridge'),
-        'ctxlic': Service(PROTOCOLS['tcp'], 7279, 'ctxlic'),
-        'cuelink': Service(PROTOCOLS['tcp'], 5271, 'cuelink'),
-        'cuillamartin': Service(PROTOCOLS['tcp'], 1356, 'cuillamartin'),
-        'cumulus': Service(PROTOCOLS['tcp'], 9287, 'cumulus'),
-        'cumulus-admin': Service(PROTOCOLS['tcp'], 8954, 'cumulus-admin'),
-        'cuseeme': Service(PROTOCOLS['tcp'], 7648, 'cuseeme'),
-        'custix': Service(PROTOCOLS['tcp'], 528, 'custix'),
-        'cvc': Service(PROTOCOLS['tcp'], 1495, 'cvc'),
-        'cvc-hostd': Service(PROTOCOLS['tcp'], 442, 'cvc-hostd'),
-        'cvc_hostd': Service(PROTOCOLS['tcp'], 442, 'cvc_hostd'),
-        'cvd': Service(PROTOCOLS['tcp'], 8400, 'cvd'),
-        'cvmmon': Service(PROTOCOLS['tcp'], 2300, 'cvmmon'),
-        'cvmon': Service(PROTOCOLS['tcp'], 1686, 'cvmon'),
-        'cvspserver': Service(PROTOCOLS['tcp'], 2401, 'cvspserver'),
-        'cvsup': Service(PROTOCOLS['tcp'], 5999, 'cvsup'),
-        'cwmp': Service(PROTOCOLS['tcp'], 7547, 'cwmp'),
-        'cxws': Service(PROTOCOLS['tcp'], 4673, 'cxws'),
-        'cyaserv': Service(PROTOCOLS['tcp'], 2584, 'cyaserv'),
-        'cybercash': Service(PROTOCOLS['tcp'], 551, 'cybercash'),
-        'cyborg-systems': Service(PROTOCOLS['tcp'], 9888, 'cyborg-systems'),
-        'cyborgnet': Service(PROTOCOLS['tcp'], 4183, 'cyborgnet'),
-        'cybro-a-bus': Service(PROTOCOLS['tcp'], 8442, 'cybro-a-bus'),
-        'cyc': Service(PROTOCOLS['tcp'], 3645, 'cyc'),
-        'cycleserv': Service(PROTOCOLS['tcp'], 763, 'cycleserv'),
-        'cycleserv2': Service(PROTOCOLS['tcp'], 772, 'cycleserv2'),
-        'cylink-c': Service(PROTOCOLS['tcp'], 5420, 'cylink-c'),
-        'cymtec-port': Service(PROTOCOLS['tcp'], 1898, 'cymtec-port'),
-        'cypress': Service(PROTOCOLS['tcp'], 2015, 'cypress'),
-        'cypress-stat': Service(PROTOCOLS['tcp'], 2017, 'cypress-stat'),
-        'cytel-lm': Service(PROTOCOLS['tcp'], 3297, 'cytel-lm'),
-        'd-cinema-csp': Service(PROTOCOLS['tcp'], 4170, 'd-cinema-csp'),
-        'd-cinema-rrp': Service(PROTOCOLS['tcp'], 1173, 'd-cinema-rrp'),
-        'd-data': Service(PROTOCOLS['tcp'], 4301, 'd-data'),
-        'd-data-control': Service(PROTOCOLS['tcp'], 4302, 'd-data-control'),
-        'd-fence': Service(PROTOCOLS['tcp'], 8555, 'd-fence'),
-        'd-s-n': Service(PROTOCOLS['tcp'], 8086, 'd-s-n'),
-        'd2000kernel': Service(PROTOCOLS['tcp'], 3119, 'd2000kernel'),
-        'd2000webserver': Service(PROTOCOLS['tcp'], 3120, 'd2000webserver'),
-        'd2dconfig': Service(PROTOCOLS['tcp'], 9387, 'd2dconfig'),
-        'd2ddatatrans': Service(PROTOCOLS['tcp'], 9388, 'd2ddatatrans'),
-        'd2k-datamover1': Service(PROTOCOLS['tcp'], 2297, 'd2k-datamover1'),
-        'd2k-datamover2': Service(PROTOCOLS['tcp'], 2298, 'd2k-datamover2'),
-        'd2k-tapestry1': Service(PROTOCOLS['tcp'], 3393, 'd2k-tapestry1'),
-        'd2k-tapestry2': Service(PROTOCOLS['tcp'], 3394, 'd2k-tapestry2'),
-        'd3winosfi': Service(PROTOCOLS['tcp'], 3458, 'd3winosfi'),
-        'daap': Service(PROTOCOLS['tcp'], 3689, 'daap'),
-        'dab-sti-c': Service(PROTOCOLS['tcp'], 1076, 'dab-sti-c'),
-        'dai-shell': Service(PROTOCOLS['tcp'], 45824, 'dai-shell'),
-        'daishi': Service(PROTOCOLS['tcp'], 2870, 'daishi'),
-        'dali-port': Service(PROTOCOLS['tcp'], 5777, 'dali-port'),
-        'damewaremobgtwy': Service(PROTOCOLS['tcp'], 6130, 'damewaremobgtwy'),
-        'dandv-tester': Service(PROTOCOLS['tcp'], 3889, 'dandv-tester'),
-        'danf-ak2': Service(PROTOCOLS['tcp'], 1041, 'danf-ak2'),
-        'daqstream': Service(PROTOCOLS['tcp'], 7411, 'daqstream'),
-        'darcorp-lm': Service(PROTOCOLS['tcp'], 1679, 'darcorp-lm'),
-        'dashpas-port': Service(PROTOCOLS['tcp'], 3498, 'dashpas-port'),
-        'dasp': Service(PROTOCOLS['tcp'], 439, 'dasp'),
-        'data-insurance': Service(PROTOCOLS['tcp'], 2764, 'data-insurance'),
-        'data-port': Service(PROTOCOLS['tcp'], 3578, 'data-port'),
-        'datacaptor': Service(PROTOCOLS['tcp'], 1857, 'datacaptor'),
-        'datalens': Service(PROTOCOLS['tcp'], 2229, 'datalens'),
-        'datascaler-ctl': Service(PROTOCOLS['tcp'], 6625, 'datascaler-ctl'),
-        'datascaler-db': Service(PROTOCOLS['tcp'], 6624, 'datascaler-db'),
-        'datasurfsrv': Service(PROTOCOLS['tcp'], 461, 'datasurfsrv'),
-        'datasurfsrvsec': Service(PROTOCOLS['tcp'], 462, 'datasurfsrvsec'),
-        'datex-asn': Service(PROTOCOLS['tcp'], 355, 'datex-asn'),
-        'datusorb': Service(PROTOCOLS['tcp'], 3282, 'datusorb'),
-        'davsrc': Service(PROTOCOLS['tcp'], 9800, 'davsrc'),
-        'davsrcs': Service(PROTOCOLS['tcp'], 9802, 'davsrcs'),
-        'dawn': Service(PROTOCOLS['tcp'], 1908, 'dawn'),
-        'dayliteserver': Service(PROTOCOLS['tcp'], 6113, 'dayliteserver'),
-        'daylitetouch': Service(PROTOCOLS['tcp'], 6117, 'daylitetouch'),
-        'daytime': Service(PROTOCOLS['tcp'], 13, 'daytime'),
-        'db-lsp': Service(PROTOCOLS['tcp'], 17500, 'db-lsp'),
-        'dbabble': Service(PROTOCOLS['tcp'], 8132, 'dbabble'),
-        'dbase': Service(PROTOCOLS['tcp'], 217, 'dbase'),
-        'dbbrowse': Service(PROTOCOLS['tcp'], 47557, 'dbbrowse'),
-        'dbcontrol-agent': Service(PROTOCOLS['tcp'], 3938, 'dbcontrol-agent'),
-        'dbcontrol-oms': Service(PROTOCOLS['tcp'], 1158, 'dbcontrol-oms'),
-        'dbcontrol_agent': Service(PROTOCOLS['tcp'], 3938, 'dbcontrol_agent'),
-        'dbdb': Service(PROTOCOLS['tcp'], 6104, 'dbdb'),
-        'dberegister': Service(PROTOCOLS['tcp'], 1479, 'dberegister'),
-        'dbisamserver1': Service(PROTOCOLS['tcp'], 12005, 'dbisamserver1'),
-        'dbisamserver2': Service(PROTOCOLS['tcp'], 12006, 'dbisamserver2'),
-        'dbm': Service(PROTOCOLS['tcp'], 2345, 'dbm'),
-        'dbref': Service(PROTOCOLS['tcp'], 2365, 'dbref'),
-        'dbreporter': Service(PROTOCOLS['tcp'], 1379, 'dbreporter'),
-        'dbstar': Service(PROTOCOLS['tcp'], 1415, 'dbstar'),
-        'dbsyncarbiter': Service(PROTOCOLS['tcp'], 4953, 'dbsyncarbiter'),
-        'dc': Service(PROTOCOLS['tcp'], 2001, 'dc'),
-        'dca': Service(PROTOCOLS['tcp'], 1456, 'dca'),
-        'dcap': Service(PROTOCOLS['tcp'], 22125, 'dcap'),
-        'dccm': Service(PROTOCOLS['tcp'], 5679, 'dccm'),
-        'dcp': Service(PROTOCOLS['tcp'], 93, 'dcp'),
-        'dcs': Service(PROTOCOLS['tcp'], 1367, 'dcs'),
-        'dcs-config': Service(PROTOCOLS['tcp'], 3988, 'dcs-config'),
-        'dcsl-backup': Service(PROTOCOLS['tcp'], 11202, 'dcsl-backup'),
-        'dcsoftware': Service(PROTOCOLS['tcp'], 3793, 'dcsoftware'),
-        'dctp': Service(PROTOCOLS['tcp'], 675, 'dctp'),
-        'dcutility': Service(PROTOCOLS['tcp'], 1044, 'dcutility'),
-        'dddp': Service(PROTOCOLS['tcp'], 9131, 'dddp'),
-        'ddgn': Service(PROTOCOLS['tcp'], 4167, 'ddgn'),
-        'ddi-tcp-1': Service(PROTOCOLS['tcp'], 8888, 'ddi-tcp-1'),
-        'ddi-tcp-2': Service(PROTOCOLS['tcp'], 8889, 'ddi-tcp-2'),
-        'ddi-tcp-3': Service(PROTOCOLS['tcp'], 8890, 'ddi-tcp-3'),
-        'ddi-tcp-4': Service(PROTOCOLS['tcp'], 8891, 'ddi-tcp-4'),
-        'ddi-tcp-5': Service(PROTOCOLS['tcp'], 8892, 'ddi-tcp-5'),
-        'ddi-tcp-6': Service(PROTOCOLS['tcp'], 8893, 'ddi-tcp-6'),
-        'ddi-tcp-7': Service(PROTOCOLS['tcp'], 8894, 'ddi-tcp-7'),
-        'ddm-dfm': Service(PROTOCOLS['tcp'], 447, 'ddm-dfm'),
-        'ddm-rdb': Service(PROTOCOLS['tcp'], 446, 'ddm-rdb'),
-        'ddm-ssl': Service(PROTOCOLS['tcp'], 448, 'ddm-ssl'),
-        'ddns-v3': Service(PROTOCOLS['tcp'], 2164, 'ddns-v3'),
-        'ddrepl': Service(PROTOCOLS['tcp'], 4126, 'ddrepl'),
-        'ddt': Service(PROTOCOLS['tcp'], 1052, 'ddt'),
-        'de-cache-query': Service(PROTOCOLS['tcp'], 1255, 'de-cache-query'),
-        'de-noc': Service(PROTOCOLS['tcp'], 1254, 'de-noc'),
-        'de-server': Service(PROTOCOLS['tcp'], 1256, 'de-server'),
-        'de-spot': Service(PROTOCOLS['tcp'], 2753, 'de-spot'),
-        'dec-dlm': Service(PROTOCOLS['tcp'], 625, 'dec-dlm'),
-        'dec-mbadmin': Service(PROTOCOLS['tcp'], 1655, 'dec-mbadmin'),
-        'dec-mbadmin-h': Service(PROTOCOLS['tcp'], 1656, 'dec-mbadmin-h'),
-        'dec-notes': Service(PROTOCOLS['tcp'], 3333, 'dec-notes'),
-        'dec_dlm': Service(PROTOCOLS['tcp'], 625, 'dec_dlm'),
-        'decap': Service(PROTOCOLS['tcp'], 403, 'decap'),
-        'decauth': Service(PROTOCOLS['tcp'], 316, 'decauth'),
-        'decbsrv': Service(PROTOCOLS['tcp'], 579, 'decbsrv'),
-        'decladebug': Service(PROTOCOLS['tcp'], 410, 'decladebug'),
-        'dectalk': Service(PROTOCOLS['tcp'], 2007, 'dectalk'),
-        'decvms-sysmgt': Service(PROTOCOLS['tcp'], 441, 'decvms-sysmgt'),
-        'dei-icda': Service(PROTOCOLS['tcp'], 618, 'dei-icda'),
-        'delibo': Service(PROTOCOLS['tcp'], 2562, 'delibo'),
-        'dell-eql-asm': Service(PROTOCOLS['tcp'], 7569, 'dell-eql-asm'),
-        'dell-rm-port': Service(PROTOCOLS['tcp'], 3668, 'dell-rm-port'),
-        'dellpwrappks': Service(PROTOCOLS['tcp'], 1266, 'dellpwrappks'),
-        'dellwebadmin-1': Service(PROTOCOLS['tcp'], 1278, 'dellwebadmin-1'),
-        'dellwebadmin-2': Service(PROTOCOLS['tcp'], 1279, 'dellwebadmin-2'),
-        'delos-dms': Service(PROTOCOLS['tcp'], 3714, 'delos-dms'),
-        'delta-mcp': Service(PROTOCOLS['tcp'], 1324, 'delta-mcp'),
-        'denali-server': Service(PROTOCOLS['tcp'], 3444, 'denali-server'),
-        'deos': Service(PROTOCOLS['tcp'], 76, 'deos'),
-        'deploymentmap': Service(PROTOCOLS['tcp'], 4570, 'deploymentmap'),
-        'derby-repli': Service(PROTOCOLS['tcp'], 4851, 'derby-repli'),
-        'descent3': Service(PROTOCOLS['tcp'], 2092, 'descent3'),
-        'deskshare': Service(PROTOCOLS['tcp'], 1702, 'deskshare'),
-        'desktop-dna': Service(PROTOCOLS['tcp'], 2763, 'desktop-dna'),
-        'deskview': Service(PROTOCOLS['tcp'], 3298, 'deskview'),
-        'devbasic': Service(PROTOCOLS['tcp'], 5426, 'devbasic'),
-        'device': Service(PROTOCOLS['tcp'], 801, 'device'),
-        'device2': Service(PROTOCOLS['tcp'], 2030, 'device2'),
-        'devshr-nts': Service(PROTOCOLS['tcp'], 552, 'devshr-nts'),
-        'dey-keyneg': Service(PROTOCOLS['tcp'], 8750, 'dey-keyneg'),
-        'dey-sapi': Service(PROTOCOLS['tcp'], 4330, 'dey-sapi'),
-        'dfn': Service(PROTOCOLS['tcp'], 1133, 'dfn'),
-        'dfoxserver': Service(PROTOCOLS['tcp'], 2960, 'dfoxserver'),
-        'dfserver': Service(PROTOCOLS['tcp'], 21554, 'dfserver'),
-        'dgi-serv': Service(PROTOCOLS['tcp'], 33333, 'dgi-serv'),
-        'dgpf-exchg': Service(PROTOCOLS['tcp'], 6785, 'dgpf-exchg'),
-        'dhanalakshmi': Service(PROTOCOLS['tcp'], 34567, 'dhanalakshmi'),
-        'dhcp-failover': Service(PROTOCOLS['tcp'], 647, 'dhcp-failover'),
-        'dhcp-failover2': Service(PROTOCOLS['tcp'], 847, 'dhcp-failover2'),
-        'dhcpv6-client': Service(PROTOCOLS['tcp'], 546, 'dhcpv6-client'),
-        'dhcpv6-server': Service(PROTOCOLS['tcp'], 547, 'dhcpv6-server'),
-        'dhct-alerts': Service(PROTOCOLS['tcp'], 4676, 'dhct-alerts'),
-        'dhct-status': Service(PROTOCOLS['tcp'], 4675, 'dhct-status'),
-        'dhe': Service(PROTOCOLS['tcp'], 3252, 'dhe'),
-        'di-ase': Service(PROTOCOLS['tcp'], 3046, 'di-ase'),
-        'di-drm': Service(PROTOCOLS['tcp'], 2226, 'di-drm'),
-        'di-msg': Service(PROTOCOLS['tcp'], 2227, 'di-msg'),
-        'di-traceware': Service(PROTOCOLS['tcp'], 3041, 'di-traceware'),
-        'diagmond': Service(PROTOCOLS['tcp'], 1508, 'diagmond'),
-        'diagnose-proc': Service(PROTOCOLS['tcp'], 6072, 'diagnose-proc'),
-        'dialog-port': Service(PROTOCOLS['tcp'], 2098, 'dialog-port'),
-        'dialogic-elmd': Service(PROTOCOLS['tcp'], 1945, 'dialogic-elmd'),
-        'dialpad-voice1': Service(PROTOCOLS['tcp'], 2860, 'dialpad-voice1'),
-        'dialpad-voice2': Service(PROTOCOLS['tcp'], 2861, 'dialpad-voice2'),
-        'diameter': Service(PROTOCOLS['tcp'], 3868, 'diameter'),
-        'diameters': Service(PROTOCOLS['tcp'], 5868, 'diameters'),
-        'diamondport': Service(PROTOCOLS['tcp'], 33331, 'diamondport'),
-        'dic-aida': Service(PROTOCOLS['tcp'], 1941, 'dic-aida'),
-        'dicom': Service(PROTOCOLS['tcp'], 11112, 'dicom'),
-        'dicom-iscl': Service(PROTOCOLS['tcp'], 2761, 'dicom-iscl'),
-        'dicom-tls': Service(PROTOCOLS['tcp'], 2762, 'dicom-tls'),
-        'dict': Service(PROTOCOLS['tcp'], 2628, 'dict'),
-        'dict-lookup': Service(PROTOCOLS['tcp'], 2289, 'dict-lookup'),
-        'dif-port': Service(PROTOCOLS['tcp'], 2251, 'dif-port'),
-        'digiman': Service(PROTOCOLS['tcp'], 2362, 'digiman'),
-        'digital-notary': Service(PROTOCOLS['tcp'], 1335, 'digital-notary'),
-        'digital-vrc': Service(PROTOCOLS['tcp'], 466, 'digital-vrc'),
-        'digivote': Service(PROTOCOLS['tcp'], 3223, 'digivote'),
-        'direcpc-dll': Service(PROTOCOLS['tcp'], 1844, 'direcpc-dll'),
-        'direcpc-si': Service(PROTOCOLS['tcp'], 2464, 'direcpc-si'),
-        'direcpc-video': Service(PROTOCOLS['tcp'], 1825, 'direcpc-video'),
-        'direct': Service(PROTOCOLS['tcp'], 242, 'direct'),
-        'directnet': Service(PROTOCOLS['tcp'], 3447, 'directnet'),
-        'directplay': Service(PROTOCOLS['tcp'], 2234, 'directplay'),
-        'directplay8': Service(PROTOCOLS['tcp'], 6073, 'directplay8'),
-        'directplaysrvr': Service(PROTOCOLS['tcp'], 47624, 'directplaysrvr'),
-        'directv-catlg': Service(PROTOCOLS['tcp'], 3337, 'directv-catlg'),
-        'directv-soft': Service(PROTOCOLS['tcp'], 3335, 'directv-soft'),
-        'directv-tick': Service(PROTOCOLS['tcp'], 3336, 'directv-tick'),
-        'directv-web': Service(PROTOCOLS['tcp'], 3334, 'directv-web'),
-        'directvdata': Service(PROTOCOLS['tcp'], 3287, 'directvdata'),
-        'dirgis': Service(PROTOCOLS['tcp'], 2496, 'dirgis'),
-        'discard': Service(PROTOCOLS['tcp'], 9, 'discard'),
-        'disclose': Service(PROTOCOLS['tcp'], 667, 'disclose'),
-        'discovery-port': Service(PROTOCOLS['tcp'], 1925, 'discovery-port'),
-        'discp-client': Service(PROTOCOLS['tcp'], 2601, 'discp-client'),
-        'discp-server': Service(PROTOCOLS['tcp'], 2602, 'discp-server'),
-        'display': Service(PROTOCOLS['tcp'], 7236, 'display'),
-        'dist-upgrade': Service(PROTOCOLS['tcp'], 3624, 'dist-upgrade'),
-        'distcc': Service(PROTOCOLS['tcp'], 3632, 'distcc'),
-        'distinct': Service(PROTOCOLS['tcp'], 9999, 'distinct'),
-        'distinct32': Service(PROTOCOLS['tcp'], 9998, 'distinct32'),
-        'dixie': Service(PROTOCOLS['tcp'], 96, 'dixie'),
-        'dj-ice': Service(PROTOCOLS['tcp'], 5419, 'dj-ice'),
-        'dj-ilm': Service(PROTOCOLS['tcp'], 3362, 'dj-ilm'),
-        'dka': Service(PROTOCOLS['tcp'], 1263, 'dka'),
-        'dkmessenger': Service(PROTOCOLS['tcp'], 1177, 'dkmessenger'),
-        'dl-agent': Service(PROTOCOLS['tcp'], 3876, 'dl-agent'),
-        'dl_agent': Service(PROTOCOLS['tcp'], 3876, 'dl_agent'),
-        'dlep': Service(PROTOCOLS['tcp'], 854, 'dlep'),
-        'dlip': Service(PROTOCOLS['tcp'], 7201, 'dlip'),
-        'dlms-cosem': Service(PROTOCOLS['tcp'], 4059, 'dlms-cosem'),
-        'dlpx-sp': Service(PROTOCOLS['tcp'], 8415, 'dlpx-sp'),
-        'dls': Service(PROTOCOLS['tcp'], 2047, 'dls'),
-        'dls-mon': Service(PROTOCOLS['tcp'], 198, 'dls-mon'),
-        'dls-monitor': Service(PROTOCOLS['tcp'], 2048, 'dls-monitor'),
-        'dlsrap': Service(PROTOCOLS['tcp'], 1973, 'dlsrap'),
-        'dlsrpn': Service(PROTOCOLS['tcp'], 2065, 'dlsrpn'),
-        'dlswpn': Service(PROTOCOLS['tcp'], 2067, 'dlswpn'),
-        'dmaf-server': Service(PROTOCOLS['tcp'], 3574, 'dmaf-server'),
-        'dmdocbroker': Service(PROTOCOLS['tcp'], 1489, 'dmdocbroker'),
-        'dmexpress': Service(PROTOCOLS['tcp'], 32636, 'dmexpress'),
-        'dmidi': Service(PROTOCOLS['tcp'], 1199, 'dmidi'),
-        'dmod-workspace': Service(PROTOCOLS['tcp'], 3199, 'dmod-workspace'),
-        'dmt': Service(PROTOCOLS['tcp'], 7683, 'dmt'),
-        'dn6-nlm-aud': Service(PROTOCOLS['tcp'], 195, 'dn6-nlm-aud'),
-        'dn6-smm-red': Service(PROTOCOLS['tcp'], 196, 'dn6-smm-red'),
-        'dna': Service(PROTOCOLS['tcp'], 2287, 'dna'),
-        'dna-cml': Service(PROTOCOLS['tcp'], 436, 'dna-cml'),
-        'dnap': Service(PROTOCOLS['tcp'], 1172, 'dnap'),
-        'dnc-port': Service(PROTOCOLS['tcp'], 3448, 'dnc-port'),
-        'dnox': Service(PROTOCOLS['tcp'], 4022, 'dnox'),
-        'dnp': Service(PROTOCOLS['tcp'], 20000, 'dnp'),
-        'dnp-sec': Service(PROTOCOLS['tcp'], 19999, 'dnp-sec'),
-        'dns-llq': Service(PROTOCOLS['tcp'], 5352, 'dns-llq'),
-        'dns2go': Service(PROTOCOLS['tcp'], 1227, 'dns2go'),
-        'dnsix': Service(PROTOCOLS['tcp'], 90, 'dnsix'),
-        'dnx': Service(PROTOCOLS['tcp'], 3998, 'dnx'),
-        'doc-server': Service(PROTOCOLS['tcp'], 7165, 'doc-server'),
-        'doc1lm': Service(PROTOCOLS['tcp'], 3161, 'doc1lm'),
-        'docent': Service(PROTOCOLS['tcp'], 2151, 'docent'),
-        'doceri-ctl': Service(PROTOCOLS['tcp'], 7019, 'doceri-ctl'),
-        'docker': Service(PROTOCOLS['tcp'], 2375, 'docker'),
-        'docker-s': Service(PROTOCOLS['tcp'], 2376, 'docker-s'),
-        'docstor': Service(PROTOCOLS['tcp'], 1488, 'docstor'),
-        'documentum': Service(PROTOCOLS['tcp'], 10002, 'documentum'),
-        'documentum-s': Service(PROTOCOLS['tcp'], 10003, 'documentum-s'),
-        'documentum_s': Service(PROTOCOLS['tcp'], 10003, 'documentum_s'),
-        'dof-dps-mc-sec': Service(PROTOCOLS['tcp'], 5567, 'dof-dps-mc-sec'),
-        'dof-eps': Service(PROTOCOLS['tcp'], 3567, 'dof-eps'),
-        'dof-tunnel': Service(PROTOCOLS['tcp'], 8567, 'dof-tunnel'),
-        'dof-tunnel-sec': Service(PROTOCOLS['tcp'], 3568, 'dof-tunnel-sec'),
-        'doglms': Service(PROTOCOLS['tcp'], 6088, 'doglms'),
-        'doip-data': Service(PROTOCOLS['tcp'], 13400, 'doip-data'),
-        'domain': Service(PROTOCOLS['tcp'], 53, 'domain'),
-        'domain-s': Service(PROTOCOLS['tcp'], 853, 'domain-s'),
-        'domaintime': Service(PROTOCOLS['tcp'], 9909, 'domaintime'),
-        'donnyworld': Service(PROTOCOLS['tcp'], 1821, 'donnyworld'),
-        'doom': Service(PROTOCOLS['tcp'], 666, 'doom'),
-        'dossier': Service(PROTOCOLS['tcp'], 1175, 'dossier'),
-        'down': Service(PROTOCOLS['tcp'], 2022, 'down'),
-        'downtools': Service(PROTOCOLS['tcp'], 5245, 'downtools'),
-        'dpap': Service(PROTOCOLS['tcp'], 8770, 'dpap'),
-        'dpcp': Service(PROTOCOLS['tcp'], 4099, 'dpcp'),
-        'dpi-proxy': Service(PROTOCOLS['tcp'], 1795, 'dpi-proxy'),
-        'dpkeyserv': Service(PROTOCOLS['tcp'], 1780, 'dpkeyserv'),
-        'dpm': Service(PROTOCOLS['tcp'], 5718, 'dpm'),
-        'dpm-acm': Service(PROTOCOLS['tcp'], 6075, 'dpm-acm'),
-        'dpm-agent': Service(PROTOCOLS['tcp'], 5719, 'dpm-agent'),
-        'dproxy': Service(PROTOCOLS['tcp'], 1296, 'dproxy'),
-        'dpserve': Service(PROTOCOLS['tcp'], 7020, 'dpserve'),
-        'dpserveadmin': Service(PROTOCOLS['tcp'], 7021, 'dpserveadmin'),
-        'dpsi': Service(PROTOCOLS['tcp'], 315, 'dpsi'),
-        'dragonfly': Service(PROTOCOLS['tcp'], 8913, 'dragonfly'),
-        'drip': Service(PROTOCOLS['tcp'], 3949, 'drip'),
-        'driveappserver': Service(PROTOCOLS['tcp'], 1930, 'driveappserver'),
-        'drizzle': Service(PROTOCOLS['tcp'], 4427, 'drizzle'),
-        'drm-production': Service(PROTOCOLS['tcp'], 7171, 'drm-production'),
-        'drmsfsd': Service(PROTOCOLS['tcp'], 4098, 'drmsfsd'),
-        'drmsmc': Service(PROTOCOLS['tcp'], 1878, 'drmsmc'),
-        'drp': Service(PROTOCOLS['tcp'], 1974, 'drp'),
-        'drwcs': Service(PROTOCOLS['tcp'], 2193, 'drwcs'),
-        'ds-admin': Service(PROTOCOLS['tcp'], 4404, 'ds-admin'),
-        'ds-clnt': Service(PROTOCOLS['tcp'], 4402, 'ds-clnt'),
-        'ds-mail': Service(PROTOCOLS['tcp'], 4405, 'ds-mail'),
-        'ds-slp': Service(PROTOCOLS['tcp'], 4406, 'ds-slp'),
-        'ds-srv': Service(PROTOCOLS['tcp'], 4400, 'ds-srv'),
-        'ds-srvr': Service(PROTOCOLS['tcp'], 4401, 'ds-srvr'),
-        'ds-user': Service(PROTOCOLS['tcp'], 4403, 'ds-user'),
-        'dsatp': Service(PROTOCOLS['tcp'], 2111, 'dsatp'),
-        'dsc': Service(PROTOCOLS['tcp'], 3390, 'dsc'),
-        'dsdn': Service(PROTOCOLS['tcp'], 1292, 'dsdn'),
-        'dserver': Service(PROTOCOLS['tcp'], 4309, 'dserver'),
-        'dsetos': Service(PROTOCOLS['tcp'], 378, 'dsetos'),
-        'dsf': Service(PROTOCOLS['tcp'], 555, 'dsf'),
-        'dsfgw': Service(PROTOCOLS['tcp'], 438, 'dsfgw'),
-        'dslremote-mgmt': Service(PROTOCOLS['tcp'], 2420, 'dslremote-mgmt'),
-        'dsm-scm-target': Service(PROTOCOLS['tcp'], 9987, 'dsm-scm-target'),
-        'dsmcc-ccp': Service(PROTOCOLS['tcp'], 13822, 'dsmcc-ccp'),
-        'dsmcc-config': Service(PROTOCOLS['tcp'], 13818, 'dsmcc-config'),
-        'dsmcc-download': Service(PROTOCOLS['tcp'], 13821, 'dsmcc-download'),
-        'dsmcc-passthru': Service(PROTOCOLS['tcp'], 13820, 'dsmcc-passthru'),
-        'dsmcc-session': Service(PROTOCOLS['tcp'], 13819, 'dsmcc-session'),
-        'dsmeter-iatc': Service(PROTOCOLS['tcp'], 4060, 'dsmeter-iatc'),
-        'dsmeter_iatc': Service(PROTOCOLS['tcp'], 4060, 'dsmeter_iatc'),
-        'dsom-server': Service(PROTOCOLS['tcp'], 3053, 'dsom-server'),
-        'dsp': Service(PROTOCOLS['tcp'], 33, 'dsp'),
-        'dsp3270': Service(PROTOCOLS['tcp'], 246, 'dsp3270'),
-        'dssiapi': Service(PROTOCOLS['tcp'], 1265, 'dssiapi'),
-        'dsx-agent': Service(PROTOCOLS['tcp'], 3685, 'dsx-agent'),
-        'dsx-monitor': Service(PROTOCOLS['tcp'], 31685, 'dsx-monitor'),
-        'dsx_monitor': Service(PROTOCOLS['tcp'], 31685, 'dsx_monitor'),
-        'dt-mgmtsvc': Service(PROTOCOLS['tcp'], 6325, 'dt-mgmtsvc'),
-        'dt-vra': Service(PROTOCOLS['tcp'], 6326, 'dt-vra'),
-        'dta-systems': Service(PROTOCOLS['tcp'], 13929, 'dta-systems'),
-        'dtag-ste-sb': Service(PROTOCOLS['tcp'], 352, 'dtag-ste-sb'),
-        'dtk': Service(PROTOCOLS['tcp'], 365, 'dtk'),
-        'dtn-bundle': Service(PROTOCOLS['tcp'], 4556, 'dtn-bundle'),
-        'dtn1': Service(PROTOCOLS['tcp'], 2445, 'dtn1'),
-        'dtp': Service(PROTOCOLS['tcp'], 3663, 'dtp'),
-        'dtp-dia': Service(PROTOCOLS['tcp'], 3489, 'dtp-dia'),
-        'dtpt': Service(PROTOCOLS['tcp'], 5721, 'dtpt'),
-        'dts': Service(PROTOCOLS['tcp'], 2594, 'dts'),
-        'dtserver-port': Service(PROTOCOLS['tcp'], 4028, 'dtserver-port'),
-        'dtspcd': Service(PROTOCOLS['tcp'], 6112, 'dtspcd'),
-        'dtv-chan-req': Service(PROTOCOLS['tcp'], 2253, 'dtv-chan-req'),
-        'dvapps': Service(PROTOCOLS['tcp'], 3831, 'dvapps'),
-        'dvbservdsc': Service(PROTOCOLS['tcp'], 3937, 'dvbservdsc'),
-        'dvcprov-port': Service(PROTOCOLS['tcp'], 3776, 'dvcprov-port'),
-        'dvl-activemail': Service(PROTOCOLS['tcp'], 1396, 'dvl-activemail'),
-        'dvr-esm': Service(PROTOCOLS['tcp'], 2804, 'dvr-esm'),
-        'dvt-data': Service(PROTOCOLS['tcp'], 3247, 'dvt-data'),
-        'dvt-system': Service(PROTOCOLS['tcp'], 3246, 'dvt-system'),
-        'dwf': Service(PROTOCOLS['tcp'], 1450, 'dwf'),
-        'dwmsgserver': Service(PROTOCOLS['tcp'], 3228, 'dwmsgserver'),
-        'dwnmshttp': Service(PROTOCOLS['tcp'], 3227, 'dwnmshttp'),
-        'dwr': Service(PROTOCOLS['tcp'], 644, 'dwr'),
-        'dx-instrument': Service(PROTOCOLS['tcp'], 1325, 'dx-instrument'),
-        'dxadmind': Service(PROTOCOLS['tcp'], 1958, 'dxadmind'),
-        'dxmessagebase1': Service(PROTOCOLS['tcp'], 2874, 'dxmessagebase1'),
-        'dxmessagebase2': Service(PROTOCOLS['tcp'], 2875, 'dxmessagebase2'),
-        'dxspider': Service(PROTOCOLS['tcp'], 8873, 'dxspider'),
-        'dyn-site': Service(PROTOCOLS['tcp'], 3932, 'dyn-site'),
-        'dyna-access': Service(PROTOCOLS['tcp'], 3310, 'dyna-access'),
-        'dyna-lm': Service(PROTOCOLS['tcp'], 3395, 'dyna-lm'),
-        'dynamic3d': Service(PROTOCOLS['tcp'], 2150, 'dynamic3d'),
-        'dynamid': Service(PROTOCOLS['tcp'], 9002, 'dynamid'),
-        'dyniplookup': Service(PROTOCOLS['tcp'], 3295, 'dyniplookup'),
-        'dzdaemon': Service(PROTOCOLS['tcp'], 3866, 'dzdaemon'),
-        'dzoglserver': Service(PROTOCOLS['tcp'], 3867, 'dzoglserver'),
-        'e-builder': Service(PROTOCOLS['tcp'], 4121, 'e-builder'),
-        'e-design-net': Service(PROTOCOLS['tcp'], 6702, 'e-design-net'),
-        'e-design-web': Service(PROTOCOLS['tcp'], 6703, 'e-design-web'),
-        'e-dpnet': Service(PROTOCOLS['tcp'], 2036, 'e-dpnet'),
-        'e-mdu': Service(PROTOCOLS['tcp'], 3727, 'e-mdu'),
-        'e-net': Service(PROTOCOLS['tcp'], 3286, 'e-net'),
-        'e-woa': Service(PROTOCOLS['tcp'], 3728, 'e-woa'),
-        'e3consultants': Service(PROTOCOLS['tcp'], 3157, 'e3consultants'),
-        'ea': Service(PROTOCOLS['tcp'], 17729, 'ea'),
-        'ea1': Service(PROTOCOLS['tcp'], 1791, 'ea1'),
-        'eapsp': Service(PROTOCOLS['tcp'], 2291, 'eapsp'),
-        'easl': Service(PROTOCOLS['tcp'], 3693, 'easl'),
-        'easy-soft-mux': Service(PROTOCOLS['tcp'], 2168, 'easy-soft-mux'),
-        'easyengine': Service(PROTOCOLS['tcp'], 22222, 'easyengine'),
-        'eba': Service(PROTOCOLS['tcp'], 45678, 'eba'),
-        'ebinsite': Service(PROTOCOLS['tcp'], 2651, 'ebinsite'),
-        'echo': Service(PROTOCOLS['tcp'], 7, 'echo'),
-        'echonet': Service(PROTOCOLS['tcp'], 3610, 'echonet'),
-        'ecmp': Service(PROTOCOLS['tcp'], 6160, 'ecmp'),
-        'ecmport': Service(PROTOCOLS['tcp'], 3524, 'ecmport'),
-        'ecnp': Service(PROTOCOLS['tcp'], 2858, 'ecnp'),
-        'ecolor-imager': Service(PROTOCOLS['tcp'], 3263, 'ecolor-imager'),
-        'ecomm': Service(PROTOCOLS['tcp'], 3477, 'ecomm'),
-        'ecovisiong6-1': Service(PROTOCOLS['tcp'], 2896, 'ecovisiong6-1'),
-        'ecp': Service(PROTOCOLS['tcp'], 3134, 'ecp'),
-        'ecsqdmn': Service(PROTOCOLS['tcp'], 1882, 'ecsqdmn'),
-        'ecwcfg': Service(PROTOCOLS['tcp'], 2263, 'ecwcfg'),
-        'edb-server1': Service(PROTOCOLS['tcp'], 1635, 'edb-server1'),
-        'edb-server2': Service(PROTOCOLS['tcp'], 3711, 'edb-server2'),
-        'edbsrvr': Service(PROTOCOLS['tcp'], 12010, 'edbsrvr'),
-        'editbench': Service(PROTOCOLS['tcp'], 1350, 'editbench'),
-        'edix': Service(PROTOCOLS['tcp'], 3123, 'edix'),
-        'edm-adm-notify': Service(PROTOCOLS['tcp'], 3463, 'edm-adm-notify'),
-        'edm-manager': Service(PROTOCOLS['tcp'], 3460, 'edm-manager'),
-        'edm-mgr-cntrl': Service(PROTOCOLS['tcp'], 3465, 'edm-mgr-cntrl'),
-        'edm-mgr-sync': Service(PROTOCOLS['tcp'], 3464, 'edm-mgr-sync'),
-        'edm-stager': Service(PROTOCOLS['tcp'], 3461, 'edm-stager'),
-        'edm-std-notify': Service(PROTOCOLS['tcp'], 3462, 'edm-std-notify'),
-        'edtools': Service(PROTOCOLS['tcp'], 1142, 'edtools'),
-        'eenet': Service(PROTOCOLS['tcp'], 5234, 'eenet'),
-        'efb-aci': Service(PROTOCOLS['tcp'], 6159, 'efb-aci'),
-        'efcp': Service(PROTOCOLS['tcp'], 3671, 'efcp'),
-        'efi-lm': Service(PROTOCOLS['tcp'], 3392, 'efi-lm'),
-        'efi-mg': Service(PROTOCOLS['tcp'], 2224, 'efi-mg'),
-        'efidiningport': Service(PROTOCOLS['tcp'], 2553, 'efidiningport'),
-        'eforward': Service(PROTOCOLS['tcp'], 2181, 'eforward'),
-        'efr': Service(PROTOCOLS['tcp'], 5618, 'efr'),
-        'efs': Service(PROTOCOLS['tcp'], 520, 'efs'),
-        'eftp': Service(PROTOCOLS['tcp'], 37601, 'eftp'),
-        'egptlm': Service(PROTOCOLS['tcp'], 3328, 'egptlm'),
-        'egs': Service(PROTOCOLS['tcp'], 1926, 'egs'),
-        'ehome-ms': Service(PROTOCOLS['tcp'], 2228, 'ehome-ms'),
-        'ehp-backup': Service(PROTOCOLS['tcp'], 3638, 'ehp-backup'),
-        'ehs': Service(PROTOCOLS['tcp'], 4535, 'ehs'),
-        'ehs-ssl': Service(PROTOCOLS['tcp'], 4536, 'ehs-ssl'),
-        'ehtp': Service(PROTOCOLS['tcp'], 1295, 'ehtp'),
-        'eicon-server': Service(PROTOCOLS['tcp'], 1438, 'eicon-server'),
-        'eicon-slp': Service(PROTOCOLS['tcp'], 1440, 'eicon-slp'),
-        'eicon-x25': Service(PROTOCOLS['tcp'], 1439, 'eicon-x25'),
-        'eims-admin': Service(PROTOCOLS['tcp'], 4199, 'eims-admin'),
-        'eis': Service(PROTOCOLS['tcp'], 3982, 'eis'),
-        'eisp': Service(PROTOCOLS['tcp'], 3983, 'eisp'),
-        'eisport': Service(PROTOCOLS['tcp'], 3525, 'eisport'),
-        'elad': Service(PROTOCOLS['tcp'], 1893, 'elad'),
-        'elan': Service(PROTOCOLS['tcp'], 1378, 'elan'),
-        'elanlm': Service(PROTOCOLS['tcp'], 4346, 'elanlm'),
-        'elatelink': Service(PROTOCOLS['tcp'], 2124, 'elatelink'),
-        'elcn': Service(PROTOCOLS['tcp'], 7101, 'elcn'),
-        'elcsd': Service(PROTOCOLS['tcp'], 704, 'elcsd'),
-        'elektron-admin': Service(PROTOCOLS['tcp'], 5398, 'elektron-admin'),
-        'elfiq-repl': Service(PROTOCOLS['tcp'], 1148, 'elfiq-repl'),
-        'eli': Service(PROTOCOLS['tcp'], 2087, 'eli'),
-        'elipse-rec': Service(PROTOCOLS['tcp'], 6515, 'elipse-rec'),
-        'ellpack': Service(PROTOCOLS['tcp'], 2025, 'ellpack'),
-        'elm-momentum': Service(PROTOCOLS['tcp'], 1914, 'elm-momentum'),
-        'elpro-tunnel': Service(PROTOCOLS['tcp'], 4370, 'elpro-tunnel'),
-        'elpro_tunnel': Service(PROTOCOLS['tcp'], 4370, 'elpro_tunnel'),
-        'els': Service(PROTOCOLS['tcp'], 1315, 'els'),
-        'elvin-client': Service(PROTOCOLS['tcp'], 2917, 'elvin-client'),
-        'elvin-server': Service(PROTOCOLS['tcp'], 2916, 'elvin-server'),
-        'elvin_client': Service(PROTOCOLS['tcp'], 2917, 'elvin_client'),
-        'elvin_server': Service(PROTOCOLS['tcp'], 2916, 'elvin_server'),
-        'elxmgmt': Service(PROTOCOLS['tcp'], 23333, 'elxmgmt'),
-        'em7-secom': Service(PROTOCOLS['tcp'], 7700, 'em7-secom'),
-        'ema-sent-lm': Service(PROTOCOLS['tcp'], 2526, 'ema-sent-lm'),
-        'embl-ndt': Service(PROTOCOLS['tcp'], 394, 'embl-ndt'),
-        'embrace-dp-c': Service(PROTOCOLS['tcp'], 3198, 'embrace-dp-c'),
-        'embrace-dp-s': Service(PROTOCOLS['tcp'], 3197, 'embrace-dp-s'),
-        'emc-gateway': Service(PROTOCOLS['tcp'], 1273, 'emc-gateway'),
-        'emc-pp-mgmtsvc': Service(PROTOCOLS['tcp'], 9083, 'emc-pp-mgmtsvc'),
-        'emc-vcas-tcp': Service(PROTOCOLS['tcp'], 13218, 'emc-vcas-tcp'),
-        'emc-xsw-dcache': Service(PROTOCOLS['tcp'], 11723, 'emc-xsw-dcache'),
-        'emc-xsw-dconfig': Service(PROTOCOLS['tcp'], 11623, 'emc-xsw-dconfig'),
-        'emcads': Service(PROTOCOLS['tcp'], 3945, 'emcads'),
-        'emcrmirccd': Service(PROTOCOLS['tcp'], 10004, 'emcrmirccd'),
-        'emcrmird': Service(PROTOCOLS['tcp'], 10005, 'emcrmird'),
-        'emcsymapiport': Service(PROTOCOLS['tcp'], 2707, 'emcsymapiport'),
-        'emfis-cntl': Service(PROTOCOLS['tcp'], 141, 'emfis-cntl'),
-        'emfis-data': Service(PROTOCOLS['tcp'], 140, 'emfis-data'),
-        'emgmsg': Service(PROTOCOLS['tcp'], 6656, 'emgmsg'),
-        'emp-server1': Service(PROTOCOLS['tcp'], 6321, 'emp-server1'),
-        'emp-server2': Service(PROTOCOLS['tcp'], 6322, 'emp-server2'),
-        'emperion': Service(PROTOCOLS['tcp'], 1282, 'emperion'),
-        'empire-empuma': Service(PROTOCOLS['tcp'], 1691, 'empire-empuma'),
-        'empowerid': Service(PROTOCOLS['tcp'], 7080, 'empowerid'),
-        'emprise-lls': Service(PROTOCOLS['tcp'], 3585, 'emprise-lls'),
-        'emprise-lsc': Service(PROTOCOLS['tcp'], 3586, 'emprise-lsc'),
-        'ems': Service(PROTOCOLS['tcp'], 4664, 'ems'),
-        'emsd-port': Service(PROTOCOLS['tcp'], 1928, 'emsd-port'),
-        'emwavemsg': Service(PROTOCOLS['tcp'], 20480, 'emwavemsg'),
-        'emwin': Service(PROTOCOLS['tcp'], 2211, 'emwin'),
-        'encore': Service(PROTOCOLS['tcp'], 1740, 'encore'),
-        'encrypted-admin': Service(PROTOCOLS['tcp'], 1138, 'encrypted-admin'),
-        'encrypted-llrp': Service(PROTOCOLS['tcp'], 5085, 'encrypted-llrp'),
-        'encrypted_admin': Service(PROTOCOLS['tcp'], 1138, 'encrypted_admin'),
-        'enfs': Service(PROTOCOLS['tcp'], 5233, 'enfs'),
-        'enguity-xccetp': Service(PROTOCOLS['tcp'], 8041, 'enguity-xccetp'),
-        'enl': Service(PROTOCOLS['tcp'], 1804, 'enl'),
-        'enl-name': Service(PROTOCOLS['tcp'], 1805, 'enl-name'),
-        'enpc': Service(PROTOCOLS['tcp'], 3289, 'enpc'),
-        'enpp': Service(PROTOCOLS['tcp'], 2968, 'enpp'),
-        'ent-engine': Service(PROTOCOLS['tcp'], 3665, 'ent-engine'),
-        'entexthigh': Service(PROTOCOLS['tcp'], 12002, 'entexthigh'),
-        'entextlow': Service(PROTOCOLS['tcp'], 12004, 'entextlow'),
-        'entextmed': Service(PROTOCOLS['tcp'], 12003, 'entextmed'),
-        'entextnetwk': Service(PROTOCOLS['tcp'], 12001, 'entextnetwk'),
-        'entextxid': Service(PROTOCOLS['tcp'], 12000, 'entextxid'),
-        'entomb': Service(PROTOCOLS['tcp'], 775, 'entomb'),
-        'entp': Service(PROTOCOLS['tcp'], 1865, 'entp'),
-        'entrust-aaas': Service(PROTOCOLS['tcp'], 680, 'entrust-aaas'),
-        'entrust-aams': Service(PROTOCOLS['tcp'], 681, 'entrust-aams'),
-        'entrust-ash': Service(PROTOCOLS['tcp'], 710, 'entrust-ash'),
-        'entrust-kmsh': Service(PROTOCOLS['tcp'], 709, 'entrust-kmsh'),
-        'entrust-sps': Service(PROTOCOLS['tcp'], 640, 'entrust-sps'),
-        'entrusttime': Service(PROTOCOLS['tcp'], 309, 'entrusttime'),
-        'eoss': Service(PROTOCOLS['tcp'], 1210, 'eoss'),
-        'ep-nsp': Service(PROTOCOLS['tcp'], 3621, 'ep-nsp'),
-        'ep-pcp': Service(PROTOCOLS['tcp'], 3620, 'ep-pcp'),
-        'epc': Service(PROTOCOLS['tcp'], 1267, 'epc'),
-        'epicon': Service(PROTOCOLS['tcp'], 2912, 'epicon'),
-        'epl-slp': Service(PROTOCOLS['tcp'], 3819, 'epl-slp'),
-        'epmap': Service(PROTOCOLS['tcp'], 135, 'epmap'),
-        'epmd': Service(PROTOCOLS['tcp'], 4369, 'epmd'),
-        'epncdp2': Service(PROTOCOLS['tcp'], 3259, 'epncdp2'),
-        'epnsdp': Service(PROTOCOLS['tcp'], 2051, 'epnsdp'),
-        'eportcomm': Service(PROTOCOLS['tcp'], 4666, 'eportcomm'),
-        'eportcommdata': Service(PROTOCOLS['tcp'], 4669, 'eportcommdata'),
-        'epp': Service(PROTOCOLS['tcp'], 3044, 'epp'),
-        'eppc': Service(PROTOCOLS['tcp'], 3031, 'eppc'),
-        'ept-machine': Service(PROTOCOLS['tcp'], 3628, 'ept-machine'),
-        'eq-office-4940': Service(PROTOCOLS['tcp'], 4940, 'eq-office-4940'),
-        'eq-office-4941': Service(PROTOCOLS['tcp'], 4941, 'eq-office-4941'),
-        'eq-office-4942': Service(PROTOCOLS['tcp'], 4942, 'eq-office-4942'),
-        'eq3-update': Service(PROTOCOLS['tcp'], 43439, 'eq3-update'),
-        'equationbuilder': Service(PROTOCOLS['tcp'], 1351, 'equationbuilder'),
-        'ergolight': Service(PROTOCOLS['tcp'], 2109, 'ergolight'),
-        'eristwoguns': Service(PROTOCOLS['tcp'], 2650, 'eristwoguns'),
-        'erp-scale': Service(PROTOCOLS['tcp'], 5135, 'erp-scale'),
-        'erpc': Service(PROTOCOLS['tcp'], 121, 'erpc'),
-        'erunbook-agent': Service(PROTOCOLS['tcp'], 9616, 'erunbook-agent'),
-        'erunbook-server': Service(PROTOCOLS['tcp'], 9617, 'erunbook-server'),
-        'erunbook_agent': Service(PROTOCOLS['tcp'], 9616, 'erunbook_agent'),
-        'erunbook_server': Service(PROTOCOLS['tcp'], 9617, 'erunbook_server'),
-        'es-elmd': Service(PROTOCOLS['tcp'], 1822, 'es-elmd'),
-        'esbroker': Service(PROTOCOLS['tcp'], 1342, 'esbroker'),
-        'escale': Service(PROTOCOLS['tcp'], 3679, 'escale'),
-        'escp-ip': Service(PROTOCOLS['tcp'], 621, 'escp-ip'),
-        'escvpnet': Service(PROTOCOLS['tcp'], 3629, 'escvpnet'),
-        'eserver-pap': Service(PROTOCOLS['tcp'], 3666, 'eserver-pap'),
-        'esimport': Service(PROTOCOLS['tcp'], 3564, 'esimport'),
-        'esinstall': Service(PROTOCOLS['tcp'], 5599, 'esinstall'),
-        'esip': Service(PROTOCOLS['tcp'], 2950, 'esip'),
-        'esl-lm': Service(PROTOCOLS['tcp'], 1455, 'esl-lm'),
-        'esmagent': Service(PROTOCOLS['tcp'], 5601, 'esmagent'),
-        'esmmanager': Service(PROTOCOLS['tcp'], 5600, 'esmmanager'),
-        'esnm-zoning': Service(PROTOCOLS['tcp'], 4023, 'esnm-zoning'),
-        'esp-encap': Service(PROTOCOLS['tcp'], 2797, 'esp-encap'),
-        'esp-lm': Service(PROTOCOLS['tcp'], 3383, 'esp-lm'),
-        'espeech': Service(PROTOCOLS['tcp'], 8416, 'espeech'),
-        'espeech-rtp': Service(PROTOCOLS['tcp'], 8417, 'espeech-rtp'),
-        'esps-portal': Service(PROTOCOLS['tcp'], 2867, 'esps-portal'),
-        'esri-sde': Service(PROTOCOLS['tcp'], 5151, 'esri-sde'),
-        'esri_sde': Service(PROTOCOLS['tcp'], 5151, 'esri_sde'),
-        'esro-emsdp': Service(PROTOCOLS['tcp'], 642, 'esro-emsdp'),
-        'esro-gen': Service(PROTOCOLS['tcp'], 259, 'esro-gen'),
-        'essbase': Service(PROTOCOLS['tcp'], 1423, 'essbase'),
-        'essp': Service(PROTOCOLS['tcp'], 2969, 'essp'),
-        'essweb-gw': Service(PROTOCOLS['tcp'], 1772, 'essweb-gw'),
-        'estamp': Service(PROTOCOLS['tcp'], 1982, 'estamp'),
-        'etb4j': Service(PROTOCOLS['tcp'], 16309, 'etb4j'),
-        'etc-control': Service(PROTOCOLS['tcp'], 6107, 'etc-control'),
-        'etcd-client': Service(PROTOCOLS['tcp'], 2379, 'etcd-client'),
-        'etcd-server': Service(PROTOCOLS['tcp'], 2380, 'etcd-server'),
-        'etebac5': Service(PROTOCOLS['tcp'], 1216, 'etebac5'),
-        'etftp': Service(PROTOCOLS['tcp'], 1818, 'etftp'),
-        'ethercat': Service(PROTOCOLS['tcp'], 34980, 'ethercat'),
-        'ethernet-ip-1': Service(PROTOCOLS['tcp'], 2222, 'ethernet-ip-1'),
-        'ethernet-ip-2': Service(PROTOCOLS['tcp'], 44818, 'ethernet-ip-2'),
-        'ethernet-ip-s': Service(PROTOCOLS['tcp'], 2221, 'ethernet-ip-s'),
-        'ethernet/ip-1': Service(PROTOCOLS['tcp'], 2222, 'ethernet/ip-1'),
-        'ethernet/ip-2': Service(PROTOCOLS['tcp'], 44818, 'ethernet/ip-2'),
-        'ethoscan': Service(PROTOCOLS['tcp'], 6935, 'ethoscan'),
-        'etlservicemgr': Service(PROTOCOLS['tcp'], 9001, 'etlservicemgr'),
-        'etp': Service(PROTOCOLS['tcp'], 1798, 'etp'),
-        'ets': Service(PROTOCOLS['tcp'], 1569, 'ets'),
-        'eudora-set': Service(PROTOCOLS['tcp'], 592, 'eudora-set'),
-        'ev-services': Service(PROTOCOLS['tcp'], 5114, 'ev-services'),
-        'evb-elm': Service(PROTOCOLS['tcp'], 1504, 'evb-elm'),
-        'event-listener': Service(PROTOCOLS['tcp'], 3017, 'event-listener'),
-        'event-port': Service(PROTOCOLS['tcp'], 2069, 'event-port'),
-        'event_listener': Service(PROTOCOLS['tcp'], 3017, 'event_listener'),
-        'everydayrc': Service(PROTOCOLS['tcp'], 2782, 'everydayrc'),
-        'evm': Service(PROTOCOLS['tcp'], 1139, 'evm'),
-        'evtp': Service(PROTOCOLS['tcp'], 2834, 'evtp'),
-        'evtp-data': Service(PROTOCOLS['tcp'], 2835, 'evtp-data'),
-        'ew-mgmt': Service(PROTOCOLS['tcp'], 43440, 'ew-mgmt'),
-        'ewall': Service(PROTOCOLS['tcp'], 1328, 'ewall'),
-        'ewcappsrv': Service(PROTOCOLS['tcp'], 1876, 'ewcappsrv'),
-        'ewctsp': Service(PROTOCOLS['tcp'], 6066, 'ewctsp'),
-        'ewdgs': Service(PROTOCOLS['tcp'], 4092, 'ewdgs'),
-        'ewinstaller': Service(PROTOCOLS['tcp'], 4091, 'ewinstaller'),
-        'ewnn': Service(PROTOCOLS['tcp'], 2674, 'ewnn'),
-        'exapt-lmgr': Service(PROTOCOLS['tcp'], 3759, 'exapt-lmgr'),
-        'exasoftport1': Service(PROTOCOLS['tcp'], 3920, 'exasoftport1'),
-        'exbit-escp': Service(PROTOCOLS['tcp'], 1316, 'exbit-escp'),
-        'exce': Service(PROTOCOLS['tcp'], 2769, 'exce'),
-        'excerpt': Service(PROTOCOLS['tcp'], 5400, 'excerpt'),
-        'excerpts': Service(PROTOCOLS['tcp'], 5401, 'excerpts'),
-        'excw': Service(PROTOCOLS['tcp'], 1271, 'excw'),
-        'exec': Service(PROTOCOLS['tcp'], 512, 'exec'),
-        'exlm-agent': Service(PROTOCOLS['tcp'], 3002, 'exlm-agent'),
-        'exoconfig': Service(PROTOCOLS['tcp'], 26487, 'exoconfig'),
-        'exoline-tcp': Service(PROTOCOLS['tcp'], 26486, 'exoline-tcp'),
-        'exonet': Service(PROTOCOLS['tcp'], 26489, 'exonet'),
-        'exp1': Service(PROTOCOLS['tcp'], 1021, 'exp1'),
-        'exp2': Service(PROTOCOLS['tcp'], 1022, 'exp2'),
-        'expresspay': Service(PROTOCOLS['tcp'], 2755, 'expresspay'),
-        'extensis': Service(PROTOCOLS['tcp'], 2666, 'extensis'),
-        'eye2eye': Service(PROTOCOLS['tcp'], 1948, 'eye2eye'),
-        'eyelink': Service(PROTOCOLS['tcp'], 589, 'eyelink'),
-        'eyetv': Service(PROTOCOLS['tcp'], 2170, 'eyetv'),
-        'ezmeeting': Service(PROTOCOLS['tcp'], 26261, 'ezmeeting'),
-        'ezmeeting-2': Service(PROTOCOLS['tcp'], 10101, 'ezmeeting-2'),
-        'ezmessagesrv': Service(PROTOCOLS['tcp'], 4085, 'ezmessagesrv'),
-        'ezproxy': Service(PROTOCOLS['tcp'], 26260, 'ezproxy'),
-        'ezproxy-2': Service(PROTOCOLS['tcp'], 10102, 'ezproxy-2'),
-        'ezrelay': Service(PROTOCOLS['tcp'], 10103, 'ezrelay'),
-        'f5-globalsite': Service(PROTOCOLS['tcp'], 2792, 'f5-globalsite'),
-        'f5-iquery': Service(PROTOCOLS['tcp'], 4353, 'f5-iquery'),
-        'fac-restore': Service(PROTOCOLS['tcp'], 5582, 'fac-restore'),
-        'facelink': Service(PROTOCOLS['tcp'], 1915, 'facelink'),
-        'facilityview': Service(PROTOCOLS['tcp'], 1561, 'facilityview'),
-        'facsys-ntp': Service(PROTOCOLS['tcp'], 2514, 'facsys-ntp'),
-        'facsys-router': Service(PROTOCOLS['tcp'], 2515, 'facsys-router'),
-        'fagordnc': Service(PROTOCOLS['tcp'], 3873, 'fagordnc'),
-        'fairview': Service(PROTOCOLS['tcp'], 38202, 'fairview'),
-        'famdc': Service(PROTOCOLS['tcp'], 10081, 'famdc'),
-        'farenet': Service(PROTOCOLS['tcp'], 5557, 'farenet'),
-        'fast-rem-serv': Service(PROTOCOLS['tcp'], 2495, 'fast-rem-serv'),
-        'fastlynx': Service(PROTOCOLS['tcp'], 2689, 'fastlynx'),
-        'fatpipe': Service(PROTOCOLS['tcp'], 3353, 'fatpipe'),
-        'fatserv': Service(PROTOCOLS['tcp'], 347, 'fatserv'),
-        'faxcomservice': Service(PROTOCOLS['tcp'], 6417, 'faxcomservice'),
-        'faximum': Service(PROTOCOLS['tcp'], 7437, 'faximum'),
-        'faxportwinport': Service(PROTOCOLS['tcp'], 1620, 'faxportwinport'),
-        'faxstfx-port': Service(PROTOCOLS['tcp'], 3684, 'faxstfx-port'),
-        'fazzt-admin': Service(PROTOCOLS['tcp'], 4039, 'fazzt-admin'),
-        'fazzt-ptp': Service(PROTOCOLS['tcp'], 4038, 'fazzt-ptp'),
-        'fc-cli': Service(PROTOCOLS['tcp'], 1371, 'fc-cli'),
-        'fc-faultnotify': Service(PROTOCOLS['tcp'], 2819, 'fc-faultnotify'),
-        'fc-ser': Service(PROTOCOLS['tcp'], 1372, 'fc-ser'),
-        'fcip-port': Service(PROTOCOLS['tcp'], 3225, 'fcip-port'),
-        'fcis': Service(PROTOCOLS['tcp'], 4727, 'fcis'),
-        'fcmsys': Service(PROTOCOLS['tcp'], 2344, 'fcmsys'),
-        'fcopy-server': Service(PROTOCOLS['tcp'], 5745, 'fcopy-server'),
-        'fcopys-server': Service(PROTOCOLS['tcp'], 5746, 'fcopys-server'),
-        'fcp': Service(PROTOCOLS['tcp'], 510, 'fcp'),
-        'fcp-addr-srvr1': Service(PROTOCOLS['tcp'], 5500, 'fcp-addr-srvr1'),
-        'fcp-addr-srvr2': Service(PROTOCOLS['tcp'], 5501, 'fcp-addr-srvr2'),
-        'fcp-cics-gw1': Service(PROTOCOLS['tcp'], 5504, 'fcp-cics-gw1'),
-        'fcp-srvr-inst1': Service(PROTOCOLS['tcp'], 5502, 'fcp-srvr-inst1'),
-        'fcp-srvr-inst2': Service(PROTOCOLS['tcp'], 5503, 'fcp-srvr-inst2'),
-        'fcp-udp': Service(PROTOCOLS['tcp'], 810, 'fcp-udp'),
-        'fdt-rcatp': Service(PROTOCOLS['tcp'], 4320, 'fdt-rcatp'),
-        'fdtracks': Service(PROTOCOLS['tcp'], 5579, 'fdtracks'),
-        'febooti-aw': Service(PROTOCOLS['tcp'], 36524, 'febooti-aw'),
-        'feitianrockey': Service(PROTOCOLS['tcp'], 3152, 'feitianrockey'),
-        'femis': Service(PROTOCOLS['tcp'], 1776, 'femis'),
-        'ferrari-foam': Service(PROTOCOLS['tcp'], 3216, 'ferrari-foam'),
-        'ff-annunc': Service(PROTOCOLS['tcp'], 1089, 'ff-annunc'),
-        'ff-fms': Service(PROTOCOLS['tcp'], 1090, 'ff-fms'),
-        'ff-lr-port': Service(PROTOCOLS['tcp'], 3622, 'ff-lr-port'),
-        'ff-sm': Service(PROTOCOLS['tcp'], 1091, 'ff-sm'),
-        'ffserver': Service(PROTOCOLS['tcp'], 3825, 'ffserver'),
-        'fg-fps': Service(PROTOCOLS['tcp'], 3293, 'fg-fps'),
-        'fg-gip': Service(PROTOCOLS['tcp'], 3294, 'fg-gip'),
-        'fg-sysupdate': Service(PROTOCOLS['tcp'], 6550, 'fg-sysupdate'),
-        'fhc': Service(PROTOCOLS['tcp'], 1499, 'fhc'),
-        'fhsp': Service(PROTOCOLS['tcp'], 1807, 'fhsp'),
-        'fibotrader-com': Service(PROTOCOLS['tcp'], 6715, 'fibotrader-com'),
-        'filecast': Service(PROTOCOLS['tcp'], 3401, 'filecast'),
-        'filemq': Service(PROTOCOLS['tcp'], 5670, 'filemq'),
-        'filenet-cm': Service(PROTOCOLS['tcp'], 32773, 'filenet-cm'),
-        'filenet-nch': Service(PROTOCOLS['tcp'], 32770, 'filenet-nch'),
-        'filenet-obrok': Service(PROTOCOLS['tcp'], 32777, 'filenet-obrok'),
-        'filenet-pa': Service(PROTOCOLS['tcp'], 32772, 'filenet-pa'),
-        'filenet-pch': Service(PROTOCOLS['tcp'], 32775, 'filenet-pch'),
-        'filenet-peior': Service(PROTOCOLS['tcp'], 32776, 'filenet-peior'),
-        'filenet-powsrm': Service(PROTOCOLS['tcp'], 32767, 'filenet-powsrm'),
-        'filenet-re': Service(PROTOCOLS['tcp'], 32774, 'filenet-re'),
-        'filenet-rmi': Service(PROTOCOLS['tcp'], 32771, 'filenet-rmi'),
-        'filenet-rpc': Service(PROTOCOLS['tcp'], 32769, 'filenet-rpc'),
-        'filenet-tms': Service(PROTOCOLS['tcp'], 32768, 'filenet-tms'),
-        'filesphere': Service(PROTOCOLS['tcp'], 24242, 'filesphere'),
-        'filex-lport': Service(PROTOCOLS['tcp'], 1887, 'filex-lport'),
-        'find': Service(PROTOCOLS['tcp'], 24922, 'find'),
-        'findviatv': Service(PROTOCOLS['tcp'], 3350, 'findviatv'),
-        'finger': Service(PROTOCOLS['tcp'], 79, 'finger'),
-        'finisar': Service(PROTOCOLS['tcp'], 4682, 'finisar'),
-        'finle-lm': Service(PROTOCOLS['tcp'], 1784, 'finle-lm'),
-        'fintrx': Service(PROTOCOLS['tcp'], 3787, 'fintrx'),
-        'fio-cmgmt': Service(PROTOCOLS['tcp'], 9051, 'fio-cmgmt'),
-        'fiorano-msgsvc': Service(PROTOCOLS['tcp'], 1856, 'fiorano-msgsvc'),
-        'fiorano-rtrsvc': Service(PROTOCOLS['tcp'], 1855, 'fiorano-rtrsvc'),
-        'firefox': Service(PROTOCOLS['tcp'], 1689, 'firefox'),
-        'firemonrcc': Service(PROTOCOLS['tcp'], 3192, 'firemonrcc'),
-        'firepower': Service(PROTOCOLS['tcp'], 2615, 'firepower'),
-        'first-defense': Service(PROTOCOLS['tcp'], 1232, 'first-defense'),
-        'firstcall42': Service(PROTOCOLS['tcp'], 2673, 'firstcall42'),
-        'fis': Service(PROTOCOLS['tcp'], 5912, 'fis'),
-        'fisa-svc': Service(PROTOCOLS['tcp'], 7018, 'fisa-svc'),
-        'fiveacross': Service(PROTOCOLS['tcp'], 1193, 'fiveacross'),
-        'fj-hdnet': Service(PROTOCOLS['tcp'], 1717, 'fj-hdnet'),
-        'fjappmgrbulk': Service(PROTOCOLS['tcp'], 2510, 'fjappmgrbulk'),
-        'fjcp': Service(PROTOCOLS['tcp'], 3648, 'fjcp'),
-        'fjdmimgr': Service(PROTOCOLS['tcp'], 9374, 'fjdmimgr'),
-        'fjdocdist': Service(PROTOCOLS['tcp'], 1848, 'fjdocdist'),
-        'fjhpjp': Service(PROTOCOLS['tcp'], 3067, 'fjhpjp'),
-        'fjicl-tep-a': Service(PROTOCOLS['tcp'], 1901, 'fjicl-tep-a'),
-        'fjicl-tep-b': Service(PROTOCOLS['tcp'], 1902, 'fjicl-tep-b'),
-        'fjicl-tep-c': Service(PROTOCOLS['tcp'], 1904, 'fjicl-tep-c'),
-        'fjinvmgr': Service(PROTOCOLS['tcp'], 9396, 'fjinvmgr'),
-        'fjippol-cnsl': Service(PROTOCOLS['tcp'], 2749, 'fjippol-cnsl'),
-        'fjippol-polsvr': Service(PROTOCOLS['tcp'], 2748, 'fjippol-polsvr'),
-        'fjippol-port1': Service(PROTOCOLS['tcp'], 2750, 'fjippol-port1'),
-        'fjippol-port2': Service(PROTOCOLS['tcp'], 2751, 'fjippol-port2'),
-        'fjippol-swrly': Service(PROTOCOLS['tcp'], 2747, 'fjippol-swrly'),
-        'fjitsuappmgr': Service(PROTOCOLS['tcp'], 2425, 'fjitsuappmgr'),
-        'fjmpcm': Service(PROTOCOLS['tcp'], 2975, 'fjmpcm'),
-        'fjmpjps': Service(PROTOCOLS['tcp'], 1873, 'fjmpjps'),
-        'fjmpss': Service(PROTOCOLS['tcp'], 2509, 'fjmpss'),
-        'fjsv-gssagt': Service(PROTOCOLS['tcp'], 3035, 'fjsv-gssagt'),
-        'fjsvmpor': Service(PROTOCOLS['tcp'], 2946, 'fjsvmpor'),
-        'fjswapsnp': Service(PROTOCOLS['tcp'], 1874, 'fjswapsnp'),
-        'fksp-audit': Service(PROTOCOLS['tcp'], 3729, 'fksp-audit'),
-        'flamenco-proxy': Service(PROTOCOLS['tcp'], 3210, 'flamenco-proxy'),
-        'flashfiler': Service(PROTOCOLS['tcp'], 24677, 'flashfiler'),
-        'flashmsg': Service(PROTOCOLS['tcp'], 2884, 'flashmsg'),
-        'flcrs': Service(PROTOCOLS['tcp'], 5638, 'flcrs'),
-        'flexlm': Service(PROTOCOLS['tcp'], 744, 'flexlm'),
-        'flirtmitmir': Service(PROTOCOLS['tcp'], 3840, 'flirtmitmir'),
-        'fln-spx': Service(PROTOCOLS['tcp'], 221, 'fln-spx'),
-        'florence': Service(PROTOCOLS['tcp'], 1228, 'florence'),
-        'flr-agent': Service(PROTOCOLS['tcp'], 4901, 'flr-agent'),
-        'flr_agent': Service(PROTOCOLS['tcp'], 4901, 'flr_agent'),
-        'flukeserver': Service(PROTOCOLS['tcp'], 2359, 'flukeserver'),
-        'fly': Service(PROTOCOLS['tcp'], 4396, 'fly'),
-        'fmp': Service(PROTOCOLS['tcp'], 4745, 'fmp'),
-        'fmpro-fdal': Service(PROTOCOLS['tcp'], 2399, 'fmpro-fdal'),
-        'fmpro-internal': Service(PROTOCOLS['tcp'], 5003, 'fmpro-internal'),
-        'fmpro-v6': Service(PROTOCOLS['tcp'], 5013, 'fmpro-v6'),
-        'fmsas': Service(PROTOCOLS['tcp'], 16000, 'fmsas'),
-        'fmsascon': Service(PROTOCOLS['tcp'], 16001, 'fmsascon'),
-        'fmtp': Service(PROTOCOLS['tcp'], 8500, 'fmtp'),
-        'fmwp': Service(PROTOCOLS['tcp'], 5015, 'fmwp'),
-        'fnet-remote-ui': Service(PROTOCOLS['tcp'], 1174, 'fnet-remote-ui'),
-        'fodms': Service(PROTOCOLS['tcp'], 7200, 'fodms'),
-        'foliocorp': Service(PROTOCOLS['tcp'], 2242, 'foliocorp'),
-        'font-service': Service(PROTOCOLS['tcp'], 7100, 'font-service'),
-        'foresyte-clear': Service(PROTOCOLS['tcp'], 5407, 'foresyte-clear'),
-        'foresyte-sec': Service(PROTOCOLS['tcp'], 5408, 'foresyte-sec'),
-        'fotogcad': Service(PROTOCOLS['tcp'], 3878, 'fotogcad'),
-        'found': Service(PROTOCOLS['tcp'], 4411, 'found'),
-        'fpitp': Service(PROTOCOLS['tcp'], 1045, 'fpitp'),
-        'fpo-fns': Service(PROTOCOLS['tcp'], 1066, 'fpo-fns'),
-        'fprams': Service(PROTOCOLS['tcp'], 4122, 'fprams'),
-        'frc-hicp': Service(PROTOCOLS['tcp'], 7244, 'frc-hicp'),
-        'frcs': Service(PROTOCOLS['tcp'], 4915, 'frcs'),
-        'freeciv': Service(PROTOCOLS['tcp'], 5556, 'freeciv'),
-        'freezexservice': Service(PROTOCOLS['tcp'], 7726, 'freezexservice'),
-        'fronet': Service(PROTOCOLS['tcp'], 4130, 'fronet'),
-        'fryeserv': Service(PROTOCOLS['tcp'], 2788, 'fryeserv'),
-        'fs-agent': Service(PROTOCOLS['tcp'], 8042, 'fs-agent'),
-        'fs-mgmt': Service(PROTOCOLS['tcp'], 8044, 'fs-mgmt'),
-        'fs-qos': Service(PROTOCOLS['tcp'], 41111, 'fs-qos'),
-        'fs-rh-srv': Service(PROTOCOLS['tcp'], 3488, 'fs-rh-srv'),
-        'fs-server': Service(PROTOCOLS['tcp'], 8043, 'fs-server'),
-        'fsc-port': Service(PROTOCOLS['tcp'], 9217, 'fsc-port'),
-        'fse': Service(PROTOCOLS['tcp'], 7394, 'fse'),
-        'fsportmap': Service(PROTOCOLS['tcp'], 4349, 'fsportmap'),
-        'fsr': Service(PROTOCOLS['tcp'], 7164, 'fsr'),
-        'ft-role': Service(PROTOCOLS['tcp'], 2429, 'ft-role'),
-        'ftnmtp': Service(PROTOCOLS['tcp'], 8502, 'ftnmtp'),
-        'ftp': Service(PROTOCOLS['tcp'], 21, 'ftp'),
-        'ftp-agent': Service(PROTOCOLS['tcp'], 574, 'ftp-agent'),
-        'ftp-data': Service(PROTOCOLS['tcp'], 20, 'ftp-data'),
-        'ftps': Service(PROTOCOLS['tcp'], 990, 'ftps'),
-        'ftps-data': Service(PROTOCOLS['tcp'], 989, 'ftps-data'),
-        'ftranhc': Service(PROTOCOLS['tcp'], 1105, 'ftranhc'),
-        'ftrapid-1': Service(PROTOCOLS['tcp'], 1746, 'ftrapid-1'),
-        'ftrapid-2': Service(PROTOCOLS['tcp'], 1747, 'ftrapid-2'),
-        'ftsrv': Service(PROTOCOLS['tcp'], 1359, 'ftsrv'),
-        'fujitsu-dev': Service(PROTOCOLS['tcp'], 747, 'fujitsu-dev'),
-        'fujitsu-dtc': Service(PROTOCOLS['tcp'], 1513, 'fujitsu-dtc'),
-        'fujitsu-dtcns': Service(PROTOCOLS['tcp'], 1514, 'fujitsu-dtcns'),
-        'fujitsu-mmpdc': Service(PROTOCOLS['tcp'], 1657, 'fujitsu-mmpdc'),
-        'fujitsu-neat': Service(PROTOCOLS['tcp'], 3382, 'fujitsu-neat'),
-        'funk-dialout': Service(PROTOCOLS['tcp'], 2909, 'funk-dialout'),
-        'funk-license': Service(PROTOCOLS['tcp'], 1787, 'funk-license'),
-        'funk-logger': Service(PROTOCOLS['tcp'], 1786, 'funk-logger'),
-        'funkproxy': Service(PROTOCOLS['tcp'], 1505, 'funkproxy'),
-        'fuscript': Service(PROTOCOLS['tcp'], 1144, 'fuscript'),
-        'futrix': Service(PROTOCOLS['tcp'], 2358, 'futrix'),
-        'fxaengine-net': Service(PROTOCOLS['tcp'], 3402, 'fxaengine-net'),
-        'fxp': Service(PROTOCOLS['tcp'], 2849, 'fxp'),
-        'fxuptp': Service(PROTOCOLS['tcp'], 19539, 'fxuptp'),
-        'fyre-messanger': Service(PROTOCOLS['tcp'], 2731, 'fyre-messanger'),
-        'g-talk': Service(PROTOCOLS['tcp'], 2421, 'g-talk'),
-        'g2tag': Service(PROTOCOLS['tcp'], 4110, 'g2tag'),
-        'g5m': Service(PROTOCOLS['tcp'], 2732, 'g5m'),
-        'gacp': Service(PROTOCOLS['tcp'], 190, 'gacp'),
-        'gadgetgate1way': Service(PROTOCOLS['tcp'], 2677, 'gadgetgate1way'),
-        'gadgetgate2way': Service(PROTOCOLS['tcp'], 2678, 'gadgetgate2way'),
-        'gadugadu': Service(PROTOCOLS['tcp'], 8074, 'gadugadu'),
-        'gaia': Service(PROTOCOLS['tcp'], 4340, 'gaia'),
-        'galaxy-network': Service(PROTOCOLS['tcp'], 5235, 'galaxy-network'),
-        'galaxy-server': Service(PROTOCOLS['tcp'], 3051, 'galaxy-server'),
-        'galaxy4d': Service(PROTOCOLS['tcp'], 8881, 'galaxy4d'),
-        'galaxy7-data': Service(PROTOCOLS['tcp'], 38201, 'galaxy7-data'),
-        'galileolog': Service(PROTOCOLS['tcp'], 3520, 'galileolog'),
-        'gamegen1': Service(PROTOCOLS['tcp'], 1738, 'gamegen1'),
-        'gamelobby': Service(PROTOCOLS['tcp'], 2914, 'gamelobby'),
-        'gamesmith-port': Service(PROTOCOLS['tcp'], 31765, 'gamesmith-port'),
-        'gammafetchsvr': Service(PROTOCOLS['tcp'], 1859, 'gammafetchsvr'),
-        'gandalf-lm': Service(PROTOCOLS['tcp'], 1421, 'gandalf-lm'),
-        'gap': Service(PROTOCOLS['tcp'], 10800, 'gap'),
-        'garcon': Service(PROTOCOLS['tcp'], 999, 'garcon'),
-        'garmin-marine': Service(PROTOCOLS['tcp'], 8322, 'garmin-marine'),
-        'gat-lmd': Service(PROTOCOLS['tcp'], 1708, 'gat-lmd'),
-        'gbjd816': Service(PROTOCOLS['tcp'], 2626, 'gbjd816'),
-        'gbmt-stars': Service(PROTOCOLS['tcp'], 3912, 'gbmt-stars'),
-        'gbs-smp': Service(PROTOCOLS['tcp'], 3762, 'gbs-smp'),
-        'gbs-stp': Service(PROTOCOLS['tcp'], 3484, 'gbs-stp'),
-        'gc-config': Service(PROTOCOLS['tcp'], 3436, 'gc-config'),
-        'gcm-app': Service(PROTOCOLS['tcp'], 14145, 'gcm-app'),
-        'gcmonitor': Service(PROTOCOLS['tcp'], 2660, 'gcmonitor'),
-        'gcp-rphy': Service(PROTOCOLS['tcp'], 8190, 'gcp-rphy'),
-        'gcsp': Service(PROTOCOLS['tcp'], 3429, 'gcsp'),
-        'gdbremote': Service(PROTOCOLS['tcp'], 2159, 'gdbremote'),
-        'gdoi': Service(PROTOCOLS['tcp'], 848, 'gdoi'),
-        'gdomap': Service(PROTOCOLS['tcp'], 538, 'gdomap'),
-        'gdp-port': Service(PROTOCOLS['tcp'], 1997, 'gdp-port'),
-        'gdrive-sync': Service(PROTOCOLS['tcp'], 37483, 'gdrive-sync'),
-        'gds-adppiw-db': Service(PROTOCOLS['tcp'], 4550, 'gds-adppiw-db'),
-        'gds-db': Service(PROTOCOLS['tcp'], 3050, 'gds-db'),
-        'gds_db': Service(PROTOCOLS['tcp'], 3050, 'gds_db'),
-        'gearman': Service(PROTOCOLS['tcp'], 4730, 'gearman'),
-        'gemini-lm': Service(PROTOCOLS['tcp'], 1590, 'gemini-lm'),
-        'geneous': Service(PROTOCOLS['tcp'], 3381, 'geneous'),
-        'generalsync': Service(PROTOCOLS['tcp'], 7962, 'generalsync'),
-        'genie': Service(PROTOCOLS['tcp'], 402, 'genie'),
-        'genie-lm': Service(PROTOCOLS['tcp'], 1453, 'genie-lm'),
-        'genisar-port': Service(PROTOCOLS['tcp'], 3475, 'genisar-port'),
-        'geniuslm': Service(PROTOCOLS['tcp'], 3005, 'geniuslm'),
-        'genrad-mux': Service(PROTOCOLS['tcp'], 176, 'genrad-mux'),
-        'genstat': Service(PROTOCOLS['tcp'], 7283, 'genstat'),
-        'geognosis': Service(PROTOCOLS['tcp'], 4326, 'geognosis'),
-        'geognosisman': Service(PROTOCOLS['tcp'], 4325, 'geognosisman'),
-        'geolocate': Service(PROTOCOLS['tcp'], 3108, 'geolocate'),
-        'gerhcs': Service(PROTOCOLS['tcp'], 4985, 'gerhcs'),
-        'gf': Service(PROTOCOLS['tcp'], 3530, 'gf'),
-        'ggf-ncp': Service(PROTOCOLS['tcp'], 678, 'ggf-ncp'),
-        'ggz': Service(PROTOCOLS['tcp'], 5688, 'ggz'),
-        'giga-pocket': Service(PROTOCOLS['tcp'], 3862, 'giga-pocket'),
-        'gilatskysurfer': Service(PROTOCOLS['tcp'], 3013, 'gilatskysurfer'),
-        'ginad': Service(PROTOCOLS['tcp'], 634, 'ginad'),
-        'giop': Service(PROTOCOLS['tcp'], 2481, 'giop'),
-        'giop-ssl': Service(PROTOCOLS['tcp'], 2482, 'giop-ssl'),
-        'git': Service(PROTOCOLS['tcp'], 9418, 'git'),
-        'glbp': Service(PROTOCOLS['tcp'], 3222, 'glbp'),
-        'gld': Service(PROTOCOLS['tcp'], 6267, 'gld'),
-        'glishd': Service(PROTOCOLS['tcp'], 2833, 'glishd'),
-        'global-cd-port': Service(PROTOCOLS['tcp'], 3229, 'global-cd-port'),
-        'global-dtserv': Service(PROTOCOLS['tcp'], 1774, 'global-dtserv'),
-        'global-wlink': Service(PROTOCOLS['tcp'], 1909, 'global-wlink'),
-        'globe': Service(PROTOCOLS['tcp'], 2002, 'globe'),
-        'globecast-id': Service(PROTOCOLS['tcp'], 6109, 'globecast-id'),
-        'globmsgsvc': Service(PROTOCOLS['tcp'], 2519, 'globmsgsvc'),
-        'glogger': Service(PROTOCOLS['tcp'], 2033, 'glogger'),
-        'glrpc': Service(PROTOCOLS['tcp'], 9080, 'glrpc'),
-        'gmrupdateserv': Service(PROTOCOLS['tcp'], 1070, 'gmrupdateserv'),
-        'gntp': Service(PROTOCOLS['tcp'], 23053, 'gntp'),
-        'gnunet': Service(PROTOCOLS['tcp'], 2086, 'gnunet'),
-        'gnutella-rtr': Service(PROTOCOLS['tcp'], 6347, 'gnutella-rtr'),
-        'gnutella-svc': Service(PROTOCOLS['tcp'], 6346, 'gnutella-svc'),
-        'go-login': Service(PROTOCOLS['tcp'], 491, 'go-login'),
-        'goahead-fldup': Service(PROTOCOLS['tcp'], 3057, 'goahead-fldup'),
-        'goldleaf-licman': Service(PROTOCOLS['tcp'], 1401, 'goldleaf-licman'),
-        'golem': Service(PROTOCOLS['tcp'], 9005, 'golem'),
-        'gopher': Service(PROTOCOLS['tcp'], 70, 'gopher'),
-        'gotodevice': Service(PROTOCOLS['tcp'], 2217, 'gotodevice'),
-        'gpfs': Service(PROTOCOLS['tcp'], 1191, 'gpfs'),
-        'gppitnp': Service(PROTOCOLS['tcp'], 103, 'gppitnp'),
-        'gprs-cube': Service(PROTOCOLS['tcp'], 3751, 'gprs-cube'),
-        'gprs-data': Service(PROTOCOLS['tcp'], 3386, 'gprs-data'),
-        'gpsd': Service(PROTOCOLS['tcp'], 2947, 'gpsd'),
-        'gradecam': Service(PROTOCOLS['tcp'], 5117, 'gradecam'),
-        'graphics': Service(PROTOCOLS['tcp'], 41, 'graphics'),
-        'grasp': Service(PROTOCOLS['tcp'], 7017, 'grasp'),
-        'grcmp': Service(PROTOCOLS['tcp'], 9122, 'grcmp'),
-        'grcp': Service(PROTOCOLS['tcp'], 9123, 'grcp'),
-        'grf-port': Service(PROTOCOLS['tcp'], 3757, 'grf-port'),
-        'grid': Service(PROTOCOLS['tcp'], 6268, 'grid'),
-        'grid-alt': Service(PROTOCOLS['tcp'], 6269, 'grid-alt'),
-        'gridgen-elmd': Service(PROTOCOLS['tcp'], 1542, 'gridgen-elmd'),
-        'griffin': Service(PROTOCOLS['tcp'], 2458, 'griffin'),
-        'gris': Service(PROTOCOLS['tcp'], 2135, 'gris'),
-        'groove': Service(PROTOCOLS['tcp'], 2492, 'groove'),
-        'groove-dpp': Service(PROTOCOLS['tcp'], 1211, 'groove-dpp'),
-        'groupwise': Service(PROTOCOLS['tcp'], 1677, 'groupwise'),
-        'grubd': Service(PROTOCOLS['tcp'], 3136, 'grubd'),
-        'gs-realtime': Service(PROTOCOLS['tcp'], 30400, 'gs-realtime'),
-        'gsakmp': Service(PROTOCOLS['tcp'], 3761, 'gsakmp'),
-        'gsi': Service(PROTOCOLS['tcp'], 1850, 'gsi'),
-        'gsidcap': Service(PROTOCOLS['tcp'], 22128, 'gsidcap'),
-        'gsiftp': Service(PROTOCOLS['tcp'], 2811, 'gsiftp'),
-        'gsigatekeeper': Service(PROTOCOLS['tcp'], 2119, 'gsigatekeeper'),
-        'gsmp-ancp': Service(PROTOCOLS['tcp'], 6068, 'gsmp-ancp'),
-        'gsms': Service(PROTOCOLS['tcp'], 16002, 'gsms'),
-        'gss-http': Service(PROTOCOLS['tcp'], 488, 'gss-http'),
-        'gss-xlicen': Service(PROTOCOLS['tcp'], 128, 'gss-xlicen'),
-        'gt-proxy': Service(PROTOCOLS['tcp'], 9889, 'gt-proxy'),
-        'gtaua': Service(PROTOCOLS['tcp'], 2186, 'gtaua'),
-        'gte-samp': Service(PROTOCOLS['tcp'], 2643, 'gte-samp'),
-        'gtegsc-lm': Service(PROTOCOLS['tcp'], 1452, 'gtegsc-lm'),
-        'gtp-control': Service(PROTOCOLS['tcp'], 2123, 'gtp-control'),
-        'gtp-user': Service(PROTOCOLS['tcp'], 2152, 'gtp-user'),
-        'gtrack-ne': Service(PROTOCOLS['tcp'], 3592, 'gtrack-ne'),
-        'gtrack-server': Service(PROTOCOLS['tcp'], 3591, 'gtrack-server'),
-        'guibase': Service(PROTOCOLS['tcp'], 9321, 'guibase'),
-        'guttersnex': Service(PROTOCOLS['tcp'], 35356, 'guttersnex'),
-        'gv-pf': Service(PROTOCOLS['tcp'], 18262, 'gv-pf'),
-        'gv-us': Service(PROTOCOLS['tcp'], 1369, 'gv-us'),
-        'gvcp': Service(PROTOCOLS['tcp'], 3956, 'gvcp'),
-        'gw': Service(PROTOCOLS['tcp'], 3010, 'gw'),
-        'gw-asv': Service(PROTOCOLS['tcp'], 4842, 'gw-asv'),
-        'gw-call-port': Service(PROTOCOLS['tcp'], 3745, 'gw-call-port'),
-        'gw-log': Service(PROTOCOLS['tcp'], 4844, 'gw-log'),
-        'gwen-sonya': Service(PROTOCOLS['tcp'], 2778, 'gwen-sonya'),
-        'gwha': Service(PROTOCOLS['tcp'], 1383, 'gwha'),
-        'gxs-data-port': Service(PROTOCOLS['tcp'], 2073, 'gxs-data-port'),
-        'gxtelmd': Service(PROTOCOLS['tcp'], 2356, 'gxtelmd'),
-        'h2250-annex-g': Service(PROTOCOLS['tcp'], 2099, 'h2250-annex-g'),
-        'h248-binary': Service(PROTOCOLS['tcp'], 2945, 'h248-binary'),
-        'h263-video': Service(PROTOCOLS['tcp'], 2979, 'h263-video'),
-        'h2gf-w-2m': Service(PROTOCOLS['tcp'], 3179, 'h2gf-w-2m'),
-        'h323callsigalt': Service(PROTOCOLS['tcp'], 11720, 'h323callsigalt'),
-        'h323gatedisc': Service(PROTOCOLS['tcp'], 1718, 'h323gatedisc'),
-        'h323gatestat': Service(PROTOCOLS['tcp'], 1719, 'h323gatestat'),
-        'h323hostcall': Service(PROTOCOLS['tcp'], 1720, 'h323hostcall'),
-        'h323hostcallsc': Service(PROTOCOLS['tcp'], 1300, 'h323hostcallsc'),
-        'ha-cluster': Service(PROTOCOLS['tcp'], 694, 'ha-cluster'),
-        'hacl-cfg': Service(PROTOCOLS['tcp'], 5302, 'hacl-cfg'),
-        'hacl-gs': Service(PROTOCOLS['tcp'], 5301, 'hacl-gs'),
-        'hacl-hb': Service(PROTOCOLS['tcp'], 5300, 'hacl-hb'),
-        'hacl-local': Service(PROTOCOLS['tcp'], 5304, 'hacl-local'),
-        'hacl-monitor': Service(PROTOCOLS['tcp'], 3542, 'hacl-monitor'),
-        'hacl-poll': Service(PROTOCOLS['tcp'], 5315, 'hacl-poll'),
-        'hacl-probe': Service(PROTOCOLS['tcp'], 5303, 'hacl-probe'),
-        'hacl-qs': Service(PROTOCOLS['tcp'], 1238, 'hacl-qs'),
-        'hacl-test': Service(PROTOCOLS['tcp'], 5305, 'hacl-test'),
-        'hagel-dump': Service(PROTOCOLS['tcp'], 3036, 'hagel-dump'),
-        'haipe-discover': Service(PROTOCOLS['tcp'], 3623, 'haipe-discover'),
-        'haipe-otnk': Service(PROTOCOLS['tcp'], 3769, 'haipe-otnk'),
-        'hao': Service(PROTOCOLS['tcp'], 2245, 'hao'),
-        'hap': Service(PROTOCOLS['tcp'], 661, 'hap'),
-        'harp': Service(PROTOCOLS['tcp'], 1816, 'harp'),
-        'hart-ip': Service(PROTOCOLS['tcp'], 5094, 'hart-ip'),
-        'hassle': Service(PROTOCOLS['tcp'], 375, 'hassle'),
-        'hawk': Service(PROTOCOLS['tcp'], 7630, 'hawk'),
-        'hb-engine': Service(PROTOCOLS['tcp'], 1703, 'hb-engine'),
-        'hbci': Service(PROTOCOLS['tcp'], 3000, 'hbci'),
-        'hcp-wismar': Service(PROTOCOLS['tcp'], 686, 'hcp-wismar'),
-        'hctl': Service(PROTOCOLS['tcp'], 4197, 'hctl'),
-        'hdap': Service(PROTOCOLS['tcp'], 263, 'hdap'),
-        'hde-lcesrvr-1': Service(PROTOCOLS['tcp'], 14936, 'hde-lcesrvr-1'),
-        'hde-lcesrvr-2': Service(PROTOCOLS['tcp'], 14937, 'hde-lcesrvr-2'),
-        'hdl-srv': Service(PROTOCOLS['tcp'], 2641, 'hdl-srv'),
-        'health-polling': Service(PROTOCOLS['tcp'], 1161, 'health-polling'),
-        'health-trap': Service(PROTOCOLS['tcp'], 1162, 'health-trap'),
-        'healthd': Service(PROTOCOLS['tcp'], 1281, 'healthd'),
-        'heartbeat': Service(PROTOCOLS['tcp'], 3740, 'heartbeat'),
-        'heathview': Service(PROTOCOLS['tcp'], 35000, 'heathview'),
-        'hecmtl-db': Service(PROTOCOLS['tcp'], 1551, 'hecmtl-db'),
-        'helix': Service(PROTOCOLS['tcp'], 10860, 'helix'),
-        'hello': Service(PROTOCOLS['tcp'], 1789, 'hello'),
-        'hello-port': Service(PROTOCOLS['tcp'], 652, 'hello-port'),
-        'hems': Service(PROTOCOLS['tcp'], 151, 'hems'),
-        'here-lm': Service(PROTOCOLS['tcp'], 1409, 'here-lm'),
-        'hermes': Service(PROTOCOLS['tcp'], 1248, 'hermes'),
-        'herodotus-net': Service(PROTOCOLS['tcp'], 3921, 'herodotus-net'),
-        'hexarc': Service(PROTOCOLS['tcp'], 7397, 'hexarc'),
-        'hfcs': Service(PROTOCOLS['tcp'], 4900, 'hfcs'),
-        'hfcs-manager': Service(PROTOCOLS['tcp'], 4999, 'hfcs-manager'),
-        'hhb-gateway': Service(PROTOCOLS['tcp'], 1136, 'hhb-gateway'),
-        'hhb-handheld': Service(PROTOCOLS['tcp'], 4148, 'hhb-handheld'),
-        'hicp': Service(PROTOCOLS['tcp'], 3250, 'hicp'),
-        'high-criteria': Service(PROTOCOLS['tcp'], 2467, 'high-criteria'),
-        'hillrserv': Service(PROTOCOLS['tcp'], 4117, 'hillrserv'),
-        'hinp': Service(PROTOCOLS['tcp'], 9954, 'hinp'),
-        'hiperscan-id': Service(PROTOCOLS['tcp'], 8293, 'hiperscan-id'),
-        'hippad': Service(PROTOCOLS['tcp'], 2988, 'hippad'),
-        'hiq': Service(PROTOCOLS['tcp'], 1410, 'hiq'),
-        'hislip': Service(PROTOCOLS['tcp'], 4880, 'hislip'),
-        'hivep': Service(PROTOCOLS['tcp'], 12172, 'hivep'),
-        'hivestor': Service(PROTOCOLS['tcp'], 4884, 'hivestor'),
-        'hkp': Service(PROTOCOLS['tcp'], 11371, 'hkp'),
-        'hks-lm': Service(PROTOCOLS['tcp'], 1722, 'hks-lm'),
-        'hl7': Service(PROTOCOLS['tcp'], 2575, 'hl7'),
-        'hlibmgr': Service(PROTOCOLS['tcp'], 3634, 'hlibmgr'),
-        'hlserver': Service(PROTOCOLS['tcp'], 3047, 'hlserver'),
-        'hmmp-ind': Service(PROTOCOLS['tcp'], 612, 'hmmp-ind'),
-        'hmmp-op': Service(PROTOCOLS['tcp'], 613, 'hmmp-op'),
-        'hnm': Service(PROTOCOLS['tcp'], 6791, 'hnm'),
-        'hnmp': Service(PROTOCOLS['tcp'], 6790, 'hnmp'),
-        'homeportal-web': Service(PROTOCOLS['tcp'], 3941, 'homeportal-web'),
-        'homesteadglory': Service(PROTOCOLS['tcp'], 2597, 'homesteadglory'),
-        'honyaku': Service(PROTOCOLS['tcp'], 2744, 'honyaku'),
-        'hostname': Service(PROTOCOLS['tcp'], 101, 'hostname'),
-        'hotu-chat': Service(PROTOCOLS['tcp'], 3449, 'hotu-chat'),
-        'houdini-lm': Service(PROTOCOLS['tcp'], 1715, 'houdini-lm'),
-        'houston': Service(PROTOCOLS['tcp'], 4041, 'houston'),
-        'hp-3000-telnet': Service(PROTOCOLS['tcp'], 2564, 'hp-3000-telnet'),
-        'hp-alarm-mgr': Service(PROTOCOLS['tcp'], 383, 'hp-alarm-mgr'),
-        'hp-clic': Service(PROTOCOLS['tcp'], 3384, 'hp-clic'),
-        'hp-collector': Service(PROTOCOLS['tcp'], 381, 'hp-collector'),
-        'hp-dataprotect': Service(PROTOCOLS['tcp'], 3612, 'hp-dataprotect'),
-        'hp-device-disc': Service(PROTOCOLS['tcp'], 3329, 'hp-device-disc'),
-        'hp-hcip': Service(PROTOCOLS['tcp'], 1782, 'hp-hcip'),
-        'hp-hcip-gwy': Service(PROTOCOLS['tcp'], 1803, 'hp-hcip-gwy'),
-        'hp-managed-node': Service(PROTOCOLS['tcp'], 382, 'hp-managed-node'),
-        'hp-nnm-data': Service(PROTOCOLS['tcp'], 2690, 'hp-nnm-data'),
-        'hp-pdl-datastr': Service(PROTOCOLS['tcp'], 9100, 'hp-pdl-datastr'),
-        'hp-pxpib': Service(PROTOCOLS['tcp'], 3101, 'hp-pxpib'),
-        'hp-rda': Service(PROTOCOLS['tcp'], 2371, 'hp-rda'),
-        'hp-san-mgmt': Service(PROTOCOLS['tcp'], 3037, 'hp-san-mgmt'),
-        'hp-sca': Service(PROTOCOLS['tcp'], 19411, 'hp-sca'),
-        'hp-sci': Service(PROTOCOLS['tcp'], 1299, 'hp-sci'),
-        'hp-sco': Service(PROTOCOLS['tcp'], 19410, 'hp-sco'),
-        'hp-server': Service(PROTOCOLS['tcp'], 5225, 'hp-server'),
-        'hp-sessmon': Service(PROTOCOLS['tcp'], 19412, 'hp-sessmon'),
-        'hp-status': Service(PROTOCOLS['tcp'], 5226, 'hp-status'),
-        'hp-webadmin': Service(PROTOCOLS['tcp'], 1188, 'hp-webadmin'),
-        'hp-webqosdb': Service(PROTOCOLS['tcp'], 1877, 'hp-webqosdb'),
-        'hpbladems': Service(PROTOCOLS['tcp'], 5316, 'hpbladems'),
-        'hpdevms': Service(PROTOCOLS['tcp'], 5317, 'hpdevms'),
-        'hpe-dp-bura': Service(PROTOCOLS['tcp'], 5565, 'hpe-dp-bura'),
-        'hpidsadmin': Service(PROTOCOLS['tcp'], 2984, 'hpidsadmin'),
-        'hpidsagent': Service(PROTOCOLS['tcp'], 2985, 'hpidsagent'),
-        'hpiod': Service(PROTOCOLS['tcp'], 2208, 'hpiod'),
-        'hpocbus': Service(PROTOCOLS['tcp'], 2206, 'hpocbus'),
-        'hpoms-ci-lstn': Service(PROTOCOLS['tcp'], 5403, 'hpoms-ci-lstn'),
-        'hpoms-dps-lstn': Service(PROTOCOLS['tcp'], 5404, 'hpoms-dps-lstn'),
-        'hpppssvr': Service(PROTOCOLS['tcp'], 2448, 'hpppssvr'),
-        'hppronetman': Service(PROTOCOLS['tcp'], 3908, 'hppronetman'),
-        'hpss-ndapi': Service(PROTOCOLS['tcp'], 1217, 'hpss-ndapi'),
-        'hpssd': Service(PROTOCOLS['tcp'], 2207, 'hpssd'),
-        'hpssmgmt': Service(PROTOCOLS['tcp'], 4484, 'hpssmgmt'),
-        'hpstgmgr': Service(PROTOCOLS['tcp'], 2600, 'hpstgmgr'),
-        'hpstgmgr2': Service(PROTOCOLS['tcp'], 2715, 'hpstgmgr2'),
-        'hpvirtctrl': Service(PROTOCOLS['tcp'], 5224, 'hpvirtctrl'),
-        'hpvirtgrp': Service(PROTOCOLS['tcp'], 5223, 'hpvirtgrp'),
-        'hpvmmagent': Service(PROTOCOLS['tcp'], 1125, 'hpvmmagent'),
-        'hpvmmcontrol': Service(PROTOCOLS['tcp'], 1124, 'hpvmmcontrol'),
-        'hpvmmdata': Service(PROTOCOLS['tcp'], 1126, 'hpvmmdata'),
-        'hpvroom': Service(PROTOCOLS['tcp'], 5228, 'hpvroom'),
-        'hrd-ncs': Service(PROTOCOLS['tcp'], 6324, 'hrd-ncs'),
-        'hri-port': Service(PROTOCOLS['tcp'], 3439, 'hri-port'),
-        'hs-port': Service(PROTOCOLS['tcp'], 2570, 'hs-port'),
-        'hsl-storm': Service(PROTOCOLS['tcp'], 2113, 'hsl-storm'),
-        'hsrp': Service(PROTOCOLS['tcp'], 1985, 'hsrp'),
-        'hsrpv6': Service(PROTOCOLS['tcp'], 2029, 'hsrpv6'),
-        'htcp': Service(PROTOCOLS['tcp'], 4827, 'htcp'),
-        'htrust': Service(PROTOCOLS['tcp'], 5628, 'htrust'),
-        'http': Service(PROTOCOLS['tcp'], 80, 'http'),
-        'http-alt': Service(PROTOCOLS['tcp'], 8080, 'http-alt'),
-        'http-mgmt': Service(PROTOCOLS['tcp'], 280, 'http-mgmt'),
-        'http-rpc-epmap': Service(PROTOCOLS['tcp'], 593, 'http-rpc-epmap'),
-        'http-wmap': Service(PROTOCOLS['tcp'], 8990, 'http-wmap'),
-        'https': Service(PROTOCOLS['tcp'], 443, 'https'),
-        'https-wmap': Service(PROTOCOLS['tcp'], 8991, 'https-wmap'),
-        'httpx': Service(PROTOCOLS['tcp'], 4180, 'httpx'),
-        'htuilsrv': Service(PROTOCOLS['tcp'], 5023, 'htuilsrv'),
-        'hub-open-net': Service(PROTOCOLS['tcp'], 8313, 'hub-open-net'),
-        'husky': Service(PROTOCOLS['tcp'], 1310, 'husky'),
-        'hybrid': Service(PROTOCOLS['tcp'], 1424, 'hybrid'),
-        'hybrid-pop': Service(PROTOCOLS['tcp'], 473, 'hybrid-pop'),
-        'hydap': Service(PROTOCOLS['tcp'], 15000, 'hydap'),
-        'hydra': Service(PROTOCOLS['tcp'], 2374, 'hydra'),
-        'hylafax': Service(PROTOCOLS['tcp'], 4559, 'hylafax'),
-        'hyper-g': Service(PROTOCOLS['tcp'], 418, 'hyper-g'),
-        'hypercube-lm': Service(PROTOCOLS['tcp'], 1577, 'hypercube-lm'),
-        'hyperip': Service(PROTOCOLS['tcp'], 3919, 'hyperip'),
-        'hyperscsi-port': Service(PROTOCOLS['tcp'], 5674, 'hyperscsi-port'),
-        'hyperwave-isp': Service(PROTOCOLS['tcp'], 692, 'hyperwave-isp'),
-        'i-net-2000-npr': Service(PROTOCOLS['tcp'], 5069, 'i-net-2000-npr'),
-        'i-zipqd': Service(PROTOCOLS['tcp'], 13160, 'i-zipqd'),
-        'i3-sessionmgr': Service(PROTOCOLS['tcp'], 3952, 'i3-sessionmgr'),
-        'iadt': Service(PROTOCOLS['tcp'], 4169, 'iadt'),
-        'iadt-tls': Service(PROTOCOLS['tcp'], 9614, 'iadt-tls'),
-        'iafdbase': Service(PROTOCOLS['tcp'], 480, 'iafdbase'),
-        'iafserver': Service(PROTOCOLS['tcp'], 479, 'iafserver'),
-        'ianywhere-dbns': Service(PROTOCOLS['tcp'], 3968, 'ianywhere-dbns'),
-        'iapp': Service(PROTOCOLS['tcp'], 2313, 'iapp'),
-        'ias-admind': Service(PROTOCOLS['tcp'], 2141, 'ias-admind'),
-        'ias-auth': Service(PROTOCOLS['tcp'], 2139, 'ias-auth'),
-        'ias-neighbor': Service(PROTOCOLS['tcp'], 4596, 'ias-neighbor'),
-        'ias-paging': Service(PROTOCOLS['tcp'], 4595, 'ias-paging'),
-        'ias-reg': Service(PROTOCOLS['tcp'], 2140, 'ias-reg'),
-        'ias-session': Service(PROTOCOLS['tcp'], 4594, 'ias-session'),
-        'iascontrol': Service(PROTOCOLS['tcp'], 1157, 'iascontrol'),
-        'iascontrol-oms': Service(PROTOCOLS['tcp'], 1156, 'iascontrol-oms'),
-        'iasd': Service(PROTOCOLS['tcp'], 432, 'iasd'),
-        'iatp-highpri': Service(PROTOCOLS['tcp'], 6998, 'iatp-highpri'),
-        'iatp-normalpri': Service(PROTOCOLS['tcp'], 6999, 'iatp-normalpri'),
-        'iax': Service(PROTOCOLS['tcp'], 4569, 'iax'),
-        'iberiagames': Service(PROTOCOLS['tcp'], 1726, 'iberiagames'),
-        'ibm-abtact': Service(PROTOCOLS['tcp'], 1586, 'ibm-abtact'),
-        'ibm-app': Service(PROTOCOLS['tcp'], 385, 'ibm-app'),
-        'ibm-cics': Service(PROTOCOLS['tcp'], 1435, 'ibm-cics'),
-        'ibm-db2': Service(PROTOCOLS['tcp'], 523, 'ibm-db2'),
-        'ibm-dial-out': Service(PROTOCOLS['tcp'], 3267, 'ibm-dial-out'),
-        'ibm-diradm': Service(PROTOCOLS['tcp'], 3538, 'ibm-diradm'),
-        'ibm-diradm-ssl': Service(PROTOCOLS['tcp'], 3539, 'ibm-diradm-ssl'),
-        'ibm-dt-2': Service(PROTOCOLS['tcp'], 1792, 'ibm-dt-2'),
-        'ibm-mgr': Service(PROTOCOLS['tcp'], 3801, 'ibm-mgr'),
-        'ibm-mqseries': Service(PROTOCOLS['tcp'], 1414, 'ibm-mqseries'),
-        'ibm-mqseries2': Service(PROTOCOLS['tcp'], 1881, 'ibm-mqseries2'),
-        'ibm-pps': Service(PROTOCOLS['tcp'], 1376, 'ibm-pps'),
-        'ibm-res': Service(PROTOCOLS['tcp'], 1405, 'ibm-res'),
-        'ibm-rsyscon': Service(PROTOCOLS['tcp'], 9085, 'ibm-rsyscon'),
-        'ibm-ssd': Service(PROTOCOLS['tcp'], 1260, 'ibm-ssd'),
-        'ibm-wrless-lan': Service(PROTOCOLS['tcp'], 1461, 'ibm-wrless-lan'),
-        'ibm3494': Service(PROTOCOLS['tcp'], 3494, 'ibm3494'),
-        'ibm_wrless_lan': Service(PROTOCOLS['tcp'], 1461, 'ibm_wrless_lan'),
-        'ibp': Service(PROTOCOLS['tcp'], 2572, 'ibp'),
-        'ibprotocol': Service(PROTOCOLS['tcp'], 6714, 'ibprotocol'),
-        'ibridge-data': Service(PROTOCOLS['tcp'], 2275, 'ibridge-data'),
-        'ibridge-mgmt': Service(PROTOCOLS['tcp'], 2276, 'ibridge-mgmt'),
-        'ibus': Service(PROTOCOLS['tcp'], 8733, 'ibus'),
-        'ica': Service(PROTOCOLS['tcp'], 1494, 'ica'),
-        'icabrowser': Service(PROTOCOLS['tcp'], 1604, 'icabrowser'),
-        'icad-el': Service(PROTOCOLS['tcp'], 425, 'icad-el'),
-        'icap': Service(PROTOCOLS['tcp'], 1344, 'icap'),
-        'iccrushmore': Service(PROTOCOLS['tcp'], 6850, 'iccrushmore'),
-        'ice-location': Service(PROTOCOLS['tcp'], 4061, 'ice-location'),
-        'ice-router': Service(PROTOCOLS['tcp'], 4063, 'ice-router'),
-        'ice-slocation': Service(PROTOCOLS['tcp'], 4062, 'ice-slocation'),
-        'ice-srouter': Service(PROTOCOLS['tcp'], 4064, 'ice-srouter'),
-        'iceedcp-rx': Service(PROTOCOLS['tcp'], 31949, 'iceedcp-rx'),
-        'iceedcp-tx': Service(PROTOCOLS['tcp'], 31948, 'iceedcp-tx'),
-        'iceedcp_rx': Service(PROTOCOLS['tcp'], 31949, 'iceedcp_rx'),
-        'iceedcp_tx': Service(PROTOCOLS['tcp'], 31948, 'iceedcp_tx'),
-        'icg-bridge': Service(PROTOCOLS['tcp'], 2063, 'icg-bridge'),
-        'icg-iprelay': Service(PROTOCOLS['tcp'], 2064, 'icg-iprelay'),
-        'icg-swp': Service(PROTOCOLS['tcp'], 2062, 'icg-swp'),
-        'ici': Service(PROTOCOLS['tcp'], 2200, 'ici'),
-        'icl-twobase1': Service(PROTOCOLS['tcp'], 25000, 'icl-twobase1'),
-        'icl-twobase10': Service(PROTOCOLS['tcp'], 25009, 'icl-twobase10'),
-        'icl-twobase2': Service(PROTOCOLS['tcp'], 25001, 'icl-twobase2'),
-        'icl-twobase3': Service(PROTOCOLS['tcp'], 25002, 'icl-twobase3'),
-        'icl-twobase4': Service(PROTOCOLS['tcp'], 25003, 'icl-twobase4'),
-        'icl-twobase5': Service(PROTOCOLS['tcp'], 25004, 'icl-twobase5'),
-        'icl-twobase6': Service(PROTOCOLS['tcp'], 25005, 'icl-twobase6'),
-        'icl-twobase7': Service(PROTOCOLS['tcp'], 25006, 'icl-twobase7'),
-        'icl-twobase8': Service(PROTOCOLS['tcp'], 25007, 'icl-twobase8'),
-        'icl-twobase9': Service(PROTOCOLS['tcp'], 25008, 'icl-twobase9'),
-        'iclcnet-locate': Service(PROTOCOLS['tcp'], 886, 'iclcnet-locate'),
-        'iclcnet-svinfo': Service(PROTOCOLS['tcp'], 887, 'iclcnet-svinfo'),
-        'iclcnet_svinfo': Service(PROTOCOLS['tcp'], 887, 'iclcnet_svinfo'),
-        'iclid': Service(PROTOCOLS['tcp'], 18242, 'iclid'),
-        'iclpv-dm': Service(PROTOCOLS['tcp'], 1389, 'iclpv-dm'),
-        'iclpv-nlc': Service(PROTOCOLS['tcp'], 1394, 'iclpv-nlc'),
-        'iclpv-nls': Service(PROTOCOLS['tcp'], 1393, 'iclpv-nls'),
-        'iclpv-pm': Service(PROTOCOLS['tcp'], 1392, 'iclpv-pm'),
-        'iclpv-sas': Service(PROTOCOLS['tcp'], 1391, 'iclpv-sas'),
-        'iclpv-sc': Service(PROTOCOLS['tcp'], 1390, 'iclpv-sc'),
-        'iclpv-wsm': Service(PROTOCOLS['tcp'], 1395, 'iclpv-wsm'),
-        'icmpd': Service(PROTOCOLS['tcp'], 5813, 'icmpd'),
-        'icms': Service(PROTOCOLS['tcp'], 4486, 'icms'),
-        'icon-discover': Service(PROTOCOLS['tcp'], 2799, 'icon-discover'),
-        'iconp': Service(PROTOCOLS['tcp'], 3972, 'iconp'),
-        'iconstructsrv': Service(PROTOCOLS['tcp'], 6077, 'iconstructsrv'),
-        'icp': Service(PROTOCOLS['tcp'], 1112, 'icp'),
-        'icpp': Service(PROTOCOLS['tcp'], 14142, 'icpp'),
-        'icpps': Service(PROTOCOLS['tcp'], 14143, 'icpps'),
-        'icpv2': Service(PROTOCOLS['tcp'], 3130, 'icpv2'),
-        'ics': Service(PROTOCOLS['tcp'], 5639, 'ics'),
-        'icshostsvc': Service(PROTOCOLS['tcp'], 4553, 'icshostsvc'),
-        'icslap': Service(PROTOCOLS['tcp'], 2869, 'icslap'),
-        'ida-discover1': Service(PROTOCOLS['tcp'], 5741, 'ida-discover1'),
-        'ida-discover2': Service(PROTOCOLS['tcp'], 5742, 'ida-discover2'),
-        'idac': Service(PROTOCOLS['tcp'], 3881, 'idac'),
-        'idcp': Service(PROTOCOLS['tcp'], 2326, 'idcp'),
-        'ideafarm-door': Service(PROTOCOLS['tcp'], 902, 'ideafarm-door'),
-        'ideafarm-panic': Service(PROTOCOLS['tcp'], 903, 'ideafarm-panic'),
-        'ideesrv': Service(PROTOCOLS['tcp'], 2337, 'ideesrv'),
-        'iden-ralp': Service(PROTOCOLS['tcp'], 1725, 'iden-ralp'),
-        'ident': Service(PROTOCOLS['tcp'], 113, 'ident'),
-        'identify': Service(PROTOCOLS['tcp'], 2987, 'identify'),
-        'idfp': Service(PROTOCOLS['tcp'], 549, 'idfp'),
-        'idig-mux': Service(PROTOCOLS['tcp'], 4152, 'idig-mux'),
-        'idig_mux': Service(PROTOCOLS['tcp'], 4152, 'idig_mux'),
-        'idmaps': Service(PROTOCOLS['tcp'], 1884, 'idmaps'),
-        'idmgratm': Service(PROTOCOLS['tcp'], 32896, 'idmgratm'),
-        'idonix-metanet': Service(PROTOCOLS['tcp'], 2112, 'idonix-metanet'),
-        'idotdist': Service(PROTOCOLS['tcp'], 2590, 'idotdist'),
-        'idp': Service(PROTOCOLS['tcp'], 4067, 'idp'),
-        'idp-infotrieve': Service(PROTOCOLS['tcp'], 2966, 'idp-infotrieve'),
-        'idps': Service(PROTOCOLS['tcp'], 3797, 'idps'),
-        'idrs': Service(PROTOCOLS['tcp'], 2995, 'idrs'),
-        'idtp': Service(PROTOCOLS['tcp'], 25604, 'idtp'),
-        'idware-router': Service(PROTOCOLS['tcp'], 2079, 'idware-router'),
-        'idxp': Service(PROTOCOLS['tcp'], 603, 'idxp'),
-        'iec-104': Service(PROTOCOLS['tcp'], 2404, 'iec-104'),
-        'iec-104-sec': Service(PROTOCOLS['tcp'], 19998, 'iec-104-sec'),
-        'iee-qfx': Service(PROTOCOLS['tcp'], 1284, 'iee-qfx'),
-        'ieee-mih': Service(PROTOCOLS['tcp'], 4551, 'ieee-mih'),
-        'ieee-mms': Service(PROTOCOLS['tcp'], 651, 'ieee-mms'),
-        'ieee-mms-ssl': Service(PROTOCOLS['tcp'], 695, 'ieee-mms-ssl'),
-        'ieee11073-20701': Service(PROTOCOLS['tcp'], 6464, 'ieee11073-20701'),
-        'ies-lm': Service(PROTOCOLS['tcp'], 1443, 'ies-lm'),
-        'ifcp-port': Service(PROTOCOLS['tcp'], 3420, 'ifcp-port'),
-        'ife-icorp': Service(PROTOCOLS['tcp'], 5165, 'ife-icorp'),
-        'ife_icorp': Service(PROTOCOLS['tcp'], 5165, 'ife_icorp'),
-        'ifor-protocol': Service(PROTOCOLS['tcp'], 1515, 'ifor-protocol'),
-        'ifsf-hb-port': Service(PROTOCOLS['tcp'], 3486, 'ifsf-hb-port'),
-        'ifsp': Service(PROTOCOLS['tcp'], 4744, 'ifsp'),
-        'igcp': Service(PROTOCOLS['tcp'], 2801, 'igcp'),
-        'igi-lm': Service(PROTOCOLS['tcp'], 1404, 'igi-lm'),
-        'igo-incognito': Service(PROTOCOLS['tcp'], 4100, 'igo-incognito'),
-        'igrid': Service(PROTOCOLS['tcp'], 19000, 'igrid'),
-        'igrs': Service(PROTOCOLS['tcp'], 3880, 'igrs'),
-        'ii-admin': Service(PROTOCOLS['tcp'], 3006, 'ii-admin'),
-        'iims': Service(PROTOCOLS['tcp'], 4800, 'iims'),
-        'iiop': Service(PROTOCOLS['tcp'], 535, 'iiop'),
-        'iiw-port': Service(PROTOCOLS['tcp'], 3186, 'iiw-port'),
-        'ild': Service(PROTOCOLS['tcp'], 24321, 'ild'),
-        'ill': Service(PROTOCOLS['tcp'], 1611, 'ill'),
-        'ilss': Service(PROTOCOLS['tcp'], 4802, 'ilss'),
-        'imagepump': Service(PROTOCOLS['tcp'], 27345, 'imagepump'),
-        'imagequery': Service(PROTOCOLS['tcp'], 2239, 'imagequery'),
-        'imap': Service(PROTOCOLS['tcp'], 143, 'imap'),
-        'imap3': Service(PROTOCOLS['tcp'], 220, 'imap3'),
-        'imaps': Service(PROTOCOLS['tcp'], 993, 'imaps'),
-        'imdocsvc': Service(PROTOCOLS['tcp'], 2637, 'imdocsvc'),
-        'imgames': Service(PROTOCOLS['tcp'], 1077, 'imgames'),
-        'imink': Service(PROTOCOLS['tcp'], 8615, 'imink'),
-        'imip': Service(PROTOCOLS['tcp'], 11319, 'imip'),
-        'imip-channels': Service(PROTOCOLS['tcp'], 11320, 'imip-channels'),
-        'immedianet-bcn': Service(PROTOCOLS['tcp'], 3657, 'immedianet-bcn'),
-        'imoguia-port': Service(PROTOCOLS['tcp'], 3907, 'imoguia-port'),
-        'impera': Service(PROTOCOLS['tcp'], 1710, 'impera'),
-        'imprs': Service(PROTOCOLS['tcp'], 3164, 'imprs'),
-        'imqbrokerd': Service(PROTOCOLS['tcp'], 7676, 'imqbrokerd'),
-        'imqstomp': Service(PROTOCOLS['tcp'], 7672, 'imqstomp'),
-        'imqstomps': Service(PROTOCOLS['tcp'], 7673, 'imqstomps'),
-        'imqtunnel': Service(PROTOCOLS['tcp'], 7675, 'imqtunnel'),
-        'imqtunnels': Service(PROTOCOLS['tcp'], 7674, 'imqtunnels'),
-        'imsldoc': Service(PROTOCOLS['tcp'], 2035, 'imsldoc'),
-        'imsp': Service(PROTOCOLS['tcp'], 406, 'imsp'),
-        'imtc-map': Service(PROTOCOLS['tcp'], 2202, 'imtc-map'),
-        'imtc-mcs': Service(PROTOCOLS['tcp'], 1503, 'imtc-mcs'),
-        'imyx': Service(PROTOCOLS['tcp'], 1143, 'imyx'),
-        'inbusiness': Service(PROTOCOLS['tcp'], 244, 'inbusiness'),
-        'incognitorv': Service(PROTOCOLS['tcp'], 3139, 'incognitorv'),
-        'incp': Service(PROTOCOLS['tcp'], 2932, 'incp'),
-        'index-net': Service(PROTOCOLS['tcp'], 2970, 'index-net'),
-        'index-pc-wb': Service(PROTOCOLS['tcp'], 2127, 'index-pc-wb'),
-        'indi': Service(PROTOCOLS['tcp'], 7624, 'indi'),
-        'indigo-server': Service(PROTOCOLS['tcp'], 1176, 'indigo-server'),
-        'indigo-vbcp': Service(PROTOCOLS['tcp'], 8131, 'indigo-vbcp'),
-        'indigo-vrmi': Service(PROTOCOLS['tcp'], 8130, 'indigo-vrmi'),
-        'indura': Service(PROTOCOLS['tcp'], 3156, 'indura'),
-        'indx-dds': Service(PROTOCOLS['tcp'], 2454, 'indx-dds'),
-        'indy': Service(PROTOCOLS['tcp'], 5963, 'indy'),
-        'inedo': Service(PROTOCOLS['tcp'], 46336, 'inedo'),
-        'inetfs': Service(PROTOCOLS['tcp'], 7775, 'inetfs'),
-        'infi-async': Service(PROTOCOLS['tcp'], 8067, 'infi-async'),
-        'infiniswitchcl': Service(PROTOCOLS['tcp'], 3602, 'infiniswitchcl'),
-        'influence': Service(PROTOCOLS['tcp'], 3345, 'influence'),
-        'infobright': Service(PROTOCOLS['tcp'], 5029, 'infobright'),
-        'infocrypt': Service(PROTOCOLS['tcp'], 2233, 'infocrypt'),
-        'infoexch': Service(PROTOCOLS['tcp'], 3667, 'infoexch'),
-        'infolibria': Service(PROTOCOLS['tcp'], 2319, 'infolibria'),
-        'infoman': Service(PROTOCOLS['tcp'], 1451, 'infoman'),
-        'infomover': Service(PROTOCOLS['tcp'], 2854, 'infomover'),
-        'informatik-lm': Service(PROTOCOLS['tcp'], 1428, 'informatik-lm'),
-        'informer': Service(PROTOCOLS['tcp'], 3856, 'informer'),
-        'infoseek': Service(PROTOCOLS['tcp'], 414, 'infoseek'),
-        'infotos': Service(PROTOCOLS['tcp'], 18881, 'infotos'),
-        'infowave': Service(PROTOCOLS['tcp'], 2082, 'infowave'),
-        'ingres-net': Service(PROTOCOLS['tcp'], 134, 'ingres-net'),
-        'ingreslock': Service(PROTOCOLS['tcp'], 1524, 'ingreslock'),
-        'ininmessaging': Service(PROTOCOLS['tcp'], 5597, 'ininmessaging'),
-        'iniserve-port': Service(PROTOCOLS['tcp'], 3560, 'iniserve-port'),
-        'initlsmsad': Service(PROTOCOLS['tcp'], 2793, 'initlsmsad'),
-        'innosys': Service(PROTOCOLS['tcp'], 1412, 'innosys'),
-        'innosys-acl': Service(PROTOCOLS['tcp'], 1413, 'innosys-acl'),
-        'inova-ip-disco': Service(PROTOCOLS['tcp'], 2716, 'inova-ip-disco'),
-        'inovaport1': Service(PROTOCOLS['tcp'], 23000, 'inovaport1'),
-        'inovaport2': Service(PROTOCOLS['tcp'], 23001, 'inovaport2'),
-        'inovaport3': Service(PROTOCOLS['tcp'], 23002, 'inovaport3'),
-        'inovaport4': Service(PROTOCOLS['tcp'], 23003, 'inovaport4'),
-        'inovaport5': Service(PROTOCOLS['tcp'], 23004, 'inovaport5'),
-        'inovaport6': Service(PROTOCOLS['tcp'], 23005, 'inovaport6'),
-        'insis': Service(PROTOCOLS['tcp'], 9215, 'insis'),
-        'insitu-conf': Service(PROTOCOLS['tcp'], 1490, 'insitu-conf'),
-        'inspect': Service(PROTOCOLS['tcp'], 1602, 'inspect'),
-        'inspider': Service(PROTOCOLS['tcp'], 49150, 'inspider'),
-        'instantia': Service(PROTOCOLS['tcp'], 1240, 'instantia'),
-        'instl-bootc': Service(PROTOCOLS['tcp'], 1068, 'instl-bootc'),
-        'instl-boots': Service(PROTOCOLS['tcp'], 1067, 'instl-boots'),
-        'instl_bootc': Service(PROTOCOLS['tcp'], 1068, 'instl_bootc'),
-        'instl_boots': Service(PROTOCOLS['tcp'], 1067, 'instl_boots'),
-        'int-rcv-cntrl': Service(PROTOCOLS['tcp'], 3603, 'int-rcv-cntrl'),
-        'intecom-ps1': Service(PROTOCOLS['tcp'], 5056, 'intecom-ps1'),
-        'intecom-ps2': Service(PROTOCOLS['tcp'], 5057, 'intecom-ps2'),
-        'intecourier': Service(PROTOCOLS['tcp'], 495, 'intecourier'),
-        'integra-sme': Service(PROTOCOLS['tcp'], 484, 'integra-sme'),
-        'integral': Service(PROTOCOLS['tcp'], 3459, 'integral'),
-        'integrius-stp': Service(PROTOCOLS['tcp'], 17234, 'integrius-stp'),
-        'intel-rci': Service(PROTOCOLS['tcp'], 24386, 'intel-rci'),
-        'intel-rci-mp': Service(PROTOCOLS['tcp'], 16991, 'intel-rci-mp'),
-        'intel_rci': Service(PROTOCOLS['tcp'], 24386, 'intel_rci'),
-        'intellistor-lm': Service(PROTOCOLS['tcp'], 1539, 'intellistor-lm'),
-        'intelsync': Service(PROTOCOLS['tcp'], 3692, 'intelsync'),
-        'interact': Service(PROTOCOLS['tcp'], 4052, 'interact'),
-        'interactionweb': Service(PROTOCOLS['tcp'], 3508, 'interactionweb'),
-        'interbase': Service(PROTOCOLS['tcp'], 2041, 'interbase'),
-        'interhdl-elmd': Service(PROTOCOLS['tcp'], 1454, 'interhdl-elmd'),
-        'interhdl_elmd': Service(PROTOCOLS['tcp'], 1454, 'interhdl_elmd'),
-        'interintelli': Service(PROTOCOLS['tcp'], 2633, 'interintelli'),
-        'intermapper': Service(PROTOCOLS['tcp'], 8181, 'intermapper'),
-        'interpathpanel': Service(PROTOCOLS['tcp'], 2652, 'interpathpanel'),
-        'intersan': Service(PROTOCOLS['tcp'], 1331, 'intersan'),
-        'interserver': Service(PROTOCOLS['tcp'], 3060, 'interserver'),
-        'intersys-cache': Service(PROTOCOLS['tcp'], 1972, 'intersys-cache'),
-        'interwise': Service(PROTOCOLS['tcp'], 7778, 'interwise'),
-        'interworld': Service(PROTOCOLS['tcp'], 3548, 'interworld'),
-        'intraintra': Service(PROTOCOLS['tcp'], 3202, 'intraintra'),
-        'intrastar': Service(PROTOCOLS['tcp'], 1907, 'intrastar'),
-        'intrepid-ssl': Service(PROTOCOLS['tcp'], 11751, 'intrepid-ssl'),
-        'intrinsa': Service(PROTOCOLS['tcp'], 503, 'intrinsa'),
-        'intu-ec-client': Service(PROTOCOLS['tcp'], 8021, 'intu-ec-client'),
-        'intu-ec-svcdisc': Service(PROTOCOLS['tcp'], 8020, 'intu-ec-svcdisc'),
-        'intuitive-edge': Service(PROTOCOLS['tcp'], 1355, 'intuitive-edge'),
-        'intv': Service(PROTOCOLS['tcp'], 1585, 'intv'),
-        'invision': Service(PROTOCOLS['tcp'], 1641, 'invision'),
-        'invision-ag': Service(PROTOCOLS['tcp'], 45054, 'invision-ag'),
-        'invokator': Service(PROTOCOLS['tcp'], 2006, 'invokator'),
-        'io-dist-data': Service(PROTOCOLS['tcp'], 5728, 'io-dist-data'),
-        'ioc-sea-lm': Service(PROTOCOLS['tcp'], 1579, 'ioc-sea-lm'),
-        'ionixnetmon': Service(PROTOCOLS['tcp'], 7410, 'ionixnetmon'),
-        'iop': Service(PROTOCOLS['tcp'], 2055, 'iop'),
-        'ip-blf': Service(PROTOCOLS['tcp'], 2088, 'ip-blf'),
-        'ip-provision': Service(PROTOCOLS['tcp'], 43190, 'ip-provision'),
-        'ip-qsig': Service(PROTOCOLS['tcp'], 4029, 'ip-qsig'),
-        'ipass': Service(PROTOCOLS['tcp'], 2549, 'ipass'),
-        'ipcd': Service(PROTOCOLS['tcp'], 576, 'ipcd'),
-        'ipcd3': Service(PROTOCOLS['tcp'], 1209, 'ipcd3'),
-        'ipcore': Service(PROTOCOLS['tcp'], 2215, 'ipcore'),
-        'ipcs-command': Service(PROTOCOLS['tcp'], 3743, 'ipcs-command'),
-        'ipcserver': Service(PROTOCOLS['tcp'], 600, 'ipcserver'),
-        'ipdcesgbs': Service(PROTOCOLS['tcp'], 9214, 'ipdcesgbs'),
-        'ipdd': Service(PROTOCOLS['tcp'], 578, 'ipdd'),
-        'ipdr-sp': Service(PROTOCOLS['tcp'], 4737, 'ipdr-sp'),
-        'ipdtp-port': Service(PROTOCOLS['tcp'], 20202, 'ipdtp-port'),
-        'ipether232port': Service(PROTOCOLS['tcp'], 3497, 'ipether232port'),
-        'ipfix': Service(PROTOCOLS['tcp'], 4739, 'ipfix'),
-        'ipfixs': Service(PROTOCOLS['tcp'], 4740, 'ipfixs'),
-        'ipfltbcst': Service(PROTOCOLS['tcp'], 4068, 'ipfltbcst'),
-        'iph-policy-adm': Service(PROTOCOLS['tcp'], 2963, 'iph-policy-adm'),
-        'iph-policy-cli': Service(PROTOCOLS['tcp'], 2962, 'iph-policy-cli'),
-        'iposplanet': Service(PROTOCOLS['tcp'], 7031, 'iposplanet'),
-        'ipp': Service(PROTOCOLS['tcp'], 631, 'ipp'),
-        'ipr-dglt': Service(PROTOCOLS['tcp'], 3678, 'ipr-dglt'),
-        'ipsec-nat-t': Service(PROTOCOLS['tcp'], 4500, 'ipsec-nat-t'),
-        'ipsendmsg': Service(PROTOCOLS['tcp'], 1992, 'ipsendmsg'),
-        'ipt-anri-anri': Service(PROTOCOLS['tcp'], 4593, 'ipt-anri-anri'),
-        'ipulse-ics': Service(PROTOCOLS['tcp'], 20222, 'ipulse-ics'),
-        'ipx': Service(PROTOCOLS['tcp'], 213, 'ipx'),
-        'iqnet-port': Service(PROTOCOLS['tcp'], 3804, 'iqnet-port'),
-        'iqobject': Service(PROTOCOLS['tcp'], 48619, 'iqobject'),
-        'iqrm': Service(PROTOCOLS['tcp'], 10117, 'iqrm'),
-        'iqserver': Service(PROTOCOLS['tcp'], 2527, 'iqserver'),
-        'ique': Service(PROTOCOLS['tcp'], 18769, 'ique'),
-        'iracinghelper': Service(PROTOCOLS['tcp'], 32034, 'iracinghelper'),
-        'irapp': Service(PROTOCOLS['tcp'], 4073, 'irapp'),
-        'irc': Service(PROTOCOLS['tcp'], 194, 'irc'),
-        'irc-serv': Service(PROTOCOLS['tcp'], 529, 'irc-serv'),
-        'ircs-u': Service(PROTOCOLS['tcp'], 6697, 'ircs-u'),
-        'ircu': Service(PROTOCOLS['tcp'], 6669, 'ircu'),
-        'irdg-post': Service(PROTOCOLS['tcp'], 2632, 'irdg-post'),
-        'irdmi': Service(PROTOCOLS['tcp'], 8000, 'irdmi'),
-        'irdmi2': Service(PROTOCOLS['tcp'], 7999, 'irdmi2'),
-        'iris-beep': Service(PROTOCOLS['tcp'], 702, 'iris-beep'),
-        'iris-lwz': Service(PROTOCOLS['tcp'], 715, 'iris-lwz'),
-        'iris-xpc': Service(PROTOCOLS['tcp'], 713, 'iris-xpc'),
-        'iris-xpcs': Service(PROTOCOLS['tcp'], 714, 'iris-xpcs'),
-        'irisa': Service(PROTOCOLS['tcp'], 11000, 'irisa'),
-        'ironmail': Service(PROTOCOLS['tcp'], 3206, 'ironmail'),
-        'ironstorm': Service(PROTOCOLS['tcp'], 3504, 'ironstorm'),
-        'irp': Service(PROTOCOLS['tcp'], 4604, 'irp'),
-        'irtrans': Service(PROTOCOLS['tcp'], 21000, 'irtrans'),
-        'is99c': Service(PROTOCOLS['tcp'], 379, 'is99c'),
-        'is99s': Service(PROTOCOLS['tcp'], 380, 'is99s'),
-        'isa100-gci': Service(PROTOCOLS['tcp'], 17223, 'isa100-gci'),
-        'isakmp': Service(PROTOCOLS['tcp'], 500, 'isakmp'),
-        'isbconference1': Service(PROTOCOLS['tcp'], 1244, 'isbconference1'),
-        'isbconference2': Service(PROTOCOLS['tcp'], 1245, 'isbconference2'),
-        'ischat': Service(PROTOCOLS['tcp'], 1336, 'ischat'),
-        'iscsi': Service(PROTOCOLS['tcp'], 860, 'iscsi'),
-        'iscsi-target': Service(PROTOCOLS['tcp'], 3260, 'iscsi-target'),
-        'isdc': Service(PROTOCOLS['tcp'], 1636, 'isdc'),
-        'isdd': Service(PROTOCOLS['tcp'], 8148, 'isdd'),
-        'isg-uda-server': Service(PROTOCOLS['tcp'], 2551, 'isg-uda-server'),
-        'isi-gl': Service(PROTOCOLS['tcp'], 55, 'isi-gl'),
-        'isi-irp': Service(PROTOCOLS['tcp'], 3226, 'isi-irp'),
-        'isis': Service(PROTOCOLS['tcp'], 2042, 'isis'),
-        'isis-am': Service(PROTOCOLS['tcp'], 1642, 'isis-am'),
-        'isis-ambc': Service(PROTOCOLS['tcp'], 1643, 'isis-ambc'),
-        'isis-bcast': Service(PROTOCOLS['tcp'], 2043, 'isis-bcast'),
-        'islc': Service(PROTOCOLS['tcp'], 1637, 'islc'),
-        'ismaeasdaqlive': Service(PROTOCOLS['tcp'], 1949, 'ismaeasdaqlive'),
-        'ismaeasdaqtest': Service(PROTOCOLS['tcp'], 1950, 'ismaeasdaqtest'),
-        'ismc': Service(PROTOCOLS['tcp'], 1638, 'ismc'),
-        'ismserver': Service(PROTOCOLS['tcp'], 9500, 'ismserver'),
-        'isnetserv': Service(PROTOCOLS['tcp'], 48128, 'isnetserv'),
-        'isns': Service(PROTOCOLS['tcp'], 3205, 'isns'),
-        'iso-ill': Service(PROTOCOLS['tcp'], 499, 'iso-ill'),
-        'iso-ip': Service(PROTOCOLS['tcp'], 147, 'iso-ip'),
-        'iso-tp0': Service(PROTOCOLS['tcp'], 146, 'iso-tp0'),
-        'iso-tp0s': Service(PROTOCOLS['tcp'], 3782, 'iso-tp0s'),
-        'iso-tsap': Service(PROTOCOLS['tcp'], 102, 'iso-tsap'),
-        'iso-tsap-c2': Service(PROTOCOLS['tcp'], 399, 'iso-tsap-c2'),
-        'isode-dua': Service(PROTOCOLS['tcp'], 17007, 'isode-dua'),
-        'isoft-p2p': Service(PROTOCOLS['tcp'], 3501, 'isoft-p2p'),
-        'isoipsigport-1': Service(PROTOCOLS['tcp'], 1106, 'isoipsigport-1'),
-        'isoipsigport-2': Service(PROTOCOLS['tcp'], 1107, 'isoipsigport-2'),
-        'isomair': Service(PROTOCOLS['tcp'], 3589, 'isomair'),
-        'ispipes': Service(PROTOCOLS['tcp'], 2853, 'ispipes'),
-        'ispmmgr': Service(PROTOCOLS['tcp'], 3775, 'ispmmgr'),
-        'isrp-port': Service(PROTOCOLS['tcp'], 3788, 'isrp-port'),
-        'iss-mgmt-ssl': Service(PROTOCOLS['tcp'], 3995, 'iss-mgmt-ssl'),
-        'issd': Service(PROTOCOLS['tcp'], 1600, 'issd'),
-        'isysg-lm': Service(PROTOCOLS['tcp'], 1609, 'isysg-lm'),
-        'ita-agent': Service(PROTOCOLS['tcp'], 5051, 'ita-agent'),
-        'ita-manager': Service(PROTOCOLS['tcp'], 5052, 'ita-manager'),
-        'itach': Service(PROTOCOLS['tcp'], 8184, 'itach'),
-        'itactionserver1': Service(PROTOCOLS['tcp'], 7280, 'itactionserver1'),
-        'itactionserver2': Service(PROTOCOLS['tcp'], 7281, 'itactionserver2'),
-        'italk': Service(PROTOCOLS['tcp'], 12345, 'italk'),
-        'itap-ddtp': Service(PROTOCOLS['tcp'], 10100, 'itap-ddtp'),
-        'itelserverport': Service(PROTOCOLS['tcp'], 3719, 'itelserverport'),
-        'item': Service(PROTOCOLS['tcp'], 3848, 'item'),
-        'itinternet': Service(PROTOCOLS['tcp'], 2691, 'itinternet'),
-        'itm-lm': Service(PROTOCOLS['tcp'], 2828, 'itm-lm'),
-        'itm-mccs': Service(PROTOCOLS['tcp'], 3084, 'itm-mccs'),
-        'itm-mcell-s': Service(PROTOCOLS['tcp'], 828, 'itm-mcell-s'),
-        'itm-mcell-u': Service(PROTOCOLS['tcp'], 1828, 'itm-mcell-u'),
-        'ito-e-gui': Service(PROTOCOLS['tcp'], 2531, 'ito-e-gui'),
-        'itose': Service(PROTOCOLS['tcp'], 4348, 'itose'),
-        'itscomm-ns': Service(PROTOCOLS['tcp'], 1573, 'itscomm-ns'),
-        'itv-control': Service(PROTOCOLS['tcp'], 3899, 'itv-control'),
-        'itwo-server': Service(PROTOCOLS['tcp'], 4410, 'itwo-server'),
-        'iua': Service(PROTOCOLS['tcp'], 9900, 'iua'),
-        'ivcollector': Service(PROTOCOLS['tcp'], 1275, 'ivcollector'),
-        'ivecon-port': Service(PROTOCOLS['tcp'], 3258, 'ivecon-port'),
-        'ivocalize': Service(PROTOCOLS['tcp'], 5049, 'ivocalize'),
-        'ivs-database': Service(PROTOCOLS['tcp'], 38000, 'ivs-database'),
-        'ivs-insertion': Service(PROTOCOLS['tcp'], 38001, 'ivs-insertion'),
-        'ivs-video': Service(PROTOCOLS['tcp'], 2232, 'ivs-video'),
-        'ivsd': Service(PROTOCOLS['tcp'], 2241, 'ivsd'),
-        'iw-mmogame': Service(PROTOCOLS['tcp'], 3596, 'iw-mmogame'),
-        'iwb-whiteboard': Service(PROTOCOLS['tcp'], 2982, 'iwb-whiteboard'),
-        'iwec': Service(PROTOCOLS['tcp'], 4801, 'iwec'),
-        'iwg1': Service(PROTOCOLS['tcp'], 7071, 'iwg1'),
-        'iwlistener': Service(PROTOCOLS['tcp'], 2866, 'iwlistener'),
-        'iwserver': Service(PROTOCOLS['tcp'], 2166, 'iwserver'),
-        'izm': Service(PROTOCOLS['tcp'], 4109, 'izm'),
-        'j-ac': Service(PROTOCOLS['tcp'], 4107, 'j-ac'),
-        'j-lan-p': Service(PROTOCOLS['tcp'], 2808, 'j-lan-p'),
-        'j-link': Service(PROTOCOLS['tcp'], 19020, 'j-link'),
-        'jacobus-lm': Service(PROTOCOLS['tcp'], 1578, 'jacobus-lm'),
-        'jaleosnd': Service(PROTOCOLS['tcp'], 1623, 'jaleosnd'),
-        'jamlink': Service(PROTOCOLS['tcp'], 8091, 'jamlink'),
-        'jamserverport': Service(PROTOCOLS['tcp'], 3627, 'jamserverport'),
-        'jargon': Service(PROTOCOLS['tcp'], 148, 'jargon'),
-        'jaugsremotec-1': Service(PROTOCOLS['tcp'], 3472, 'jaugsremotec-1'),
-        'jaugsremotec-2': Service(PROTOCOLS['tcp'], 3473, 'jaugsremotec-2'),
-        'jaus': Service(PROTOCOLS['tcp'], 3794, 'jaus'),
-        'jaxer-manager': Service(PROTOCOLS['tcp'], 4328, 'jaxer-manager'),
-        'jaxer-web': Service(PROTOCOLS['tcp'], 4327, 'jaxer-web'),
-        'jaxflow': Service(PROTOCOLS['tcp'], 5229, 'jaxflow'),
-        'jaxflow-data': Service(PROTOCOLS['tcp'], 5230, 'jaxflow-data'),
-        'jboss-iiop': Service(PROTOCOLS['tcp'], 3528, 'jboss-iiop'),
-        'jboss-iiop-ssl': Service(PROTOCOLS['tcp'], 3529, 'jboss-iiop-ssl'),
-        'jbroker': Service(PROTOCOLS['tcp'], 2506, 'jbroker'),
-        'jcp': Service(PROTOCOLS['tcp'], 19541, 'jcp'),
-        'jdatastore': Service(PROTOCOLS['tcp'], 2508, 'jdatastore'),
-        'jdl-dbkitchen': Service(PROTOCOLS['tcp'], 3086, 'jdl-dbkitchen'),
-        'jdmn-port': Service(PROTOCOLS['tcp'], 4030, 'jdmn-port'),
-        'jediserver': Service(PROTOCOLS['tcp'], 2406, 'jediserver'),
-        'jeol-nsdtp-1': Service(PROTOCOLS['tcp'], 6241, 'jeol-nsdtp-1'),
-        'jeol-nsdtp-2': Service(PROTOCOLS['tcp'], 6242, 'jeol-nsdtp-2'),
-        'jeol-nsdtp-3': Service(PROTOCOLS['tcp'], 6243, 'jeol-nsdtp-3'),
-        'jeol-nsdtp-4': Service(PROTOCOLS['tcp'], 6244, 'jeol-nsdtp-4'),
-        'jerand-lm': Service(PROTOCOLS['tcp'], 1810, 'jerand-lm'),
-        'jesmsjc': Service(PROTOCOLS['tcp'], 27442, 'jesmsjc'),
-        'jetcmeserver': Service(PROTOCOLS['tcp'], 1936, 'jetcmeserver'),
-        'jetform': Service(PROTOCOLS['tcp'], 1706, 'jetform'),
-        'jetformpreview': Service(PROTOCOLS['tcp'], 2097, 'jetformpreview'),
-        'jetstream': Service(PROTOCOLS['tcp'], 6901, 'jetstream'),
-        'jibe-eb': Service(PROTOCOLS['tcp'], 3777, 'jibe-eb'),
-        'jini-discovery': Service(PROTOCOLS['tcp'], 4160, 'jini-discovery'),
-        'jlicelmd': Service(PROTOCOLS['tcp'], 1567, 'jlicelmd'),
-        'jmact3': Service(PROTOCOLS['tcp'], 6961, 'jmact3'),
-        'jmact5': Service(PROTOCOLS['tcp'], 2957, 'jmact5'),
-        'jmact6': Service(PROTOCOLS['tcp'], 2958, 'jmact6'),
-        'jmb-cds1': Service(PROTOCOLS['tcp'], 8900, 'jmb-cds1'),
-        'jmb-cds2': Service(PROTOCOLS['tcp'], 8901, 'jmb-cds2'),
-        'jmevt2': Service(PROTOCOLS['tcp'], 6962, 'jmevt2'),
-        'jmq-daemon-1': Service(PROTOCOLS['tcp'], 3214, 'jmq-daemon-1'),
-        'jmq-daemon-2': Service(PROTOCOLS['tcp'], 3215, 'jmq-daemon-2'),
-        'jms': Service(PROTOCOLS['tcp'], 5673, 'jms'),
-        'joajewelsuite': Service(PROTOCOLS['tcp'], 6583, 'joajewelsuite'),
-        'joltid': Service(PROTOCOLS['tcp'], 3531, 'joltid'),
-        'jomamqmonitor': Service(PROTOCOLS['tcp'], 4114, 'jomamqmonitor'),
-        'joost': Service(PROTOCOLS['tcp'], 4166, 'joost'),
-        'journee': Service(PROTOCOLS['tcp'], 3042, 'journee'),
-        'jpegmpeg': Service(PROTOCOLS['tcp'], 3155, 'jpegmpeg'),
-        'jprinter': Service(PROTOCOLS['tcp'], 5309, 'jprinter'),
-        'jps': Service(PROTOCOLS['tcp'], 2205, 'jps'),
-        'jstel': Service(PROTOCOLS['tcp'], 1064, 'jstel'),
-        'jt400': Service(PROTOCOLS['tcp'], 3470, 'jt400'),
-        'jt400-ssl': Service(PROTOCOLS['tcp'], 3471, 'jt400-ssl'),
-        'jtag-server': Service(PROTOCOLS['tcp'], 1309, 'jtag-server'),
-        'jtnetd-server': Service(PROTOCOLS['tcp'], 5033, 'jtnetd-server'),
-        'jtnetd-status': Service(PROTOCOLS['tcp'], 5034, 'jtnetd-status'),
-        'jute': Service(PROTOCOLS['tcp'], 5883, 'jute'),
-        'juxml-port': Service(PROTOCOLS['tcp'], 3642, 'juxml-port'),
-        'jvclient': Service(PROTOCOLS['tcp'], 1940, 'jvclient'),
-        'jvserver': Service(PROTOCOLS['tcp'], 1939, 'jvserver'),
-        'jwalkserver': Service(PROTOCOLS['tcp'], 1289, 'jwalkserver'),
-        'jwclient': Service(PROTOCOLS['tcp'], 1938, 'jwclient'),
-        'jwpc': Service(PROTOCOLS['tcp'], 16020, 'jwpc'),
-        'jwpc-bin': Service(PROTOCOLS['tcp'], 16021, 'jwpc-bin'),
-        'jwserver': Service(PROTOCOLS['tcp'], 1937, 'jwserver'),
-        'k-block': Service(PROTOCOLS['tcp'], 287, 'k-block'),
-        'k3software-cli': Service(PROTOCOLS['tcp'], 26263, 'k3software-cli'),
-        'k3software-svr': Service(PROTOCOLS['tcp'], 26262, 'k3software-svr'),
-        'ka-sddp': Service(PROTOCOLS['tcp'], 31016, 'ka-sddp'),
-        'ka0wuc': Service(PROTOCOLS['tcp'], 2822, 'ka0wuc'),
-        'kali': Service(PROTOCOLS['tcp'], 2213, 'kali'),
-        'kana': Service(PROTOCOLS['tcp'], 2656, 'kana'),
-        'kar2ouche': Service(PROTOCOLS['tcp'], 4661, 'kar2ouche'),
-        'kastenchasepad': Service(PROTOCOLS['tcp'], 2918, 'kastenchasepad'),
-        'kastenxpipe': Service(PROTOCOLS['tcp'], 36865, 'kastenxpipe'),
-        'kazaa': Service(PROTOCOLS['tcp'], 1214, 'kazaa'),
-        'kdm': Service(PROTOCOLS['tcp'], 2115, 'kdm'),
-        'kentrox-prot': Service(PROTOCOLS['tcp'], 2502, 'kentrox-prot'),
-        'kerberos': Service(PROTOCOLS['tcp'], 88, 'kerberos'),
-        'kerberos-adm': Service(PROTOCOLS['tcp'], 749, 'kerberos-adm'),
-        'kermit': Service(PROTOCOLS['tcp'], 1649, 'kermit'),
-        'keyserver': Service(PROTOCOLS['tcp'], 584, 'keyserver'),
-        'keyshadow': Service(PROTOCOLS['tcp'], 19315, 'keyshadow'),
-        'keysrvr': Service(PROTOCOLS['tcp'], 19283, 'keysrvr'),
-        'kfserver': Service(PROTOCOLS['tcp'], 5343, 'kfserver'),
-        'kftp': Service(PROTOCOLS['tcp'], 6621, 'kftp'),
-        'kftp-data': Service(PROTOCOLS['tcp'], 6620, 'kftp-data'),
-        'kfxaclicensing': Service(PROTOCOLS['tcp'], 3581, 'kfxaclicensing'),
-        'kingdomsonline': Service(PROTOCOLS['tcp'], 30260, 'kingdomsonline'),
-        'kingfisher': Service(PROTOCOLS['tcp'], 4058, 'kingfisher'),
-        'kink': Service(PROTOCOLS['tcp'], 910, 'kink'),
-        'kiosk': Service(PROTOCOLS['tcp'], 1061, 'kiosk'),
-        'kis': Service(PROTOCOLS['tcp'], 186, 'kis'),
-        'kitim': Service(PROTOCOLS['tcp'], 35354, 'kitim'),
-        'kjtsiteserver': Service(PROTOCOLS['tcp'], 1339, 'kjtsiteserver'),
-        'klio': Service(PROTOCOLS['tcp'], 7697, 'klio'),
-        'klogin': Service(PROTOCOLS['tcp'], 543, 'klogin'),
-        'kme-trap-port': Service(PROTOCOLS['tcp'], 2081, 'kme-trap-port'),
-        'kmip': Service(PROTOCOLS['tcp'], 5696, 'kmip'),
-        'kmscontrol': Service(PROTOCOLS['tcp'], 1773, 'kmscontrol'),
-        'knet-cmp': Service(PROTOCOLS['tcp'], 157, 'knet-cmp'),
-        'kofax-svr': Service(PROTOCOLS['tcp'], 2424, 'kofax-svr'),
-        'konshus-lm': Service(PROTOCOLS['tcp'], 2294, 'konshus-lm'),
-        'konspire2b': Service(PROTOCOLS['tcp'], 6085, 'konspire2b'),
-        'kopek-httphead': Service(PROTOCOLS['tcp'], 27504, 'kopek-httphead'),
-        'kpasswd': Service(PROTOCOLS['tcp'], 464, 'kpasswd'),
-        'kpdp': Service(PROTOCOLS['tcp'], 5253, 'kpdp'),
-        'kpn-icw': Service(PROTOCOLS['tcp'], 3699, 'kpn-icw'),
-        'krb524': Service(PROTOCOLS['tcp'], 4444, 'krb524'),
-        'krb5gatekeeper': Service(PROTOCOLS['tcp'], 1318, 'krb5gatekeeper'),
-        'kryptolan': Service(PROTOCOLS['tcp'], 398, 'kryptolan'),
-        'kshell': Service(PROTOCOLS['tcp'], 544, 'kshell'),
-        'ksysguard': Service(PROTOCOLS['tcp'], 3112, 'ksysguard'),
-        'ktelnet': Service(PROTOCOLS['tcp'], 6623, 'ktelnet'),
-        'kti-icad-srvr': Service(PROTOCOLS['tcp'], 6701, 'kti-icad-srvr'),
-        'ktickets-rest': Service(PROTOCOLS['tcp'], 4331, 'ktickets-rest'),
-        'kv-agent': Service(PROTOCOLS['tcp'], 3361, 'kv-agent'),
-        'kv-server': Service(PROTOCOLS['tcp'], 3360, 'kv-server'),
-        'kvm-via-ip': Service(PROTOCOLS['tcp'], 1132, 'kvm-via-ip'),
-        'kwdb-commn': Service(PROTOCOLS['tcp'], 1127, 'kwdb-commn'),
-        'kwtc': Service(PROTOCOLS['tcp'], 4566, 'kwtc'),
-        'kyoceranetdev': Service(PROTOCOLS['tcp'], 1063, 'kyoceranetdev'),
-        'kz-migr': Service(PROTOCOLS['tcp'], 8102, 'kz-migr'),
-        'l-acoustics': Service(PROTOCOLS['tcp'], 4432, 'l-acoustics'),
-        'l2c-control': Service(PROTOCOLS['tcp'], 4371, 'l2c-control'),
-        'l2c-data': Service(PROTOCOLS['tcp'], 4372, 'l2c-data'),
-        'l2f': Service(PROTOCOLS['tcp'], 1701, 'l2f'),
-        'l2tp': Service(PROTOCOLS['tcp'], 1701, 'l2tp'),
-        'l3-exprt': Service(PROTOCOLS['tcp'], 2840, 'l3-exprt'),
-        'l3-hawk': Service(PROTOCOLS['tcp'], 2842, 'l3-hawk'),
-        'l3-hbmon': Service(PROTOCOLS['tcp'], 2370, 'l3-hbmon'),
-        'l3-ranger': Service(PROTOCOLS['tcp'], 2841, 'l3-ranger'),
-        'l3t-at-an': Service(PROTOCOLS['tcp'], 4591, 'l3t-at-an'),
-        'l5nas-parchan': Service(PROTOCOLS['tcp'], 9747, 'l5nas-parchan'),
-        'labrat': Service(PROTOCOLS['tcp'], 2560, 'labrat'),
-        'laes-bf': Service(PROTOCOLS['tcp'], 9536, 'laes-bf'),
-        'lam': Service(PROTOCOLS['tcp'], 2040, 'lam'),
-        'lan900-remote': Service(PROTOCOLS['tcp'], 2395, 'lan900-remote'),
-        'lan900_remote': Service(PROTOCOLS['tcp'], 2395, 'lan900_remote'),
-        'landmarks': Service(PROTOCOLS['tcp'], 3969, 'landmarks'),
-        'lanmessenger': Service(PROTOCOLS['tcp'], 2372, 'lanmessenger'),
-        'lanner-lm': Service(PROTOCOLS['tcp'], 4547, 'lanner-lm'),
-        'lanrevagent': Service(PROTOCOLS['tcp'], 3970, 'lanrevagent'),
-        'lanrevserver': Service(PROTOCOLS['tcp'], 3971, 'lanrevserver'),
-        'lanschool': Service(PROTOCOLS['tcp'], 11796, 'lanschool'),
-        'lanserver': Service(PROTOCOLS['tcp'], 637, 'lanserver'),
-        'lansource': Service(PROTOCOLS['tcp'], 1485, 'lansource'),
-        'lansurveyor': Service(PROTOCOLS['tcp'], 4347, 'lansurveyor'),
-        'lansurveyorxml': Service(PROTOCOLS['tcp'], 3815, 'lansurveyorxml'),
-        'lanyon-lantern': Service(PROTOCOLS['tcp'], 1682, 'lanyon-lantern'),
-        'laplink': Service(PROTOCOLS['tcp'], 1547, 'laplink'),
-        'launchbird-lm': Service(PROTOCOLS['tcp'], 3739, 'launchbird-lm'),
-        'lavenir-lm': Service(PROTOCOLS['tcp'], 3373, 'lavenir-lm'),
-        'lazy-ptop': Service(PROTOCOLS['tcp'], 7099, 'lazy-ptop'),
-        'lbc-control': Service(PROTOCOLS['tcp'], 2780, 'lbc-control'),
-        'lbc-measure': Service(PROTOCOLS['tcp'], 2815, 'lbc-measure'),
-        'lbc-sync': Service(PROTOCOLS['tcp'], 2779, 'lbc-sync'),
-        'lbc-watchdog': Service(PROTOCOLS['tcp'], 2816, 'lbc-watchdog'),
-        'lbf': Service(PROTOCOLS['tcp'], 2466, 'lbf'),
-        'lbm': Service(PROTOCOLS['tcp'], 2465, 'lbm'),
-        'lcm-server': Service(PROTOCOLS['tcp'], 7365, 'lcm-server'),
-        'ldap': Service(PROTOCOLS['tcp'], 389, 'ldap'),
-        'ldap-admin': Service(PROTOCOLS['tcp'], 3407, 'ldap-admin'),
-        'ldaps': Service(PROTOCOLS['tcp'], 636, 'ldaps'),
-        'ldgateway': Service(PROTOCOLS['tcp'], 9592, 'ldgateway'),
-        'ldoms-mgmt': Service(PROTOCOLS['tcp'], 6482, 'ldoms-mgmt'),
-        'ldoms-migr': Service(PROTOCOLS['tcp'], 8101, 'ldoms-migr'),
-        'ldp': Service(PROTOCOLS['tcp'], 646, 'ldp'),
-        'lds-distrib': Service(PROTOCOLS['tcp'], 6543, 'lds-distrib'),
-        'lds-dump': Service(PROTOCOLS['tcp'], 6544, 'lds-dump'),
-        'ldss': Service(PROTOCOLS['tcp'], 6087, 'ldss'),
-        'ldxp': Service(PROTOCOLS['tcp'], 4042, 'ldxp'),
-        'lecroy-vicp': Service(PROTOCOLS['tcp'], 1861, 'lecroy-vicp'),
-        'leecoposserver': Service(PROTOCOLS['tcp'], 2212, 'leecoposserver'),
-        'legent-1': Service(PROTOCOLS['tcp'], 373, 'legent-1'),
-        'legent-2': Service(PROTOCOLS['tcp'], 374, 'legent-2'),
-        'leoip': Service(PROTOCOLS['tcp'], 1886, 'leoip'),
-        'lhtp': Service(PROTOCOLS['tcp'], 1983, 'lhtp'),
-        'libelle': Service(PROTOCOLS['tcp'], 8282, 'libelle'),
-        'liberty-lm': Service(PROTOCOLS['tcp'], 1496, 'liberty-lm'),
-        'licensedaemon': Service(PROTOCOLS['tcp'], 1986, 'licensedaemon'),
-        'liebdevmgmt-a': Service(PROTOCOLS['tcp'], 3029, 'liebdevmgmt-a'),
-        'liebdevmgmt-c': Service(PROTOCOLS['tcp'], 3027, 'liebdevmgmt-c'),
-        'liebdevmgmt-dm': Service(PROTOCOLS['tcp'], 3028, 'liebdevmgmt-dm'),
-        'liebdevmgmt_a': Service(PROTOCOLS['tcp'], 3029, 'liebdevmgmt_a'),
-        'liebdevmgmt_c': Service(PROTOCOLS['tcp'], 3027, 'liebdevmgmt_c'),
-        'liebdevmgmt_dm': Service(PROTOCOLS['tcp'], 3028, 'liebdevmgmt_dm'),
-        'light': Service(PROTOCOLS['tcp'], 4670, 'light'),
-        'limnerpressure': Service(PROTOCOLS['tcp'], 8191, 'limnerpressure'),
-        'link': Service(PROTOCOLS['tcp'], 245, 'link'),
-        'linkname': Service(PROTOCOLS['tcp'], 1903, 'linkname'),
-        'linktest': Service(PROTOCOLS['tcp'], 3746, 'linktest'),
-        'linktest-s': Service(PROTOCOLS['tcp'], 3747, 'linktest-s'),
-        'linogridengine': Service(PROTOCOLS['tcp'], 12300, 'linogridengine'),
-        'linx': Service(PROTOCOLS['tcp'], 1361, 'linx'),
-        'lionhead': Service(PROTOCOLS['tcp'], 2611, 'lionhead'),
-        'lipsinc': Service(PROTOCOLS['tcp'], 1968, 'lipsinc'),
-        'lipsinc1': Service(PROTOCOLS['tcp'], 1969, 'lipsinc1'),
-        'lisp-cons': Service(PROTOCOLS['tcp'], 4342, 'lisp-cons'),
-        'lisp-data': Service(PROTOCOLS['tcp'], 4341, 'lisp-data'),
-        'lispworks-orb': Service(PROTOCOLS['tcp'], 3672, 'lispworks-orb'),
-        'listcrt-port': Service(PROTOCOLS['tcp'], 3913, 'listcrt-port'),
-        'listcrt-port-2': Service(PROTOCOLS['tcp'], 3914, 'listcrt-port-2'),
-        'listmgr-port': Service(PROTOCOLS['tcp'], 3767, 'listmgr-port'),
-        'livelan': Service(PROTOCOLS['tcp'], 1555, 'livelan'),
-        'livestats': Service(PROTOCOLS['tcp'], 2795, 'livestats'),
-        'ljk-login': Service(PROTOCOLS['tcp'], 472, 'ljk-login'),
-        'lkcmserver': Service(PROTOCOLS['tcp'], 3278, 'lkcmserver'),
-        'llm-csv': Service(PROTOCOLS['tcp'], 2814, 'llm-csv'),
-        'llm-pass': Service(PROTOCOLS['tcp'], 2813, 'llm-pass'),
-        'llmnr': Service(PROTOCOLS['tcp'], 5355, 'llmnr'),
-        'llrp': Service(PROTOCOLS['tcp'], 5084, 'llrp'),
-        'llsurfup-http': Service(PROTOCOLS['tcp'], 1183, 'llsurfup-http'),
-        'llsurfup-https': Service(PROTOCOLS['tcp'], 1184, 'llsurfup-https'),
-        'lm-dta': Service(PROTOCOLS['tcp'], 8206, 'lm-dta'),
-        'lm-instmgr': Service(PROTOCOLS['tcp'], 8205, 'lm-instmgr'),
-        'lm-mon': Service(PROTOCOLS['tcp'], 31620, 'lm-mon'),
-        'lm-perfworks': Service(PROTOCOLS['tcp'], 8204, 'lm-perfworks'),
-        'lm-sserver': Service(PROTOCOLS['tcp'], 8207, 'lm-sserver'),
-        'lm-webwatcher': Service(PROTOCOLS['tcp'], 8208, 'lm-webwatcher'),
-        'lm-x': Service(PROTOCOLS['tcp'], 6200, 'lm-x'),
-        'lmcs': Service(PROTOCOLS['tcp'], 4877, 'lmcs'),
-        'lmdp': Service(PROTOCOLS['tcp'], 2623, 'lmdp'),
-        'lmp': Service(PROTOCOLS['tcp'], 701, 'lmp'),
-        'lms': Service(PROTOCOLS['tcp'], 4056, 'lms'),
-        'lmsocialserver': Service(PROTOCOLS['tcp'], 1111, 'lmsocialserver'),
-        'lnvalarm': Service(PROTOCOLS['tcp'], 2282, 'lnvalarm'),
-        'lnvconsole': Service(PROTOCOLS['tcp'], 2281, 'lnvconsole'),
-        'lnvmailmon': Service(PROTOCOLS['tcp'], 2285, 'lnvmailmon'),
-        'lnvmaps': Service(PROTOCOLS['tcp'], 2284, 'lnvmaps'),
-        'lnvpoller': Service(PROTOCOLS['tcp'], 2280, 'lnvpoller'),
-        'lnvstatus': Service(PROTOCOLS['tcp'], 2283, 'lnvstatus'),
-        'loaprobe': Service(PROTOCOLS['tcp'], 1634, 'loaprobe'),
-        'localinfosrvr': Service(PROTOCOLS['tcp'], 1487, 'localinfosrvr'),
-        'lockstep': Service(PROTOCOLS['tcp'], 2125, 'lockstep'),
-        'locus-con': Service(PROTOCOLS['tcp'], 127, 'locus-con'),
-        'locus-map': Service(PROTOCOLS['tcp'], 125, 'locus-map'),
-        'lofr-lm': Service(PROTOCOLS['tcp'], 1752, 'lofr-lm'),
-        'logcabin': Service(PROTOCOLS['tcp'], 5254, 'logcabin'),
-        'login': Service(PROTOCOLS['tcp'], 513, 'login'),
-        'lonewolf-lm': Service(PROTOCOLS['tcp'], 6146, 'lonewolf-lm'),
-        'lontalk-norm': Service(PROTOCOLS['tcp'], 1628, 'lontalk-norm'),
-        'lontalk-urgnt': Service(PROTOCOLS['tcp'], 1629, 'lontalk-urgnt'),
-        'lonworks': Service(PROTOCOLS['tcp'], 2540, 'lonworks'),
-        'lonworks2': Service(PROTOCOLS['tcp'], 2541, 'lonworks2'),
-        'lorica-in': Service(PROTOCOLS['tcp'], 4080, 'lorica-in'),
-        'lorica-in-sec': Service(PROTOCOLS['tcp'], 4081, 'lorica-in-sec'),
-        'lorica-out': Service(PROTOCOLS['tcp'], 4082, 'lorica-out'),
-        'lorica-out-sec': Service(PROTOCOLS['tcp'], 4083, 'lorica-out-sec'),
-        'lot105-ds-upd': Service(PROTOCOLS['tcp'], 2053, 'lot105-ds-upd'),
-        'lotusmtap': Service(PROTOCOLS['tcp'], 3007, 'lotusmtap'),
-        'lotusnote': Service(PROTOCOLS['tcp'], 1352, 'lotusnote'),
-        'lpar2rrd': Service(PROTOCOLS['tcp'], 8162, 'lpar2rrd'),
-        'lpcp': Service(PROTOCOLS['tcp'], 1298, 'lpcp'),
-        'lpdg': Service(PROTOCOLS['tcp'], 10805, 'lpdg'),
-        'lpsrecommender': Service(PROTOCOLS['tcp'], 2620, 'lpsrecommender'),
-        'lrp': Service(PROTOCOLS['tcp'], 2090, 'lrp'),
-        'lrs-paging': Service(PROTOCOLS['tcp'], 3700, 'lrs-paging'),
-        'ls3': Service(PROTOCOLS['tcp'], 3069, 'ls3'),
-        'ls3bcast': Service(PROTOCOLS['tcp'], 3068, 'ls3bcast'),
-        'lsi-bobcat': Service(PROTOCOLS['tcp'], 5574, 'lsi-bobcat'),
-        'lsi-raid-mgmt': Service(PROTOCOLS['tcp'], 2463, 'lsi-raid-mgmt'),
-        'lsp-ping': Service(PROTOCOLS['tcp'], 3503, 'lsp-ping'),
-        'lstp': Service(PROTOCOLS['tcp'], 2559, 'lstp'),
-        'ltctcp': Service(PROTOCOLS['tcp'], 3487, 'ltctcp'),
-        'ltp': Service(PROTOCOLS['tcp'], 4044, 'ltp'),
-        'ltp-deepspace': Service(PROTOCOLS['tcp'], 1113, 'ltp-deepspace'),
-        'lumimgrd': Service(PROTOCOLS['tcp'], 4741, 'lumimgrd'),
-        'lupa': Service(PROTOCOLS['tcp'], 1212, 'lupa'),
-        'lutap': Service(PROTOCOLS['tcp'], 4912, 'lutap'),
-        'lutcp': Service(PROTOCOLS['tcp'], 4913, 'lutcp'),
-        'lv-auth': Service(PROTOCOLS['tcp'], 2147, 'lv-auth'),
-        'lv-ffx': Service(PROTOCOLS['tcp'], 2144, 'lv-ffx'),
-        'lv-frontpanel': Service(PROTOCOLS['tcp'], 3079, 'lv-frontpanel'),
-        'lv-jc': Service(PROTOCOLS['tcp'], 2143, 'lv-jc'),
-        'lv-not': Service(PROTOCOLS['tcp'], 2146, 'lv-not'),
-        'lv-pici': Service(PROTOCOLS['tcp'], 2145, 'lv-pici'),
-        'lvision-lm': Service(PROTOCOLS['tcp'], 6471, 'lvision-lm'),
-        'lxi-evntsvc': Service(PROTOCOLS['tcp'], 5044, 'lxi-evntsvc'),
-        'lyskom': Service(PROTOCOLS['tcp'], 4894, 'lyskom'),
-        'm-wnn': Service(PROTOCOLS['tcp'], 3732, 'm-wnn'),
-        'm2mservices': Service(PROTOCOLS['tcp'], 8383, 'm2mservices'),
-        'm2pa': Service(PROTOCOLS['tcp'], 3565, 'm2pa'),
-        'm2ua': Service(PROTOCOLS['tcp'], 2904, 'm2ua'),
-        'm3da': Service(PROTOCOLS['tcp'], 44900, 'm3da'),
-        'm3ua': Service(PROTOCOLS['tcp'], 2905, 'm3ua'),
-        'm4-network-as': Service(PROTOCOLS['tcp'], 4345, 'm4-network-as'),
-        'mac-srvr-admin': Service(PROTOCOLS['tcp'], 660, 'mac-srvr-admin'),
-        'macbak': Service(PROTOCOLS['tcp'], 4181, 'macbak'),
-        'macon-tcp': Service(PROTOCOLS['tcp'], 456, 'macon-tcp'),
-        'macromedia-fcs': Service(PROTOCOLS['tcp'], 1935, 'macromedia-fcs'),
-        'madcap': Service(PROTOCOLS['tcp'], 2535, 'madcap'),
-        'madge-ltd': Service(PROTOCOLS['tcp'], 2453, 'madge-ltd'),
-        'magaya-network': Service(PROTOCOLS['tcp'], 3691, 'magaya-network'),
-        'magbind': Service(PROTOCOLS['tcp'], 3194, 'magbind'),
-        'magenta-logic': Service(PROTOCOLS['tcp'], 313, 'magenta-logic'),
-        'magiccontrol': Service(PROTOCOLS['tcp'], 4902, 'magiccontrol'),
-        'magicnotes': Service(PROTOCOLS['tcp'], 3023, 'magicnotes'),
-        'magicom': Service(PROTOCOLS['tcp'], 2243, 'magicom'),
-        'mailbox': Service(PROTOCOLS['tcp'], 2004, 'mailbox'),
-        'mailbox-lm': Service(PROTOCOLS['tcp'], 505, 'mailbox-lm'),
-        'mailprox': Service(PROTOCOLS['tcp'], 3936, 'mailprox'),
-        'mailq': Service(PROTOCOLS['tcp'], 174, 'mailq'),
-        'maincontrol': Service(PROTOCOLS['tcp'], 2516, 'maincontrol'),
-        'mainsoft-lm': Service(PROTOCOLS['tcp'], 1593, 'mainsoft-lm'),
-        'maitrd': Service(PROTOCOLS['tcp'], 997, 'maitrd'),
-        'manage-exec': Service(PROTOCOLS['tcp'], 2342, 'manage-exec'),
-        'manet': Service(PROTOCOLS['tcp'], 269, 'manet'),
-        'manyone-http': Service(PROTOCOLS['tcp'], 8910, 'manyone-http'),
-        'manyone-xml': Service(PROTOCOLS['tcp'], 8911, 'manyone-xml'),
-        'mao': Service(PROTOCOLS['tcp'], 2908, 'mao'),
-        'mapper-mapethd': Service(PROTOCOLS['tcp'], 3985, 'mapper-mapethd'),
-        'mapper-nodemgr': Service(PROTOCOLS['tcp'], 3984, 'mapper-nodemgr'),
-        'mapper-ws-ethd': Service(PROTOCOLS['tcp'], 3986, 'mapper-ws-ethd'),
-        'mapper-ws_ethd': Service(PROTOCOLS['tcp'], 3986, 'mapper-ws_ethd'),
-        'mapx': Service(PROTOCOLS['tcp'], 36700, 'mapx'),
-        'marcam-lm': Service(PROTOCOLS['tcp'], 1444, 'marcam-lm'),
-        'markem-dcp': Service(PROTOCOLS['tcp'], 3836, 'markem-dcp'),
-        'martalk': Service(PROTOCOLS['tcp'], 7073, 'martalk'),
-        'masc': Service(PROTOCOLS['tcp'], 2587, 'masc'),
-        'masqdialer': Service(PROTOCOLS['tcp'], 224, 'masqdialer'),
-        'matahari': Service(PROTOCOLS['tcp'], 49000, 'matahari'),
-        'matip-type-a': Service(PROTOCOLS['tcp'], 350, 'matip-type-a'),
-        'matip-type-b': Service(PROTOCOLS['tcp'], 351, 'matip-type-b'),
-        'matrix-vnet': Service(PROTOCOLS['tcp'], 4360, 'matrix-vnet'),
-        'matrix_vnet': Service(PROTOCOLS['tcp'], 4360, 'matrix_vnet'),
-        'max': Service(PROTOCOLS['tcp'], 6074, 'max'),
-        'maxim-asics': Service(PROTOCOLS['tcp'], 3276, 'maxim-asics'),
-        'maxumsp': Service(PROTOCOLS['tcp'], 4179, 'maxumsp'),
-        'maytagshuffle': Service(PROTOCOLS['tcp'], 2591, 'maytagshuffle'),
-        'mbap': Service(PROTOCOLS['tcp'], 502, 'mbap'),
-        'mbap-s': Service(PROTOCOLS['tcp'], 802, 'mbap-s'),
-        'mbg-ctrl': Service(PROTOCOLS['tcp'], 3569, 'mbg-ctrl'),
-        'mbl-battd': Service(PROTOCOLS['tcp'], 4153, 'mbl-battd'),
-        'mbus': Service(PROTOCOLS['tcp'], 47000, 'mbus'),
-        'mc-appserver': Service(PROTOCOLS['tcp'], 8763, 'mc-appserver'),
-        'mc-brk-srv': Service(PROTOCOLS['tcp'], 3180, 'mc-brk-srv'),
-        'mc-client': Service(PROTOCOLS['tcp'], 1180, 'mc-client'),
-        'mc-gt-srv': Service(PROTOCOLS['tcp'], 2180, 'mc-gt-srv'),
-        'mc2studios': Service(PROTOCOLS['tcp'], 1899, 'mc2studios'),
-        'mc3ss': Service(PROTOCOLS['tcp'], 3521, 'mc3ss'),
-        'mcagent': Service(PROTOCOLS['tcp'], 1820, 'mcagent'),
-        'mccwebsvr-port': Service(PROTOCOLS['tcp'], 3570, 'mccwebsvr-port'),
-        'mcer-port': Service(PROTOCOLS['tcp'], 6510, 'mcer-port'),
-        'mcftp': Service(PROTOCOLS['tcp'], 6622, 'mcftp'),
-        'mcidas': Service(PROTOCOLS['tcp'], 112, 'mcidas'),
-        'mck-ivpip': Service(PROTOCOLS['tcp'], 2698, 'mck-ivpip'),
-        'mcns-sec': Service(PROTOCOLS['tcp'], 638, 'mcns-sec'),
-        'mcns-tel-ret': Service(PROTOCOLS['tcp'], 3311, 'mcns-tel-ret'),
-        'mcntp': Service(PROTOCOLS['tcp'], 5418, 'mcntp'),
-        'mcp': Service(PROTOCOLS['tcp'], 4458, 'mcp'),
-        'mcp-port': Service(PROTOCOLS['tcp'], 3558, 'mcp-port'),
-        'mcreport': Service(PROTOCOLS['tcp'], 8003, 'mcreport'),
-        'mcs-calypsoicf': Service(PROTOCOLS['tcp'], 3330, 'mcs-calypsoicf'),
-        'mcs-fastmail': Service(PROTOCOLS['tcp'], 3302, 'mcs-fastmail'),
-        'mcs-mailsvr': Service(PROTOCOLS['tcp'], 3332, 'mcs-mailsvr'),
-        'mcs-messaging': Service(PROTOCOLS['tcp'], 3331, 'mcs-messaging'),
-        'mctet-gateway': Service(PROTOCOLS['tcp'], 3116, 'mctet-gateway'),
-        'mctet-jserv': Service(PROTOCOLS['tcp'], 3117, 'mctet-jserv'),
-        'mctet-master': Service(PROTOCOLS['tcp'], 3115, 'mctet-master'),
-        'mctfeed': Service(PROTOCOLS['tcp'], 5598, 'mctfeed'),
-        'mctp': Service(PROTOCOLS['tcp'], 1100, 'mctp'),
-        'md-cg-http': Service(PROTOCOLS['tcp'], 2688, 'md-cg-http'),
-        'mdap-port': Service(PROTOCOLS['tcp'], 3235, 'mdap-port'),
-        'mdbs-daemon': Service(PROTOCOLS['tcp'], 800, 'mdbs-daemon'),
-        'mdbs_daemon': Service(PROTOCOLS['tcp'], 800, 'mdbs_daemon'),
-        'mdc-portmapper': Service(PROTOCOLS['tcp'], 685, 'mdc-portmapper'),
-        'mdm': Service(PROTOCOLS['tcp'], 7871, 'mdm'),
-        'mdns': Service(PROTOCOLS['tcp'], 5353, 'mdns'),
-        'mdnsresponder': Service(PROTOCOLS['tcp'], 5354, 'mdnsresponder'),
-        'mdqs': Service(PROTOCOLS['tcp'], 666, 'mdqs'),
-        'mdtp': Service(PROTOCOLS['tcp'], 3232, 'mdtp'),
-        'mecomm': Service(PROTOCOLS['tcp'], 668, 'mecomm'),
-        'med-ci': Service(PROTOCOLS['tcp'], 24005, 'med-ci'),
-        'med-fsp-rx': Service(PROTOCOLS['tcp'], 24001, 'med-fsp-rx'),
-        'med-fsp-tx': Service(PROTOCOLS['tcp'], 24002, 'med-fsp-tx'),
-        'med-ltp': Service(PROTOCOLS['tcp'], 24000, 'med-ltp'),
-        'med-net-svc': Service(PROTOCOLS['tcp'], 24006, 'med-net-svc'),
-        'med-ovw': Service(PROTOCOLS['tcp'], 24004, 'med-ovw'),
-        'med-supp': Service(PROTOCOLS['tcp'], 24003, 'med-supp'),
-        'medevolve': Service(PROTOCOLS['tcp'], 13930, 'medevolve'),
-        'media-agent': Service(PROTOCOLS['tcp'], 2789, 'media-agent'),
-        'mediabox': Service(PROTOCOLS['tcp'], 46999, 'mediabox'),
-        'mediacntrlnfsd': Service(PROTOCOLS['tcp'], 2363, 'mediacntrlnfsd'),
-        'mediaspace': Service(PROTOCOLS['tcp'], 3594, 'mediaspace'),
-        'mediat': Service(PROTOCOLS['tcp'], 5157, 'mediat'),
-        'mediavault-gui': Service(PROTOCOLS['tcp'], 3673, 'mediavault-gui'),
-        'medimageportal': Service(PROTOCOLS['tcp'], 7720, 'medimageportal'),
-        'megaco-h248': Service(PROTOCOLS['tcp'], 2944, 'megaco-h248'),
-        'megardsvr-port': Service(PROTOCOLS['tcp'], 3571, 'megardsvr-port'),
-        'megaregsvrport': Service(PROTOCOLS['tcp'], 3572, 'megaregsvrport'),
-        'memcache': Service(PROTOCOLS['tcp'], 11211, 'memcache'),
-        'menandmice-dns': Service(PROTOCOLS['tcp'], 1337, 'menandmice-dns'),
-        'menandmice-lpm': Service(PROTOCOLS['tcp'], 1231, 'menandmice-lpm'),
-        'menandmice-mon': Service(PROTOCOLS['tcp'], 4552, 'menandmice-mon'),
-        'menandmice-noh': Service(PROTOCOLS['tcp'], 4151, 'menandmice-noh'),
-        'menandmice-upg': Service(PROTOCOLS['tcp'], 4603, 'menandmice-upg'),
-        'menandmice_noh': Service(PROTOCOLS['tcp'], 4151, 'menandmice_noh'),
-        'mentaclient': Service(PROTOCOLS['tcp'], 2117, 'mentaclient'),
-        'mentaserver': Service(PROTOCOLS['tcp'], 2118, 'mentaserver'),
-        'mercantile': Service(PROTOCOLS['tcp'], 3398, 'mercantile'),
-        'mercury-disc': Service(PROTOCOLS['tcp'], 9596, 'mercury-disc'),
-        'meregister': Service(PROTOCOLS['tcp'], 669, 'meregister'),
-        'mesavistaco': Service(PROTOCOLS['tcp'], 1249, 'mesavistaco'),
-        'messageasap': Service(PROTOCOLS['tcp'], 6070, 'messageasap'),
-        'messageservice': Service(PROTOCOLS['tcp'], 2311, 'messageservice'),
-        'meta-corp': Service(PROTOCOLS['tcp'], 6141, 'meta-corp'),
-        'meta5': Service(PROTOCOLS['tcp'], 393, 'meta5'),
-        'metaagent': Service(PROTOCOLS['tcp'], 1897, 'metaagent'),
-        'metaconsole': Service(PROTOCOLS['tcp'], 2850, 'metaconsole'),
-        'metaedit-mu': Service(PROTOCOLS['tcp'], 6360, 'metaedit-mu'),
-        'metaedit-se': Service(PROTOCOLS['tcp'], 6370, 'metaedit-se'),
-        'metaedit-ws': Service(PROTOCOLS['tcp'], 6390, 'metaedit-ws'),
-        'metagram': Service(PROTOCOLS['tcp'], 99, 'metagram'),
-        'metalbend': Service(PROTOCOLS['tcp'], 7172, 'metalbend'),
-        'metasage': Service(PROTOCOLS['tcp'], 1207, 'metasage'),
-        'metastorm': Service(PROTOCOLS['tcp'], 2511, 'metastorm'),
-        'metasys': Service(PROTOCOLS['tcp'], 11001, 'metasys'),
-        'metatude-mds': Service(PROTOCOLS['tcp'], 6382, 'metatude-mds'),
-        'meter': Service(PROTOCOLS['tcp'], 571, 'meter'),
-        'metricadbc': Service(PROTOCOLS['tcp'], 2622, 'metricadbc'),
-        'metrics-pas': Service(PROTOCOLS['tcp'], 1824, 'metrics-pas'),
-        'mevent': Service(PROTOCOLS['tcp'], 7900, 'mevent'),
-        'mfcobol': Service(PROTOCOLS['tcp'], 86, 'mfcobol'),
-        'mfserver': Service(PROTOCOLS['tcp'], 2266, 'mfserver'),
-        'mftp': Service(PROTOCOLS['tcp'], 5402, 'mftp'),
-        'mgcp-callagent': Service(PROTOCOLS['tcp'], 2727, 'mgcp-callagent'),
-        'mgcp-gateway': Service(PROTOCOLS['tcp'], 2427, 'mgcp-gateway'),
-        'mgcs-mfp-port': Service(PROTOCOLS['tcp'], 6509, 'mgcs-mfp-port'),
-        'mgemanagement': Service(PROTOCOLS['tcp'], 4680, 'mgemanagement'),
-        'mgesupervision': Service(PROTOCOLS['tcp'], 4679, 'mgesupervision'),
-        'mgxswitch': Service(PROTOCOLS['tcp'], 3070, 'mgxswitch'),
-        'mib-streaming': Service(PROTOCOLS['tcp'], 2292, 'mib-streaming'),
-        'mice': Service(PROTOCOLS['tcp'], 5022, 'mice'),
-        'micom-pfs': Service(PROTOCOLS['tcp'], 490, 'micom-pfs'),
-        'microcom-sbp': Service(PROTOCOLS['tcp'], 1680, 'microcom-sbp'),
-        'micromuse-lm': Service(PROTOCOLS['tcp'], 1534, 'micromuse-lm'),
-        'micromuse-ncps': Service(PROTOCOLS['tcp'], 7979, 'micromuse-ncps'),
-        'micromuse-ncpw': Service(PROTOCOLS['tcp'], 9600, 'micromuse-ncpw'),
-        'microsan': Service(PROTOCOLS['tcp'], 20001, 'microsan'),
-        'microsoft-ds': Service(PROTOCOLS['tcp'], 445, 'microsoft-ds'),
-        'microtalon-com': Service(PROTOCOLS['tcp'], 7014, 'microtalon-com'),
-        'microtalon-dis': Service(PROTOCOLS['tcp'], 7013, 'microtalon-dis'),
-        'midnight-tech': Service(PROTOCOLS['tcp'], 3008, 'midnight-tech'),
-        'mikey': Service(PROTOCOLS['tcp'], 2269, 'mikey'),
-        'mil-2045-47001': Service(PROTOCOLS['tcp'], 1581, 'mil-2045-47001'),
-        'miles-apart': Service(PROTOCOLS['tcp'], 2621, 'miles-apart'),
-        'mimer': Service(PROTOCOLS['tcp'], 1360, 'mimer'),
-        'mindarray-ca': Service(PROTOCOLS['tcp'], 9445, 'mindarray-ca'),
-        'mindfilesys': Service(PROTOCOLS['tcp'], 7391, 'mindfilesys'),
-        'mindprint': Service(PROTOCOLS['tcp'], 8033, 'mindprint'),
-        'minger': Service(PROTOCOLS['tcp'], 4069, 'minger'),
-        'mini-sql': Service(PROTOCOLS['tcp'], 1114, 'mini-sql'),
-        'minilock': Service(PROTOCOLS['tcp'], 3798, 'minilock'),
-        'minipay': Service(PROTOCOLS['tcp'], 2105, 'minipay'),
-        'minirem': Service(PROTOCOLS['tcp'], 4120, 'minirem'),
-        'minivend': Service(PROTOCOLS['tcp'], 7786, 'minivend'),
-        'mipi-debug': Service(PROTOCOLS['tcp'], 7606, 'mipi-debug'),
-        'mira': Service(PROTOCOLS['tcp'], 3454, 'mira'),
-        'miroconnect': Service(PROTOCOLS['tcp'], 1532, 'miroconnect'),
-        'mirrtex': Service(PROTOCOLS['tcp'], 4310, 'mirrtex'),
-        'mit-dov': Service(PROTOCOLS['tcp'], 91, 'mit-dov'),
-        'mit-ml-dev': Service(PROTOCOLS['tcp'], 85, 'mit-ml-dev'),
-        'miteksys-lm': Service(PROTOCOLS['tcp'], 1482, 'miteksys-lm'),
-        'miva-mqs': Service(PROTOCOLS['tcp'], 1277, 'miva-mqs'),
-        'mkm-discovery': Service(PROTOCOLS['tcp'], 3837, 'mkm-discovery'),
-        'ml-svnet': Service(PROTOCOLS['tcp'], 4171, 'ml-svnet'),
-        'mles': Service(PROTOCOLS['tcp'], 8077, 'mles'),
-        'mloadd': Service(PROTOCOLS['tcp'], 1427, 'mloadd'),
-        'mlsn': Service(PROTOCOLS['tcp'], 32801, 'mlsn'),
-        'mmacomm': Service(PROTOCOLS['tcp'], 4667, 'mmacomm'),
-        'mmaeds': Service(PROTOCOLS['tcp'], 4668, 'mmaeds'),
-        'mmcal': Service(PROTOCOLS['tcp'], 2272, 'mmcal'),
-        'mmcals': Service(PROTOCOLS['tcp'], 2271, 'mmcals'),
-        'mmcc': Service(PROTOCOLS['tcp'], 5050, 'mmcc'),
-        'mmpft': Service(PROTOCOLS['tcp'], 1815, 'mmpft'),
-        'mnet-discovery': Service(PROTOCOLS['tcp'], 5237, 'mnet-discovery'),
-        'mngsuite': Service(PROTOCOLS['tcp'], 9535, 'mngsuite'),
-        'mni-prot-rout': Service(PROTOCOLS['tcp'], 3764, 'mni-prot-rout'),
-        'mnp-exchange': Service(PROTOCOLS['tcp'], 2197, 'mnp-exchange'),
-        'mns-mail': Service(PROTOCOLS['tcp'], 2593, 'mns-mail'),
-        'mobile-file-dl': Service(PROTOCOLS['tcp'], 2926, 'mobile-file-dl'),
-        'mobile-p2p': Service(PROTOCOLS['tcp'], 4688, 'mobile-p2p'),
-        'mobileanalyzer': Service(PROTOCOLS['tcp'], 7869, 'mobileanalyzer'),
-        'mobileip-agent': Service(PROTOCOLS['tcp'], 434, 'mobileip-agent'),
-        'mobilip-mn': Service(PROTOCOLS['tcp'], 435, 'mobilip-mn'),
-        'mobilitysrv': Service(PROTOCOLS['tcp'], 6997, 'mobilitysrv'),
-        'mobrien-chat': Service(PROTOCOLS['tcp'], 2031, 'mobrien-chat'),
-        'moldflow-lm': Service(PROTOCOLS['tcp'], 1576, 'moldflow-lm'),
-        'molly': Service(PROTOCOLS['tcp'], 1374, 'molly'),
-        'mon': Service(PROTOCOLS['tcp'], 9255, 'mon'),
-        'mondex': Service(PROTOCOLS['tcp'], 471, 'mondex'),
-        'monetra': Service(PROTOCOLS['tcp'], 8665, 'monetra'),
-        'monetra-admin': Service(PROTOCOLS['tcp'], 8666, 'monetra-admin'),
-        'monitor': Service(PROTOCOLS['tcp'], 561, 'monitor'),
-        'monkeycom': Service(PROTOCOLS['tcp'], 9898, 'monkeycom'),
-        'monp': Service(PROTOCOLS['tcp'], 3445, 'monp'),
-        'montage-lm': Service(PROTOCOLS['tcp'], 6147, 'montage-lm'),
-        'mortgageware': Service(PROTOCOLS['tcp'], 367, 'mortgageware'),
-        'mos-aux': Service(PROTOCOLS['tcp'], 10542, 'mos-aux'),
-        'mos-lower': Service(PROTOCOLS['tcp'], 10540, 'mos-lower'),
-        'mos-soap': Service(PROTOCOLS['tcp'], 10543, 'mos-soap'),
-        'mos-soap-opt': Service(PROTOCOLS['tcp'], 10544, 'mos-soap-opt'),
-        'mos-upper': Service(PROTOCOLS['tcp'], 10541, 'mos-upper'),
-        'mosaicsyssvc1': Service(PROTOCOLS['tcp'], 1235, 'mosaicsyssvc1'),
-        'mosaixcc': Service(PROTOCOLS['tcp'], 2561, 'mosaixcc'),
-        'moshebeeri': Service(PROTOCOLS['tcp'], 2627, 'moshebeeri'),
-        'mountd': Service(PROTOCOLS['tcp'], 20048, 'mountd'),
-        'movaz-ssc': Service(PROTOCOLS['tcp'], 5252, 'movaz-ssc'),
-        'moy-corp': Service(PROTOCOLS['tcp'], 2488, 'moy-corp'),
-        'mpc-lifenet': Service(PROTOCOLS['tcp'], 1213, 'mpc-lifenet'),
-        'mpfoncl': Service(PROTOCOLS['tcp'], 2579, 'mpfoncl'),
-        'mpfwsas': Service(PROTOCOLS['tcp'], 2952, 'mpfwsas'),
-        'mphlpdmc': Service(PROTOCOLS['tcp'], 9344, 'mphlpdmc'),
-        'mpidcagt': Service(PROTOCOLS['tcp'], 9397, 'mpidcagt'),
-        'mpidcmgr': Service(PROTOCOLS['tcp'], 9343, 'mpidcmgr'),
-        'mpl-gprs-port': Service(PROTOCOLS['tcp'], 3924, 'mpl-gprs-port'),
-        'mpm': Service(PROTOCOLS['tcp'], 45, 'mpm'),
-        'mpm-flags': Service(PROTOCOLS['tcp'], 44, 'mpm-flags'),
-        'mpm-snd': Service(PROTOCOLS['tcp'], 46, 'mpm-snd'),
-        'mpnjsc': Service(PROTOCOLS['tcp'], 1952, 'mpnjsc'),
-        'mpnjsocl': Service(PROTOCOLS['tcp'], 2685, 'mpnjsocl'),
-        'mpnjsomb': Service(PROTOCOLS['tcp'], 2681, 'mpnjsomb'),
-        'mpnjsomg': Service(PROTOCOLS['tcp'], 2686, 'mpnjsomg'),
-        'mpnjsosv': Service(PROTOCOLS['tcp'], 2684, 'mpnjsosv'),
-        'mpp': Service(PROTOCOLS['tcp'], 218, 'mpp'),
-        'mppolicy-mgr': Service(PROTOCOLS['tcp'], 5969, 'mppolicy-mgr'),
-        'mppolicy-v5': Service(PROTOCOLS['tcp'], 5968, 'mppolicy-v5'),
-        'mps-raft': Service(PROTOCOLS['tcp'], 1700, 'mps-raft'),
-        'mpshrsv': Service(PROTOCOLS['tcp'], 1261, 'mpshrsv'),
-        'mpsserver': Service(PROTOCOLS['tcp'], 6106, 'mpsserver'),
-        'mpsysrmsvr': Service(PROTOCOLS['tcp'], 3358, 'mpsysrmsvr'),
-        'mptn': Service(PROTOCOLS['tcp'], 397, 'mptn'),
-        'mqe-agent': Service(PROTOCOLS['tcp'], 3958, 'mqe-agent'),
-        'mqe-broker': Service(PROTOCOLS['tcp'], 3957, 'mqe-broker'),
-        'mqtt': Service(PROTOCOLS['tcp'], 1883, 'mqtt'),
-        'mrip': Service(PROTOCOLS['tcp'], 4986, 'mrip'),
-        'mrm': Service(PROTOCOLS['tcp'], 679, 'mrm'),
-        'mrssrendezvous': Service(PROTOCOLS['tcp'], 7392, 'mrssrendezvous'),
-        'ms-alerter': Service(PROTOCOLS['tcp'], 5359, 'ms-alerter'),
-        'ms-cluster-net': Service(PROTOCOLS['tcp'], 3343, 'ms-cluster-net'),
-        'ms-ilm': Service(PROTOCOLS['tcp'], 5725, 'ms-ilm'),
-        'ms-ilm-sts': Service(PROTOCOLS['tcp'], 5726, 'ms-ilm-sts'),
-        'ms-la': Service(PROTOCOLS['tcp'], 3535, 'ms-la'),
-        'ms-licensing': Service(PROTOCOLS['tcp'], 5720, 'ms-licensing'),
-        'ms-olap1': Service(PROTOCOLS['tcp'], 2393, 'ms-olap1'),
-        'ms-olap2': Service(PROTOCOLS['tcp'], 2394, 'ms-olap2'),
-        'ms-olap3': Service(PROTOCOLS['tcp'], 2382, 'ms-olap3'),
-        'ms-olap4': Service(PROTOCOLS['tcp'], 2383, 'ms-olap4'),
-        'ms-rome': Service(PROTOCOLS['tcp'], 569, 'ms-rome'),
-        'ms-rule-engine': Service(PROTOCOLS['tcp'], 3132, 'ms-rule-engine'),
-        'ms-s-sideshow': Service(PROTOCOLS['tcp'], 5361, 'ms-s-sideshow'),
-        'ms-shuttle': Service(PROTOCOLS['tcp'], 568, 'ms-shuttle'),
-        'ms-sideshow': Service(PROTOCOLS['tcp'], 5360, 'ms-sideshow'),
-        'ms-smlbiz': Service(PROTOCOLS['tcp'], 5356, 'ms-smlbiz'),
-        'ms-sna-base': Service(PROTOCOLS['tcp'], 1478, 'ms-sna-base'),
-        'ms-sna-server': Service(PROTOCOLS['tcp'], 1477, 'ms-sna-server'),
-        'ms-sql-m': Service(PROTOCOLS['tcp'], 1434, 'ms-sql-m'),
-        'ms-sql-s': Service(PROTOCOLS['tcp'], 1433, 'ms-sql-s'),
-        'ms-streaming': Service(PROTOCOLS['tcp'], 1755, 'ms-streaming'),
-        'ms-theater': Service(PROTOCOLS['tcp'], 2460, 'ms-theater'),
-        'ms-v-worlds': Service(PROTOCOLS['tcp'], 2525, 'ms-v-worlds'),
-        'ms-wbt-server': Service(PROTOCOLS['tcp'], 3389, 'ms-wbt-server'),
-        'msdfsr': Service(PROTOCOLS['tcp'], 5722, 'msdfsr'),
-        'msdp': Service(PROTOCOLS['tcp'], 639, 'msdp'),
-        'msdts1': Service(PROTOCOLS['tcp'], 3882, 'msdts1'),
-        'msexch-routing': Service(PROTOCOLS['tcp'], 691, 'msexch-routing'),
-        'msfrs': Service(PROTOCOLS['tcp'], 4554, 'msfrs'),
-        'msft-dpm-cert': Service(PROTOCOLS['tcp'], 6076, 'msft-dpm-cert'),
-        'msft-gc': Service(PROTOCOLS['tcp'], 3268, 'msft-gc'),
-        'msft-gc-ssl': Service(PROTOCOLS['tcp'], 3269, 'msft-gc-ssl'),
-        'msfw-array': Service(PROTOCOLS['tcp'], 2174, 'msfw-array'),
-        'msfw-control': Service(PROTOCOLS['tcp'], 3847, 'msfw-control'),
-        'msfw-replica': Service(PROTOCOLS['tcp'], 2173, 'msfw-replica'),
-        'msfw-s-storage': Service(PROTOCOLS['tcp'], 2172, 'msfw-s-storage'),
-        'msfw-storage': Service(PROTOCOLS['tcp'], 2171, 'msfw-storage'),
-        'msg-auth': Service(PROTOCOLS['tcp'], 31, 'msg-auth'),
-        'msg-icp': Service(PROTOCOLS['tcp'], 29, 'msg-icp'),
-        'msgclnt': Service(PROTOCOLS['tcp'], 8786, 'msgclnt'),
-        'msgsrvr': Service(PROTOCOLS['tcp'], 8787, 'msgsrvr'),
-        'msgsys': Service(PROTOCOLS['tcp'], 9594, 'msgsys'),
-        'mshnet': Service(PROTOCOLS['tcp'], 1989, 'mshnet'),
-        'mshvlm': Service(PROTOCOLS['tcp'], 6600, 'mshvlm'),
-        'msi-cps-rm': Service(PROTOCOLS['tcp'], 8675, 'msi-cps-rm'),
-        'msi-selectplay': Service(PROTOCOLS['tcp'], 2871, 'msi-selectplay'),
-        'msiccp': Service(PROTOCOLS['tcp'], 1731, 'msiccp'),
-        'msims': Service(PROTOCOLS['tcp'], 1582, 'msims'),
-        'msl-lmd': Service(PROTOCOLS['tcp'], 1464, 'msl-lmd'),
-        'msl_lmd': Service(PROTOCOLS['tcp'], 1464, 'msl_lmd'),
-        'msmq': Service(PROTOCOLS['tcp'], 1801, 'msmq'),
-        'msnp': Service(PROTOCOLS['tcp'], 1863, 'msnp'),
-        'msolap-ptp2': Service(PROTOCOLS['tcp'], 2725, 'msolap-ptp2'),
-        'msp': Service(PROTOCOLS['tcp'], 2438, 'msp'),
-        'msp-os': Service(PROTOCOLS['tcp'], 4686, 'msp-os'),
-        'msr-plugin-port': Service(PROTOCOLS['tcp'], 3931, 'msr-plugin-port'),
-        'msrp': Service(PROTOCOLS['tcp'], 2855, 'msrp'),
-        'msss': Service(PROTOCOLS['tcp'], 7742, 'msss'),
-        'mstmg-sstp': Service(PROTOCOLS['tcp'], 6601, 'mstmg-sstp'),
-        'msync': Service(PROTOCOLS['tcp'], 2072, 'msync'),
-        'mt-scaleserver': Service(PROTOCOLS['tcp'], 2305, 'mt-scaleserver'),
-        'mti-tcs-comm': Service(PROTOCOLS['tcp'], 2469, 'mti-tcs-comm'),
-        'mtl8000-matrix': Service(PROTOCOLS['tcp'], 8115, 'mtl8000-matrix'),
-        'mtn': Service(PROTOCOLS['tcp'], 4691, 'mtn'),
-        'mtp': Service(PROTOCOLS['tcp'], 1911, 'mtp'),
-        'mtport-regist': Service(PROTOCOLS['tcp'], 2791, 'mtport-regist'),
-        'mtportmon': Service(PROTOCOLS['tcp'], 7421, 'mtportmon'),
-        'mtqp': Service(PROTOCOLS['tcp'], 1038, 'mtqp'),
-        'mtrgtrans': Service(PROTOCOLS['tcp'], 19398, 'mtrgtrans'),
-        'mtsserver': Service(PROTOCOLS['tcp'], 4602, 'mtsserver'),
-        'multiling-http': Service(PROTOCOLS['tcp'], 777, 'multiling-http'),
-        'multip-msg': Service(PROTOCOLS['tcp'], 3733, 'multip-msg'),
-        'multiplex': Service(PROTOCOLS['tcp'], 171, 'multiplex'),
-        'mumps': Service(PROTOCOLS['tcp'], 188, 'mumps'),
-        'munin': Service(PROTOCOLS['tcp'], 4949, 'munin'),
-        'mupdate': Service(PROTOCOLS['tcp'], 3905, 'mupdate'),
-        'murray': Service(PROTOCOLS['tcp'], 1123, 'murray'),
-        'murx': Service(PROTOCOLS['tcp'], 2743, 'murx'),
-        'muse': Service(PROTOCOLS['tcp'], 6888, 'muse'),
-        'musiconline': Service(PROTOCOLS['tcp'], 1806, 'musiconline'),
-        'must-backplane': Service(PROTOCOLS['tcp'], 3515, 'must-backplane'),
-        'must-p2p': Service(PROTOCOLS['tcp'], 3514, 'must-p2p'),
-        'mvel-lm': Service(PROTOCOLS['tcp'], 1574, 'mvel-lm'),
-        'mvs-capacity': Service(PROTOCOLS['tcp'], 10007, 'mvs-capacity'),
-        'mvx-lm': Service(PROTOCOLS['tcp'], 1510, 'mvx-lm'),
-        'mxi': Service(PROTOCOLS['tcp'], 8005, 'mxi'),
-        'mxit': Service(PROTOCOLS['tcp'], 9119, 'mxit'),
-        'mxodbc-connect': Service(PROTOCOLS['tcp'], 6632, 'mxodbc-connect'),
-        'mxomss': Service(PROTOCOLS['tcp'], 1141, 'mxomss'),
-        'mxxrlogin': Service(PROTOCOLS['tcp'], 1035, 'mxxrlogin'),
-        'myblast': Service(PROTOCOLS['tcp'], 3795, 'myblast'),
-        'mylex-mapd': Service(PROTOCOLS['tcp'], 467, 'mylex-mapd'),
-        'mylxamport': Service(PROTOCOLS['tcp'], 2981, 'mylxamport'),
-        'mynahautostart': Service(PROTOCOLS['tcp'], 2388, 'mynahautostart'),
-        'myrtle': Service(PROTOCOLS['tcp'], 1831, 'myrtle'),
-        'mysql': Service(PROTOCOLS['tcp'], 3306, 'mysql'),
-        'mysql-cluster': Service(PROTOCOLS['tcp'], 1186, 'mysql-cluster'),
-        'mysql-cm-agent': Service(PROTOCOLS['tcp'], 1862, 'mysql-cm-agent'),
-        'mysql-im': Service(PROTOCOLS['tcp'], 2273, 'mysql-im'),
-        'mysql-proxy': Service(PROTOCOLS['tcp'], 6446, 'mysql-proxy'),
-        'mysqlx': Service(PROTOCOLS['tcp'], 33060, 'mysqlx'),
-        'mzap': Service(PROTOCOLS['tcp'], 2106, 'mzap'),
-        'mzca-action': Service(PROTOCOLS['tcp'], 7282, 'mzca-action'),
-        'n1-fwp': Service(PROTOCOLS['tcp'], 4446, 'n1-fwp'),
-        'n1-rmgmt': Service(PROTOCOLS['tcp'], 4447, 'n1-rmgmt'),
-        'n2h2server': Service(PROTOCOLS['tcp'], 9285, 'n2h2server'),
-        'n2nremote': Service(PROTOCOLS['tcp'], 1685, 'n2nremote'),
-        'na-er-tip': Service(PROTOCOLS['tcp'], 3725, 'na-er-tip'),
-        'na-localise': Service(PROTOCOLS['tcp'], 5062, 'na-localise'),
-        'naap': Service(PROTOCOLS['tcp'], 1340, 'naap'),
-        'nacagent': Service(PROTOCOLS['tcp'], 4407, 'nacagent'),
-        'name': Service(PROTOCOLS['tcp'], 42, 'name'),
-        'namemunge': Service(PROTOCOLS['tcp'], 3950, 'namemunge'),
-        'nameserver': Service(PROTOCOLS['tcp'], 42, 'nameserver'),
-        'namp': Service(PROTOCOLS['tcp'], 167, 'namp'),
-        'nani': Service(PROTOCOLS['tcp'], 2236, 'nani'),
-        'nas': Service(PROTOCOLS['tcp'], 991, 'nas'),
-        'nas-metering': Service(PROTOCOLS['tcp'], 2286, 'nas-metering'),
-        'nasmanager': Service(PROTOCOLS['tcp'], 1960, 'nasmanager'),
-        'natdataservice': Service(PROTOCOLS['tcp'], 3927, 'natdataservice'),
-        'nati-dstp': Service(PROTOCOLS['tcp'], 3015, 'nati-dstp'),
-        'nati-logos': Service(PROTOCOLS['tcp'], 2343, 'nati-logos'),
-        'nati-svrloc': Service(PROTOCOLS['tcp'], 3580, 'nati-svrloc'),
-        'nati-vi-server': Service(PROTOCOLS['tcp'], 3363, 'nati-vi-server'),
-        'nattyserver': Service(PROTOCOLS['tcp'], 3753, 'nattyserver'),
-        'natuslink': Service(PROTOCOLS['tcp'], 2895, 'natuslink'),
-        'nav-data-cmd': Service(PROTOCOLS['tcp'], 6317, 'nav-data-cmd'),
-        'nav-port': Service(PROTOCOLS['tcp'], 3859, 'nav-port'),
-        'navbuddy': Service(PROTOCOLS['tcp'], 1288, 'navbuddy'),
-        'navegaweb-port': Service(PROTOCOLS['tcp'], 3159, 'navegaweb-port'),
-        'navisphere': Service(PROTOCOLS['tcp'], 2162, 'navisphere'),
-        'navisphere-sec': Service(PROTOCOLS['tcp'], 2163, 'navisphere-sec'),
-        'nbd': Service(PROTOCOLS['tcp'], 10809, 'nbd'),
-        'nbdb': Service(PROTOCOLS['tcp'], 13785, 'nbdb'),
-        'nbt-pc': Service(PROTOCOLS['tcp'], 5133, 'nbt-pc'),
-        'nbt-wol': Service(PROTOCOLS['tcp'], 6133, 'nbt-wol'),
-        'nburn-id': Service(PROTOCOLS['tcp'], 20034, 'nburn-id'),
-        'nburn_id': Service(PROTOCOLS['tcp'], 20034, 'nburn_id'),
-        'nbx-au': Service(PROTOCOLS['tcp'], 2094, 'nbx-au'),
-        'nbx-cc': Service(PROTOCOLS['tcp'], 2093, 'nbx-cc'),
-        'nbx-dir': Service(PROTOCOLS['tcp'], 2096, 'nbx-dir'),
-        'nbx-ser': Service(PROTOCOLS['tcp'], 2095, 'nbx-ser'),
-        'ncacn-ip-tcp': Service(PROTOCOLS['tcp'], 3062, 'ncacn-ip-tcp'),
-        'ncadg-ip-udp': Service(PROTOCOLS['tcp'], 3063, 'ncadg-ip-udp'),
-        'ncconfig': Service(PROTOCOLS['tcp'], 1888, 'ncconfig'),
-        'ncdloadbalance': Service(PROTOCOLS['tcp'], 2683, 'ncdloadbalance'),
-        'ncdmirroring': Service(PROTOCOLS['tcp'], 2706, 'ncdmirroring'),
-        'nced': Service(PROTOCOLS['tcp'], 404, 'nced'),
-        'ncl': Service(PROTOCOLS['tcp'], 2397, 'ncl'),
-        'ncld': Service(PROTOCOLS['tcp'], 405, 'ncld'),
-        'ncp': Service(PROTOCOLS['tcp'], 524, 'ncp'),
-        'ncpm-ft': Service(PROTOCOLS['tcp'], 1744, 'ncpm-ft'),
-        'ncpm-hip': Service(PROTOCOLS['tcp'], 1683, 'ncpm-hip'),
-        'ncpm-pm': Service(PROTOCOLS['tcp'], 1591, 'ncpm-pm'),
-        'ncr-ccl': Service(PROTOCOLS['tcp'], 2528, 'ncr-ccl'),
-        'ncr_ccl': Service(PROTOCOLS['tcp'], 2528, 'ncr_ccl'),
-        'ncu-1': Service(PROTOCOLS['tcp'], 3195, 'ncu-1'),
-        'ncu-2': Service(PROTOCOLS['tcp'], 3196, 'ncu-2'),
-        'ncube-lm': Service(PROTOCOLS['tcp'], 1521, 'ncube-lm'),
-        'ncxcp': Service(PROTOCOLS['tcp'], 5681, 'ncxcp'),
-        'ndl-aas': Service(PROTOCOLS['tcp'], 3128, 'ndl-aas'),
-        'ndl-ahp-svc': Service(PROTOCOLS['tcp'], 6064, 'ndl-ahp-svc'),
-        'ndl-als': Service(PROTOCOLS['tcp'], 3431, 'ndl-als'),
-        'ndl-aps': Service(PROTOCOLS['tcp'], 3096, 'ndl-aps'),
-        'ndl-tcp-ois-gw': Service(PROTOCOLS['tcp'], 2738, 'ndl-tcp-ois-gw'),
-        'ndm-agent-port': Service(PROTOCOLS['tcp'], 43189, 'ndm-agent-port'),
-        'ndm-requester': Service(PROTOCOLS['tcp'], 1363, 'ndm-requester'),
-        'ndm-server': Service(PROTOCOLS['tcp'], 1364, 'ndm-server'),
-        'ndmp': Service(PROTOCOLS['tcp'], 10000, 'ndmp'),
-        'ndmps': Service(PROTOCOLS['tcp'], 30000, 'ndmps'),
-        'ndnp': Service(PROTOCOLS['tcp'], 2883, 'ndnp'),
-        'nds-sso': Service(PROTOCOLS['tcp'], 3024, 'nds-sso'),
-        'nds_sso': Service(PROTOCOLS['tcp'], 3024, 'nds_sso'),
-        'ndsauth': Service(PROTOCOLS['tcp'], 353, 'ndsauth'),
-        'ndsconnect': Service(PROTOCOLS['tcp'], 3890, 'ndsconnect'),
-        'ndsp': Service(PROTOCOLS['tcp'], 2881, 'ndsp'),
-        'ndtp': Service(PROTOCOLS['tcp'], 2882, 'ndtp'),
-        'nec-raidplus': Service(PROTOCOLS['tcp'], 2730, 'nec-raidplus'),
-        'neckar': Service(PROTOCOLS['tcp'], 37475, 'neckar'),
-        'necp': Service(PROTOCOLS['tcp'], 3262, 'necp'),
-        'nei-management': Service(PROTOCOLS['tcp'], 3886, 'nei-management'),
-        'neo4j': Service(PROTOCOLS['tcp'], 7474, 'neo4j'),
-        'neod1': Service(PROTOCOLS['tcp'], 1047, 'neod1'),
-        'neod2': Service(PROTOCOLS['tcp'], 1048, 'neod2'),
-        'neoiface': Service(PROTOCOLS['tcp'], 1285, 'neoiface'),
-        'neon24x7': Service(PROTOCOLS['tcp'], 3213, 'neon24x7'),
-        'nerv': Service(PROTOCOLS['tcp'], 1222, 'nerv'),
-        'nesh-broker': Service(PROTOCOLS['tcp'], 3507, 'nesh-broker'),
-        'nessus': Service(PROTOCOLS['tcp'], 1241, 'nessus'),
-        'nest-protocol': Service(PROTOCOLS['tcp'], 489, 'nest-protocol'),
-        'net-device': Service(PROTOCOLS['tcp'], 4350, 'net-device'),
-        'net-projection': Service(PROTOCOLS['tcp'], 5363, 'net-projection'),
-        'net-steward': Service(PROTOCOLS['tcp'], 2128, 'net-steward'),
-        'net2display': Service(PROTOCOLS['tcp'], 9086, 'net2display'),
-        'net8-cman': Service(PROTOCOLS['tcp'], 1830, 'net8-cman'),
-        'netadmin': Service(PROTOCOLS['tcp'], 2450, 'netadmin'),
-        'netagent': Service(PROTOCOLS['tcp'], 5771, 'netagent'),
-        'netangel': Service(PROTOCOLS['tcp'], 2442, 'netangel'),
-        'netapp-icdata': Service(PROTOCOLS['tcp'], 11105, 'netapp-icdata'),
-        'netapp-icmgmt': Service(PROTOCOLS['tcp'], 11104, 'netapp-icmgmt'),
-        'netapp-sync': Service(PROTOCOLS['tcp'], 10006, 'netapp-sync'),
-        'netarx': Service(PROTOCOLS['tcp'], 1040, 'netarx'),
-        'netaspi': Service(PROTOCOLS['tcp'], 2902, 'netaspi'),
-        'netattachsdmp': Service(PROTOCOLS['tcp'], 3066, 'netattachsdmp'),
-        'netbill-auth': Service(PROTOCOLS['tcp'], 1615, 'netbill-auth'),
-        'netbill-cred': Service(PROTOCOLS['tcp'], 1614, 'netbill-cred'),
-        'netbill-keyrep': Service(PROTOCOLS['tcp'], 1613, 'netbill-keyrep'),
-        'netbill-prod': Service(PROTOCOLS['tcp'], 1616, 'netbill-prod'),
-        'netbill-trans': Service(PROTOCOLS['tcp'], 1612, 'netbill-trans'),
-        'netbios-dgm': Service(PROTOCOLS['tcp'], 138, 'netbios-dgm'),
-        'netbios-ns': Service(PROTOCOLS['tcp'], 137, 'netbios-ns'),
-        'netbios-ssn': Service(PROTOCOLS['tcp'], 139, 'netbios-ssn'),
-        'netbookmark': Service(PROTOCOLS['tcp'], 3131, 'netbookmark'),
-        'netboot-pxe': Service(PROTOCOLS['tcp'], 3928, 'netboot-pxe'),
-        'netcabinet-com': Service(PROTOCOLS['tcp'], 4409, 'netcabinet-com'),
-        'netcelera': Service(PROTOCOLS['tcp'], 3701, 'netcelera'),
-        'netchat': Service(PROTOCOLS['tcp'], 2451, 'netchat'),
-        'netcheque': Service(PROTOCOLS['tcp'], 4008, 'netcheque'),
-        'netclip': Service(PROTOCOLS['tcp'], 2971, 'netclip'),
-        'netcomm1': Service(PROTOCOLS['tcp'], 1676, 'netcomm1'),
-        'netconf-beep': Service(PROTOCOLS['tcp'], 831, 'netconf-beep'),
-        'netconf-ch-ssh': Service(PROTOCOLS['tcp'], 4334, 'netconf-ch-ssh'),
-        'netconf-ch-tls': Service(PROTOCOLS['tcp'], 4335, 'netconf-ch-tls'),
-        'netconf-ssh': Service(PROTOCOLS['tcp'], 830, 'netconf-ssh'),
-        'netconf-tls': Service(PROTOCOLS['tcp'], 6513, 'netconf-tls'),
-        'netconfsoapbeep': Service(PROTOCOLS['tcp'], 833, 'netconfsoapbeep'),
-        'netconfsoaphttp': Service(PROTOCOLS['tcp'], 832, 'netconfsoaphttp'),
-        'netcp': Service(PROTOCOLS['tcp'], 395, 'netcp'),
-        'netdb-export': Service(PROTOCOLS['tcp'], 1329, 'netdb-export'),
-        'neteh': Service(PROTOCOLS['tcp'], 3828, 'neteh'),
-        'neteh-ext': Service(PROTOCOLS['tcp'], 3829, 'neteh-ext'),
-        'netgw': Service(PROTOCOLS['tcp'], 741, 'netgw'),
-        'netinfo-local': Service(PROTOCOLS['tcp'], 1033, 'netinfo-local'),
-        'netiq': Service(PROTOCOLS['tcp'], 2220, 'netiq'),
-        'netiq-endpoint': Service(PROTOCOLS['tcp'], 10113, 'netiq-endpoint'),
-        'netiq-endpt': Service(PROTOCOLS['tcp'], 10115, 'netiq-endpt'),
-        'netiq-mc': Service(PROTOCOLS['tcp'], 2735, 'netiq-mc'),
-        'netiq-ncap': Service(PROTOCOLS['tcp'], 2219, 'netiq-ncap'),
-        'netiq-qcheck': Service(PROTOCOLS['tcp'], 10114, 'netiq-qcheck'),
-        'netiq-voipa': Service(PROTOCOLS['tcp'], 10116, 'netiq-voipa'),
-        'netlabs-lm': Service(PROTOCOLS['tcp'], 1406, 'netlabs-lm'),
-        'netmagic': Service(PROTOCOLS['tcp'], 1196, 'netmagic'),
-        'netmap-lm': Service(PROTOCOLS['tcp'], 1493, 'netmap-lm'),
-        'netmap_lm': Service(PROTOCOLS['tcp'], 1493, 'netmap_lm'),
-        'netml': Service(PROTOCOLS['tcp'], 2288, 'netml'),
-        'netmo-default': Service(PROTOCOLS['tcp'], 6841, 'netmo-default'),
-        'netmo-http': Service(PROTOCOLS['tcp'], 6842, 'netmo-http'),
-        'netmon': Service(PROTOCOLS['tcp'], 2606, 'netmon'),
-        'netmount': Service(PROTOCOLS['tcp'], 2061, 'netmount'),
-        'netmpi': Service(PROTOCOLS['tcp'], 3827, 'netmpi'),
-        'netnews': Service(PROTOCOLS['tcp'], 532, 'netnews'),
-        'neto-dcs': Service(PROTOCOLS['tcp'], 3814, 'neto-dcs'),
-        'neto-wol-server': Service(PROTOCOLS['tcp'], 3812, 'neto-wol-server'),
-        'netobjects1': Service(PROTOCOLS['tcp'], 2485, 'netobjects1'),
-        'netobjects2': Service(PROTOCOLS['tcp'], 2486, 'netobjects2'),
-        'netop-rc': Service(PROTOCOLS['tcp'], 1970, 'netop-rc'),
-        'netop-school': Service(PROTOCOLS['tcp'], 1971, 'netop-school'),
-        'netopia-vo1': Service(PROTOCOLS['tcp'], 1839, 'netopia-vo1'),
-        'netopia-vo2': Service(PROTOCOLS['tcp'], 1840, 'netopia-vo2'),
-        'netopia-vo3': Service(PROTOCOLS['tcp'], 1841, 'netopia-vo3'),
-        'netopia-vo4': Service(PROTOCOLS['tcp'], 1842, 'netopia-vo4'),
-        'netopia-vo5': Service(PROTOCOLS['tcp'], 1843, 'netopia-vo5'),
-        'netops-broker': Service(PROTOCOLS['tcp'], 5465, 'netops-broker'),
-        'netperf': Service(PROTOCOLS['tcp'], 12865, 'netperf'),
-        'netplan': Service(PROTOCOLS['tcp'], 2983, 'netplan'),
-        'netplay-port1': Service(PROTOCOLS['tcp'], 3640, 'netplay-port1'),
-        'netplay-port2': Service(PROTOCOLS['tcp'], 3641, 'netplay-port2'),
-        'netport-id': Service(PROTOCOLS['tcp'], 3129, 'netport-id'),
-        'netrcs': Service(PROTOCOLS['tcp'], 742, 'netrcs'),
-        'netrek': Service(PROTOCOLS['tcp'], 2592, 'netrek'),
-        'netrisk': Service(PROTOCOLS['tcp'], 1799, 'netrisk'),
-        'netrix-sftm': Service(PROTOCOLS['tcp'], 2328, 'netrix-sftm'),
-        'netrjs-1': Service(PROTOCOLS['tcp'], 71, 'netrjs-1'),
-        'netrjs-2': Service(PROTOCOLS['tcp'], 72, 'netrjs-2'),
-        'netrjs-3': Service(PROTOCOLS['tcp'], 73, 'netrjs-3'),
-        'netrjs-4': Service(PROTOCOLS['tcp'], 74, 'netrjs-4'),
-        'netrockey6': Service(PROTOCOLS['tcp'], 4425, 'netrockey6'),
-        'netsc-dev': Service(PROTOCOLS['tcp'], 155, 'netsc-dev'),
-        'netsc-prod': Service(PROTOCOLS['tcp'], 154, 'netsc-prod'),
-        'netscript': Service(PROTOCOLS['tcp'], 4118, 'netscript'),
-        'netserialext1': Service(PROTOCOLS['tcp'], 16360, 'netserialext1'),
-        'netserialext2': Service(PROTOCOLS['tcp'], 16361, 'netserialext2'),
-        'netserialext3': Service(PROTOCOLS['tcp'], 16367, 'netserialext3'),
-        'netserialext4': Service(PROTOCOLS['tcp'], 16368, 'netserialext4'),
-        'netspeak-acd': Service(PROTOCOLS['tcp'], 21848, 'netspeak-acd'),
-        'netspeak-cps': Service(PROTOCOLS['tcp'], 21849, 'netspeak-cps'),
-        'netspeak-cs': Service(PROTOCOLS['tcp'], 21847, 'netspeak-cs'),
-        'netspeak-is': Service(PROTOCOLS['tcp'], 21846, 'netspeak-is'),
-        'netsteward': Service(PROTOCOLS['tcp'], 2810, 'netsteward'),
-        'netsupport': Service(PROTOCOLS['tcp'], 5405, 'netsupport'),
-        'netsupport2': Service(PROTOCOLS['tcp'], 5421, 'netsupport2'),
-        'nettest': Service(PROTOCOLS['tcp'], 4138, 'nettest'),
-        'nettgain-nms': Service(PROTOCOLS['tcp'], 1879, 'nettgain-nms'),
-        'netuitive': Service(PROTOCOLS['tcp'], 1286, 'netuitive'),
-        'netview-aix-1': Service(PROTOCOLS['tcp'], 1661, 'netview-aix-1'),
-        'netview-aix-10': Service(PROTOCOLS['tcp'], 1670, 'netview-aix-10'),
-        'netview-aix-11': Service(PROTOCOLS['tcp'], 1671, 'netview-aix-11'),
-        'netview-aix-12': Service(PROTOCOLS['tcp'], 1672, 'netview-aix-12'),
-        'netview-aix-2': Service(PROTOCOLS['tcp'], 1662, 'netview-aix-2'),
-        'netview-aix-3': Service(PROTOCOLS['tcp'], 1663, 'netview-aix-3'),
-        'netview-aix-4': Service(PROTOCOLS['tcp'], 1664, 'netview-aix-4'),
-        'netview-aix-5': Service(PROTOCOLS['tcp'], 1665, 'netview-aix-5'),
-        'netview-aix-6': Service(PROTOCOLS['tcp'], 1666, 'netview-aix-6'),
-        'netview-aix-7': Service(PROTOCOLS['tcp'], 1667, 'netview-aix-7'),
-        'netview-aix-8': Service(PROTOCOLS['tcp'], 1668, 'netview-aix-8'),
-        'netview-aix-9': Service(PROTOCOLS['tcp'], 1669, 'netview-aix-9'),
-        'netviewdm1': Service(PROTOCOLS['tcp'], 729, 'netviewdm1'),
-        'netviewdm2': Service(PROTOCOLS['tcp'], 730, 'netviewdm2'),
-        'netviewdm3': Service(PROTOCOLS['tcp'], 731, 'netviewdm3'),
-        'netwall': Service(PROTOCOLS['tcp'], 533, 'netwall'),
-        'netware-csp': Service(PROTOCOLS['tcp'], 1366, 'netware-csp'),
-        'netware-ip': Service(PROTOCOLS['tcp'], 396, 'netware-ip'),
-        'netwatcher-db': Service(PROTOCOLS['tcp'], 3204, 'netwatcher-db'),
-        'netwatcher-mon': Service(PROTOCOLS['tcp'], 3203, 'netwatcher-mon'),
-        'netwave-ap-mgmt': Service(PROTOCOLS['tcp'], 2411, 'netwave-ap-mgmt'),
-        'netwkpathengine': Service(PROTOCOLS['tcp'], 3209, 'netwkpathengine'),
-        'networklens': Service(PROTOCOLS['tcp'], 3409, 'networklens'),
-        'networklenss': Service(PROTOCOLS['tcp'], 3410, 'networklenss'),
-        'netx-agent': Service(PROTOCOLS['tcp'], 2586, 'netx-agent'),
-        'netx-server': Service(PROTOCOLS['tcp'], 2585, 'netx-server'),
-        'netxms-agent': Service(PROTOCOLS['tcp'], 4700, 'netxms-agent'),
-        'netxms-mgmt': Service(PROTOCOLS['tcp'], 4701, 'netxms-mgmt'),
-        'netxms-sync': Service(PROTOCOLS['tcp'], 4702, 'netxms-sync'),
-        'neveroffline': Service(PROTOCOLS['tcp'], 2614, 'neveroffline'),
-        'new-rwho': Service(PROTOCOLS['tcp'], 550, 'new-rwho'),
-        'newbay-snc-mc': Service(PROTOCOLS['tcp'], 16900, 'newbay-snc-mc'),
-        'newgenpay': Service(PROTOCOLS['tcp'], 3165, 'newgenpay'),
-        'newheights': Service(PROTOCOLS['tcp'], 2114, 'newheights'),
-        'newlixconfig': Service(PROTOCOLS['tcp'], 2076, 'newlixconfig'),
-        'newlixengine': Service(PROTOCOLS['tcp'], 2075, 'newlixengine'),
-        'newlixreg': Service(PROTOCOLS['tcp'], 2671, 'newlixreg'),
-        'newoak': Service(PROTOCOLS['tcp'], 4001, 'newoak'),
-        'news': Service(PROTOCOLS['tcp'], 2009, 'news'),
-        'newwavesearch': Service(PROTOCOLS['tcp'], 2058, 'newwavesearch'),
-        'nexentamv': Service(PROTOCOLS['tcp'], 8457, 'nexentamv'),
-        'nexgen': Service(PROTOCOLS['tcp'], 6627, 'nexgen'),
-        'nexgen-aux': Service(PROTOCOLS['tcp'], 6629, 'nexgen-aux'),
-        'nexstorindltd': Service(PROTOCOLS['tcp'], 2360, 'nexstorindltd'),
-        'nextstep': Service(PROTOCOLS['tcp'], 178, 'nextstep'),
-        'nexus-portal': Service(PROTOCOLS['tcp'], 4021, 'nexus-portal'),
-        'nfa': Service(PROTOCOLS['tcp'], 1155, 'nfa'),
-        'nfoldman': Service(PROTOCOLS['tcp'], 7393, 'nfoldman'),
-        'nfs': Service(PROTOCOLS['tcp'], 2049, 'nfs'),
-        'nfsrdma': Service(PROTOCOLS['tcp'], 20049, 'nfsrdma'),
-        'ng-umds': Service(PROTOCOLS['tcp'], 1690, 'ng-umds'),
-        'nhci': Service(PROTOCOLS['tcp'], 3842, 'nhci'),
-        'nhserver': Service(PROTOCOLS['tcp'], 2672, 'nhserver'),
-        'ni-visa-remote': Service(PROTOCOLS['tcp'], 3537, 'ni-visa-remote'),
-        'nicelink': Service(PROTOCOLS['tcp'], 1095, 'nicelink'),
-        'nicetec-mgmt': Service(PROTOCOLS['tcp'], 2557, 'nicetec-mgmt'),
-        'nicetec-nmsvc': Service(PROTOCOLS['tcp'], 2556, 'nicetec-nmsvc'),
-        'nicname': Service(PROTOCOLS['tcp'], 43, 'nicname'),
-        'nifty-hmi': Service(PROTOCOLS['tcp'], 4134, 'nifty-hmi'),
-        'nilinkanalyst': Service(PROTOCOLS['tcp'], 25902, 'nilinkanalyst'),
-        'nim': Service(PROTOCOLS['tcp'], 1058, 'nim'),
-        'nim-vdrshell': Service(PROTOCOLS['tcp'], 6420, 'nim-vdrshell'),
-        'nim-wan': Service(PROTOCOLS['tcp'], 6421, 'nim-wan'),
-        'nimaux': Service(PROTOCOLS['tcp'], 3902, 'nimaux'),
-        'nimbusdb': Service(PROTOCOLS['tcp'], 48004, 'nimbusdb'),
-        'nimbusdbctrl': Service(PROTOCOLS['tcp'], 48005, 'nimbusdbctrl'),
-        'nimcontroller': Service(PROTOCOLS['tcp'], 48000, 'nimcontroller'),
-        'nimgtw': Service(PROTOCOLS['tcp'], 48003, 'nimgtw'),
-        'nimhub': Service(PROTOCOLS['tcp'], 48002, 'nimhub'),
-        'nimreg': Service(PROTOCOLS['tcp'], 1059, 'nimreg'),
-        'nimrod-agent': Service(PROTOCOLS['tcp'], 1617, 'nimrod-agent'),
-        'nimsh': Service(PROTOCOLS['tcp'], 3901, 'nimsh'),
-        'nimspooler': Service(PROTOCOLS['tcp'], 48001, 'nimspooler'),
-        'ninaf': Service(PROTOCOLS['tcp'], 5627, 'ninaf'),
-        'niobserver': Service(PROTOCOLS['tcp'], 25901, 'niobserver'),
-        'nip': Service(PROTOCOLS['tcp'], 376, 'nip'),
-        'niprobe': Service(PROTOCOLS['tcp'], 25903, 'niprobe'),
-        'nirp': Service(PROTOCOLS['tcp'], 4043, 'nirp'),
-        'nitrogen': Service(PROTOCOLS['tcp'], 7725, 'nitrogen'),
-        'njenet-ssl': Service(PROTOCOLS['tcp'], 2252, 'njenet-ssl'),
-        'nkd': Service(PROTOCOLS['tcp'], 1650, 'nkd'),
-        'nlg-data': Service(PROTOCOLS['tcp'], 5299, 'nlg-data'),
-        'nlogin': Service(PROTOCOLS['tcp'], 758, 'nlogin'),
-        'nls-tl': Service(PROTOCOLS['tcp'], 7549, 'nls-tl'),
-        'nm-asses-admin': Service(PROTOCOLS['tcp'], 3150, 'nm-asses-admin'),
-        'nm-assessor': Service(PROTOCOLS['tcp'], 3151, 'nm-assessor'),
-        'nm-game-admin': Service(PROTOCOLS['tcp'], 3148, 'nm-game-admin'),
-        'nm-game-server': Service(PROTOCOLS['tcp'], 3149, 'nm-game-server'),
-        'nmap': Service(PROTOCOLS['tcp'], 689, 'nmap'),
-        'nmasoverip': Service(PROTOCOLS['tcp'], 1242, 'nmasoverip'),
-        'nmea-0183': Service(PROTOCOLS['tcp'], 10110, 'nmea-0183'),
-        'nmmp': Service(PROTOCOLS['tcp'], 3649, 'nmmp'),
-        'nms': Service(PROTOCOLS['tcp'], 1429, 'nms'),
-        'nms-dpnss': Service(PROTOCOLS['tcp'], 2503, 'nms-dpnss'),
-        'nms-topo-serv': Service(PROTOCOLS['tcp'], 1486, 'nms-topo-serv'),
-        'nms_topo_serv': Service(PROTOCOLS['tcp'], 1486, 'nms_topo_serv'),
-        'nmsd': Service(PROTOCOLS['tcp'], 1239, 'nmsd'),
-        'nmsigport': Service(PROTOCOLS['tcp'], 2839, 'nmsigport'),
-        'nmsp': Service(PROTOCOLS['tcp'], 1790, 'nmsp'),
-        'nmsserver': Service(PROTOCOLS['tcp'], 2244, 'nmsserver'),
-        'nnp': Service(PROTOCOLS['tcp'], 3780, 'nnp'),
-        'nnsp': Service(PROTOCOLS['tcp'], 433, 'nnsp'),
-        'nntp': Service(PROTOCOLS['tcp'], 119, 'nntp'),
-        'nntps': Service(PROTOCOLS['tcp'], 563, 'nntps'),
-        'noaaport': Service(PROTOCOLS['tcp'], 2210, 'noaaport'),
-        'noadmin': Service(PROTOCOLS['tcp'], 1921, 'noadmin'),
-        'noagent': Service(PROTOCOLS['tcp'], 1917, 'noagent'),
-        'nod-provider': Service(PROTOCOLS['tcp'], 8980, 'nod-provider'),
-        'noit-transport': Service(PROTOCOLS['tcp'], 43191, 'noit-transport'),
-        'nokia-ann-ch1': Service(PROTOCOLS['tcp'], 3405, 'nokia-ann-ch1'),
-        'nokia-ann-ch2': Service(PROTOCOLS['tcp'], 3406, 'nokia-ann-ch2'),
-        'nomad': Service(PROTOCOLS['tcp'], 5209, 'nomad'),
-        'nomdb': Service(PROTOCOLS['tcp'], 13786, 'nomdb'),
-        'norton-lambert': Service(PROTOCOLS['tcp'], 2338, 'norton-lambert'),
-        'notateit': Service(PROTOCOLS['tcp'], 4803, 'notateit'),
-        'noteit': Service(PROTOCOLS['tcp'], 4663, 'noteit'),
-        'noteshare': Service(PROTOCOLS['tcp'], 8474, 'noteshare'),
-        'noteza': Service(PROTOCOLS['tcp'], 5215, 'noteza'),
-        'notezilla-lan': Service(PROTOCOLS['tcp'], 21010, 'notezilla-lan'),
-        'notify-srvr': Service(PROTOCOLS['tcp'], 3016, 'notify-srvr'),
-        'notify_srvr': Service(PROTOCOLS['tcp'], 3016, 'notify_srvr'),
-        'novar-alarm': Service(PROTOCOLS['tcp'], 23401, 'novar-alarm'),
-        'novar-dbase': Service(PROTOCOLS['tcp'], 23400, 'novar-dbase'),
-        'novar-global': Service(PROTOCOLS['tcp'], 23402, 'novar-global'),
-        'novastorbakcup': Service(PROTOCOLS['tcp'], 308, 'novastorbakcup'),
-        'novation': Service(PROTOCOLS['tcp'], 1322, 'novation'),
-        'novell-ipx-cmd': Service(PROTOCOLS['tcp'], 2645, 'novell-ipx-cmd'),
-        'novell-lu6-2': Service(PROTOCOLS['tcp'], 1416, 'novell-lu6-2'),
-        'novell-lu6.2': Service(PROTOCOLS['tcp'], 1416, 'novell-lu6.2'),
-        'novell-zen': Service(PROTOCOLS['tcp'], 2544, 'novell-zen'),
-        'nowcontact': Service(PROTOCOLS['tcp'], 3167, 'nowcontact'),
-        'npdbgmngr': Service(PROTOCOLS['tcp'], 2293, 'npdbgmngr'),
-        'npds-tracker': Service(PROTOCOLS['tcp'], 3680, 'npds-tracker'),
-        'npep-messaging': Service(PROTOCOLS['tcp'], 2868, 'npep-messaging'),
-        'npmp': Service(PROTOCOLS['tcp'], 8450, 'npmp'),
-        'npmp-gui': Service(PROTOCOLS['tcp'], 611, 'npmp-gui'),
-        'npmp-local': Service(PROTOCOLS['tcp'], 610, 'npmp-local'),
-        'npmp-trap': Service(PROTOCOLS['tcp'], 609, 'npmp-trap'),
-        'npp': Service(PROTOCOLS['tcp'], 4045, 'npp'),
-        'nppmp': Service(PROTOCOLS['tcp'], 3476, 'nppmp'),
-        'npqes-test': Service(PROTOCOLS['tcp'], 4703, 'npqes-test'),
-        'npsp': Service(PROTOCOLS['tcp'], 4088, 'npsp'),
-        'nqs': Service(PROTOCOLS['tcp'], 607, 'nqs'),
-        'nrcabq-lm': Service(PROTOCOLS['tcp'], 1458, 'nrcabq-lm'),
-        'nrpe': Service(PROTOCOLS['tcp'], 5666, 'nrpe'),
-        'ns': Service(PROTOCOLS['tcp'], 760, 'ns'),
-        'ns-cfg-server': Service(PROTOCOLS['tcp'], 3266, 'ns-cfg-server'),
-        'ns-server': Service(PROTOCOLS['tcp'], 5415, 'ns-server'),
-        'nsc-ccs': Service(PROTOCOLS['tcp'], 2604, 'nsc-ccs'),
-        'nsc-posa': Service(PROTOCOLS['tcp'], 2605, 'nsc-posa'),
-        'nsdeepfreezectl': Service(PROTOCOLS['tcp'], 7724, 'nsdeepfreezectl'),
-        'nsesrvr': Service(PROTOCOLS['tcp'], 9988, 'nsesrvr'),
-        'nsiiops': Service(PROTOCOLS['tcp'], 261, 'nsiiops'),
-        'nsjtp-ctrl': Service(PROTOCOLS['tcp'], 1687, 'nsjtp-ctrl'),
-        'nsjtp-data': Service(PROTOCOLS['tcp'], 1688, 'nsjtp-data'),
-        'nsp': Service(PROTOCOLS['tcp'], 5012, 'nsp'),
-        'nsrmp': Service(PROTOCOLS['tcp'], 359, 'nsrmp'),
-        'nsrp': Service(PROTOCOLS['tcp'], 7170, 'nsrp'),
-        'nss': Service(PROTOCOLS['tcp'], 4159, 'nss'),
-        'nss-routing': Service(PROTOCOLS['tcp'], 159, 'nss-routing'),
-        'nssagentmgr': Service(PROTOCOLS['tcp'], 4454, 'nssagentmgr'),
-        'nssalertmgr': Service(PROTOCOLS['tcp'], 4453, 'nssalertmgr'),
-        'nssocketport': Service(PROTOCOLS['tcp'], 3522, 'nssocketport'),
-        'nsstp': Service(PROTOCOLS['tcp'], 1036, 'nsstp'),
-        'nst': Service(PROTOCOLS['tcp'], 4687, 'nst'),
-        'nsw-fe': Service(PROTOCOLS['tcp'], 27, 'nsw-fe'),
-        'nsws': Service(PROTOCOLS['tcp'], 3049, 'nsws'),
-        'nta-ds': Service(PROTOCOLS['tcp'], 7544, 'nta-ds'),
-        'nta-us': Service(PROTOCOLS['tcp'], 7545, 'nta-us'),
-        'ntalk': Service(PROTOCOLS['tcp'], 518, 'ntalk'),
-        'ntp': Service(PROTOCOLS['tcp'], 123, 'ntp'),
-        'ntz-p2p-storage': Service(PROTOCOLS['tcp'], 6778, 'ntz-p2p-storage'),
-        'ntz-tracker': Service(PROTOCOLS['tcp'], 6777, 'ntz-tracker'),
-        'nuauth': Service(PROTOCOLS['tcp'], 4129, 'nuauth'),
-        'nucleus': Service(PROTOCOLS['tcp'], 1463, 'nucleus'),
-        'nucleus-sand': Service(PROTOCOLS['tcp'], 1201, 'nucleus-sand'),
-        'nufw': Service(PROTOCOLS['tcp'], 4128, 'nufw'),
-        'nupaper-ss': Service(PROTOCOLS['tcp'], 12121, 'nupaper-ss'),
-        'nusrp': Service(PROTOCOLS['tcp'], 49001, 'nusrp'),
-        'nut': Service(PROTOCOLS['tcp'], 3493, 'nut'),
-        'nuts-bootp': Service(PROTOCOLS['tcp'], 4133, 'nuts-bootp'),
-        'nuts-dem': Service(PROTOCOLS['tcp'], 4132, 'nuts-dem'),
-        'nuts_bootp': Service(PROTOCOLS['tcp'], 4133, 'nuts_bootp'),
-        'nuts_dem': Service(PROTOCOLS['tcp'], 4132, 'nuts_dem'),
-        'nuxsl': Service(PROTOCOLS['tcp'], 5991, 'nuxsl'),
-        'nv-video': Service(PROTOCOLS['tcp'], 4444, 'nv-video'),
-        'nvc': Service(PROTOCOLS['tcp'], 8711, 'nvc'),
-        'nvcnet': Service(PROTOCOLS['tcp'], 3999, 'nvcnet'),
-        'nvd': Service(PROTOCOLS['tcp'], 2329, 'nvd'),
-        'nvm-express': Service(PROTOCOLS['tcp'], 4420, 'nvm-express'),
-        'nvmsgd': Service(PROTOCOLS['tcp'], 3519, 'nvmsgd'),
-        'nw-license': Service(PROTOCOLS['tcp'], 3697, 'nw-license'),
-        'nxedit': Service(PROTOCOLS['tcp'], 126, 'nxedit'),
-        'nxlmd': Service(PROTOCOLS['tcp'], 28000, 'nxlmd'),
-        'o2server-port': Service(PROTOCOLS['tcp'], 1894, 'o2server-port'),
-        'oa-system': Service(PROTOCOLS['tcp'], 8022, 'oa-system'),
-        'obex': Service(PROTOCOLS['tcp'], 650, 'obex'),
-        'objcall': Service(PROTOCOLS['tcp'], 94, 'objcall'),
-        'objective-dbc': Service(PROTOCOLS['tcp'], 1388, 'objective-dbc'),
-        'objectmanager': Service(PROTOCOLS['tcp'], 2038, 'objectmanager'),
-        'obrpd': Service(PROTOCOLS['tcp'], 1092, 'obrpd'),
-        'observium-agent': Service(PROTOCOLS['tcp'], 36602, 'observium-agent'),
-        'oc-lm': Service(PROTOCOLS['tcp'], 1448, 'oc-lm'),
-        'ocbinder': Service(PROTOCOLS['tcp'], 183, 'ocbinder'),
-        'oce-snmp-trap': Service(PROTOCOLS['tcp'], 2697, 'oce-snmp-trap'),
-        'oceansoft-lm': Service(PROTOCOLS['tcp'], 1466, 'oceansoft-lm'),
-        'ocs-amu': Service(PROTOCOLS['tcp'], 429, 'ocs-amu'),
-        'ocs-cmu': Service(PROTOCOLS['tcp'], 428, 'ocs-cmu'),
-        'ocs_amu': Service(PROTOCOLS['tcp'], 429, 'ocs_amu'),
-        'ocs_cmu': Service(PROTOCOLS['tcp'], 428, 'ocs_cmu'),
-        'ocserver': Service(PROTOCOLS['tcp'], 184, 'ocserver'),
-        'octopus': Service(PROTOCOLS['tcp'], 10008, 'octopus'),
-        'octopustentacle': Service(PROTOCOLS['tcp'], 10933, 'octopustentacle'),
-        'odbcpathway': Service(PROTOCOLS['tcp'], 9628, 'odbcpathway'),
-        'odette-ftp': Service(PROTOCOLS['tcp'], 3305, 'odette-ftp'),
-        'odette-ftps': Service(PROTOCOLS['tcp'], 6619, 'odette-ftps'),
-        'odeumservlink': Service(PROTOCOLS['tcp'], 3523, 'odeumservlink'),
-        'odi-port': Service(PROTOCOLS['tcp'], 3187, 'odi-port'),
-        'odmr': Service(PROTOCOLS['tcp'], 366, 'odmr'),
-        'odn-castraq': Service(PROTOCOLS['tcp'], 2498, 'odn-castraq'),
-        'odnsp': Service(PROTOCOLS['tcp'], 9966, 'odnsp'),
-        'odsi': Service(PROTOCOLS['tcp'], 1308, 'odsi'),
-        'oem-agent': Service(PROTOCOLS['tcp'], 3872, 'oem-agent'),
-        'oemcacao-jmxmp': Service(PROTOCOLS['tcp'], 11172, 'oemcacao-jmxmp'),
-        'oemcacao-rmi': Service(PROTOCOLS['tcp'], 11174, 'oemcacao-rmi'),
-        'oemcacao-websvc': Service(PROTOCOLS['tcp'], 11175, 'oemcacao-websvc'),
-        'office-tools': Service(PROTOCOLS['tcp'], 7789, 'office-tools'),
-        'officelink2000': Service(PROTOCOLS['tcp'], 3320, 'officelink2000'),
-        'ofsd': Service(PROTOCOLS['tcp'], 2322, 'ofsd'),
-        'ogs-server': Service(PROTOCOLS['tcp'], 9008, 'ogs-server'),
-        'ohimsrv': Service(PROTOCOLS['tcp'], 506, 'ohimsrv'),
-        'ohsc': Service(PROTOCOLS['tcp'], 18186, 'ohsc'),
-        'oi-2000': Service(PROTOCOLS['tcp'], 2364, 'oi-2000'),
-        'oidocsvc': Service(PROTOCOLS['tcp'], 4142, 'oidocsvc'),
-        'oidsr': Service(PROTOCOLS['tcp'], 4143, 'oidsr'),
-        'oirtgsvc': Service(PROTOCOLS['tcp'], 4141, 'oirtgsvc'),
-        'olhost': Service(PROTOCOLS['tcp'], 2661, 'olhost'),
-        'olsr': Service(PROTOCOLS['tcp'], 698, 'olsr'),
-        'olsv': Service(PROTOCOLS['tcp'], 1160, 'olsv'),
-        'oma-dcdocbs': Service(PROTOCOLS['tcp'], 7278, 'oma-dcdocbs'),
-        'oma-ilp': Service(PROTOCOLS['tcp'], 7276, 'oma-ilp'),
-        'oma-ilp-s': Service(PROTOCOLS['tcp'], 7277, 'oma-ilp-s'),
-        'oma-mlp': Service(PROTOCOLS['tcp'], 9210, 'oma-mlp'),
-        'oma-mlp-s': Service(PROTOCOLS['tcp'], 9211, 'oma-mlp-s'),
-        'oma-rlp': Service(PROTOCOLS['tcp'], 7273, 'oma-rlp'),
-        'oma-rlp-s': Service(PROTOCOLS['tcp'], 7274, 'oma-rlp-s'),
-        'oma-ulp': Service(PROTOCOLS['tcp'], 7275, 'oma-ulp'),
-        'omabcastltkm': Service(PROTOCOLS['tcp'], 4359, 'omabcastltkm'),
-        'omasgport': Service(PROTOCOLS['tcp'], 4090, 'omasgport'),
-        'omginitialrefs': Service(PROTOCOLS['tcp'], 900, 'omginitialrefs'),
-        'omhs': Service(PROTOCOLS['tcp'], 5723, 'omhs'),
-        'omnilink-port': Service(PROTOCOLS['tcp'], 3904, 'omnilink-port'),
-        'omnisky': Service(PROTOCOLS['tcp'], 2056, 'omnisky'),
-        'omnivision': Service(PROTOCOLS['tcp'], 1135, 'omnivision'),
-        'omnivisionesx': Service(PROTOCOLS['tcp'], 4395, 'omnivisionesx'),
-        'oms': Service(PROTOCOLS['tcp'], 4662, 'oms'),
-        'oms-nonsecure': Service(PROTOCOLS['tcp'], 5102, 'oms-nonsecure'),
-        'omscontact': Service(PROTOCOLS['tcp'], 4161, 'omscontact'),
-        'omsdk': Service(PROTOCOLS['tcp'], 5724, 'omsdk'),
-        'omserv': Service(PROTOCOLS['tcp'], 764, 'omserv'),
-        'omstopology': Service(PROTOCOLS['tcp'], 4162, 'omstopology'),
-        'omviagent': Service(PROTOCOLS['tcp'], 4429, 'omviagent'),
-        'omviserver': Service(PROTOCOLS['tcp'], 4428, 'omviserver'),
-        'onbase-dds': Service(PROTOCOLS['tcp'], 2185, 'onbase-dds'),
-        'onehome-help': Service(PROTOCOLS['tcp'], 2199, 'onehome-help'),
-        'onehome-remote': Service(PROTOCOLS['tcp'], 2198, 'onehome-remote'),
-        'onep-tls': Service(PROTOCOLS['tcp'], 15002, 'onep-tls'),
-        'onesaf': Service(PROTOCOLS['tcp'], 3244, 'onesaf'),
-        'onmux': Service(PROTOCOLS['tcp'], 417, 'onmux'),
-        'onscreen': Service(PROTOCOLS['tcp'], 5080, 'onscreen'),
-        'ontime': Service(PROTOCOLS['tcp'], 1622, 'ontime'),
-        'ontobroker': Service(PROTOCOLS['tcp'], 2267, 'ontobroker'),
-        'oob-ws-http': Service(PROTOCOLS['tcp'], 623, 'oob-ws-http'),
-        'oob-ws-https': Service(PROTOCOLS['tcp'], 664, 'oob-ws-https'),
-        'op-probe': Service(PROTOCOLS['tcp'], 7030, 'op-probe'),
-        'opalis-rbt-ipc': Service(PROTOCOLS['tcp'], 5314, 'opalis-rbt-ipc'),
-        'opalis-rdv': Service(PROTOCOLS['tcp'], 536, 'opalis-rdv'),
-        'opalis-robot': Service(PROTOCOLS['tcp'], 314, 'opalis-robot'),
-        'opc-job-start': Service(PROTOCOLS['tcp'], 423, 'opc-job-start'),
-        'opc-job-track': Service(PROTOCOLS['tcp'], 424, 'opc-job-track'),
-        'opcon-xps': Service(PROTOCOLS['tcp'], 3100, 'opcon-xps'),
-        'opcua-tcp': Service(PROTOCOLS['tcp'], 4840, 'opcua-tcp'),
-        'opcua-tls': Service(PROTOCOLS['tcp'], 4843, 'opcua-tls'),
-        'opencm': Service(PROTOCOLS['tcp'], 3434, 'opencm'),
-        'opencore': Service(PROTOCOLS['tcp'], 4089, 'opencore'),
-        'opendeploy': Service(PROTOCOLS['tcp'], 20014, 'opendeploy'),
-        'openflow': Service(PROTOCOLS['tcp'], 6653, 'openflow'),
-        'openhpid': Service(PROTOCOLS['tcp'], 4743, 'openhpid'),
-        'openit': Service(PROTOCOLS['tcp'], 7478, 'openit'),
-        'openmail': Service(PROTOCOLS['tcp'], 5729, 'openmail'),
-        'openmailg': Service(PROTOCOLS['tcp'], 5755, 'openmailg'),
-        'openmailns': Service(PROTOCOLS['tcp'], 5766, 'openmailns'),
-        'openmailpxy': Service(PROTOCOLS['tcp'], 5768, 'openmailpxy'),
-        'openmath': Service(PROTOCOLS['tcp'], 1473, 'openmath'),
-        'opennl': Service(PROTOCOLS['tcp'], 1258, 'opennl'),
-        'opennl-voice': Service(PROTOCOLS['tcp'], 1259, 'opennl-voice'),
-        'openport': Service(PROTOCOLS['tcp'], 260, 'openport'),
-        'openqueue': Service(PROTOCOLS['tcp'], 8764, 'openqueue'),
-        'openremote-ctrl': Service(PROTOCOLS['tcp'], 8688, 'openremote-ctrl'),
-        'openstack-id': Service(PROTOCOLS['tcp'], 35357, 'openstack-id'),
-        'opentable': Service(PROTOCOLS['tcp'], 2368, 'opentable'),
-        'opentrac': Service(PROTOCOLS['tcp'], 3855, 'opentrac'),
-        'openvms-sysipc': Service(PROTOCOLS['tcp'], 557, 'openvms-sysipc'),
-        'openvpn': Service(PROTOCOLS['tcp'], 1194, 'openvpn'),
-        'openwebnet': Service(PROTOCOLS['tcp'], 20005, 'openwebnet'),
-        'opequus-server': Service(PROTOCOLS['tcp'], 2400, 'opequus-server'),
-        'opi-sock': Service(PROTOCOLS['tcp'], 7429, 'opi-sock'),
-        'opnet-smp': Service(PROTOCOLS['tcp'], 3433, 'opnet-smp'),
-        'opsec-cvp': Service(PROTOCOLS['tcp'], 18181, 'opsec-cvp'),
-        'opsec-ela': Service(PROTOCOLS['tcp'], 18187, 'opsec-ela'),
-        'opsec-lea': Service(PROTOCOLS['tcp'], 18184, 'opsec-lea'),
-        'opsec-omi': Service(PROTOCOLS['tcp'], 18185, 'opsec-omi'),
-        'opsec-sam': Service(PROTOCOLS['tcp'], 18183, 'opsec-sam'),
-        'opsec-uaa': Service(PROTOCOLS['tcp'], 19191, 'opsec-uaa'),
-        'opsec-ufp': Service(PROTOCOLS['tcp'], 18182, 'opsec-ufp'),
-        'opsession-clnt': Service(PROTOCOLS['tcp'], 3303, 'opsession-clnt'),
-        'opsession-prxy': Service(PROTOCOLS['tcp'], 3307, 'opsession-prxy'),
-        'opsession-srvr': Service(PROTOCOLS['tcp'], 3304, 'opsession-srvr'),
-        'opsmessaging': Service(PROTOCOLS['tcp'], 8090, 'opsmessaging'),
-        'opsmgr': Service(PROTOCOLS['tcp'], 1270, 'opsmgr'),
-        'opsview-envoy': Service(PROTOCOLS['tcp'], 4125, 'opsview-envoy'),
-        'opswagent': Service(PROTOCOLS['tcp'], 3976, 'opswagent'),
-        'opswmanager': Service(PROTOCOLS['tcp'], 3977, 'opswmanager'),
-        'optech-port1-lm': Service(PROTOCOLS['tcp'], 2237, 'optech-port1-lm'),
-        'optika-emedia': Service(PROTOCOLS['tcp'], 1829, 'optika-emedia'),
-        'optilogic': Service(PROTOCOLS['tcp'], 2435, 'optilogic'),
-        'optima-vnet': Service(PROTOCOLS['tcp'], 1051, 'optima-vnet'),
-        'optiwave-lm': Service(PROTOCOLS['tcp'], 2524, 'optiwave-lm'),
-        'optocontrol': Service(PROTOCOLS['tcp'], 22001, 'optocontrol'),
-        'optohost002': Service(PROTOCOLS['tcp'], 22002, 'optohost002'),
-        'optohost003': Service(PROTOCOLS['tcp'], 22003, 'optohost003'),
-        'optohost004': Service(PROTOCOLS['tcp'], 22005, 'optohost004'),
-        'opus-services': Service(PROTOCOLS['tcp'], 3718, 'opus-services'),
-        'ora-lm': Service(PROTOCOLS['tcp'], 1446, 'ora-lm'),
-        'ora-oap': Service(PROTOCOLS['tcp'], 5575, 'ora-oap'),
-        'oracle-em1': Service(PROTOCOLS['tcp'], 1748, 'oracle-em1'),
-        'oracle-em2': Service(PROTOCOLS['tcp'], 1754, 'oracle-em2'),
-        'oracle-ms-ens': Service(PROTOCOLS['tcp'], 8997, 'oracle-ms-ens'),
-        'oracle-oms': Service(PROTOCOLS['tcp'], 1159, 'oracle-oms'),
-        'oracle-vp1': Service(PROTOCOLS['tcp'], 1809, 'oracle-vp1'),
-        'oracle-vp2': Service(PROTOCOLS['tcp'], 1808, 'oracle-vp2'),
-        'oracleas-https': Service(PROTOCOLS['tcp'], 7443, 'oracleas-https'),
-        'oraclenames': Service(PROTOCOLS['tcp'], 1575, 'oraclenames'),
-        'oraclenet8cman': Service(PROTOCOLS['tcp'], 1630, 'oraclenet8cman'),
-        'orasrv': Service(PROTOCOLS['tcp'], 1525, 'orasrv'),
-        'orbiter': Service(PROTOCOLS['tcp'], 2398, 'orbiter'),
-        'orbix-cfg-ssl': Service(PROTOCOLS['tcp'], 3078, 'orbix-cfg-ssl'),
-        'orbix-config': Service(PROTOCOLS['tcp'], 3076, 'orbix-config'),
-        'orbix-loc-ssl': Service(PROTOCOLS['tcp'], 3077, 'orbix-loc-ssl'),
-        'orbix-locator': Service(PROTOCOLS['tcp'], 3075, 'orbix-locator'),
-        'orbixd': Service(PROTOCOLS['tcp'], 1570, 'orbixd'),
-        'orbplus-iiop': Service(PROTOCOLS['tcp'], 1597, 'orbplus-iiop'),
-        'ordinox-dbase': Service(PROTOCOLS['tcp'], 3355, 'ordinox-dbase'),
-        'ordinox-server': Service(PROTOCOLS['tcp'], 3274, 'ordinox-server'),
-        'origo-native': Service(PROTOCOLS['tcp'], 3001, 'origo-native'),
-        'origo-sync': Service(PROTOCOLS['tcp'], 11103, 'origo-sync'),
-        'orion': Service(PROTOCOLS['tcp'], 2407, 'orion'),
-        'orion-rmi-reg': Service(PROTOCOLS['tcp'], 2413, 'orion-rmi-reg'),
-        'os-licman': Service(PROTOCOLS['tcp'], 1384, 'os-licman'),
-        'osaut': Service(PROTOCOLS['tcp'], 6679, 'osaut'),
-        'osb-sd': Service(PROTOCOLS['tcp'], 400, 'osb-sd'),
-        'osdcp': Service(PROTOCOLS['tcp'], 3432, 'osdcp'),
-        'osm-appsrvr': Service(PROTOCOLS['tcp'], 9990, 'osm-appsrvr'),
-        'osm-oev': Service(PROTOCOLS['tcp'], 9991, 'osm-oev'),
-        'osmosis-aeea': Service(PROTOCOLS['tcp'], 3034, 'osmosis-aeea'),
-        'osp': Service(PROTOCOLS['tcp'], 5045, 'osp'),
-        'ospf-lite': Service(PROTOCOLS['tcp'], 8899, 'ospf-lite'),
-        'osu-nms': Service(PROTOCOLS['tcp'], 192, 'osu-nms'),
-        'osvr': Service(PROTOCOLS['tcp'], 7728, 'osvr'),
-        'otlp': Service(PROTOCOLS['tcp'], 6951, 'otlp'),
-        'otmp': Service(PROTOCOLS['tcp'], 29167, 'otmp'),
-        'otp': Service(PROTOCOLS['tcp'], 9390, 'otp'),
-        'otpatch': Service(PROTOCOLS['tcp'], 2936, 'otpatch'),
-        'ott': Service(PROTOCOLS['tcp'], 2428, 'ott'),
-        'ottp': Service(PROTOCOLS['tcp'], 2951, 'ottp'),
-        'otv': Service(PROTOCOLS['tcp'], 8472, 'otv'),
-        'outlaws': Service(PROTOCOLS['tcp'], 5310, 'outlaws'),
-        'ov-nnm-websrv': Service(PROTOCOLS['tcp'], 3443, 'ov-nnm-websrv'),
-        'ovalarmsrv': Service(PROTOCOLS['tcp'], 2953, 'ovalarmsrv'),
-        'ovalarmsrv-cmd': Service(PROTOCOLS['tcp'], 2954, 'ovalarmsrv-cmd'),
-        'ovbus': Service(PROTOCOLS['tcp'], 7501, 'ovbus'),
-        'oveadmgr': Service(PROTOCOLS['tcp'], 7427, 'oveadmgr'),
-        'ovhpas': Service(PROTOCOLS['tcp'], 7510, 'ovhpas'),
-        'ovladmgr': Service(PROTOCOLS['tcp'], 7428, 'ovladmgr'),
-        'ovobs': Service(PROTOCOLS['tcp'], 30999, 'ovobs'),
-        'ovrimosdbman': Service(PROTOCOLS['tcp'], 2956, 'ovrimosdbman'),
-        'ovsam-d-agent': Service(PROTOCOLS['tcp'], 3870, 'ovsam-d-agent'),
-        'ovsam-mgmt': Service(PROTOCOLS['tcp'], 3869, 'ovsam-mgmt'),
-        'ovsdb': Service(PROTOCOLS['tcp'], 6640, 'ovsdb'),
-        'ovsessionmgr': Service(PROTOCOLS['tcp'], 2389, 'ovsessionmgr'),
-        'ovtopmd': Service(PROTOCOLS['tcp'], 2532, 'ovtopmd'),
-        'ovwdb': Service(PROTOCOLS['tcp'], 2447, 'ovwdb'),
-        'owamp-control': Service(PROTOCOLS['tcp'], 861, 'owamp-control'),
-        'owms': Service(PROTOCOLS['tcp'], 7878, 'owms'),
-        'owserver': Service(PROTOCOLS['tcp'], 4304, 'owserver'),
-        'p-net-local': Service(PROTOCOLS['tcp'], 34378, 'p-net-local'),
-        'p-net-remote': Service(PROTOCOLS['tcp'], 34379, 'p-net-remote'),
-        'p2pcommunity': Service(PROTOCOLS['tcp'], 3955, 'p2pcommunity'),
-        'p2pevolvenet': Service(PROTOCOLS['tcp'], 8004, 'p2pevolvenet'),
-        'p2pgroup': Service(PROTOCOLS['tcp'], 3587, 'p2pgroup'),
-        'p2pq': Service(PROTOCOLS['tcp'], 1981, 'p2pq'),
-        'p4p-portal': Service(PROTOCOLS['tcp'], 6671, 'p4p-portal'),
-        'p6ssmc': Service(PROTOCOLS['tcp'], 4311, 'p6ssmc'),
-        'pace-licensed': Service(PROTOCOLS['tcp'], 31400, 'pace-licensed'),
-        'pacerforum': Service(PROTOCOLS['tcp'], 1480, 'pacerforum'),
-        'pacmand': Service(PROTOCOLS['tcp'], 1307, 'pacmand'),
-        'pacom': Service(PROTOCOLS['tcp'], 3435, 'pacom'),
-        'padl2sim': Service(PROTOCOLS['tcp'], 5236, 'padl2sim'),
-        'pads': Service(PROTOCOLS['tcp'], 7237, 'pads'),
-        'pafec-lm': Service(PROTOCOLS['tcp'], 7511, 'pafec-lm'),
-        'paging-port': Service(PROTOCOLS['tcp'], 3771, 'paging-port'),
-        'pago-services1': Service(PROTOCOLS['tcp'], 30001, 'pago-services1'),
-        'pago-services2': Service(PROTOCOLS['tcp'], 30002, 'pago-services2'),
-        'palace-1': Service(PROTOCOLS['tcp'], 9992, 'palace-1'),
-        'palace-2': Service(PROTOCOLS['tcp'], 9993, 'palace-2'),
-        'palace-3': Service(PROTOCOLS['tcp'], 9994, 'palace-3'),
-        'palace-4': Service(PROTOCOLS['tcp'], 9995, 'palace-4'),
-        'palace-5': Service(PROTOCOLS['tcp'], 9996, 'palace-5'),
-        'palace-6': Service(PROTOCOLS['tcp'], 9997, 'palace-6'),
-        'pammratc': Service(PROTOCOLS['tcp'], 1632, 'pammratc'),
-        'pammrpc': Service(PROTOCOLS['tcp'], 1633, 'pammrpc'),
-        'panagolin-ident': Service(PROTOCOLS['tcp'], 9021, 'panagolin-ident'),
-        'panasas': Service(PROTOCOLS['tcp'], 3095, 'panasas'),
-        'pando-pub': Service(PROTOCOLS['tcp'], 7680, 'pando-pub'),
-        'pando-sec': Service(PROTOCOLS['tcp'], 8276, 'pando-sec'),
-        'pangolin-laser': Service(PROTOCOLS['tcp'], 3348, 'pangolin-laser'),
-        'paradym-31port': Service(PROTOCOLS['tcp'], 1864, 'paradym-31port'),
-        'paragent': Service(PROTOCOLS['tcp'], 9022, 'paragent'),
-        'parallel': Service(PROTOCOLS['tcp'], 4989, 'parallel'),
-        'park-agent': Service(PROTOCOLS['tcp'], 5431, 'park-agent'),
-        'parliant': Service(PROTOCOLS['tcp'], 4681, 'parliant'),
-        'parsec-game': Service(PROTOCOLS['tcp'], 6582, 'parsec-game'),
-        'parsec-master': Service(PROTOCOLS['tcp'], 6580, 'parsec-master'),
-        'parsec-peer': Service(PROTOCOLS['tcp'], 6581, 'parsec-peer'),
-        'partimage': Service(PROTOCOLS['tcp'], 4025, 'partimage'),
-        'passgo': Service(PROTOCOLS['tcp'], 511, 'passgo'),
-        'passgo-tivoli': Service(PROTOCOLS['tcp'], 627, 'passgo-tivoli'),
-        'password-chg': Service(PROTOCOLS['tcp'], 586, 'password-chg'),
-        'passwrd-policy': Service(PROTOCOLS['tcp'], 1333, 'passwrd-policy'),
-        'patrol': Service(PROTOCOLS['tcp'], 8160, 'patrol'),
-        'patrol-coll': Service(PROTOCOLS['tcp'], 6162, 'patrol-coll'),
-        'patrol-ism': Service(PROTOCOLS['tcp'], 6161, 'patrol-ism'),
-        'patrol-mq-gm': Service(PROTOCOLS['tcp'], 2664, 'patrol-mq-gm'),
-        'patrol-mq-nm': Service(PROTOCOLS['tcp'], 2665, 'patrol-mq-nm'),
-        'patrol-snmp': Service(PROTOCOLS['tcp'], 8161, 'patrol-snmp'),
-        'patrolview': Service(PROTOCOLS['tcp'], 4097, 'patrolview'),
-        'pawserv': Service(PROTOCOLS['tcp'], 345, 'pawserv'),
-        'pay-per-view': Service(PROTOCOLS['tcp'], 1564, 'pay-per-view'),
-        'paycash-online': Service(PROTOCOLS['tcp'], 8128, 'paycash-online'),
-        'paycash-wbp': Service(PROTOCOLS['tcp'], 8129, 'paycash-wbp'),
-        'payrouter': Service(PROTOCOLS['tcp'], 1246, 'payrouter'),
-        'pc-mta-addrmap': Service(PROTOCOLS['tcp'], 2246, 'pc-mta-addrmap'),
-        'pc-telecommute': Service(PROTOCOLS['tcp'], 2299, 'pc-telecommute'),
-        'pcanywheredata': Service(PROTOCOLS['tcp'], 5631, 'pcanywheredata'),
-        'pcanywherestat': Service(PROTOCOLS['tcp'], 5632, 'pcanywherestat'),
-        'pcc-image-port': Service(PROTOCOLS['tcp'], 3892, 'pcc-image-port'),
-        'pcc-mfp': Service(PROTOCOLS['tcp'], 2256, 'pcc-mfp'),
-        'pcep': Service(PROTOCOLS['tcp'], 4189, 'pcep'),
-        'pcia-rxp-b': Service(PROTOCOLS['tcp'], 1332, 'pcia-rxp-b'),
-        'pciarray': Service(PROTOCOLS['tcp'], 1552, 'pciarray'),
-        'pcihreq': Service(PROTOCOLS['tcp'], 3085, 'pcihreq'),
-        'pcle-infex': Service(PROTOCOLS['tcp'], 3189, 'pcle-infex'),
-        'pclemultimedia': Service(PROTOCOLS['tcp'], 2558, 'pclemultimedia'),
-        'pcmail-srv': Service(PROTOCOLS['tcp'], 158, 'pcmail-srv'),
-        'pcmk-remote': Service(PROTOCOLS['tcp'], 3121, 'pcmk-remote'),
-        'pcoip': Service(PROTOCOLS['tcp'], 4172, 'pcoip'),
-        'pcoip-mgmt': Service(PROTOCOLS['tcp'], 5172, 'pcoip-mgmt'),
-        'pconnectmgr': Service(PROTOCOLS['tcp'], 1562, 'pconnectmgr'),
-        'pcptcpservice': Service(PROTOCOLS['tcp'], 4182, 'pcptcpservice'),
-        'pcs-pcw': Service(PROTOCOLS['tcp'], 2566, 'pcs-pcw'),
-        'pcs-sf-ui-man': Service(PROTOCOLS['tcp'], 6655, 'pcs-sf-ui-man'),
-        'pcsync-http': Service(PROTOCOLS['tcp'], 8444, 'pcsync-http'),
-        'pcsync-https': Service(PROTOCOLS['tcp'], 8443, 'pcsync-https'),
-        'pctrader': Service(PROTOCOLS['tcp'], 3048, 'pctrader'),
-        'pcttunnell': Service(PROTOCOLS['tcp'], 2274, 'pcttunnell'),
-        'pd-admin': Service(PROTOCOLS['tcp'], 9597, 'pd-admin'),
-        'pda-data': Service(PROTOCOLS['tcp'], 3253, 'pda-data'),
-        'pda-gate': Service(PROTOCOLS['tcp'], 4012, 'pda-gate'),
-        'pda-sys': Service(PROTOCOLS['tcp'], 3254, 'pda-sys'),
-        'pdap': Service(PROTOCOLS['tcp'], 344, 'pdap'),
-        'pdap-np': Service(PROTOCOLS['tcp'], 1526, 'pdap-np'),
-        'pdb': Service(PROTOCOLS['tcp'], 3033, 'pdb'),
-        'pdefmns': Service(PROTOCOLS['tcp'], 16311, 'pdefmns'),
-        'pdl-datastream': Service(PROTOCOLS['tcp'], 9100, 'pdl-datastream'),
-        'pdnet': Service(PROTOCOLS['tcp'], 2843, 'pdnet'),
-        'pdp': Service(PROTOCOLS['tcp'], 1675, 'pdp'),
-        'pdps': Service(PROTOCOLS['tcp'], 1314, 'pdps'),
-        'pdrncs': Service(PROTOCOLS['tcp'], 3299, 'pdrncs'),
-        'pds': Service(PROTOCOLS['tcp'], 9595, 'pds'),
-        'pdtp': Service(PROTOCOLS['tcp'], 6086, 'pdtp'),
-        'pduncs': Service(PROTOCOLS['tcp'], 16310, 'pduncs'),
-        'pe-mike': Service(PROTOCOLS['tcp'], 1305, 'pe-mike'),
-        'pearldoc-xact': Service(PROTOCOLS['tcp'], 1980, 'pearldoc-xact'),
-        'peerbook-port': Service(PROTOCOLS['tcp'], 3135, 'peerbook-port'),
-        'peerwire': Service(PROTOCOLS['tcp'], 9104, 'peerwire'),
-        'pegasus': Service(PROTOCOLS['tcp'], 9278, 'pegasus'),
-        'pegasus-ctl': Service(PROTOCOLS['tcp'], 9279, 'pegasus-ctl'),
-        'pegboard': Service(PROTOCOLS['tcp'], 1357, 'pegboard'),
-        'pehelp': Service(PROTOCOLS['tcp'], 2307, 'pehelp'),
-        'pentbox-sim': Service(PROTOCOLS['tcp'], 6817, 'pentbox-sim'),
-        'peocoll': Service(PROTOCOLS['tcp'], 9631, 'peocoll'),
-        'peoctlr': Service(PROTOCOLS['tcp'], 9630, 'peoctlr'),
-        'peport': Service(PROTOCOLS['tcp'], 1449, 'peport'),
-        'perf-port': Service(PROTOCOLS['tcp'], 1995, 'perf-port'),
-        'perfd': Service(PROTOCOLS['tcp'], 5227, 'perfd'),
-        'perimlan': Service(PROTOCOLS['tcp'], 4075, 'perimlan'),
-        'periscope': Service(PROTOCOLS['tcp'], 1230, 'periscope'),
-        'permabit-cs': Service(PROTOCOLS['tcp'], 5312, 'permabit-cs'),
-        'perrla': Service(PROTOCOLS['tcp'], 4313, 'perrla'),
-        'persona': Service(PROTOCOLS['tcp'], 1916, 'persona'),
-        'personal-agent': Service(PROTOCOLS['tcp'], 5555, 'personal-agent'),
-        'personal-link': Service(PROTOCOLS['tcp'], 281, 'personal-link'),
-        'personalos-001': Service(PROTOCOLS['tcp'], 3557, 'personalos-001'),
-        'personnel': Service(PROTOCOLS['tcp'], 3109, 'personnel'),
-        'pftp': Service(PROTOCOLS['tcp'], 662, 'pftp'),
-        'pfu-prcallback': Service(PROTOCOLS['tcp'], 3208, 'pfu-prcallback'),
-        'pgbouncer': Service(PROTOCOLS['tcp'], 6432, 'pgbouncer'),
-        'pgps': Service(PROTOCOLS['tcp'], 9280, 'pgps'),
-        'ph': Service(PROTOCOLS['tcp'], 481, 'ph'),
-        'pharmasoft': Service(PROTOCOLS['tcp'], 1779, 'pharmasoft'),
-        'pharos': Service(PROTOCOLS['tcp'], 4443, 'pharos'),
-        'philips-vc': Service(PROTOCOLS['tcp'], 583, 'philips-vc'),
-        'phoenix-rpc': Service(PROTOCOLS['tcp'], 3347, 'phoenix-rpc'),
-        'phonebook': Service(PROTOCOLS['tcp'], 767, 'phonebook'),
-        'phonex-port': Service(PROTOCOLS['tcp'], 3177, 'phonex-port'),
-        'photuris': Service(PROTOCOLS['tcp'], 468, 'photuris'),
-        'phrelay': Service(PROTOCOLS['tcp'], 4868, 'phrelay'),
-        'phrelaydbg': Service(PROTOCOLS['tcp'], 4869, 'phrelaydbg'),
-        'piccolo': Service(PROTOCOLS['tcp'], 2787, 'piccolo'),
-        'pichat': Service(PROTOCOLS['tcp'], 9009, 'pichat'),
-        'picknfs': Service(PROTOCOLS['tcp'], 1598, 'picknfs'),
-        'picodbc': Service(PROTOCOLS['tcp'], 1603, 'picodbc'),
-        'pictrography': Service(PROTOCOLS['tcp'], 1280, 'pictrography'),
-        'pim-port': Service(PROTOCOLS['tcp'], 8471, 'pim-port'),
-        'pim-rp-disc': Service(PROTOCOLS['tcp'], 496, 'pim-rp-disc'),
-        'pinghgl': Service(PROTOCOLS['tcp'], 4306, 'pinghgl'),
-        'pip': Service(PROTOCOLS['tcp'], 1321, 'pip'),
-        'pipes': Service(PROTOCOLS['tcp'], 1465, 'pipes'),
-        'piranha1': Service(PROTOCOLS['tcp'], 4600, 'piranha1'),
-        'piranha2': Service(PROTOCOLS['tcp'], 4601, 'piranha2'),
-        'pirp': Service(PROTOCOLS['tcp'], 553, 'pirp'),
-        'pit-vpn': Service(PROTOCOLS['tcp'], 2865, 'pit-vpn'),
-        'pjj-player': Service(PROTOCOLS['tcp'], 4416, 'pjj-player'),
-        'pjlink': Service(PROTOCOLS['tcp'], 4352, 'pjlink'),
-        'pk': Service(PROTOCOLS['tcp'], 5272, 'pk'),
-        'pk-electronics': Service(PROTOCOLS['tcp'], 2634, 'pk-electronics'),
-        'pkagent': Service(PROTOCOLS['tcp'], 3118, 'pkagent'),
-        'pkix-3-ca-ra': Service(PROTOCOLS['tcp'], 829, 'pkix-3-ca-ra'),
-        'pkix-cmc': Service(PROTOCOLS['tcp'], 5318, 'pkix-cmc'),
-        'pkix-timestamp': Service(PROTOCOLS['tcp'], 318, 'pkix-timestamp'),
-        'pkt-krb-ipsec': Service(PROTOCOLS['tcp'], 1293, 'pkt-krb-ipsec'),
-        'pktcable-cops': Service(PROTOCOLS['tcp'], 2126, 'pktcable-cops'),
-        'pktcablemmcops': Service(PROTOCOLS['tcp'], 3918, 'pktcablemmcops'),
-        'plato': Service(PROTOCOLS['tcp'], 3285, 'plato'),
-        'plato-lm': Service(PROTOCOLS['tcp'], 1819, 'plato-lm'),
-        'playsta2-app': Service(PROTOCOLS['tcp'], 4658, 'playsta2-app'),
-        'playsta2-lob': Service(PROTOCOLS['tcp'], 4659, 'playsta2-lob'),
-        'plbserve-port': Service(PROTOCOLS['tcp'], 3933, 'plbserve-port'),
-        'plcy-net-svcs': Service(PROTOCOLS['tcp'], 4351, 'plcy-net-svcs'),
-        'plethora': Service(PROTOCOLS['tcp'], 3480, 'plethora'),
-        'plex': Service(PROTOCOLS['tcp'], 32400, 'plex'),
-        'plgproxy': Service(PROTOCOLS['tcp'], 2790, 'plgproxy'),
-        'pluribus': Service(PROTOCOLS['tcp'], 3469, 'pluribus'),
-        'plysrv-http': Service(PROTOCOLS['tcp'], 6770, 'plysrv-http'),
-        'plysrv-https': Service(PROTOCOLS['tcp'], 6771, 'plysrv-https'),
-        'pm-cmdsvr': Service(PROTOCOLS['tcp'], 5112, 'pm-cmdsvr'),
-        'pmas': Service(PROTOCOLS['tcp'], 4066, 'pmas'),
-        'pmcd': Service(PROTOCOLS['tcp'], 44321, 'pmcd'),
-        'pmcdproxy': Service(PROTOCOLS['tcp'], 44322, 'pmcdproxy'),
-        'pmcp': Service(PROTOCOLS['tcp'], 3821, 'pmcp'),
-        'pmcs': Service(PROTOCOLS['tcp'], 6355, 'pmcs'),
-        'pmd': Service(PROTOCOLS['tcp'], 7431, 'pmd'),
-        'pmdfmgt': Service(PROTOCOLS['tcp'], 7633, 'pmdfmgt'),
-        'pmdmgr': Service(PROTOCOLS['tcp'], 7426, 'pmdmgr'),
-        'pmsm-webrctl': Service(PROTOCOLS['tcp'], 2972, 'pmsm-webrctl'),
-        'pmwebapi': Service(PROTOCOLS['tcp'], 44323, 'pmwebapi'),
-        'pn-requester': Service(PROTOCOLS['tcp'], 2717, 'pn-requester'),
-        'pn-requester2': Service(PROTOCOLS['tcp'], 2718, 'pn-requester2'),
-        'pnaconsult-lm': Service(PROTOCOLS['tcp'], 2937, 'pnaconsult-lm'),
-        'pnbs': Service(PROTOCOLS['tcp'], 6124, 'pnbs'),
-        'pnbscada': Service(PROTOCOLS['tcp'], 3875, 'pnbscada'),
-        'pnet-conn': Service(PROTOCOLS['tcp'], 7797, 'pnet-conn'),
-        'pnet-enc': Service(PROTOCOLS['tcp'], 7798, 'pnet-enc'),
-        'pnrp-port': Service(PROTOCOLS['tcp'], 3540, 'pnrp-port'),
-        'pns': Service(PROTOCOLS['tcp'], 2487, 'pns'),
-        'polestar': Service(PROTOCOLS['tcp'], 1060, 'polestar'),
-        'policyserver': Service(PROTOCOLS['tcp'], 3055, 'policyserver'),
-        'pon-ictp': Service(PROTOCOLS['tcp'], 7202, 'pon-ictp'),
-        'pop2': Service(PROTOCOLS['tcp'], 109, 'pop2'),
-        'pop3': Service(PROTOCOLS['tcp'], 110, 'pop3'),
-        'pop3s': Service(PROTOCOLS['tcp'], 995, 'pop3s'),
-        'popup-reminders': Service(PROTOCOLS['tcp'], 7787, 'popup-reminders'),
-        'portgate-auth': Service(PROTOCOLS['tcp'], 3710, 'portgate-auth'),
-        'postgresql': Service(PROTOCOLS['tcp'], 5432, 'postgresql'),
-        'pov-ray': Service(PROTOCOLS['tcp'], 494, 'pov-ray'),
-        'poweralert-nsa': Service(PROTOCOLS['tcp'], 4150, 'poweralert-nsa'),
-        'powerburst': Service(PROTOCOLS['tcp'], 485, 'powerburst'),
-        'powerclientcsf': Service(PROTOCOLS['tcp'], 2443, 'powerclientcsf'),
-        'powerexchange': Service(PROTOCOLS['tcp'], 2480, 'powerexchange'),
-        'powergemplus': Service(PROTOCOLS['tcp'], 2899, 'powergemplus'),
-        'powerguardian': Service(PROTOCOLS['tcp'], 1777, 'powerguardian'),
-        'poweronnud': Service(PROTOCOLS['tcp'], 3168, 'poweronnud'),
-        'powerschool': Service(PROTOCOLS['tcp'], 5071, 'powerschool'),
-        'powwow-client': Service(PROTOCOLS['tcp'], 13223, 'powwow-client'),
-        'powwow-server': Service(PROTOCOLS['tcp'], 13224, 'powwow-server'),
-        'ppactivation': Service(PROTOCOLS['tcp'], 5134, 'ppactivation'),
-        'ppcontrol': Service(PROTOCOLS['tcp'], 2505, 'ppcontrol'),
-        'ppsms': Service(PROTOCOLS['tcp'], 3967, 'ppsms'),
-        'ppsuitemsg': Service(PROTOCOLS['tcp'], 5863, 'ppsuitemsg'),
-        'pptconference': Service(PROTOCOLS['tcp'], 1711, 'pptconference'),
-        'pptp': Service(PROTOCOLS['tcp'], 1723, 'pptp'),
-        'pq-lic-mgmt': Service(PROTOCOLS['tcp'], 2687, 'pq-lic-mgmt'),
-        'pqsflows': Service(PROTOCOLS['tcp'], 9640, 'pqsflows'),
-        'pqsp': Service(PROTOCOLS['tcp'], 28001, 'pqsp'),
-        'pra-elmd': Service(PROTOCOLS['tcp'], 1587, 'pra-elmd'),
-        'pra_elmd': Service(PROTOCOLS['tcp'], 1587, 'pra_elmd'),
-        'prat': Service(PROTOCOLS['tcp'], 1264, 'prat'),
-        'prchat-server': Service(PROTOCOLS['tcp'], 4456, 'prchat-server'),
-        'prchat-user': Service(PROTOCOLS['tcp'], 4455, 'prchat-user'),
-        'precise-comm': Service(PROTOCOLS['tcp'], 5630, 'precise-comm'),
-        'precise-i3': Service(PROTOCOLS['tcp'], 3607, 'precise-i3'),
-        'precise-sft': Service(PROTOCOLS['tcp'], 2315, 'precise-sft'),
-        'precise-vip': Service(PROTOCOLS['tcp'], 2924, 'precise-vip'),
-        'predatar-comms': Service(PROTOCOLS['tcp'], 1753, 'predatar-comms'),
-        'prelude': Service(PROTOCOLS['tcp'], 4690, 'prelude'),
-        'presence': Service(PROTOCOLS['tcp'], 5298, 'presence'),
-        'press': Service(PROTOCOLS['tcp'], 3582, 'press'),
-        'prex-tcp': Service(PROTOCOLS['tcp'], 4487, 'prex-tcp'),
-        'prgp': Service(PROTOCOLS['tcp'], 7747, 'prgp'),
-        'primaserver': Service(PROTOCOLS['tcp'], 6105, 'primaserver'),
-        'princity-agent': Service(PROTOCOLS['tcp'], 6716, 'princity-agent'),
-        'print-srv': Service(PROTOCOLS['tcp'], 170, 'print-srv'),
-        'printer': Service(PROTOCOLS['tcp'], 515, 'printer'),
-        'printer-agent': Service(PROTOCOLS['tcp'], 3396, 'printer-agent'),
-        'printer_agent': Service(PROTOCOLS['tcp'], 3396, 'printer_agent'),
-        'printopia': Service(PROTOCOLS['tcp'], 10631, 'printopia'),
-        'priority-e-com': Service(PROTOCOLS['tcp'], 2618, 'priority-e-com'),
-        'prism-deploy': Service(PROTOCOLS['tcp'], 3133, 'prism-deploy'),
-        'prismiq-plugin': Service(PROTOCOLS['tcp'], 3650, 'prismiq-plugin'),
-        'privateark': Service(PROTOCOLS['tcp'], 1858, 'privateark'),
-        'privatechat': Service(PROTOCOLS['tcp'], 1735, 'privatechat'),
-        'privatewire': Service(PROTOCOLS['tcp'], 4449, 'privatewire'),
-        'privilege': Service(PROTOCOLS['tcp'], 2588, 'privilege'),
-        'privoxy': Service(PROTOCOLS['tcp'], 8118, 'privoxy'),
-        'prizma': Service(PROTOCOLS['tcp'], 2039, 'prizma'),
-        'prm-nm': Service(PROTOCOLS['tcp'], 409, 'prm-nm'),
-        'prm-nm-np': Service(PROTOCOLS['tcp'], 1403, 'prm-nm-np'),
-        'prm-sm': Service(PROTOCOLS['tcp'], 408, 'prm-sm'),
-        'prm-sm-np': Service(PROTOCOLS['tcp'], 1402, 'prm-sm-np'),
-        'prnrequest': Service(PROTOCOLS['tcp'], 3910, 'prnrequest'),
-        'prnstatus': Service(PROTOCOLS['tcp'], 3911, 'prnstatus'),
-        'pro-ed': Service(PROTOCOLS['tcp'], 8032, 'pro-ed'),
-        'proactivate': Service(PROTOCOLS['tcp'], 24678, 'proactivate'),
-        'proactivesrvr': Service(PROTOCOLS['tcp'], 2722, 'proactivesrvr'),
-        'proaxess': Service(PROTOCOLS['tcp'], 3961, 'proaxess'),
-        'procos-lm': Service(PROTOCOLS['tcp'], 3248, 'procos-lm'),
-        'prodigy-intrnet': Service(PROTOCOLS['tcp'], 1778, 'prodigy-intrnet'),
-        'productinfo': Service(PROTOCOLS['tcp'], 1283, 'productinfo'),
-        'profile': Service(PROTOCOLS['tcp'], 136, 'profile'),
-        'profilemac': Service(PROTOCOLS['tcp'], 4749, 'profilemac'),
-        'profinet-cm': Service(PROTOCOLS['tcp'], 34964, 'profinet-cm'),
-        'profinet-rt': Service(PROTOCOLS['tcp'], 34962, 'profinet-rt'),
-        'profinet-rtm': Service(PROTOCOLS['tcp'], 34963, 'profinet-rtm'),
-        'progistics': Service(PROTOCOLS['tcp'], 3973, 'progistics'),
-        'programmar': Service(PROTOCOLS['tcp'], 15999, 'programmar'),
-        'prolink': Service(PROTOCOLS['tcp'], 1678, 'prolink'),
-        'proofd': Service(PROTOCOLS['tcp'], 1093, 'proofd'),
-        'propel-msgsys': Service(PROTOCOLS['tcp'], 1268, 'propel-msgsys'),
-        'proremote': Service(PROTOCOLS['tcp'], 8183, 'proremote'),
-        'proshare-mc-1': Service(PROTOCOLS['tcp'], 1673, 'proshare-mc-1'),
-        'proshare-mc-2': Service(PROTOCOLS['tcp'], 1674, 'proshare-mc-2'),
-        'proshare1': Service(PROTOCOLS['tcp'], 1459, 'proshare1'),
-        'proshare2': Service(PROTOCOLS['tcp'], 1460, 'proshare2'),
-        'proshareaudio': Service(PROTOCOLS['tcp'], 5713, 'proshareaudio'),
-        'prosharedata': Service(PROTOCOLS['tcp'], 5715, 'prosharedata'),
-        'prosharenotify': Service(PROTOCOLS['tcp'], 5717, 'prosharenotify'),
-        'prosharerequest': Service(PROTOCOLS['tcp'], 5716, 'prosharerequest'),
-        'prosharevideo': Service(PROTOCOLS['tcp'], 5714, 'prosharevideo'),
-        'prospero': Service(PROTOCOLS['tcp'], 191, 'prospero'),
-        'prospero-np': Service(PROTOCOLS['tcp'], 1525, 'prospero-np'),
-        'proxim': Service(PROTOCOLS['tcp'], 1732, 'proxim'),
-        'proxima-lm': Service(PROTOCOLS['tcp'], 1445, 'proxima-lm'),
-        'proxy-gateway': Service(PROTOCOLS['tcp'], 2303, 'proxy-gateway'),
-        'prp': Service(PROTOCOLS['tcp'], 2091, 'prp'),
-        'prregister': Service(PROTOCOLS['tcp'], 4457, 'prregister'),
-        'prsvp': Service(PROTOCOLS['tcp'], 3455, 'prsvp'),
-        'ps-ams': Service(PROTOCOLS['tcp'], 3658, 'ps-ams'),
-        'ps-capture-pro': Service(PROTOCOLS['tcp'], 7216, 'ps-capture-pro'),
-        'ps-server': Service(PROTOCOLS['tcp'], 7215, 'ps-server'),
-        'psbserver': Service(PROTOCOLS['tcp'], 2350, 'psbserver'),
-        'pscl-mgt': Service(PROTOCOLS['tcp'], 4312, 'pscl-mgt'),
-        'pscribe': Service(PROTOCOLS['tcp'], 6163, 'pscribe'),
-        'pscupd': Service(PROTOCOLS['tcp'], 3453, 'pscupd'),
-        'psdbserver': Service(PROTOCOLS['tcp'], 2355, 'psdbserver'),
-        'pserver': Service(PROTOCOLS['tcp'], 3662, 'pserver'),
-        'psi-ptt': Service(PROTOCOLS['tcp'], 4374, 'psi-ptt'),
-        'psl-management': Service(PROTOCOLS['tcp'], 5507, 'psl-management'),
-        'pslicser': Service(PROTOCOLS['tcp'], 4168, 'pslicser'),
-        'pslserver': Service(PROTOCOLS['tcp'], 2352, 'pslserver'),
-        'psmond': Service(PROTOCOLS['tcp'], 1788, 'psmond'),
-        'psprserver': Service(PROTOCOLS['tcp'], 2354, 'psprserver'),
-        'pspserver': Service(PROTOCOLS['tcp'], 2353, 'pspserver'),
-        'psrserver': Service(PROTOCOLS['tcp'], 2351, 'psrserver'),
-        'pss': Service(PROTOCOLS['tcp'], 7880, 'pss'),
-        'pssc': Service(PROTOCOLS['tcp'], 645, 'pssc'),
-        'pt-tls': Service(PROTOCOLS['tcp'], 271, 'pt-tls'),
-        'pt2-discover': Service(PROTOCOLS['tcp'], 1101, 'pt2-discover'),
-        'ptcnameservice': Service(PROTOCOLS['tcp'], 597, 'ptcnameservice'),
-        'ptk-alink': Service(PROTOCOLS['tcp'], 3089, 'ptk-alink'),
-        'ptp': Service(PROTOCOLS['tcp'], 15740, 'ptp'),
-        'ptp-event': Service(PROTOCOLS['tcp'], 319, 'ptp-event'),
-        'ptp-general': Service(PROTOCOLS['tcp'], 320, 'ptp-general'),
-        'publiqare-sync': Service(PROTOCOLS['tcp'], 4329, 'publiqare-sync'),
-        'pulsonixnls': Service(PROTOCOLS['tcp'], 6140, 'pulsonixnls'),
-        'pump': Service(PROTOCOLS['tcp'], 751, 'pump'),
-        'pumpkindb': Service(PROTOCOLS['tcp'], 9981, 'pumpkindb'),
-        'puppet': Service(PROTOCOLS['tcp'], 8140, 'puppet'),
-        'puprouter': Service(PROTOCOLS['tcp'], 999, 'puprouter'),
-        'purenoise': Service(PROTOCOLS['tcp'], 663, 'purenoise'),
-        'purityrpc': Service(PROTOCOLS['tcp'], 8117, 'purityrpc'),
-        'pushns': Service(PROTOCOLS['tcp'], 7997, 'pushns'),
-        'pvaccess': Service(PROTOCOLS['tcp'], 5075, 'pvaccess'),
-        'pvsw': Service(PROTOCOLS['tcp'], 2520, 'pvsw'),
-        'pvsw-inet': Service(PROTOCOLS['tcp'], 2441, 'pvsw-inet'),
-        'pvuniwien': Service(PROTOCOLS['tcp'], 1081, 'pvuniwien'),
-        'pvxpluscs': Service(PROTOCOLS['tcp'], 4093, 'pvxpluscs'),
-        'pvxplusio': Service(PROTOCOLS['tcp'], 4193, 'pvxplusio'),
-        'pwdgen': Service(PROTOCOLS['tcp'], 129, 'pwdgen'),
-        'pwdis': Service(PROTOCOLS['tcp'], 3735, 'pwdis'),
-        'pwgippfax': Service(PROTOCOLS['tcp'], 3951, 'pwgippfax'),
-        'pwgpsi': Service(PROTOCOLS['tcp'], 3800, 'pwgpsi'),
-        'pwgwims': Service(PROTOCOLS['tcp'], 4951, 'pwgwims'),
-        'pwrsevent': Service(PROTOCOLS['tcp'], 2694, 'pwrsevent'),
-        'pxc-epmap': Service(PROTOCOLS['tcp'], 2434, 'pxc-epmap'),
-        'pxc-ntfy': Service(PROTOCOLS['tcp'], 3009, 'pxc-ntfy'),
-        'pxc-pin': Service(PROTOCOLS['tcp'], 4005, 'pxc-pin'),
-        'pxc-roid': Service(PROTOCOLS['tcp'], 4004, 'pxc-roid'),
-        'pxc-sapxom': Service(PROTOCOLS['tcp'], 2680, 'pxc-sapxom'),
-        'pxc-splr': Service(PROTOCOLS['tcp'], 4007, 'pxc-splr'),
-        'pxc-splr-ft': Service(PROTOCOLS['tcp'], 4003, 'pxc-splr-ft'),
-        'pxc-spvr': Service(PROTOCOLS['tcp'], 4006, 'pxc-spvr'),
-        'pxc-spvr-ft': Service(PROTOCOLS['tcp'], 4002, 'pxc-spvr-ft'),
-        'pyrrho': Service(PROTOCOLS['tcp'], 5433, 'pyrrho'),
-        'q3ade': Service(PROTOCOLS['tcp'], 7794, 'q3ade'),
-        'q55-pcc': Service(PROTOCOLS['tcp'], 1253, 'q55-pcc'),
-        'qadmifevent': Service(PROTOCOLS['tcp'], 2462, 'qadmifevent'),
-        'qadmifoper': Service(PROTOCOLS['tcp'], 2461, 'qadmifoper'),
-        'qb-db-server': Service(PROTOCOLS['tcp'], 10160, 'qb-db-server'),
-        'qbdb': Service(PROTOCOLS['tcp'], 8019, 'qbdb'),
-        'qbikgdp': Service(PROTOCOLS['tcp'], 368, 'qbikgdp'),
-        'qcp': Service(PROTOCOLS['tcp'], 5082, 'qcp'),
-        'qdb2service': Service(PROTOCOLS['tcp'], 45825, 'qdb2service'),
-        'qencp': Service(PROTOCOLS['tcp'], 2120, 'qencp'),
-        'qfp': Service(PROTOCOLS['tcp'], 5083, 'qfp'),
-        'qft': Service(PROTOCOLS['tcp'], 189, 'qft'),
-        'qftest-lookup': Service(PROTOCOLS['tcp'], 3543, 'qftest-lookup'),
-        'qip-audup': Service(PROTOCOLS['tcp'], 2765, 'qip-audup'),
-        'qip-login': Service(PROTOCOLS['tcp'], 2366, 'qip-login'),
-        'qip-msgd': Service(PROTOCOLS['tcp'], 2468, 'qip-msgd'),
-        'qip-qdhcp': Service(PROTOCOLS['tcp'], 2490, 'qip-qdhcp'),
-        'qke-llc-v3': Service(PROTOCOLS['tcp'], 2523, 'qke-llc-v3'),
-        'qmqp': Service(PROTOCOLS['tcp'], 628, 'qmqp'),
-        'qmtp': Service(PROTOCOLS['tcp'], 209, 'qmtp'),
-        'qmtps': Service(PROTOCOLS['tcp'], 6209, 'qmtps'),
-        'qmvideo': Service(PROTOCOLS['tcp'], 5689, 'qmvideo'),
-        'qnts-orb': Service(PROTOCOLS['tcp'], 1262, 'qnts-orb'),
-        'qnxnetman': Service(PROTOCOLS['tcp'], 3385, 'qnxnetman'),
-        'qo-secure': Service(PROTOCOLS['tcp'], 7913, 'qo-secure'),
-        'qotd': Service(PROTOCOLS['tcp'], 17, 'qotd'),
-        'qotps': Service(PROTOCOLS['tcp'], 2724, 'qotps'),
-        'qpasa-agent': Service(PROTOCOLS['tcp'], 2612, 'qpasa-agent'),
-        'qptlmd': Service(PROTOCOLS['tcp'], 10055, 'qptlmd'),
-        'qrh': Service(PROTOCOLS['tcp'], 752, 'qrh'),
-        'qsm-gui': Service(PROTOCOLS['tcp'], 1165, 'qsm-gui'),
-        'qsm-proxy': Service(PROTOCOLS['tcp'], 1164, 'qsm-proxy'),
-        'qsm-remote': Service(PROTOCOLS['tcp'], 1166, 'qsm-remote'),
-        'qsnet-assist': Service(PROTOCOLS['tcp'], 4356, 'qsnet-assist'),
-        'qsnet-cond': Service(PROTOCOLS['tcp'], 4357, 'qsnet-cond'),
-        'qsnet-nucl': Service(PROTOCOLS['tcp'], 4358, 'qsnet-nucl'),
-        'qsnet-trans': Service(PROTOCOLS['tcp'], 4354, 'qsnet-trans'),
-        'qsnet-workst': Service(PROTOCOLS['tcp'], 4355, 'qsnet-workst'),
-        'qsoft': Service(PROTOCOLS['tcp'], 3059, 'qsoft'),
-        'qt-serveradmin': Service(PROTOCOLS['tcp'], 1220, 'qt-serveradmin'),
-        'qtms-bootstrap': Service(PROTOCOLS['tcp'], 3850, 'qtms-bootstrap'),
-        'qtp': Service(PROTOCOLS['tcp'], 2935, 'qtp'),
-        'quaddb': Service(PROTOCOLS['tcp'], 2497, 'quaddb'),
-        'quailnet': Service(PROTOCOLS['tcp'], 5464, 'quailnet'),
-        'quake': Service(PROTOCOLS['tcp'], 26000, 'quake'),
-        'quantastor': Service(PROTOCOLS['tcp'], 8153, 'quantastor'),
-        'quartus-tcl': Service(PROTOCOLS['tcp'], 2589, 'quartus-tcl'),
-        'quasar-server': Service(PROTOCOLS['tcp'], 3599, 'quasar-server'),
-        'qubes': Service(PROTOCOLS['tcp'], 1341, 'qubes'),
-        'quest-agent': Service(PROTOCOLS['tcp'], 3843, 'quest-agent'),
-        'quest-data-hub': Service(PROTOCOLS['tcp'], 3566, 'quest-data-hub'),
-        'quest-vista': Service(PROTOCOLS['tcp'], 7980, 'quest-vista'),
-        'questdb2-lnchr': Service(PROTOCOLS['tcp'], 5677, 'questdb2-lnchr'),
-        'questnotify': Service(PROTOCOLS['tcp'], 3554, 'questnotify'),
-        'queueadm': Service(PROTOCOLS['tcp'], 2230, 'queueadm'),
-        'quickbooksrds': Service(PROTOCOLS['tcp'], 3790, 'quickbooksrds'),
-        'quicksuite': Service(PROTOCOLS['tcp'], 2900, 'quicksuite'),
-        'quosa': Service(PROTOCOLS['tcp'], 4841, 'quosa'),
-        'quotad': Service(PROTOCOLS['tcp'], 762, 'quotad'),
-        'qvr': Service(PROTOCOLS['tcp'], 5028, 'qvr'),
-        'qwave': Service(PROTOCOLS['tcp'], 2177, 'qwave'),
-        'raadmin': Service(PROTOCOLS['tcp'], 5676, 'raadmin'),
-        'racf': Service(PROTOCOLS['tcp'], 18136, 'racf'),
-        'radan-http': Service(PROTOCOLS['tcp'], 8088, 'radan-http'),
-        'radclientport': Service(PROTOCOLS['tcp'], 3178, 'radclientport'),
-        'radec-corp': Service(PROTOCOLS['tcp'], 5430, 'radec-corp'),
-        'radg': Service(PROTOCOLS['tcp'], 6789, 'radg'),
-        'radio': Service(PROTOCOLS['tcp'], 1595, 'radio'),
-        'radio-sm': Service(PROTOCOLS['tcp'], 1596, 'radio-sm'),
-        'radius': Service(PROTOCOLS['tcp'], 1812, 'radius'),
-        'radius-acct': Service(PROTOCOLS['tcp'], 1813, 'radius-acct'),
-        'radius-dynauth': Service(PROTOCOLS['tcp'], 3799, 'radius-dynauth'),
-        'radix': Service(PROTOCOLS['tcp'], 2872, 'radix'),
-        'radmin-port': Service(PROTOCOLS['tcp'], 4899, 'radmin-port'),
-        'radmind': Service(PROTOCOLS['tcp'], 6222, 'radmind'),
-        'radpdf': Service(PROTOCOLS['tcp'], 18104, 'radpdf'),
-        'rads': Service(PROTOCOLS['tcp'], 12302, 'rads'),
-        'radsec': Service(PROTOCOLS['tcp'], 2083, 'radsec'),
-        'radware-rpm': Service(PROTOCOLS['tcp'], 2188, 'radware-rpm'),
-        'radware-rpm-s': Service(PROTOCOLS['tcp'], 2189, 'radware-rpm-s'),
-        'radwiz-nms-srv': Service(PROTOCOLS['tcp'], 2736, 'radwiz-nms-srv'),
-        'raid-am': Service(PROTOCOLS['tcp'], 2013, 'raid-am'),
-        'raid-cc': Service(PROTOCOLS['tcp'], 2011, 'raid-cc'),
-        'railgun-webaccl': Service(PROTOCOLS['tcp'], 2408, 'railgun-webaccl'),
-        'ramp': Service(PROTOCOLS['tcp'], 7227, 'ramp'),
-        'rancher': Service(PROTOCOLS['tcp'], 9345, 'rancher'),
-        'rap': Service(PROTOCOLS['tcp'], 256, 'rap'),
-        'rap-ip': Service(PROTOCOLS['tcp'], 3813, 'rap-ip'),
-        'rap-listen': Service(PROTOCOLS['tcp'], 1531, 'rap-listen'),
-        'rap-service': Service(PROTOCOLS['tcp'], 1530, 'rap-service'),
-        'rapi': Service(PROTOCOLS['tcp'], 2176, 'rapi'),
-        'rapidbase': Service(PROTOCOLS['tcp'], 1953, 'rapidbase'),
-        'rapidmq-center': Service(PROTOCOLS['tcp'], 3093, 'rapidmq-center'),
-        'rapidmq-reg': Service(PROTOCOLS['tcp'], 3094, 'rapidmq-reg'),
-        'rapido-ip': Service(PROTOCOLS['tcp'], 2457, 'rapido-ip'),
-        'raqmon-pdu': Service(PROTOCOLS['tcp'], 7744, 'raqmon-pdu'),
-        'rasadv': Service(PROTOCOLS['tcp'], 9753, 'rasadv'),
-        'ratio-adp': Service(PROTOCOLS['tcp'], 1108, 'ratio-adp'),
-        'ratl': Service(PROTOCOLS['tcp'], 2449, 'ratl'),
-        'ravehd': Service(PROTOCOLS['tcp'], 4037, 'ravehd'),
-        'raven-rdp': Service(PROTOCOLS['tcp'], 3533, 'raven-rdp'),
-        'raven-rmp': Service(PROTOCOLS['tcp'], 3532, 'raven-rmp'),
-        'raventbs': Service(PROTOCOLS['tcp'], 2713, 'raventbs'),
-        'raventdm': Service(PROTOCOLS['tcp'], 2714, 'raventdm'),
-        'raw-serial': Service(PROTOCOLS['tcp'], 2167, 'raw-serial'),
-        'raxa-mgmt': Service(PROTOCOLS['tcp'], 6099, 'raxa-mgmt'),
-        'razor': Service(PROTOCOLS['tcp'], 3555, 'razor'),
-        'rbakcup1': Service(PROTOCOLS['tcp'], 2773, 'rbakcup1'),
-        'rbakcup2': Service(PROTOCOLS['tcp'], 2774, 'rbakcup2'),
-        'rblcheckd': Service(PROTOCOLS['tcp'], 3768, 'rblcheckd'),
-        'rbr-debug': Service(PROTOCOLS['tcp'], 44553, 'rbr-debug'),
-        'rbr-discovery': Service(PROTOCOLS['tcp'], 3553, 'rbr-discovery'),
-        'rbsystem': Service(PROTOCOLS['tcp'], 5693, 'rbsystem'),
-        'rbt-smc': Service(PROTOCOLS['tcp'], 7870, 'rbt-smc'),
-        'rbt-wanopt': Service(PROTOCOLS['tcp'], 7810, 'rbt-wanopt'),
-        'rcc-host': Service(PROTOCOLS['tcp'], 2332, 'rcc-host'),
-        'rcip-itu': Service(PROTOCOLS['tcp'], 2225, 'rcip-itu'),
-        'rcp': Service(PROTOCOLS['tcp'], 469, 'rcp'),
-        'rcst': Service(PROTOCOLS['tcp'], 3467, 'rcst'),
-        'rcts': Service(PROTOCOLS['tcp'], 2258, 'rcts'),
-        'rda': Service(PROTOCOLS['tcp'], 630, 'rda'),
-        'rdb-dbs-disp': Service(PROTOCOLS['tcp'], 1571, 'rdb-dbs-disp'),
-        'rdc-wh-eos': Service(PROTOCOLS['tcp'], 3142, 'rdc-wh-eos'),
-        'rdcenter': Service(PROTOCOLS['tcp'], 4756, 'rdcenter'),
-        'rdgs': Service(PROTOCOLS['tcp'], 16385, 'rdgs'),
-        'rdlap': Service(PROTOCOLS['tcp'], 2321, 'rdlap'),
-        'rdm-tfs': Service(PROTOCOLS['tcp'], 21553, 'rdm-tfs'),
-        'rdmnet-ctrl': Service(PROTOCOLS['tcp'], 5569, 'rdmnet-ctrl'),
-        'rdrmshc': Service(PROTOCOLS['tcp'], 1075, 'rdrmshc'),
-        'rds': Service(PROTOCOLS['tcp'], 1540, 'rds'),
-        'rds-ib': Service(PROTOCOLS['tcp'], 18634, 'rds-ib'),
-        'rds-ip': Service(PROTOCOLS['tcp'], 18635, 'rds-ip'),
-        'rds2': Service(PROTOCOLS['tcp'], 1541, 'rds2'),
-        're-conn-proto': Service(PROTOCOLS['tcp'], 1306, 're-conn-proto'),
-        're-mail-ck': Service(PROTOCOLS['tcp'], 50, 're-mail-ck'),
-        're101': Service(PROTOCOLS['tcp'], 1343, 're101'),
-        'reachout': Service(PROTOCOLS['tcp'], 43188, 'reachout'),
-        'realm-rusd': Service(PROTOCOLS['tcp'], 688, 'realm-rusd'),
-        'realsecure': Service(PROTOCOLS['tcp'], 2998, 'realsecure'),
-        'rebol': Service(PROTOCOLS['tcp'], 2997, 'rebol'),
-        'recipe': Service(PROTOCOLS['tcp'], 2240, 'recipe'),
-        'recvr-rc': Service(PROTOCOLS['tcp'], 43000, 'recvr-rc'),
-        'redis': Service(PROTOCOLS['tcp'], 6379, 'redis'),
-        'redstone-cpss': Service(PROTOCOLS['tcp'], 2928, 'redstone-cpss'),
-        'redstorm-diag': Service(PROTOCOLS['tcp'], 2349, 'redstorm-diag'),
-        'redstorm-find': Service(PROTOCOLS['tcp'], 2347, 'redstorm-find'),
-        'redstorm-info': Service(PROTOCOLS['tcp'], 2348, 'redstorm-info'),
-        'redstorm-join': Service(PROTOCOLS['tcp'], 2346, 'redstorm-join'),
-        'redstorm_diag': Service(PROTOCOLS['tcp'], 2349, 'redstorm_diag'),
-        'redstorm_find': Service(PROTOCOLS['tcp'], 2347, 'redstorm_find'),
-        'redstorm_info': Service(PROTOCOLS['tcp'], 2348, 'redstorm_info'),
-        'redstorm_join': Service(PROTOCOLS['tcp'], 2346, 'redstorm_join'),
-        'redwood-chat': Service(PROTOCOLS['tcp'], 3032, 'redwood-chat'),
-        'reftek': Service(PROTOCOLS['tcp'], 2543, 'reftek'),
-        'registrar': Service(PROTOCOLS['tcp'], 1712, 'registrar'),
-        'relief': Service(PROTOCOLS['tcp'], 1353, 'relief'),
-        'reload-config': Service(PROTOCOLS['tcp'], 6084, 'reload-config'),
-        'remcap': Service(PROTOCOLS['tcp'], 4731, 'remcap'),
-        'remctl': Service(PROTOCOLS['tcp'], 4373, 'remctl'),
-        'remographlm': Service(PROTOCOLS['tcp'], 2373, 'remographlm'),
-        'remote-as': Service(PROTOCOLS['tcp'], 1053, 'remote-as'),
-        'remote-collab': Service(PROTOCOLS['tcp'], 2250, 'remote-collab'),
-        'remote-kis': Service(PROTOCOLS['tcp'], 185, 'remote-kis'),
-        'remote-winsock': Service(PROTOCOLS['tcp'], 1745, 'remote-winsock'),
-        'remotedeploy': Service(PROTOCOLS['tcp'], 3789, 'remotedeploy'),
-        'remotefs': Service(PROTOCOLS['tcp'], 556, 'remotefs'),
-        'remoteware-cl': Service(PROTOCOLS['tcp'], 3000, 'remoteware-cl'),
-        'remoteware-srv': Service(PROTOCOLS['tcp'], 3002, 'remoteware-srv'),
-        'remoteware-un': Service(PROTOCOLS['tcp'], 2999, 'remoteware-un'),
-        'repcmd': Service(PROTOCOLS['tcp'], 641, 'repcmd'),
-        'repliweb': Service(PROTOCOLS['tcp'], 2837, 'repliweb'),
-        'repscmd': Service(PROTOCOLS['tcp'], 653, 'repscmd'),
-        'repsvc': Service(PROTOCOLS['tcp'], 6320, 'repsvc'),
-        'res': Service(PROTOCOLS['tcp'], 1942, 'res'),
-        'res-sap': Service(PROTOCOLS['tcp'], 3163, 'res-sap'),
-        'resacommunity': Service(PROTOCOLS['tcp'], 1154, 'resacommunity'),
-        'rescap': Service(PROTOCOLS['tcp'], 283, 'rescap'),
-        'resorcs': Service(PROTOCOLS['tcp'], 4733, 'resorcs'),
-        'resource-mgr': Service(PROTOCOLS['tcp'], 3019, 'resource-mgr'),
-        'resource_mgr': Service(PROTOCOLS['tcp'], 3019, 'resource_mgr'),
-        'responselogic': Service(PROTOCOLS['tcp'], 2886, 'responselogic'),
-        'responsenet': Service(PROTOCOLS['tcp'], 3045, 'responsenet'),
-        'restconf-ch-tls': Service(PROTOCOLS['tcp'], 4336, 'restconf-ch-tls'),
-        'retp': Service(PROTOCOLS['tcp'], 32811, 'retp'),
-        'retrospect': Service(PROTOCOLS['tcp'], 497, 'retrospect'),
-        'rets': Service(PROTOCOLS['tcp'], 6103, 'rets'),
-        'rets-ssl': Service(PROTOCOLS['tcp'], 12109, 'rets-ssl'),
-        'reversion': Service(PROTOCOLS['tcp'], 5842, 'reversion'),
-        'rexecj': Service(PROTOCOLS['tcp'], 8230, 'rexecj'),
-        'rfa': Service(PROTOCOLS['tcp'], 4672, 'rfa'),
-        'rfb': Service(PROTOCOLS['tcp'], 5900, 'rfb'),
-        'rfe': Service(PROTOCOLS['tcp'], 5002, 'rfe'),
-        'rfid-rp1': Service(PROTOCOLS['tcp'], 4684, 'rfid-rp1'),
-        'rfile': Service(PROTOCOLS['tcp'], 750, 'rfile'),
-        'rfio': Service(PROTOCOLS['tcp'], 3147, 'rfio'),
-        'rfmp': Service(PROTOCOLS['tcp'], 2249, 'rfmp'),
-        'rfx-lm': Service(PROTOCOLS['tcp'], 1497, 'rfx-lm'),
-        'rgtp': Service(PROTOCOLS['tcp'], 1431, 'rgtp'),
-        'rhp-iibp': Service(PROTOCOLS['tcp'], 1912, 'rhp-iibp'),
-        'rib-slm': Service(PROTOCOLS['tcp'], 3296, 'rib-slm'),
-        'ricardo-lm': Service(PROTOCOLS['tcp'], 6148, 'ricardo-lm'),
-        'rich-cp': Service(PROTOCOLS['tcp'], 2057, 'rich-cp'),
-        'rid': Service(PROTOCOLS['tcp'], 4590, 'rid'),
-        'ridgeway1': Service(PROTOCOLS['tcp'], 2776, 'ridgeway1'),
-        'ridgeway2': Service(PROTOCOLS['tcp'], 2777, 'ridgeway2'),
-        'rimf-ps': Service(PROTOCOLS['tcp'], 2209, 'rimf-ps'),
-        'rimsl': Service(PROTOCOLS['tcp'], 2044, 'rimsl'),
-        'ripng': Service(PROTOCOLS['tcp'], 521, 'ripng'),
-        'ris': Service(PROTOCOLS['tcp'], 180, 'ris'),
-        'ris-cm': Service(PROTOCOLS['tcp'], 748, 'ris-cm'),
-        'rise': Service(PROTOCOLS['tcp'], 7473, 'rise'),
-        'rjcdb-vcards': Service(PROTOCOLS['tcp'], 9208, 'rjcdb-vcards'),
-        'rje': Service(PROTOCOLS['tcp'], 5, 'rje'),
-        'rkb-oscs': Service(PROTOCOLS['tcp'], 1817, 'rkb-oscs'),
-        'rlm': Service(PROTOCOLS['tcp'], 5053, 'rlm'),
-        'rlm-admin': Service(PROTOCOLS['tcp'], 5054, 'rlm-admin'),
-        'rlp': Service(PROTOCOLS['tcp'], 39, 'rlp'),
-        'rlzdbase': Service(PROTOCOLS['tcp'], 635, 'rlzdbase'),
-        'rmc': Service(PROTOCOLS['tcp'], 657, 'rmc'),
-        'rmiactivation': Service(PROTOCOLS['tcp'], 1098, 'rmiactivation'),
-        'rmiaux': Service(PROTOCOLS['tcp'], 10990, 'rmiaux'),
-        'rmiregistry': Service(PROTOCOLS['tcp'], 1099, 'rmiregistry'),
-        'rmlnk': Service(PROTOCOLS['tcp'], 2818, 'rmlnk'),
-        'rmonitor': Service(PROTOCOLS['tcp'], 560, 'rmonitor'),
-        'rmonitor-secure': Service(PROTOCOLS['tcp'], 5145, 'rmonitor-secure'),
-        'rmonitor_secure': Service(PROTOCOLS['tcp'], 5145, 'rmonitor_secure'),
-        'rmopagt': Service(PROTOCOLS['tcp'], 2959, 'rmopagt'),
-        'rmpp': Service(PROTOCOLS['tcp'], 1121, 'rmpp'),
-        'rmt': Service(PROTOCOLS['tcp'], 411, 'rmt'),
-        'rmtserver': Service(PROTOCOLS['tcp'], 2416, 'rmtserver'),
-        'rndc': Service(PROTOCOLS['tcp'], 953, 'rndc'),
-        'rnm': Service(PROTOCOLS['tcp'], 3844, 'rnm'),
-        'rnmap': Service(PROTOCOLS['tcp'], 3418, 'rnmap'),
-        'rnrp': Service(PROTOCOLS['tcp'], 2423, 'rnrp'),
-        'robcad-lm': Service(PROTOCOLS['tcp'], 1509, 'robcad-lm'),
-        'robix': Service(PROTOCOLS['tcp'], 9599, 'robix'),
-        'roboeda': Service(PROTOCOLS['tcp'], 2920, 'roboeda'),
-        'roboer': Service(PROTOCOLS['tcp'], 2919, 'roboer'),
-        'robot-remote': Service(PROTOCOLS['tcp'], 8270, 'robot-remote'),
-        'robotraconteur': Service(PROTOCOLS['tcp'], 48653, 'robotraconteur'),
-        'rockwell-csp2': Service(PROTOCOLS['tcp'], 2223, 'rockwell-csp2'),
-        'rocrail': Service(PROTOCOLS['tcp'], 8051, 'rocrail'),
-        'roketz': Service(PROTOCOLS['tcp'], 1730, 'roketz'),
-        'rootd': Service(PROTOCOLS['tcp'], 1094, 'rootd'),
-        'rothaga': Service(PROTOCOLS['tcp'], 7117, 'rothaga'),
-        'routematch': Service(PROTOCOLS['tcp'], 1287, 'routematch'),
-        'roverlog': Service(PROTOCOLS['tcp'], 3677, 'roverlog'),
-        'rpasswd': Service(PROTOCOLS['tcp'], 774, 'rpasswd'),
-        'rpc2portmap': Service(PROTOCOLS['tcp'], 369, 'rpc2portmap'),
-        'rpi': Service(PROTOCOLS['tcp'], 2214, 'rpi'),
-        'rpki-rtr': Service(PROTOCOLS['tcp'], 323, 'rpki-rtr'),
-        'rpki-rtr-tls': Service(PROTOCOLS['tcp'], 324, 'rpki-rtr-tls'),
-        'rprt': Service(PROTOCOLS['tcp'], 3064, 'rprt'),
-        'rrac': Service(PROTOCOLS['tcp'], 5678, 'rrac'),
-        'rrdp': Service(PROTOCOLS['tcp'], 5313, 'rrdp'),
-        'rrh': Service(PROTOCOLS['tcp'], 753, 'rrh'),
-        'rrifmm': Service(PROTOCOLS['tcp'], 1696, 'rrifmm'),
-        'rrilwm': Service(PROTOCOLS['tcp'], 1695, 'rrilwm'),
-        'rrimwm': Service(PROTOCOLS['tcp'], 1694, 'rrimwm'),
-        'rrirtr': Service(PROTOCOLS['tcp'], 1693, 'rrirtr'),
-        'rrisat': Service(PROTOCOLS['tcp'], 1697, 'rrisat'),
-        'rrp': Service(PROTOCOLS['tcp'], 648, 'rrp'),
-        'rs-pias': Service(PROTOCOLS['tcp'], 13217, 'rs-pias'),
-        'rs-rmi': Service(PROTOCOLS['tcp'], 3736, 'rs-rmi'),
-        'rs-status': Service(PROTOCOLS['tcp'], 45002, 'rs-status'),
-        'rsap': Service(PROTOCOLS['tcp'], 1647, 'rsap'),
-        'rsc-robot': Service(PROTOCOLS['tcp'], 1793, 'rsc-robot'),
-        'rscd': Service(PROTOCOLS['tcp'], 5750, 'rscd'),
-        'rsf-1': Service(PROTOCOLS['tcp'], 1195, 'rsf-1'),
-        'rsh-spx': Service(PROTOCOLS['tcp'], 222, 'rsh-spx'),
-        'rsip': Service(PROTOCOLS['tcp'], 4555, 'rsip'),
-        'rsisysaccess': Service(PROTOCOLS['tcp'], 2752, 'rsisysaccess'),
-        'rsms': Service(PROTOCOLS['tcp'], 10201, 'rsms'),
-        'rsmtp': Service(PROTOCOLS['tcp'], 2390, 'rsmtp'),
-        'rsom': Service(PROTOCOLS['tcp'], 2889, 'rsom'),
-        'rsqlserver': Service(PROTOCOLS['tcp'], 4430, 'rsqlserver'),
-        'rsvd': Service(PROTOCOLS['tcp'], 168, 'rsvd'),
-        'rsvp-encap-1': Service(PROTOCOLS['tcp'], 1698, 'rsvp-encap-1'),
-        'rsvp-encap-2': Service(PROTOCOLS['tcp'], 1699, 'rsvp-encap-2'),
-        'rsvp-tunnel': Service(PROTOCOLS['tcp'], 363, 'rsvp-tunnel'),
-        'rsvp_tunnel': Service(PROTOCOLS['tcp'], 363, 'rsvp_tunnel'),
-        'rsync': Service(PROTOCOLS['tcp'], 873, 'rsync'),
-        'rt-classmanager': Service(PROTOCOLS['tcp'], 35004, 'rt-classmanager'),
-        'rt-devicemapper': Service(PROTOCOLS['tcp'], 35003, 'rt-devicemapper'),
-        'rt-event': Service(PROTOCOLS['tcp'], 3706, 'rt-event'),
-        'rt-event-s': Service(PROTOCOLS['tcp'], 3707, 'rt-event-s'),
-        'rt-helper': Service(PROTOCOLS['tcp'], 35006, 'rt-helper'),
-        'rt-labtracker': Service(PROTOCOLS['tcp'], 35005, 'rt-labtracker'),
-        'rt-sound': Service(PROTOCOLS['tcp'], 35002, 'rt-sound'),
-        'rt-viewer': Service(PROTOCOLS['tcp'], 35001, 'rt-viewer'),
-        'rtc-pm-port': Service(PROTOCOLS['tcp'], 3891, 'rtc-pm-port'),
-        'rtcm-sc104': Service(PROTOCOLS['tcp'], 2101, 'rtcm-sc104'),
-        'rtelnet': Service(PROTOCOLS['tcp'], 107, 'rtelnet'),
-        'rtimeviewer': Service(PROTOCOLS['tcp'], 6900, 'rtimeviewer'),
-        'rtip': Service(PROTOCOLS['tcp'], 771, 'rtip'),
-        'rtmp-port': Service(PROTOCOLS['tcp'], 3500, 'rtmp-port'),
-        'rtnt-1': Service(PROTOCOLS['tcp'], 3137, 'rtnt-1'),
-        'rtnt-2': Service(PROTOCOLS['tcp'], 3138, 'rtnt-2'),
-        'rtps-dd-mt': Service(PROTOCOLS['tcp'], 7402, 'rtps-dd-mt'),
-        'rtps-dd-ut': Service(PROTOCOLS['tcp'], 7401, 'rtps-dd-ut'),
-        'rtps-discovery': Service(PROTOCOLS['tcp'], 7400, 'rtps-discovery'),
-        'rtraceroute': Service(PROTOCOLS['tcp'], 3765, 'rtraceroute'),
-        'rtsclient': Service(PROTOCOLS['tcp'], 2501, 'rtsclient'),
-        'rtsp': Service(PROTOCOLS['tcp'], 554, 'rtsp'),
-        'rtsp-alt': Service(PROTOCOLS['tcp'], 8554, 'rtsp-alt'),
-        'rtsps': Service(PROTOCOLS['tcp'], 322, 'rtsps'),
-        'rtsserv': Service(PROTOCOLS['tcp'], 2500, 'rtsserv'),
-        'rugameonline': Service(PROTOCOLS['tcp'], 5156, 'rugameonline'),
-        'rusb-sys-port': Service(PROTOCOLS['tcp'], 3422, 'rusb-sys-port'),
-        'rushd': Service(PROTOCOLS['tcp'], 696, 'rushd'),
-        'rvs-isdn-dcp': Service(PROTOCOLS['tcp'], 2578, 'rvs-isdn-dcp'),
-        'rwhois': Service(PROTOCOLS['tcp'], 4321, 'rwhois'),
-        'rwp': Service(PROTOCOLS['tcp'], 30100, 'rwp'),
-        'rxapi': Service(PROTOCOLS['tcp'], 10010, 'rxapi'),
-        'rxe': Service(PROTOCOLS['tcp'], 761, 'rxe'),
-        'rxmon': Service(PROTOCOLS['tcp'], 1311, 'rxmon'),
-        's-net': Service(PROTOCOLS['tcp'], 166, 's-net'),
-        's-openmail': Service(PROTOCOLS['tcp'], 5767, 's-openmail'),
-        's3db': Service(PROTOCOLS['tcp'], 2278, 's3db'),
-        's8-client-port': Service(PROTOCOLS['tcp'], 3153, 's8-client-port'),
-        'sa-msg-port': Service(PROTOCOLS['tcp'], 1646, 'sa-msg-port'),
-        'sabams': Service(PROTOCOLS['tcp'], 2760, 'sabams'),
-        'sabarsd': Service(PROTOCOLS['tcp'], 8401, 'sabarsd'),
-        'sabp-signal': Service(PROTOCOLS['tcp'], 3452, 'sabp-signal'),
-        'sac': Service(PROTOCOLS['tcp'], 8097, 'sac'),
-        'sacred': Service(PROTOCOLS['tcp'], 1118, 'sacred'),
-        'safetynetp': Service(PROTOCOLS['tcp'], 40000, 'safetynetp'),
-        'saft': Service(PROTOCOLS['tcp'], 487, 'saft'),
-        'sage-best-com1': Service(PROTOCOLS['tcp'], 14033, 'sage-best-com1'),
-        'sage-best-com2': Service(PROTOCOLS['tcp'], 14034, 'sage-best-com2'),
-        'sagectlpanel': Service(PROTOCOLS['tcp'], 3698, 'sagectlpanel'),
-        'sagxtsds': Service(PROTOCOLS['tcp'], 4952, 'sagxtsds'),
-        'sah-lm': Service(PROTOCOLS['tcp'], 3291, 'sah-lm'),
-        'sais': Service(PROTOCOLS['tcp'], 1426, 'sais'),
-        'saiscm': Service(PROTOCOLS['tcp'], 1501, 'saiscm'),
-        'saiseh': Service(PROTOCOLS['tcp'], 1644, 'saiseh'),
-        'saism': Service(PROTOCOLS['tcp'], 1436, 'saism'),
-        'salient-dtasrv': Service(PROTOCOLS['tcp'], 5409, 'salient-dtasrv'),
-        'salient-mux': Service(PROTOCOLS['tcp'], 5422, 'salient-mux'),
-        'salient-usrmgr': Service(PROTOCOLS['tcp'], 5410, 'salient-usrmgr'),
-        'samd': Service(PROTOCOLS['tcp'], 3275, 'samd'),
-        'samsung-unidex': Service(PROTOCOLS['tcp'], 4010, 'samsung-unidex'),
-        'sanavigator': Service(PROTOCOLS['tcp'], 4033, 'sanavigator'),
-        'sane-port': Service(PROTOCOLS['tcp'], 6566, 'sane-port'),
-        'sanity': Service(PROTOCOLS['tcp'], 643, 'sanity'),
-        'santak-ups': Service(PROTOCOLS['tcp'], 3038, 'santak-ups'),
-        'santools': Service(PROTOCOLS['tcp'], 4079, 'santools'),
-        'saphostctrl': Service(PROTOCOLS['tcp'], 1128, 'saphostctrl'),
-        'saphostctrls': Service(PROTOCOLS['tcp'], 1129, 'saphostctrls'),
-        'sapv1': Service(PROTOCOLS['tcp'], 9875, 'sapv1'),
-        'saratoga': Service(PROTOCOLS['tcp'], 7542, 'saratoga'),
-        'saris': Service(PROTOCOLS['tcp'], 4442, 'saris'),
-        'sas-remote-hlp': Service(PROTOCOLS['tcp'], 3755, 'sas-remote-hlp'),
-        'sasg': Service(PROTOCOLS['tcp'], 3744, 'sasg'),
-        'sasggprs': Service(PROTOCOLS['tcp'], 3964, 'sasggprs'),
-        'sasp': Service(PROTOCOLS['tcp'], 3860, 'sasp'),
-        'sauterdongle': Service(PROTOCOLS['tcp'], 25576, 'sauterdongle'),
-        'savant': Service(PROTOCOLS['tcp'], 3391, 'savant'),
-        'sbackup': Service(PROTOCOLS['tcp'], 5163, 'sbackup'),
-        'sbi-agent': Service(PROTOCOLS['tcp'], 3962, 'sbi-agent'),
-        'sbl': Service(PROTOCOLS['tcp'], 1039, 'sbl'),
-        'sbook': Service(PROTOCOLS['tcp'], 1349, 'sbook'),
-        'scaleft': Service(PROTOCOLS['tcp'], 4421, 'scaleft'),
-        'scan-change': Service(PROTOCOLS['tcp'], 2719, 'scan-change'),
-        'scanstat-1': Service(PROTOCOLS['tcp'], 1215, 'scanstat-1'),
-        'scc-security': Service(PROTOCOLS['tcp'], 582, 'scc-security'),
-        'sccip-media': Service(PROTOCOLS['tcp'], 3499, 'sccip-media'),
-        'sceanics': Service(PROTOCOLS['tcp'], 5435, 'sceanics'),
-        'scenccs': Service(PROTOCOLS['tcp'], 7129, 'scenccs'),
-        'scenidm': Service(PROTOCOLS['tcp'], 7128, 'scenidm'),
-        'scientia-sdb': Service(PROTOCOLS['tcp'], 1811, 'scientia-sdb'),
-        'scientia-ssdb': Service(PROTOCOLS['tcp'], 2121, 'scientia-ssdb'),
-        'scinet': Service(PROTOCOLS['tcp'], 7708, 'scinet'),
-        'scintilla': Service(PROTOCOLS['tcp'], 19007, 'scintilla'),
-        'scipticslsrvr': Service(PROTOCOLS['tcp'], 2577, 'scipticslsrvr'),
-        'sco-aip': Service(PROTOCOLS['tcp'], 5307, 'sco-aip'),
-        'sco-dtmgr': Service(PROTOCOLS['tcp'], 617, 'sco-dtmgr'),
-        'sco-inetmgr': Service(PROTOCOLS['tcp'], 615, 'sco-inetmgr'),
-        'sco-peer-tta': Service(PROTOCOLS['tcp'], 5427, 'sco-peer-tta'),
-        'sco-sysmgr': Service(PROTOCOLS['tcp'], 616, 'sco-sysmgr'),
-        'sco-websrvrmg3': Service(PROTOCOLS['tcp'], 598, 'sco-websrvrmg3'),
-        'sco-websrvrmgr': Service(PROTOCOLS['tcp'], 620, 'sco-websrvrmgr'),
-        'scohelp': Service(PROTOCOLS['tcp'], 457, 'scohelp'),
-        'scoi2odialog': Service(PROTOCOLS['tcp'], 360, 'scoi2odialog'),
-        'scol': Service(PROTOCOLS['tcp'], 1200, 'scol'),
-        'scoremgr': Service(PROTOCOLS['tcp'], 2034, 'scoremgr'),
-        'scotty-ft': Service(PROTOCOLS['tcp'], 14000, 'scotty-ft'),
-        'scp': Service(PROTOCOLS['tcp'], 3820, 'scp'),
-        'scp-config': Service(PROTOCOLS['tcp'], 10001, 'scp-config'),
-        'scpi-raw': Service(PROTOCOLS['tcp'], 5025, 'scpi-raw'),
-        'scpi-telnet': Service(PROTOCOLS['tcp'], 5024, 'scpi-telnet'),
-        'scrabble': Service(PROTOCOLS['tcp'], 2026, 'scrabble'),
-        'screencast': Service(PROTOCOLS['tcp'], 1368, 'screencast'),
-        'scriptview': Service(PROTOCOLS['tcp'], 7741, 'scriptview'),
-        'scscp': Service(PROTOCOLS['tcp'], 26133, 'scscp'),
-        'scservp': Service(PROTOCOLS['tcp'], 3637, 'scservp'),
-        'scte104': Service(PROTOCOLS['tcp'], 5167, 'scte104'),
-        'scte30': Service(PROTOCOLS['tcp'], 5168, 'scte30'),
-        'scup': Service(PROTOCOLS['tcp'], 6315, 'scup'),
-        'scx-proxy': Service(PROTOCOLS['tcp'], 470, 'scx-proxy'),
-        'sd': Service(PROTOCOLS['tcp'], 9876, 'sd'),
-        'sd-data': Service(PROTOCOLS['tcp'], 2385, 'sd-data'),
-        'sd-elmd': Service(PROTOCOLS['tcp'], 1681, 'sd-elmd'),
-        'sd-request': Service(PROTOCOLS['tcp'], 2384, 'sd-request'),
-        'sdbproxy': Service(PROTOCOLS['tcp'], 3562, 'sdbproxy'),
-        'sdclient': Service(PROTOCOLS['tcp'], 2310, 'sdclient'),
-        'sddp': Service(PROTOCOLS['tcp'], 1163, 'sddp'),
-        'sde-discovery': Service(PROTOCOLS['tcp'], 5152, 'sde-discovery'),
-        'sdfunc': Service(PROTOCOLS['tcp'], 2046, 'sdfunc'),
-        'sdhelp': Service(PROTOCOLS['tcp'], 2308, 'sdhelp'),
-        'sdl-ets': Service(PROTOCOLS['tcp'], 5081, 'sdl-ets'),
-        'sdmmp': Service(PROTOCOLS['tcp'], 5573, 'sdmmp'),
-        'sdnskmp': Service(PROTOCOLS['tcp'], 558, 'sdnskmp'),
-        'sdo': Service(PROTOCOLS['tcp'], 3635, 'sdo'),
-        'sdo-ssh': Service(PROTOCOLS['tcp'], 3897, 'sdo-ssh'),
-        'sdo-tls': Service(PROTOCOLS['tcp'], 3896, 'sdo-tls'),
-        'sdp-id-port': Service(PROTOCOLS['tcp'], 3242, 'sdp-id-port'),
-        'sdp-portmapper': Service(PROTOCOLS['tcp'], 3935, 'sdp-portmapper'),
-        'sdproxy': Service(PROTOCOLS['tcp'], 1297, 'sdproxy'),
-        'sdr': Service(PROTOCOLS['tcp'], 9010, 'sdr'),
-        'sds': Service(PROTOCOLS['tcp'], 5059, 'sds'),
-        'sds-admin': Service(PROTOCOLS['tcp'], 2705, 'sds-admin'),
-        'sdsc-lm': Service(PROTOCOLS['tcp'], 1537, 'sdsc-lm'),
-        'sdserver': Service(PROTOCOLS['tcp'], 2309, 'sdserver'),
-        'sdt': Service(PROTOCOLS['tcp'], 5568, 'sdt'),
-        'sdt-lmd': Service(PROTOCOLS['tcp'], 3319, 'sdt-lmd'),
-        'sdtvwcam': Service(PROTOCOLS['tcp'], 24666, 'sdtvwcam'),
-        'seagull-ais': Service(PROTOCOLS['tcp'], 1208, 'seagull-ais'),
-        'seagulllms': Service(PROTOCOLS['tcp'], 1291, 'seagulllms'),
-        'seaodbc': Service(PROTOCOLS['tcp'], 2471, 'seaodbc'),
-        'search': Service(PROTOCOLS['tcp'], 2010, 'search'),
-        'search-agent': Service(PROTOCOLS['tcp'], 1234, 'search-agent'),
-        'seaview': Service(PROTOCOLS['tcp'], 3143, 'seaview'),
-        'sec-ntb-clnt': Service(PROTOCOLS['tcp'], 32635, 'sec-ntb-clnt'),
-        'sec-pc2fax-srv': Service(PROTOCOLS['tcp'], 9402, 'sec-pc2fax-srv'),
-        'sec-t4net-clt': Service(PROTOCOLS['tcp'], 9401, 'sec-t4net-clt'),
-        'sec-t4net-srv': Service(PROTOCOLS['tcp'], 9400, 'sec-t4net-srv'),
-        'seclayer-tcp': Service(PROTOCOLS['tcp'], 3495, 'seclayer-tcp'),
-        'seclayer-tls': Service(PROTOCOLS['tcp'], 3496, 'seclayer-tls'),
-        'secrmmsafecopya': Service(PROTOCOLS['tcp'], 38865, 'secrmmsafecopya'),
-        'secure-cfg-svr': Service(PROTOCOLS['tcp'], 3978, 'secure-cfg-svr'),
-        'secure-mqtt': Service(PROTOCOLS['tcp'], 8883, 'secure-mqtt'),
-        'secure-ts': Service(PROTOCOLS['tcp'], 9318, 'secure-ts'),
-        'securitychase': Service(PROTOCOLS['tcp'], 5399, 'securitychase'),
-        'seispoc': Service(PROTOCOLS['tcp'], 2254, 'seispoc'),
-        'semantix': Service(PROTOCOLS['tcp'], 361, 'semantix'),
-        'semaphore': Service(PROTOCOLS['tcp'], 3255, 'semaphore'),
-        'send': Service(PROTOCOLS['tcp'], 169, 'send'),
-        'senip': Service(PROTOCOLS['tcp'], 3898, 'senip'),
-        'senomix01': Service(PROTOCOLS['tcp'], 8052, 'senomix01'),
-        'senomix02': Service(PROTOCOLS['tcp'], 8053, 'senomix02'),
-        'senomix03': Service(PROTOCOLS['tcp'], 8054, 'senomix03'),
-        'senomix04': Service(PROTOCOLS['tcp'], 8055, 'senomix04'),
-        'senomix05': Service(PROTOCOLS['tcp'], 8056, 'senomix05'),
-        'senomix06': Service(PROTOCOLS['tcp'], 8057, 'senomix06'),
-        'senomix07': Service(PROTOCOLS['tcp'], 8058, 'senomix07'),
-        'senomix08': Service(PROTOCOLS['tcp'], 8059, 'senomix08'),
-        'sent-lm': Service(PROTOCOLS['tcp'], 2316, 'sent-lm'),
-        'sentinel': Service(PROTOCOLS['tcp'], 3588, 'sentinel'),
-        'sentinel-ent': Service(PROTOCOLS['tcp'], 3712, 'sentinel-ent'),
-        'sentinel-lm': Service(PROTOCOLS['tcp'], 5093, 'sentinel-lm'),
-        'sentinelsrm': Service(PROTOCOLS['tcp'], 1947, 'sentinelsrm'),
-        'sentlm-srv2srv': Service(PROTOCOLS['tcp'], 5099, 'sentlm-srv2srv'),
-        'sep': Service(PROTOCOLS['tcp'], 2089, 'sep'),
-        'seraph': Service(PROTOCOLS['tcp'], 4076, 'seraph'),
-        'sercomm-scadmin': Service(PROTOCOLS['tcp'], 6108, 'sercomm-scadmin'),
-        'sercomm-wlink': Service(PROTOCOLS['tcp'], 2235, 'sercomm-wlink'),
-        'serialgateway': Service(PROTOCOLS['tcp'], 1243, 'serialgateway'),
-        'server-find': Service(PROTOCOLS['tcp'], 8351, 'server-find'),
-        'serverdocs': Service(PROTOCOLS['tcp'], 10548, 'serverdocs'),
-        'servergraph': Service(PROTOCOLS['tcp'], 1251, 'servergraph'),
-        'serverstart': Service(PROTOCOLS['tcp'], 9213, 'serverstart'),
-        'serverview-as': Service(PROTOCOLS['tcp'], 3169, 'serverview-as'),
-        'serverview-asn': Service(PROTOCOLS['tcp'], 3170, 'serverview-asn'),
-        'serverview-gf': Service(PROTOCOLS['tcp'], 3171, 'serverview-gf'),
-        'serverview-icc': Service(PROTOCOLS['tcp'], 3173, 'serverview-icc'),
-        'serverview-rm': Service(PROTOCOLS['tcp'], 3172, 'serverview-rm'),
-        'serverviewdbms': Service(PROTOCOLS['tcp'], 9212, 'serverviewdbms'),
-        'serverwsd2': Service(PROTOCOLS['tcp'], 5362, 'serverwsd2'),
-        'servexec': Service(PROTOCOLS['tcp'], 2021, 'servexec'),
-        'service-ctrl': Service(PROTOCOLS['tcp'], 2367, 'service-ctrl'),
-        'servicemeter': Service(PROTOCOLS['tcp'], 2603, 'servicemeter'),
-        'servicetags': Service(PROTOCOLS['tcp'], 6481, 'servicetags'),
-        'servistaitsm': Service(PROTOCOLS['tcp'], 3636, 'servistaitsm'),
-        'servstat': Service(PROTOCOLS['tcp'], 633, 'servstat'),
-        'sesi-lm': Service(PROTOCOLS['tcp'], 1714, 'sesi-lm'),
-        'set': Service(PROTOCOLS['tcp'], 257, 'set'),
-        'sf-lm': Service(PROTOCOLS['tcp'], 4546, 'sf-lm'),
-        'sflm': Service(PROTOCOLS['tcp'], 3162, 'sflm'),
-        'sflow': Service(PROTOCOLS['tcp'], 6343, 'sflow'),
-        'sfm-db-server': Service(PROTOCOLS['tcp'], 5636, 'sfm-db-server'),
-        'sfmsso': Service(PROTOCOLS['tcp'], 5635, 'sfmsso'),
-        'sfs-config': Service(PROTOCOLS['tcp'], 452, 'sfs-config'),
-        'sfs-smp-net': Service(PROTOCOLS['tcp'], 451, 'sfs-smp-net'),
-        'sftdst-port': Service(PROTOCOLS['tcp'], 3230, 'sftdst-port'),
-        'sftp': Service(PROTOCOLS['tcp'], 115, 'sftp'),
-        'sftsrv': Service(PROTOCOLS['tcp'], 1303, 'sftsrv'),
-        'sftu': Service(PROTOCOLS['tcp'], 3326, 'sftu'),
-        'sg-lm': Service(PROTOCOLS['tcp'], 1659, 'sg-lm'),
-        'sgcip': Service(PROTOCOLS['tcp'], 16950, 'sgcip'),
-        'sgcp': Service(PROTOCOLS['tcp'], 440, 'sgcp'),
-        'sge-execd': Service(PROTOCOLS['tcp'], 6445, 'sge-execd'),
-        'sge-qmaster': Service(PROTOCOLS['tcp'], 6444, 'sge-qmaster'),
-        'sge_execd': Service(PROTOCOLS['tcp'], 6445, 'sge_execd'),
-        'sge_qmaster': Service(PROTOCOLS['tcp'], 6444, 'sge_qmaster'),
-        'sgi-arrayd': Service(PROTOCOLS['tcp'], 5434, 'sgi-arrayd'),
-        'sgi-dmfmgr': Service(PROTOCOLS['tcp'], 11109, 'sgi-dmfmgr'),
-        'sgi-esphttp': Service(PROTOCOLS['tcp'], 5554, 'sgi-esphttp'),
-        'sgi-eventmond': Service(PROTOCOLS['tcp'], 5553, 'sgi-eventmond'),
-        'sgi-lk': Service(PROTOCOLS['tcp'], 11106, 'sgi-lk'),
-        'sgi-soap': Service(PROTOCOLS['tcp'], 11110, 'sgi-soap'),
-        'sgi-storman': Service(PROTOCOLS['tcp'], 1178, 'sgi-storman'),
-        'sgmp': Service(PROTOCOLS['tcp'], 153, 'sgmp'),
-        'sgmp-traps': Service(PROTOCOLS['tcp'], 160, 'sgmp-traps'),
-        'shadowserver': Service(PROTOCOLS['tcp'], 2027, 'shadowserver'),
-        'shaperai': Service(PROTOCOLS['tcp'], 43210, 'shaperai'),
-        'shareapp': Service(PROTOCOLS['tcp'], 3595, 'shareapp'),
-        'sharp-server': Service(PROTOCOLS['tcp'], 3617, 'sharp-server'),
-        'shell': Service(PROTOCOLS['tcp'], 514, 'shell'),
-        'shilp': Service(PROTOCOLS['tcp'], 2049, 'shilp'),
-        'shiprush-d-ch': Service(PROTOCOLS['tcp'], 5841, 'shiprush-d-ch'),
-        'shiprush-db-svr': Service(PROTOCOLS['tcp'], 3841, 'shiprush-db-svr'),
-        'shiva-confsrvr': Service(PROTOCOLS['tcp'], 1651, 'shiva-confsrvr'),
-        'shiva_confsrvr': Service(PROTOCOLS['tcp'], 1651, 'shiva_confsrvr'),
-        'shivadiscovery': Service(PROTOCOLS['tcp'], 1502, 'shivadiscovery'),
-        'shivahose': Service(PROTOCOLS['tcp'], 1549, 'shivahose'),
-        'shockwave': Service(PROTOCOLS['tcp'], 1626, 'shockwave'),
-        'shockwave2': Service(PROTOCOLS['tcp'], 1257, 'shockwave2'),
-        'shofar': Service(PROTOCOLS['tcp'], 4105, 'shofar'),
-        'shrewd-control': Service(PROTOCOLS['tcp'], 22335, 'shrewd-control'),
-        'shrinkwrap': Service(PROTOCOLS['tcp'], 358, 'shrinkwrap'),
-        'sia-ctrl-plane': Service(PROTOCOLS['tcp'], 4787, 'sia-ctrl-plane'),
-        'siam': Service(PROTOCOLS['tcp'], 498, 'siam'),
-        'sicct': Service(PROTOCOLS['tcp'], 4742, 'sicct'),
-        'siebel-ns': Service(PROTOCOLS['tcp'], 2320, 'siebel-ns'),
-        'siemensgsm': Service(PROTOCOLS['tcp'], 28240, 'siemensgsm'),
-        'sieve': Service(PROTOCOLS['tcp'], 4190, 'sieve'),
-        'sift-uft': Service(PROTOCOLS['tcp'], 608, 'sift-uft'),
-        'sightline': Service(PROTOCOLS['tcp'], 1645, 'sightline'),
-        'sigma-port': Service(PROTOCOLS['tcp'], 3614, 'sigma-port'),
-        'signacert-agent': Service(PROTOCOLS['tcp'], 5032, 'signacert-agent'),
-        'signal': Service(PROTOCOLS['tcp'], 2974, 'signal'),
-        'signet-ctf': Service(PROTOCOLS['tcp'], 2733, 'signet-ctf'),
-        'siipat': Service(PROTOCOLS['tcp'], 1733, 'siipat'),
-        'silc': Service(PROTOCOLS['tcp'], 706, 'silc'),
-        'silhouette': Service(PROTOCOLS['tcp'], 7500, 'silhouette'),
-        'silkmeter': Service(PROTOCOLS['tcp'], 5461, 'silkmeter'),
-        'silkp1': Service(PROTOCOLS['tcp'], 2829, 'silkp1'),
-        'silkp2': Service(PROTOCOLS['tcp'], 2830, 'silkp2'),
-        'silkp3': Service(PROTOCOLS['tcp'], 2831, 'silkp3'),
-        'silkp4': Service(PROTOCOLS['tcp'], 2832, 'silkp4'),
-        'silverpeakcomm': Service(PROTOCOLS['tcp'], 4164, 'silverpeakcomm'),
-        'silverpeakpeer': Service(PROTOCOLS['tcp'], 4163, 'silverpeakpeer'),
-        'silverplatter': Service(PROTOCOLS['tcp'], 416, 'silverplatter'),
-        'sim-control': Service(PROTOCOLS['tcp'], 3110, 'sim-control'),
-        'simba-cs': Service(PROTOCOLS['tcp'], 1543, 'simba-cs'),
-        'simbaexpress': Service(PROTOCOLS['tcp'], 1583, 'simbaexpress'),
-        'simbaservices': Service(PROTOCOLS['tcp'], 1599, 'simbaservices'),
-        'simco': Service(PROTOCOLS['tcp'], 7626, 'simco'),
-        'simctlp': Service(PROTOCOLS['tcp'], 2857, 'simctlp'),
-        'simon': Service(PROTOCOLS['tcp'], 4753, 'simon'),
-        'simp-all': Service(PROTOCOLS['tcp'], 1959, 'simp-all'),
-        'simple-push': Service(PROTOCOLS['tcp'], 3687, 'simple-push'),
-        'simple-push-s': Service(PROTOCOLS['tcp'], 3688, 'simple-push-s'),
-        'simple-tx-rx': Service(PROTOCOLS['tcp'], 2257, 'simple-tx-rx'),
-        'simplement-tie': Service(PROTOCOLS['tcp'], 2756, 'simplement-tie'),
-        'simplifymedia': Service(PROTOCOLS['tcp'], 8087, 'simplifymedia'),
-        'simslink': Service(PROTOCOLS['tcp'], 2676, 'simslink'),
-        'sip': Service(PROTOCOLS['tcp'], 5060, 'sip'),
-        'sips': Service(PROTOCOLS['tcp'], 5061, 'sips'),
-        'sis-emt': Service(PROTOCOLS['tcp'], 2545, 'sis-emt'),
-        'sitaradir': Service(PROTOCOLS['tcp'], 2631, 'sitaradir'),
-        'sitaramgmt': Service(PROTOCOLS['tcp'], 2630, 'sitaramgmt'),
-        'sitaraserver': Service(PROTOCOLS['tcp'], 2629, 'sitaraserver'),
-        'sitewatch': Service(PROTOCOLS['tcp'], 3792, 'sitewatch'),
-        'sitewatch-s': Service(PROTOCOLS['tcp'], 3766, 'sitewatch-s'),
-        'six-degrees': Service(PROTOCOLS['tcp'], 3611, 'six-degrees'),
-        'sixchat': Service(PROTOCOLS['tcp'], 4605, 'sixchat'),
-        'sixnetudr': Service(PROTOCOLS['tcp'], 1658, 'sixnetudr'),
-        'sixtrak': Service(PROTOCOLS['tcp'], 1594, 'sixtrak'),
-        'sixxsconfig': Service(PROTOCOLS['tcp'], 3874, 'sixxsconfig'),
-        'skip-cert-recv': Service(PROTOCOLS['tcp'], 6455, 'skip-cert-recv'),
-        'skip-cert-send': Service(PROTOCOLS['tcp'], 6456, 'skip-cert-send'),
-        'skip-mc-gikreq': Service(PROTOCOLS['tcp'], 1660, 'skip-mc-gikreq'),
-        'skronk': Service(PROTOCOLS['tcp'], 460, 'skronk'),
-        'sky-transport': Service(PROTOCOLS['tcp'], 3556, 'sky-transport'),
-        'skytelnet': Service(PROTOCOLS['tcp'], 1618, 'skytelnet'),
-        'slc-ctrlrloops': Service(PROTOCOLS['tcp'], 2827, 'slc-ctrlrloops'),
-        'slc-systemlog': Service(PROTOCOLS['tcp'], 2826, 'slc-systemlog'),
-        'slim-devices': Service(PROTOCOLS['tcp'], 3483, 'slim-devices'),
-        'slingshot': Service(PROTOCOLS['tcp'], 1705, 'slingshot'),
-        'slinkysearch': Service(PROTOCOLS['tcp'], 1225, 'slinkysearch'),
-        'slinterbase': Service(PROTOCOLS['tcp'], 3065, 'slinterbase'),
-        'slm-api': Service(PROTOCOLS['tcp'], 1606, 'slm-api'),
-        'slp': Service(PROTOCOLS['tcp'], 1605, 'slp'),
-        'slp-notify': Service(PROTOCOLS['tcp'], 1847, 'slp-notify'),
-        'slscc': Service(PROTOCOLS['tcp'], 4408, 'slscc'),
-        'slslavemon': Service(PROTOCOLS['tcp'], 3102, 'slslavemon'),
-        'slush': Service(PROTOCOLS['tcp'], 1966, 'slush'),
-        'sm-pas-1': Service(PROTOCOLS['tcp'], 2938, 'sm-pas-1'),
-        'sm-pas-2': Service(PROTOCOLS['tcp'], 2939, 'sm-pas-2'),
-        'sm-pas-3': Service(PROTOCOLS['tcp'], 2940, 'sm-pas-3'),
-        'sm-pas-4': Service(PROTOCOLS['tcp'], 2941, 'sm-pas-4'),
-        'sm-pas-5': Service(PROTOCOLS['tcp'], 2942, 'sm-pas-5'),
-        'smaclmgr': Service(PROTOCOLS['tcp'], 4660, 'smaclmgr'),
-        'smakynet': Service(PROTOCOLS['tcp'], 122, 'smakynet'),
-        'smap': Service(PROTOCOLS['tcp'], 3731, 'smap'),
-        'smar-se-port1': Service(PROTOCOLS['tcp'], 4987, 'smar-se-port1'),
-        'smar-se-port2': Service(PROTOCOLS['tcp'], 4988, 'smar-se-port2'),
-        'smart-diagnose': Service(PROTOCOLS['tcp'], 2721, 'smart-diagnose'),
-        'smart-install': Service(PROTOCOLS['tcp'], 4786, 'smart-install'),
-        'smart-lm': Service(PROTOCOLS['tcp'], 1608, 'smart-lm'),
-        'smartcard-port': Service(PROTOCOLS['tcp'], 3516, 'smartcard-port'),
-        'smartcard-tls': Service(PROTOCOLS['tcp'], 4116, 'smartcard-tls'),
-        'smartpackets': Service(PROTOCOLS['tcp'], 3218, 'smartpackets'),
-        'smartsdp': Service(PROTOCOLS['tcp'], 426, 'smartsdp'),
-        'smauth-port': Service(PROTOCOLS['tcp'], 3929, 'smauth-port'),
-        'smbdirect': Service(PROTOCOLS['tcp'], 5445, 'smbdirect'),
-        'smc-admin': Service(PROTOCOLS['tcp'], 6787, 'smc-admin'),
-        'smc-http': Service(PROTOCOLS['tcp'], 6788, 'smc-http'),
-        'smc-jmx': Service(PROTOCOLS['tcp'], 6786, 'smc-jmx'),
-        'smcluster': Service(PROTOCOLS['tcp'], 4174, 'smcluster'),
-        'smile': Service(PROTOCOLS['tcp'], 3670, 'smile'),
-        'smip': Service(PROTOCOLS['tcp'], 7734, 'smip'),
-        'smntubootstrap': Service(PROTOCOLS['tcp'], 2613, 'smntubootstrap'),
-        'smpnameres': Service(PROTOCOLS['tcp'], 901, 'smpnameres'),
-        'smpp': Service(PROTOCOLS['tcp'], 2775, 'smpp'),
-        'smpppd': Service(PROTOCOLS['tcp'], 3185, 'smpppd'),
-        'smpte': Service(PROTOCOLS['tcp'], 420, 'smpte'),
-        'sms-chat': Service(PROTOCOLS['tcp'], 2703, 'sms-chat'),
-        'sms-rcinfo': Service(PROTOCOLS['tcp'], 2701, 'sms-rcinfo'),
-        'sms-remctrl': Service(PROTOCOLS['tcp'], 2704, 'sms-remctrl'),
-        'sms-xfer': Service(PROTOCOLS['tcp'], 2702, 'sms-xfer'),
-        'smsd': Service(PROTOCOLS['tcp'], 596, 'smsd'),
-        'smsp': Service(PROTOCOLS['tcp'], 413, 'smsp'),
-        'smsqp': Service(PROTOCOLS['tcp'], 11201, 'smsqp'),
-        'smtp': Service(PROTOCOLS['tcp'], 25, 'smtp'),
-        'smux': Service(PROTOCOLS['tcp'], 199, 'smux'),
-        'smwan': Service(PROTOCOLS['tcp'], 3979, 'smwan'),
-        'sna-cs': Service(PROTOCOLS['tcp'], 1553, 'sna-cs'),
-        'snac': Service(PROTOCOLS['tcp'], 3536, 'snac'),
-        'snagas': Service(PROTOCOLS['tcp'], 108, 'snagas'),
-        'snap': Service(PROTOCOLS['tcp'], 4752, 'snap'),
-        'snapd': Service(PROTOCOLS['tcp'], 2599, 'snapd'),
-        'snapenetio': Service(PROTOCOLS['tcp'], 22000, 'snapenetio'),
-        'snapp': Service(PROTOCOLS['tcp'], 2333, 'snapp'),
-        'snare': Service(PROTOCOLS['tcp'], 509, 'snare'),
-        'snaresecure': Service(PROTOCOLS['tcp'], 1684, 'snaresecure'),
-        'sncp': Service(PROTOCOLS['tcp'], 7560, 'sncp'),
-        'snifferclient': Service(PROTOCOLS['tcp'], 2452, 'snifferclient'),
-        'snifferdata': Service(PROTOCOLS['tcp'], 2892, 'snifferdata'),
-        'snifferserver': Service(PROTOCOLS['tcp'], 2533, 'snifferserver'),
-        'snip-slave': Service(PROTOCOLS['tcp'], 33656, 'snip-slave'),
-        'snmp': Service(PROTOCOLS['tcp'], 161, 'snmp'),
-        'snmp-tcp-port': Service(PROTOCOLS['tcp'], 1993, 'snmp-tcp-port'),
-        'snmpssh': Service(PROTOCOLS['tcp'], 5161, 'snmpssh'),
-        'snmpssh-trap': Service(PROTOCOLS['tcp'], 5162, 'snmpssh-trap'),
-        'snmptls': Service(PROTOCOLS['tcp'], 10161, 'snmptls'),
-        'snmptls-trap': Service(PROTOCOLS['tcp'], 10162, 'snmptls-trap'),
-        'snmptrap': Service(PROTOCOLS['tcp'], 162, 'snmptrap'),
-        'snpp': Service(PROTOCOLS['tcp'], 444, 'snpp'),
-        'sns-admin': Service(PROTOCOLS['tcp'], 2658, 'sns-admin'),
-        'sns-agent': Service(PROTOCOLS['tcp'], 5417, 'sns-agent'),
-        'sns-channels': Service(PROTOCOLS['tcp'], 3380, 'sns-channels'),
-        'sns-dispatcher': Service(PROTOCOLS['tcp'], 2657, 'sns-dispatcher'),
-        'sns-gateway': Service(PROTOCOLS['tcp'], 5416, 'sns-gateway'),
-        'sns-protocol': Service(PROTOCOLS['tcp'], 2409, 'sns-protocol'),
-        'sns-query': Service(PROTOCOLS['tcp'], 2659, 'sns-query'),
-        'sns-quote': Service(PROTOCOLS['tcp'], 1967, 'sns-quote'),
-        'sntlkeyssrvr': Service(PROTOCOLS['tcp'], 9450, 'sntlkeyssrvr'),
-        'sntp-heartbeat': Service(PROTOCOLS['tcp'], 580, 'sntp-heartbeat'),
-        'soagateway': Service(PROTOCOLS['tcp'], 5250, 'soagateway'),
-        'soap-beep': Service(PROTOCOLS['tcp'], 605, 'soap-beep'),
-        'soap-http': Service(PROTOCOLS['tcp'], 7627, 'soap-http'),
-        'socalia': Service(PROTOCOLS['tcp'], 5100, 'socalia'),
-        'social-alarm': Service(PROTOCOLS['tcp'], 5146, 'social-alarm'),
-        'socks': Service(PROTOCOLS['tcp'], 1080, 'socks'),
-        'socorfs': Service(PROTOCOLS['tcp'], 3379, 'socorfs'),
-        'softaudit': Service(PROTOCOLS['tcp'], 3419, 'softaudit'),
-        'softcm': Service(PROTOCOLS['tcp'], 6110, 'softcm'),
-        'softdataphone': Service(PROTOCOLS['tcp'], 1621, 'softdataphone'),
-        'softpc': Service(PROTOCOLS['tcp'], 215, 'softpc'),
-        'softrack-meter': Service(PROTOCOLS['tcp'], 3884, 'softrack-meter'),
-        'solaris-audit': Service(PROTOCOLS['tcp'], 16162, 'solaris-audit'),
-        'solera-epmap': Service(PROTOCOLS['tcp'], 2132, 'solera-epmap'),
-        'solera-lpn': Service(PROTOCOLS['tcp'], 4738, 'solera-lpn'),
-        'solid-e-engine': Service(PROTOCOLS['tcp'], 1964, 'solid-e-engine'),
-        'solid-mux': Service(PROTOCOLS['tcp'], 1029, 'solid-mux'),
-        'solve': Service(PROTOCOLS['tcp'], 2636, 'solve'),
-        'sonar': Service(PROTOCOLS['tcp'], 572, 'sonar'),
-        'sonardata': Service(PROTOCOLS['tcp'], 2863, 'sonardata'),
-        'soniqsync': Service(PROTOCOLS['tcp'], 3803, 'soniqsync'),
-        'sonus': Service(PROTOCOLS['tcp'], 2653, 'sonus'),
-        'sonus-logging': Service(PROTOCOLS['tcp'], 2290, 'sonus-logging'),
-        'sonuscallsig': Service(PROTOCOLS['tcp'], 2569, 'sonuscallsig'),
-        'sophia-lm': Service(PROTOCOLS['tcp'], 1408, 'sophia-lm'),
-        'sops': Service(PROTOCOLS['tcp'], 3944, 'sops'),
-        'sor-update': Service(PROTOCOLS['tcp'], 3922, 'sor-update'),
-        'sos': Service(PROTOCOLS['tcp'], 3838, 'sos'),
-        'sossd-agent': Service(PROTOCOLS['tcp'], 7982, 'sossd-agent'),
-        'sossd-collect': Service(PROTOCOLS['tcp'], 7981, 'sossd-collect'),
-        'sossecollector': Service(PROTOCOLS['tcp'], 3166, 'sossecollector'),
-        'soundsvirtual': Service(PROTOCOLS['tcp'], 17185, 'soundsvirtual'),
-        'spamtrap': Service(PROTOCOLS['tcp'], 2568, 'spamtrap'),
-        'spandataport': Service(PROTOCOLS['tcp'], 3193, 'spandataport'),
-        'spc': Service(PROTOCOLS['tcp'], 6111, 'spc'),
-        'spcsdlobby': Service(PROTOCOLS['tcp'], 2888, 'spcsdlobby'),
-        'spdy': Service(PROTOCOLS['tcp'], 6121, 'spdy'),
-        'spearway': Service(PROTOCOLS['tcp'], 2440, 'spearway'),
-        'spectardata': Service(PROTOCOLS['tcp'], 3834, 'spectardata'),
-        'spectardb': Service(PROTOCOLS['tcp'], 3835, 'spectardb'),
-        'spectraport': Service(PROTOCOLS['tcp'], 3851, 'spectraport'),
-        'speedtrace': Service(PROTOCOLS['tcp'], 33334, 'speedtrace'),
-        'spg': Service(PROTOCOLS['tcp'], 7016, 'spg'),
-        'sphinxapi': Service(PROTOCOLS['tcp'], 9312, 'sphinxapi'),
-        'sphinxql': Service(PROTOCOLS['tcp'], 9306, 'sphinxql'),
-        'spice': Service(PROTOCOLS['tcp'], 1923, 'spice'),
-        'spike': Service(PROTOCOLS['tcp'], 4683, 'spike'),
-        'spiral-admin': Service(PROTOCOLS['tcp'], 3438, 'spiral-admin'),
-        'splitlock': Service(PROTOCOLS['tcp'], 3606, 'splitlock'),
-        'splitlock-gw': Service(PROTOCOLS['tcp'], 3647, 'splitlock-gw'),
-        'spmp': Service(PROTOCOLS['tcp'], 656, 'spmp'),
-        'spock': Service(PROTOCOLS['tcp'], 2507, 'spock'),
-        'spocp': Service(PROTOCOLS['tcp'], 4751, 'spocp'),
-        'spramsca': Service(PROTOCOLS['tcp'], 5769, 'spramsca'),
-        'spramsd': Service(PROTOCOLS['tcp'], 5770, 'spramsd'),
-        'spremotetablet': Service(PROTOCOLS['tcp'], 46998, 'spremotetablet'),
-        'sps-tunnel': Service(PROTOCOLS['tcp'], 2876, 'sps-tunnel'),
-        'spsc': Service(PROTOCOLS['tcp'], 478, 'spsc'),
-        'spss': Service(PROTOCOLS['tcp'], 5443, 'spss'),
-        'spss-lm': Service(PROTOCOLS['tcp'], 1759, 'spss-lm'),
-        'spt-automation': Service(PROTOCOLS['tcp'], 5814, 'spt-automation'),
-        'sptx': Service(PROTOCOLS['tcp'], 40404, 'sptx'),
-        'spugna': Service(PROTOCOLS['tcp'], 3807, 'spugna'),
-        'spw-dialer': Service(PROTOCOLS['tcp'], 3796, 'spw-dialer'),
-        'spw-dnspreload': Service(PROTOCOLS['tcp'], 3849, 'spw-dnspreload'),
-        'spytechphone': Service(PROTOCOLS['tcp'], 8192, 'spytechphone'),
-        'sqdr': Service(PROTOCOLS['tcp'], 2728, 'sqdr'),
-        'sql*net': Service(PROTOCOLS['tcp'], 66, 'sql*net'),
-        'sql-net': Service(PROTOCOLS['tcp'], 150, 'sql-net'),
-        'sqlexec': Service(PROTOCOLS['tcp'], 9088, 'sqlexec'),
-        'sqlexec-ssl': Service(PROTOCOLS['tcp'], 9089, 'sqlexec-ssl'),
-        'sqlserv': Service(PROTOCOLS['tcp'], 118, 'sqlserv'),
-        'sqlsrv': Service(PROTOCOLS['tcp'], 156, 'sqlsrv'),
-        'src': Service(PROTOCOLS['tcp'], 200, 'src'),
-        'srcp': Service(PROTOCOLS['tcp'], 4303, 'srcp'),
-        'srdp': Service(PROTOCOLS['tcp'], 3942, 'srdp'),
-        'srmp': Service(PROTOCOLS['tcp'], 193, 'srmp'),
-        'srp-feedback': Service(PROTOCOLS['tcp'], 2737, 'srp-feedback'),
-        'srssend': Service(PROTOCOLS['tcp'], 362, 'srssend'),
-        'sruth': Service(PROTOCOLS['tcp'], 38800, 'sruth'),
-        'srvc-registry': Service(PROTOCOLS['tcp'], 3018, 'srvc-registry'),
-        'srvc_registry': Service(PROTOCOLS['tcp'], 3018, 'srvc_registry'),
-        'ss-idi': Service(PROTOCOLS['tcp'], 20013, 'ss-idi'),
-        'ss7ns': Service(PROTOCOLS['tcp'], 477, 'ss7ns'),
-        'ssad': Service(PROTOCOLS['tcp'], 4750, 'ssad'),
-        'ssc-agent': Service(PROTOCOLS['tcp'], 2967, 'ssc-agent'),
-        'sscan': Service(PROTOCOLS['tcp'], 3853, 'sscan'),
-        'ssdispatch': Service(PROTOCOLS['tcp'], 3430, 'ssdispatch'),
-        'ssdp': Service(PROTOCOLS['tcp'], 1900, 'ssdp'),
-        'ssdtp': Service(PROTOCOLS['tcp'], 6071, 'ssdtp'),
-        'sse-app-config': Service(PROTOCOLS['tcp'], 3852, 'sse-app-config'),
-        'ssh': Service(PROTOCOLS['tcp'], 22, 'ssh'),
-        'ssh-mgmt': Service(PROTOCOLS['tcp'], 17235, 'ssh-mgmt'),
-        'sshell': Service(PROTOCOLS['tcp'], 614, 'sshell'),
-        'sslp': Service(PROTOCOLS['tcp'], 1750, 'sslp'),
-        'ssm-cssps': Service(PROTOCOLS['tcp'], 2478, 'ssm-cssps'),
-        'ssm-cvs': Service(PROTOCOLS['tcp'], 2477, 'ssm-cvs'),
-        'ssm-els': Service(PROTOCOLS['tcp'], 2479, 'ssm-els'),
-        'ssmc': Service(PROTOCOLS['tcp'], 2187, 'ssmc'),
-        'ssmpp': Service(PROTOCOLS['tcp'], 3550, 'ssmpp'),
-        'sso-control': Service(PROTOCOLS['tcp'], 2711, 'sso-control'),
-        'sso-service': Service(PROTOCOLS['tcp'], 2710, 'sso-service'),
-        'ssowatch': Service(PROTOCOLS['tcp'], 3644, 'ssowatch'),
-        'ssp': Service(PROTOCOLS['tcp'], 3249, 'ssp'),
-        'ssp-client': Service(PROTOCOLS['tcp'], 7801, 'ssp-client'),
-        'ssql': Service(PROTOCOLS['tcp'], 3352, 'ssql'),
-        'ssr-servermgr': Service(PROTOCOLS['tcp'], 45966, 'ssr-servermgr'),
-        'ssrip': Service(PROTOCOLS['tcp'], 3318, 'ssrip'),
-        'ssslic-mgr': Service(PROTOCOLS['tcp'], 1203, 'ssslic-mgr'),
-        'ssslog-mgr': Service(PROTOCOLS['tcp'], 1204, 'ssslog-mgr'),
-        'sst': Service(PROTOCOLS['tcp'], 266, 'sst'),
-        'sstp-1': Service(PROTOCOLS['tcp'], 7743, 'sstp-1'),
-        'sstp-2': Service(PROTOCOLS['tcp'], 9801, 'sstp-2'),
-        'sstsys-lm': Service(PROTOCOLS['tcp'], 1692, 'sstsys-lm'),
-        'stanag-5066': Service(PROTOCOLS['tcp'], 5066, 'stanag-5066'),
-        'starbot': Service(PROTOCOLS['tcp'], 2838, 'starbot'),
-        'starfish': Service(PROTOCOLS['tcp'], 3981, 'starfish'),
-        'stargatealerts': Service(PROTOCOLS['tcp'], 1654, 'stargatealerts'),
-        'starquiz-port': Service(PROTOCOLS['tcp'], 3526, 'starquiz-port'),
-        'stars': Service(PROTOCOLS['tcp'], 4131, 'stars'),
-        'starschool': Service(PROTOCOLS['tcp'], 2270, 'starschool'),
-        'start-network': Service(PROTOCOLS['tcp'], 3615, 'start-network'),
-        'startron': Service(PROTOCOLS['tcp'], 1057, 'startron'),
-        'stat-cc': Service(PROTOCOLS['tcp'], 4158, 'stat-cc'),
-        'stat-results': Service(PROTOCOLS['tcp'], 4156, 'stat-results'),
-        'stat-scanner': Service(PROTOCOLS['tcp'], 4157, 'stat-scanner'),
-        'statsci1-lm': Service(PROTOCOLS['tcp'], 6144, 'statsci1-lm'),
-        'statsci2-lm': Service(PROTOCOLS['tcp'], 6145, 'statsci2-lm'),
-        'statsrv': Service(PROTOCOLS['tcp'], 133, 'statsrv'),
-        'statusd': Service(PROTOCOLS['tcp'], 5414, 'statusd'),
-        'stdptc': Service(PROTOCOLS['tcp'], 2154, 'stdptc'),
-        'ste-smsc': Service(PROTOCOLS['tcp'], 1836, 'ste-smsc'),
-        'stgxfws': Service(PROTOCOLS['tcp'], 1226, 'stgxfws'),
-        'sti-envision': Service(PROTOCOLS['tcp'], 1312, 'sti-envision'),
-        'stm-pproc': Service(PROTOCOLS['tcp'], 3080, 'stm-pproc'),
-        'stm_pproc': Service(PROTOCOLS['tcp'], 3080, 'stm_pproc'),
-        'stmf': Service(PROTOCOLS['tcp'], 501, 'stmf'),
-        'stone-design-1': Service(PROTOCOLS['tcp'], 1492, 'stone-design-1'),
-        'stonefalls': Service(PROTOCOLS['tcp'], 2986, 'stonefalls'),
-        'storageos': Service(PROTOCOLS['tcp'], 5705, 'storageos'),
-        'storman': Service(PROTOCOLS['tcp'], 4178, 'storman'),
-        'storview': Service(PROTOCOLS['tcp'], 9293, 'storview'),
-        'streamcomm-ds': Service(PROTOCOLS['tcp'], 9612, 'streamcomm-ds'),
-        'street-stream': Service(PROTOCOLS['tcp'], 1736, 'street-stream'),
-        'streetperfect': Service(PROTOCOLS['tcp'], 1330, 'streetperfect'),
-        'streettalk': Service(PROTOCOLS['tcp'], 566, 'streettalk'),
-        'streletz': Service(PROTOCOLS['tcp'], 6344, 'streletz'),
-        'stresstester': Service(PROTOCOLS['tcp'], 5397, 'stresstester'),
-        'strexec-d': Service(PROTOCOLS['tcp'], 5026, 'strexec-d'),
-        'strexec-s': Service(PROTOCOLS['tcp'], 5027, 'strexec-s'),
-        'stryker-com': Service(PROTOCOLS['tcp'], 3854, 'stryker-com'),
-        'stss': Service(PROTOCOLS['tcp'], 3090, 'stss'),
-        'stt': Service(PROTOCOLS['tcp'], 1607, 'stt'),
-        'sttunnel': Service(PROTOCOLS['tcp'], 7471, 'sttunnel'),
-        'stun': Service(PROTOCOLS['tcp'], 3478, 'stun'),
-        'stun-behavior': Service(PROTOCOLS['tcp'], 3478, 'stun-behavior'),
-        'stun-behaviors': Service(PROTOCOLS['tcp'], 5349, 'stun-behaviors'),
-        'stun-p1': Service(PROTOCOLS['tcp'], 1990, 'stun-p1'),
-        'stun-p2': Service(PROTOCOLS['tcp'], 1991, 'stun-p2'),
-        'stun-p3': Service(PROTOCOLS['tcp'], 1992, 'stun-p3'),
-        'stun-port': Service(PROTOCOLS['tcp'], 1994, 'stun-port'),
-        'stuns': Service(PROTOCOLS['tcp'], 5349, 'stuns'),
-        'stvp': Service(PROTOCOLS['tcp'], 3158, 'stvp'),
-        'stx': Service(PROTOCOLS['tcp'], 527, 'stx'),
-        'su-mit-tg': Service(PROTOCOLS['tcp'], 89, 'su-mit-tg'),
-        'sua': Service(PROTOCOLS['tcp'], 14001, 'sua'),
-        'submission': Service(PROTOCOLS['tcp'], 587, 'submission'),
-        'submissions': Service(PROTOCOLS['tcp'], 465, 'submissions'),
-        'submit': Service(PROTOCOLS['tcp'], 773, 'submit'),
-        'submitserver': Service(PROTOCOLS['tcp'], 2028, 'submitserver'),
-        'subntbcst-tftp': Service(PROTOCOLS['tcp'], 247, 'subntbcst-tftp'),
-        'subntbcst_tftp': Service(PROTOCOLS['tcp'], 247, 'subntbcst_tftp'),
-        'sugp': Service(PROTOCOLS['tcp'], 1905, 'sugp'),
-        'suitcase': Service(PROTOCOLS['tcp'], 2903, 'suitcase'),
-        'suitjd': Service(PROTOCOLS['tcp'], 3354, 'suitjd'),
-        'sum': Service(PROTOCOLS['tcp'], 6551, 'sum'),
-        'sun-as-iiops': Service(PROTOCOLS['tcp'], 3708, 'sun-as-iiops'),
-        'sun-as-iiops-ca': Service(PROTOCOLS['tcp'], 3808, 'sun-as-iiops-ca'),
-        'sun-as-jmxrmi': Service(PROTOCOLS['tcp'], 8686, 'sun-as-jmxrmi'),
-        'sun-as-jpda': Service(PROTOCOLS['tcp'], 9191, 'sun-as-jpda'),
-        'sun-as-nodeagt': Service(PROTOCOLS['tcp'], 4850, 'sun-as-nodeagt'),
-        'sun-dr': Service(PROTOCOLS['tcp'], 665, 'sun-dr'),
-        'sun-lm': Service(PROTOCOLS['tcp'], 7588, 'sun-lm'),
-        'sun-mc-grp': Service(PROTOCOLS['tcp'], 5306, 'sun-mc-grp'),
-        'sun-sea-port': Service(PROTOCOLS['tcp'], 16161, 'sun-sea-port'),
-        'sun-sr-admin': Service(PROTOCOLS['tcp'], 6489, 'sun-sr-admin'),
-        'sun-sr-http': Service(PROTOCOLS['tcp'], 6480, 'sun-sr-http'),
-        'sun-sr-https': Service(PROTOCOLS['tcp'], 6443, 'sun-sr-https'),
-        'sun-sr-iiop': Service(PROTOCOLS['tcp'], 6485, 'sun-sr-iiop'),
-        'sun-sr-iiop-aut': Service(PROTOCOLS['tcp'], 6487, 'sun-sr-iiop-aut'),
-        'sun-sr-iiops': Service(PROTOCOLS['tcp'], 6486, 'sun-sr-iiops'),
-        'sun-sr-jms': Service(PROTOCOLS['tcp'], 6484, 'sun-sr-jms'),
-        'sun-sr-jmx': Service(PROTOCOLS['tcp'], 6488, 'sun-sr-jmx'),
-        'sun-user-https': Service(PROTOCOLS['tcp'], 7677, 'sun-user-https'),
-        'suncacao-csa': Service(PROTOCOLS['tcp'], 11164, 'suncacao-csa'),
-        'suncacao-jmxmp': Service(PROTOCOLS['tcp'], 11162, 'suncacao-jmxmp'),
-        'suncacao-rmi': Service(PROTOCOLS['tcp'], 11163, 'suncacao-rmi'),
-        'suncacao-snmp': Service(PROTOCOLS['tcp'], 11161, 'suncacao-snmp'),
-        'suncacao-websvc': Service(PROTOCOLS['tcp'], 11165, 'suncacao-websvc'),
-        'sunclustergeo': Service(PROTOCOLS['tcp'], 2084, 'sunclustergeo'),
-        'sunclustermgr': Service(PROTOCOLS['tcp'], 1097, 'sunclustermgr'),
-        'sunfm-port': Service(PROTOCOLS['tcp'], 3934, 'sunfm-port'),
-        'sunlps-http': Service(PROTOCOLS['tcp'], 3816, 'sunlps-http'),
-        'sunproxyadmin': Service(PROTOCOLS['tcp'], 8081, 'sunproxyadmin'),
-        'sunrpc': Service(PROTOCOLS['tcp'], 111, 'sunrpc'),
-        'sunscalar-dns': Service(PROTOCOLS['tcp'], 1870, 'sunscalar-dns'),
-        'sunscalar-svc': Service(PROTOCOLS['tcp'], 1860, 'sunscalar-svc'),
-        'sunvts-rmi': Service(PROTOCOLS['tcp'], 6483, 'sunvts-rmi'),
-        'sunwebadmin': Service(PROTOCOLS['tcp'], 8800, 'sunwebadmin'),
-        'sunwebadmins': Service(PROTOCOLS['tcp'], 8989, 'sunwebadmins'),
-        'supdup': Service(PROTOCOLS['tcp'], 95, 'supdup'),
-        'supercell': Service(PROTOCOLS['tcp'], 7967, 'supercell'),
-        'supermon': Service(PROTOCOLS['tcp'], 2709, 'supermon'),
-        'supportassist': Service(PROTOCOLS['tcp'], 5700, 'supportassist'),
-        'sur-meas': Service(PROTOCOLS['tcp'], 243, 'sur-meas'),
-        'surebox': Service(PROTOCOLS['tcp'], 5453, 'surebox'),
-        'surf': Service(PROTOCOLS['tcp'], 1010, 'surf'),
-        'surfcontrolcpa': Service(PROTOCOLS['tcp'], 3909, 'surfcontrolcpa'),
-        'surfpass': Service(PROTOCOLS['tcp'], 5030, 'surfpass'),
-        'surveyinst': Service(PROTOCOLS['tcp'], 3212, 'surveyinst'),
-        'suucp': Service(PROTOCOLS['tcp'], 4031, 'suucp'),
-        'svbackup': Service(PROTOCOLS['tcp'], 8405, 'svbackup'),
-        'svcloud': Service(PROTOCOLS['tcp'], 8404, 'svcloud'),
-        'svdrp': Service(PROTOCOLS['tcp'], 6419, 'svdrp'),
-        'svn': Service(PROTOCOLS['tcp'], 3690, 'svn'),
-        'svnet': Service(PROTOCOLS['tcp'], 3413, 'svnet'),
-        'svnetworks': Service(PROTOCOLS['tcp'], 2973, 'svnetworks'),
-        'svrloc': Service(PROTOCOLS['tcp'], 427, 'svrloc'),
-        'svs-omagent': Service(PROTOCOLS['tcp'], 1625, 'svs-omagent'),
-        'sw-orion': Service(PROTOCOLS['tcp'], 17777, 'sw-orion'),
-        'swa-1': Service(PROTOCOLS['tcp'], 9023, 'swa-1'),
-        'swa-2': Service(PROTOCOLS['tcp'], 9024, 'swa-2'),
-        'swa-3': Service(PROTOCOLS['tcp'], 9025, 'swa-3'),
-        'swa-4': Service(PROTOCOLS['tcp'], 9026, 'swa-4'),
-        'swarm': Service(PROTOCOLS['tcp'], 2377, 'swarm'),
-        'swdtp': Service(PROTOCOLS['tcp'], 10104, 'swdtp'),
-        'swdtp-sv': Service(PROTOCOLS['tcp'], 10009, 'swdtp-sv'),
-        'sweetware-apps': Service(PROTOCOLS['tcp'], 1221, 'sweetware-apps'),
-        'swift-rvf': Service(PROTOCOLS['tcp'], 97, 'swift-rvf'),
-        'swiftnet': Service(PROTOCOLS['tcp'], 1751, 'swiftnet'),
-        'swismgr1': Service(PROTOCOLS['tcp'], 6963, 'swismgr1'),
-        'swismgr2': Service(PROTOCOLS['tcp'], 6964, 'swismgr2'),
-        'swispol': Service(PROTOCOLS['tcp'], 6966, 'swispol'),
-        'swistrap': Service(PROTOCOLS['tcp'], 6965, 'swistrap'),
-        'swldy-sias': Service(PROTOCOLS['tcp'], 1250, 'swldy-sias'),
-        'swr-port': Service(PROTOCOLS['tcp'], 3491, 'swr-port'),
-        'swrmi': Service(PROTOCOLS['tcp'], 1866, 'swrmi'),
-        'swtp-port1': Service(PROTOCOLS['tcp'], 9281, 'swtp-port1'),
-        'swtp-port2': Service(PROTOCOLS['tcp'], 9282, 'swtp-port2'),
-        'swx-gate': Service(PROTOCOLS['tcp'], 4538, 'swx-gate'),
-        'swxadmin': Service(PROTOCOLS['tcp'], 5043, 'swxadmin'),
-        'sxmp': Service(PROTOCOLS['tcp'], 3273, 'sxmp'),
-        'sxuptp': Service(PROTOCOLS['tcp'], 19540, 'sxuptp'),
-        'syam-agent': Service(PROTOCOLS['tcp'], 3894, 'syam-agent'),
-        'syam-smc': Service(PROTOCOLS['tcp'], 3895, 'syam-smc'),
-        'syam-webserver': Service(PROTOCOLS['tcp'], 3930, 'syam-webserver'),
-        'sybase-sqlany': Service(PROTOCOLS['tcp'], 1498, 'sybase-sqlany'),
-        'sybaseanywhere': Service(PROTOCOLS['tcp'], 2638, 'sybaseanywhere'),
-        'sybasedbsynch': Service(PROTOCOLS['tcp'], 2439, 'sybasedbsynch'),
-        'sybasesrvmon': Service(PROTOCOLS['tcp'], 4950, 'sybasesrvmon'),
-        'sychrond': Service(PROTOCOLS['tcp'], 3723, 'sychrond'),
-        'symantec-sfdb': Service(PROTOCOLS['tcp'], 5629, 'symantec-sfdb'),
-        'symantec-sim': Service(PROTOCOLS['tcp'], 3547, 'symantec-sim'),
-        'symb-sb-port': Service(PROTOCOLS['tcp'], 3923, 'symb-sb-port'),
-        'symplex': Service(PROTOCOLS['tcp'], 1507, 'symplex'),
-        'synapse': Service(PROTOCOLS['tcp'], 2880, 'synapse'),
-        'synapse-nhttp': Service(PROTOCOLS['tcp'], 8280, 'synapse-nhttp'),
-        'synapse-nhttps': Service(PROTOCOLS['tcp'], 8243, 'synapse-nhttps'),
-        'synapsis-edge': Service(PROTOCOLS['tcp'], 5008, 'synapsis-edge'),
-        'sync-em7': Service(PROTOCOLS['tcp'], 7707, 'sync-em7'),
-        'synchromesh': Service(PROTOCOLS['tcp'], 4548, 'synchromesh'),
-        'synchronet-db': Service(PROTOCOLS['tcp'], 6100, 'synchronet-db'),
-        'synchronet-rtc': Service(PROTOCOLS['tcp'], 6101, 'synchronet-rtc'),
-        'synchronet-upd': Service(PROTOCOLS['tcp'], 6102, 'synchronet-upd'),
-        'synchronite': Service(PROTOCOLS['tcp'], 4106, 'synchronite'),
-        'syncserver': Service(PROTOCOLS['tcp'], 2647, 'syncserver'),
-        'syncserverssl': Service(PROTOCOLS['tcp'], 2679, 'syncserverssl'),
-        'synctest': Service(PROTOCOLS['tcp'], 45045, 'synctest'),
-        'synel-data': Service(PROTOCOLS['tcp'], 3734, 'synel-data'),
-        'synoptics-trap': Service(PROTOCOLS['tcp'], 412, 'synoptics-trap'),
-        'synotics-broker': Service(PROTOCOLS['tcp'], 392, 'synotics-broker'),
-        'synotics-relay': Service(PROTOCOLS['tcp'], 391, 'synotics-relay'),
-        'sype-transport': Service(PROTOCOLS['tcp'], 9911, 'sype-transport'),
-        'syscomlan': Service(PROTOCOLS['tcp'], 1065, 'syscomlan'),
-        'syserverremote': Service(PROTOCOLS['tcp'], 6418, 'syserverremote'),
-        'sysinfo-sp': Service(PROTOCOLS['tcp'], 11967, 'sysinfo-sp'),
-        'syslog-conn': Service(PROTOCOLS['tcp'], 601, 'syslog-conn'),
-        'syslog-tls': Service(PROTOCOLS['tcp'], 6514, 'syslog-tls'),
-        'sysopt': Service(PROTOCOLS['tcp'], 3281, 'sysopt'),
-        'sysorb': Service(PROTOCOLS['tcp'], 3241, 'sysorb'),
-        'sysrqd': Service(PROTOCOLS['tcp'], 4094, 'sysrqd'),
-        'sysscanner': Service(PROTOCOLS['tcp'], 3251, 'sysscanner'),
-        'systat': Service(PROTOCOLS['tcp'], 11, 'systat'),
-        'system-monitor': Service(PROTOCOLS['tcp'], 2609, 'system-monitor'),
-        'systemics-sox': Service(PROTOCOLS['tcp'], 5406, 'systemics-sox'),
-        't1-e1-over-ip': Service(PROTOCOLS['tcp'], 3175, 't1-e1-over-ip'),
-        't128-gateway': Service(PROTOCOLS['tcp'], 1627, 't128-gateway'),
-        't1distproc': Service(PROTOCOLS['tcp'], 1274, 't1distproc'),
-        't1distproc60': Service(PROTOCOLS['tcp'], 32249, 't1distproc60'),
-        't2-brm': Service(PROTOCOLS['tcp'], 7933, 't2-brm'),
-        't2-drm': Service(PROTOCOLS['tcp'], 7932, 't2-drm'),
-        't5-straton': Service(PROTOCOLS['tcp'], 11173, 't5-straton'),
-        'tabula': Service(PROTOCOLS['tcp'], 1437, 'tabula'),
-        'tacacs': Service(PROTOCOLS['tcp'], 49, 'tacacs'),
-        'tacacs-ds': Service(PROTOCOLS['tcp'], 65, 'tacacs-ds'),
-        'tacnews': Service(PROTOCOLS['tcp'], 98, 'tacnews'),
-        'tacticalauth': Service(PROTOCOLS['tcp'], 2392, 'tacticalauth'),
-        'taep-as-svc': Service(PROTOCOLS['tcp'], 5111, 'taep-as-svc'),
-        'tag-pm': Service(PROTOCOLS['tcp'], 5073, 'tag-pm'),
-        'tag-ups-1': Service(PROTOCOLS['tcp'], 3573, 'tag-ups-1'),
-        'taiclock': Service(PROTOCOLS['tcp'], 4014, 'taiclock'),
-        'tal-pod': Service(PROTOCOLS['tcp'], 6149, 'tal-pod'),
-        'talarian-mcast1': Service(PROTOCOLS['tcp'], 4015, 'talarian-mcast1'),
-        'talarian-mcast2': Service(PROTOCOLS['tcp'], 4016, 'talarian-mcast2'),
-        'talarian-mcast3': Service(PROTOCOLS['tcp'], 4017, 'talarian-mcast3'),
-        'talarian-mcast4': Service(PROTOCOLS['tcp'], 4018, 'talarian-mcast4'),
-        'talarian-mcast5': Service(PROTOCOLS['tcp'], 4019, 'talarian-mcast5'),
-        'talarian-mqs': Service(PROTOCOLS['tcp'], 2493, 'talarian-mqs'),
-        'talarian-tcp': Service(PROTOCOLS['tcp'], 5101, 'talarian-tcp'),
-        'taligent-lm': Service(PROTOCOLS['tcp'], 1475, 'taligent-lm'),
-        'talikaserver': Service(PROTOCOLS['tcp'], 22763, 'talikaserver'),
-        'talk': Service(PROTOCOLS['tcp'], 517, 'talk'),
-        'talnet': Service(PROTOCOLS['tcp'], 1838, 'talnet'),
-        'talon-disc': Service(PROTOCOLS['tcp'], 7011, 'talon-disc'),
-        'talon-engine': Service(PROTOCOLS['tcp'], 7012, 'talon-engine'),
-        'talon-webserver': Service(PROTOCOLS['tcp'], 7015, 'talon-webserver'),
-        'tambora': Service(PROTOCOLS['tcp'], 9020, 'tambora'),
-        'tams': Service(PROTOCOLS['tcp'], 2726, 'tams'),
-        'tapestry': Service(PROTOCOLS['tcp'], 1922, 'tapestry'),
-        'tapeware': Service(PROTOCOLS['tcp'], 3817, 'tapeware'),
-        'tappi-boxnet': Service(PROTOCOLS['tcp'], 2306, 'tappi-boxnet'),
-        'tarantella': Service(PROTOCOLS['tcp'], 3144, 'tarantella'),
-        'targus-getdata': Service(PROTOCOLS['tcp'], 5200, 'targus-getdata'),
-        'targus-getdata1': Service(PROTOCOLS['tcp'], 5201, 'targus-getdata1'),
-        'targus-getdata2': Service(PROTOCOLS['tcp'], 5202, 'targus-getdata2'),
-        'targus-getdata3': Service(PROTOCOLS['tcp'], 5203, 'targus-getdata3'),
-        'tarp': Service(PROTOCOLS['tcp'], 6442, 'tarp'),
-        'taserver': Service(PROTOCOLS['tcp'], 3552, 'taserver'),
-        'taskman-port': Service(PROTOCOLS['tcp'], 2470, 'taskman-port'),
-        'taskmaster2000': Service(PROTOCOLS['tcp'], 2403, 'taskmaster2000'),
-        'tasp-net': Service(PROTOCOLS['tcp'], 25900, 'tasp-net'),
-        'taurus-wh': Service(PROTOCOLS['tcp'], 1610, 'taurus-wh'),
-        'tbrpf': Service(PROTOCOLS['tcp'], 712, 'tbrpf'),
-        'tcc-http': Service(PROTOCOLS['tcp'], 24680, 'tcc-http'),
-        'tcim-control': Service(PROTOCOLS['tcp'], 2729, 'tcim-control'),
-        'tclprodebugger': Service(PROTOCOLS['tcp'], 2576, 'tclprodebugger'),
-        'tcoaddressbook': Service(PROTOCOLS['tcp'], 1977, 'tcoaddressbook'),
-        'tcoflashagent': Service(PROTOCOLS['tcp'], 1975, 'tcoflashagent'),
-        'tcoregagent': Service(PROTOCOLS['tcp'], 1976, 'tcoregagent'),
-        'tcp-id-port': Service(PROTOCOLS['tcp'], 1999, 'tcp-id-port'),
-        'tcpdataserver': Service(PROTOCOLS['tcp'], 3805, 'tcpdataserver'),
-        'tcpmux': Service(PROTOCOLS['tcp'], 1, 'tcpmux'),
-        'tcpnethaspsrv': Service(PROTOCOLS['tcp'], 475, 'tcpnethaspsrv'),
-        'td-postman': Service(PROTOCOLS['tcp'], 1049, 'td-postman'),
-        'td-replica': Service(PROTOCOLS['tcp'], 268, 'td-replica'),
-        'td-service': Service(PROTOCOLS['tcp'], 267, 'td-service'),
-        'tdaccess': Service(PROTOCOLS['tcp'], 2910, 'tdaccess'),
-        'tdmoip': Service(PROTOCOLS['tcp'], 2142, 'tdmoip'),
-        'tdp-suite': Service(PROTOCOLS['tcp'], 1814, 'tdp-suite'),
-        'teamcoherence': Service(PROTOCOLS['tcp'], 9222, 'teamcoherence'),
-        'tec5-sdctp': Service(PROTOCOLS['tcp'], 9668, 'tec5-sdctp'),
-        'teedtap': Service(PROTOCOLS['tcp'], 559, 'teedtap'),
-        'tekpls': Service(PROTOCOLS['tcp'], 1946, 'tekpls'),
-        'telaconsole': Service(PROTOCOLS['tcp'], 5428, 'telaconsole'),
-        'telefinder': Service(PROTOCOLS['tcp'], 1474, 'telefinder'),
-        'telelpathattack': Service(PROTOCOLS['tcp'], 5011, 'telelpathattack'),
-        'telelpathstart': Service(PROTOCOLS['tcp'], 5010, 'telelpathstart'),
-        'teleniumdaemon': Service(PROTOCOLS['tcp'], 2060, 'teleniumdaemon'),
-        'telesis-licman': Service(PROTOCOLS['tcp'], 1380, 'telesis-licman'),
-        'telindus': Service(PROTOCOLS['tcp'], 1728, 'telindus'),
-        'tell': Service(PROTOCOLS['tcp'], 754, 'tell'),
-        'tellumat-nms': Service(PROTOCOLS['tcp'], 3549, 'tellumat-nms'),
-        'telnet': Service(PROTOCOLS['tcp'], 23, 'telnet'),
-        'telnetcpcd': Service(PROTOCOLS['tcp'], 3696, 'telnetcpcd'),
-        'telnets': Service(PROTOCOLS['tcp'], 992, 'telnets'),
-        'telops-lmd': Service(PROTOCOLS['tcp'], 7491, 'telops-lmd'),
-        'tempest-port': Service(PROTOCOLS['tcp'], 11600, 'tempest-port'),
-        'tempo': Service(PROTOCOLS['tcp'], 526, 'tempo'),
-        'tenfold': Service(PROTOCOLS['tcp'], 658, 'tenfold'),
-        'tentacle': Service(PROTOCOLS['tcp'], 41121, 'tentacle'),
-        'terabase': Service(PROTOCOLS['tcp'], 4000, 'terabase'),
-        'teradataordbms': Service(PROTOCOLS['tcp'], 8002, 'teradataordbms'),
-        'teredo': Service(PROTOCOLS['tcp'], 3544, 'teredo'),
-        'terminaldb': Service(PROTOCOLS['tcp'], 2018, 'terminaldb'),
-        'tesla-sys-msg': Service(PROTOCOLS['tcp'], 7631, 'tesla-sys-msg'),
-        'tetrinet': Service(PROTOCOLS['tcp'], 31457, 'tetrinet'),
-        'texai': Service(PROTOCOLS['tcp'], 5048, 'texai'),
-        'texar': Service(PROTOCOLS['tcp'], 333, 'texar'),
-        'tftp': Service(PROTOCOLS['tcp'], 69, 'tftp'),
-        'tftp-mcast': Service(PROTOCOLS['tcp'], 1758, 'tftp-mcast'),
-        'tftps': Service(PROTOCOLS['tcp'], 3713, 'tftps'),
-        'tgcconnect': Service(PROTOCOLS['tcp'], 4146, 'tgcconnect'),
-        'tgp': Service(PROTOCOLS['tcp'], 1223, 'tgp'),
-        'theta-lm': Service(PROTOCOLS['tcp'], 2296, 'theta-lm'),
-        'thingkit': Service(PROTOCOLS['tcp'], 4423, 'thingkit'),
-        'thrp': Service(PROTOCOLS['tcp'], 3963, 'thrp'),
-        'thrtx': Service(PROTOCOLS['tcp'], 4139, 'thrtx'),
-        'tht-treasure': Service(PROTOCOLS['tcp'], 1832, 'tht-treasure'),
-        'tibet-server': Service(PROTOCOLS['tcp'], 1407, 'tibet-server'),
-        'ticf-1': Service(PROTOCOLS['tcp'], 492, 'ticf-1'),
-        'ticf-2': Service(PROTOCOLS['tcp'], 493, 'ticf-2'),
-        'tick-port': Service(PROTOCOLS['tcp'], 3200, 'tick-port'),
-        'tidp': Service(PROTOCOLS['tcp'], 7548, 'tidp'),
-        'tiepie': Service(PROTOCOLS['tcp'], 5450, 'tiepie'),
-        'tig': Service(PROTOCOLS['tcp'], 3943, 'tig'),
-        'tigv2': Service(PROTOCOLS['tcp'], 4124, 'tigv2'),
-        'tile-ml': Service(PROTOCOLS['tcp'], 10261, 'tile-ml'),
-        'timbuktu': Service(PROTOCOLS['tcp'], 407, 'timbuktu'),
-        'timbuktu-srv1': Service(PROTOCOLS['tcp'], 1417, 'timbuktu-srv1'),
-        'timbuktu-srv2': Service(PROTOCOLS['tcp'], 1418, 'timbuktu-srv2'),
-        'timbuktu-srv3': Service(PROTOCOLS['tcp'], 1419, 'timbuktu-srv3'),
-        'timbuktu-srv4': Service(PROTOCOLS['tcp'], 1420, 'timbuktu-srv4'),
-        'time': Service(PROTOCOLS['tcp'], 37, 'time'),
-        'timed': Service(PROTOCOLS['tcp'], 525, 'timed'),
-        'timeflies': Service(PROTOCOLS['tcp'], 1362, 'timeflies'),
-        'timelot': Service(PROTOCOLS['tcp'], 3243, 'timelot'),
-        'timestenbroker': Service(PROTOCOLS['tcp'], 3754, 'timestenbroker'),
-        'tinc': Service(PROTOCOLS['tcp'], 655, 'tinc'),
-        'tip-app-server': Service(PROTOCOLS['tcp'], 3160, 'tip-app-server'),
-        'tip2': Service(PROTOCOLS['tcp'], 3372, 'tip2'),
-        'tivoconnect': Service(PROTOCOLS['tcp'], 2190, 'tivoconnect'),
-        'tivoli-npm': Service(PROTOCOLS['tcp'], 1965, 'tivoli-npm'),
-        'tksocket': Service(PROTOCOLS['tcp'], 2915, 'tksocket'),
-        'tl-ipcproxy': Service(PROTOCOLS['tcp'], 4176, 'tl-ipcproxy'),
-        'tl1': Service(PROTOCOLS['tcp'], 2361, 'tl1'),
-        'tl1-lv': Service(PROTOCOLS['tcp'], 3081, 'tl1-lv'),
-        'tl1-raw': Service(PROTOCOLS['tcp'], 3082, 'tl1-raw'),
-        'tl1-raw-ssl': Service(PROTOCOLS['tcp'], 6251, 'tl1-raw-ssl'),
-        'tl1-ssh': Service(PROTOCOLS['tcp'], 6252, 'tl1-ssh'),
-        'tl1-telnet': Service(PROTOCOLS['tcp'], 3083, 'tl1-telnet'),
-        'tlisrv': Service(PROTOCOLS['tcp'], 1527, 'tlisrv'),
-        'tmesis-upshot': Service(PROTOCOLS['tcp'], 2798, 'tmesis-upshot'),
-        'tmi': Service(PROTOCOLS['tcp'], 8300, 'tmi'),
-        'tmo-icon-sync': Service(PROTOCOLS['tcp'], 5583, 'tmo-icon-sync'),
-        'tmophl7mts': Service(PROTOCOLS['tcp'], 20046, 'tmophl7mts'),
-        'tmosms0': Service(PROTOCOLS['tcp'], 5580, 'tmosms0'),
-        'tmosms1': Service(PROTOCOLS['tcp'], 5581, 'tmosms1'),
-        'tn-timing': Service(PROTOCOLS['tcp'], 2739, 'tn-timing'),
-        'tn-tl-fd1': Service(PROTOCOLS['tcp'], 476, 'tn-tl-fd1'),
-        'tn-tl-fd2': Service(PROTOCOLS['tcp'], 1584, 'tn-tl-fd2'),
-        'tn-tl-r1': Service(PROTOCOLS['tcp'], 1580, 'tn-tl-r1'),
-        'tn-tl-w1': Service(PROTOCOLS['tcp'], 474, 'tn-tl-w1'),
-        'tnetos': Service(PROTOCOLS['tcp'], 377, 'tnetos'),
-        'tnmpv2': Service(PROTOCOLS['tcp'], 3686, 'tnmpv2'),
-        'tnos-dp': Service(PROTOCOLS['tcp'], 7902, 'tnos-dp'),
-        'tnos-dps': Service(PROTOCOLS['tcp'], 7903, 'tnos-dps'),
-        'tnos-sp': Service(PROTOCOLS['tcp'], 7901, 'tnos-sp'),
-        'tnp': Service(PROTOCOLS['tcp'], 8321, 'tnp'),
-        'tnp-discover': Service(PROTOCOLS['tcp'], 8320, 'tnp-discover'),
-        'tnp1-port': Service(PROTOCOLS['tcp'], 4024, 'tnp1-port'),
-        'tns-adv': Service(PROTOCOLS['tcp'], 3309, 'tns-adv'),
-        'tns-cml': Service(PROTOCOLS['tcp'], 590, 'tns-cml'),
-        'tns-server': Service(PROTOCOLS['tcp'], 3308, 'tns-server'),
-        'toad': Service(PROTOCOLS['tcp'], 2669, 'toad'),
-        'toad-bi-appsrvr': Service(PROTOCOLS['tcp'], 8066, 'toad-bi-appsrvr'),
-        'tolfab': Service(PROTOCOLS['tcp'], 20167, 'tolfab'),
-        'tolteces': Service(PROTOCOLS['tcp'], 4375, 'tolteces'),
-        'tomato-springs': Service(PROTOCOLS['tcp'], 3040, 'tomato-springs'),
-        'tonidods': Service(PROTOCOLS['tcp'], 24465, 'tonidods'),
-        'topflow': Service(PROTOCOLS['tcp'], 2885, 'topflow'),
-        'topflow-ssl': Service(PROTOCOLS['tcp'], 3885, 'topflow-ssl'),
-        'topovista-data': Service(PROTOCOLS['tcp'], 3906, 'topovista-data'),
-        'topx': Service(PROTOCOLS['tcp'], 2436, 'topx'),
-        'toruxserver': Service(PROTOCOLS['tcp'], 5153, 'toruxserver'),
-        'touchnetplus': Service(PROTOCOLS['tcp'], 2158, 'touchnetplus'),
-        'tpcsrvr': Service(PROTOCOLS['tcp'], 2078, 'tpcsrvr'),
-        'tpdu': Service(PROTOCOLS['tcp'], 1430, 'tpdu'),
-        'tpip': Service(PROTOCOLS['tcp'], 594, 'tpip'),
-        'tpmd': Service(PROTOCOLS['tcp'], 1906, 'tpmd'),
-        'tqdata': Service(PROTOCOLS['tcp'], 2700, 'tqdata'),
-        'tr-rsrb-p1': Service(PROTOCOLS['tcp'], 1987, 'tr-rsrb-p1'),
-        'tr-rsrb-p2': Service(PROTOCOLS['tcp'], 1988, 'tr-rsrb-p2'),
-        'tr-rsrb-p3': Service(PROTOCOLS['tcp'], 1989, 'tr-rsrb-p3'),
-        'tr-rsrb-port': Service(PROTOCOLS['tcp'], 1996, 'tr-rsrb-port'),
-        'traceroute': Service(PROTOCOLS['tcp'], 33434, 'traceroute'),
-        'track': Service(PROTOCOLS['tcp'], 20670, 'track'),
-        'tragic': Service(PROTOCOLS['tcp'], 2642, 'tragic'),
-        'tram': Service(PROTOCOLS['tcp'], 4567, 'tram'),
-        'transact': Service(PROTOCOLS['tcp'], 1869, 'transact'),
-        'transmit-port': Service(PROTOCOLS['tcp'], 5282, 'transmit-port'),
-        'trap': Service(PROTOCOLS['tcp'], 4020, 'trap'),
-        'trap-daemon': Service(PROTOCOLS['tcp'], 3600, 'trap-daemon'),
-        'trap-port': Service(PROTOCOLS['tcp'], 3857, 'trap-port'),
-        'trap-port-mom': Service(PROTOCOLS['tcp'], 3858, 'trap-port-mom'),
-        'traversal': Service(PROTOCOLS['tcp'], 4678, 'traversal'),
-        'travsoft-ipx-t': Service(PROTOCOLS['tcp'], 2644, 'travsoft-ipx-t'),
-        'trc-netpoll': Service(PROTOCOLS['tcp'], 2405, 'trc-netpoll'),
-        'trdp-md': Service(PROTOCOLS['tcp'], 17225, 'trdp-md'),
-        'treehopper': Service(PROTOCOLS['tcp'], 3959, 'treehopper'),
-        'trendchip-dcp': Service(PROTOCOLS['tcp'], 3608, 'trendchip-dcp'),
-        'tributary': Service(PROTOCOLS['tcp'], 2580, 'tributary'),
-        'trident-data': Service(PROTOCOLS['tcp'], 7727, 'trident-data'),
-        'trim': Service(PROTOCOLS['tcp'], 1137, 'trim'),
-        'trim-event': Service(PROTOCOLS['tcp'], 4322, 'trim-event'),
-        'trim-ice': Service(PROTOCOLS['tcp'], 4323, 'trim-ice'),
-        'trinity-dist': Service(PROTOCOLS['tcp'], 4711, 'trinity-dist'),
-        'trinket-agent': Service(PROTOCOLS['tcp'], 21212, 'trinket-agent'),
-        'triomotion': Service(PROTOCOLS['tcp'], 3240, 'triomotion'),
-        'trip': Service(PROTOCOLS['tcp'], 6069, 'trip'),
-        'tripe': Service(PROTOCOLS['tcp'], 4070, 'tripe'),
-        'tripwire': Service(PROTOCOLS['tcp'], 1169, 'tripwire'),
-        'triquest-lm': Service(PROTOCOLS['tcp'], 1588, 'triquest-lm'),
-        'trisoap': Service(PROTOCOLS['tcp'], 10200, 'trisoap'),
-        'trispen-sra': Service(PROTOCOLS['tcp'], 9555, 'trispen-sra'),
-        'tritium-can': Service(PROTOCOLS['tcp'], 4876, 'tritium-can'),
-        'trivnet1': Service(PROTOCOLS['tcp'], 8200, 'trivnet1'),
-        'trivnet2': Service(PROTOCOLS['tcp'], 8201, 'trivnet2'),
-        'trnsprntproxy': Service(PROTOCOLS['tcp'], 3346, 'trnsprntproxy'),
-        'troff': Service(PROTOCOLS['tcp'], 2014, 'troff'),
-        'trp': Service(PROTOCOLS['tcp'], 2156, 'trp'),
-        'truckstar': Service(PROTOCOLS['tcp'], 4725, 'truckstar'),
-        'truecm': Service(PROTOCOLS['tcp'], 8804, 'truecm'),
-        'trueconf': Service(PROTOCOLS['tcp'], 4307, 'trueconf'),
-        'trusted-web': Service(PROTOCOLS['tcp'], 3011, 'trusted-web'),
-        'trustestablish': Service(PROTOCOLS['tcp'], 2573, 'trustestablish'),
-        'tsa': Service(PROTOCOLS['tcp'], 6689, 'tsa'),
-        'tsaf': Service(PROTOCOLS['tcp'], 12753, 'tsaf'),
-        'tsb': Service(PROTOCOLS['tcp'], 2741, 'tsb'),
-        'tsb2': Service(PROTOCOLS['tcp'], 2742, 'tsb2'),
-        'tscchat': Service(PROTOCOLS['tcp'], 2330, 'tscchat'),
-        'tsdos390': Service(PROTOCOLS['tcp'], 1237, 'tsdos390'),
-        'tsepisp': Service(PROTOCOLS['tcp'], 4422, 'tsepisp'),
-        'tserver': Service(PROTOCOLS['tcp'], 450, 'tserver'),
-        'tsilb': Service(PROTOCOLS['tcp'], 2489, 'tsilb'),
-        'tsp': Service(PROTOCOLS['tcp'], 3653, 'tsp'),
-        'tsrmagt': Service(PROTOCOLS['tcp'], 2077, 'tsrmagt'),
-        'tsspmap': Service(PROTOCOLS['tcp'], 1568, 'tsspmap'),
-        'ttat3lb': Service(PROTOCOLS['tcp'], 3579, 'ttat3lb'),
-        'ttc': Service(PROTOCOLS['tcp'], 2483, 'ttc'),
-        'ttc-etap': Service(PROTOCOLS['tcp'], 2675, 'ttc-etap'),
-        'ttc-etap-ds': Service(PROTOCOLS['tcp'], 2978, 'ttc-etap-ds'),
-        'ttc-etap-ns': Service(PROTOCOLS['tcp'], 2977, 'ttc-etap-ns'),
-        'ttc-ssl': Service(PROTOCOLS['tcp'], 2484, 'ttc-ssl'),
-        'ttcmremotectrl': Service(PROTOCOLS['tcp'], 3468, 'ttcmremotectrl'),
-        'ttg-protocol': Service(PROTOCOLS['tcp'], 2862, 'ttg-protocol'),
-        'ttl-publisher': Service(PROTOCOLS['tcp'], 5462, 'ttl-publisher'),
-        'ttlpriceproxy': Service(PROTOCOLS['tcp'], 5463, 'ttlpriceproxy'),
-        'ttnrepository': Service(PROTOCOLS['tcp'], 2943, 'ttnrepository'),
-        'ttntspauto': Service(PROTOCOLS['tcp'], 3474, 'ttntspauto'),
-        'ttyinfo': Service(PROTOCOLS['tcp'], 2012, 'ttyinfo'),
-        'tunalyzer': Service(PROTOCOLS['tcp'], 5748, 'tunalyzer'),
-        'tunatic': Service(PROTOCOLS['tcp'], 5747, 'tunatic'),
-        'tungsten-http': Service(PROTOCOLS['tcp'], 9762, 'tungsten-http'),
-        'tungsten-https': Service(PROTOCOLS['tcp'], 9443, 'tungsten-https'),
-        'tunnel': Service(PROTOCOLS['tcp'], 604, 'tunnel'),
-        'tunstall-lwp': Service(PROTOCOLS['tcp'], 5197, 'tunstall-lwp'),
-        'tunstall-pnc': Service(PROTOCOLS['tcp'], 1846, 'tunstall-pnc'),
-        'turbonote-1': Service(PROTOCOLS['tcp'], 39681, 'turbonote-1'),
-        'turbonote-2': Service(PROTOCOLS['tcp'], 34249, 'turbonote-2'),
-        'turn': Service(PROTOCOLS['tcp'], 3478, 'turn'),
-        'turns': Service(PROTOCOLS['tcp'], 5349, 'turns'),
-        'tvbus': Service(PROTOCOLS['tcp'], 2191, 'tvbus'),
-        'tvdumtray-port': Service(PROTOCOLS['tcp'], 3492, 'tvdumtray-port'),
-        'tve-announce': Service(PROTOCOLS['tcp'], 2670, 'tve-announce'),
-        'tvnetworkvideo': Service(PROTOCOLS['tcp'], 3791, 'tvnetworkvideo'),
-        'tvpm': Service(PROTOCOLS['tcp'], 21800, 'tvpm'),
-        'tw-auth-key': Service(PROTOCOLS['tcp'], 27999, 'tw-auth-key'),
-        'twamp-control': Service(PROTOCOLS['tcp'], 862, 'twamp-control'),
-        'twcss': Service(PROTOCOLS['tcp'], 3428, 'twcss'),
-        'twds': Service(PROTOCOLS['tcp'], 8937, 'twds'),
-        'twrpc': Service(PROTOCOLS['tcp'], 3479, 'twrpc'),
-        'twsdss': Service(PROTOCOLS['tcp'], 3012, 'twsdss'),
-        'u-dbap': Service(PROTOCOLS['tcp'], 3584, 'u-dbap'),
-        'ua-secureagent': Service(PROTOCOLS['tcp'], 19194, 'ua-secureagent'),
-        'uaac': Service(PROTOCOLS['tcp'], 145, 'uaac'),
-        'uacs': Service(PROTOCOLS['tcp'], 2768, 'uacs'),
-        'uadtc': Service(PROTOCOLS['tcp'], 2767, 'uadtc'),
-        'uaiact': Service(PROTOCOLS['tcp'], 1470, 'uaiact'),
-        'uarps': Service(PROTOCOLS['tcp'], 219, 'uarps'),
-        'ub-dns-control': Service(PROTOCOLS['tcp'], 8953, 'ub-dns-control'),
-        'ubroker': Service(PROTOCOLS['tcp'], 7887, 'ubroker'),
-        'ubxd': Service(PROTOCOLS['tcp'], 4034, 'ubxd'),
-        'ucentric-ds': Service(PROTOCOLS['tcp'], 2879, 'ucentric-ds'),
-        'ucontrol': Service(PROTOCOLS['tcp'], 13894, 'ucontrol'),
-        'ucs-isc': Service(PROTOCOLS['tcp'], 8070, 'ucs-isc'),
-        'udp-sr-port': Service(PROTOCOLS['tcp'], 1624, 'udp-sr-port'),
-        'udpradio': Service(PROTOCOLS['tcp'], 1833, 'udpradio'),
-        'udrawgraph': Service(PROTOCOLS['tcp'], 2542, 'udrawgraph'),
-        'udrive': Service(PROTOCOLS['tcp'], 1867, 'udrive'),
-        'udt-os': Service(PROTOCOLS['tcp'], 3900, 'udt-os'),
-        'udt_os': Service(PROTOCOLS['tcp'], 3900, 'udt_os'),
-        'uec': Service(PROTOCOLS['tcp'], 8778, 'uec'),
-        'ufastro-instr': Service(PROTOCOLS['tcp'], 3720, 'ufastro-instr'),
-        'ufmp': Service(PROTOCOLS['tcp'], 6306, 'ufmp'),
-        'uis': Service(PROTOCOLS['tcp'], 390, 'uis'),
-        'ulistproc': Service(PROTOCOLS['tcp'], 372, 'ulistproc'),
-        'ulp': Service(PROTOCOLS['tcp'], 522, 'ulp'),
-        'ulpnet': Service(PROTOCOLS['tcp'], 483, 'ulpnet'),
-        'ultimad': Service(PROTOCOLS['tcp'], 1737, 'ultimad'),
-        'ultrabac': Service(PROTOCOLS['tcp'], 1910, 'ultrabac'),
-        'ultraseek-http': Service(PROTOCOLS['tcp'], 8765, 'ultraseek-http'),
-        'ultrex': Service(PROTOCOLS['tcp'], 1327, 'ultrex'),
-        'uma': Service(PROTOCOLS['tcp'], 1797, 'uma'),
-        'umm-port': Service(PROTOCOLS['tcp'], 3098, 'umm-port'),
-        'ums': Service(PROTOCOLS['tcp'], 2248, 'ums'),
-        'umsp': Service(PROTOCOLS['tcp'], 2110, 'umsp'),
-        'unbind-cluster': Service(PROTOCOLS['tcp'], 2138, 'unbind-cluster'),
-        'undo-lm': Service(PROTOCOLS['tcp'], 5281, 'undo-lm'),
-        'unet': Service(PROTOCOLS['tcp'], 1189, 'unet'),
-        'unglue': Service(PROTOCOLS['tcp'], 2655, 'unglue'),
-        'unicall': Service(PROTOCOLS['tcp'], 4343, 'unicall'),
-        'unicontrol': Service(PROTOCOLS['tcp'], 2499, 'unicontrol'),
-        'unidata-ldm': Service(PROTOCOLS['tcp'], 388, 'unidata-ldm'),
-        'unieng': Service(PROTOCOLS['tcp'], 5730, 'unieng'),
-        'unify': Service(PROTOCOLS['tcp'], 181, 'unify'),
-        'unify-adapter': Service(PROTOCOLS['tcp'], 1889, 'unify-adapter'),
-        'unify-debug': Service(PROTOCOLS['tcp'], 4867, 'unify-debug'),
-        'unifyadmin': Service(PROTOCOLS['tcp'], 2696, 'unifyadmin'),
-        'unihub-server': Service(PROTOCOLS['tcp'], 2357, 'unihub-server'),
-        'unikeypro': Service(PROTOCOLS['tcp'], 4127, 'unikeypro'),
-        'unimobilectrl': Service(PROTOCOLS['tcp'], 2927, 'unimobilectrl'),
-        'uniport': Service(PROTOCOLS['tcp'], 9629, 'uniport'),
-        'unisql': Service(PROTOCOLS['tcp'], 1978, 'unisql'),
-        'unisql-java': Service(PROTOCOLS['tcp'], 1979, 'unisql-java'),
-        'unisys-eportal': Service(PROTOCOLS['tcp'], 37654, 'unisys-eportal'),
-        'unisys-lm': Service(PROTOCOLS['tcp'], 1823, 'unisys-lm'),
-        'unite': Service(PROTOCOLS['tcp'], 3217, 'unite'),
-        'univ-appserver': Service(PROTOCOLS['tcp'], 1233, 'univ-appserver'),
-        'universe-suite': Service(PROTOCOLS['tcp'], 4184, 'universe-suite'),
-        'universe_suite': Service(PROTOCOLS['tcp'], 4184, 'universe_suite'),
-        'univision': Service(PROTOCOLS['tcp'], 2820, 'univision'),
-        'unix-status': Service(PROTOCOLS['tcp'], 1957, 'unix-status'),
-        'unizensus': Service(PROTOCOLS['tcp'], 1151, 'unizensus'),
-        'unot': Service(PROTOCOLS['tcp'], 5055, 'unot'),
-        'uohost': Service(PROTOCOLS['tcp'], 3314, 'uohost'),
-        'uorb': Service(PROTOCOLS['tcp'], 3313, 'uorb'),
-        'updog': Service(PROTOCOLS['tcp'], 4414, 'updog'),
-        'upgrade': Service(PROTOCOLS['tcp'], 2537, 'upgrade'),
-        'upnotifyp': Service(PROTOCOLS['tcp'], 4445, 'upnotifyp'),
-        'upnotifyps': Service(PROTOCOLS['tcp'], 3356, 'upnotifyps'),
-        'ups': Service(PROTOCOLS['tcp'], 401, 'ups'),
-        'ups-engine': Service(PROTOCOLS['tcp'], 3664, 'ups-engine'),
-        'ups-onlinet': Service(PROTOCOLS['tcp'], 7010, 'ups-onlinet'),
-        'upsnotifyprot': Service(PROTOCOLS['tcp'], 2648, 'upsnotifyprot'),
-        'upstriggervsw': Service(PROTOCOLS['tcp'], 3786, 'upstriggervsw'),
-        'urbisnet': Service(PROTOCOLS['tcp'], 2745, 'urbisnet'),
-        'urd': Service(PROTOCOLS['tcp'], 465, 'urd'),
-        'urld-port': Service(PROTOCOLS['tcp'], 3534, 'urld-port'),
-        'urm': Service(PROTOCOLS['tcp'], 606, 'urm'),
-        'us-cli': Service(PROTOCOLS['tcp'], 8082, 'us-cli'),
-        'us-gv': Service(PROTOCOLS['tcp'], 1370, 'us-gv'),
-        'us-srv': Service(PROTOCOLS['tcp'], 8083, 'us-srv'),
-        'user-manager': Service(PROTOCOLS['tcp'], 3272, 'user-manager'),
-        'utcd': Service(PROTOCOLS['tcp'], 1506, 'utcd'),
-        'utime': Service(PROTOCOLS['tcp'], 519, 'utime'),
-        'utmpcd': Service(PROTOCOLS['tcp'], 431, 'utmpcd'),
-        'utmpsd': Service(PROTOCOLS['tcp'], 430, 'utmpsd'),
-        'utsftp': Service(PROTOCOLS['tcp'], 2529, 'utsftp'),
-        'uucp': Service(PROTOCOLS['tcp'], 540, 'uucp'),
-        'uucp-path': Service(PROTOCOLS['tcp'], 117, 'uucp-path'),
-        'uucp-rlogin': Service(PROTOCOLS['tcp'], 541, 'uucp-rlogin'),
-        'uuidgen': Service(PROTOCOLS['tcp'], 697, 'uuidgen'),
-        'v-one-spp': Service(PROTOCOLS['tcp'], 3845, 'v-one-spp'),
-        'v5ua': Service(PROTOCOLS['tcp'], 5675, 'v5ua'),
-        'va-pacbase': Service(PROTOCOLS['tcp'], 3676, 'va-pacbase'),
-        'vacdsm-app': Service(PROTOCOLS['tcp'], 671, 'vacdsm-app'),
-        'vacdsm-sws': Service(PROTOCOLS['tcp'], 670, 'vacdsm-sws'),
-        'vad': Service(PROTOCOLS['tcp'], 14154, 'vad'),
-        'valisys-lm': Service(PROTOCOLS['tcp'], 1457, 'valisys-lm'),
-        'vantronix-mgmt': Service(PROTOCOLS['tcp'], 8034, 'vantronix-mgmt'),
-        'vaprtm': Service(PROTOCOLS['tcp'], 3654, 'vaprtm'),
-        'varadero-0': Service(PROTOCOLS['tcp'], 4837, 'varadero-0'),
-        'varadero-1': Service(PROTOCOLS['tcp'], 4838, 'varadero-1'),
-        'varadero-2': Service(PROTOCOLS['tcp'], 4839, 'varadero-2'),
-        'vat': Service(PROTOCOLS['tcp'], 3456, 'vat'),
-        'vat-control': Service(PROTOCOLS['tcp'], 3457, 'vat-control'),
-        'vatata': Service(PROTOCOLS['tcp'], 4188, 'vatata'),
-        'vatp': Service(PROTOCOLS['tcp'], 690, 'vatp'),
-        'vaultbase': Service(PROTOCOLS['tcp'], 1771, 'vaultbase'),
-        'vce': Service(PROTOCOLS['tcp'], 11111, 'vce'),
-        'vchat': Service(PROTOCOLS['tcp'], 1168, 'vchat'),
-        'vcmp': Service(PROTOCOLS['tcp'], 2426, 'vcmp'),
-        'vcnet-link-v10': Service(PROTOCOLS['tcp'], 2554, 'vcnet-link-v10'),
-        'vcom-tunnel': Service(PROTOCOLS['tcp'], 8001, 'vcom-tunnel'),
-        'vcrp': Service(PROTOCOLS['tcp'], 3073, 'vcrp'),
-        'vcs-app': Service(PROTOCOLS['tcp'], 14141, 'vcs-app'),
-        'vcscmd': Service(PROTOCOLS['tcp'], 14150, 'vcscmd'),
-        'vdab': Service(PROTOCOLS['tcp'], 1775, 'vdab'),
-        'vdmmesh': Service(PROTOCOLS['tcp'], 18668, 'vdmmesh'),
-        'vdmplay': Service(PROTOCOLS['tcp'], 1707, 'vdmplay'),
-        'vemmi': Service(PROTOCOLS['tcp'], 575, 'vemmi'),
-        'venus': Service(PROTOCOLS['tcp'], 2430, 'venus'),
-        'venus-se': Service(PROTOCOLS['tcp'], 2431, 'venus-se'),
-        'veracity': Service(PROTOCOLS['tcp'], 1062, 'veracity'),
-        'vergencecm': Service(PROTOCOLS['tcp'], 2771, 'vergencecm'),
-        'verismart': Service(PROTOCOLS['tcp'], 3270, 'verismart'),
-        'veritas-pbx': Service(PROTOCOLS['tcp'], 1556, 'veritas-pbx'),
-        'veritas-tcp1': Service(PROTOCOLS['tcp'], 2802, 'veritas-tcp1'),
-        'veritas-ucl': Service(PROTOCOLS['tcp'], 2148, 'veritas-ucl'),
-        'veritas-vis1': Service(PROTOCOLS['tcp'], 2993, 'veritas-vis1'),
-        'veritas-vis2': Service(PROTOCOLS['tcp'], 2994, 'veritas-vis2'),
-        'veritas_pbx': Service(PROTOCOLS['tcp'], 1556, 'veritas_pbx'),
-        'veronica': Service(PROTOCOLS['tcp'], 2770, 'veronica'),
-        'versa-tek': Service(PROTOCOLS['tcp'], 2610, 'versa-tek'),
-        'versatalk': Service(PROTOCOLS['tcp'], 3738, 'versatalk'),
-        'versiera': Service(PROTOCOLS['tcp'], 9050, 'versiera'),
-        'vestasdlp': Service(PROTOCOLS['tcp'], 17184, 'vestasdlp'),
-        'vettcp': Service(PROTOCOLS['tcp'], 78, 'vettcp'),
-        'vfbp': Service(PROTOCOLS['tcp'], 6678, 'vfbp'),
-        'vfmobile': Service(PROTOCOLS['tcp'], 5646, 'vfmobile'),
-        'vfo': Service(PROTOCOLS['tcp'], 1056, 'vfo'),
-        'vhd': Service(PROTOCOLS['tcp'], 3802, 'vhd'),
-        'vid': Service(PROTOCOLS['tcp'], 769, 'vid'),
-        'video-activmail': Service(PROTOCOLS['tcp'], 1398, 'video-activmail'),
-        'videobeans': Service(PROTOCOLS['tcp'], 3058, 'videobeans'),
-        'videotex': Service(PROTOCOLS['tcp'], 516, 'videotex'),
-        'videte-cipc': Service(PROTOCOLS['tcp'], 1927, 'videte-cipc'),
-        'vidigo': Service(PROTOCOLS['tcp'], 3231, 'vidigo'),
-        'vids-avtp': Service(PROTOCOLS['tcp'], 1853, 'vids-avtp'),
-        'vieo-fe': Service(PROTOCOLS['tcp'], 3245, 'vieo-fe'),
-        'vinainstall': Service(PROTOCOLS['tcp'], 4344, 'vinainstall'),
-        'vipera': Service(PROTOCOLS['tcp'], 12012, 'vipera'),
-        'vipera-ssl': Service(PROTOCOLS['tcp'], 12013, 'vipera-ssl'),
-        'vipremoteagent': Service(PROTOCOLS['tcp'], 3752, 'vipremoteagent'),
-        'virprot-lm': Service(PROTOCOLS['tcp'], 7121, 'virprot-lm'),
-        'virtual-places': Service(PROTOCOLS['tcp'], 1533, 'virtual-places'),
-        'virtual-time': Service(PROTOCOLS['tcp'], 1852, 'virtual-time'),
-        'virtualtape': Service(PROTOCOLS['tcp'], 2386, 'virtualtape'),
-        'virtualuser': Service(PROTOCOLS['tcp'], 5423, 'virtualuser'),
-        'visd': Service(PROTOCOLS['tcp'], 9284, 'visd'),
-        'visinet-gui': Service(PROTOCOLS['tcp'], 3601, 'visinet-gui'),
-        'vision-elmd': Service(PROTOCOLS['tcp'], 6673, 'vision-elmd'),
-        'vision-server': Service(PROTOCOLS['tcp'], 6672, 'vision-server'),
-        'vision_elmd': Service(PROTOCOLS['tcp'], 6673, 'vision_elmd'),
-        'vision_server': Service(PROTOCOLS['tcp'], 6672, 'vision_server'),
-        'visionpyramid': Service(PROTOCOLS['tcp'], 1247, 'visionpyramid'),
-        'visitview': Service(PROTOCOLS['tcp'], 1631, 'visitview'),
-        'vista-4gl': Service(PROTOCOLS['tcp'], 24249, 'vista-4gl'),
-        'vistium-share': Service(PROTOCOLS['tcp'], 1545, 'vistium-share'),
-        'visweather': Service(PROTOCOLS['tcp'], 9979, 'visweather'),
-        'vitalanalysis': Service(PROTOCOLS['tcp'], 2474, 'vitalanalysis'),
-        'viziblebrowser': Service(PROTOCOLS['tcp'], 1868, 'viziblebrowser'),
-        'vlsi-lm': Service(PROTOCOLS['tcp'], 1500, 'vlsi-lm'),
-        'vmnet': Service(PROTOCOLS['tcp'], 175, 'vmnet'),
-        'vmodem': Service(PROTOCOLS['tcp'], 3141, 'vmodem'),
-        'vmpwscs': Service(PROTOCOLS['tcp'], 214, 'vmpwscs'),
-        'vmrdp': Service(PROTOCOLS['tcp'], 2179, 'vmrdp'),
-        'vmsvc': Service(PROTOCOLS['tcp'], 7024, 'vmsvc'),
-        'vmsvc-2': Service(PROTOCOLS['tcp'], 7025, 'vmsvc-2'),
-        'vmware-fdm': Service(PROTOCOLS['tcp'], 8182, 'vmware-fdm'),
-        'vnas': Service(PROTOCOLS['tcp'], 577, 'vnas'),
-        'vnetd': Service(PROTOCOLS['tcp'], 13724, 'vnetd'),
-        'vnsstr': Service(PROTOCOLS['tcp'], 3321, 'vnsstr'),
-        'vnwk-prapi': Service(PROTOCOLS['tcp'], 2538, 'vnwk-prapi'),
-        'vnyx': Service(PROTOCOLS['tcp'], 8699, 'vnyx'),
-        'vocaltec-admin': Service(PROTOCOLS['tcp'], 1796, 'vocaltec-admin'),
-        'vocaltec-gold': Service(PROTOCOLS['tcp'], 6670, 'vocaltec-gold'),
-        'vocaltec-hos': Service(PROTOCOLS['tcp'], 25793, 'vocaltec-hos'),
-        'vocaltec-wconf': Service(PROTOCOLS['tcp'], 22555, 'vocaltec-wconf'),
-        'vofr-gateway': Service(PROTOCOLS['tcp'], 21590, 'vofr-gateway'),
-        'voispeed-port': Service(PROTOCOLS['tcp'], 3541, 'voispeed-port'),
-        'volley': Service(PROTOCOLS['tcp'], 3625, 'volley'),
-        'vop': Service(PROTOCOLS['tcp'], 4433, 'vop'),
-        'vopied': Service(PROTOCOLS['tcp'], 13783, 'vopied'),
-        'voxelstorm': Service(PROTOCOLS['tcp'], 28200, 'voxelstorm'),
-        'vp2p': Service(PROTOCOLS['tcp'], 8473, 'vp2p'),
-        'vpa': Service(PROTOCOLS['tcp'], 5164, 'vpa'),
-        'vpac': Service(PROTOCOLS['tcp'], 1517, 'vpac'),
-        'vpad': Service(PROTOCOLS['tcp'], 1516, 'vpad'),
-        'vpjp': Service(PROTOCOLS['tcp'], 1345, 'vpjp'),
-        'vpnz': Service(PROTOCOLS['tcp'], 1224, 'vpnz'),
-        'vpp': Service(PROTOCOLS['tcp'], 677, 'vpp'),
-        'vpps-qua': Service(PROTOCOLS['tcp'], 672, 'vpps-qua'),
-        'vpps-via': Service(PROTOCOLS['tcp'], 676, 'vpps-via'),
-        'vpsipport': Service(PROTOCOLS['tcp'], 2649, 'vpsipport'),
-        'vpvc': Service(PROTOCOLS['tcp'], 1519, 'vpvc'),
-        'vpvd': Service(PROTOCOLS['tcp'], 1518, 'vpvd'),
-        'vqp': Service(PROTOCOLS['tcp'], 1589, 'vqp'),
-        'vrace': Service(PROTOCOLS['tcp'], 9300, 'vrace'),
-        'vrcommerce': Service(PROTOCOLS['tcp'], 2530, 'vrcommerce'),
-        'vrpn': Service(PROTOCOLS['tcp'], 3883, 'vrpn'),
-        'vrt': Service(PROTOCOLS['tcp'], 4991, 'vrt'),
-        'vrtl-vmf-ds': Service(PROTOCOLS['tcp'], 1956, 'vrtl-vmf-ds'),
-        'vrtl-vmf-sa': Service(PROTOCOLS['tcp'], 2074, 'vrtl-vmf-sa'),
-        'vrtp': Service(PROTOCOLS['tcp'], 2255, 'vrtp'),
-        'vrts-at-port': Service(PROTOCOLS['tcp'], 2821, 'vrts-at-port'),
-        'vrts-auth-port': Service(PROTOCOLS['tcp'], 4032, 'vrts-auth-port'),
-        'vrts-ipcserver': Service(PROTOCOLS['tcp'], 1317, 'vrts-ipcserver'),
-        'vrts-registry': Service(PROTOCOLS['tcp'], 2410, 'vrts-registry'),
-        'vrts-tdd': Service(PROTOCOLS['tcp'], 14149, 'vrts-tdd'),
-        'vrtstrapserver': Service(PROTOCOLS['tcp'], 1885, 'vrtstrapserver'),
-        'vrxpservman': Service(PROTOCOLS['tcp'], 4147, 'vrxpservman'),
-        'vs-server': Service(PROTOCOLS['tcp'], 3280, 'vs-server'),
-        'vsaiport': Service(PROTOCOLS['tcp'], 3317, 'vsaiport'),
-        'vsamredirector': Service(PROTOCOLS['tcp'], 2387, 'vsamredirector'),
-        'vsat-control': Service(PROTOCOLS['tcp'], 1880, 'vsat-control'),
-        'vscp': Service(PROTOCOLS['tcp'], 9598, 'vscp'),
-        'vseconnector': Service(PROTOCOLS['tcp'], 2893, 'vseconnector'),
-        'vsi-omega': Service(PROTOCOLS['tcp'], 7566, 'vsi-omega'),
-        'vsiadmin': Service(PROTOCOLS['tcp'], 2539, 'vsiadmin'),
-        'vsinet': Service(PROTOCOLS['tcp'], 996, 'vsinet'),
-        'vsixml': Service(PROTOCOLS['tcp'], 2996, 'vsixml'),
-        'vslmp': Service(PROTOCOLS['tcp'], 312, 'vslmp'),
-        'vsnm-agent': Service(PROTOCOLS['tcp'], 3375, 'vsnm-agent'),
-        'vspread': Service(PROTOCOLS['tcp'], 2695, 'vspread'),
-        'vstat': Service(PROTOCOLS['tcp'], 7779, 'vstat'),
-        'vt-ssl': Service(PROTOCOLS['tcp'], 3509, 'vt-ssl'),
-        'vtr-emulator': Service(PROTOCOLS['tcp'], 3122, 'vtr-emulator'),
-        'vts-rpc': Service(PROTOCOLS['tcp'], 5780, 'vts-rpc'),
-        'vtsas': Service(PROTOCOLS['tcp'], 5070, 'vtsas'),
-        'vtu-comms': Service(PROTOCOLS['tcp'], 2216, 'vtu-comms'),
-        'vulture': Service(PROTOCOLS['tcp'], 3482, 'vulture'),
-        'vvr-control': Service(PROTOCOLS['tcp'], 4145, 'vvr-control'),
-        'vvr-data': Service(PROTOCOLS['tcp'], 8199, 'vvr-data'),
-        'vx-auth-port': Service(PROTOCOLS['tcp'], 3207, 'vx-auth-port'),
-        'vxcrnbuport': Service(PROTOCOLS['tcp'], 3652, 'vxcrnbuport'),
-        'vytalvaultbrtp': Service(PROTOCOLS['tcp'], 2546, 'vytalvaultbrtp'),
-        'vytalvaultpipe': Service(PROTOCOLS['tcp'], 2548, 'vytalvaultpipe'),
-        'vytalvaultvsmp': Service(PROTOCOLS['tcp'], 2547, 'vytalvaultvsmp'),
-        'wacp': Service(PROTOCOLS['tcp'], 3633, 'wacp'),
-        'wafs': Service(PROTOCOLS['tcp'], 4049, 'wafs'),
-        'wag-service': Service(PROTOCOLS['tcp'], 2608, 'wag-service'),
-        'wago-io-system': Service(PROTOCOLS['tcp'], 2455, 'wago-io-system'),
-        'wago-service': Service(PROTOCOLS['tcp'], 6626, 'wago-service'),
-        'wanscaler': Service(PROTOCOLS['tcp'], 2312, 'wanscaler'),
-        'wap-push': Service(PROTOCOLS['tcp'], 2948, 'wap-push'),
-        'wap-push-http': Service(PROTOCOLS['tcp'], 4035, 'wap-push-http'),
-        'wap-push-https': Service(PROTOCOLS['tcp'], 4036, 'wap-push-https'),
-        'wap-pushsecure': Service(PROTOCOLS['tcp'], 2949, 'wap-pushsecure'),
-        'wap-vcal': Service(PROTOCOLS['tcp'], 9205, 'wap-vcal'),
-        'wap-vcal-s': Service(PROTOCOLS['tcp'], 9207, 'wap-vcal-s'),
-        'wap-vcard': Service(PROTOCOLS['tcp'], 9204, 'wap-vcard'),
-        'wap-vcard-s': Service(PROTOCOLS['tcp'], 9206, 'wap-vcard-s'),
-        'wap-wsp': Service(PROTOCOLS['tcp'], 9200, 'wap-wsp'),
-        'wap-wsp-s': Service(PROTOCOLS['tcp'], 9202, 'wap-wsp-s'),
-        'wap-wsp-wtp': Service(PROTOCOLS['tcp'], 9201, 'wap-wsp-wtp'),
-        'wap-wsp-wtp-s': Service(PROTOCOLS['tcp'], 9203, 'wap-wsp-wtp-s'),
-        'warehouse': Service(PROTOCOLS['tcp'], 12322, 'warehouse'),
-        'warehouse-sss': Service(PROTOCOLS['tcp'], 12321, 'warehouse-sss'),
-        'warmspotmgmt': Service(PROTOCOLS['tcp'], 1074, 'warmspotmgmt'),
-        'warmux': Service(PROTOCOLS['tcp'], 3826, 'warmux'),
-        'warppipe': Service(PROTOCOLS['tcp'], 8007, 'warppipe'),
-        'watchdoc': Service(PROTOCOLS['tcp'], 5744, 'watchdoc'),
-        'watchdoc-pod': Service(PROTOCOLS['tcp'], 5743, 'watchdoc-pod'),
-        'watchdog-nt': Service(PROTOCOLS['tcp'], 2723, 'watchdog-nt'),
-        'watchme-7272': Service(PROTOCOLS['tcp'], 7272, 'watchme-7272'),
-        'watcomdebug': Service(PROTOCOLS['tcp'], 3563, 'watcomdebug'),
-        'watershed-lm': Service(PROTOCOLS['tcp'], 6143, 'watershed-lm'),
-        'watilapp': Service(PROTOCOLS['tcp'], 1269, 'watilapp'),
-        'wbem-exp-https': Service(PROTOCOLS['tcp'], 5990, 'wbem-exp-https'),
-        'wbem-http': Service(PROTOCOLS['tcp'], 5988, 'wbem-http'),
-        'wbem-https': Service(PROTOCOLS['tcp'], 5989, 'wbem-https'),
-        'wbem-rmi': Service(PROTOCOLS['tcp'], 5987, 'wbem-rmi'),
-        'wcbackup': Service(PROTOCOLS['tcp'], 8912, 'wcbackup'),
-        'wcpp': Service(PROTOCOLS['tcp'], 4185, 'wcpp'),
-        'wcr-remlib': Service(PROTOCOLS['tcp'], 4845, 'wcr-remlib'),
-        'weandsf': Service(PROTOCOLS['tcp'], 48050, 'weandsf'),
-        'weave': Service(PROTOCOLS['tcp'], 11095, 'weave'),
-        'web2host': Service(PROTOCOLS['tcp'], 1559, 'web2host'),
-        'webaccess': Service(PROTOCOLS['tcp'], 1739, 'webaccess'),
-        'webadmstart': Service(PROTOCOLS['tcp'], 1110, 'webadmstart'),
-        'webdata': Service(PROTOCOLS['tcp'], 3748, 'webdata'),
-        'webemshttp': Service(PROTOCOLS['tcp'], 2851, 'webemshttp'),
-        'weblogin': Service(PROTOCOLS['tcp'], 2054, 'weblogin'),
-        'webmachine': Service(PROTOCOLS['tcp'], 1963, 'webmachine'),
-        'webmail-2': Service(PROTOCOLS['tcp'], 3511, 'webmail-2'),
-        'webmethods-b2b': Service(PROTOCOLS['tcp'], 2907, 'webmethods-b2b'),
-        'webobjects': Service(PROTOCOLS['tcp'], 1085, 'webobjects'),
-        'webphone': Service(PROTOCOLS['tcp'], 21845, 'webphone'),
-        'webpush': Service(PROTOCOLS['tcp'], 1001, 'webpush'),
-        'websm': Service(PROTOCOLS['tcp'], 9090, 'websm'),
-        'websphere-snmp': Service(PROTOCOLS['tcp'], 3427, 'websphere-snmp'),
-        'webster': Service(PROTOCOLS['tcp'], 765, 'webster'),
-        'webtie': Service(PROTOCOLS['tcp'], 3342, 'webtie'),
-        'webyast': Service(PROTOCOLS['tcp'], 4984, 'webyast'),
-        'wello': Service(PROTOCOLS['tcp'], 4177, 'wello'),
-        'westec-connect': Service(PROTOCOLS['tcp'], 5566, 'westec-connect'),
-        'westell-stats': Service(PROTOCOLS['tcp'], 1875, 'westell-stats'),
-        'wfc': Service(PROTOCOLS['tcp'], 4847, 'wfc'),
-        'wfm': Service(PROTOCOLS['tcp'], 4057, 'wfm'),
-        'wfremotertm': Service(PROTOCOLS['tcp'], 1046, 'wfremotertm'),
-        'wg-netforce': Service(PROTOCOLS['tcp'], 3359, 'wg-netforce'),
-        'wherehoo': Service(PROTOCOLS['tcp'], 5859, 'wherehoo'),
-        'whisker': Service(PROTOCOLS['tcp'], 3233, 'whisker'),
-        'whoami': Service(PROTOCOLS['tcp'], 565, 'whoami'),
-        'whois++': Service(PROTOCOLS['tcp'], 63, 'whois++'),
-        'whoispp': Service(PROTOCOLS['tcp'], 63, 'whoispp'),
-        'whosells': Service(PROTOCOLS['tcp'], 2781, 'whosells'),
-        'whosockami': Service(PROTOCOLS['tcp'], 2019, 'whosockami'),
-        'wibukey': Service(PROTOCOLS['tcp'], 22347, 'wibukey'),
-        'wiegand': Service(PROTOCOLS['tcp'], 4390, 'wiegand'),
-        'wifree': Service(PROTOCOLS['tcp'], 11208, 'wifree'),
-        'wilkenlistener': Service(PROTOCOLS['tcp'], 1890, 'wilkenlistener'),
-        'willy': Service(PROTOCOLS['tcp'], 2518, 'willy'),
-        'wimaxasncp': Service(PROTOCOLS['tcp'], 2231, 'wimaxasncp'),
-        'wimd': Service(PROTOCOLS['tcp'], 2980, 'wimd'),
-        'wimsic': Service(PROTOCOLS['tcp'], 1326, 'wimsic'),
-        'windb': Service(PROTOCOLS['tcp'], 2522, 'windb'),
-        'winddlb': Service(PROTOCOLS['tcp'], 1565, 'winddlb'),
-        'winddx': Service(PROTOCOLS['tcp'], 1727, 'winddx'),
-        'windlm': Service(PROTOCOLS['tcp'], 1785, 'windlm'),
-        'windream': Service(PROTOCOLS['tcp'], 534, 'windream'),
-        'winfs': Service(PROTOCOLS['tcp'], 5009, 'winfs'),
-        'wininstall-ipc': Service(PROTOCOLS['tcp'], 3674, 'wininstall-ipc'),
-        'winjaserver': Service(PROTOCOLS['tcp'], 1290, 'winjaserver'),
-        'winpcs': Service(PROTOCOLS['tcp'], 5166, 'winpcs'),
-        'winpharaoh': Service(PROTOCOLS['tcp'], 6065, 'winpharaoh'),
-        'winpoplanmess': Service(PROTOCOLS['tcp'], 1152, 'winpoplanmess'),
-        'winport': Service(PROTOCOLS['tcp'], 3926, 'winport'),
-        'winqedit': Service(PROTOCOLS['tcp'], 7395, 'winqedit'),
-        'winrm': Service(PROTOCOLS['tcp'], 47001, 'winrm'),
-        'wins': Service(PROTOCOLS['tcp'], 1512, 'wins'),
-        'winshadow': Service(PROTOCOLS['tcp'], 3261, 'winshadow'),
-        'winshadow-hd': Service(PROTOCOLS['tcp'], 3861, 'winshadow-hd'),
-        'wip-port': Service(PROTOCOLS['tcp'], 3414, 'wip-port'),
-        'wired': Service(PROTOCOLS['tcp'], 4871, 'wired'),
-        'wkars': Service(PROTOCOLS['tcp'], 2720, 'wkars'),
-        'wkstn-mon': Service(PROTOCOLS['tcp'], 2991, 'wkstn-mon'),
-        'wlanauth': Service(PROTOCOLS['tcp'], 3810, 'wlanauth'),
-        'wlbs': Service(PROTOCOLS['tcp'], 2504, 'wlbs'),
-        'wmc-log-svc': Service(PROTOCOLS['tcp'], 1338, 'wmc-log-svc'),
-        'wmlserver': Service(PROTOCOLS['tcp'], 4883, 'wmlserver'),
-        'wms-messenger': Service(PROTOCOLS['tcp'], 3219, 'wms-messenger'),
-        'wnn6': Service(PROTOCOLS['tcp'], 22273, 'wnn6'),
-        'wnn6-ds': Service(PROTOCOLS['tcp'], 26208, 'wnn6-ds'),
-        'workflow': Service(PROTOCOLS['tcp'], 3466, 'workflow'),
-        'workflowdir': Service(PROTOCOLS['tcp'], 4417, 'workflowdir'),
-        'world-lm': Service(PROTOCOLS['tcp'], 1462, 'world-lm'),
-        'worldfusion1': Service(PROTOCOLS['tcp'], 2595, 'worldfusion1'),
-        'worldfusion2': Service(PROTOCOLS['tcp'], 2596, 'worldfusion2'),
-        'worldscores': Service(PROTOCOLS['tcp'], 4545, 'worldscores'),
-        'wpages': Service(PROTOCOLS['tcp'], 776, 'wpages'),
-        'wpgs': Service(PROTOCOLS['tcp'], 780, 'wpgs'),
-        'wpl-analytics': Service(PROTOCOLS['tcp'], 8006, 'wpl-analytics'),
-        'writesrv': Service(PROTOCOLS['tcp'], 1334, 'writesrv'),
-        'wrs-registry': Service(PROTOCOLS['tcp'], 2340, 'wrs-registry'),
-        'wrs_registry': Service(PROTOCOLS['tcp'], 2340, 'wrs_registry'),
-        'wrspice': Service(PROTOCOLS['tcp'], 6114, 'wrspice'),
-        'ws-discovery': Service(PROTOCOLS['tcp'], 3702, 'ws-discovery'),
-        'wsdapi': Service(PROTOCOLS['tcp'], 5357, 'wsdapi'),
-        'wsdapi-s': Service(PROTOCOLS['tcp'], 5358, 'wsdapi-s'),
-        'wsdl-event': Service(PROTOCOLS['tcp'], 4879, 'wsdl-event'),
-        'wsicopy': Service(PROTOCOLS['tcp'], 3378, 'wsicopy'),
-        'wsm-server': Service(PROTOCOLS['tcp'], 5006, 'wsm-server'),
-        'wsm-server-ssl': Service(PROTOCOLS['tcp'], 5007, 'wsm-server-ssl'),
-        'wsman': Service(PROTOCOLS['tcp'], 5985, 'wsman'),
-        'wsmans': Service(PROTOCOLS['tcp'], 5986, 'wsmans'),
-        'wsmlb': Service(PROTOCOLS['tcp'], 3806, 'wsmlb'),
-        'wso2esb-console': Service(PROTOCOLS['tcp'], 9444, 'wso2esb-console'),
-        'wspipe': Service(PROTOCOLS['tcp'], 4431, 'wspipe'),
-        'wssauthsvc': Service(PROTOCOLS['tcp'], 4537, 'wssauthsvc'),
-        'wsscomfrmwk': Service(PROTOCOLS['tcp'], 6602, 'wsscomfrmwk'),
-        'wsynch': Service(PROTOCOLS['tcp'], 3111, 'wsynch'),
-        'wta-wsp-s': Service(PROTOCOLS['tcp'], 2805, 'wta-wsp-s'),
-        'wta-wsp-wtp-s': Service(PROTOCOLS['tcp'], 2923, 'wta-wsp-wtp-s'),
-        'wusage': Service(PROTOCOLS['tcp'], 2396, 'wusage'),
-        'wv-csp-sms': Service(PROTOCOLS['tcp'], 3590, 'wv-csp-sms'),
-        'wv-csp-sms-cir': Service(PROTOCOLS['tcp'], 3716, 'wv-csp-sms-cir'),
-        'wv-csp-udp-cir': Service(PROTOCOLS['tcp'], 3717, 'wv-csp-udp-cir'),
-        'wwiotalk': Service(PROTOCOLS['tcp'], 5413, 'wwiotalk'),
-        'www': Service(PROTOCOLS['tcp'], 80, 'www'),
-        'www-dev': Service(PROTOCOLS['tcp'], 2784, 'www-dev'),
-        'www-http': Service(PROTOCOLS['tcp'], 80, 'www-http'),
-        'www-ldap-gw': Service(PROTOCOLS['tcp'], 1760, 'www-ldap-gw'),
-        'wxbrief': Service(PROTOCOLS['tcp'], 4368, 'wxbrief'),
-        'wysdma': Service(PROTOCOLS['tcp'], 3741, 'wysdma'),
-        'wysdmc': Service(PROTOCOLS['tcp'], 3916, 'wysdmc'),
-        'x-bone-api': Service(PROTOCOLS['tcp'], 2165, 'x-bone-api'),
-        'x-bone-ctl': Service(PROTOCOLS['tcp'], 265, 'x-bone-ctl'),
-        'x11': Service(PROTOCOLS['tcp'], 6063, 'x11'),
-        'x25-svc-port': Service(PROTOCOLS['tcp'], 1998, 'x25-svc-port'),
-        'x500ms': Service(PROTOCOLS['tcp'], 5757, 'x500ms'),
-        'x9-icue': Service(PROTOCOLS['tcp'], 1145, 'x9-icue'),
-        'xaapi': Service(PROTOCOLS['tcp'], 1934, 'xaapi'),
-        'xact-backup': Service(PROTOCOLS['tcp'], 911, 'xact-backup'),
-        'xadmin': Service(PROTOCOLS['tcp'], 9105, 'xadmin'),
-        'xandros-cms': Service(PROTOCOLS['tcp'], 4389, 'xandros-cms'),
-        'xap-ha': Service(PROTOCOLS['tcp'], 3639, 'xap-ha'),
-        'xbox': Service(PROTOCOLS['tcp'], 3074, 'xbox'),
-        'xdas': Service(PROTOCOLS['tcp'], 7629, 'xdas'),
-        'xdmcp': Service(PROTOCOLS['tcp'], 177, 'xdmcp'),
-        'xds': Service(PROTOCOLS['tcp'], 2130, 'xds'),
-        'xdsxdm': Service(PROTOCOLS['tcp'], 6558, 'xdsxdm'),
-        'xdtp': Service(PROTOCOLS['tcp'], 3088, 'xdtp'),
-        'xecp-node': Service(PROTOCOLS['tcp'], 3940, 'xecp-node'),
-        'xfer': Service(PROTOCOLS['tcp'], 82, 'xfer'),
-        'xfr': Service(PROTOCOLS['tcp'], 682, 'xfr'),
-        'xgrid': Service(PROTOCOLS['tcp'], 4111, 'xgrid'),
-        'xic': Service(PROTOCOLS['tcp'], 6115, 'xic'),
-        'xiip': Service(PROTOCOLS['tcp'], 1924, 'xiip'),
-        'xingcsm': Service(PROTOCOLS['tcp'], 2327, 'xingcsm'),
-        'xingmpeg': Service(PROTOCOLS['tcp'], 1558, 'xingmpeg'),
-        'xinuexpansion3': Service(PROTOCOLS['tcp'], 2023, 'xinuexpansion3'),
-        'xinuexpansion4': Service(PROTOCOLS['tcp'], 2024, 'xinuexpansion4'),
-        'xinupageserver': Service(PROTOCOLS['tcp'], 2020, 'xinupageserver'),
-        'xiostatus': Service(PROTOCOLS['tcp'], 2341, 'xiostatus'),
-        'xkotodrcp': Service(PROTOCOLS['tcp'], 5344, 'xkotodrcp'),
-        'xmapi': Service(PROTOCOLS['tcp'], 1933, 'xmapi'),
-        'xmcp': Service(PROTOCOLS['tcp'], 4788, 'xmcp'),
-        'xmlblaster': Service(PROTOCOLS['tcp'], 3412, 'xmlblaster'),
-        'xmlink-connect': Service(PROTOCOLS['tcp'], 3953, 'xmlink-connect'),
-        'xmlipcregsvc': Service(PROTOCOLS['tcp'], 9092, 'xmlipcregsvc'),
-        'xmlrpc-beep': Service(PROTOCOLS['tcp'], 602, 'xmlrpc-beep'),
-        'xmltec-xmlmail': Service(PROTOCOLS['tcp'], 9091, 'xmltec-xmlmail'),
-        'xmms2': Service(PROTOCOLS['tcp'], 9667, 'xmms2'),
-        'xmpcr-interface': Service(PROTOCOLS['tcp'], 3877, 'xmpcr-interface'),
-        'xmpp-bosh': Service(PROTOCOLS['tcp'], 5280, 'xmpp-bosh'),
-        'xmpp-client': Service(PROTOCOLS['tcp'], 5222, 'xmpp-client'),
-        'xmpp-server': Service(PROTOCOLS['tcp'], 5269, 'xmpp-server'),
-        'xmpv7': Service(PROTOCOLS['tcp'], 7430, 'xmpv7'),
-        'xmquery': Service(PROTOCOLS['tcp'], 2279, 'xmquery'),
-        'xmsg': Service(PROTOCOLS['tcp'], 1716, 'xmsg'),
-        'xnds': Service(PROTOCOLS['tcp'], 2157, 'xnds'),
-        'xnm-clear-text': Service(PROTOCOLS['tcp'], 3221, 'xnm-clear-text'),
-        'xnm-ssl': Service(PROTOCOLS['tcp'], 3220, 'xnm-ssl'),
-        'xnmp': Service(PROTOCOLS['tcp'], 1652, 'xnmp'),
-        'xns-auth': Service(PROTOCOLS['tcp'], 56, 'xns-auth'),
-        'xns-ch': Service(PROTOCOLS['tcp'], 54, 'xns-ch'),
-        'xns-courier': Service(PROTOCOLS['tcp'], 165, 'xns-courier'),
-        'xns-mail': Service(PROTOCOLS['tcp'], 58, 'xns-mail'),
-        'xns-time': Service(PROTOCOLS['tcp'], 52, 'xns-time'),
-        'xo-wave': Service(PROTOCOLS['tcp'], 3763, 'xo-wave'),
-        'xoms': Service(PROTOCOLS['tcp'], 16619, 'xoms'),
-        'xoraya': Service(PROTOCOLS['tcp'], 11876, 'xoraya'),
-        'xpanel': Service(PROTOCOLS['tcp'], 3737, 'xpanel'),
-        'xpilot': Service(PROTOCOLS['tcp'], 15345, 'xpilot'),
-        'xpl': Service(PROTOCOLS['tcp'], 3865, 'xpl'),
-        'xplat-replicate': Service(PROTOCOLS['tcp'], 3071, 'xplat-replicate'),
-        'xpra': Service(PROTOCOLS['tcp'], 14500, 'xpra'),
-        'xprint-server': Service(PROTOCOLS['tcp'], 8100, 'xprint-server'),
-        'xprtld': Service(PROTOCOLS['tcp'], 5634, 'xprtld'),
-        'xqosd': Service(PROTOCOLS['tcp'], 31416, 'xqosd'),
-        'xrl': Service(PROTOCOLS['tcp'], 1104, 'xrl'),
-        'xrpc-registry': Service(PROTOCOLS['tcp'], 3651, 'xrpc-registry'),
-        'xs-openstorage': Service(PROTOCOLS['tcp'], 1619, 'xs-openstorage'),
-        'xserveraid': Service(PROTOCOLS['tcp'], 3722, 'xserveraid'),
-        'xsip-network': Service(PROTOCOLS['tcp'], 1354, 'xsip-network'),
-        'xsmsvc': Service(PROTOCOLS['tcp'], 6936, 'xsmsvc'),
-        'xss-port': Service(PROTOCOLS['tcp'], 3510, 'xss-port'),
-        'xss-srv-port': Service(PROTOCOLS['tcp'], 3646, 'xss-srv-port'),
-        'xsync': Service(PROTOCOLS['tcp'], 3721, 'xsync'),
-        'xtgui': Service(PROTOCOLS['tcp'], 4095, 'xtgui'),
-        'xtlserv': Service(PROTOCOLS['tcp'], 6116, 'xtlserv'),
-        'xtreamx': Service(PROTOCOLS['tcp'], 5793, 'xtreamx'),
-        'xtrm': Service(PROTOCOLS['tcp'], 3423, 'xtrm'),
-        'xtrms': Service(PROTOCOLS['tcp'], 3424, 'xtrms'),
-        'xvttp': Service(PROTOCOLS['tcp'], 508, 'xvttp'),
-        'xxnetserver': Service(PROTOCOLS['tcp'], 3832, 'xxnetserver'),
-        'xybrid-cloud': Service(PROTOCOLS['tcp'], 9925, 'xybrid-cloud'),
-        'xybrid-rt': Service(PROTOCOLS['tcp'], 9978, 'xybrid-rt'),
-        'xyplex-mux': Service(PROTOCOLS['tcp'], 173, 'xyplex-mux'),
-        'yo-main': Service(PROTOCOLS['tcp'], 4040, 'yo-main'),
-        'z-wave': Service(PROTOCOLS['tcp'], 4123, 'z-wave'),
-        'z-wave-s': Service(PROTOCOLS['tcp'], 41230, 'z-wave-s'),
-        'z-wave-tunnel': Service(PROTOCOLS['tcp'], 44123, 'z-wave-tunnel'),
-        'z39-50': Service(PROTOCOLS['tcp'], 210, 'z39-50'),
-        'z39.50': Service(PROTOCOLS['tcp'], 210, 'z39.50'),
-        'zabbix-agent': Service(PROTOCOLS['tcp'], 10050, 'zabbix-agent'),
-        'zabbix-trapper': Service(PROTOCOLS['tcp'], 10051, 'zabbix-trapper'),
-        'zannet': Service(PROTOCOLS['tcp'], 317, 'zannet'),
-        'zarkov': Service(PROTOCOLS['tcp'], 2989, 'zarkov'),
-        'zen-pawn': Service(PROTOCOLS['tcp'], 7628, 'zen-pawn'),
-        'zenginkyo-1': Service(PROTOCOLS['tcp'], 5020, 'zenginkyo-1'),
-        'zenginkyo-2': Service(PROTOCOLS['tcp'], 5021, 'zenginkyo-2'),
-        'zented': Service(PROTOCOLS['tcp'], 1229, 'zented'),
-        'zep': Service(PROTOCOLS['tcp'], 17754, 'zep'),
-        'zephyr-clt': Service(PROTOCOLS['tcp'], 2103, 'zephyr-clt'),
-        'zephyr-hm': Service(PROTOCOLS['tcp'], 2104, 'zephyr-hm'),
-        'zephyr-srv': Service(PROTOCOLS['tcp'], 2102, 'zephyr-srv'),
-        'zicom': Service(PROTOCOLS['tcp'], 3774, 'zicom'),
-        'zieto-sock': Service(PROTOCOLS['tcp'], 4072, 'zieto-sock'),
-        'zigbee-ip': Service(PROTOCOLS['tcp'], 17755, 'zigbee-ip'),
-        'zigbee-ips': Service(PROTOCOLS['tcp'], 17756, 'zigbee-ips'),
-        'zion-lm': Service(PROTOCOLS['tcp'], 1425, 'zion-lm'),
-        'zmp': Service(PROTOCOLS['tcp'], 3925, 'zmp'),
-        'zoomcp': Service(PROTOCOLS['tcp'], 9666, 'zoomcp'),
-        'zsecure': Service(PROTOCOLS['tcp'], 7173, 'zsecure'),
-        'zserv': Service(PROTOCOLS['tcp'], 346, 'zserv'),
-        'zymed-zpp': Service(PROTOCOLS['tcp'], 2133, 'zymed-zpp'),
-    },
-    'udp': {
-        '1ci-smcs': Service(PROTOCOLS['udp'], 3091, '1ci-smcs'),
-        '2ping': Service(PROTOCOLS['udp'], 15998, '2ping'),
-        '3com-amp3': Service(PROTOCOLS['udp'], 629, '3com-amp3'),
-        '3com-net-mgmt': Service(PROTOCOLS['udp'], 2391, '3com-net-mgmt'),
-        '3com-njack-1': Service(PROTOCOLS['udp'], 5264, '3com-njack-1'),
-        '3com-njack-2': Service(PROTOCOLS['udp'], 5265, '3com-njack-2'),
-        '3com-nsd': Service(PROTOCOLS['udp'], 1742, '3com-nsd'),
-        '3com-tsmux': Service(PROTOCOLS['udp'], 106, '3com-tsmux'),
-        '3com-webview': Service(PROTOCOLS['udp'], 2339, '3com-webview'),
-        '3comfaxrpc': Service(PROTOCOLS['udp'], 3446, '3comfaxrpc'),
-        '3comnetman': Service(PROTOCOLS['udp'], 1181, '3comnetman'),
-        '3d-nfsd': Service(PROTOCOLS['udp'], 2323, '3d-nfsd'),
-        '3ds-lm': Service(PROTOCOLS['udp'], 1538, '3ds-lm'),
-        '3l-l1': Service(PROTOCOLS['udp'], 1511, '3l-l1'),
-        '3link': Service(PROTOCOLS['udp'], 15363, '3link'),
-        '3m-image-lm': Service(PROTOCOLS['udp'], 1550, '3m-image-lm'),
-        '3par-evts': Service(PROTOCOLS['udp'], 5781, '3par-evts'),
-        '3par-mgmt': Service(PROTOCOLS['udp'], 5782, '3par-mgmt'),
-        '3par-mgmt-ssl': Service(PROTOCOLS['udp'], 5783, '3par-mgmt-ssl'),
-        '3par-rcopy': Service(PROTOCOLS['udp'], 5785, '3par-rcopy'),
-        '4-tieropmcli': Service(PROTOCOLS['udp'], 2934, '4-tieropmcli'),
-        '4-tieropmgw': Service(PROTOCOLS['udp'], 2933, '4-tieropmgw'),
-        '4talk': Service(PROTOCOLS['udp'], 3284, '4talk'),
-        '5afe-disc': Service(PROTOCOLS['udp'], 23294, '5afe-disc'),
-        '6a44': Service(PROTOCOLS['udp'], 1027, '6a44'),
-        '802-11-iapp': Service(PROTOCOLS['udp'], 3517, '802-11-iapp'),
-        '914c-g': Service(PROTOCOLS['udp'], 211, '914c-g'),
-        '914c/g': Service(PROTOCOLS['udp'], 211, '914c/g'),
-        '9pfs': Service(PROTOCOLS['udp'], 564, '9pfs'),
-        'a1-bs': Service(PROTOCOLS['udp'], 5603, 'a1-bs'),
-        'a1-msc': Service(PROTOCOLS['udp'], 5602, 'a1-msc'),
-        'a13-an': Service(PROTOCOLS['udp'], 3125, 'a13-an'),
-        'a14': Service(PROTOCOLS['udp'], 3597, 'a14'),
-        'a15': Service(PROTOCOLS['udp'], 3598, 'a15'),
-        'a16-an-an': Service(PROTOCOLS['udp'], 4598, 'a16-an-an'),
-        'a17-an-an': Service(PROTOCOLS['udp'], 4599, 'a17-an-an'),
-        'a21-an-1xbs': Service(PROTOCOLS['udp'], 4597, 'a21-an-1xbs'),
-        'a26-fap-fgw': Service(PROTOCOLS['udp'], 4726, 'a26-fap-fgw'),
-        'a27-ran-ran': Service(PROTOCOLS['udp'], 28119, 'a27-ran-ran'),
-        'a3-sdunode': Service(PROTOCOLS['udp'], 5604, 'a3-sdunode'),
-        'a4-sdunode': Service(PROTOCOLS['udp'], 5605, 'a4-sdunode'),
-        'aairnet-1': Service(PROTOCOLS['udp'], 3618, 'aairnet-1'),
-        'aairnet-2': Service(PROTOCOLS['udp'], 3619, 'aairnet-2'),
-        'aal-lm': Service(PROTOCOLS['udp'], 1469, 'aal-lm'),
-        'aamp': Service(PROTOCOLS['udp'], 3939, 'aamp'),
-        'aap': Service(PROTOCOLS['udp'], 2878, 'aap'),
-        'aas': Service(PROTOCOLS['udp'], 1601, 'aas'),
-        'abacus-remote': Service(PROTOCOLS['udp'], 2894, 'abacus-remote'),
-        'abarsd': Service(PROTOCOLS['udp'], 8402, 'abarsd'),
-        'abatemgr': Service(PROTOCOLS['udp'], 3655, 'abatemgr'),
-        'abatjss': Service(PROTOCOLS['udp'], 3656, 'abatjss'),
-        'abb-escp': Service(PROTOCOLS['udp'], 6316, 'abb-escp'),
-        'abbaccuray': Service(PROTOCOLS['udp'], 1546, 'abbaccuray'),
-        'abbs': Service(PROTOCOLS['udp'], 4885, 'abbs'),
-        'abcsoftware': Service(PROTOCOLS['udp'], 3996, 'abcsoftware'),
-        'abcvoice-port': Service(PROTOCOLS['udp'], 3781, 'abcvoice-port'),
-        'about': Service(PROTOCOLS['udp'], 2019, 'about'),
-        'abr-api': Service(PROTOCOLS['udp'], 1954, 'abr-api'),
-        'abr-secure': Service(PROTOCOLS['udp'], 1955, 'abr-secure'),
-        'ac-cluster': Service(PROTOCOLS['udp'], 18463, 'ac-cluster'),
-        'ac-tech': Service(PROTOCOLS['udp'], 2796, 'ac-tech'),
-        'acap': Service(PROTOCOLS['udp'], 674, 'acap'),
-        'acas': Service(PROTOCOLS['udp'], 62, 'acas'),
-        'acc-raid': Service(PROTOCOLS['udp'], 2800, 'acc-raid'),
-        'accel': Service(PROTOCOLS['udp'], 4108, 'accel'),
-        'accelenet-data': Service(PROTOCOLS['udp'], 1182, 'accelenet-data'),
-        'accessbuilder': Service(PROTOCOLS['udp'], 888, 'accessbuilder'),
-        'accessnetwork': Service(PROTOCOLS['udp'], 699, 'accessnetwork'),
-        'accord-mgc': Service(PROTOCOLS['udp'], 1205, 'accord-mgc'),
-        'acctopus-st': Service(PROTOCOLS['udp'], 6868, 'acctopus-st'),
-        'accu-lmgr': Service(PROTOCOLS['udp'], 7781, 'accu-lmgr'),
-        'accuracer': Service(PROTOCOLS['udp'], 12007, 'accuracer'),
-        'accuracer-dbms': Service(PROTOCOLS['udp'], 12008, 'accuracer-dbms'),
-        'acd-pm': Service(PROTOCOLS['udp'], 8793, 'acd-pm'),
-        'ace-client': Service(PROTOCOLS['udp'], 2334, 'ace-client'),
-        'ace-proxy': Service(PROTOCOLS['udp'], 2335, 'ace-proxy'),
-        'ace-server': Service(PROTOCOLS['udp'], 2475, 'ace-server'),
-        'ace-svr-prop': Service(PROTOCOLS['udp'], 2476, 'ace-svr-prop'),
-        'aci': Service(PROTOCOLS['udp'], 187, 'aci'),
-        'acis': Service(PROTOCOLS['udp'], 9953, 'acis'),
-        'acl-manager': Service(PROTOCOLS['udp'], 4013, 'acl-manager'),
-        'acmaint-dbd': Service(PROTOCOLS['udp'], 774, 'acmaint-dbd'),
-        'acmaint-transd': Service(PROTOCOLS['udp'], 775, 'acmaint-transd'),
-        'acmaint_dbd': Service(PROTOCOLS['udp'], 774, 'acmaint_dbd'),
-        'acmaint_transd': Service(PROTOCOLS['udp'], 775, 'acmaint_transd'),
-        'acme': Service(PROTOCOLS['udp'], 9216, 'acme'),
-        'acms': Service(PROTOCOLS['udp'], 3980, 'acms'),
-        'acmsoda': Service(PROTOCOLS['udp'], 6969, 'acmsoda'),
-        'acnet': Service(PROTOCOLS['udp'], 6801, 'acnet'),
-        'acp': Service(PROTOCOLS['udp'], 599, 'acp'),
-        'acp-conduit': Service(PROTOCOLS['udp'], 3823, 'acp-conduit'),
-        'acp-discovery': Service(PROTOCOLS['udp'], 3822, 'acp-discovery'),
-        'acp-policy': Service(PROTOCOLS['udp'], 3824, 'acp-policy'),
-        'acp-port': Service(PROTOCOLS['udp'], 2071, 'acp-port'),
-        'acp-proto': Service(PROTOCOLS['udp'], 4046, 'acp-proto'),
-        'acptsys': Service(PROTOCOLS['udp'], 2149, 'acptsys'),
-        'acr-nema': Service(PROTOCOLS['udp'], 104, 'acr-nema'),
-        'acter': Service(PROTOCOLS['udp'], 4671, 'acter'),
-        'activememory': Service(PROTOCOLS['udp'], 2859, 'activememory'),
-        'activesync': Service(PROTOCOLS['udp'], 1034, 'activesync'),
-        'actnet': Service(PROTOCOLS['udp'], 5411, 'actnet'),
-        'ada-cip': Service(PROTOCOLS['udp'], 2085, 'ada-cip'),
-        'adap': Service(PROTOCOLS['udp'], 6350, 'adap'),
-        'adapt-sna': Service(PROTOCOLS['udp'], 1365, 'adapt-sna'),
-        'adaptecmgr': Service(PROTOCOLS['udp'], 2521, 'adaptecmgr'),
-        'adi-gxp-srvprt': Service(PROTOCOLS['udp'], 6769, 'adi-gxp-srvprt'),
-        'admind': Service(PROTOCOLS['udp'], 8403, 'admind'),
-        'admins-lms': Service(PROTOCOLS['udp'], 2692, 'admins-lms'),
-        'adobeserver-1': Service(PROTOCOLS['udp'], 1102, 'adobeserver-1'),
-        'adobeserver-2': Service(PROTOCOLS['udp'], 1103, 'adobeserver-2'),
-        'adobeserver-3': Service(PROTOCOLS['udp'], 3703, 'adobeserver-3'),
-        'adobeserver-4': Service(PROTOCOLS['udp'], 3704, 'adobeserver-4'),
-        'adobeserver-5': Service(PROTOCOLS['udp'], 3705, 'adobeserver-5'),
-        'adrep': Service(PROTOCOLS['udp'], 3954, 'adrep'),
-        'ads': Service(PROTOCOLS['udp'], 2550, 'ads'),
-        'ads-c': Service(PROTOCOLS['udp'], 5913, 'ads-c'),
-        'adtech-test': Service(PROTOCOLS['udp'], 3357, 'adtech-test'),
-        'adtempusclient': Service(PROTOCOLS['udp'], 3760, 'adtempusclient'),
-        'advant-lm': Service(PROTOCOLS['udp'], 2295, 'advant-lm'),
-        'aed-512': Service(PROTOCOLS['udp'], 149, 'aed-512'),
-        'aegate': Service(PROTOCOLS['udp'], 4549, 'aegate'),
-        'aero': Service(PROTOCOLS['udp'], 8060, 'aero'),
-        'aeroflight-ads': Service(PROTOCOLS['udp'], 1218, 'aeroflight-ads'),
-        'aeroflight-ret': Service(PROTOCOLS['udp'], 1219, 'aeroflight-ret'),
-        'aes-discovery': Service(PROTOCOLS['udp'], 3224, 'aes-discovery'),
-        'aes-x170': Service(PROTOCOLS['udp'], 7107, 'aes-x170'),
-        'aesop': Service(PROTOCOLS['udp'], 8202, 'aesop'),
-        'af': Service(PROTOCOLS['udp'], 1411, 'af'),
-        'afesc-mc': Service(PROTOCOLS['udp'], 6628, 'afesc-mc'),
-        'affiliate': Service(PROTOCOLS['udp'], 6579, 'affiliate'),
-        'afore-vdp-disc': Service(PROTOCOLS['udp'], 4362, 'afore-vdp-disc'),
-        'afpovertcp': Service(PROTOCOLS['udp'], 548, 'afpovertcp'),
-        'afrog': Service(PROTOCOLS['udp'], 1042, 'afrog'),
-        'afs': Service(PROTOCOLS['udp'], 1483, 'afs'),
-        'afs3-bos': Service(PROTOCOLS['udp'], 7007, 'afs3-bos'),
-        'afs3-callback': Service(PROTOCOLS['udp'], 7001, 'afs3-callback'),
-        'afs3-errors': Service(PROTOCOLS['udp'], 7006, 'afs3-errors'),
-        'afs3-fileserver': Service(PROTOCOLS['udp'], 7000, 'afs3-fileserver'),
-        'afs3-kaserver': Service(PROTOCOLS['udp'], 7004, 'afs3-kaserver'),
-        'afs3-prserver': Service(PROTOCOLS['udp'], 7002, 'afs3-prserver'),
-        'afs3-rmtsys': Service(PROTOCOLS['udp'], 7009, 'afs3-rmtsys'),
-        'afs3-update': Service(PROTOCOLS['udp'], 7008, 'afs3-update'),
-        'afs3-vlserver': Service(PROTOCOLS['udp'], 7003, 'afs3-vlserver'),
-        'afs3-volser': Service(PROTOCOLS['udp'], 7005, 'afs3-volser'),
-        'aftmux': Service(PROTOCOLS['udp'], 3917, 'aftmux'),
-        'agcat': Service(PROTOCOLS['udp'], 3915, 'agcat'),
-        'agentsease-db': Service(PROTOCOLS['udp'], 3997, 'agentsease-db'),
-        'agentview': Service(PROTOCOLS['udp'], 2331, 'agentview'),
-        'agentx': Service(PROTOCOLS['udp'], 705, 'agentx'),
-        'agpolicy': Service(PROTOCOLS['udp'], 38203, 'agpolicy'),
-        'agps-port': Service(PROTOCOLS['udp'], 3425, 'agps-port'),
-        'agri-gateway': Service(PROTOCOLS['udp'], 3026, 'agri-gateway'),
-        'agriserver': Service(PROTOCOLS['udp'], 3021, 'agriserver'),
-        'agslb': Service(PROTOCOLS['udp'], 4149, 'agslb'),
-        'ah-esp-encap': Service(PROTOCOLS['udp'], 2070, 'ah-esp-encap'),
-        'ahsp': Service(PROTOCOLS['udp'], 4333, 'ahsp'),
-        'aiagent': Service(PROTOCOLS['udp'], 7738, 'aiagent'),
-        'aibkup': Service(PROTOCOLS['udp'], 4071, 'aibkup'),
-        'aic-np': Service(PROTOCOLS['udp'], 2785, 'aic-np'),
-        'aic-oncrpc': Service(PROTOCOLS['udp'], 2786, 'aic-oncrpc'),
-        'aicc-cmi': Service(PROTOCOLS['udp'], 3316, 'aicc-cmi'),
-        'aimpp-hello': Service(PROTOCOLS['udp'], 2846, 'aimpp-hello'),
-        'aimpp-port-req': Service(PROTOCOLS['udp'], 2847, 'aimpp-port-req'),
-        'aipn-auth': Service(PROTOCOLS['udp'], 3833, 'aipn-auth'),
-        'aipn-reg': Service(PROTOCOLS['udp'], 4113, 'aipn-reg'),
-        'aironetddp': Service(PROTOCOLS['udp'], 2887, 'aironetddp'),
-        'airs': Service(PROTOCOLS['udp'], 1481, 'airs'),
-        'airshot': Service(PROTOCOLS['udp'], 3975, 'airshot'),
-        'airsync': Service(PROTOCOLS['udp'], 2175, 'airsync'),
-        'aises': Service(PROTOCOLS['udp'], 2783, 'aises'),
-        'aja-ntv4-disc': Service(PROTOCOLS['udp'], 4804, 'aja-ntv4-disc'),
-        'aker-cdp': Service(PROTOCOLS['udp'], 2473, 'aker-cdp'),
-        'alaris-disc': Service(PROTOCOLS['udp'], 3613, 'alaris-disc'),
-        'alarm': Service(PROTOCOLS['udp'], 2740, 'alarm'),
-        'alarm-clock-c': Service(PROTOCOLS['udp'], 2668, 'alarm-clock-c'),
-        'alarm-clock-s': Service(PROTOCOLS['udp'], 2667, 'alarm-clock-s'),
-        'alchemy': Service(PROTOCOLS['udp'], 3234, 'alchemy'),
-        'alesquery': Service(PROTOCOLS['udp'], 5074, 'alesquery'),
-        'alfin': Service(PROTOCOLS['udp'], 16003, 'alfin'),
-        'alias': Service(PROTOCOLS['udp'], 1187, 'alias'),
-        'alljoyn': Service(PROTOCOLS['udp'], 9956, 'alljoyn'),
-        'alljoyn-mcm': Service(PROTOCOLS['udp'], 9955, 'alljoyn-mcm'),
-        'allpeers': Service(PROTOCOLS['udp'], 36001, 'allpeers'),
-        'allstorcns': Service(PROTOCOLS['udp'], 2901, 'allstorcns'),
-        'almobile-system': Service(PROTOCOLS['udp'], 9209, 'almobile-system'),
-        'alpes': Service(PROTOCOLS['udp'], 463, 'alpes'),
-        'alpha-sms': Service(PROTOCOLS['udp'], 1849, 'alpha-sms'),
-        'alphatech-lm': Service(PROTOCOLS['udp'], 1653, 'alphatech-lm'),
-        'alta-ana-lm': Service(PROTOCOLS['udp'], 1346, 'alta-ana-lm'),
-        'altalink': Service(PROTOCOLS['udp'], 1845, 'altalink'),
-        'altav-remmgt': Service(PROTOCOLS['udp'], 2456, 'altav-remmgt'),
-        'altav-tunnel': Service(PROTOCOLS['udp'], 3265, 'altav-tunnel'),
-        'altbsdp': Service(PROTOCOLS['udp'], 7799, 'altbsdp'),
-        'altcp': Service(PROTOCOLS['udp'], 4165, 'altcp'),
-        'altova-lm-disc': Service(PROTOCOLS['udp'], 35355, 'altova-lm-disc'),
-        'altovacentral': Service(PROTOCOLS['udp'], 4689, 'altovacentral'),
-        'altserviceboot': Service(PROTOCOLS['udp'], 4011, 'altserviceboot'),
-        'amanda': Service(PROTOCOLS['udp'], 10080, 'amanda'),
-        'amberon': Service(PROTOCOLS['udp'], 8301, 'amberon'),
-        'ambit-lm': Service(PROTOCOLS['udp'], 6831, 'ambit-lm'),
-        'amc': Service(PROTOCOLS['udp'], 5506, 'amc'),
-        'amcs': Service(PROTOCOLS['udp'], 8766, 'amcs'),
-        'amdsched': Service(PROTOCOLS['udp'], 1931, 'amdsched'),
-        'ami-control': Service(PROTOCOLS['udp'], 2640, 'ami-control'),
-        'amicon-fpsu-ra': Service(PROTOCOLS['udp'], 30003, 'amicon-fpsu-ra'),
-        'amicon-fpsu-s': Service(PROTOCOLS['udp'], 30004, 'amicon-fpsu-s'),
-        'amiganetfs': Service(PROTOCOLS['udp'], 2100, 'amiganetfs'),
-        'aminet': Service(PROTOCOLS['udp'], 2639, 'aminet'),
-        'amp': Service(PROTOCOLS['udp'], 3811, 'amp'),
-        'ampify': Service(PROTOCOLS['udp'], 8040, 'ampify'),
-        'ampr-info': Service(PROTOCOLS['udp'], 1535, 'ampr-info'),
-        'ampr-inter': Service(PROTOCOLS['udp'], 1536, 'ampr-inter'),
-        'ampr-rcmd': Service(PROTOCOLS['udp'], 459, 'ampr-rcmd'),
-        'amqp': Service(PROTOCOLS['udp'], 5672, 'amqp'),
-        'amqps': Service(PROTOCOLS['udp'], 5671, 'amqps'),
-        'ams': Service(PROTOCOLS['udp'], 1037, 'ams'),
-        'amt': Service(PROTOCOLS['udp'], 2268, 'amt'),
-        'amt-blc-port': Service(PROTOCOLS['udp'], 2848, 'amt-blc-port'),
-        'amt-cnf-prot': Service(PROTOCOLS['udp'], 3054, 'amt-cnf-prot'),
-        'amt-esd-prot': Service(PROTOCOLS['udp'], 1082, 'amt-esd-prot'),
-        'amt-redir-tcp': Service(PROTOCOLS['udp'], 16994, 'amt-redir-tcp'),
-        'amt-redir-tls': Service(PROTOCOLS['udp'], 16995, 'amt-redir-tls'),
-        'amt-soap-http': Service(PROTOCOLS['udp'], 16992, 'amt-soap-http'),
-        'amt-soap-https': Service(PROTOCOLS['udp'], 16993, 'amt-soap-https'),
-        'amx-axbnet': Service(PROTOCOLS['udp'], 1320, 'amx-axbnet'),
-        'amx-icsp': Service(PROTOCOLS['udp'], 1319, 'amx-icsp'),
-        'amx-rms': Service(PROTOCOLS['udp'], 3839, 'amx-rms'),
-        'amx-webadmin': Service(PROTOCOLS['udp'], 2929, 'amx-webadmin'),
-        'amx-weblinx': Service(PROTOCOLS['udp'], 2930, 'amx-weblinx'),
-        'an-pcp': Service(PROTOCOLS['udp'], 3846, 'an-pcp'),
-        'an-signaling': Service(PROTOCOLS['udp'], 4936, 'an-signaling'),
-        'and-lm': Service(PROTOCOLS['udp'], 2646, 'and-lm'),
-        'anet': Service(PROTOCOLS['udp'], 212, 'anet'),
-        'anet-b': Service(PROTOCOLS['udp'], 3338, 'anet-b'),
-        'anet-h': Service(PROTOCOLS['udp'], 3341, 'anet-h'),
-        'anet-l': Service(PROTOCOLS['udp'], 3339, 'anet-l'),
-        'anet-m': Service(PROTOCOLS['udp'], 3340, 'anet-m'),
-        'anoto-rendezv': Service(PROTOCOLS['udp'], 3715, 'anoto-rendezv'),
-        'ans-console': Service(PROTOCOLS['udp'], 3440, 'ans-console'),
-        'ansanotify': Service(PROTOCOLS['udp'], 116, 'ansanotify'),
-        'ansatrader': Service(PROTOCOLS['udp'], 124, 'ansatrader'),
-        'ansoft-lm-1': Service(PROTOCOLS['udp'], 1083, 'ansoft-lm-1'),
-        'ansoft-lm-2': Service(PROTOCOLS['udp'], 1084, 'ansoft-lm-2'),
-        'answersoft-lm': Service(PROTOCOLS['udp'], 1781, 'answersoft-lm'),
-        'ansys-lm': Service(PROTOCOLS['udp'], 1800, 'ansys-lm'),
-        'ansysli': Service(PROTOCOLS['udp'], 2325, 'ansysli'),
-        'ansyslmd': Service(PROTOCOLS['udp'], 1055, 'ansyslmd'),
-        'anthony-data': Service(PROTOCOLS['udp'], 1206, 'anthony-data'),
-        'antidotemgrsvr': Service(PROTOCOLS['udp'], 2247, 'antidotemgrsvr'),
-        'aocp': Service(PROTOCOLS['udp'], 2712, 'aocp'),
-        'aodv': Service(PROTOCOLS['udp'], 654, 'aodv'),
-        'aol': Service(PROTOCOLS['udp'], 5190, 'aol'),
-        'aol-1': Service(PROTOCOLS['udp'], 5191, 'aol-1'),
-        'aol-2': Service(PROTOCOLS['udp'], 5192, 'aol-2'),
-        'aol-3': Service(PROTOCOLS['udp'], 5193, 'aol-3'),
-        'ap': Service(PROTOCOLS['udp'], 47806, 'ap'),
-        'apani1': Service(PROTOCOLS['udp'], 9160, 'apani1'),
-        'apani2': Service(PROTOCOLS['udp'], 9161, 'apani2'),
-        'apani3': Service(PROTOCOLS['udp'], 9162, 'apani3'),
-        'apani4': Service(PROTOCOLS['udp'], 9163, 'apani4'),
-        'apani5': Service(PROTOCOLS['udp'], 9164, 'apani5'),
-        'apc-2160': Service(PROTOCOLS['udp'], 2160, 'apc-2160'),
-        'apc-2161': Service(PROTOCOLS['udp'], 2161, 'apc-2161'),
-        'apc-2260': Service(PROTOCOLS['udp'], 2260, 'apc-2260'),
-        'apc-3052': Service(PROTOCOLS['udp'], 3052, 'apc-3052'),
-        'apc-3506': Service(PROTOCOLS['udp'], 3506, 'apc-3506'),
-        'apc-5454': Service(PROTOCOLS['udp'], 5454, 'apc-5454'),
-        'apc-5455': Service(PROTOCOLS['udp'], 5455, 'apc-5455'),
-        'apc-5456': Service(PROTOCOLS['udp'], 5456, 'apc-5456'),
-        'apc-6547': Service(PROTOCOLS['udp'], 6547, 'apc-6547'),
-        'apc-6548': Service(PROTOCOLS['udp'], 6548, 'apc-6548'),
-        'apc-6549': Service(PROTOCOLS['udp'], 6549, 'apc-6549'),
-        'apc-7845': Service(PROTOCOLS['udp'], 7845, 'apc-7845'),
-        'apc-7846': Service(PROTOCOLS['udp'], 7846, 'apc-7846'),
-        'apc-9950': Service(PROTOCOLS['udp'], 9950, 'apc-9950'),
-        'apc-9951': Service(PROTOCOLS['udp'], 9951, 'apc-9951'),
-        'apc-9952': Service(PROTOCOLS['udp'], 9952, 'apc-9952'),
-        'apc-necmp': Service(PROTOCOLS['udp'], 18888, 'apc-necmp'),
-        'apcupsd': Service(PROTOCOLS['udp'], 3551, 'apcupsd'),
-        'apdap': Service(PROTOCOLS['udp'], 3948, 'apdap'),
-        'apertus-ldp': Service(PROTOCOLS['udp'], 539, 'apertus-ldp'),
-        'apex-edge': Service(PROTOCOLS['udp'], 913, 'apex-edge'),
-        'apex-mesh': Service(PROTOCOLS['udp'], 912, 'apex-mesh'),
-        'aplx': Service(PROTOCOLS['udp'], 1134, 'aplx'),
-        'apm-link': Service(PROTOCOLS['udp'], 32483, 'apm-link'),
-        'apocd': Service(PROTOCOLS['udp'], 3809, 'apocd'),
-        'apogeex-port': Service(PROTOCOLS['udp'], 3184, 'apogeex-port'),
-        'apollo-admin': Service(PROTOCOLS['udp'], 8122, 'apollo-admin'),
-        'apollo-cc': Service(PROTOCOLS['udp'], 2754, 'apollo-cc'),
-        'apollo-data': Service(PROTOCOLS['udp'], 8121, 'apollo-data'),
-        'apollo-gms': Service(PROTOCOLS['udp'], 2759, 'apollo-gms'),
-        'apollo-relay': Service(PROTOCOLS['udp'], 10252, 'apollo-relay'),
-        'apollo-status': Service(PROTOCOLS['udp'], 2758, 'apollo-status'),
-        'apparenet-as': Service(PROTOCOLS['udp'], 3238, 'apparenet-as'),
-        'apparenet-tps': Service(PROTOCOLS['udp'], 3237, 'apparenet-tps'),
-        'apparenet-ts': Service(PROTOCOLS['udp'], 3236, 'apparenet-ts'),
-        'apparenet-ui': Service(PROTOCOLS['udp'], 3239, 'apparenet-ui'),
-        'appiq-mgmt': Service(PROTOCOLS['udp'], 4674, 'appiq-mgmt'),
-        'apple': Service(PROTOCOLS['udp'], 3283, 'apple'),
-        'apple-licman': Service(PROTOCOLS['udp'], 1381, 'apple-licman'),
-        'apple-sasl': Service(PROTOCOLS['udp'], 3659, 'apple-sasl'),
-        'apple-vpns-rp': Service(PROTOCOLS['udp'], 4112, 'apple-vpns-rp'),
-        'appleqtc': Service(PROTOCOLS['udp'], 458, 'appleqtc'),
-        'appleqtcsrvr': Service(PROTOCOLS['udp'], 545, 'appleqtcsrvr'),
-        'appleugcontrol': Service(PROTOCOLS['udp'], 2336, 'appleugcontrol'),
-        'appliance-cfg': Service(PROTOCOLS['udp'], 2898, 'appliance-cfg'),
-        'applix': Service(PROTOCOLS['udp'], 999, 'applix'),
-        'applus': Service(PROTOCOLS['udp'], 2037, 'applus'),
-        'appman-server': Service(PROTOCOLS['udp'], 3312, 'appman-server'),
-        'appserv-http': Service(PROTOCOLS['udp'], 4848, 'appserv-http'),
-        'appserv-https': Service(PROTOCOLS['udp'], 4849, 'appserv-https'),
-        'appss-lm': Service(PROTOCOLS['udp'], 3879, 'appss-lm'),
-        'appswitch-emp': Service(PROTOCOLS['udp'], 2616, 'appswitch-emp'),
-        'appworxsrv': Service(PROTOCOLS['udp'], 2136, 'appworxsrv'),
-        'apri-lm': Service(PROTOCOLS['udp'], 1447, 'apri-lm'),
-        'apsolab-rpc': Service(PROTOCOLS['udp'], 5474, 'apsolab-rpc'),
-        'apw-registry': Service(PROTOCOLS['udp'], 3758, 'apw-registry'),
-        'apwi-disc': Service(PROTOCOLS['udp'], 4394, 'apwi-disc'),
-        'apx500api-1': Service(PROTOCOLS['udp'], 2264, 'apx500api-1'),
-        'apx500api-2': Service(PROTOCOLS['udp'], 2265, 'apx500api-2'),
-        'arbortext-lm': Service(PROTOCOLS['udp'], 1557, 'arbortext-lm'),
-        'arcisdms': Service(PROTOCOLS['udp'], 262, 'arcisdms'),
-        'arcp': Service(PROTOCOLS['udp'], 7070, 'arcp'),
-        'arcpd': Service(PROTOCOLS['udp'], 3513, 'arcpd'),
-        'ardt': Service(PROTOCOLS['udp'], 1826, 'ardt'),
-        'ardus-cntl': Service(PROTOCOLS['udp'], 1116, 'ardus-cntl'),
-        'ardus-mtrns': Service(PROTOCOLS['udp'], 1117, 'ardus-mtrns'),
-        'ardus-trns': Service(PROTOCOLS['udp'], 1115, 'ardus-trns'),
-        'ardusmul': Service(PROTOCOLS['udp'], 1835, 'ardusmul'),
-        'ardusuni': Service(PROTOCOLS['udp'], 1834, 'ardusuni'),
-        'arena-server': Service(PROTOCOLS['udp'], 11321, 'arena-server'),
-        'arepa-cas': Service(PROTOCOLS['udp'], 3030, 'arepa-cas'),
-        'arepa-raft': Service(PROTOCOLS['udp'], 3025, 'arepa-raft'),
-        'argis-ds': Service(PROTOCOLS['udp'], 2582, 'argis-ds'),
-        'argis-te': Service(PROTOCOLS['udp'], 2581, 'argis-te'),
-        'aria': Service(PROTOCOLS['udp'], 2624, 'aria'),
-        'ariel1': Service(PROTOCOLS['udp'], 419, 'ariel1'),
-        'ariel2': Service(PROTOCOLS['udp'], 421, 'ariel2'),
-        'ariel3': Service(PROTOCOLS['udp'], 422, 'ariel3'),
-        'aries-kfinder': Service(PROTOCOLS['udp'], 7570, 'aries-kfinder'),
-        'ariliamulti': Service(PROTOCOLS['udp'], 3140, 'ariliamulti'),
-        'arkivio': Service(PROTOCOLS['udp'], 3426, 'arkivio'),
-        'armadp': Service(PROTOCOLS['udp'], 1913, 'armadp'),
-        'armagetronad': Service(PROTOCOLS['udp'], 4534, 'armagetronad'),
-        'armcenterhttp': Service(PROTOCOLS['udp'], 9294, 'armcenterhttp'),
-        'armcenterhttps': Service(PROTOCOLS['udp'], 9295, 'armcenterhttps'),
-        'armi-server': Service(PROTOCOLS['udp'], 3174, 'armi-server'),
-        'armtechdaemon': Service(PROTOCOLS['udp'], 9292, 'armtechdaemon'),
-        'arns': Service(PROTOCOLS['udp'], 384, 'arns'),
-        'array-manager': Service(PROTOCOLS['udp'], 3726, 'array-manager'),
-        'ars-master': Service(PROTOCOLS['udp'], 3176, 'ars-master'),
-        'ars-vista': Service(PROTOCOLS['udp'], 27782, 'ars-vista'),
-        'artifact-msg': Service(PROTOCOLS['udp'], 3518, 'artifact-msg'),
-        'aruba-server': Service(PROTOCOLS['udp'], 7166, 'aruba-server'),
-        'as-debug': Service(PROTOCOLS['udp'], 4026, 'as-debug'),
-        'as-servermap': Service(PROTOCOLS['udp'], 449, 'as-servermap'),
-        'asa': Service(PROTOCOLS['udp'], 386, 'asa'),
-        'asam': Service(PROTOCOLS['udp'], 3451, 'asam'),
-        'asap-udp': Service(PROTOCOLS['udp'], 3863, 'asap-udp'),
-        'asc-slmd': Service(PROTOCOLS['udp'], 4448, 'asc-slmd'),
-        'asci-val': Service(PROTOCOLS['udp'], 1560, 'asci-val'),
-        'ascomalarm': Service(PROTOCOLS['udp'], 4077, 'ascomalarm'),
-        'asctrl-agent': Service(PROTOCOLS['udp'], 5155, 'asctrl-agent'),
-        'asdis': Service(PROTOCOLS['udp'], 2192, 'asdis'),
-        'asf-rmcp': Service(PROTOCOLS['udp'], 623, 'asf-rmcp'),
-        'asf-secure-rmcp': Service(PROTOCOLS['udp'], 664, 'asf-secure-rmcp'),
-        'asi': Service(PROTOCOLS['udp'], 1827, 'asi'),
-        'asia': Service(PROTOCOLS['udp'], 626, 'asia'),
-        'asihpi': Service(PROTOCOLS['udp'], 44600, 'asihpi'),
-        'asip-webadmin': Service(PROTOCOLS['udp'], 311, 'asip-webadmin'),
-        'asipregistry': Service(PROTOCOLS['udp'], 687, 'asipregistry'),
-        'asmp-mon': Service(PROTOCOLS['udp'], 45000, 'asmp-mon'),
-        'asnaacceler8db': Service(PROTOCOLS['udp'], 5042, 'asnaacceler8db'),
-        'asoki-sma': Service(PROTOCOLS['udp'], 3087, 'asoki-sma'),
-        'aspcoordination': Service(PROTOCOLS['udp'], 7235, 'aspcoordination'),
-        'aspeclmd': Service(PROTOCOLS['udp'], 1544, 'aspeclmd'),
-        'aspen-services': Service(PROTOCOLS['udp'], 1749, 'aspen-services'),
-        'aspentec-lm': Service(PROTOCOLS['udp'], 6142, 'aspentec-lm'),
-        'asprovatalk': Service(PROTOCOLS['udp'], 1079, 'asprovatalk'),
-        'asr': Service(PROTOCOLS['udp'], 7800, 'asr'),
-        'assoc-disc': Service(PROTOCOLS['udp'], 24850, 'assoc-disc'),
-        'assuria-slm': Service(PROTOCOLS['udp'], 4119, 'assuria-slm'),
-        'astergate-disc': Service(PROTOCOLS['udp'], 9106, 'astergate-disc'),
-        'asterix': Service(PROTOCOLS['udp'], 8600, 'asterix'),
-        'astromed-main': Service(PROTOCOLS['udp'], 2864, 'astromed-main'),
-        'at-3': Service(PROTOCOLS['udp'], 203, 'at-3'),
-        'at-5': Service(PROTOCOLS['udp'], 205, 'at-5'),
-        'at-7': Service(PROTOCOLS['udp'], 207, 'at-7'),
-        'at-8': Service(PROTOCOLS['udp'], 208, 'at-8'),
-        'at-echo': Service(PROTOCOLS['udp'], 204, 'at-echo'),
-        'at-nbp': Service(PROTOCOLS['udp'], 202, 'at-nbp'),
-        'at-rtmp': Service(PROTOCOLS['udp'], 201, 'at-rtmp'),
-        'at-zis': Service(PROTOCOLS['udp'], 206, 'at-zis'),
-        'atc-appserver': Service(PROTOCOLS['udp'], 1171, 'atc-appserver'),
-        'atc-lm': Service(PROTOCOLS['udp'], 1170, 'atc-lm'),
-        'atex-elmd': Service(PROTOCOLS['udp'], 1385, 'atex-elmd'),
-        'atex_elmd': Service(PROTOCOLS['udp'], 1385, 'atex_elmd'),
-        'athand-mmp': Service(PROTOCOLS['udp'], 20999, 'athand-mmp'),
-        'ati-ip-to-ncpe': Service(PROTOCOLS['udp'], 3965, 'ati-ip-to-ncpe'),
-        'atlinks': Service(PROTOCOLS['udp'], 4154, 'atlinks'),
-        'atm-uhas': Service(PROTOCOLS['udp'], 11367, 'atm-uhas'),
-        'atm-zip-office': Service(PROTOCOLS['udp'], 1520, 'atm-zip-office'),
-        'atmp': Service(PROTOCOLS['udp'], 5150, 'atmp'),
-        'atmtcp': Service(PROTOCOLS['udp'], 2812, 'atmtcp'),
-        'ats': Service(PROTOCOLS['udp'], 2201, 'ats'),
-        'atsc-mh-ssc': Service(PROTOCOLS['udp'], 4937, 'atsc-mh-ssc'),
-        'attachmate-g32': Service(PROTOCOLS['udp'], 2317, 'attachmate-g32'),
-        'attachmate-s2s': Service(PROTOCOLS['udp'], 2419, 'attachmate-s2s'),
-        'attachmate-uts': Service(PROTOCOLS['udp'], 2304, 'attachmate-uts'),
-        'atul': Service(PROTOCOLS['udp'], 7543, 'atul'),
-        'audio-activmail': Service(PROTOCOLS['udp'], 1397, 'audio-activmail'),
-        'audiojuggler': Service(PROTOCOLS['udp'], 3643, 'audiojuggler'),
-        'audit': Service(PROTOCOLS['udp'], 182, 'audit'),
-        'audit-transfer': Service(PROTOCOLS['udp'], 1146, 'audit-transfer'),
-        'auditd': Service(PROTOCOLS['udp'], 48, 'auditd'),
-        'aura': Service(PROTOCOLS['udp'], 2066, 'aura'),
-        'auriga-router': Service(PROTOCOLS['udp'], 5680, 'auriga-router'),
-        'auris': Service(PROTOCOLS['udp'], 2772, 'auris'),
-        'aurora': Service(PROTOCOLS['udp'], 9084, 'aurora'),
-        'aurora-balaena': Service(PROTOCOLS['udp'], 33123, 'aurora-balaena'),
-        'aurora-cmgr': Service(PROTOCOLS['udp'], 364, 'aurora-cmgr'),
-        'aurp': Service(PROTOCOLS['udp'], 387, 'aurp'),
-        'auth': Service(PROTOCOLS['udp'], 113, 'auth'),
-        'authentx': Service(PROTOCOLS['udp'], 5067, 'authentx'),
-        'autocueds': Service(PROTOCOLS['udp'], 3437, 'autocueds'),
-        'autocuesmi': Service(PROTOCOLS['udp'], 3103, 'autocuesmi'),
-        'autocuetime': Service(PROTOCOLS['udp'], 3104, 'autocuetime'),
-        'autodesk-lm': Service(PROTOCOLS['udp'], 1422, 'autodesk-lm'),
-        'autodesk-nlm': Service(PROTOCOLS['udp'], 2080, 'autodesk-nlm'),
-        'autonoc': Service(PROTOCOLS['udp'], 1140, 'autonoc'),
-        'autopac': Service(PROTOCOLS['udp'], 4685, 'autopac'),
-        'av-emb-config': Service(PROTOCOLS['udp'], 2050, 'av-emb-config'),
-        'availant-mgr': Service(PROTOCOLS['udp'], 1122, 'availant-mgr'),
-        'avantageb2b': Service(PROTOCOLS['udp'], 2131, 'avantageb2b'),
-        'avanti-cdp': Service(PROTOCOLS['udp'], 4065, 'avanti-cdp'),
-        'avanti_cdp': Service(PROTOCOLS['udp'], 4065, 'avanti_cdp'),
-        'avauthsrvprtcl': Service(PROTOCOLS['udp'], 2068, 'avauthsrvprtcl'),
-        'avdecc': Service(PROTOCOLS['udp'], 17221, 'avdecc'),
-        'avenue': Service(PROTOCOLS['udp'], 2134, 'avenue'),
-        'avenyo': Service(PROTOCOLS['udp'], 2992, 'avenyo'),
-        'avi-nms-disc': Service(PROTOCOLS['udp'], 4413, 'avi-nms-disc'),
-        'avian': Service(PROTOCOLS['udp'], 486, 'avian'),
-        'avinstalldisc': Service(PROTOCOLS['udp'], 3502, 'avinstalldisc'),
-        'aviva-sna': Service(PROTOCOLS['udp'], 2238, 'aviva-sna'),
-        'avocent-adsap': Service(PROTOCOLS['udp'], 3871, 'avocent-adsap'),
-        'avocent-proxy': Service(PROTOCOLS['udp'], 1078, 'avocent-proxy'),
-        'avsecuremgmt': Service(PROTOCOLS['udp'], 3211, 'avsecuremgmt'),
-        'avt-profile-1': Service(PROTOCOLS['udp'], 5004, 'avt-profile-1'),
-        'avt-profile-2': Service(PROTOCOLS['udp'], 5005, 'avt-profile-2'),
-        'avtp': Service(PROTOCOLS['udp'], 17220, 'avtp'),
-        'awacs-ice': Service(PROTOCOLS['udp'], 4488, 'awacs-ice'),
-        'awg-proxy': Service(PROTOCOLS['udp'], 3277, 'awg-proxy'),
-        'aws-brf': Service(PROTOCOLS['udp'], 22800, 'aws-brf'),
-        'axio-disc': Service(PROTOCOLS['udp'], 35100, 'axio-disc'),
-        'axis-wimp-port': Service(PROTOCOLS['udp'], 10260, 'axis-wimp-port'),
-        'axon-lm': Service(PROTOCOLS['udp'], 1548, 'axon-lm'),
-        'axysbridge': Service(PROTOCOLS['udp'], 4418, 'axysbridge'),
-        'ayiya': Service(PROTOCOLS['udp'], 5072, 'ayiya'),
-        'azeti-bd': Service(PROTOCOLS['udp'], 4192, 'azeti-bd'),
-        'aztec': Service(PROTOCOLS['udp'], 3512, 'aztec'),
-        'b-novative-ls': Service(PROTOCOLS['udp'], 1896, 'b-novative-ls'),
-        'b2-license': Service(PROTOCOLS['udp'], 2204, 'b2-license'),
-        'b2-runtime': Service(PROTOCOLS['udp'], 2203, 'b2-runtime'),
-        'b2n': Service(PROTOCOLS['udp'], 1179, 'b2n'),
-        'babel': Service(PROTOCOLS['udp'], 6696, 'babel'),
-        'backburner': Service(PROTOCOLS['udp'], 2635, 'backburner'),
-        'backroomnet': Service(PROTOCOLS['udp'], 3387, 'backroomnet'),
-        'backup-express': Service(PROTOCOLS['udp'], 6123, 'backup-express'),
-        'backupedge': Service(PROTOCOLS['udp'], 3946, 'backupedge'),
-        'bacnet': Service(PROTOCOLS['udp'], 47808, 'bacnet'),
-        'bacula-dir': Service(PROTOCOLS['udp'], 9101, 'bacula-dir'),
-        'bacula-fd': Service(PROTOCOLS['udp'], 9102, 'bacula-fd'),
-        'bacula-sd': Service(PROTOCOLS['udp'], 9103, 'bacula-sd'),
-        'badm-priv': Service(PROTOCOLS['udp'], 6505, 'badm-priv'),
-        'badm-pub': Service(PROTOCOLS['udp'], 6506, 'badm-pub'),
-        'badm_priv': Service(PROTOCOLS['udp'], 6505, 'badm_priv'),
-        'badm_pub': Service(PROTOCOLS['udp'], 6506, 'badm_pub'),
-        'bandwiz-system': Service(PROTOCOLS['udp'], 1929, 'bandwiz-system'),
-        'banyan-net': Service(PROTOCOLS['udp'], 2708, 'banyan-net'),
-        'banyan-rpc': Service(PROTOCOLS['udp'], 567, 'banyan-rpc'),
-        'banyan-vip': Service(PROTOCOLS['udp'], 573, 'banyan-vip'),
-        'barracuda-bbs': Service(PROTOCOLS['udp'], 5120, 'barracuda-bbs'),
-        'base': Service(PROTOCOLS['udp'], 5429, 'base'),
-        'batman': Service(PROTOCOLS['udp'], 4305, 'batman'),
-        'bb': Service(PROTOCOLS['udp'], 1984, 'bb'),
-        'bbars': Service(PROTOCOLS['udp'], 3327, 'bbars'),
-        'bbn-mmc': Service(PROTOCOLS['udp'], 1347, 'bbn-mmc'),
-        'bbn-mmx': Service(PROTOCOLS['udp'], 1348, 'bbn-mmx'),
-        'bcinameservice': Service(PROTOCOLS['udp'], 3415, 'bcinameservice'),
-        'bcs': Service(PROTOCOLS['udp'], 4677, 'bcs'),
-        'bcs-broker': Service(PROTOCOLS['udp'], 1704, 'bcs-broker'),
-        'bcs-lmserver': Service(PROTOCOLS['udp'], 1951, 'bcs-lmserver'),
-        'bcslogc': Service(PROTOCOLS['udp'], 13216, 'bcslogc'),
-        'bctp': Service(PROTOCOLS['udp'], 8999, 'bctp'),
-        'bctp-server': Service(PROTOCOLS['udp'], 10107, 'bctp-server'),
-        'bdir-priv': Service(PROTOCOLS['udp'], 6507, 'bdir-priv'),
-        'bdir-pub': Service(PROTOCOLS['udp'], 6508, 'bdir-pub'),
-        'bdir_priv': Service(PROTOCOLS['udp'], 6507, 'bdir_priv'),
-        'bdir_pub': Service(PROTOCOLS['udp'], 6508, 'bdir_pub'),
-        'bdp': Service(PROTOCOLS['udp'], 581, 'bdp'),
-        'beacon-port': Service(PROTOCOLS['udp'], 3124, 'beacon-port'),
-        'beacon-port-2': Service(PROTOCOLS['udp'], 4426, 'beacon-port-2'),
-        'bears-01': Service(PROTOCOLS['udp'], 2852, 'bears-01'),
-        'bears-02': Service(PROTOCOLS['udp'], 3146, 'bears-02'),
-        'beeyond': Service(PROTOCOLS['udp'], 2414, 'beeyond'),
-        'beeyond-media': Service(PROTOCOLS['udp'], 1943, 'beeyond-media'),
-        'beorl': Service(PROTOCOLS['udp'], 5633, 'beorl'),
-        'besapi': Service(PROTOCOLS['udp'], 3408, 'besapi'),
-        'beserver-msg-q': Service(PROTOCOLS['udp'], 3527, 'beserver-msg-q'),
-        'bess': Service(PROTOCOLS['udp'], 3960, 'bess'),
-        'bex-webadmin': Service(PROTOCOLS['udp'], 6122, 'bex-webadmin'),
-        'bex-xr': Service(PROTOCOLS['udp'], 15660, 'bex-xr'),
-        'beyond-remote': Service(PROTOCOLS['udp'], 5424, 'beyond-remote'),
-        'bf-game': Service(PROTOCOLS['udp'], 25954, 'bf-game'),
-        'bf-master': Service(PROTOCOLS['udp'], 25955, 'bf-master'),
-        'bfd-control': Service(PROTOCOLS['udp'], 3784, 'bfd-control'),
-        'bfd-echo': Service(PROTOCOLS['udp'], 3785, 'bfd-echo'),
-        'bfd-lag': Service(PROTOCOLS['udp'], 6784, 'bfd-lag'),
-        'bfd-multi-ctl': Service(PROTOCOLS['udp'], 4784, 'bfd-multi-ctl'),
-        'bflckmgr': Service(PROTOCOLS['udp'], 3966, 'bflckmgr'),
-        'bftp': Service(PROTOCOLS['udp'], 152, 'bftp'),
-        'bgmp': Service(PROTOCOLS['udp'], 264, 'bgmp'),
-        'bgp': Service(PROTOCOLS['udp'], 179, 'bgp'),
-        'bgs-nsi': Service(PROTOCOLS['udp'], 482, 'bgs-nsi'),
-        'bh611': Service(PROTOCOLS['udp'], 354, 'bh611'),
-        'bhevent': Service(PROTOCOLS['udp'], 357, 'bhevent'),
-        'bhfhs': Service(PROTOCOLS['udp'], 248, 'bhfhs'),
-        'bhmds': Service(PROTOCOLS['udp'], 310, 'bhmds'),
-        'bhoedap4': Service(PROTOCOLS['udp'], 352, 'bhoedap4'),
-        'bhoetty': Service(PROTOCOLS['udp'], 351, 'bhoetty'),
-        'biap-mp': Service(PROTOCOLS['udp'], 1962, 'biap-mp'),
-        'biff': Service(PROTOCOLS['udp'], 512, 'biff'),
-        'biimenu': Service(PROTOCOLS['udp'], 18000, 'biimenu'),
-        'bilobit-update': Service(PROTOCOLS['udp'], 24577, 'bilobit-update'),
-        'bim-pem': Service(PROTOCOLS['udp'], 3783, 'bim-pem'),
-        'binderysupport': Service(PROTOCOLS['udp'], 2302, 'binderysupport'),
-        'binkp': Service(PROTOCOLS['udp'], 24554, 'binkp'),
-        'bintec-admin': Service(PROTOCOLS['udp'], 2107, 'bintec-admin'),
-        'bintec-capi': Service(PROTOCOLS['udp'], 2662, 'bintec-capi'),
-        'bintec-tapi': Service(PROTOCOLS['udp'], 2663, 'bintec-tapi'),
-        'biolink-auth': Service(PROTOCOLS['udp'], 3411, 'biolink-auth'),
-        'bioserver': Service(PROTOCOLS['udp'], 6946, 'bioserver'),
-        'bip': Service(PROTOCOLS['udp'], 4376, 'bip'),
-        'bis-sync': Service(PROTOCOLS['udp'], 5585, 'bis-sync'),
-        'bis-web': Service(PROTOCOLS['udp'], 5584, 'bis-web'),
-        'bitspeer': Service(PROTOCOLS['udp'], 2178, 'bitspeer'),
-        'bl-idm': Service(PROTOCOLS['udp'], 142, 'bl-idm'),
-        'blackboard': Service(PROTOCOLS['udp'], 2032, 'blackboard'),
-        'blackjack': Service(PROTOCOLS['udp'], 1025, 'blackjack'),
-        'blaze': Service(PROTOCOLS['udp'], 1150, 'blaze'),
-        'blizwow': Service(PROTOCOLS['udp'], 3724, 'blizwow'),
-        'blockade': Service(PROTOCOLS['udp'], 2911, 'blockade'),
-        'blockade-bpsp': Service(PROTOCOLS['udp'], 2574, 'blockade-bpsp'),
-        'blocks': Service(PROTOCOLS['udp'], 10288, 'blocks'),
-        'blp1': Service(PROTOCOLS['udp'], 8194, 'blp1'),
-        'blp2': Service(PROTOCOLS['udp'], 8195, 'blp2'),
-        'blp3': Service(PROTOCOLS['udp'], 8292, 'blp3'),
-        'blp4': Service(PROTOCOLS['udp'], 8294, 'blp4'),
-        'blp5': Service(PROTOCOLS['udp'], 48129, 'blp5'),
-        'blueberry-lm': Service(PROTOCOLS['udp'], 1432, 'blueberry-lm'),
-        'bluectrlproxy': Service(PROTOCOLS['udp'], 2277, 'bluectrlproxy'),
-        'bluelance': Service(PROTOCOLS['udp'], 2877, 'bluelance'),
-        'blwnkl-port': Service(PROTOCOLS['udp'], 2625, 'blwnkl-port'),
-        'bmap': Service(PROTOCOLS['udp'], 3421, 'bmap'),
-        'bmc-ar': Service(PROTOCOLS['udp'], 2494, 'bmc-ar'),
-        'bmc-ctd-ldap': Service(PROTOCOLS['udp'], 6301, 'bmc-ctd-ldap'),
-        'bmc-data-coll': Service(PROTOCOLS['udp'], 3695, 'bmc-data-coll'),
-        'bmc-ea': Service(PROTOCOLS['udp'], 3683, 'bmc-ea'),
-        'bmc-grx': Service(PROTOCOLS['udp'], 6300, 'bmc-grx'),
-        'bmc-jmx-port': Service(PROTOCOLS['udp'], 3604, 'bmc-jmx-port'),
-        'bmc-messaging': Service(PROTOCOLS['udp'], 2059, 'bmc-messaging'),
-        'bmc-net-adm': Service(PROTOCOLS['udp'], 1769, 'bmc-net-adm'),
-        'bmc-net-svc': Service(PROTOCOLS['udp'], 1770, 'bmc-net-svc'),
-        'bmc-onekey': Service(PROTOCOLS['udp'], 3561, 'bmc-onekey'),
-        'bmc-patroldb': Service(PROTOCOLS['udp'], 1313, 'bmc-patroldb'),
-        'bmc-perf-agent': Service(PROTOCOLS['udp'], 6767, 'bmc-perf-agent'),
-        'bmc-perf-mgrd': Service(PROTOCOLS['udp'], 6768, 'bmc-perf-mgrd'),
-        'bmc-perf-sd': Service(PROTOCOLS['udp'], 10128, 'bmc-perf-sd'),
-        'bmc-reporting': Service(PROTOCOLS['udp'], 4568, 'bmc-reporting'),
-        'bmc_ctd_ldap': Service(PROTOCOLS['udp'], 6301, 'bmc_ctd_ldap'),
-        'bmc_patroldb': Service(PROTOCOLS['udp'], 1313, 'bmc_patroldb'),
-        'bmcpatrolagent': Service(PROTOCOLS['udp'], 3181, 'bmcpatrolagent'),
-        'bmcpatrolrnvu': Service(PROTOCOLS['udp'], 3182, 'bmcpatrolrnvu'),
-        'bmpp': Service(PROTOCOLS['udp'], 632, 'bmpp'),
-        'bnet': Service(PROTOCOLS['udp'], 415, 'bnet'),
-        'bnetfile': Service(PROTOCOLS['udp'], 1120, 'bnetfile'),
-        'bnetgame': Service(PROTOCOLS['udp'], 1119, 'bnetgame'),
-        'bngsync': Service(PROTOCOLS['udp'], 10439, 'bngsync'),
-        'bnt-manager': Service(PROTOCOLS['udp'], 3344, 'bnt-manager'),
-        'board-roar': Service(PROTOCOLS['udp'], 9700, 'board-roar'),
-        'board-voip': Service(PROTOCOLS['udp'], 9750, 'board-voip'),
-        'boinc-client': Service(PROTOCOLS['udp'], 1043, 'boinc-client'),
-        'boks': Service(PROTOCOLS['udp'], 6500, 'boks'),
-        'boks-clntd': Service(PROTOCOLS['udp'], 6503, 'boks-clntd'),
-        'boks-servc': Service(PROTOCOLS['udp'], 6501, 'boks-servc'),
-        'boks-servm': Service(PROTOCOLS['udp'], 6502, 'boks-servm'),
-        'boks_clntd': Service(PROTOCOLS['udp'], 6503, 'boks_clntd'),
-        'boks_servc': Service(PROTOCOLS['udp'], 6501, 'boks_servc'),
-        'boks_servm': Service(PROTOCOLS['udp'], 6502, 'boks_servm'),
-        'boldsoft-lm': Service(PROTOCOLS['udp'], 2961, 'boldsoft-lm'),
-        'bones': Service(PROTOCOLS['udp'], 4914, 'bones'),
-        'boomerang': Service(PROTOCOLS['udp'], 1304, 'boomerang'),
-        'boosterware': Service(PROTOCOLS['udp'], 2913, 'boosterware'),
-        'bootclient': Service(PROTOCOLS['udp'], 2017, 'bootclient'),
-        'bootpc': Service(PROTOCOLS['udp'], 68, 'bootpc'),
-        'bootps': Service(PROTOCOLS['udp'], 67, 'bootps'),
-        'bootserver': Service(PROTOCOLS['udp'], 2016, 'bootserver'),
-        'borland-dsj': Service(PROTOCOLS['udp'], 707, 'borland-dsj'),
-        'boscap': Service(PROTOCOLS['udp'], 2990, 'boscap'),
-        'bounzza': Service(PROTOCOLS['udp'], 2218, 'bounzza'),
-        'boxp': Service(PROTOCOLS['udp'], 9380, 'boxp'),
-        'bpcd': Service(PROTOCOLS['udp'], 13782, 'bpcd'),
-        'bpcp-poll': Service(PROTOCOLS['udp'], 2844, 'bpcp-poll'),
-        'bpcp-trap': Service(PROTOCOLS['udp'], 2845, 'bpcp-trap'),
-        'bpdbm': Service(PROTOCOLS['udp'], 13721, 'bpdbm'),
-        'bpjava-msvc': Service(PROTOCOLS['udp'], 13722, 'bpjava-msvc'),
-        'bpmd': Service(PROTOCOLS['udp'], 3593, 'bpmd'),
-        'bprd': Service(PROTOCOLS['udp'], 13720, 'bprd'),
-        'br-channel': Service(PROTOCOLS['udp'], 5425, 'br-channel'),
-        'brain': Service(PROTOCOLS['udp'], 2169, 'brain'),
-        'brcd': Service(PROTOCOLS['udp'], 1323, 'brcd'),
-        'brcm-comm-port': Service(PROTOCOLS['udp'], 3188, 'brcm-comm-port'),
-        'brdptc': Service(PROTOCOLS['udp'], 2155, 'brdptc'),
-        'bre': Service(PROTOCOLS['udp'], 4096, 'bre'),
-        'brf-gw': Service(PROTOCOLS['udp'], 22951, 'brf-gw'),
-        'bridgecontrol': Service(PROTOCOLS['udp'], 1073, 'bridgecontrol'),
-        'brightcore': Service(PROTOCOLS['udp'], 5682, 'brightcore'),
-        'brlp-0': Service(PROTOCOLS['udp'], 4101, 'brlp-0'),
-        'brlp-1': Service(PROTOCOLS['udp'], 4102, 'brlp-1'),
-        'brlp-2': Service(PROTOCOLS['udp'], 4103, 'brlp-2'),
-        'brlp-3': Service(PROTOCOLS['udp'], 4104, 'brlp-3'),
-        'broker-service': Service(PROTOCOLS['udp'], 3014, 'broker-service'),
-        'broker_service': Service(PROTOCOLS['udp'], 3014, 'broker_service'),
-        'brp': Service(PROTOCOLS['udp'], 3043, 'brp'),
-        'bruce': Service(PROTOCOLS['udp'], 2619, 'bruce'),
-        'brutus': Service(PROTOCOLS['udp'], 2003, 'brutus'),
-        'brvread': Service(PROTOCOLS['udp'], 1054, 'brvread'),
-        'bspne-pcc': Service(PROTOCOLS['udp'], 1252, 'bspne-pcc'),
-        'bsquare-voip': Service(PROTOCOLS['udp'], 1071, 'bsquare-voip'),
-        'btpp2audctr1': Service(PROTOCOLS['udp'], 2536, 'btpp2audctr1'),
-        'btpp2sectrans': Service(PROTOCOLS['udp'], 2444, 'btpp2sectrans'),
-        'btprjctrl': Service(PROTOCOLS['udp'], 2803, 'btprjctrl'),
-        'btrieve': Service(PROTOCOLS['udp'], 3351, 'btrieve'),
-        'bts-appserver': Service(PROTOCOLS['udp'], 1961, 'bts-appserver'),
-        'bts-x73': Service(PROTOCOLS['udp'], 3681, 'bts-x73'),
-        'buddy-draw': Service(PROTOCOLS['udp'], 1854, 'buddy-draw'),
-        'bues-service': Service(PROTOCOLS['udp'], 2446, 'bues-service'),
-        'bues_service': Service(PROTOCOLS['udp'], 2446, 'bues_service'),
-        'bullant-rap': Service(PROTOCOLS['udp'], 2965, 'bullant-rap'),
-        'bullant-srap': Service(PROTOCOLS['udp'], 2964, 'bullant-srap'),
-        'buschtrommel': Service(PROTOCOLS['udp'], 4747, 'buschtrommel'),
-        'business': Service(PROTOCOLS['udp'], 3107, 'business'),
-        'busycal': Service(PROTOCOLS['udp'], 4990, 'busycal'),
-        'bv-agent': Service(PROTOCOLS['udp'], 3993, 'bv-agent'),
-        'bv-ds': Service(PROTOCOLS['udp'], 3992, 'bv-ds'),
-        'bv-is': Service(PROTOCOLS['udp'], 3990, 'bv-is'),
-        'bv-queryengine': Service(PROTOCOLS['udp'], 3989, 'bv-queryengine'),
-        'bv-smcsrv': Service(PROTOCOLS['udp'], 3991, 'bv-smcsrv'),
-        'bvcdaemon-port': Service(PROTOCOLS['udp'], 3626, 'bvcdaemon-port'),
-        'bvcontrol': Service(PROTOCOLS['udp'], 1236, 'bvcontrol'),
-        'bveapi': Service(PROTOCOLS['udp'], 10880, 'bveapi'),
-        'bvtsonar': Service(PROTOCOLS['udp'], 1149, 'bvtsonar'),
-        'bxp': Service(PROTOCOLS['udp'], 4027, 'bxp'),
-        'bytex': Service(PROTOCOLS['udp'], 1375, 'bytex'),
-        'bzflag': Service(PROTOCOLS['udp'], 5154, 'bzflag'),
-        'bzr': Service(PROTOCOLS['udp'], 4155, 'bzr'),
-        'c-h-it-port': Service(PROTOCOLS['udp'], 3778, 'c-h-it-port'),
-        'c1222-acse': Service(PROTOCOLS['udp'], 1153, 'c1222-acse'),
-        'c3': Service(PROTOCOLS['udp'], 2472, 'c3'),
-        'ca-1': Service(PROTOCOLS['udp'], 5064, 'ca-1'),
-        'ca-2': Service(PROTOCOLS['udp'], 5065, 'ca-2'),
-        'ca-audit-da': Service(PROTOCOLS['udp'], 8025, 'ca-audit-da'),
-        'ca-audit-ds': Service(PROTOCOLS['udp'], 8026, 'ca-audit-ds'),
-        'ca-idms': Service(PROTOCOLS['udp'], 3709, 'ca-idms'),
-        'ca-web-update': Service(PROTOCOLS['udp'], 14414, 'ca-web-update'),
-        'caaclang2': Service(PROTOCOLS['udp'], 5249, 'caaclang2'),
-        'caacws': Service(PROTOCOLS['udp'], 5248, 'caacws'),
-        'cab-protocol': Service(PROTOCOLS['udp'], 595, 'cab-protocol'),
-        'cableport-ax': Service(PROTOCOLS['udp'], 282, 'cableport-ax'),
-        'cabsm-comm': Service(PROTOCOLS['udp'], 7161, 'cabsm-comm'),
-        'caci-lm': Service(PROTOCOLS['udp'], 1554, 'caci-lm'),
-        'cacsambroker': Service(PROTOCOLS['udp'], 7163, 'cacsambroker'),
-        'cadabra-lm': Service(PROTOCOLS['udp'], 1563, 'cadabra-lm'),
-        'cadencecontrol': Service(PROTOCOLS['udp'], 2318, 'cadencecontrol'),
-        'cadis-1': Service(PROTOCOLS['udp'], 1441, 'cadis-1'),
-        'cadis-2': Service(PROTOCOLS['udp'], 1442, 'cadis-2'),
-        'cadkey-licman': Service(PROTOCOLS['udp'], 1399, 'cadkey-licman'),
-        'cadkey-tablet': Service(PROTOCOLS['udp'], 1400, 'cadkey-tablet'),
-        'cadlock': Service(PROTOCOLS['udp'], 770, 'cadlock'),
-        'cadlock2': Service(PROTOCOLS['udp'], 1000, 'cadlock2'),
-        'cadsi-lm': Service(PROTOCOLS['udp'], 1387, 'cadsi-lm'),
-        'cadview-3d': Service(PROTOCOLS['udp'], 649, 'cadview-3d'),
-        'caerpc': Service(PROTOCOLS['udp'], 42510, 'caerpc'),
-        'caevms': Service(PROTOCOLS['udp'], 5251, 'caevms'),
-        'caicci': Service(PROTOCOLS['udp'], 1721, 'caicci'),
-        'caiccipc': Service(PROTOCOLS['udp'], 1202, 'caiccipc'),
-        'caids-sensor': Service(PROTOCOLS['udp'], 1192, 'caids-sensor'),
-        'cailic': Service(PROTOCOLS['udp'], 216, 'cailic'),
-        'caistoragemgr': Service(PROTOCOLS['udp'], 7162, 'caistoragemgr'),
-        'cajo-discovery': Service(PROTOCOLS['udp'], 1198, 'cajo-discovery'),
-        'cal': Service(PROTOCOLS['udp'], 588, 'cal'),
-        'call-logging': Service(PROTOCOLS['udp'], 2552, 'call-logging'),
-        'call-sig-trans': Service(PROTOCOLS['udp'], 2517, 'call-sig-trans'),
-        'caller9': Service(PROTOCOLS['udp'], 2906, 'caller9'),
-        'calltrax': Service(PROTOCOLS['udp'], 3675, 'calltrax'),
-        'callwaveiam': Service(PROTOCOLS['udp'], 9283, 'callwaveiam'),
-        'camac': Service(PROTOCOLS['udp'], 3545, 'camac'),
-        'cambertx-lm': Service(PROTOCOLS['udp'], 1734, 'cambertx-lm'),
-        'camp': Service(PROTOCOLS['udp'], 4450, 'camp'),
-        'can-dch': Service(PROTOCOLS['udp'], 1919, 'can-dch'),
-        'can-ferret': Service(PROTOCOLS['udp'], 1920, 'can-ferret'),
-        'can-ferret-ssl': Service(PROTOCOLS['udp'], 3661, 'can-ferret-ssl'),
-        'can-nds': Service(PROTOCOLS['udp'], 1918, 'can-nds'),
-        'can-nds-ssl': Service(PROTOCOLS['udp'], 3660, 'can-nds-ssl'),
-        'canditv': Service(PROTOCOLS['udp'], 24676, 'canditv'),
-        'candp': Service(PROTOCOLS['udp'], 42508, 'candp'),
-        'candrp': Service(PROTOCOLS['udp'], 42509, 'candrp'),
-        'canex-watch': Service(PROTOCOLS['udp'], 3583, 'canex-watch'),
-        'canocentral0': Service(PROTOCOLS['udp'], 1871, 'canocentral0'),
-        'canocentral1': Service(PROTOCOLS['udp'], 1872, 'canocentral1'),
-        'canon-bjnp1': Service(PROTOCOLS['udp'], 8611, 'canon-bjnp1'),
-        'canon-bjnp2': Service(PROTOCOLS['udp'], 8612, 'canon-bjnp2'),
-        'canon-bjnp3': Service(PROTOCOLS['udp'], 8613, 'canon-bjnp3'),
-        'canon-bjnp4': Service(PROTOCOLS['udp'], 8614, 'canon-bjnp4'),
-        'canon-capt': Service(PROTOCOLS['udp'], 3756, 'canon-capt'),
-        'canon-cpp-disc': Service(PROTOCOLS['udp'], 8609, 'canon-cpp-disc'),
-        'canon-mfnp': Service(PROTOCOLS['udp'], 8610, 'canon-mfnp'),
-        'cap': Service(PROTOCOLS['udp'], 1026, 'cap'),
-        'capfast-lmd': Service(PROTOCOLS['udp'], 1756, 'capfast-lmd'),
-        'capioverlan': Service(PROTOCOLS['udp'], 1147, 'capioverlan'),
-        'capmux': Service(PROTOCOLS['udp'], 4728, 'capmux'),
-        'caps-lm': Service(PROTOCOLS['udp'], 3290, 'caps-lm'),
-        'capwap-control': Service(PROTOCOLS['udp'], 5246, 'capwap-control'),
-        'capwap-data': Service(PROTOCOLS['udp'], 5247, 'capwap-data'),
-        'cardax': Service(PROTOCOLS['udp'], 1072, 'cardax'),
-        'cardbox': Service(PROTOCOLS['udp'], 3105, 'cardbox'),
-        'cardbox-http': Service(PROTOCOLS['udp'], 3106, 'cardbox-http'),
-        'cardweb-rt': Service(PROTOCOLS['udp'], 9060, 'cardweb-rt'),
-        'carrius-rshell': Service(PROTOCOLS['udp'], 1197, 'carrius-rshell'),
-        'cart-o-rama': Service(PROTOCOLS['udp'], 3292, 'cart-o-rama'),
-        'cartographerxmp': Service(PROTOCOLS['udp'], 5270, 'cartographerxmp'),
-        'cas': Service(PROTOCOLS['udp'], 2418, 'cas'),
-        'cas-mapi': Service(PROTOCOLS['udp'], 3682, 'cas-mapi'),
-        'casanswmgmt': Service(PROTOCOLS['udp'], 3669, 'casanswmgmt'),
-        'casp': Service(PROTOCOLS['udp'], 1130, 'casp'),
-        'caspssl': Service(PROTOCOLS['udp'], 1131, 'caspssl'),
-        'castorproxy': Service(PROTOCOLS['udp'], 3450, 'castorproxy'),
-        'catalyst': Service(PROTOCOLS['udp'], 2836, 'catalyst'),
-        'catchpole': Service(PROTOCOLS['udp'], 1185, 'catchpole'),
-        'caupc-remote': Service(PROTOCOLS['udp'], 2122, 'caupc-remote'),
-        'cautcpd': Service(PROTOCOLS['udp'], 3061, 'cautcpd'),
-        'cawas': Service(PROTOCOLS['udp'], 12168, 'cawas'),
-        'cba8': Service(PROTOCOLS['udp'], 9593, 'cba8'),
-        'cbos-ip-port': Service(PROTOCOLS['udp'], 3750, 'cbos-ip-port'),
-        'cbserver': Service(PROTOCOLS['udp'], 3388, 'cbserver'),
-        'cbt': Service(PROTOCOLS['udp'], 7777, 'cbt'),
-        'cc-tracking': Service(PROTOCOLS['udp'], 4870, 'cc-tracking'),
-        'ccag-pib': Service(PROTOCOLS['udp'], 7169, 'ccag-pib'),
-        'ccm-port': Service(PROTOCOLS['udp'], 3575, 'ccm-port'),
-        'ccmad': Service(PROTOCOLS['udp'], 3114, 'ccmad'),
-        'ccmail': Service(PROTOCOLS['udp'], 3264, 'ccmail'),
-        'ccmcomm': Service(PROTOCOLS['udp'], 3505, 'ccmcomm'),
-        'ccmrmi': Service(PROTOCOLS['udp'], 3154, 'ccmrmi'),
-        'ccnx': Service(PROTOCOLS['udp'], 9695, 'ccnx'),
-        'ccowcmr': Service(PROTOCOLS['udp'], 2116, 'ccowcmr'),
-        'ccp': Service(PROTOCOLS['udp'], 3947, 'ccp'),
-        'ccs-software': Service(PROTOCOLS['udp'], 2734, 'ccs-software'),
-        'ccss-qmm': Service(PROTOCOLS['udp'], 4969, 'ccss-qmm'),
-        'ccss-qsm': Service(PROTOCOLS['udp'], 4970, 'ccss-qsm'),
-        'cctv-port': Service(PROTOCOLS['udp'], 3559, 'cctv-port'),
-        'ccu-comm-1': Service(PROTOCOLS['udp'], 4053, 'ccu-comm-1'),
-        'ccu-comm-2': Service(PROTOCOLS['udp'], 4054, 'ccu-comm-2'),
-        'ccu-comm-3': Service(PROTOCOLS['udp'], 4055, 'ccu-comm-3'),
-        'cd3o-protocol': Service(PROTOCOLS['udp'], 3616, 'cd3o-protocol'),
-        'cdbroker': Service(PROTOCOLS['udp'], 3376, 'cdbroker'),
-        'cdc': Service(PROTOCOLS['udp'], 223, 'cdc'),
-        'cddbp-alt': Service(PROTOCOLS['udp'], 8880, 'cddbp-alt'),
-        'cdfunc': Service(PROTOCOLS['udp'], 2045, 'cdfunc'),
-        'cdid': Service(PROTOCOLS['udp'], 3315, 'cdid'),
-        'cdl-server': Service(PROTOCOLS['udp'], 3056, 'cdl-server'),
-        'cdn': Service(PROTOCOLS['udp'], 2412, 'cdn'),
-        'cds': Service(PROTOCOLS['udp'], 4115, 'cds'),
-        'cecsvc': Service(PROTOCOLS['udp'], 2571, 'cecsvc'),
-        'cedros-fds': Service(PROTOCOLS['udp'], 4140, 'cedros-fds'),
-        'cedros_fds': Service(PROTOCOLS['udp'], 4140, 'cedros_fds'),
-        'cefd-vmp': Service(PROTOCOLS['udp'], 10023, 'cefd-vmp'),
-        'celatalk': Service(PROTOCOLS['udp'], 3485, 'celatalk'),
-        'centerline': Service(PROTOCOLS['udp'], 3987, 'centerline'),
-        'centra': Service(PROTOCOLS['udp'], 1709, 'centra'),
-        'cequint-cityid': Service(PROTOCOLS['udp'], 4074, 'cequint-cityid'),
-        'cera-bcm': Service(PROTOCOLS['udp'], 1794, 'cera-bcm'),
-        'cernsysmgmtagt': Service(PROTOCOLS['udp'], 3830, 'cernsysmgmtagt'),
-        'cert-initiator': Service(PROTOCOLS['udp'], 1639, 'cert-initiator'),
-        'cert-responder': Service(PROTOCOLS['udp'], 1640, 'cert-responder'),
-        'cesdcdman': Service(PROTOCOLS['udp'], 2921, 'cesdcdman'),
-        'cesdcdtrn': Service(PROTOCOLS['udp'], 2922, 'cesdcdtrn'),
-        'cesdinv': Service(PROTOCOLS['udp'], 2856, 'cesdinv'),
-        'cfdptkt': Service(PROTOCOLS['udp'], 120, 'cfdptkt'),
-        'cfengine': Service(PROTOCOLS['udp'], 5308, 'cfengine'),
-        'cfs': Service(PROTOCOLS['udp'], 7546, 'cfs'),
-        'cft-0': Service(PROTOCOLS['udp'], 1761, 'cft-0'),
-        'cft-1': Service(PROTOCOLS['udp'], 1762, 'cft-1'),
-        'cft-2': Service(PROTOCOLS['udp'], 1763, 'cft-2'),
-        'cft-3': Service(PROTOCOLS['udp'], 1764, 'cft-3'),
-        'cft-4': Service(PROTOCOLS['udp'], 1765, 'cft-4'),
-        'cft-5': Service(PROTOCOLS['udp'], 1766, 'cft-5'),
-        'cft-6': Service(PROTOCOLS['udp'], 1767, 'cft-6'),
-        'cft-7': Service(PROTOCOLS['udp'], 1768, 'cft-7'),
-        'cgi-starapi': Service(PROTOCOLS['udp'], 3893, 'cgi-starapi'),
-        'cgms': Service(PROTOCOLS['udp'], 3003, 'cgms'),
-        'cgn-config': Service(PROTOCOLS['udp'], 2183, 'cgn-config'),
-        'cgn-stat': Service(PROTOCOLS['udp'], 2182, 'cgn-stat'),
-        'chargen': Service(PROTOCOLS['udp'], 19, 'chargen'),
-        'charsetmgr': Service(PROTOCOLS['udp'], 3903, 'charsetmgr'),
-        'checkoutdb': Service(PROTOCOLS['udp'], 5505, 'checkoutdb'),
-        'checkpoint-rtm': Service(PROTOCOLS['udp'], 18241, 'checkpoint-rtm'),
-        'checksum': Service(PROTOCOLS['udp'], 1386, 'checksum'),
-        'chevinservices': Service(PROTOCOLS['udp'], 3349, 'chevinservices'),
-        'childkey-ctrl': Service(PROTOCOLS['udp'], 1892, 'childkey-ctrl'),
-        'childkey-notif': Service(PROTOCOLS['udp'], 1891, 'childkey-notif'),
-        'chimera-hwm': Service(PROTOCOLS['udp'], 4009, 'chimera-hwm'),
-        'chip-lm': Service(PROTOCOLS['udp'], 1572, 'chip-lm'),
-        'chipper': Service(PROTOCOLS['udp'], 17219, 'chipper'),
-        'chmd': Service(PROTOCOLS['udp'], 3099, 'chmd'),
-        'chromagrafx': Service(PROTOCOLS['udp'], 1373, 'chromagrafx'),
-        'chshell': Service(PROTOCOLS['udp'], 562, 'chshell'),
-        'ci3-software-1': Service(PROTOCOLS['udp'], 1301, 'ci3-software-1'),
-        'ci3-software-2': Service(PROTOCOLS['udp'], 1302, 'ci3-software-2'),
-        'cichild-lm': Service(PROTOCOLS['udp'], 1523, 'cichild-lm'),
-        'cichlid': Service(PROTOCOLS['udp'], 1377, 'cichlid'),
-        'cifs': Service(PROTOCOLS['udp'], 3020, 'cifs'),
-        'cimplex': Service(PROTOCOLS['udp'], 673, 'cimplex'),
-        'cimtrak': Service(PROTOCOLS['udp'], 3749, 'cimtrak'),
-        'cindycollab': Service(PROTOCOLS['udp'], 3770, 'cindycollab'),
-        'cinegrfx-elmd': Service(PROTOCOLS['udp'], 2891, 'cinegrfx-elmd'),
-        'cinegrfx-lm': Service(PROTOCOLS['udp'], 1743, 'cinegrfx-lm'),
-        'ciphire-data': Service(PROTOCOLS['udp'], 3887, 'ciphire-data'),
-        'ciphire-serv': Service(PROTOCOLS['udp'], 3888, 'ciphire-serv'),
-        'circle-x': Service(PROTOCOLS['udp'], 2931, 'circle-x'),
-        'cis': Service(PROTOCOLS['udp'], 22305, 'cis'),
-        'cis-secure': Service(PROTOCOLS['udp'], 22343, 'cis-secure'),
-        'cisco-aqos': Service(PROTOCOLS['udp'], 9081, 'cisco-aqos'),
-        'cisco-fna': Service(PROTOCOLS['udp'], 130, 'cisco-fna'),
-        'cisco-ipsla': Service(PROTOCOLS['udp'], 1167, 'cisco-ipsla'),
-        'cisco-net-mgmt': Service(PROTOCOLS['udp'], 1741, 'cisco-net-mgmt'),
-        'cisco-redu': Service(PROTOCOLS['udp'], 5786, 'cisco-redu'),
-        'cisco-sccp': Service(PROTOCOLS['udp'], 2000, 'cisco-sccp'),
-        'cisco-snat': Service(PROTOCOLS['udp'], 15555, 'cisco-snat'),
-        'cisco-sys': Service(PROTOCOLS['udp'], 132, 'cisco-sys'),
-        'cisco-tdp': Service(PROTOCOLS['udp'], 711, 'cisco-tdp'),
-        'cisco-tna': Service(PROTOCOLS['udp'], 131, 'cisco-tna'),
-        'cisco-vpath-tun': Service(PROTOCOLS['udp'], 6633, 'cisco-vpath-tun'),
-        'cisco-wafs': Service(PROTOCOLS['udp'], 4050, 'cisco-wafs'),
-        'ciscocsdb': Service(PROTOCOLS['udp'], 43441, 'ciscocsdb'),
-        'citadel': Service(PROTOCOLS['udp'], 504, 'citadel'),
-        'citrix-rtmp': Service(PROTOCOLS['udp'], 2897, 'citrix-rtmp'),
-        'citrixadmin': Service(PROTOCOLS['udp'], 2513, 'citrixadmin'),
-        'citrixima': Service(PROTOCOLS['udp'], 2512, 'citrixima'),
-        'citriximaclient': Service(PROTOCOLS['udp'], 2598, 'citriximaclient'),
-        'citynl': Service(PROTOCOLS['udp'], 1729, 'citynl'),
-        'citysearch': Service(PROTOCOLS['udp'], 3974, 'citysearch'),
-        'cl-1': Service(PROTOCOLS['udp'], 172, 'cl-1'),
-        'cl-db-attach': Service(PROTOCOLS['udp'], 4135, 'cl-db-attach'),
-        'cl-db-remote': Service(PROTOCOLS['udp'], 4137, 'cl-db-remote'),
-        'cl-db-request': Service(PROTOCOLS['udp'], 4136, 'cl-db-request'),
-        'cl/1': Service(PROTOCOLS['udp'], 172, 'cl/1'),
-        'clariion-evr01': Service(PROTOCOLS['udp'], 6389, 'clariion-evr01'),
-        'classic': Service(PROTOCOLS['udp'], 9087, 'classic'),
-        'cleanerliverc': Service(PROTOCOLS['udp'], 3481, 'cleanerliverc'),
-        'clearcase': Service(PROTOCOLS['udp'], 371, 'clearcase'),
-        'clearvisn': Service(PROTOCOLS['udp'], 2052, 'clearvisn'),
-        'client-ctrl': Service(PROTOCOLS['udp'], 3730, 'client-ctrl'),
-        'client-wakeup': Service(PROTOCOLS['udp'], 9694, 'client-wakeup'),
-        'cloanto-lm': Service(PROTOCOLS['udp'], 3397, 'cloanto-lm'),
-        'cloanto-net-1': Service(PROTOCOLS['udp'], 356, 'cloanto-net-1'),
-        'close-combat': Service(PROTOCOLS['udp'], 1944, 'close-combat'),
-        'cloudcheck-ping': Service(PROTOCOLS['udp'], 45514, 'cloudcheck-ping'),
-        'cloudsignaling': Service(PROTOCOLS['udp'], 7550, 'cloudsignaling'),
-        'clp': Service(PROTOCOLS['udp'], 2567, 'clp'),
-        'cluster-disc': Service(PROTOCOLS['udp'], 3374, 'cluster-disc'),
-        'clutild': Service(PROTOCOLS['udp'], 7174, 'clutild'),
-        'clvm-cfg': Service(PROTOCOLS['udp'], 1476, 'clvm-cfg'),
-        'cm': Service(PROTOCOLS['udp'], 5910, 'cm'),
-        'cma': Service(PROTOCOLS['udp'], 1050, 'cma'),
-        'cmadmin': Service(PROTOCOLS['udp'], 2617, 'cmadmin'),
-        'cmc-port': Service(PROTOCOLS['udp'], 3576, 'cmc-port'),
-        'cmip-agent': Service(PROTOCOLS['udp'], 164, 'cmip-agent'),
-        'cmip-man': Service(PROTOCOLS['udp'], 163, 'cmip-man'),
-        'cmmdriver': Service(PROTOCOLS['udp'], 1294, 'cmmdriver'),
-        'cmtp-av': Service(PROTOCOLS['udp'], 8501, 'cmtp-av'),
-        'cnap': Service(PROTOCOLS['udp'], 7262, 'cnap'),
-        'cncp': Service(PROTOCOLS['udp'], 4785, 'cncp'),
-        'cnhrp': Service(PROTOCOLS['udp'], 1757, 'cnhrp'),
-        'cnrp': Service(PROTOCOLS['udp'], 2757, 'cnrp'),
-        'cnrprotocol': Service(PROTOCOLS['udp'], 1096, 'cnrprotocol'),
-        'cns-srv-port': Service(PROTOCOLS['udp'], 2976, 'cns-srv-port'),
-        'coap': Service(PROTOCOLS['udp'], 5683, 'coap'),
-        'coaps': Service(PROTOCOLS['udp'], 5684, 'coaps'),
-        'coauthor': Service(PROTOCOLS['udp'], 1529, 'coauthor'),
-        'codaauth2': Service(PROTOCOLS['udp'], 370, 'codaauth2'),
-        'codasrv': Service(PROTOCOLS['udp'], 2432, 'codasrv'),
-        'codasrv-se': Service(PROTOCOLS['udp'], 2433, 'codasrv-se'),
-        'codemeter': Service(PROTOCOLS['udp'], 22350, 'codemeter'),
-        'codima-rtp': Service(PROTOCOLS['udp'], 2415, 'codima-rtp'),
-        'cogitate': Service(PROTOCOLS['udp'], 3039, 'cogitate'),
-        'cognex-insight': Service(PROTOCOLS['udp'], 1069, 'cognex-insight'),
-        'cognima': Service(PROTOCOLS['udp'], 3779, 'cognima'),
-        'cogsys-lm': Service(PROTOCOLS['udp'], 3377, 'cogsys-lm'),
-        'coherence-disc': Service(PROTOCOLS['udp'], 7574, 'coherence-disc'),
-        'collaber': Service(PROTOCOLS['udp'], 7689, 'collaber'),
-        'collaborator': Service(PROTOCOLS['udp'], 622, 'collaborator'),
-        'colubris': Service(PROTOCOLS['udp'], 3490, 'colubris'),
-        'com-bardac-dw': Service(PROTOCOLS['udp'], 48556, 'com-bardac-dw'),
-        'combox-web-acc': Service(PROTOCOLS['udp'], 2534, 'combox-web-acc'),
-        'comcam': Service(PROTOCOLS['udp'], 2108, 'comcam'),
-        'comcam-io': Service(PROTOCOLS['udp'], 3605, 'comcam-io'),
-        'commandport': Service(PROTOCOLS['udp'], 3416, 'commandport'),
-        'commerce': Service(PROTOCOLS['udp'], 542, 'commerce'),
-        'commlinx-avl': Service(PROTOCOLS['udp'], 1190, 'commlinx-avl'),
-        'commonspace': Service(PROTOCOLS['udp'], 1592, 'commonspace'),
-        'commplex-link': Service(PROTOCOLS['udp'], 5001, 'commplex-link'),
-        'commplex-main': Service(PROTOCOLS['udp'], 5000, 'commplex-main'),
-        'commtact-http': Service(PROTOCOLS['udp'], 20002, 'commtact-http'),
-        'commtact-https': Service(PROTOCOLS['udp'], 20003, 'commtact-https'),
-        'community': Service(PROTOCOLS['udp'], 2459, 'community'),
-        'comotionback': Service(PROTOCOLS['udp'], 2262, 'comotionback'),
-        'comotionmaster': Service(PROTOCOLS['udp'], 2261, 'comotionmaster'),
-        'compaq-evm': Service(PROTOCOLS['udp'], 619, 'compaq-evm'),
-        'compaq-https': Service(PROTOCOLS['udp'], 2381, 'compaq-https'),
-        'compaq-scp': Service(PROTOCOLS['udp'], 2766, 'compaq-scp'),
-        'compaq-wcp': Service(PROTOCOLS['udp'], 2555, 'compaq-wcp'),
-        'composit-server': Service(PROTOCOLS['udp'], 2417, 'composit-server'),
-        'compressnet': Service(PROTOCOLS['udp'], 3, 'compressnet'),
-        'compx-lockview': Service(PROTOCOLS['udp'], 4308, 'compx-lockview'),
-        'comsat': Service(PROTOCOLS['udp'], 512, 'comsat'),
-        'comscm': Service(PROTOCOLS['udp'], 437, 'comscm'),
-        'con': Service(PROTOCOLS['udp'], 759, 'con'),
-        'conclave-cpp': Service(PROTOCOLS['udp'], 2491, 'conclave-cpp'),
-        'concomp1': Service(PROTOCOLS['udp'], 1802, 'concomp1'),
-        'concurrent-lm': Service(PROTOCOLS['udp'], 1648, 'concurrent-lm'),
-        'condor': Service(PROTOCOLS['udp'], 9618, 'condor'),
-        'conference': Service(PROTOCOLS['udp'], 531, 'conference'),
-        'conferencetalk': Service(PROTOCOLS['udp'], 1713, 'conferencetalk'),
-        'config-port': Service(PROTOCOLS['udp'], 3577, 'config-port'),
-        'confluent': Service(PROTOCOLS['udp'], 1484, 'confluent'),
-        'connect': Service(PROTOCOLS['udp'], 2137, 'connect'),
-        'connect-client': Service(PROTOCOLS['udp'], 3441, 'connect-client'),
-        'connect-server': Service(PROTOCOLS['udp'], 3442, 'connect-server'),
-        'connected': Service(PROTOCOLS['udp'], 16384, 'connected'),
-        'connection': Service(PROTOCOLS['udp'], 2607, 'connection'),
-        'connendp': Service(PROTOCOLS['udp'], 693, 'connendp'),
-        'connlcli': Service(PROTOCOLS['udp'], 1358, 'connlcli'),
-        'conspiracy': Service(PROTOCOLS['udp'], 4692, 'conspiracy'),
-        'consul-insight': Service(PROTOCOLS['udp'], 5992, 'consul-insight'),
-        'contamac-icm': Service(PROTOCOLS['udp'], 4846, 'contamac-icm'),
-        'contamac_icm': Service(PROTOCOLS['udp'], 4846, 'contamac_icm'),
-        'contclientms': Service(PROTOCOLS['udp'], 4665, 'contclientms'),
-        'contentserver': Service(PROTOCOLS['udp'], 3365, 'contentserver'),
-        'continuus': Service(PROTOCOLS['udp'], 5412, 'continuus'),
-        'coord-svr': Service(PROTOCOLS['udp'], 2565, 'coord-svr'),
-        'cops': Service(PROTOCOLS['udp'], 3288, 'cops'),
-        'cops-tls': Service(PROTOCOLS['udp'], 3183, 'cops-tls'),
-        'copy-disc': Service(PROTOCOLS['udp'], 8445, 'copy-disc'),
-        'cora-disc': Service(PROTOCOLS['udp'], 19220, 'cora-disc'),
-        'corba-iiop': Service(PROTOCOLS['udp'], 683, 'corba-iiop'),
-        'corba-iiop-ssl': Service(PROTOCOLS['udp'], 684, 'corba-iiop-ssl'),
-        'corbaloc': Service(PROTOCOLS['udp'], 2809, 'corbaloc'),
-        'corel-vncadmin': Service(PROTOCOLS['udp'], 2654, 'corel-vncadmin'),
-        'corel_vncadmin': Service(PROTOCOLS['udp'], 2654, 'corel_vncadmin'),
-        'corelccam': Service(PROTOCOLS['udp'], 4300, 'corelccam'),
-        'corelvideo': Service(PROTOCOLS['udp'], 1566, 'corelvideo'),
-        'corerjd': Service(PROTOCOLS['udp'], 284, 'corerjd'),
-        'cosmocall': Service(PROTOCOLS['udp'], 2324, 'cosmocall'),
-        'couchdb': Service(PROTOCOLS['udp'], 5984, 'couchdb'),
-        'courier': Service(PROTOCOLS['udp'], 530, 'courier'),
-        'covia': Service(PROTOCOLS['udp'], 64, 'covia'),
-        'cp-cluster': Service(PROTOCOLS['udp'], 8116, 'cp-cluster'),
-        'cp-spxdpy': Service(PROTOCOLS['udp'], 4378, 'cp-spxdpy'),
-        'cp-spxrpts': Service(PROTOCOLS['udp'], 5079, 'cp-spxrpts'),
-        'cp-spxsvr': Service(PROTOCOLS['udp'], 4377, 'cp-spxsvr'),
-        'cpdi-pidas-cm': Service(PROTOCOLS['udp'], 3609, 'cpdi-pidas-cm'),
-        'cpdlc': Service(PROTOCOLS['udp'], 5911, 'cpdlc'),
-        'cplscrambler-al': Service(PROTOCOLS['udp'], 1088, 'cplscrambler-al'),
-        'cplscrambler-in': Service(PROTOCOLS['udp'], 1087, 'cplscrambler-in'),
-        'cplscrambler-lg': Service(PROTOCOLS['udp'], 1086, 'cplscrambler-lg'),
-        'cppdp': Service(PROTOCOLS['udp'], 4051, 'cppdp'),
-        'cpq-tasksmart': Service(PROTOCOLS['udp'], 3201, 'cpq-tasksmart'),
-        'cpq-wbem': Service(PROTOCOLS['udp'], 2301, 'cpq-wbem'),
-        'cpqrpm-agent': Service(PROTOCOLS['udp'], 3256, 'cpqrpm-agent'),
-        'cpqrpm-server': Service(PROTOCOLS['udp'], 3257, 'cpqrpm-server'),
-        'cps': Service(PROTOCOLS['udp'], 14250, 'cps'),
-        'cpsp': Service(PROTOCOLS['udp'], 17222, 'cpsp'),
-        'cpudpencap': Service(PROTOCOLS['udp'], 2746, 'cpudpencap'),
-        'cqg-netlan': Service(PROTOCOLS['udp'], 2823, 'cqg-netlan'),
-        'cqg-netlan-1': Service(PROTOCOLS['udp'], 2824, 'cqg-netlan-1'),
-        'cr-websystems': Service(PROTOCOLS['udp'], 2314, 'cr-websystems'),
-        'creativepartnr': Service(PROTOCOLS['udp'], 3366, 'creativepartnr'),
-        'creativeserver': Service(PROTOCOLS['udp'], 3364, 'creativeserver'),
-        'crescoctrl-disc': Service(PROTOCOLS['udp'], 38002, 'crescoctrl-disc'),
-        'crestron-cip': Service(PROTOCOLS['udp'], 41794, 'crestron-cip'),
-        'crestron-ctp': Service(PROTOCOLS['udp'], 41795, 'crestron-ctp'),
-        'crinis-hb': Service(PROTOCOLS['udp'], 3818, 'crinis-hb'),
-        'crip': Service(PROTOCOLS['udp'], 6253, 'crip'),
-        'crmsbits': Service(PROTOCOLS['udp'], 2422, 'crmsbits'),
-        'crs': Service(PROTOCOLS['udp'], 507, 'crs'),
-        'cruise-config': Service(PROTOCOLS['udp'], 8378, 'cruise-config'),
-        'cruise-diags': Service(PROTOCOLS['udp'], 8379, 'cruise-diags'),
-        'cruise-enum': Service(PROTOCOLS['udp'], 8376, 'cruise-enum'),
-        'cruise-swroute': Service(PROTOCOLS['udp'], 8377, 'cruise-swroute'),
-        'cruise-update': Service(PROTOCOLS['udp'], 8380, 'cruise-update'),
-        'cryptoadmin': Service(PROTOCOLS['udp'], 624, 'cryptoadmin'),
-        'cs-auth-svr': Service(PROTOCOLS['udp'], 3113, 'cs-auth-svr'),
-        'cs-live': Service(PROTOCOLS['udp'], 2129, 'cs-live'),
-        'cs-remote-db': Service(PROTOCOLS['udp'], 3630, 'cs-remote-db'),
-        'cs-services': Service(PROTOCOLS['udp'], 3631, 'cs-services'),
-        'csbphonemaster': Service(PROTOCOLS['udp'], 1724, 'csbphonemaster'),
-        'csccfirewall': Service(PROTOCOLS['udp'], 40843, 'csccfirewall'),
-        'csccredir': Service(PROTOCOLS['udp'], 40842, 'csccredir'),
-        'cscp': Service(PROTOCOLS['udp'], 40841, 'cscp'),
-        'csd-monitor': Service(PROTOCOLS['udp'], 3072, 'csd-monitor'),
-        'csdm': Service(PROTOCOLS['udp'], 1472, 'csdm'),
-        'csdmbase': Service(PROTOCOLS['udp'], 1471, 'csdmbase'),
-        'csi-lfap': Service(PROTOCOLS['udp'], 3145, 'csi-lfap'),
-        'csi-sgwp': Service(PROTOCOLS['udp'], 348, 'csi-sgwp'),
-        'cslistener': Service(PROTOCOLS['udp'], 9000, 'cslistener'),
-        'csms': Service(PROTOCOLS['udp'], 3399, 'csms'),
-        'csms2': Service(PROTOCOLS['udp'], 3400, 'csms2'),
-        'csnet-ns': Service(PROTOCOLS['udp'], 105, 'csnet-ns'),
-        'csnotify': Service(PROTOCOLS['udp'], 2955, 'csnotify'),
-        'cso': Service(PROTOCOLS['udp'], 105, 'cso'),
-        'csoft-plusclnt': Service(PROTOCOLS['udp'], 2699, 'csoft-plusclnt'),
-        'csoft-prev': Service(PROTOCOLS['udp'], 3271, 'csoft-prev'),
-        'csoft1': Service(PROTOCOLS['udp'], 1837, 'csoft1'),
-        'csoftragent': Service(PROTOCOLS['udp'], 3004, 'csoftragent'),
-        'cspclmulti': Service(PROTOCOLS['udp'], 2890, 'cspclmulti'),
-        'cspmlockmgr': Service(PROTOCOLS['udp'], 1272, 'cspmlockmgr'),
-        'cspmulti': Service(PROTOCOLS['udp'], 2807, 'cspmulti'),
-        'cspuni': Service(PROTOCOLS['udp'], 2806, 'cspuni'),
-        'csregagent': Service(PROTOCOLS['udp'], 3022, 'csregagent'),
-        'cst-port': Service(PROTOCOLS['udp'], 3742, 'cst-port'),
-        'csvr': Service(PROTOCOLS['udp'], 3417, 'csvr'),
-        'csvr-proxy': Service(PROTOCOLS['udp'], 3190, 'csvr-proxy'),
-        'csvr-sslproxy': Service(PROTOCOLS['udp'], 3191, 'csvr-sslproxy'),
-        'ct2nmcs': Service(PROTOCOLS['udp'], 7023, 'ct2nmcs'),
-        'ctcd': Service(PROTOCOLS['udp'], 1851, 'ctcd'),
-        'ctdb': Service(PROTOCOLS['udp'], 4379, 'ctdb'),
-        'ctdhercules': Service(PROTOCOLS['udp'], 3773, 'ctdhercules'),
-        'ctdp': Service(PROTOCOLS['udp'], 7022, 'ctdp'),
-        'ctechlicensing': Service(PROTOCOLS['udp'], 9346, 'ctechlicensing'),
-        'ctf': Service(PROTOCOLS['udp'], 84, 'ctf'),
-        'cti-redwood': Service(PROTOCOLS['udp'], 2563, 'cti-redwood'),
-        'ctiprogramload': Service(PROTOCOLS['udp'], 4452, 'ctiprogramload'),
-        'ctisystemmsg': Service(PROTOCOLS['udp'], 4451, 'ctisystemmsg'),
-        'ctlptc': Service(PROTOCOLS['udp'], 2153, 'ctlptc'),
-        'ctp': Service(PROTOCOLS['udp'], 3772, 'ctp'),
-        'ctp-state': Service(PROTOCOLS['udp'], 4047, 'ctp-state'),
-        'ctsd': Service(PROTOCOLS['udp'], 5137, 'ctsd'),
-        'ctt-broker': Service(PROTOCOLS['udp'], 1932, 'ctt-broker'),
-        'ctx-bridge': Service(PROTOCOLS['udp'], 3127, 'ctx-bridge'),
-        'ctxlic': Service(PROTOCOLS['udp'], 7279, 'ctxlic'),
-        'ctxs-vpp': Service(PROTOCOLS['udp'], 4980, 'ctxs-vpp'),
-        'cuelink-disc': Service(PROTOCOLS['udp'], 5271, 'cuelink-disc'),
-        'cuillamartin': Service(PROTOCOLS['udp'], 1356, 'cuillamartin'),
-        'cumulus': Service(PROTOCOLS['udp'], 9287, 'cumulus'),
-        'cumulus-admin': Service(PROTOCOLS['udp'], 8954, 'cumulus-admin'),
-        'cuseeme': Service(PROTOCOLS['udp'], 7648, 'cuseeme'),
-        'custix': Service(PROTOCOLS['udp'], 528, 'custix'),
-        'cvc': Service(PROTOCOLS['udp'], 1495, 'cvc'),
-        'cvc-hostd': Service(PROTOCOLS['udp'], 442, 'cvc-hostd'),
-        'cvc_hostd': Service(PROTOCOLS['udp'], 442, 'cvc_hostd'),
-        'cvd': Service(PROTOCOLS['udp'], 8400, 'cvd'),
-        'cvmmon': Service(PROTOCOLS['udp'], 2300, 'cvmmon'),
-        'cvmon': Service(PROTOCOLS['udp'], 1686, 'cvmon'),
-        'cvspserver': Service(PROTOCOLS['udp'], 2401, 'cvspserver'),
-        'cvsup': Service(PROTOCOLS['udp'], 5999, 'cvsup'),
-        'cwmp': Service(PROTOCOLS['udp'], 7547, 'cwmp'),
-        'cxws': Service(PROTOCOLS['udp'], 4673, 'cxws'),
-        'cyaserv': Service(PROTOCOLS['udp'], 2584, 'cyaserv'),
-        'cybercash': Service(PROTOCOLS['udp'], 551, 'cybercash'),
-        'cyborg-systems': Service(PROTOCOLS['udp'], 9888, 'cyborg-systems'),
-        'cyborgnet': Service(PROTOCOLS['udp'], 4183, 'cyborgnet'),
-        'cybro-a-bus': Service(PROTOCOLS['udp'], 8442, 'cybro-a-bus'),
-        'cyc': Service(PROTOCOLS['udp'], 3645, 'cyc'),
-        'cycleserv': Service(PROTOCOLS['udp'], 763, 'cycleserv'),
-        'cycleserv2': Service(PROTOCOLS['udp'], 772, 'cycleserv2'),
-        'cylink-c': Service(PROTOCOLS['udp'], 5420, 'cylink-c'),
-        'cymtec-port': Service(PROTOCOLS['udp'], 1898, 'cymtec-port'),
-        'cytel-lm': Service(PROTOCOLS['udp'], 3297, 'cytel-lm'),
-        'd-cinema-rrp': Service(PROTOCOLS['udp'], 1173, 'd-cinema-rrp'),
-        'd-data': Service(PROTOCOLS['udp'], 4301, 'd-data'),
-        'd-data-control': Service(PROTOCOLS['udp'], 4302, 'd-data-control'),
-        'd-fence': Service(PROTOCOLS['udp'], 8555, 'd-fence'),
-        'd-s-n': Service(PROTOCOLS['udp'], 8086, 'd-s-n'),
-        'd2000kernel': Service(PROTOCOLS['udp'], 3119, 'd2000kernel'),
-        'd2000webserver': Service(PROTOCOLS['udp'], 3120, 'd2000webserver'),
-        'd2k-datamover1': Service(PROTOCOLS['udp'], 2297, 'd2k-datamover1'),
-        'd2k-datamover2': Service(PROTOCOLS['udp'], 2298, 'd2k-datamover2'),
-        'd2k-tapestry1': Service(PROTOCOLS['udp'], 3393, 'd2k-tapestry1'),
-        'd2k-tapestry2': Service(PROTOCOLS['udp'], 3394, 'd2k-tapestry2'),
-        'd3winosfi': Service(PROTOCOLS['udp'], 3458, 'd3winosfi'),
-        'daap': Service(PROTOCOLS['udp'], 3689, 'daap'),
-        'dab-sti-c': Service(PROTOCOLS['udp'], 1076, 'dab-sti-c'),
-        'daishi': Service(PROTOCOLS['udp'], 2870, 'daishi'),
-        'dali-port': Service(PROTOCOLS['udp'], 5777, 'dali-port'),
-        'dandv-tester': Service(PROTOCOLS['udp'], 3889, 'dandv-tester'),
-        'danf-ak2': Service(PROTOCOLS['udp'], 1041, 'danf-ak2'),
-        'daqstream': Service(PROTOCOLS['udp'], 7411, 'daqstream'),
-        'darcorp-lm': Service(PROTOCOLS['udp'], 1679, 'darcorp-lm'),
-        'dashpas-port': Service(PROTOCOLS['udp'], 3498, 'dashpas-port'),
-        'dasp': Service(PROTOCOLS['udp'], 439, 'dasp'),
-        'data-insurance': Service(PROTOCOLS['udp'], 2764, 'data-insurance'),
-        'data-port': Service(PROTOCOLS['udp'], 3578, 'data-port'),
-        'datacaptor': Service(PROTOCOLS['udp'], 1857, 'datacaptor'),
-        'datalens': Service(PROTOCOLS['udp'], 2229, 'datalens'),
-        'datasurfsrv': Service(PROTOCOLS['udp'], 461, 'datasurfsrv'),
-        'datasurfsrvsec': Service(PROTOCOLS['udp'], 462, 'datasurfsrvsec'),
-        'datex-asn': Service(PROTOCOLS['udp'], 355, 'datex-asn'),
-        'datusorb': Service(PROTOCOLS['udp'], 3282, 'datusorb'),
-        'davsrc': Service(PROTOCOLS['udp'], 9800, 'davsrc'),
-        'davsrcs': Service(PROTOCOLS['udp'], 9802, 'davsrcs'),
-        'dawn': Service(PROTOCOLS['udp'], 1908, 'dawn'),
-        'daytime': Service(PROTOCOLS['udp'], 13, 'daytime'),
-        'db-lsp-disc': Service(PROTOCOLS['udp'], 17500, 'db-lsp-disc'),
-        'dbabble': Service(PROTOCOLS['udp'], 8132, 'dbabble'),
-        'dbase': Service(PROTOCOLS['udp'], 217, 'dbase'),
-        'dbbrowse': Service(PROTOCOLS['udp'], 47557, 'dbbrowse'),
-        'dbcontrol-agent': Service(PROTOCOLS['udp'], 3938, 'dbcontrol-agent'),
-        'dbcontrol-oms': Service(PROTOCOLS['udp'], 1158, 'dbcontrol-oms'),
-        'dbcontrol_agent': Service(PROTOCOLS['udp'], 3938, 'dbcontrol_agent'),
-        'dbdb': Service(PROTOCOLS['udp'], 6104, 'dbdb'),
-        'dberegister': Service(PROTOCOLS['udp'], 1479, 'dberegister'),
-        'dbisamserver1': Service(PROTOCOLS['udp'], 12005, 'dbisamserver1'),
-        'dbisamserver2': Service(PROTOCOLS['udp'], 12006, 'dbisamserver2'),
-        'dbm': Service(PROTOCOLS['udp'], 2345, 'dbm'),
-        'dbref': Service(PROTOCOLS['udp'], 2365, 'dbref'),
-        'dbreporter': Service(PROTOCOLS['udp'], 1379, 'dbreporter'),
-        'dbstar': Service(PROTOCOLS['udp'], 1415, 'dbstar'),
-        'dca': Service(PROTOCOLS['udp'], 1456, 'dca'),
-        'dccm': Service(PROTOCOLS['udp'], 5679, 'dccm'),
-        'dccp-udp': Service(PROTOCOLS['udp'], 6511, 'dccp-udp'),
-        'dcp': Service(PROTOCOLS['udp'], 93, 'dcp'),
-        'dcs': Service(PROTOCOLS['udp'], 1367, 'dcs'),
-        'dcs-config': Service(PROTOCOLS['udp'], 3988, 'dcs-config'),
-        'dcsoftware': Service(PROTOCOLS['udp'], 3793, 'dcsoftware'),
-        'dctp': Service(PROTOCOLS['udp'], 675, 'dctp'),
-        'dcutility': Service(PROTOCOLS['udp'], 1044, 'dcutility'),
-        'dddp': Service(PROTOCOLS['udp'], 9131, 'dddp'),
-        'ddgn': Service(PROTOCOLS['udp'], 4167, 'ddgn'),
-        'ddi-udp-1': Service(PROTOCOLS['udp'], 8888, 'ddi-udp-1'),
-        'ddi-udp-2': Service(PROTOCOLS['udp'], 8889, 'ddi-udp-2'),
-        'ddi-udp-3': Service(PROTOCOLS['udp'], 8890, 'ddi-udp-3'),
-        'ddi-udp-4': Service(PROTOCOLS['udp'], 8891, 'ddi-udp-4'),
-        'ddi-udp-5': Service(PROTOCOLS['udp'], 8892, 'ddi-udp-5'),
-        'ddi-udp-6': Service(PROTOCOLS['udp'], 8893, 'ddi-udp-6'),
-        'ddi-udp-7': Service(PROTOCOLS['udp'], 8894, 'ddi-udp-7'),
-        'ddm-dfm': Service(PROTOCOLS['udp'], 447, 'ddm-dfm'),
-        'ddm-rdb': Service(PROTOCOLS['udp'], 446, 'ddm-rdb'),
-        'ddm-ssl': Service(PROTOCOLS['udp'], 448, 'ddm-ssl'),
-        'ddns-v3': Service(PROTOCOLS['udp'], 2164, 'ddns-v3'),
-        'ddrepl': Service(PROTOCOLS['udp'], 4126, 'ddrepl'),
-        'ddt': Service(PROTOCOLS['udp'], 1052, 'ddt'),
-        'de-cache-query': Service(PROTOCOLS['udp'], 1255, 'de-cache-query'),
-        'de-noc': Service(PROTOCOLS['udp'], 1254, 'de-noc'),
-        'de-server': Service(PROTOCOLS['udp'], 1256, 'de-server'),
-        'de-spot': Service(PROTOCOLS['udp'], 2753, 'de-spot'),
-        'dec-dlm': Service(PROTOCOLS['udp'], 625, 'dec-dlm'),
-        'dec-mbadmin': Service(PROTOCOLS['udp'], 1655, 'dec-mbadmin'),
-        'dec-mbadmin-h': Service(PROTOCOLS['udp'], 1656, 'dec-mbadmin-h'),
-        'dec-notes': Service(PROTOCOLS['udp'], 3333, 'dec-notes'),
-        'dec_dlm': Service(PROTOCOLS['udp'], 625, 'dec_dlm'),
-        'decap': Service(PROTOCOLS['udp'], 403, 'decap'),
-        'decauth': Service(PROTOCOLS['udp'], 316, 'decauth'),
-        'decbsrv': Service(PROTOCOLS['udp'], 579, 'decbsrv'),
-        'decladebug': Service(PROTOCOLS['udp'], 410, 'decladebug'),
-        'decvms-sysmgt': Service(PROTOCOLS['udp'], 441, 'decvms-sysmgt'),
-        'dei-icda': Service(PROTOCOLS['udp'], 618, 'dei-icda'),
-        'delibo': Service(PROTOCOLS['udp'], 2562, 'delibo'),
-        'dell-rm-port': Service(PROTOCOLS['udp'], 3668, 'dell-rm-port'),
-        'dellpwrappks': Service(PROTOCOLS['udp'], 1266, 'dellpwrappks'),
-        'dellwebadmin-1': Service(PROTOCOLS['udp'], 1278, 'dellwebadmin-1'),
-        'dellwebadmin-2': Service(PROTOCOLS['udp'], 1279, 'dellwebadmin-2'),
-        'delos-dms': Service(PROTOCOLS['udp'], 3714, 'delos-dms'),
-        'delta-mcp': Service(PROTOCOLS['udp'], 1324, 'delta-mcp'),
-        'denali-server': Service(PROTOCOLS['udp'], 3444, 'denali-server'),
-        'deos': Service(PROTOCOLS['udp'], 76, 'deos'),
-        'derby-repli': Service(PROTOCOLS['udp'], 4851, 'derby-repli'),
-        'descent3': Service(PROTOCOLS['udp'], 2092, 'descent3'),
-        'deskshare': Service(PROTOCOLS['udp'], 1702, 'deskshare'),
-        'desktop-dna': Service(PROTOCOLS['udp'], 2763, 'desktop-dna'),
-        'deskview': Service(PROTOCOLS['udp'], 3298, 'deskview'),
-        'devbasic': Service(PROTOCOLS['udp'], 5426, 'devbasic'),
-        'device': Service(PROTOCOLS['udp'], 801, 'device'),
-        'device2': Service(PROTOCOLS['udp'], 2030, 'device2'),
-        'devshr-nts': Service(PROTOCOLS['udp'], 552, 'devshr-nts'),
-        'dfn': Service(PROTOCOLS['udp'], 1133, 'dfn'),
-        'dfoxserver': Service(PROTOCOLS['udp'], 2960, 'dfoxserver'),
-        'dfserver': Service(PROTOCOLS['udp'], 21554, 'dfserver'),
-        'dgpf-exchg': Service(PROTOCOLS['udp'], 6785, 'dgpf-exchg'),
-        'dhcp-failover': Service(PROTOCOLS['udp'], 647, 'dhcp-failover'),
-        'dhcp-failover2': Service(PROTOCOLS['udp'], 847, 'dhcp-failover2'),
-        'dhcpv6-client': Service(PROTOCOLS['udp'], 546, 'dhcpv6-client'),
-        'dhcpv6-server': Service(PROTOCOLS['udp'], 547, 'dhcpv6-server'),
-        'dhct-alerts': Service(PROTOCOLS['udp'], 4676, 'dhct-alerts'),
-        'dhct-status': Service(PROTOCOLS['udp'], 4675, 'dhct-status'),
-        'dhe': Service(PROTOCOLS['udp'], 3252, 'dhe'),
-        'di-ase': Service(PROTOCOLS['udp'], 3046, 'di-ase'),
-        'di-drm': Service(PROTOCOLS['udp'], 2226, 'di-drm'),
-        'di-msg': Service(PROTOCOLS['udp'], 2227, 'di-msg'),
-        'di-traceware': Service(PROTOCOLS['udp'], 3041, 'di-traceware'),
-        'diagmond': Service(PROTOCOLS['udp'], 1508, 'diagmond'),
-        'diagnose-proc': Service(PROTOCOLS['udp'], 6072, 'diagnose-proc'),
-        'dialog-port': Service(PROTOCOLS['udp'], 2098, 'dialog-port'),
-        'dialogic-elmd': Service(PROTOCOLS['udp'], 1945, 'dialogic-elmd'),
-        'dialpad-voice1': Service(PROTOCOLS['udp'], 2860, 'dialpad-voice1'),
-        'dialpad-voice2': Service(PROTOCOLS['udp'], 2861, 'dialpad-voice2'),
-        'diamondport': Service(PROTOCOLS['udp'], 33331, 'diamondport'),
-        'dic-aida': Service(PROTOCOLS['udp'], 1941, 'dic-aida'),
-        'dicom': Service(PROTOCOLS['udp'], 11112, 'dicom'),
-        'dicom-iscl': Service(PROTOCOLS['udp'], 2761, 'dicom-iscl'),
-        'dicom-tls': Service(PROTOCOLS['udp'], 2762, 'dicom-tls'),
-        'dict': Service(PROTOCOLS['udp'], 2628, 'dict'),
-        'dict-lookup': Service(PROTOCOLS['udp'], 2289, 'dict-lookup'),
-        'dif-port': Service(PROTOCOLS['udp'], 2251, 'dif-port'),
-        'digiman': Service(PROTOCOLS['udp'], 2362, 'digiman'),
-        'digital-notary': Service(PROTOCOLS['udp'], 1335, 'digital-notary'),
-        'digital-vrc': Service(PROTOCOLS['udp'], 466, 'digital-vrc'),
-        'digivote': Service(PROTOCOLS['udp'], 3223, 'digivote'),
-        'direcpc-dll': Service(PROTOCOLS['udp'], 1844, 'direcpc-dll'),
-        'direcpc-si': Service(PROTOCOLS['udp'], 2464, 'direcpc-si'),
-        'direcpc-video': Service(PROTOCOLS['udp'], 1825, 'direcpc-video'),
-        'direct': Service(PROTOCOLS['udp'], 242, 'direct'),
-        'directnet': Service(PROTOCOLS['udp'], 3447, 'directnet'),
-        'directplay': Service(PROTOCOLS['udp'], 2234, 'directplay'),
-        'directplay8': Service(PROTOCOLS['udp'], 6073, 'directplay8'),
-        'directplaysrvr': Service(PROTOCOLS['udp'], 47624, 'directplaysrvr'),
-        'directv-catlg': Service(PROTOCOLS['udp'], 3337, 'directv-catlg'),
-        'directv-soft': Service(PROTOCOLS['udp'], 3335, 'directv-soft'),
-        'directv-tick': Service(PROTOCOLS['udp'], 3336, 'directv-tick'),
-        'directv-web': Service(PROTOCOLS['udp'], 3334, 'directv-web'),
-        'directvdata': Service(PROTOCOLS['udp'], 3287, 'directvdata'),
-        'dirgis': Service(PROTOCOLS['udp'], 2496, 'dirgis'),
-        'discard': Service(PROTOCOLS['udp'], 9, 'discard'),
-        'disclose': Service(PROTOCOLS['udp'], 667, 'disclose'),
-        'discovery-port': Service(PROTOCOLS['udp'], 1925, 'discovery-port'),
-        'discp-client': Service(PROTOCOLS['udp'], 2601, 'discp-client'),
-        'discp-server': Service(PROTOCOLS['udp'], 2602, 'discp-server'),
-        'dist-upgrade': Service(PROTOCOLS['udp'], 3624, 'dist-upgrade'),
-        'distcc': Service(PROTOCOLS['udp'], 3632, 'distcc'),
-        'distinct': Service(PROTOCOLS['udp'], 9999, 'distinct'),
-        'distinct32': Service(PROTOCOLS['udp'], 9998, 'distinct32'),
-        'dixie': Service(PROTOCOLS['udp'], 96, 'dixie'),
-        'dj-ice': Service(PROTOCOLS['udp'], 5419, 'dj-ice'),
-        'dj-ilm': Service(PROTOCOLS['udp'], 3362, 'dj-ilm'),
-        'dka': Service(PROTOCOLS['udp'], 1263, 'dka'),
-        'dkmessenger': Service(PROTOCOLS['udp'], 1177, 'dkmessenger'),
-        'dl-agent': Service(PROTOCOLS['udp'], 3876, 'dl-agent'),
-        'dl_agent': Service(PROTOCOLS['udp'], 3876, 'dl_agent'),
-        'dlep': Service(PROTOCOLS['udp'], 854, 'dlep'),
-        'dlip': Service(PROTOCOLS['udp'], 7201, 'dlip'),
-        'dlms-cosem': Service(PROTOCOLS['udp'], 4059, 'dlms-cosem'),
-        'dls': Service(PROTOCOLS['udp'], 2047, 'dls'),
-        'dls-mon': Service(PROTOCOLS['udp'], 198, 'dls-mon'),
-        'dls-monitor': Service(PROTOCOLS['udp'], 2048, 'dls-monitor'),
-        'dlsrap': Service(PROTOCOLS['udp'], 1973, 'dlsrap'),
-        'dlsrpn': Service(PROTOCOLS['udp'], 2065, 'dlsrpn'),
-        'dlswpn': Service(PROTOCOLS['udp'], 2067, 'dlswpn'),
-        'dmaf-caster': Service(PROTOCOLS['udp'], 3574, 'dmaf-caster'),
-        'dmdocbroker': Service(PROTOCOLS['udp'], 1489, 'dmdocbroker'),
-        'dmexpress': Service(PROTOCOLS['udp'], 32636, 'dmexpress'),
-        'dmidi': Service(PROTOCOLS['udp'], 1199, 'dmidi'),
-        'dmod-workspace': Service(PROTOCOLS['udp'], 3199, 'dmod-workspace'),
-        'dmp': Service(PROTOCOLS['udp'], 5031, 'dmp'),
-        'dn6-nlm-aud': Service(PROTOCOLS['udp'], 195, 'dn6-nlm-aud'),
-        'dn6-smm-red': Service(PROTOCOLS['udp'], 196, 'dn6-smm-red'),
-        'dna': Service(PROTOCOLS['udp'], 2287, 'dna'),
-        'dna-cml': Service(PROTOCOLS['udp'], 436, 'dna-cml'),
-        'dnap': Service(PROTOCOLS['udp'], 1172, 'dnap'),
-        'dnc-port': Service(PROTOCOLS['udp'], 3448, 'dnc-port'),
-        'dnox': Service(PROTOCOLS['udp'], 4022, 'dnox'),
-        'dnp': Service(PROTOCOLS['udp'], 20000, 'dnp'),
-        'dnp-sec': Service(PROTOCOLS['udp'], 19999, 'dnp-sec'),
-        'dns-llq': Service(PROTOCOLS['udp'], 5352, 'dns-llq'),
-        'dns2go': Service(PROTOCOLS['udp'], 1227, 'dns2go'),
-        'dnsix': Service(PROTOCOLS['udp'], 90, 'dnsix'),
-        'dnx': Service(PROTOCOLS['udp'], 3998, 'dnx'),
-        'doc-server': Service(PROTOCOLS['udp'], 7165, 'doc-server'),
-        'doc1lm': Service(PROTOCOLS['udp'], 3161, 'doc1lm'),
-        'docent': Service(PROTOCOLS['udp'], 2151, 'docent'),
-        'doceri-view': Service(PROTOCOLS['udp'], 7019, 'doceri-view'),
-        'docstor': Service(PROTOCOLS['udp'], 1488, 'docstor'),
-        'documentum': Service(PROTOCOLS['udp'], 10002, 'documentum'),
-        'documentum-s': Service(PROTOCOLS['udp'], 10003, 'documentum-s'),
-        'documentum_s': Service(PROTOCOLS['udp'], 10003, 'documentum_s'),
-        'dof-dps-mc-sec': Service(PROTOCOLS['udp'], 5567, 'dof-dps-mc-sec'),
-        'dof-eps': Service(PROTOCOLS['udp'], 3567, 'dof-eps'),
-        'dof-tunnel': Service(PROTOCOLS['udp'], 8567, 'dof-tunnel'),
-        'dof-tunnel-sec': Service(PROTOCOLS['udp'], 3568, 'dof-tunnel-sec'),
-        'doglms-notify': Service(PROTOCOLS['udp'], 6088, 'doglms-notify'),
-        'doip-disc': Service(PROTOCOLS['udp'], 13400, 'doip-disc'),
-        'domain': Service(PROTOCOLS['udp'], 53, 'domain'),
-        'domain-s': Service(PROTOCOLS['udp'], 853, 'domain-s'),
-        'domaintime': Service(PROTOCOLS['udp'], 9909, 'domaintime'),
-        'domiq': Service(PROTOCOLS['udp'], 44544, 'domiq'),
-        'donnyworld': Service(PROTOCOLS['udp'], 1821, 'donnyworld'),
-        'doom': Service(PROTOCOLS['udp'], 666, 'doom'),
-        'dossier': Service(PROTOCOLS['udp'], 1175, 'dossier'),
-        'downtools-disc': Service(PROTOCOLS['udp'], 5245, 'downtools-disc'),
-        'dpap': Service(PROTOCOLS['udp'], 8770, 'dpap'),
-        'dpcp': Service(PROTOCOLS['udp'], 4099, 'dpcp'),
-        'dpi-proxy': Service(PROTOCOLS['udp'], 1795, 'dpi-proxy'),
-        'dpkeyserv': Service(PROTOCOLS['udp'], 1780, 'dpkeyserv'),
-        'dpm': Service(PROTOCOLS['udp'], 5718, 'dpm'),
-        'dpm-agent': Service(PROTOCOLS['udp'], 5719, 'dpm-agent'),
-        'dproxy': Service(PROTOCOLS['udp'], 1296, 'dproxy'),
-        'dpserve': Service(PROTOCOLS['udp'], 7020, 'dpserve'),
-        'dpserveadmin': Service(PROTOCOLS['udp'], 7021, 'dpserveadmin'),
-        'dpsi': Service(PROTOCOLS['udp'], 315, 'dpsi'),
-        'dragonfly': Service(PROTOCOLS['udp'], 8913, 'dragonfly'),
-        'drip': Service(PROTOCOLS['udp'], 3949, 'drip'),
-        'driveappserver': Service(PROTOCOLS['udp'], 1930, 'driveappserver'),
-        'drm-production': Service(PROTOCOLS['udp'], 7171, 'drm-production'),
-        'drmsfsd': Service(PROTOCOLS['udp'], 4098, 'drmsfsd'),
-        'drmsmc': Service(PROTOCOLS['udp'], 1878, 'drmsmc'),
-        'drp': Service(PROTOCOLS['udp'], 1974, 'drp'),
-        'drwcs': Service(PROTOCOLS['udp'], 2193, 'drwcs'),
-        'ds-admin': Service(PROTOCOLS['udp'], 4404, 'ds-admin'),
-        'ds-clnt': Service(PROTOCOLS['udp'], 4402, 'ds-clnt'),
-        'ds-mail': Service(PROTOCOLS['udp'], 4405, 'ds-mail'),
-        'ds-slp': Service(PROTOCOLS['udp'], 4406, 'ds-slp'),
-        'ds-srv': Service(PROTOCOLS['udp'], 4400, 'ds-srv'),
-        'ds-srvr': Service(PROTOCOLS['udp'], 4401, 'ds-srvr'),
-        'ds-user': Service(PROTOCOLS['udp'], 4403, 'ds-user'),
-        'dsatp': Service(PROTOCOLS['udp'], 2111, 'dsatp'),
-        'dsc': Service(PROTOCOLS['udp'], 3390, 'dsc'),
-        'dsdn': Service(PROTOCOLS['udp'], 1292, 'dsdn'),
-        'dserver': Service(PROTOCOLS['udp'], 4309, 'dserver'),
-        'dsetos': Service(PROTOCOLS['udp'], 378, 'dsetos'),
-        'dsf': Service(PROTOCOLS['udp'], 555, 'dsf'),
-        'dsfgw': Service(PROTOCOLS['udp'], 438, 'dsfgw'),
-        'dslremote-mgmt': Service(PROTOCOLS['udp'], 2420, 'dslremote-mgmt'),
-        'dsm-scm-target': Service(PROTOCOLS['udp'], 9987, 'dsm-scm-target'),
-        'dsmcc-ccp': Service(PROTOCOLS['udp'], 13822, 'dsmcc-ccp'),
-        'dsmcc-config': Service(PROTOCOLS['udp'], 13818, 'dsmcc-config'),
-        'dsmcc-download': Service(PROTOCOLS['udp'], 13821, 'dsmcc-download'),
-        'dsmcc-passthru': Service(PROTOCOLS['udp'], 13820, 'dsmcc-passthru'),
-        'dsmcc-session': Service(PROTOCOLS['udp'], 13819, 'dsmcc-session'),
-        'dsmeter-iatc': Service(PROTOCOLS['udp'], 4060, 'dsmeter-iatc'),
-        'dsmeter_iatc': Service(PROTOCOLS['udp'], 4060, 'dsmeter_iatc'),
-        'dsmipv6': Service(PROTOCOLS['udp'], 4191, 'dsmipv6'),
-        'dsom-server': Service(PROTOCOLS['udp'], 3053, 'dsom-server'),
-        'dsp': Service(PROTOCOLS['udp'], 33, 'dsp'),
-        'dsp3270': Service(PROTOCOLS['udp'], 246, 'dsp3270'),
-        'dssiapi': Service(PROTOCOLS['udp'], 1265, 'dssiapi'),
-        'dsx-agent': Service(PROTOCOLS['udp'], 3685, 'dsx-agent'),
-        'dta-systems': Service(PROTOCOLS['udp'], 13929, 'dta-systems'),
-        'dtag-ste-sb': Service(PROTOCOLS['udp'], 352, 'dtag-ste-sb'),
-        'dtk': Service(PROTOCOLS['udp'], 365, 'dtk'),
-        'dtn-bundle': Service(PROTOCOLS['udp'], 4556, 'dtn-bundle'),
-        'dtn1': Service(PROTOCOLS['udp'], 2445, 'dtn1'),
-        'dtp': Service(PROTOCOLS['udp'], 3663, 'dtp'),
-        'dtp-dia': Service(PROTOCOLS['udp'], 3489, 'dtp-dia'),
-        'dtp-net': Service(PROTOCOLS['udp'], 8732, 'dtp-net'),
-        'dtpt': Service(PROTOCOLS['udp'], 5721, 'dtpt'),
-        'dts': Service(PROTOCOLS['udp'], 2594, 'dts'),
-        'dtserver-port': Service(PROTOCOLS['udp'], 4028, 'dtserver-port'),
-        'dtspcd': Service(PROTOCOLS['udp'], 6112, 'dtspcd'),
-        'dtv-chan-req': Service(PROTOCOLS['udp'], 2253, 'dtv-chan-req'),
-        'dvapps': Service(PROTOCOLS['udp'], 3831, 'dvapps'),
-        'dvbservdsc': Service(PROTOCOLS['udp'], 3937, 'dvbservdsc'),
-        'dvcprov-port': Service(PROTOCOLS['udp'], 3776, 'dvcprov-port'),
-        'dvl-activemail': Service(PROTOCOLS['udp'], 1396, 'dvl-activemail'),
-        'dvr-esm': Service(PROTOCOLS['udp'], 2804, 'dvr-esm'),
-        'dvt-data': Service(PROTOCOLS['udp'], 3247, 'dvt-data'),
-        'dvt-system': Service(PROTOCOLS['udp'], 3246, 'dvt-system'),
-        'dwf': Service(PROTOCOLS['udp'], 1450, 'dwf'),
-        'dwmsgserver': Service(PROTOCOLS['udp'], 3228, 'dwmsgserver'),
-        'dwnmshttp': Service(PROTOCOLS['udp'], 3227, 'dwnmshttp'),
-        'dwr': Service(PROTOCOLS['udp'], 644, 'dwr'),
-        'dx-instrument': Service(PROTOCOLS['udp'], 1325, 'dx-instrument'),
-        'dxadmind': Service(PROTOCOLS['udp'], 1958, 'dxadmind'),
-        'dxmessagebase1': Service(PROTOCOLS['udp'], 2874, 'dxmessagebase1'),
-        'dxmessagebase2': Service(PROTOCOLS['udp'], 2875, 'dxmessagebase2'),
-        'dxspider': Service(PROTOCOLS['udp'], 8873, 'dxspider'),
-        'dyn-site': Service(PROTOCOLS['udp'], 3932, 'dyn-site'),
-        'dyna-access': Service(PROTOCOLS['udp'], 3310, 'dyna-access'),
-        'dyna-lm': Service(PROTOCOLS['udp'], 3395, 'dyna-lm'),
-        'dynamic3d': Service(PROTOCOLS['udp'], 2150, 'dynamic3d'),
-        'dynamid': Service(PROTOCOLS['udp'], 9002, 'dynamid'),
-        'dyniplookup': Service(PROTOCOLS['udp'], 3295, 'dyniplookup'),
-        'dzdaemon': Service(PROTOCOLS['udp'], 3866, 'dzdaemon'),
-        'dzoglserver': Service(PROTOCOLS['udp'], 3867, 'dzoglserver'),
-        'e-builder': Service(PROTOCOLS['udp'], 4121, 'e-builder'),
-        'e-design-net': Service(PROTOCOLS['udp'], 6702, 'e-design-net'),
-        'e-design-web': Service(PROTOCOLS['udp'], 6703, 'e-design-web'),
-        'e-dpnet': Service(PROTOCOLS['udp'], 2036, 'e-dpnet'),
-        'e-mdu': Service(PROTOCOLS['udp'], 3727, 'e-mdu'),
-        'e-net': Service(PROTOCOLS['udp'], 3286, 'e-net'),
-        'e-woa': Service(PROTOCOLS['udp'], 3728, 'e-woa'),
-        'e3consultants': Service(PROTOCOLS['udp'], 3157, 'e3consultants'),
-        'ea': Service(PROTOCOLS['udp'], 17729, 'ea'),
-        'ea1': Service(PROTOCOLS['udp'], 1791, 'ea1'),
-        'eapol-relay': Service(PROTOCOLS['udp'], 10253, 'eapol-relay'),
-        'eapsp': Service(PROTOCOLS['udp'], 2291, 'eapsp'),
-        'easy-soft-mux': Service(PROTOCOLS['udp'], 2168, 'easy-soft-mux'),
-        'eba': Service(PROTOCOLS['udp'], 45678, 'eba'),
-        'ebinsite': Service(PROTOCOLS['udp'], 2651, 'ebinsite'),
-        'echo': Service(PROTOCOLS['udp'], 7, 'echo'),
-        'echonet': Service(PROTOCOLS['udp'], 3610, 'echonet'),
-        'ecmp-data': Service(PROTOCOLS['udp'], 6160, 'ecmp-data'),
-        'ecmport': Service(PROTOCOLS['udp'], 3524, 'ecmport'),
-        'ecnp': Service(PROTOCOLS['udp'], 2858, 'ecnp'),
-        'ecolor-imager': Service(PROTOCOLS['udp'], 3263, 'ecolor-imager'),
-        'ecomm': Service(PROTOCOLS['udp'], 3477, 'ecomm'),
-        'ecovisiong6-1': Service(PROTOCOLS['udp'], 2896, 'ecovisiong6-1'),
-        'ecp': Service(PROTOCOLS['udp'], 3134, 'ecp'),
-        'ecsqdmn': Service(PROTOCOLS['udp'], 1882, 'ecsqdmn'),
-        'ecwcfg': Service(PROTOCOLS['udp'], 2263, 'ecwcfg'),
-        'edb-server1': Service(PROTOCOLS['udp'], 1635, 'edb-server1'),
-        'edb-server2': Service(PROTOCOLS['udp'], 3711, 'edb-server2'),
-        'edi_service': Service(PROTOCOLS['udp'], 34567, 'edi_service'),
-        'editbench': Service(PROTOCOLS['udp'], 1350, 'editbench'),
-        'edix': Service(PROTOCOLS['udp'], 3123, 'edix'),
-        'edm-adm-notify': Service(PROTOCOLS['udp'], 3463, 'edm-adm-notify'),
-        'edm-manager': Service(PROTOCOLS['udp'], 3460, 'edm-manager'),
-        'edm-mgr-cntrl': Service(PROTOCOLS['udp'], 3465, 'edm-mgr-cntrl'),
-        'edm-mgr-sync': Service(PROTOCOLS['udp'], 3464, 'edm-mgr-sync'),
-        'edm-stager': Service(PROTOCOLS['udp'], 3461, 'edm-stager'),
-        'edm-std-notify': Service(PROTOCOLS['udp'], 3462, 'edm-std-notify'),
-        'edtools': Service(PROTOCOLS['udp'], 1142, 'edtools'),
-        'eenet': Service(PROTOCOLS['udp'], 5234, 'eenet'),
-        'efcp': Service(PROTOCOLS['udp'], 3671, 'efcp'),
-        'efi-lm': Service(PROTOCOLS['udp'], 3392, 'efi-lm'),
-        'efi-mg': Service(PROTOCOLS['udp'], 2224, 'efi-mg'),
-        'efidiningport': Service(PROTOCOLS['udp'], 2553, 'efidiningport'),
-        'eforward': Service(PROTOCOLS['udp'], 2181, 'eforward'),
-        'egptlm': Service(PROTOCOLS['udp'], 3328, 'egptlm'),
-        'egs': Service(PROTOCOLS['udp'], 1926, 'egs'),
-        'ehome-ms': Service(PROTOCOLS['udp'], 2228, 'ehome-ms'),
-        'ehp-backup': Service(PROTOCOLS['udp'], 3638, 'ehp-backup'),
-        'ehs': Service(PROTOCOLS['udp'], 4535, 'ehs'),
-        'ehs-ssl': Service(PROTOCOLS['udp'], 4536, 'ehs-ssl'),
-        'ehtp': Service(PROTOCOLS['udp'], 1295, 'ehtp'),
-        'eicon-server': Service(PROTOCOLS['udp'], 1438, 'eicon-server'),
-        'eicon-slp': Service(PROTOCOLS['udp'], 1440, 'eicon-slp'),
-        'eicon-x25': Service(PROTOCOLS['udp'], 1439, 'eicon-x25'),
-        'eims-admin': Service(PROTOCOLS['udp'], 4199, 'eims-admin'),
-        'eis': Service(PROTOCOLS['udp'], 3982, 'eis'),
-        'eisp': Service(PROTOCOLS['udp'], 3983, 'eisp'),
-        'eisport': Service(PROTOCOLS['udp'], 3525, 'eisport'),
-        'elad': Service(PROTOCOLS['udp'], 1893, 'elad'),
-        'elan': Service(PROTOCOLS['udp'], 1378, 'elan'),
-        'elanlm': Service(PROTOCOLS['udp'], 4346, 'elanlm'),
-        'elatelink': Service(PROTOCOLS['udp'], 2124, 'elatelink'),
-        'elcn': Service(PROTOCOLS['udp'], 7101, 'elcn'),
-        'elcsd': Service(PROTOCOLS['udp'], 704, 'elcsd'),
-        'elektron-admin': Service(PROTOCOLS['udp'], 5398, 'elektron-admin'),
-        'elfiq-repl': Service(PROTOCOLS['udp'], 1148, 'elfiq-repl'),
-        'eli': Service(PROTOCOLS['udp'], 2087, 'eli'),
-        'elipse-rec': Service(PROTOCOLS['udp'], 6515, 'elipse-rec'),
-        'elm-momentum': Service(PROTOCOLS['udp'], 1914, 'elm-momentum'),
-        'elpro-tunnel': Service(PROTOCOLS['udp'], 4370, 'elpro-tunnel'),
-        'elpro_tunnel': Service(PROTOCOLS['udp'], 4370, 'elpro_tunnel'),
-        'els': Service(PROTOCOLS['udp'], 1315, 'els'),
-        'elvin-client': Service(PROTOCOLS['udp'], 2917, 'elvin-client'),
-        'elvin-server': Service(PROTOCOLS['udp'], 2916, 'elvin-server'),
-        'elvin_client': Service(PROTOCOLS['udp'], 2917, 'elvin_client'),
-        'elvin_server': Service(PROTOCOLS['udp'], 2916, 'elvin_server'),
-        'elxmgmt': Service(PROTOCOLS['udp'], 23333, 'elxmgmt'),
-        'ema-sent-lm': Service(PROTOCOLS['udp'], 2526, 'ema-sent-lm'),
-        'emb-proj-cmd': Service(PROTOCOLS['udp'], 5116, 'emb-proj-cmd'),
-        'embl-ndt': Service(PROTOCOLS['udp'], 394, 'embl-ndt'),
-        'embrace-dp-c': Service(PROTOCOLS['udp'], 3198, 'embrace-dp-c'),
-        'embrace-dp-s': Service(PROTOCOLS['udp'], 3197, 'embrace-dp-s'),
-        'emc-gateway': Service(PROTOCOLS['udp'], 1273, 'emc-gateway'),
-        'emc-vcas-udp': Service(PROTOCOLS['udp'], 13218, 'emc-vcas-udp'),
-        'emc-xsw-dcache': Service(PROTOCOLS['udp'], 11723, 'emc-xsw-dcache'),
-        'emcads': Service(PROTOCOLS['udp'], 3945, 'emcads'),
-        'emce': Service(PROTOCOLS['udp'], 2004, 'emce'),
-        'emcsymapiport': Service(PROTOCOLS['udp'], 2707, 'emcsymapiport'),
-        'emfis-cntl': Service(PROTOCOLS['udp'], 141, 'emfis-cntl'),
-        'emfis-data': Service(PROTOCOLS['udp'], 140, 'emfis-data'),
-        'emp-server1': Service(PROTOCOLS['udp'], 6321, 'emp-server1'),
-        'emp-server2': Service(PROTOCOLS['udp'], 6322, 'emp-server2'),
-        'emperion': Service(PROTOCOLS['udp'], 1282, 'emperion'),
-        'empire-empuma': Service(PROTOCOLS['udp'], 1691, 'empire-empuma'),
-        'empowerid': Service(PROTOCOLS['udp'], 7080, 'empowerid'),
-        'emprise-lls': Service(PROTOCOLS['udp'], 3585, 'emprise-lls'),
-        'emprise-lsc': Service(PROTOCOLS['udp'], 3586, 'emprise-lsc'),
-        'ems': Service(PROTOCOLS['udp'], 4664, 'ems'),
-        'emsd-port': Service(PROTOCOLS['udp'], 1928, 'emsd-port'),
-        'emwavemsg': Service(PROTOCOLS['udp'], 20480, 'emwavemsg'),
-        'emwin': Service(PROTOCOLS['udp'], 2211, 'emwin'),
-        'encore': Service(PROTOCOLS['udp'], 1740, 'encore'),
-        'encrypted-admin': Service(PROTOCOLS['udp'], 1138, 'encrypted-admin'),
-        'encrypted-llrp': Service(PROTOCOLS['udp'], 5085, 'encrypted-llrp'),
-        'encrypted_admin': Service(PROTOCOLS['udp'], 1138, 'encrypted_admin'),
-        'enguity-xccetp': Service(PROTOCOLS['udp'], 8041, 'enguity-xccetp'),
-        'enl': Service(PROTOCOLS['udp'], 1804, 'enl'),
-        'enl-name': Service(PROTOCOLS['udp'], 1805, 'enl-name'),
-        'enpc': Service(PROTOCOLS['udp'], 3289, 'enpc'),
-        'enpp': Service(PROTOCOLS['udp'], 2968, 'enpp'),
-        'enrp': Service(PROTOCOLS['udp'], 9901, 'enrp'),
-        'ent-engine': Service(PROTOCOLS['udp'], 3665, 'ent-engine'),
-        'entexthigh': Service(PROTOCOLS['udp'], 12002, 'entexthigh'),
-        'entextlow': Service(PROTOCOLS['udp'], 12004, 'entextlow'),
-        'entextmed': Service(PROTOCOLS['udp'], 12003, 'entextmed'),
-        'entextnetwk': Service(PROTOCOLS['udp'], 12001, 'entextnetwk'),
-        'entextxid': Service(PROTOCOLS['udp'], 12000, 'entextxid'),
-        'entp': Service(PROTOCOLS['udp'], 1865, 'entp'),
-        'entrust-aaas': Service(PROTOCOLS['udp'], 680, 'entrust-aaas'),
-        'entrust-aams': Service(PROTOCOLS['udp'], 681, 'entrust-aams'),
-        'entrust-ash': Service(PROTOCOLS['udp'], 710, 'entrust-ash'),
-        'entrust-kmsh': Service(PROTOCOLS['udp'], 709, 'entrust-kmsh'),
-        'entrust-sps': Service(PROTOCOLS['udp'], 640, 'entrust-sps'),
-        'entrusttime': Service(PROTOCOLS['udp'], 309, 'entrusttime'),
-        'eor-game': Service(PROTOCOLS['udp'], 8149, 'eor-game'),
-        'eoss': Service(PROTOCOLS['udp'], 1210, 'eoss'),
-        'ep-nsp': Service(PROTOCOLS['udp'], 3621, 'ep-nsp'),
-        'ep-pcp': Service(PROTOCOLS['udp'], 3620, 'ep-pcp'),
-        'epc': Service(PROTOCOLS['udp'], 1267, 'epc'),
-        'epicon': Service(PROTOCOLS['udp'], 2912, 'epicon'),
-        'epl-slp': Service(PROTOCOLS['udp'], 3819, 'epl-slp'),
-        'epmap': Service(PROTOCOLS['udp'], 135, 'epmap'),
-        'epmd': Service(PROTOCOLS['udp'], 4369, 'epmd'),
-        'epncdp2': Service(PROTOCOLS['udp'], 3259, 'epncdp2'),
-        'epnsdp': Service(PROTOCOLS['udp'], 2051, 'epnsdp'),
-        'eportcomm': Service(PROTOCOLS['udp'], 4666, 'eportcomm'),
-        'eportcommdata': Service(PROTOCOLS['udp'], 4669, 'eportcommdata'),
-        'epp': Service(PROTOCOLS['udp'], 3044, 'epp'),
-        'eppc': Service(PROTOCOLS['udp'], 3031, 'eppc'),
-        'ept-machine': Service(PROTOCOLS['udp'], 3628, 'ept-machine'),
-        'eq-office-4940': Service(PROTOCOLS['udp'], 4940, 'eq-office-4940'),
-        'eq-office-4941': Service(PROTOCOLS['udp'], 4941, 'eq-office-4941'),
-        'eq-office-4942': Service(PROTOCOLS['udp'], 4942, 'eq-office-4942'),
-        'eq3-config': Service(PROTOCOLS['udp'], 43439, 'eq3-config'),
-        'equationbuilder': Service(PROTOCOLS['udp'], 1351, 'equationbuilder'),
-        'ergolight': Service(PROTOCOLS['udp'], 2109, 'ergolight'),
-        'eristwoguns': Service(PROTOCOLS['udp'], 2650, 'eristwoguns'),
-        'erpc': Service(PROTOCOLS['udp'], 121, 'erpc'),
-        'es-elmd': Service(PROTOCOLS['udp'], 1822, 'es-elmd'),
-        'esbroker': Service(PROTOCOLS['udp'], 1342, 'esbroker'),
-        'escale': Service(PROTOCOLS['udp'], 3679, 'escale'),
-        'escp-ip': Service(PROTOCOLS['udp'], 621, 'escp-ip'),
-        'escvpnet': Service(PROTOCOLS['udp'], 3629, 'escvpnet'),
-        'eserver-pap': Service(PROTOCOLS['udp'], 3666, 'eserver-pap'),
-        'esimport': Service(PROTOCOLS['udp'], 3564, 'esimport'),
-        'esinstall': Service(PROTOCOLS['udp'], 5599, 'esinstall'),
-        'esip': Service(PROTOCOLS['udp'], 2950, 'esip'),
-        'esl-lm': Service(PROTOCOLS['udp'], 1455, 'esl-lm'),
-        'esmagent': Service(PROTOCOLS['udp'], 5601, 'esmagent'),
-        'esmmanager': Service(PROTOCOLS['udp'], 5600, 'esmmanager'),
-        'esnm-zoning': Service(PROTOCOLS['udp'], 4023, 'esnm-zoning'),
-        'esp-encap': Service(PROTOCOLS['udp'], 2797, 'esp-encap'),
-        'esp-lm': Service(PROTOCOLS['udp'], 3383, 'esp-lm'),
-        'espeech': Service(PROTOCOLS['udp'], 8416, 'espeech'),
-        'espeech-rtp': Service(PROTOCOLS['udp'], 8417, 'espeech-rtp'),
-        'esps-portal': Service(PROTOCOLS['udp'], 2867, 'esps-portal'),
-        'esri-sde': Service(PROTOCOLS['udp'], 5151, 'esri-sde'),
-        'esri_sde': Service(PROTOCOLS['udp'], 5151, 'esri_sde'),
-        'esro-emsdp': Service(PROTOCOLS['udp'], 642, 'esro-emsdp'),
-        'esro-gen': Service(PROTOCOLS['udp'], 259, 'esro-gen'),
-        'essbase': Service(PROTOCOLS['udp'], 1423, 'essbase'),
-        'essp': Service(PROTOCOLS['udp'], 2969, 'essp'),
-        'essweb-gw': Service(PROTOCOLS['udp'], 1772, 'essweb-gw'),
-        'estamp': Service(PROTOCOLS['udp'], 1982, 'estamp'),
-        'etb4j': Service(PROTOCOLS['udp'], 16309, 'etb4j'),
-        'etc-control': Service(PROTOCOLS['udp'], 6107, 'etc-control'),
-        'etebac5': Service(PROTOCOLS['udp'], 1216, 'etebac5'),
-        'etftp': Service(PROTOCOLS['udp'], 1818, 'etftp'),
-        'ethercat': Service(PROTOCOLS['udp'], 34980, 'ethercat'),
-        'ethernet-ip-1': Service(PROTOCOLS['udp'], 2222, 'ethernet-ip-1'),
-        'ethernet-ip-2': Service(PROTOCOLS['udp'], 44818, 'ethernet-ip-2'),
-        'ethernet-ip-s': Service(PROTOCOLS['udp'], 2221, 'ethernet-ip-s'),
-        'ethernet/ip-1': Service(PROTOCOLS['udp'], 2222, 'ethernet/ip-1'),
-        'ethernet/ip-2': Service(PROTOCOLS['udp'], 44818, 'ethernet/ip-2'),
-        'ethoscan': Service(PROTOCOLS['udp'], 6935, 'ethoscan'),
-        'etlservicemgr': Service(PROTOCOLS['udp'], 9001, 'etlservicemgr'),
-        'etp': Service(PROTOCOLS['udp'], 1798, 'etp'),
-        'ets': Service(PROTOCOLS['udp'], 1569, 'ets'),
-        'eudora-set': Service(PROTOCOLS['udp'], 592, 'eudora-set'),
-        'evb-elm': Service(PROTOCOLS['udp'], 1504, 'evb-elm'),
-        'event-listener': Service(PROTOCOLS['udp'], 3017, 'event-listener'),
-        'event-port': Service(PROTOCOLS['udp'], 2069, 'event-port'),
-        'event_listener': Service(PROTOCOLS['udp'], 3017, 'event_listener'),
-        'everydayrc': Service(PROTOCOLS['udp'], 2782, 'everydayrc'),
-        'evm': Service(PROTOCOLS['udp'], 1139, 'evm'),
-        'evtp': Service(PROTOCOLS['udp'], 2834, 'evtp'),
-        'evtp-data': Service(PROTOCOLS['udp'], 2835, 'evtp-data'),
-        'ew-disc-cmd': Service(PROTOCOLS['udp'], 43440, 'ew-disc-cmd'),
-        'ewall': Service(PROTOCOLS['udp'], 1328, 'ewall'),
-        'ewcappsrv': Service(PROTOCOLS['udp'], 1876, 'ewcappsrv'),
-        'ewctsp': Service(PROTOCOLS['udp'], 6066, 'ewctsp'),
-        'ewdgs': Service(PROTOCOLS['udp'], 4092, 'ewdgs'),
-        'ewinstaller': Service(PROTOCOLS['udp'], 4091, 'ewinstaller'),
-        'ewnn': Service(PROTOCOLS['udp'], 2674, 'ewnn'),
-        'exapt-lmgr': Service(PROTOCOLS['udp'], 3759, 'exapt-lmgr'),
-        'exasoftport1': Service(PROTOCOLS['udp'], 3920, 'exasoftport1'),
-        'exbit-escp': Service(PROTOCOLS['udp'], 1316, 'exbit-escp'),
-        'exce': Service(PROTOCOLS['udp'], 2769, 'exce'),
-        'excerpt': Service(PROTOCOLS['udp'], 5400, 'excerpt'),
-        'excerpts': Service(PROTOCOLS['udp'], 5401, 'excerpts'),
-        'excw': Service(PROTOCOLS['udp'], 1271, 'excw'),
-        'exlm-agent': Service(PROTOCOLS['udp'], 3002, 'exlm-agent'),
-        'exoconfig': Service(PROTOCOLS['udp'], 26487, 'exoconfig'),
-        'exoline-udp': Service(PROTOCOLS['udp'], 26486, 'exoline-udp'),
-        'exonet': Service(PROTOCOLS['udp'], 26489, 'exonet'),
-        'exp1': Service(PROTOCOLS['udp'], 1021, 'exp1'),
-        'exp2': Service(PROTOCOLS['udp'], 1022, 'exp2'),
-        'expresspay': Service(PROTOCOLS['udp'], 2755, 'expresspay'),
-        'extensis': Service(PROTOCOLS['udp'], 2666, 'extensis'),
-        'eye2eye': Service(PROTOCOLS['udp'], 1948, 'eye2eye'),
-        'eyelink': Service(PROTOCOLS['udp'], 589, 'eyelink'),
-        'eyetv': Service(PROTOCOLS['udp'], 2170, 'eyetv'),
-        'ezmeeting': Service(PROTOCOLS['udp'], 26261, 'ezmeeting'),
-        'ezmeeting-2': Service(PROTOCOLS['udp'], 10101, 'ezmeeting-2'),
-        'ezproxy': Service(PROTOCOLS['udp'], 26260, 'ezproxy'),
-        'ezproxy-2': Service(PROTOCOLS['udp'], 10102, 'ezproxy-2'),
-        'ezrelay': Service(PROTOCOLS['udp'], 10103, 'ezrelay'),
-        'f5-globalsite': Service(PROTOCOLS['udp'], 2792, 'f5-globalsite'),
-        'f5-iquery': Service(PROTOCOLS['udp'], 4353, 'f5-iquery'),
-        'fac-restore': Service(PROTOCOLS['udp'], 5582, 'fac-restore'),
-        'facelink': Service(PROTOCOLS['udp'], 1915, 'facelink'),
-        'facilityview': Service(PROTOCOLS['udp'], 1561, 'facilityview'),
-        'facsys-ntp': Service(PROTOCOLS['udp'], 2514, 'facsys-ntp'),
-        'facsys-router': Service(PROTOCOLS['udp'], 2515, 'facsys-router'),
-        'fagordnc': Service(PROTOCOLS['udp'], 3873, 'fagordnc'),
-        'fairview': Service(PROTOCOLS['udp'], 38202, 'fairview'),
-        'famdc': Service(PROTOCOLS['udp'], 10081, 'famdc'),
-        'fast-rem-serv': Service(PROTOCOLS['udp'], 2495, 'fast-rem-serv'),
-        'fastlynx': Service(PROTOCOLS['udp'], 2689, 'fastlynx'),
-        'fatpipe': Service(PROTOCOLS['udp'], 3353, 'fatpipe'),
-        'fatserv': Service(PROTOCOLS['udp'], 347, 'fatserv'),
-        'faxcomservice': Service(PROTOCOLS['udp'], 6417, 'faxcomservice'),
-        'faximum': Service(PROTOCOLS['udp'], 7437, 'faximum'),
-        'faxportwinport': Service(PROTOCOLS['udp'], 1620, 'faxportwinport'),
-        'faxstfx-port': Service(PROTOCOLS['udp'], 3684, 'faxstfx-port'),
-        'fazzt-admin': Service(PROTOCOLS['udp'], 4039, 'fazzt-admin'),
-        'fazzt-ptp': Service(PROTOCOLS['udp'], 4038, 'fazzt-ptp'),
-        'fc-cli': Service(PROTOCOLS['udp'], 1371, 'fc-cli'),
-        'fc-faultnotify': Service(PROTOCOLS['udp'], 2819, 'fc-faultnotify'),
-        'fc-ser': Service(PROTOCOLS['udp'], 1372, 'fc-ser'),
-        'fcip-port': Service(PROTOCOLS['udp'], 3225, 'fcip-port'),
-        'fcis-disc': Service(PROTOCOLS['udp'], 4727, 'fcis-disc'),
-        'fcmsys': Service(PROTOCOLS['udp'], 2344, 'fcmsys'),
-        'fcopy-server': Service(PROTOCOLS['udp'], 5745, 'fcopy-server'),
-        'fcopys-server': Service(PROTOCOLS['udp'], 5746, 'fcopys-server'),
-        'fcp': Service(PROTOCOLS['udp'], 510, 'fcp'),
-        'fcp-addr-srvr1': Service(PROTOCOLS['udp'], 5500, 'fcp-addr-srvr1'),
-        'fcp-addr-srvr2': Service(PROTOCOLS['udp'], 5501, 'fcp-addr-srvr2'),
-        'fcp-cics-gw1': Service(PROTOCOLS['udp'], 5504, 'fcp-cics-gw1'),
-        'fcp-srvr-inst1': Service(PROTOCOLS['udp'], 5502, 'fcp-srvr-inst1'),
-        'fcp-srvr-inst2': Service(PROTOCOLS['udp'], 5503, 'fcp-srvr-inst2'),
-        'fcp-udp': Service(PROTOCOLS['udp'], 810, 'fcp-udp'),
-        'fdt-rcatp': Service(PROTOCOLS['udp'], 4320, 'fdt-rcatp'),
-        'feitianrockey': Service(PROTOCOLS['udp'], 3152, 'feitianrockey'),
-        'femis': Service(PROTOCOLS['udp'], 1776, 'femis'),
-        'ferrari-foam': Service(PROTOCOLS['udp'], 3216, 'ferrari-foam'),
-        'ff-annunc': Service(PROTOCOLS['udp'], 1089, 'ff-annunc'),
-        'ff-fms': Service(PROTOCOLS['udp'], 1090, 'ff-fms'),
-        'ff-lr-port': Service(PROTOCOLS['udp'], 3622, 'ff-lr-port'),
-        'ff-sm': Service(PROTOCOLS['udp'], 1091, 'ff-sm'),
-        'ffserver': Service(PROTOCOLS['udp'], 3825, 'ffserver'),
-        'fg-fps': Service(PROTOCOLS['udp'], 3293, 'fg-fps'),
-        'fg-gip': Service(PROTOCOLS['udp'], 3294, 'fg-gip'),
-        'fg-sysupdate': Service(PROTOCOLS['udp'], 6550, 'fg-sysupdate'),
-        'fhc': Service(PROTOCOLS['udp'], 1499, 'fhc'),
-        'fhsp': Service(PROTOCOLS['udp'], 1807, 'fhsp'),
-        'fibotrader-com': Service(PROTOCOLS['udp'], 6715, 'fibotrader-com'),
-        'filecast': Service(PROTOCOLS['udp'], 3401, 'filecast'),
-        'filenet-cm': Service(PROTOCOLS['udp'], 32773, 'filenet-cm'),
-        'filenet-nch': Service(PROTOCOLS['udp'], 32770, 'filenet-nch'),
-        'filenet-obrok': Service(PROTOCOLS['udp'], 32777, 'filenet-obrok'),
-        'filenet-pa': Service(PROTOCOLS['udp'], 32772, 'filenet-pa'),
-        'filenet-pch': Service(PROTOCOLS['udp'], 32775, 'filenet-pch'),
-        'filenet-peior': Service(PROTOCOLS['udp'], 32776, 'filenet-peior'),
-        'filenet-powsrm': Service(PROTOCOLS['udp'], 32767, 'filenet-powsrm'),
-        'filenet-re': Service(PROTOCOLS['udp'], 32774, 'filenet-re'),
-        'filenet-rmi': Service(PROTOCOLS['udp'], 32771, 'filenet-rmi'),
-        'filenet-rpc': Service(PROTOCOLS['udp'], 32769, 'filenet-rpc'),
-        'filenet-tms': Service(PROTOCOLS['udp'], 32768, 'filenet-tms'),
-        'filesphere': Service(PROTOCOLS['udp'], 24242, 'filesphere'),
-        'filex-lport': Service(PROTOCOLS['udp'], 1887, 'filex-lport'),
-        'find': Service(PROTOCOLS['udp'], 24922, 'find'),
-        'findviatv': Service(PROTOCOLS['udp'], 3350, 'findviatv'),
-        'finger': Service(PROTOCOLS['udp'], 79, 'finger'),
-        'finisar': Service(PROTOCOLS['udp'], 4682, 'finisar'),
-        'finle-lm': Service(PROTOCOLS['udp'], 1784, 'finle-lm'),
-        'fintrx': Service(PROTOCOLS['udp'], 3787, 'fintrx'),
-        'fiorano-msgsvc': Service(PROTOCOLS['udp'], 1856, 'fiorano-msgsvc'),
-        'fiorano-rtrsvc': Service(PROTOCOLS['udp'], 1855, 'fiorano-rtrsvc'),
-        'firefox': Service(PROTOCOLS['udp'], 1689, 'firefox'),
-        'firemonrcc': Service(PROTOCOLS['udp'], 3192, 'firemonrcc'),
-        'firepower': Service(PROTOCOLS['udp'], 2615, 'firepower'),
-        'first-defense': Service(PROTOCOLS['udp'], 1232, 'first-defense'),
-        'firstcall42': Service(PROTOCOLS['udp'], 2673, 'firstcall42'),
-        'fis': Service(PROTOCOLS['udp'], 5912, 'fis'),
-        'fiveacross': Service(PROTOCOLS['udp'], 1193, 'fiveacross'),
-        'fj-hdnet': Service(PROTOCOLS['udp'], 1717, 'fj-hdnet'),
-        'fjappmgrbulk': Service(PROTOCOLS['udp'], 2510, 'fjappmgrbulk'),
-        'fjcp': Service(PROTOCOLS['udp'], 3648, 'fjcp'),
-        'fjdmimgr': Service(PROTOCOLS['udp'], 9374, 'fjdmimgr'),
-        'fjdocdist': Service(PROTOCOLS['udp'], 1848, 'fjdocdist'),
-        'fjhpjp': Service(PROTOCOLS['udp'], 3067, 'fjhpjp'),
-        'fjicl-tep-a': Service(PROTOCOLS['udp'], 1901, 'fjicl-tep-a'),
-        'fjicl-tep-b': Service(PROTOCOLS['udp'], 1902, 'fjicl-tep-b'),
-        'fjicl-tep-c': Service(PROTOCOLS['udp'], 1904, 'fjicl-tep-c'),
-        'fjinvmgr': Service(PROTOCOLS['udp'], 9396, 'fjinvmgr'),
-        'fjippol-cnsl': Service(PROTOCOLS['udp'], 2749, 'fjippol-cnsl'),
-        'fjippol-polsvr': Service(PROTOCOLS['udp'], 2748, 'fjippol-polsvr'),
-        'fjippol-port1': Service(PROTOCOLS['udp'], 2750, 'fjippol-port1'),
-        'fjippol-port2': Service(PROTOCOLS['udp'], 2751, 'fjippol-port2'),
-        'fjippol-swrly': Service(PROTOCOLS['udp'], 2747, 'fjippol-swrly'),
-        'fjitsuappmgr': Service(PROTOCOLS['udp'], 2425, 'fjitsuappmgr'),
-        'fjmpcm': Service(PROTOCOLS['udp'], 2975, 'fjmpcm'),
-        'fjmpjps': Service(PROTOCOLS['udp'], 1873, 'fjmpjps'),
-        'fjmpss': Service(PROTOCOLS['udp'], 2509, 'fjmpss'),
-        'fjsv-gssagt': Service(PROTOCOLS['udp'], 3035, 'fjsv-gssagt'),
-        'fjsvmpor': Service(PROTOCOLS['udp'], 2946, 'fjsvmpor'),
-        'fjswapsnp': Service(PROTOCOLS['udp'], 1874, 'fjswapsnp'),
-        'fksp-audit': Service(PROTOCOLS['udp'], 3729, 'fksp-audit'),
-        'flamenco-proxy': Service(PROTOCOLS['udp'], 3210, 'flamenco-proxy'),
-        'flashfiler': Service(PROTOCOLS['udp'], 24677, 'flashfiler'),
-        'flashmsg': Service(PROTOCOLS['udp'], 2884, 'flashmsg'),
-        'flexlm': Service(PROTOCOLS['udp'], 744, 'flexlm'),
-        'flirtmitmir': Service(PROTOCOLS['udp'], 3840, 'flirtmitmir'),
-        'fln-spx': Service(PROTOCOLS['udp'], 221, 'fln-spx'),
-        'florence': Service(PROTOCOLS['udp'], 1228, 'florence'),
-        'flukeserver': Service(PROTOCOLS['udp'], 2359, 'flukeserver'),
-        'fmp': Service(PROTOCOLS['udp'], 4745, 'fmp'),
-        'fmpro-fdal': Service(PROTOCOLS['udp'], 2399, 'fmpro-fdal'),
-        'fmpro-internal': Service(PROTOCOLS['udp'], 5003, 'fmpro-internal'),
-        'fmpro-v6': Service(PROTOCOLS['udp'], 5013, 'fmpro-v6'),
-        'fmtp': Service(PROTOCOLS['udp'], 8500, 'fmtp'),
-        'fnet-remote-ui': Service(PROTOCOLS['udp'], 1174, 'fnet-remote-ui'),
-        'fodms': Service(PROTOCOLS['udp'], 7200, 'fodms'),
-        'foliocorp': Service(PROTOCOLS['udp'], 2242, 'foliocorp'),
-        'font-service': Service(PROTOCOLS['udp'], 7100, 'font-service'),
-        'foresyte-clear': Service(PROTOCOLS['udp'], 5407, 'foresyte-clear'),
-        'foresyte-sec': Service(PROTOCOLS['udp'], 5408, 'foresyte-sec'),
-        'fortisphere-vm': Service(PROTOCOLS['udp'], 4084, 'fortisphere-vm'),
-        'fotogcad': Service(PROTOCOLS['udp'], 3878, 'fotogcad'),
-        'fpitp': Service(PROTOCOLS['udp'], 1045, 'fpitp'),
-        'fpo-fns': Service(PROTOCOLS['udp'], 1066, 'fpo-fns'),
-        'fprams': Service(PROTOCOLS['udp'], 4122, 'fprams'),
-        'frc-hicp-disc': Service(PROTOCOLS['udp'], 7244, 'frc-hicp-disc'),
-        'freeciv': Service(PROTOCOLS['udp'], 5556, 'freeciv'),
-        'freezexservice': Service(PROTOCOLS['udp'], 7726, 'freezexservice'),
-        'fronet': Service(PROTOCOLS['udp'], 4130, 'fronet'),
-        'fryeserv': Service(PROTOCOLS['udp'], 2788, 'fryeserv'),
-        'fs-qos': Service(PROTOCOLS['udp'], 41111, 'fs-qos'),
-        'fs-rh-srv': Service(PROTOCOLS['udp'], 3488, 'fs-rh-srv'),
-        'fsc-port': Service(PROTOCOLS['udp'], 9217, 'fsc-port'),
-        'fse': Service(PROTOCOLS['udp'], 7394, 'fse'),
-        'fsportmap': Service(PROTOCOLS['udp'], 4349, 'fsportmap'),
-        'fsr': Service(PROTOCOLS['udp'], 7164, 'fsr'),
-        'ft-role': Service(PROTOCOLS['udp'], 2429, 'ft-role'),
-        'ftp': Service(PROTOCOLS['udp'], 21, 'ftp'),
-        'ftp-agent': Service(PROTOCOLS['udp'], 574, 'ftp-agent'),
-        'ftp-data': Service(PROTOCOLS['udp'], 20, 'ftp-data'),
-        'ftps': Service(PROTOCOLS['udp'], 990, 'ftps'),
-        'ftps-data': Service(PROTOCOLS['udp'], 989, 'ftps-data'),
-        'ftranhc': Service(PROTOCOLS['udp'], 1105, 'ftranhc'),
-        'ftrapid-1': Service(PROTOCOLS['udp'], 1746, 'ftrapid-1'),
-        'ftrapid-2': Service(PROTOCOLS['udp'], 1747, 'ftrapid-2'),
-        'ftsrv': Service(PROTOCOLS['udp'], 1359, 'ftsrv'),
-        'ftsync': Service(PROTOCOLS['udp'], 4086, 'ftsync'),
-        'fujitsu-dev': Service(PROTOCOLS['udp'], 747, 'fujitsu-dev'),
-        'fujitsu-dtc': Service(PROTOCOLS['udp'], 1513, 'fujitsu-dtc'),
-        'fujitsu-dtcns': Service(PROTOCOLS['udp'], 1514, 'fujitsu-dtcns'),
-        'fujitsu-mmpdc': Service(PROTOCOLS['udp'], 1657, 'fujitsu-mmpdc'),
-        'fujitsu-neat': Service(PROTOCOLS['udp'], 3382, 'fujitsu-neat'),
-        'funk-dialout': Service(PROTOCOLS['udp'], 2909, 'funk-dialout'),
-        'funk-license': Service(PROTOCOLS['udp'], 1787, 'funk-license'),
-        'funk-logger': Service(PROTOCOLS['udp'], 1786, 'funk-logger'),
-        'funkproxy': Service(PROTOCOLS['udp'], 1505, 'funkproxy'),
-        'fuscript': Service(PROTOCOLS['udp'], 1144, 'fuscript'),
-        'futrix': Service(PROTOCOLS['udp'], 2358, 'futrix'),
-        'fxaengine-net': Service(PROTOCOLS['udp'], 3402, 'fxaengine-net'),
-        'fxp': Service(PROTOCOLS['udp'], 2849, 'fxp'),
-        'fxuptp': Service(PROTOCOLS['udp'], 19539, 'fxuptp'),
-        'fyre-messanger': Service(PROTOCOLS['udp'], 2731, 'fyre-messanger'),
-        'g-talk': Service(PROTOCOLS['udp'], 2421, 'g-talk'),
-        'g2tag': Service(PROTOCOLS['udp'], 4110, 'g2tag'),
-        'g5m': Service(PROTOCOLS['udp'], 2732, 'g5m'),
-        'gacp': Service(PROTOCOLS['udp'], 190, 'gacp'),
-        'gadgetgate1way': Service(PROTOCOLS['udp'], 2677, 'gadgetgate1way'),
-        'gadgetgate2way': Service(PROTOCOLS['udp'], 2678, 'gadgetgate2way'),
-        'gadugadu': Service(PROTOCOLS['udp'], 8074, 'gadugadu'),
-        'gaia': Service(PROTOCOLS['udp'], 4340, 'gaia'),
-        'galaxy-network': Service(PROTOCOLS['udp'], 5235, 'galaxy-network'),
-        'galaxy-server': Service(PROTOCOLS['udp'], 3051, 'galaxy-server'),
-        'galaxy7-data': Service(PROTOCOLS['udp'], 38201, 'galaxy7-data'),
-        'galileo': Service(PROTOCOLS['udp'], 3519, 'galileo'),
-        'galileolog': Service(PROTOCOLS['udp'], 3520, 'galileolog'),
-        'gamegen1': Service(PROTOCOLS['udp'], 1738, 'gamegen1'),
-        'gamelobby': Service(PROTOCOLS['udp'], 2914, 'gamelobby'),
-        'gamesmith-port': Service(PROTOCOLS['udp'], 31765, 'gamesmith-port'),
-        'gammafetchsvr': Service(PROTOCOLS['udp'], 1859, 'gammafetchsvr'),
-        'gandalf-lm': Service(PROTOCOLS['udp'], 1421, 'gandalf-lm'),
-        'gap': Service(PROTOCOLS['udp'], 10800, 'gap'),
-        'garmin-marine': Service(PROTOCOLS['udp'], 8322, 'garmin-marine'),
-        'gat-lmd': Service(PROTOCOLS['udp'], 1708, 'gat-lmd'),
-        'gbjd816': Service(PROTOCOLS['udp'], 2626, 'gbjd816'),
-        'gbmt-stars': Service(PROTOCOLS['udp'], 3912, 'gbmt-stars'),
-        'gbs-smp': Service(PROTOCOLS['udp'], 3762, 'gbs-smp'),
-        'gbs-stp': Service(PROTOCOLS['udp'], 3484, 'gbs-stp'),
-        'gc-config': Service(PROTOCOLS['udp'], 3436, 'gc-config'),
-        'gcm-app': Service(PROTOCOLS['udp'], 14145, 'gcm-app'),
-        'gcmonitor': Service(PROTOCOLS['udp'], 2660, 'gcmonitor'),
-        'gcsp': Service(PROTOCOLS['udp'], 3429, 'gcsp'),
-        'gdbremote': Service(PROTOCOLS['udp'], 2159, 'gdbremote'),
-        'gdoi': Service(PROTOCOLS['udp'], 848, 'gdoi'),
-        'gdomap': Service(PROTOCOLS['udp'], 538, 'gdomap'),
-        'gdp-port': Service(PROTOCOLS['udp'], 1997, 'gdp-port'),
-        'gds-adppiw-db': Service(PROTOCOLS['udp'], 4550, 'gds-adppiw-db'),
-        'gds-db': Service(PROTOCOLS['udp'], 3050, 'gds-db'),
-        'gds_db': Service(PROTOCOLS['udp'], 3050, 'gds_db'),
-        'gearman': Service(PROTOCOLS['udp'], 4730, 'gearman'),
-        'gemini-lm': Service(PROTOCOLS['udp'], 1590, 'gemini-lm'),
-        'geneous': Service(PROTOCOLS['udp'], 3381, 'geneous'),
-        'generalsync': Service(PROTOCOLS['udp'], 7962, 'generalsync'),
-        'geneve': Service(PROTOCOLS['udp'], 6081, 'geneve'),
-        'genie': Service(PROTOCOLS['udp'], 402, 'genie'),
-        'genie-lm': Service(PROTOCOLS['udp'], 1453, 'genie-lm'),
-        'genisar-port': Service(PROTOCOLS['udp'], 3475, 'genisar-port'),
-        'geniuslm': Service(PROTOCOLS['udp'], 3005, 'geniuslm'),
-        'genrad-mux': Service(PROTOCOLS['udp'], 176, 'genrad-mux'),
-        'geognosis': Service(PROTOCOLS['udp'], 4326, 'geognosis'),
-        'geognosisman': Service(PROTOCOLS['udp'], 4325, 'geognosisman'),
-        'geolocate': Service(PROTOCOLS['udp'], 3108, 'geolocate'),
-        'gf': Service(PROTOCOLS['udp'], 3530, 'gf'),
-        'ggf-ncp': Service(PROTOCOLS['udp'], 678, 'ggf-ncp'),
-        'ggz': Service(PROTOCOLS['udp'], 5688, 'ggz'),
-        'ghvpn': Service(PROTOCOLS['udp'], 12009, 'ghvpn'),
-        'giga-pocket': Service(PROTOCOLS['udp'], 3862, 'giga-pocket'),
-        'gilatskysurfer': Service(PROTOCOLS['udp'], 3013, 'gilatskysurfer'),
-        'ginad': Service(PROTOCOLS['udp'], 634, 'ginad'),
-        'giop': Service(PROTOCOLS['udp'], 2481, 'giop'),
-        'giop-ssl': Service(PROTOCOLS['udp'], 2482, 'giop-ssl'),
-        'gist': Service(PROTOCOLS['udp'], 270, 'gist'),
-        'git': Service(PROTOCOLS['udp'], 9418, 'git'),
-        'glbp': Service(PROTOCOLS['udp'], 3222, 'glbp'),
-        'glishd': Service(PROTOCOLS['udp'], 2833, 'glishd'),
-        'global-cd-port': Service(PROTOCOLS['udp'], 3229, 'global-cd-port'),
-        'global-dtserv': Service(PROTOCOLS['udp'], 1774, 'global-dtserv'),
-        'global-wlink': Service(PROTOCOLS['udp'], 1909, 'global-wlink'),
-        'globe': Service(PROTOCOLS['udp'], 2002, 'globe'),
-        'globecast-id': Service(PROTOCOLS['udp'], 6109, 'globecast-id'),
-        'globmsgsvc': Service(PROTOCOLS['udp'], 2519, 'globmsgsvc'),
-        'glogger': Service(PROTOCOLS['udp'], 2033, 'glogger'),
-        'glrpc': Service(PROTOCOLS['udp'], 9080, 'glrpc'),
-        'gmrupdateserv': Service(PROTOCOLS['udp'], 1070, 'gmrupdateserv'),
-        'gnunet': Service(PROTOCOLS['udp'], 2086, 'gnunet'),
-        'gnutella-rtr': Service(PROTOCOLS['udp'], 6347, 'gnutella-rtr'),
-        'gnutella-svc': Service(PROTOCOLS['udp'], 6346, 'gnutella-svc'),
-        'go-login': Service(PROTOCOLS['udp'], 491, 'go-login'),
-        'goahead-fldup': Service(PROTOCOLS['udp'], 3057, 'goahead-fldup'),
-        'gog-multiplayer': Service(PROTOCOLS['udp'], 5687, 'gog-multiplayer'),
-        'goldleaf-licman': Service(PROTOCOLS['udp'], 1401, 'goldleaf-licman'),
-        'gopher': Service(PROTOCOLS['udp'], 70, 'gopher'),
-        'gotodevice': Service(PROTOCOLS['udp'], 2217, 'gotodevice'),
-        'gpfs': Service(PROTOCOLS['udp'], 1191, 'gpfs'),
-        'gppitnp': Service(PROTOCOLS['udp'], 103, 'gppitnp'),
-        'gprs-cube': Service(PROTOCOLS['udp'], 3751, 'gprs-cube'),
-        'gprs-sig': Service(PROTOCOLS['udp'], 3386, 'gprs-sig'),
-        'gpsd': Service(PROTOCOLS['udp'], 2947, 'gpsd'),
-        'graphics': Service(PROTOCOLS['udp'], 41, 'graphics'),
-        'grasp': Service(PROTOCOLS['udp'], 7017, 'grasp'),
-        'gre-in-udp': Service(PROTOCOLS['udp'], 4754, 'gre-in-udp'),
-        'gre-udp-dtls': Service(PROTOCOLS['udp'], 4755, 'gre-udp-dtls'),
-        'grf-port': Service(PROTOCOLS['udp'], 3757, 'grf-port'),
-        'grid': Service(PROTOCOLS['udp'], 6268, 'grid'),
-        'grid-alt': Service(PROTOCOLS['udp'], 6269, 'grid-alt'),
-        'gridgen-elmd': Service(PROTOCOLS['udp'], 1542, 'gridgen-elmd'),
-        'griffin': Service(PROTOCOLS['udp'], 2458, 'griffin'),
-        'gris': Service(PROTOCOLS['udp'], 2135, 'gris'),
-        'groove': Service(PROTOCOLS['udp'], 2492, 'groove'),
-        'groove-dpp': Service(PROTOCOLS['udp'], 1211, 'groove-dpp'),
-        'groupwise': Service(PROTOCOLS['udp'], 1677, 'groupwise'),
-        'grubd': Service(PROTOCOLS['udp'], 3136, 'grubd'),
-        'gsakmp': Service(PROTOCOLS['udp'], 3761, 'gsakmp'),
-        'gsi': Service(PROTOCOLS['udp'], 1850, 'gsi'),
-        'gsiftp': Service(PROTOCOLS['udp'], 2811, 'gsiftp'),
-        'gsigatekeeper': Service(PROTOCOLS['udp'], 2119, 'gsigatekeeper'),
-        'gsmtap': Service(PROTOCOLS['udp'], 4729, 'gsmtap'),
-        'gss-http': Service(PROTOCOLS['udp'], 488, 'gss-http'),
-        'gss-xlicen': Service(PROTOCOLS['udp'], 128, 'gss-xlicen'),
-        'gt-proxy': Service(PROTOCOLS['udp'], 9889, 'gt-proxy'),
-        'gtaua': Service(PROTOCOLS['udp'], 2186, 'gtaua'),
-        'gte-samp': Service(PROTOCOLS['udp'], 2643, 'gte-samp'),
-        'gtegsc-lm': Service(PROTOCOLS['udp'], 1452, 'gtegsc-lm'),
-        'gtp-control': Service(PROTOCOLS['udp'], 2123, 'gtp-control'),
-        'gtp-user': Service(PROTOCOLS['udp'], 2152, 'gtp-user'),
-        'gtrack-ne': Service(PROTOCOLS['udp'], 3592, 'gtrack-ne'),
-        'gtrack-server': Service(PROTOCOLS['udp'], 3591, 'gtrack-server'),
-        'gue': Service(PROTOCOLS['udp'], 6080, 'gue'),
-        'guibase': Service(PROTOCOLS['udp'], 9321, 'guibase'),
-        'gv-pf': Service(PROTOCOLS['udp'], 18262, 'gv-pf'),
-        'gv-us': Service(PROTOCOLS['udp'], 1369, 'gv-us'),
-        'gvcp': Service(PROTOCOLS['udp'], 3956, 'gvcp'),
-        'gw-asv': Service(PROTOCOLS['udp'], 4842, 'gw-asv'),
-        'gw-call-port': Service(PROTOCOLS['udp'], 3745, 'gw-call-port'),
-        'gw-log': Service(PROTOCOLS['udp'], 4844, 'gw-log'),
-        'gwen-sonya': Service(PROTOCOLS['udp'], 2778, 'gwen-sonya'),
-        'gwha': Service(PROTOCOLS['udp'], 1383, 'gwha'),
-        'gxs-data-port': Service(PROTOCOLS['udp'], 2073, 'gxs-data-port'),
-        'gxtelmd': Service(PROTOCOLS['udp'], 2356, 'gxtelmd'),
-        'h2250-annex-g': Service(PROTOCOLS['udp'], 2099, 'h2250-annex-g'),
-        'h248-binary': Service(PROTOCOLS['udp'], 2945, 'h248-binary'),
-        'h263-video': Service(PROTOCOLS['udp'], 2979, 'h263-video'),
-        'h2gf-w-2m': Service(PROTOCOLS['udp'], 3179, 'h2gf-w-2m'),
-        'h323callsigalt': Service(PROTOCOLS['udp'], 11720, 'h323callsigalt'),
-        'h323gatedisc': Service(PROTOCOLS['udp'], 1718, 'h323gatedisc'),
-        'h323gatestat': Service(PROTOCOLS['udp'], 1719, 'h323gatestat'),
-        'h323hostcall': Service(PROTOCOLS['udp'], 1720, 'h323hostcall'),
-        'h323hostcallsc': Service(PROTOCOLS['udp'], 1300, 'h323hostcallsc'),
-        'ha-cluster': Service(PROTOCOLS['udp'], 694, 'ha-cluster'),
-        'hacl-cfg': Service(PROTOCOLS['udp'], 5302, 'hacl-cfg'),
-        'hacl-gs': Service(PROTOCOLS['udp'], 5301, 'hacl-gs'),
-        'hacl-hb': Service(PROTOCOLS['udp'], 5300, 'hacl-hb'),
-        'hacl-local': Service(PROTOCOLS['udp'], 5304, 'hacl-local'),
-        'hacl-monitor': Service(PROTOCOLS['udp'], 3542, 'hacl-monitor'),
-        'hacl-poll': Service(PROTOCOLS['udp'], 5315, 'hacl-poll'),
-        'hacl-probe': Service(PROTOCOLS['udp'], 5303, 'hacl-probe'),
-        'hacl-qs': Service(PROTOCOLS['udp'], 1238, 'hacl-qs'),
-        'hacl-test': Service(PROTOCOLS['udp'], 5305, 'hacl-test'),
-        'hagel-dump': Service(PROTOCOLS['udp'], 3036, 'hagel-dump'),
-        'haipe-discover': Service(PROTOCOLS['udp'], 3623, 'haipe-discover'),
-        'haipe-otnk': Service(PROTOCOLS['udp'], 3769, 'haipe-otnk'),
-        'hao': Service(PROTOCOLS['udp'], 2245, 'hao'),
-        'hap': Service(PROTOCOLS['udp'], 661, 'hap'),
-        'harp': Service(PROTOCOLS['udp'], 1816, 'harp'),
-        'hart-ip': Service(PROTOCOLS['udp'], 5094, 'hart-ip'),
-        'hassle': Service(PROTOCOLS['udp'], 375, 'hassle'),
-        'hb-engine': Service(PROTOCOLS['udp'], 1703, 'hb-engine'),
-        'hbci': Service(PROTOCOLS['udp'], 3000, 'hbci'),
-        'hcp-wismar': Service(PROTOCOLS['udp'], 686, 'hcp-wismar'),
-        'hctl': Service(PROTOCOLS['udp'], 4197, 'hctl'),
-        'hdap': Service(PROTOCOLS['udp'], 263, 'hdap'),
-        'hde-lcesrvr-1': Service(PROTOCOLS['udp'], 14936, 'hde-lcesrvr-1'),
-        'hde-lcesrvr-2': Service(PROTOCOLS['udp'], 14937, 'hde-lcesrvr-2'),
-        'hdl-srv': Service(PROTOCOLS['udp'], 2641, 'hdl-srv'),
-        'health-polling': Service(PROTOCOLS['udp'], 1161, 'health-polling'),
-        'health-trap': Service(PROTOCOLS['udp'], 1162, 'health-trap'),
-        'healthd': Service(PROTOCOLS['udp'], 1281, 'healthd'),
-        'heartbeat': Service(PROTOCOLS['udp'], 3740, 'heartbeat'),
-        'hecmtl-db': Service(PROTOCOLS['udp'], 1551, 'hecmtl-db'),
-        'helix': Service(PROTOCOLS['udp'], 10860, 'helix'),
-        'hello': Service(PROTOCOLS['udp'], 1789, 'hello'),
-        'hello-port': Service(PROTOCOLS['udp'], 652, 'hello-port'),
-        'hems': Service(PROTOCOLS['udp'], 151, 'hems'),
-        'here-lm': Service(PROTOCOLS['udp'], 1409, 'here-lm'),
-        'hermes': Service(PROTOCOLS['udp'], 1248, 'hermes'),
-        'herodotus-net': Service(PROTOCOLS['udp'], 3921, 'herodotus-net'),
-        'hexarc': Service(PROTOCOLS['udp'], 7397, 'hexarc'),
-        'hfcs': Service(PROTOCOLS['udp'], 4900, 'hfcs'),
-        'hfcs-manager': Service(PROTOCOLS['udp'], 4999, 'hfcs-manager'),
-        'hhb-gateway': Service(PROTOCOLS['udp'], 1136, 'hhb-gateway'),
-        'hhb-handheld': Service(PROTOCOLS['udp'], 4148, 'hhb-handheld'),
-        'hicp': Service(PROTOCOLS['udp'], 3250, 'hicp'),
-        'hid': Service(PROTOCOLS['udp'], 24322, 'hid'),
-        'high-criteria': Service(PROTOCOLS['udp'], 2467, 'high-criteria'),
-        'hillrserv': Service(PROTOCOLS['udp'], 4117, 'hillrserv'),
-        'hip-nat-t': Service(PROTOCOLS['udp'], 10500, 'hip-nat-t'),
-        'hippad': Service(PROTOCOLS['udp'], 2988, 'hippad'),
-        'hiq': Service(PROTOCOLS['udp'], 1410, 'hiq'),
-        'hivep': Service(PROTOCOLS['udp'], 12172, 'hivep'),
-        'hivestor': Service(PROTOCOLS['udp'], 4884, 'hivestor'),
-        'hkp': Service(PROTOCOLS['udp'], 11371, 'hkp'),
-        'hks-lm': Service(PROTOCOLS['udp'], 1722, 'hks-lm'),
-        'hl7': Service(PROTOCOLS['udp'], 2575, 'hl7'),
-        'hlibmgr': Service(PROTOCOLS['udp'], 3634, 'hlibmgr'),
-        'hlserver': Service(PROTOCOLS['udp'], 3047, 'hlserver'),
-        'hmmp-ind': Service(PROTOCOLS['udp'], 612, 'hmmp-ind'),
-        'hmmp-op': Service(PROTOCOLS['udp'], 613, 'hmmp-op'),
-        'hncp-dtls-port': Service(PROTOCOLS['udp'], 8232, 'hncp-dtls-port'),
-        'hncp-udp-port': Service(PROTOCOLS['udp'], 8231, 'hncp-udp-port'),
-        'hnm': Service(PROTOCOLS['udp'], 6791, 'hnm'),
-        'hnmp': Service(PROTOCOLS['udp'], 6790, 'hnmp'),
-        'homeportal-web': Service(PROTOCOLS['udp'], 3941, 'homeportal-web'),
-        'homesteadglory': Service(PROTOCOLS['udp'], 2597, 'homesteadglory'),
-        'honyaku': Service(PROTOCOLS['udp'], 2744, 'honyaku'),
-        'hostname': Service(PROTOCOLS['udp'], 101, 'hostname'),
-        'hotu-chat': Service(PROTOCOLS['udp'], 3449, 'hotu-chat'),
-        'houdini-lm': Service(PROTOCOLS['udp'], 1715, 'houdini-lm'),
-        'houston': Service(PROTOCOLS['udp'], 4041, 'houston'),
-        'hp-3000-telnet': Service(PROTOCOLS['udp'], 2564, 'hp-3000-telnet'),
-        'hp-alarm-mgr': Service(PROTOCOLS['udp'], 383, 'hp-alarm-mgr'),
-        'hp-clic': Service(PROTOCOLS['udp'], 3384, 'hp-clic'),
-        'hp-collector': Service(PROTOCOLS['udp'], 381, 'hp-collector'),
-        'hp-dataprotect': Service(PROTOCOLS['udp'], 3612, 'hp-dataprotect'),
-        'hp-device-disc': Service(PROTOCOLS['udp'], 3329, 'hp-device-disc'),
-        'hp-hcip': Service(PROTOCOLS['udp'], 1782, 'hp-hcip'),
-        'hp-hcip-gwy': Service(PROTOCOLS['udp'], 1803, 'hp-hcip-gwy'),
-        'hp-managed-node': Service(PROTOCOLS['udp'], 382, 'hp-managed-node'),
-        'hp-nnm-data': Service(PROTOCOLS['udp'], 2690, 'hp-nnm-data'),
-        'hp-pdl-datastr': Service(PROTOCOLS['udp'], 9100, 'hp-pdl-datastr'),
-        'hp-pxpib': Service(PROTOCOLS['udp'], 3101, 'hp-pxpib'),
-        'hp-san-mgmt': Service(PROTOCOLS['udp'], 3037, 'hp-san-mgmt'),
-        'hp-sca': Service(PROTOCOLS['udp'], 19411, 'hp-sca'),
-        'hp-sci': Service(PROTOCOLS['udp'], 1299, 'hp-sci'),
-        'hp-sco': Service(PROTOCOLS['udp'], 19410, 'hp-sco'),
-        'hp-server': Service(PROTOCOLS['udp'], 5225, 'hp-server'),
-        'hp-sessmon': Service(PROTOCOLS['udp'], 19412, 'hp-sessmon'),
-        'hp-status': Service(PROTOCOLS['udp'], 5226, 'hp-status'),
-        'hp-webadmin': Service(PROTOCOLS['udp'], 1188, 'hp-webadmin'),
-        'hp-webqosdb': Service(PROTOCOLS['udp'], 1877, 'hp-webqosdb'),
-        'hpidsadmin': Service(PROTOCOLS['udp'], 2984, 'hpidsadmin'),
-        'hpidsagent': Service(PROTOCOLS['udp'], 2985, 'hpidsagent'),
-        'hpiod': Service(PROTOCOLS['udp'], 2208, 'hpiod'),
-        'hpocbus': Service(PROTOCOLS['udp'], 2206, 'hpocbus'),
-        'hpoms-ci-lstn': Service(PROTOCOLS['udp'], 5403, 'hpoms-ci-lstn'),
-        'hpoms-dps-lstn': Service(PROTOCOLS['udp'], 5404, 'hpoms-dps-lstn'),
-        'hpppssvr': Service(PROTOCOLS['udp'], 2448, 'hpppssvr'),
-        'hppronetman': Service(PROTOCOLS['udp'], 3908, 'hppronetman'),
-        'hpss-ndapi': Service(PROTOCOLS['udp'], 1217, 'hpss-ndapi'),
-        'hpssd': Service(PROTOCOLS['udp'], 2207, 'hpssd'),
-        'hpssmgmt': Service(PROTOCOLS['udp'], 4484, 'hpssmgmt'),
-        'hpstgmgr': Service(PROTOCOLS['udp'], 2600, 'hpstgmgr'),
-        'hpstgmgr2': Service(PROTOCOLS['udp'], 2715, 'hpstgmgr2'),
-        'hpvirtctrl': Service(PROTOCOLS['udp'], 5224, 'hpvirtctrl'),
-        'hpvirtgrp': Service(PROTOCOLS['udp'], 5223, 'hpvirtgrp'),
-        'hpvmmagent': Service(PROTOCOLS['udp'], 1125, 'hpvmmagent'),
-        'hpvmmcontrol': Service(PROTOCOLS['udp'], 1124, 'hpvmmcontrol'),
-        'hpvmmdata': Service(PROTOCOLS['udp'], 1126, 'hpvmmdata'),
-        'hrd-ns-disc': Service(PROTOCOLS['udp'], 6324, 'hrd-ns-disc'),
-        'hri-port': Service(PROTOCOLS['udp'], 3439, 'hri-port'),
-        'hrpd-ith-at-an': Service(PROTOCOLS['udp'], 4592, 'hrpd-ith-at-an'),
-        'hs-port': Service(PROTOCOLS['udp'], 2570, 'hs-port'),
-        'hsl-storm': Service(PROTOCOLS['udp'], 2113, 'hsl-storm'),
-        'hsrp': Service(PROTOCOLS['udp'], 1985, 'hsrp'),
-        'hsrpv6': Service(PROTOCOLS['udp'], 2029, 'hsrpv6'),
-        'htcp': Service(PROTOCOLS['udp'], 4827, 'htcp'),
-        'htrust': Service(PROTOCOLS['udp'], 5628, 'htrust'),
-        'http': Service(PROTOCOLS['udp'], 80, 'http'),
-        'http-alt': Service(PROTOCOLS['udp'], 8080, 'http-alt'),
-        'http-mgmt': Service(PROTOCOLS['udp'], 280, 'http-mgmt'),
-        'http-rpc-epmap': Service(PROTOCOLS['udp'], 593, 'http-rpc-epmap'),
-        'http-wmap': Service(PROTOCOLS['udp'], 8990, 'http-wmap'),
-        'https': Service(PROTOCOLS['udp'], 443, 'https'),
-        'https-wmap': Service(PROTOCOLS['udp'], 8991, 'https-wmap'),
-        'httpx': Service(PROTOCOLS['udp'], 4180, 'httpx'),
-        'htuilsrv': Service(PROTOCOLS['udp'], 5023, 'htuilsrv'),
-        'hughes-ap': Service(PROTOCOLS['udp'], 5105, 'hughes-ap'),
-        'husky': Service(PROTOCOLS['udp'], 1310, 'husky'),
-        'hybrid': Service(PROTOCOLS['udp'], 1424, 'hybrid'),
-        'hybrid-pop': Service(PROTOCOLS['udp'], 473, 'hybrid-pop'),
-        'hydap': Service(PROTOCOLS['udp'], 15000, 'hydap'),
-        'hylafax': Service(PROTOCOLS['udp'], 4559, 'hylafax'),
-        'hyper-g': Service(PROTOCOLS['udp'], 418, 'hyper-g'),
-        'hypercube-lm': Service(PROTOCOLS['udp'], 1577, 'hypercube-lm'),
-        'hyperip': Service(PROTOCOLS['udp'], 3919, 'hyperip'),
-        'hyperscsi-port': Service(PROTOCOLS['udp'], 5674, 'hyperscsi-port'),
-        'hyperwave-isp': Service(PROTOCOLS['udp'], 692, 'hyperwave-isp'),
-        'i-net-2000-npr': Service(PROTOCOLS['udp'], 5069, 'i-net-2000-npr'),
-        'i-zipqd': Service(PROTOCOLS['udp'], 13160, 'i-zipqd'),
-        'i3-sessionmgr': Service(PROTOCOLS['udp'], 3952, 'i3-sessionmgr'),
-        'iadt-disc': Service(PROTOCOLS['udp'], 4169, 'iadt-disc'),
-        'iafdbase': Service(PROTOCOLS['udp'], 480, 'iafdbase'),
-        'iafserver': Service(PROTOCOLS['udp'], 479, 'iafserver'),
-        'ianywhere-dbns': Service(PROTOCOLS['udp'], 3968, 'ianywhere-dbns'),
-        'iapp': Service(PROTOCOLS['udp'], 2313, 'iapp'),
-        'ias-admind': Service(PROTOCOLS['udp'], 2141, 'ias-admind'),
-        'ias-auth': Service(PROTOCOLS['udp'], 2139, 'ias-auth'),
-        'ias-neighbor': Service(PROTOCOLS['udp'], 4596, 'ias-neighbor'),
-        'ias-paging': Service(PROTOCOLS['udp'], 4595, 'ias-paging'),
-        'ias-reg': Service(PROTOCOLS['udp'], 2140, 'ias-reg'),
-        'ias-session': Service(PROTOCOLS['udp'], 4594, 'ias-session'),
-        'iascontrol': Service(PROTOCOLS['udp'], 1157, 'iascontrol'),
-        'iascontrol-oms': Service(PROTOCOLS['udp'], 1156, 'iascontrol-oms'),
-        'iasd': Service(PROTOCOLS['udp'], 432, 'iasd'),
-        'iatp-highpri': Service(PROTOCOLS['udp'], 6998, 'iatp-highpri'),
-        'iatp-normalpri': Service(PROTOCOLS['udp'], 6999, 'iatp-normalpri'),
-        'iax': Service(PROTOCOLS['udp'], 4569, 'iax'),
-        'ibar': Service(PROTOCOLS['udp'], 5784, 'ibar'),
-        'iberiagames': Service(PROTOCOLS['udp'], 1726, 'iberiagames'),
-        'ibm-abtact': Service(PROTOCOLS['udp'], 1586, 'ibm-abtact'),
-        'ibm-app': Service(PROTOCOLS['udp'], 385, 'ibm-app'),
-        'ibm-cics': Service(PROTOCOLS['udp'], 1435, 'ibm-cics'),
-        'ibm-db2': Service(PROTOCOLS['udp'], 523, 'ibm-db2'),
-        'ibm-dial-out': Service(PROTOCOLS['udp'], 3267, 'ibm-dial-out'),
-        'ibm-diradm': Service(PROTOCOLS['udp'], 3538, 'ibm-diradm'),
-        'ibm-diradm-ssl': Service(PROTOCOLS['udp'], 3539, 'ibm-diradm-ssl'),
-        'ibm-dt-2': Service(PROTOCOLS['udp'], 1792, 'ibm-dt-2'),
-        'ibm-mgr': Service(PROTOCOLS['udp'], 3801, 'ibm-mgr'),
-        'ibm-mqseries': Service(PROTOCOLS['udp'], 1414, 'ibm-mqseries'),
-        'ibm-mqseries2': Service(PROTOCOLS['udp'], 1881, 'ibm-mqseries2'),
-        'ibm-pps': Service(PROTOCOLS['udp'], 1376, 'ibm-pps'),
-        'ibm-res': Service(PROTOCOLS['udp'], 1405, 'ibm-res'),
-        'ibm-rsyscon': Service(PROTOCOLS['udp'], 9085, 'ibm-rsyscon'),
-        'ibm-ssd': Service(PROTOCOLS['udp'], 1260, 'ibm-ssd'),
-        'ibm-wrless-lan': Service(PROTOCOLS['udp'], 1461, 'ibm-wrless-lan'),
-        'ibm3494': Service(PROTOCOLS['udp'], 3494, 'ibm3494'),
-        'ibm_wrless_lan': Service(PROTOCOLS['udp'], 1461, 'ibm_wrless_lan'),
-        'ibp': Service(PROTOCOLS['udp'], 2572, 'ibp'),
-        'ibprotocol': Service(PROTOCOLS['udp'], 6714, 'ibprotocol'),
-        'ibridge-data': Service(PROTOCOLS['udp'], 2275, 'ibridge-data'),
-        'ibridge-mgmt': Service(PROTOCOLS['udp'], 2276, 'ibridge-mgmt'),
-        'ibus': Service(PROTOCOLS['udp'], 8733, 'ibus'),
-        'ica': Service(PROTOCOLS['udp'], 1494, 'ica'),
-        'icabrowser': Service(PROTOCOLS['udp'], 1604, 'icabrowser'),
-        'icad-el': Service(PROTOCOLS['udp'], 425, 'icad-el'),
-        'icap': Service(PROTOCOLS['udp'], 1344, 'icap'),
-        'iccrushmore': Service(PROTOCOLS['udp'], 6850, 'iccrushmore'),
-        'ice-location': Service(PROTOCOLS['udp'], 4061, 'ice-location'),
-        'ice-router': Service(PROTOCOLS['udp'], 4063, 'ice-router'),
-        'ice-slocation': Service(PROTOCOLS['udp'], 4062, 'ice-slocation'),
-        'ice-srouter': Service(PROTOCOLS['udp'], 4064, 'ice-srouter'),
-        'iceedcp-rx': Service(PROTOCOLS['udp'], 31949, 'iceedcp-rx'),
-        'iceedcp-tx': Service(PROTOCOLS['udp'], 31948, 'iceedcp-tx'),
-        'iceedcp_rx': Service(PROTOCOLS['udp'], 31949, 'iceedcp_rx'),
-        'iceedcp_tx': Service(PROTOCOLS['udp'], 31948, 'iceedcp_tx'),
-        'icg-bridge': Service(PROTOCOLS['udp'], 2063, 'icg-bridge'),
-        'icg-iprelay': Service(PROTOCOLS['udp'], 2064, 'icg-iprelay'),
-        'icg-swp': Service(PROTOCOLS['udp'], 2062, 'icg-swp'),
-        'ici': Service(PROTOCOLS['udp'], 2200, 'ici'),
-        'icl-twobase1': Service(PROTOCOLS['udp'], 25000, 'icl-twobase1'),
-        'icl-twobase10': Service(PROTOCOLS['udp'], 25009, 'icl-twobase10'),
-        'icl-twobase2': Service(PROTOCOLS['udp'], 25001, 'icl-twobase2'),
-        'icl-twobase3': Service(PROTOCOLS['udp'], 25002, 'icl-twobase3'),
-        'icl-twobase4': Service(PROTOCOLS['udp'], 25003, 'icl-twobase4'),
-        'icl-twobase5': Service(PROTOCOLS['udp'], 25004, 'icl-twobase5'),
-        'icl-twobase6': Service(PROTOCOLS['udp'], 25005, 'icl-twobase6'),
-        'icl-twobase7': Service(PROTOCOLS['udp'], 25006, 'icl-twobase7'),
-        'icl-twobase8': Service(PROTOCOLS['udp'], 25007, 'icl-twobase8'),
-        'icl-twobase9': Service(PROTOCOLS['udp'], 25008, 'icl-twobase9'),
-        'iclcnet-locate': Service(PROTOCOLS['udp'], 886, 'iclcnet-locate'),
-        'iclcnet-svinfo': Service(PROTOCOLS['udp'], 887, 'iclcnet-svinfo'),
-        'iclcnet_svinfo': Service(PROTOCOLS['udp'], 887, 'iclcnet_svinfo'),
-        'iclpv-dm': Service(PROTOCOLS['udp'], 1389, 'iclpv-dm'),
-        'iclpv-nlc': Service(PROTOCOLS['udp'], 1394, 'iclpv-nlc'),
-        'iclpv-nls': Service(PROTOCOLS['udp'], 1393, 'iclpv-nls'),
-        'iclpv-pm': Service(PROTOCOLS['udp'], 1392, 'iclpv-pm'),
-        'iclpv-sas': Service(PROTOCOLS['udp'], 1391, 'iclpv-sas'),
-        'iclpv-sc': Service(PROTOCOLS['udp'], 1390, 'iclpv-sc'),
-        'iclpv-wsm': Service(PROTOCOLS['udp'], 1395, 'iclpv-wsm'),
-        'icmpd': Service(PROTOCOLS['udp'], 5813, 'icmpd'),
-        'icms': Service(PROTOCOLS['udp'], 4486, 'icms'),
-        'icon-discover': Service(PROTOCOLS['udp'], 2799, 'icon-discover'),
-        'iconp': Service(PROTOCOLS['udp'], 3972, 'iconp'),
-        'icp': Service(PROTOCOLS['udp'], 1112, 'icp'),
-        'icpp': Service(PROTOCOLS['udp'], 14142, 'icpp'),
-        'icpv2': Service(PROTOCOLS['udp'], 3130, 'icpv2'),
-        'icslap': Service(PROTOCOLS['udp'], 2869, 'icslap'),
-        'ida-discover1': Service(PROTOCOLS['udp'], 5741, 'ida-discover1'),
-        'ida-discover2': Service(PROTOCOLS['udp'], 5742, 'ida-discover2'),
-        'idac': Service(PROTOCOLS['udp'], 3881, 'idac'),
-        'idcp': Service(PROTOCOLS['udp'], 2326, 'idcp'),
-        'ideafarm-door': Service(PROTOCOLS['udp'], 902, 'ideafarm-door'),
-        'ideafarm-panic': Service(PROTOCOLS['udp'], 903, 'ideafarm-panic'),
-        'ideesrv': Service(PROTOCOLS['udp'], 2337, 'ideesrv'),
-        'iden-ralp': Service(PROTOCOLS['udp'], 1725, 'iden-ralp'),
-        'identify': Service(PROTOCOLS['udp'], 2987, 'identify'),
-        'idfp': Service(PROTOCOLS['udp'], 549, 'idfp'),
-        'idig-mux': Service(PROTOCOLS['udp'], 4152, 'idig-mux'),
-        'idig_mux': Service(PROTOCOLS['udp'], 4152, 'idig_mux'),
-        'idmaps': Service(PROTOCOLS['udp'], 1884, 'idmaps'),
-        'idmgratm': Service(PROTOCOLS['udp'], 32896, 'idmgratm'),
-        'idonix-metanet': Service(PROTOCOLS['udp'], 2112, 'idonix-metanet'),
-        'idotdist': Service(PROTOCOLS['udp'], 2590, 'idotdist'),
-        'idp': Service(PROTOCOLS['udp'], 4067, 'idp'),
-        'idp-infotrieve': Service(PROTOCOLS['udp'], 2966, 'idp-infotrieve'),
-        'idps': Service(PROTOCOLS['udp'], 3797, 'idps'),
-        'idrs': Service(PROTOCOLS['udp'], 2995, 'idrs'),
-        'idware-router': Service(PROTOCOLS['udp'], 2079, 'idware-router'),
-        'idxp': Service(PROTOCOLS['udp'], 603, 'idxp'),
-        'iec-104': Service(PROTOCOLS['udp'], 2404, 'iec-104'),
-        'iee-qfx': Service(PROTOCOLS['udp'], 1284, 'iee-qfx'),
-        'ieee-mih': Service(PROTOCOLS['udp'], 4551, 'ieee-mih'),
-        'ieee-mms': Service(PROTOCOLS['udp'], 651, 'ieee-mms'),
-        'ieee-mms-ssl': Service(PROTOCOLS['udp'], 695, 'ieee-mms-ssl'),
-        'ieee11073-20701': Service(PROTOCOLS['udp'], 6464, 'ieee11073-20701'),
-        'ies-lm': Service(PROTOCOLS['udp'], 1443, 'ies-lm'),
-        'ifcp-port': Service(PROTOCOLS['udp'], 3420, 'ifcp-port'),
-        'ife-icorp': Service(PROTOCOLS['udp'], 5165, 'ife-icorp'),
-        'ife_icorp': Service(PROTOCOLS['udp'], 5165, 'ife_icorp'),
-        'ifor-protocol': Service(PROTOCOLS['udp'], 1515, 'ifor-protocol'),
-        'ifsf-hb-port': Service(PROTOCOLS['udp'], 3486, 'ifsf-hb-port'),
-        'ifsp': Service(PROTOCOLS['udp'], 4744, 'ifsp'),
-        'igcp': Service(PROTOCOLS['udp'], 2801, 'igcp'),
-        'igi-lm': Service(PROTOCOLS['udp'], 1404, 'igi-lm'),
-        'igmpv3lite': Service(PROTOCOLS['udp'], 465, 'igmpv3lite'),
-        'igo-incognito': Service(PROTOCOLS['udp'], 4100, 'igo-incognito'),
-        'igrid': Service(PROTOCOLS['udp'], 19000, 'igrid'),
-        'igrs': Service(PROTOCOLS['udp'], 3880, 'igrs'),
-        'ii-admin': Service(PROTOCOLS['udp'], 3006, 'ii-admin'),
-        'iims': Service(PROTOCOLS['udp'], 4800, 'iims'),
-        'iiop': Service(PROTOCOLS['udp'], 535, 'iiop'),
-        'iiw-port': Service(PROTOCOLS['udp'], 3186, 'iiw-port'),
-        'ild': Service(PROTOCOLS['udp'], 24321, 'ild'),
-        'ill': Service(PROTOCOLS['udp'], 1611, 'ill'),
-        'ilss': Service(PROTOCOLS['udp'], 4802, 'ilss'),
-        'imagepump': Service(PROTOCOLS['udp'], 27345, 'imagepump'),
-        'imagequery': Service(PROTOCOLS['udp'], 2239, 'imagequery'),
-        'imap': Service(PROTOCOLS['udp'], 143, 'imap'),
-        'imap3': Service(PROTOCOLS['udp'], 220, 'imap3'),
-        'imaps': Service(PROTOCOLS['udp'], 993, 'imaps'),
-        'imdocsvc': Service(PROTOCOLS['udp'], 2637, 'imdocsvc'),
-        'imgames': Service(PROTOCOLS['udp'], 1077, 'imgames'),
-        'imip': Service(PROTOCOLS['udp'], 11319, 'imip'),
-        'imip-channels': Service(PROTOCOLS['udp'], 11320, 'imip-channels'),
-        'immedianet-bcn': Service(PROTOCOLS['udp'], 3657, 'immedianet-bcn'),
-        'imoguia-port': Service(PROTOCOLS['udp'], 3907, 'imoguia-port'),
-        'impera': Service(PROTOCOLS['udp'], 1710, 'impera'),
-        'imprs': Service(PROTOCOLS['udp'], 3164, 'imprs'),
-        'imqbrokerd': Service(PROTOCOLS['udp'], 7676, 'imqbrokerd'),
-        'imqtunnel': Service(PROTOCOLS['udp'], 7675, 'imqtunnel'),
-        'imqtunnels': Service(PROTOCOLS['udp'], 7674, 'imqtunnels'),
-        'imsldoc': Service(PROTOCOLS['udp'], 2035, 'imsldoc'),
-        'imsp': Service(PROTOCOLS['udp'], 406, 'imsp'),
-        'imtc-map': Service(PROTOCOLS['udp'], 2202, 'imtc-map'),
-        'imtc-mcs': Service(PROTOCOLS['udp'], 1503, 'imtc-mcs'),
-        'imyx': Service(PROTOCOLS['udp'], 1143, 'imyx'),
-        'inbusiness': Service(PROTOCOLS['udp'], 244, 'inbusiness'),
-        'incognitorv': Service(PROTOCOLS['udp'], 3139, 'incognitorv'),
-        'incp': Service(PROTOCOLS['udp'], 2932, 'incp'),
-        'index-net': Service(PROTOCOLS['udp'], 2970, 'index-net'),
-        'index-pc-wb': Service(PROTOCOLS['udp'], 2127, 'index-pc-wb'),
-        'indi': Service(PROTOCOLS['udp'], 7624, 'indi'),
-        'indigo-server': Service(PROTOCOLS['udp'], 1176, 'indigo-server'),
-        'indigo-vbcp': Service(PROTOCOLS['udp'], 8131, 'indigo-vbcp'),
-        'indigo-vrmi': Service(PROTOCOLS['udp'], 8130, 'indigo-vrmi'),
-        'indura': Service(PROTOCOLS['udp'], 3156, 'indura'),
-        'indx-dds': Service(PROTOCOLS['udp'], 2454, 'indx-dds'),
-        'indy': Service(PROTOCOLS['udp'], 5963, 'indy'),
-        'infiniswitchcl': Service(PROTOCOLS['udp'], 3602, 'infiniswitchcl'),
-        'influence': Service(PROTOCOLS['udp'], 3345, 'influence'),
-        'infobright': Service(PROTOCOLS['udp'], 5029, 'infobright'),
-        'infocrypt': Service(PROTOCOLS['udp'], 2233, 'infocrypt'),
-        'infoexch': Service(PROTOCOLS['udp'], 3667, 'infoexch'),
-        'infolibria': Service(PROTOCOLS['udp'], 2319, 'infolibria'),
-        'infoman': Service(PROTOCOLS['udp'], 1451, 'infoman'),
-        'infomover': Service(PROTOCOLS['udp'], 2854, 'infomover'),
-        'informatik-lm': Service(PROTOCOLS['udp'], 1428, 'informatik-lm'),
-        'informer': Service(PROTOCOLS['udp'], 3856, 'informer'),
-        'infoseek': Service(PROTOCOLS['udp'], 414, 'infoseek'),
-        'infotos': Service(PROTOCOLS['udp'], 18881, 'infotos'),
-        'infowave': Service(PROTOCOLS['udp'], 2082, 'infowave'),
-        'ingres-net': Service(PROTOCOLS['udp'], 134, 'ingres-net'),
-        'ingreslock': Service(PROTOCOLS['udp'], 1524, 'ingreslock'),
-        'ininmessaging': Service(PROTOCOLS['udp'], 5597, 'ininmessaging'),
-        'iniserve-port': Service(PROTOCOLS['udp'], 3560, 'iniserve-port'),
-        'initlsmsad': Service(PROTOCOLS['udp'], 2793, 'initlsmsad'),
-        'innosys': Service(PROTOCOLS['udp'], 1412, 'innosys'),
-        'innosys-acl': Service(PROTOCOLS['udp'], 1413, 'innosys-acl'),
-        'inova-ip-disco': Service(PROTOCOLS['udp'], 2716, 'inova-ip-disco'),
-        'inovaport1': Service(PROTOCOLS['udp'], 23000, 'inovaport1'),
-        'inovaport2': Service(PROTOCOLS['udp'], 23001, 'inovaport2'),
-        'inovaport3': Service(PROTOCOLS['udp'], 23002, 'inovaport3'),
-        'inovaport4': Service(PROTOCOLS['udp'], 23003, 'inovaport4'),
-        'inovaport5': Service(PROTOCOLS['udp'], 23004, 'inovaport5'),
-        'inovaport6': Service(PROTOCOLS['udp'], 23005, 'inovaport6'),
-        'insis': Service(PROTOCOLS['udp'], 9215, 'insis'),
-        'insitu-conf': Service(PROTOCOLS['udp'], 1490, 'insitu-conf'),
-        'inspect': Service(PROTOCOLS['udp'], 1602, 'inspect'),
-        'inst-discovery': Service(PROTOCOLS['udp'], 4878, 'inst-discovery'),
-        'instantia': Service(PROTOCOLS['udp'], 1240, 'instantia'),
-        'instl-bootc': Service(PROTOCOLS['udp'], 1068, 'instl-bootc'),
-        'instl-boots': Service(PROTOCOLS['udp'], 1067, 'instl-boots'),
-        'instl_bootc': Service(PROTOCOLS['udp'], 1068, 'instl_bootc'),
-        'instl_boots': Service(PROTOCOLS['udp'], 1067, 'instl_boots'),
-        'int-rcv-cntrl': Service(PROTOCOLS['udp'], 3603, 'int-rcv-cntrl'),
-        'intecom-ps1': Service(PROTOCOLS['udp'], 5056, 'intecom-ps1'),
-        'intecom-ps2': Service(PROTOCOLS['udp'], 5057, 'intecom-ps2'),
-        'intecourier': Service(PROTOCOLS['udp'], 495, 'intecourier'),
-        'integra-sme': Service(PROTOCOLS['udp'], 484, 'integra-sme'),
-        'integral': Service(PROTOCOLS['udp'], 3459, 'integral'),
-        'integrius-stp': Service(PROTOCOLS['udp'], 17234, 'integrius-stp'),
-        'intel-rci': Service(PROTOCOLS['udp'], 24386, 'intel-rci'),
-        'intel-rci-mp': Service(PROTOCOLS['udp'], 16991, 'intel-rci-mp'),
-        'intel_rci': Service(PROTOCOLS['udp'], 24386, 'intel_rci'),
-        'intelliadm-disc': Service(PROTOCOLS['udp'], 4746, 'intelliadm-disc'),
-        'intellistor-lm': Service(PROTOCOLS['udp'], 1539, 'intellistor-lm'),
-        'intelsync': Service(PROTOCOLS['udp'], 3692, 'intelsync'),
-        'interact': Service(PROTOCOLS['udp'], 4052, 'interact'),
-        'interactionweb': Service(PROTOCOLS['udp'], 3508, 'interactionweb'),
-        'interbase': Service(PROTOCOLS['udp'], 2041, 'interbase'),
-        'interhdl-elmd': Service(PROTOCOLS['udp'], 1454, 'interhdl-elmd'),
-        'interhdl_elmd': Service(PROTOCOLS['udp'], 1454, 'interhdl_elmd'),
-        'interintelli': Service(PROTOCOLS['udp'], 2633, 'interintelli'),
-        'interpathpanel': Service(PROTOCOLS['udp'], 2652, 'interpathpanel'),
-        'intersan': Service(PROTOCOLS['udp'], 1331, 'intersan'),
-        'interserver': Service(PROTOCOLS['udp'], 3060, 'interserver'),
-        'intersys-cache': Service(PROTOCOLS['udp'], 1972, 'intersys-cache'),
-        'interwise': Service(PROTOCOLS['udp'], 7778, 'interwise'),
-        'interworld': Service(PROTOCOLS['udp'], 3548, 'interworld'),
-        'intraintra': Service(PROTOCOLS['udp'], 3202, 'intraintra'),
-        'intrastar': Service(PROTOCOLS['udp'], 1907, 'intrastar'),
-        'intrepid-ssl': Service(PROTOCOLS['udp'], 11751, 'intrepid-ssl'),
-        'intrinsa': Service(PROTOCOLS['udp'], 503, 'intrinsa'),
-        'intu-ec-client': Service(PROTOCOLS['udp'], 8021, 'intu-ec-client'),
-        'intu-ec-svcdisc': Service(PROTOCOLS['udp'], 8020, 'intu-ec-svcdisc'),
-        'intuitive-edge': Service(PROTOCOLS['udp'], 1355, 'intuitive-edge'),
-        'intv': Service(PROTOCOLS['udp'], 1585, 'intv'),
-        'invision': Service(PROTOCOLS['udp'], 1641, 'invision'),
-        'invision-ag': Service(PROTOCOLS['udp'], 45054, 'invision-ag'),
-        'io-dist-group': Service(PROTOCOLS['udp'], 5728, 'io-dist-group'),
-        'ioc-sea-lm': Service(PROTOCOLS['udp'], 1579, 'ioc-sea-lm'),
-        'ionixnetmon': Service(PROTOCOLS['udp'], 7410, 'ionixnetmon'),
-        'iop': Service(PROTOCOLS['udp'], 2055, 'iop'),
-        'ip-blf': Service(PROTOCOLS['udp'], 2088, 'ip-blf'),
-        'ip-provision': Service(PROTOCOLS['udp'], 43190, 'ip-provision'),
-        'ip-qsig': Service(PROTOCOLS['udp'], 4029, 'ip-qsig'),
-        'ipass': Service(PROTOCOLS['udp'], 2549, 'ipass'),
-        'ipcd': Service(PROTOCOLS['udp'], 576, 'ipcd'),
-        'ipcd3': Service(PROTOCOLS['udp'], 1209, 'ipcd3'),
-        'ipcore': Service(PROTOCOLS['udp'], 2215, 'ipcore'),
-        'ipcs-command': Service(PROTOCOLS['udp'], 3743, 'ipcs-command'),
-        'ipcserver': Service(PROTOCOLS['udp'], 600, 'ipcserver'),
-        'ipdcesgbs': Service(PROTOCOLS['udp'], 9214, 'ipdcesgbs'),
-        'ipdd': Service(PROTOCOLS['udp'], 578, 'ipdd'),
-        'ipdr-sp': Service(PROTOCOLS['udp'], 4737, 'ipdr-sp'),
-        'ipdtp-port': Service(PROTOCOLS['udp'], 20202, 'ipdtp-port'),
-        'ipether232port': Service(PROTOCOLS['udp'], 3497, 'ipether232port'),
-        'ipfix': Service(PROTOCOLS['udp'], 4739, 'ipfix'),
-        'ipfixs': Service(PROTOCOLS['udp'], 4740, 'ipfixs'),
-        'ipfltbcst': Service(PROTOCOLS['udp'], 4068, 'ipfltbcst'),
-        'iph-policy-adm': Service(PROTOCOLS['udp'], 2963, 'iph-policy-adm'),
-        'iph-policy-cli': Service(PROTOCOLS['udp'], 2962, 'iph-policy-cli'),
-        'ipluminary': Service(PROTOCOLS['udp'], 7420, 'ipluminary'),
-        'ipp': Service(PROTOCOLS['udp'], 631, 'ipp'),
-        'ipr-dglt': Service(PROTOCOLS['udp'], 3678, 'ipr-dglt'),
-        'ipsec-nat-t': Service(PROTOCOLS['udp'], 4500, 'ipsec-nat-t'),
-        'ipsendmsg': Service(PROTOCOLS['udp'], 1992, 'ipsendmsg'),
-        'ipt-anri-anri': Service(PROTOCOLS['udp'], 4593, 'ipt-anri-anri'),
-        'ipulse-ics': Service(PROTOCOLS['udp'], 20222, 'ipulse-ics'),
-        'ipx': Service(PROTOCOLS['udp'], 213, 'ipx'),
-        'iqnet-port': Service(PROTOCOLS['udp'], 3804, 'iqnet-port'),
-        'iqobject': Service(PROTOCOLS['udp'], 48619, 'iqobject'),
-        'iqrm': Service(PROTOCOLS['udp'], 10117, 'iqrm'),
-        'iqserver': Service(PROTOCOLS['udp'], 2527, 'iqserver'),
-        'ique': Service(PROTOCOLS['udp'], 18769, 'ique'),
-        'iracinghelper': Service(PROTOCOLS['udp'], 32034, 'iracinghelper'),
-        'irapp': Service(PROTOCOLS['udp'], 4073, 'irapp'),
-        'irc': Service(PROTOCOLS['udp'], 194, 'irc'),
-        'irc-serv': Service(PROTOCOLS['udp'], 529, 'irc-serv'),
-        'irdg-post': Service(PROTOCOLS['udp'], 2632, 'irdg-post'),
-        'irdmi': Service(PROTOCOLS['udp'], 8000, 'irdmi'),
-        'irdmi2': Service(PROTOCOLS['udp'], 7999, 'irdmi2'),
-        'iris-beep': Service(PROTOCOLS['udp'], 702, 'iris-beep'),
-        'iris-lwz': Service(PROTOCOLS['udp'], 715, 'iris-lwz'),
-        'iris-xpc': Service(PROTOCOLS['udp'], 713, 'iris-xpc'),
-        'iris-xpcs': Service(PROTOCOLS['udp'], 714, 'iris-xpcs'),
-        'irisa': Service(PROTOCOLS['udp'], 11000, 'irisa'),
-        'ironmail': Service(PROTOCOLS['udp'], 3206, 'ironmail'),
-        'ironstorm': Service(PROTOCOLS['udp'], 3504, 'ironstorm'),
-        'irtrans': Service(PROTOCOLS['udp'], 21000, 'irtrans'),
-        'is99c': Service(PROTOCOLS['udp'], 379, 'is99c'),
-        'is99s': Service(PROTOCOLS['udp'], 380, 'is99s'),
-        'isakmp': Service(PROTOCOLS['udp'], 500, 'isakmp'),
-        'isbconference1': Service(PROTOCOLS['udp'], 1244, 'isbconference1'),
-        'isbconference2': Service(PROTOCOLS['udp'], 1245, 'isbconference2'),
-        'iscape': Service(PROTOCOLS['udp'], 5047, 'iscape'),
-        'ischat': Service(PROTOCOLS['udp'], 1336, 'ischat'),
-        'iscsi': Service(PROTOCOLS['udp'], 860, 'iscsi'),
-        'iscsi-target': Service(PROTOCOLS['udp'], 3260, 'iscsi-target'),
-        'isdc': Service(PROTOCOLS['udp'], 1636, 'isdc'),
-        'isdd': Service(PROTOCOLS['udp'], 8148, 'isdd'),
-        'isg-uda-server': Service(PROTOCOLS['udp'], 2551, 'isg-uda-server'),
-        'isi-gl': Service(PROTOCOLS['udp'], 55, 'isi-gl'),
-        'isi-irp': Service(PROTOCOLS['udp'], 3226, 'isi-irp'),
-        'isis': Service(PROTOCOLS['udp'], 2042, 'isis'),
-        'isis-am': Service(PROTOCOLS['udp'], 1642, 'isis-am'),
-        'isis-ambc': Service(PROTOCOLS['udp'], 1643, 'isis-ambc'),
-        'isis-bcast': Service(PROTOCOLS['udp'], 2043, 'isis-bcast'),
-        'islc': Service(PROTOCOLS['udp'], 1637, 'islc'),
-        'ismaeasdaqlive': Service(PROTOCOLS['udp'], 1949, 'ismaeasdaqlive'),
-        'ismaeasdaqtest': Service(PROTOCOLS['udp'], 1950, 'ismaeasdaqtest'),
-        'ismc': Service(PROTOCOLS['udp'], 1638, 'ismc'),
-        'ismserver': Service(PROTOCOLS['udp'], 9500, 'ismserver'),
-        'isnetserv': Service(PROTOCOLS['udp'], 48128, 'isnetserv'),
-        'isns': Service(PROTOCOLS['udp'], 3205, 'isns'),
-        'iso-ill': Service(PROTOCOLS['udp'], 499, 'iso-ill'),
-        'iso-ip': Service(PROTOCOLS['udp'], 147, 'iso-ip'),
-        'iso-tp0': Service(PROTOCOLS['udp'], 146, 'iso-tp0'),
-        'iso-tp0s': Service(PROTOCOLS['udp'], 3782, 'iso-tp0s'),
-        'iso-tsap': Service(PROTOCOLS['udp'], 102, 'iso-tsap'),
-        'iso-tsap-c2': Service(PROTOCOLS['udp'], 399, 'iso-tsap-c2'),
-        'isode-dua': Service(PROTOCOLS['udp'], 17007, 'isode-dua'),
-        'isoft-p2p': Service(PROTOCOLS['udp'], 3501, 'isoft-p2p'),
-        'isoipsigport-1': Service(PROTOCOLS['udp'], 1106, 'isoipsigport-1'),
-        'isoipsigport-2': Service(PROTOCOLS['udp'], 1107, 'isoipsigport-2'),
-        'isomair': Service(PROTOCOLS['udp'], 3589, 'isomair'),
-        'ispipes': Service(PROTOCOLS['udp'], 2853, 'ispipes'),
-        'ispmmgr': Service(PROTOCOLS['udp'], 3775, 'ispmmgr'),
-        'isrp-port': Service(PROTOCOLS['udp'], 3788, 'isrp-port'),
-        'iss-mgmt-ssl': Service(PROTOCOLS['udp'], 3995, 'iss-mgmt-ssl'),
-        'issd': Service(PROTOCOLS['udp'], 1600, 'issd'),
-        'isysg-lm': Service(PROTOCOLS['udp'], 1609, 'isysg-lm'),
-        'ita-agent': Service(PROTOCOLS['udp'], 5051, 'ita-agent'),
-        'ita-manager': Service(PROTOCOLS['udp'], 5052, 'ita-manager'),
-        'itach': Service(PROTOCOLS['udp'], 8184, 'itach'),
-        'itactionserver1': Service(PROTOCOLS['udp'], 7280, 'itactionserver1'),
-        'itactionserver2': Service(PROTOCOLS['udp'], 7281, 'itactionserver2'),
-        'italk': Service(PROTOCOLS['udp'], 12345, 'italk'),
-        'itap-ddtp': Service(PROTOCOLS['udp'], 10100, 'itap-ddtp'),
-        'itelserverport': Service(PROTOCOLS['udp'], 3719, 'itelserverport'),
-        'item': Service(PROTOCOLS['udp'], 3848, 'item'),
-        'itinternet': Service(PROTOCOLS['udp'], 2691, 'itinternet'),
-        'itm-lm': Service(PROTOCOLS['udp'], 2828, 'itm-lm'),
-        'itm-mccs': Service(PROTOCOLS['udp'], 3084, 'itm-mccs'),
-        'itm-mcell-s': Service(PROTOCOLS['udp'], 828, 'itm-mcell-s'),
-        'itm-mcell-u': Service(PROTOCOLS['udp'], 1828, 'itm-mcell-u'),
-        'ito-e-gui': Service(PROTOCOLS['udp'], 2531, 'ito-e-gui'),
-        'itose': Service(PROTOCOLS['udp'], 4348, 'itose'),
-        'itscomm-ns': Service(PROTOCOLS['udp'], 1573, 'itscomm-ns'),
-        'itv-control': Service(PROTOCOLS['udp'], 3899, 'itv-control'),
-        'iua': Service(PROTOCOLS['udp'], 9900, 'iua'),
-        'ivcollector': Service(PROTOCOLS['udp'], 1275, 'ivcollector'),
-        'ivecon-port': Service(PROTOCOLS['udp'], 3258, 'ivecon-port'),
-        'ivocalize': Service(PROTOCOLS['udp'], 5049, 'ivocalize'),
-        'ivs-video': Service(PROTOCOLS['udp'], 2232, 'ivs-video'),
-        'ivsd': Service(PROTOCOLS['udp'], 2241, 'ivsd'),
-        'iw-mmogame': Service(PROTOCOLS['udp'], 3596, 'iw-mmogame'),
-        'iwb-whiteboard': Service(PROTOCOLS['udp'], 2982, 'iwb-whiteboard'),
-        'iwec': Service(PROTOCOLS['udp'], 4801, 'iwec'),
-        'iwg1': Service(PROTOCOLS['udp'], 7071, 'iwg1'),
-        'iwlistener': Service(PROTOCOLS['udp'], 2866, 'iwlistener'),
-        'iwserver': Service(PROTOCOLS['udp'], 2166, 'iwserver'),
-        'izm': Service(PROTOCOLS['udp'], 4109, 'izm'),
-        'j-ac': Service(PROTOCOLS['udp'], 4107, 'j-ac'),
-        'j-lan-p': Service(PROTOCOLS['udp'], 2808, 'j-lan-p'),
-        'jacobus-lm': Service(PROTOCOLS['udp'], 1578, 'jacobus-lm'),
-        'jaleosnd': Service(PROTOCOLS['udp'], 1623, 'jaleosnd'),
-        'jamserverport': Service(PROTOCOLS['udp'], 3627, 'jamserverport'),
-        'janus-disc': Service(PROTOCOLS['udp'], 7181, 'janus-disc'),
-        'jargon': Service(PROTOCOLS['udp'], 148, 'jargon'),
-        'jaugsremotec-1': Service(PROTOCOLS['udp'], 3472, 'jaugsremotec-1'),
-        'jaugsremotec-2': Service(PROTOCOLS['udp'], 3473, 'jaugsremotec-2'),
-        'jaus': Service(PROTOCOLS['udp'], 3794, 'jaus'),
-        'jaxer-manager': Service(PROTOCOLS['udp'], 4328, 'jaxer-manager'),
-        'jaxer-web': Service(PROTOCOLS['udp'], 4327, 'jaxer-web'),
-        'jboss-iiop': Service(PROTOCOLS['udp'], 3528, 'jboss-iiop'),
-        'jboss-iiop-ssl': Service(PROTOCOLS['udp'], 3529, 'jboss-iiop-ssl'),
-        'jbroker': Service(PROTOCOLS['udp'], 2506, 'jbroker'),
-        'jcp': Service(PROTOCOLS['udp'], 19541, 'jcp'),
-        'jdatastore': Service(PROTOCOLS['udp'], 2508, 'jdatastore'),
-        'jdl-dbkitchen': Service(PROTOCOLS['udp'], 3086, 'jdl-dbkitchen'),
-        'jdmn-port': Service(PROTOCOLS['udp'], 4030, 'jdmn-port'),
-        'jdp-disc': Service(PROTOCOLS['udp'], 7095, 'jdp-disc'),
-        'jediserver': Service(PROTOCOLS['udp'], 2406, 'jediserver'),
-        'jeol-nsddp-1': Service(PROTOCOLS['udp'], 6241, 'jeol-nsddp-1'),
-        'jeol-nsddp-2': Service(PROTOCOLS['udp'], 6242, 'jeol-nsddp-2'),
-        'jeol-nsddp-3': Service(PROTOCOLS['udp'], 6243, 'jeol-nsddp-3'),
-        'jeol-nsddp-4': Service(PROTOCOLS['udp'], 6244, 'jeol-nsddp-4'),
-        'jerand-lm': Service(PROTOCOLS['udp'], 1810, 'jerand-lm'),
-        'jesmsjc': Service(PROTOCOLS['udp'], 27442, 'jesmsjc'),
-        'jetcmeserver': Service(PROTOCOLS['udp'], 1936, 'jetcmeserver'),
-        'jetform': Service(PROTOCOLS['udp'], 1706, 'jetform'),
-        'jetformpreview': Service(PROTOCOLS['udp'], 2097, 'jetformpreview'),
-        'jibe-eb': Service(PROTOCOLS['udp'], 3777, 'jibe-eb'),
-        'jini-discovery': Service(PROTOCOLS['udp'], 4160, 'jini-discovery'),
-        'jlicelmd': Service(PROTOCOLS['udp'], 1567, 'jlicelmd'),
-        'jmact3': Service(PROTOCOLS['udp'], 6961, 'jmact3'),
-        'jmact5': Service(PROTOCOLS['udp'], 2957, 'jmact5'),
-        'jmact6': Service(PROTOCOLS['udp'], 2958, 'jmact6'),
-        'jmb-cds1': Service(PROTOCOLS['udp'], 8900, 'jmb-cds1'),
-        'jmb-cds2': Service(PROTOCOLS['udp'], 8901, 'jmb-cds2'),
-        'jmevt2': Service(PROTOCOLS['udp'], 6962, 'jmevt2'),
-        'jmq-daemon-1': Service(PROTOCOLS['udp'], 3214, 'jmq-daemon-1'),
-        'jmq-daemon-2': Service(PROTOCOLS['udp'], 3215, 'jmq-daemon-2'),
-        'jms': Service(PROTOCOLS['udp'], 5673, 'jms'),
-        'joajewelsuite': Service(PROTOCOLS['udp'], 6583, 'joajewelsuite'),
-        'joltid': Service(PROTOCOLS['udp'], 3531, 'joltid'),
-        'jomamqmonitor': Service(PROTOCOLS['udp'], 4114, 'jomamqmonitor'),
-        'joost': Service(PROTOCOLS['udp'], 4166, 'joost'),
-        'journee': Service(PROTOCOLS['udp'], 3042, 'journee'),
-        'jpegmpeg': Service(PROTOCOLS['udp'], 3155, 'jpegmpeg'),
-        'jprinter': Service(PROTOCOLS['udp'], 5309, 'jprinter'),
-        'jps': Service(PROTOCOLS['udp'], 2205, 'jps'),
-        'jstel': Service(PROTOCOLS['udp'], 1064, 'jstel'),
-        'jt400': Service(PROTOCOLS['udp'], 3470, 'jt400'),
-        'jt400-ssl': Service(PROTOCOLS['udp'], 3471, 'jt400-ssl'),
-        'jtag-server': Service(PROTOCOLS['udp'], 1309, 'jtag-server'),
-        'juxml-port': Service(PROTOCOLS['udp'], 3642, 'juxml-port'),
-        'jvclient': Service(PROTOCOLS['udp'], 1940, 'jvclient'),
-        'jvl-mactalk': Service(PROTOCOLS['udp'], 47100, 'jvl-mactalk'),
-        'jvserver': Service(PROTOCOLS['udp'], 1939, 'jvserver'),
-        'jwalkserver': Service(PROTOCOLS['udp'], 1289, 'jwalkserver'),
-        'jwclient': Service(PROTOCOLS['udp'], 1938, 'jwclient'),
-        'jwserver': Service(PROTOCOLS['udp'], 1937, 'jwserver'),
-        'k-block': Service(PROTOCOLS['udp'], 287, 'k-block'),
-        'k-patentssensor': Service(PROTOCOLS['udp'], 40023, 'k-patentssensor'),
-        'k3software-cli': Service(PROTOCOLS['udp'], 26263, 'k3software-cli'),
-        'k3software-svr': Service(PROTOCOLS['udp'], 26262, 'k3software-svr'),
-        'ka-kdp': Service(PROTOCOLS['udp'], 31016, 'ka-kdp'),
-        'ka0wuc': Service(PROTOCOLS['udp'], 2822, 'ka0wuc'),
-        'kali': Service(PROTOCOLS['udp'], 2213, 'kali'),
-        'kana': Service(PROTOCOLS['udp'], 2656, 'kana'),
-        'kar2ouche': Service(PROTOCOLS['udp'], 4661, 'kar2ouche'),
-        'kastenchasepad': Service(PROTOCOLS['udp'], 2918, 'kastenchasepad'),
-        'kastenxpipe': Service(PROTOCOLS['udp'], 36865, 'kastenxpipe'),
-        'kazaa': Service(PROTOCOLS['udp'], 1214, 'kazaa'),
-        'kca-service': Service(PROTOCOLS['udp'], 9878, 'kca-service'),
-        'kdm': Service(PROTOCOLS['udp'], 2115, 'kdm'),
-        'kdnet': Service(PROTOCOLS['udp'], 5364, 'kdnet'),
-        'kentrox-prot': Service(PROTOCOLS['udp'], 2502, 'kentrox-prot'),
-        'kerberos': Service(PROTOCOLS['udp'], 88, 'kerberos'),
-        'kerberos-adm': Service(PROTOCOLS['udp'], 749, 'kerberos-adm'),
-        'kerberos-iv': Service(PROTOCOLS['udp'], 750, 'kerberos-iv'),
-        'kermit': Service(PROTOCOLS['udp'], 1649, 'kermit'),
-        'keyserver': Service(PROTOCOLS['udp'], 584, 'keyserver'),
-        'keyshadow': Service(PROTOCOLS['udp'], 19315, 'keyshadow'),
-        'keysrvr': Service(PROTOCOLS['udp'], 19283, 'keysrvr'),
-        'kfserver': Service(PROTOCOLS['udp'], 5343, 'kfserver'),
-        'kftp': Service(PROTOCOLS['udp'], 6621, 'kftp'),
-        'kftp-data': Service(PROTOCOLS['udp'], 6620, 'kftp-data'),
-        'kfxaclicensing': Service(PROTOCOLS['udp'], 3581, 'kfxaclicensing'),
-        'kingdomsonline': Service(PROTOCOLS['udp'], 30260, 'kingdomsonline'),
-        'kingfisher': Service(PROTOCOLS['udp'], 4058, 'kingfisher'),
-        'kink': Service(PROTOCOLS['udp'], 910, 'kink'),
-        'kiosk': Service(PROTOCOLS['udp'], 1061, 'kiosk'),
-        'kis': Service(PROTOCOLS['udp'], 186, 'kis'),
-        'kjtsiteserver': Service(PROTOCOLS['udp'], 1339, 'kjtsiteserver'),
-        'klio': Service(PROTOCOLS['udp'], 7697, 'klio'),
-        'klogin': Service(PROTOCOLS['udp'], 543, 'klogin'),
-        'kme-trap-port': Service(PROTOCOLS['udp'], 2081, 'kme-trap-port'),
-        'kmscontrol': Service(PROTOCOLS['udp'], 1773, 'kmscontrol'),
-        'knet-cmp': Service(PROTOCOLS['udp'], 157, 'knet-cmp'),
-        'kofax-svr': Service(PROTOCOLS['udp'], 2424, 'kofax-svr'),
-        'konshus-lm': Service(PROTOCOLS['udp'], 2294, 'konshus-lm'),
-        'konspire2b': Service(PROTOCOLS['udp'], 6085, 'konspire2b'),
-        'kopek-httphead': Service(PROTOCOLS['udp'], 27504, 'kopek-httphead'),
-        'kpasswd': Service(PROTOCOLS['udp'], 464, 'kpasswd'),
-        'kpn-icw': Service(PROTOCOLS['udp'], 3699, 'kpn-icw'),
-        'krb524': Service(PROTOCOLS['udp'], 4444, 'krb524'),
-        'krb5gatekeeper': Service(PROTOCOLS['udp'], 1318, 'krb5gatekeeper'),
-        'kryptolan': Service(PROTOCOLS['udp'], 398, 'kryptolan'),
-        'kshell': Service(PROTOCOLS['udp'], 544, 'kshell'),
-        'ksysguard': Service(PROTOCOLS['udp'], 3112, 'ksysguard'),
-        'ktelnet': Service(PROTOCOLS['udp'], 6623, 'ktelnet'),
-        'kti-icad-srvr': Service(PROTOCOLS['udp'], 6701, 'kti-icad-srvr'),
-        'kv-agent': Service(PROTOCOLS['udp'], 3361, 'kv-agent'),
-        'kv-server': Service(PROTOCOLS['udp'], 3360, 'kv-server'),
-        'kvm-via-ip': Service(PROTOCOLS['udp'], 1132, 'kvm-via-ip'),
-        'kwdb-commn': Service(PROTOCOLS['udp'], 1127, 'kwdb-commn'),
-        'kwtc': Service(PROTOCOLS['udp'], 4566, 'kwtc'),
-        'kyoceranetdev': Service(PROTOCOLS['udp'], 1063, 'kyoceranetdev'),
-        'l-acoustics': Service(PROTOCOLS['udp'], 4432, 'l-acoustics'),
-        'l2c-data': Service(PROTOCOLS['udp'], 4372, 'l2c-data'),
-        'l2c-disc': Service(PROTOCOLS['udp'], 4371, 'l2c-disc'),
-        'l2f': Service(PROTOCOLS['udp'], 1701, 'l2f'),
-        'l2tp': Service(PROTOCOLS['udp'], 1701, 'l2tp'),
-        'l3-exprt': Service(PROTOCOLS['udp'], 2840, 'l3-exprt'),
-        'l3-hawk': Service(PROTOCOLS['udp'], 2842, 'l3-hawk'),
-        'l3-hbmon': Service(PROTOCOLS['udp'], 2370, 'l3-hbmon'),
-        'l3-ranger': Service(PROTOCOLS['udp'], 2841, 'l3-ranger'),
-        'l3t-at-an': Service(PROTOCOLS['udp'], 4591, 'l3t-at-an'),
-        'l5nas-parchan': Service(PROTOCOLS['udp'], 9747, 'l5nas-parchan'),
-        'labrat': Service(PROTOCOLS['udp'], 2560, 'labrat'),
-        'laes-bf': Service(PROTOCOLS['udp'], 9536, 'laes-bf'),
-        'lam': Service(PROTOCOLS['udp'], 2040, 'lam'),
-        'lan900-remote': Service(PROTOCOLS['udp'], 2395, 'lan900-remote'),
-        'lan900_remote': Service(PROTOCOLS['udp'], 2395, 'lan900_remote'),
-        'landmarks': Service(PROTOCOLS['udp'], 3969, 'landmarks'),
-        'lanmessenger': Service(PROTOCOLS['udp'], 2372, 'lanmessenger'),
-        'lanner-lm': Service(PROTOCOLS['udp'], 4547, 'lanner-lm'),
-        'lanrevagent': Service(PROTOCOLS['udp'], 3970, 'lanrevagent'),
-        'lanrevserver': Service(PROTOCOLS['udp'], 3971, 'lanrevserver'),
-        'lanschool-mpt': Service(PROTOCOLS['udp'], 11796, 'lanschool-mpt'),
-        'lanserver': Service(PROTOCOLS['udp'], 637, 'lanserver'),
-        'lansource': Service(PROTOCOLS['udp'], 1485, 'lansource'),
-        'lansurveyor': Service(PROTOCOLS['udp'], 4347, 'lansurveyor'),
-        'lansurveyorxml': Service(PROTOCOLS['udp'], 3815, 'lansurveyorxml'),
-        'lanyon-lantern': Service(PROTOCOLS['udp'], 1682, 'lanyon-lantern'),
-        'laplink': Service(PROTOCOLS['udp'], 1547, 'laplink'),
-        'launchbird-lm': Service(PROTOCOLS['udp'], 3739, 'launchbird-lm'),
-        'lavenir-lm': Service(PROTOCOLS['udp'], 3373, 'lavenir-lm'),
-        'lazy-ptop': Service(PROTOCOLS['udp'], 7099, 'lazy-ptop'),
-        'lbc-control': Service(PROTOCOLS['udp'], 2780, 'lbc-control'),
-        'lbc-measure': Service(PROTOCOLS['udp'], 2815, 'lbc-measure'),
-        'lbc-sync': Service(PROTOCOLS['udp'], 2779, 'lbc-sync'),
-        'lbc-watchdog': Service(PROTOCOLS['udp'], 2816, 'lbc-watchdog'),
-        'lbf': Service(PROTOCOLS['udp'], 2466, 'lbf'),
-        'lbm': Service(PROTOCOLS['udp'], 2465, 'lbm'),
-        'lcm-server': Service(PROTOCOLS['udp'], 7365, 'lcm-server'),
-        'ldap': Service(PROTOCOLS['udp'], 389, 'ldap'),
-        'ldap-admin': Service(PROTOCOLS['udp'], 3407, 'ldap-admin'),
-        'ldaps': Service(PROTOCOLS['udp'], 636, 'ldaps'),
-        'ldgateway': Service(PROTOCOLS['udp'], 9592, 'ldgateway'),
-        'ldoms-mgmt': Service(PROTOCOLS['udp'], 6482, 'ldoms-mgmt'),
-        'ldp': Service(PROTOCOLS['udp'], 646, 'ldp'),
-        'lds-distrib': Service(PROTOCOLS['udp'], 6543, 'lds-distrib'),
-        'lds-dump': Service(PROTOCOLS['udp'], 6544, 'lds-dump'),
-        'ldss': Service(PROTOCOLS['udp'], 6087, 'ldss'),
-        'ldxp': Service(PROTOCOLS['udp'], 4042, 'ldxp'),
-        'lecroy-vicp': Service(PROTOCOLS['udp'], 1861, 'lecroy-vicp'),
-        'leecoposserver': Service(PROTOCOLS['udp'], 2212, 'leecoposserver'),
-        'legent-1': Service(PROTOCOLS['udp'], 373, 'legent-1'),
-        'legent-2': Service(PROTOCOLS['udp'], 374, 'legent-2'),
-        'leoip': Service(PROTOCOLS['udp'], 1886, 'leoip'),
-        'lhtp': Service(PROTOCOLS['udp'], 1983, 'lhtp'),
-        'libelle-disc': Service(PROTOCOLS['udp'], 8282, 'libelle-disc'),
-        'liberty-lm': Service(PROTOCOLS['udp'], 1496, 'liberty-lm'),
-        'licensedaemon': Service(PROTOCOLS['udp'], 1986, 'licensedaemon'),
-        'liebdevmgmt-a': Service(PROTOCOLS['udp'], 3029, 'liebdevmgmt-a'),
-        'liebdevmgmt-c': Service(PROTOCOLS['udp'], 3027, 'liebdevmgmt-c'),
-        'liebdevmgmt-dm': Service(PROTOCOLS['udp'], 3028, 'liebdevmgmt-dm'),
-        'liebdevmgmt_a': Service(PROTOCOLS['udp'], 3029, 'liebdevmgmt_a'),
-        'liebdevmgmt_c': Service(PROTOCOLS['udp'], 3027, 'liebdevmgmt_c'),
-        'liebdevmgmt_dm': Service(PROTOCOLS['udp'], 3028, 'liebdevmgmt_dm'),
-        'light': Service(PROTOCOLS['udp'], 4670, 'light'),
-        'link': Service(PROTOCOLS['udp'], 245, 'link'),
-        'linkname': Service(PROTOCOLS['udp'], 1903, 'linkname'),
-        'linktest': Service(PROTOCOLS['udp'], 3746, 'linktest'),
-        'linktest-s': Service(PROTOCOLS['udp'], 3747, 'linktest-s'),
-        'linogridengine': Service(PROTOCOLS['udp'], 12300, 'linogridengine'),
-        'linx': Service(PROTOCOLS['udp'], 1361, 'linx'),
-        'lionhead': Service(PROTOCOLS['udp'], 2611, 'lionhead'),
-        'lipsinc': Service(PROTOCOLS['udp'], 1968, 'lipsinc'),
-        'lipsinc1': Service(PROTOCOLS['udp'], 1969, 'lipsinc1'),
-        'lisp-control': Service(PROTOCOLS['udp'], 4342, 'lisp-control'),
-        'lisp-data': Service(PROTOCOLS['udp'], 4341, 'lisp-data'),
-        'lispworks-orb': Service(PROTOCOLS['udp'], 3672, 'lispworks-orb'),
-        'listcrt-port': Service(PROTOCOLS['udp'], 3913, 'listcrt-port'),
-        'listcrt-port-2': Service(PROTOCOLS['udp'], 3914, 'listcrt-port-2'),
-        'listmgr-port': Service(PROTOCOLS['udp'], 3767, 'listmgr-port'),
-        'livelan': Service(PROTOCOLS['udp'], 1555, 'livelan'),
-        'livestats': Service(PROTOCOLS['udp'], 2795, 'livestats'),
-        'ljk-login': Service(PROTOCOLS['udp'], 472, 'ljk-login'),
-        'lkcmserver': Service(PROTOCOLS['udp'], 3278, 'lkcmserver'),
-        'llm-csv': Service(PROTOCOLS['udp'], 2814, 'llm-csv'),
-        'llm-pass': Service(PROTOCOLS['udp'], 2813, 'llm-pass'),
-        'llmnr': Service(PROTOCOLS['udp'], 5355, 'llmnr'),
-        'llrp': Service(PROTOCOLS['udp'], 5084, 'llrp'),
-        'llsurfup-http': Service(PROTOCOLS['udp'], 1183, 'llsurfup-http'),
-        'llsurfup-https': Service(PROTOCOLS['udp'], 1184, 'llsurfup-https'),
-        'lm-dta': Service(PROTOCOLS['udp'], 8206, 'lm-dta'),
-        'lm-instmgr': Service(PROTOCOLS['udp'], 8205, 'lm-instmgr'),
-        'lm-mon': Service(PROTOCOLS['udp'], 31620, 'lm-mon'),
-        'lm-perfworks': Service(PROTOCOLS['udp'], 8204, 'lm-perfworks'),
-        'lm-sserver': Service(PROTOCOLS['udp'], 8207, 'lm-sserver'),
-        'lm-webwatcher': Service(PROTOCOLS['udp'], 8208, 'lm-webwatcher'),
-        'lm-x': Service(PROTOCOLS['udp'], 6200, 'lm-x'),
-        'lmcs': Service(PROTOCOLS['udp'], 4877, 'lmcs'),
-        'lmdp': Service(PROTOCOLS['udp'], 2623, 'lmdp'),
-        'lmp': Service(PROTOCOLS['udp'], 701, 'lmp'),
-        'lms': Service(PROTOCOLS['udp'], 4056, 'lms'),
-        'lmsocialserver': Service(PROTOCOLS['udp'], 1111, 'lmsocialserver'),
-        'lnvalarm': Service(PROTOCOLS['udp'], 2282, 'lnvalarm'),
-        'lnvconsole': Service(PROTOCOLS['udp'], 2281, 'lnvconsole'),
-        'lnvmailmon': Service(PROTOCOLS['udp'], 2285, 'lnvmailmon'),
-        'lnvmaps': Service(PROTOCOLS['udp'], 2284, 'lnvmaps'),
-        'lnvpoller': Service(PROTOCOLS['udp'], 2280, 'lnvpoller'),
-        'lnvstatus': Service(PROTOCOLS['udp'], 2283, 'lnvstatus'),
-        'loadav': Service(PROTOCOLS['udp'], 750, 'loadav'),
-        'loaprobe': Service(PROTOCOLS['udp'], 1634, 'loaprobe'),
-        'localinfosrvr': Service(PROTOCOLS['udp'], 1487, 'localinfosrvr'),
-        'lockstep': Service(PROTOCOLS['udp'], 2125, 'lockstep'),
-        'locus-con': Service(PROTOCOLS['udp'], 127, 'locus-con'),
-        'locus-disc': Service(PROTOCOLS['udp'], 5058, 'locus-disc'),
-        'locus-map': Service(PROTOCOLS['udp'], 125, 'locus-map'),
-        'lofr-lm': Service(PROTOCOLS['udp'], 1752, 'lofr-lm'),
-        'lonewolf-lm': Service(PROTOCOLS['udp'], 6146, 'lonewolf-lm'),
-        'lontalk-norm': Service(PROTOCOLS['udp'], 1628, 'lontalk-norm'),
-        'lontalk-urgnt': Service(PROTOCOLS['udp'], 1629, 'lontalk-urgnt'),
-        'lonworks': Service(PROTOCOLS['udp'], 2540, 'lonworks'),
-        'lonworks2': Service(PROTOCOLS['udp'], 2541, 'lonworks2'),
-        'lorica-in': Service(PROTOCOLS['udp'], 4080, 'lorica-in'),
-        'lorica-in-sec': Service(PROTOCOLS['udp'], 4081, 'lorica-in-sec'),
-        'lorica-out': Service(PROTOCOLS['udp'], 4082, 'lorica-out'),
-        'lorica-out-sec': Service(PROTOCOLS['udp'], 4083, 'lorica-out-sec'),
-        'lot105-ds-upd': Service(PROTOCOLS['udp'], 2053, 'lot105-ds-upd'),
-        'lotusmtap': Service(PROTOCOLS['udp'], 3007, 'lotusmtap'),
-        'lotusnote': Service(PROTOCOLS['udp'], 1352, 'lotusnote'),
-        'lpcp': Service(PROTOCOLS['udp'], 1298, 'lpcp'),
-        'lpdg': Service(PROTOCOLS['udp'], 10805, 'lpdg'),
-        'lpsrecommender': Service(PROTOCOLS['udp'], 2620, 'lpsrecommender'),
-        'lrp': Service(PROTOCOLS['udp'], 2090, 'lrp'),
-        'lrs-paging': Service(PROTOCOLS['udp'], 3700, 'lrs-paging'),
-        'ls3': Service(PROTOCOLS['udp'], 3069, 'ls3'),
-        'ls3bcast': Service(PROTOCOLS['udp'], 3068, 'ls3bcast'),
-        'lsdp': Service(PROTOCOLS['udp'], 11430, 'lsdp'),
-        'lsi-raid-mgmt': Service(PROTOCOLS['udp'], 2463, 'lsi-raid-mgmt'),
-        'lsp-ping': Service(PROTOCOLS['udp'], 3503, 'lsp-ping'),
-        'lsp-self-ping': Service(PROTOCOLS['udp'], 8503, 'lsp-self-ping'),
-        'lstp': Service(PROTOCOLS['udp'], 2559, 'lstp'),
-        'ltcudp': Service(PROTOCOLS['udp'], 3487, 'ltcudp'),
-        'ltp': Service(PROTOCOLS['udp'], 4044, 'ltp'),
-        'ltp-deepspace': Service(PROTOCOLS['udp'], 1113, 'ltp-deepspace'),
-        'lumimgrd': Service(PROTOCOLS['udp'], 4741, 'lumimgrd'),
-        'lupa': Service(PROTOCOLS['udp'], 1212, 'lupa'),
-        'lv-auth': Service(PROTOCOLS['udp'], 2147, 'lv-auth'),
-        'lv-ffx': Service(PROTOCOLS['udp'], 2144, 'lv-ffx'),
-        'lv-frontpanel': Service(PROTOCOLS['udp'], 3079, 'lv-frontpanel'),
-        'lv-jc': Service(PROTOCOLS['udp'], 2143, 'lv-jc'),
-        'lv-not': Service(PROTOCOLS['udp'], 2146, 'lv-not'),
-        'lv-pici': Service(PROTOCOLS['udp'], 2145, 'lv-pici'),
-        'lvision-lm': Service(PROTOCOLS['udp'], 6471, 'lvision-lm'),
-        'lxi-evntsvc': Service(PROTOCOLS['udp'], 5044, 'lxi-evntsvc'),
-        'lyskom': Service(PROTOCOLS['udp'], 4894, 'lyskom'),
-        'm-wnn': Service(PROTOCOLS['udp'], 3732, 'm-wnn'),
-        'm2mservices': Service(PROTOCOLS['udp'], 8383, 'm2mservices'),
-        'm2ua': Service(PROTOCOLS['udp'], 2904, 'm2ua'),
-        'm3da-disc': Service(PROTOCOLS['udp'], 44900, 'm3da-disc'),
-        'm4-network-as': Service(PROTOCOLS['udp'], 4345, 'm4-network-as'),
-        'mac-srvr-admin': Service(PROTOCOLS['udp'], 660, 'mac-srvr-admin'),
-        'macbak': Service(PROTOCOLS['udp'], 4181, 'macbak'),
-        'macon-udp': Service(PROTOCOLS['udp'], 456, 'macon-udp'),
-        'macromedia-fcs': Service(PROTOCOLS['udp'], 1935, 'macromedia-fcs'),
-        'madcap': Service(PROTOCOLS['udp'], 2535, 'madcap'),
-        'madge-ltd': Service(PROTOCOLS['udp'], 2453, 'madge-ltd'),
-        'magaya-network': Service(PROTOCOLS['udp'], 3691, 'magaya-network'),
-        'magbind': Service(PROTOCOLS['udp'], 3194, 'magbind'),
-        'magenta-logic': Service(PROTOCOLS['udp'], 313, 'magenta-logic'),
-        'magicnotes': Service(PROTOCOLS['udp'], 3023, 'magicnotes'),
-        'magicom': Service(PROTOCOLS['udp'], 2243, 'magicom'),
-        'magpie': Service(PROTOCOLS['udp'], 5092, 'magpie'),
-        'mailbox-lm': Service(PROTOCOLS['udp'], 505, 'mailbox-lm'),
-        'mailprox': Service(PROTOCOLS['udp'], 3936, 'mailprox'),
-        'mailq': Service(PROTOCOLS['udp'], 174, 'mailq'),
-        'maincontrol': Service(PROTOCOLS['udp'], 2516, 'maincontrol'),
-        'mainsoft-lm': Service(PROTOCOLS['udp'], 1593, 'mainsoft-lm'),
-        'maitrd': Service(PROTOCOLS['udp'], 997, 'maitrd'),
-        'manage-exec': Service(PROTOCOLS['udp'], 2342, 'manage-exec'),
-        'manet': Service(PROTOCOLS['udp'], 269, 'manet'),
-        'manyone-http': Service(PROTOCOLS['udp'], 8910, 'manyone-http'),
-        'manyone-xml': Service(PROTOCOLS['udp'], 8911, 'manyone-xml'),
-        'mao': Service(PROTOCOLS['udp'], 2908, 'mao'),
-        'mapper-mapethd': Service(PROTOCOLS['udp'], 3985, 'mapper-mapethd'),
-        'mapper-nodemgr': Service(PROTOCOLS['udp'], 3984, 'mapper-nodemgr'),
-        'mapper-ws-ethd': Service(PROTOCOLS['udp'], 3986, 'mapper-ws-ethd'),
-        'mapper-ws_ethd': Service(PROTOCOLS['udp'], 3986, 'mapper-ws_ethd'),
-        'marathontp': Service(PROTOCOLS['udp'], 8384, 'marathontp'),
-        'marcam-lm': Service(PROTOCOLS['udp'], 1444, 'marcam-lm'),
-        'markem-dcp': Service(PROTOCOLS['udp'], 3836, 'markem-dcp'),
-        'masc': Service(PROTOCOLS['udp'], 2587, 'masc'),
-        'masqdialer': Service(PROTOCOLS['udp'], 224, 'masqdialer'),
-        'matip-type-a': Service(PROTOCOLS['udp'], 350, 'matip-type-a'),
-        'matip-type-b': Service(PROTOCOLS['udp'], 351, 'matip-type-b'),
-        'max': Service(PROTOCOLS['udp'], 6074, 'max'),
-        'maxim-asics': Service(PROTOCOLS['udp'], 3276, 'maxim-asics'),
-        'maxumsp': Service(PROTOCOLS['udp'], 4179, 'maxumsp'),
-        'maytagshuffle': Service(PROTOCOLS['udp'], 2591, 'maytagshuffle'),
-        'mbap': Service(PROTOCOLS['udp'], 502, 'mbap'),
-        'mbap-s': Service(PROTOCOLS['udp'], 802, 'mbap-s'),
-        'mbg-ctrl': Service(PROTOCOLS['udp'], 3569, 'mbg-ctrl'),
-        'mbl-battd': Service(PROTOCOLS['udp'], 4153, 'mbl-battd'),
-        'mbus': Service(PROTOCOLS['udp'], 47000, 'mbus'),
-        'mc-appserver': Service(PROTOCOLS['udp'], 8763, 'mc-appserver'),
-        'mc-brk-srv': Service(PROTOCOLS['udp'], 3180, 'mc-brk-srv'),
-        'mc-client': Service(PROTOCOLS['udp'], 1180, 'mc-client'),
-        'mc-comm': Service(PROTOCOLS['udp'], 9632, 'mc-comm'),
-        'mc-gt-srv': Service(PROTOCOLS['udp'], 2180, 'mc-gt-srv'),
-        'mc2studios': Service(PROTOCOLS['udp'], 1899, 'mc2studios'),
-        'mc3ss': Service(PROTOCOLS['udp'], 3521, 'mc3ss'),
-        'mcagent': Service(PROTOCOLS['udp'], 1820, 'mcagent'),
-        'mccwebsvr-port': Service(PROTOCOLS['udp'], 3570, 'mccwebsvr-port'),
-        'mcer-port': Service(PROTOCOLS['udp'], 6510, 'mcer-port'),
-        'mcftp': Service(PROTOCOLS['udp'], 6622, 'mcftp'),
-        'mcidas': Service(PROTOCOLS['udp'], 112, 'mcidas'),
-        'mck-ivpip': Service(PROTOCOLS['udp'], 2698, 'mck-ivpip'),
-        'mcns-sec': Service(PROTOCOLS['udp'], 638, 'mcns-sec'),
-        'mcns-tel-ret': Service(PROTOCOLS['udp'], 3311, 'mcns-tel-ret'),
-        'mcntp': Service(PROTOCOLS['udp'], 5418, 'mcntp'),
-        'mcp': Service(PROTOCOLS['udp'], 4458, 'mcp'),
-        'mcp-port': Service(PROTOCOLS['udp'], 3558, 'mcp-port'),
-        'mcreport': Service(PROTOCOLS['udp'], 8003, 'mcreport'),
-        'mcs-calypsoicf': Service(PROTOCOLS['udp'], 3330, 'mcs-calypsoicf'),
-        'mcs-fastmail': Service(PROTOCOLS['udp'], 3302, 'mcs-fastmail'),
-        'mcs-mailsvr': Service(PROTOCOLS['udp'], 3332, 'mcs-mailsvr'),
-        'mcs-messaging': Service(PROTOCOLS['udp'], 3331, 'mcs-messaging'),
-        'mctet-gateway': Service(PROTOCOLS['udp'], 3116, 'mctet-gateway'),
-        'mctet-jserv': Service(PROTOCOLS['udp'], 3117, 'mctet-jserv'),
-        'mctet-master': Service(PROTOCOLS['udp'], 3115, 'mctet-master'),
-        'mctfeed': Service(PROTOCOLS['udp'], 5598, 'mctfeed'),
-        'mctp': Service(PROTOCOLS['udp'], 1100, 'mctp'),
-        'md-cg-http': Service(PROTOCOLS['udp'], 2688, 'md-cg-http'),
-        'mdap-port': Service(PROTOCOLS['udp'], 3235, 'mdap-port'),
-        'mdbs-daemon': Service(PROTOCOLS['udp'], 800, 'mdbs-daemon'),
-        'mdbs_daemon': Service(PROTOCOLS['udp'], 800, 'mdbs_daemon'),
-        'mdc-portmapper': Service(PROTOCOLS['udp'], 685, 'mdc-portmapper'),
-        'mdns': Service(PROTOCOLS['udp'], 5353, 'mdns'),
-        'mdnsresponder': Service(PROTOCOLS['udp'], 5354, 'mdnsresponder'),
-        'mdqs': Service(PROTOCOLS['udp'], 666, 'mdqs'),
-        'mdtp': Service(PROTOCOLS['udp'], 3232, 'mdtp'),
-        'mecomm': Service(PROTOCOLS['udp'], 668, 'mecomm'),
-        'med-ci': Service(PROTOCOLS['udp'], 24005, 'med-ci'),
-        'med-fsp-rx': Service(PROTOCOLS['udp'], 24001, 'med-fsp-rx'),
-        'med-fsp-tx': Service(PROTOCOLS['udp'], 24002, 'med-fsp-tx'),
-        'med-ltp': Service(PROTOCOLS['udp'], 24000, 'med-ltp'),
-        'med-net-svc': Service(PROTOCOLS['udp'], 24006, 'med-net-svc'),
-        'med-ovw': Service(PROTOCOLS['udp'], 24004, 'med-ovw'),
-        'med-supp': Service(PROTOCOLS['udp'], 24003, 'med-supp'),
-        'media-agent': Service(PROTOCOLS['udp'], 2789, 'media-agent'),
-        'mediabox': Service(PROTOCOLS['udp'], 46999, 'mediabox'),
-        'mediacntrlnfsd': Service(PROTOCOLS['udp'], 2363, 'mediacntrlnfsd'),
-        'mediaspace': Service(PROTOCOLS['udp'], 3594, 'mediaspace'),
-        'mediavault-gui': Service(PROTOCOLS['udp'], 3673, 'mediavault-gui'),
-        'medimageportal': Service(PROTOCOLS['udp'], 7720, 'medimageportal'),
-        'megaco-h248': Service(PROTOCOLS['udp'], 2944, 'megaco-h248'),
-        'megardsvr-port': Service(PROTOCOLS['udp'], 3571, 'megardsvr-port'),
-        'megaregsvrport': Service(PROTOCOLS['udp'], 3572, 'megaregsvrport'),
-        'memcache': Service(PROTOCOLS['udp'], 11211, 'memcache'),
-        'menandmice-dns': Service(PROTOCOLS['udp'], 1337, 'menandmice-dns'),
-        'menandmice-lpm': Service(PROTOCOLS['udp'], 1231, 'menandmice-lpm'),
-        'menandmice-mon': Service(PROTOCOLS['udp'], 4552, 'menandmice-mon'),
-        'menandmice-noh': Service(PROTOCOLS['udp'], 4151, 'menandmice-noh'),
-        'menandmice_noh': Service(PROTOCOLS['udp'], 4151, 'menandmice_noh'),
-        'mentaclient': Service(PROTOCOLS['udp'], 2117, 'mentaclient'),
-        'mentaserver': Service(PROTOCOLS['udp'], 2118, 'mentaserver'),
-        'mercantile': Service(PROTOCOLS['udp'], 3398, 'mercantile'),
-        'mercury-disc': Service(PROTOCOLS['udp'], 9596, 'mercury-disc'),
-        'meregister': Service(PROTOCOLS['udp'], 669, 'meregister'),
-        'mesavistaco': Service(PROTOCOLS['udp'], 1249, 'mesavistaco'),
-        'messageasap': Service(PROTOCOLS['udp'], 6070, 'messageasap'),
-        'messageservice': Service(PROTOCOLS['udp'], 2311, 'messageservice'),
-        'meta-corp': Service(PROTOCOLS['udp'], 6141, 'meta-corp'),
-        'meta5': Service(PROTOCOLS['udp'], 393, 'meta5'),
-        'metaagent': Service(PROTOCOLS['udp'], 1897, 'metaagent'),
-        'metaconsole': Service(PROTOCOLS['udp'], 2850, 'metaconsole'),
-        'metaedit-mu': Service(PROTOCOLS['udp'], 6360, 'metaedit-mu'),
-        'metaedit-se': Service(PROTOCOLS['udp'], 6370, 'metaedit-se'),
-        'metaedit-ws': Service(PROTOCOLS['udp'], 6390, 'metaedit-ws'),
-        'metagram': Service(PROTOCOLS['udp'], 99, 'metagram'),
-        'metasage': Service(PROTOCOLS['udp'], 1207, 'metasage'),
-        'metastorm': Service(PROTOCOLS['udp'], 2511, 'metastorm'),
-        'metasys': Service(PROTOCOLS['udp'], 11001, 'metasys'),
-        'metatude-mds': Service(PROTOCOLS['udp'], 6382, 'metatude-mds'),
-        'meter': Service(PROTOCOLS['udp'], 571, 'meter'),
-        'metricadbc': Service(PROTOCOLS['udp'], 2622, 'metricadbc'),
-        'metrics-pas': Service(PROTOCOLS['udp'], 1824, 'metrics-pas'),
-        'mevent': Service(PROTOCOLS['udp'], 7900, 'mevent'),
-        'mfcobol': Service(PROTOCOLS['udp'], 86, 'mfcobol'),
-        'mfserver': Service(PROTOCOLS['udp'], 2266, 'mfserver'),
-        'mftp': Service(PROTOCOLS['udp'], 5402, 'mftp'),
-        'mgcp-callagent': Service(PROTOCOLS['udp'], 2727, 'mgcp-callagent'),
-        'mgcp-gateway': Service(PROTOCOLS['udp'], 2427, 'mgcp-gateway'),
-        'mgcs-mfp-port': Service(PROTOCOLS['udp'], 6509, 'mgcs-mfp-port'),
-        'mgemanagement': Service(PROTOCOLS['udp'], 4680, 'mgemanagement'),
-        'mgesupervision': Service(PROTOCOLS['udp'], 4679, 'mgesupervision'),
-        'mgxswitch': Service(PROTOCOLS['udp'], 3070, 'mgxswitch'),
-        'miami-bcast': Service(PROTOCOLS['udp'], 6083, 'miami-bcast'),
-        'mib-streaming': Service(PROTOCOLS['udp'], 2292, 'mib-streaming'),
-        'mice': Service(PROTOCOLS['udp'], 5022, 'mice'),
-        'micom-pfs': Service(PROTOCOLS['udp'], 490, 'micom-pfs'),
-        'microcom-sbp': Service(PROTOCOLS['udp'], 1680, 'microcom-sbp'),
-        'micromuse-lm': Service(PROTOCOLS['udp'], 1534, 'micromuse-lm'),
-        'micromuse-ncps': Service(PROTOCOLS['udp'], 7979, 'micromuse-ncps'),
-        'micromuse-ncpw': Service(PROTOCOLS['udp'], 9600, 'micromuse-ncpw'),
-        'microsan': Service(PROTOCOLS['udp'], 20001, 'microsan'),
-        'microsoft-ds': Service(PROTOCOLS['udp'], 445, 'microsoft-ds'),
-        'microtalon-com': Service(PROTOCOLS['udp'], 7014, 'microtalon-com'),
-        'microtalon-dis': Service(PROTOCOLS['udp'], 7013, 'microtalon-dis'),
-        'midnight-tech': Service(PROTOCOLS['udp'], 3008, 'midnight-tech'),
-        'mikey': Service(PROTOCOLS['udp'], 2269, 'mikey'),
-        'mil-2045-47001': Service(PROTOCOLS['udp'], 1581, 'mil-2045-47001'),
-        'miles-apart': Service(PROTOCOLS['udp'], 2621, 'miles-apart'),
-        'mimer': Service(PROTOCOLS['udp'], 1360, 'mimer'),
-        'mindfilesys': Service(PROTOCOLS['udp'], 7391, 'mindfilesys'),
-        'mindprint': Service(PROTOCOLS['udp'], 8033, 'mindprint'),
-        'minger': Service(PROTOCOLS['udp'], 4069, 'minger'),
-        'mini-sql': Service(PROTOCOLS['udp'], 1114, 'mini-sql'),
-        'minilock': Service(PROTOCOLS['udp'], 3798, 'minilock'),
-        'minipay': Service(PROTOCOLS['udp'], 2105, 'minipay'),
-        'minivend': Service(PROTOCOLS['udp'], 7786, 'minivend'),
-        'minotaur-sa': Service(PROTOCOLS['udp'], 5136, 'minotaur-sa'),
-        'mipi-debug': Service(PROTOCOLS['udp'], 7606, 'mipi-debug'),
-        'mipv6tls': Service(PROTOCOLS['udp'], 7872, 'mipv6tls'),
-        'mira': Service(PROTOCOLS['udp'], 3454, 'mira'),
-        'miroconnect': Service(PROTOCOLS['udp'], 1532, 'miroconnect'),
-        'mirrtex': Service(PROTOCOLS['udp'], 4310, 'mirrtex'),
-        'mit-dov': Service(PROTOCOLS['udp'], 91, 'mit-dov'),
-        'mit-ml-dev': Service(PROTOCOLS['udp'], 85, 'mit-ml-dev'),
-        'miteksys-lm': Service(PROTOCOLS['udp'], 1482, 'miteksys-lm'),
-        'miva-mqs': Service(PROTOCOLS['udp'], 1277, 'miva-mqs'),
-        'mkm-discovery': Service(PROTOCOLS['udp'], 3837, 'mkm-discovery'),
-        'mle': Service(PROTOCOLS['udp'], 19788, 'mle'),
-        'mloadd': Service(PROTOCOLS['udp'], 1427, 'mloadd'),
-        'mlsn': Service(PROTOCOLS['udp'], 32801, 'mlsn'),
-        'mma-discovery': Service(PROTOCOLS['udp'], 4173, 'mma-discovery'),
-        'mmacomm': Service(PROTOCOLS['udp'], 4667, 'mmacomm'),
-        'mmaeds': Service(PROTOCOLS['udp'], 4668, 'mmaeds'),
-        'mmcal': Service(PROTOCOLS['udp'], 2272, 'mmcal'),
-        'mmcals': Service(PROTOCOLS['udp'], 2271, 'mmcals'),
-        'mmcc': Service(PROTOCOLS['udp'], 5050, 'mmcc'),
-        'mmpft': Service(PROTOCOLS['udp'], 1815, 'mmpft'),
-        'mnet-discovery': Service(PROTOCOLS['udp'], 5237, 'mnet-discovery'),
-        'mngsuite': Service(PROTOCOLS['udp'], 9535, 'mngsuite'),
-        'mni-prot-rout': Service(PROTOCOLS['udp'], 3764, 'mni-prot-rout'),
-        'mnp-exchange': Service(PROTOCOLS['udp'], 2197, 'mnp-exchange'),
-        'mns-mail': Service(PROTOCOLS['udp'], 2593, 'mns-mail'),
-        'mobile-file-dl': Service(PROTOCOLS['udp'], 2926, 'mobile-file-dl'),
-        'mobile-p2p': Service(PROTOCOLS['udp'], 4688, 'mobile-p2p'),
-        'mobileip-agent': Service(PROTOCOLS['udp'], 434, 'mobileip-agent'),
-        'mobilip-mn': Service(PROTOCOLS['udp'], 435, 'mobilip-mn'),
-        'mobilitysrv': Service(PROTOCOLS['udp'], 6997, 'mobilitysrv'),
-        'mobrien-chat': Service(PROTOCOLS['udp'], 2031, 'mobrien-chat'),
-        'moldflow-lm': Service(PROTOCOLS['udp'], 1576, 'moldflow-lm'),
-        'molly': Service(PROTOCOLS['udp'], 1374, 'molly'),
-        'mon': Service(PROTOCOLS['udp'], 9255, 'mon'),
-        'mondex': Service(PROTOCOLS['udp'], 471, 'mondex'),
-        'monitor': Service(PROTOCOLS['udp'], 561, 'monitor'),
-        'monkeycom': Service(PROTOCOLS['udp'], 9898, 'monkeycom'),
-        'monp': Service(PROTOCOLS['udp'], 3445, 'monp'),
-        'montage-lm': Service(PROTOCOLS['udp'], 6147, 'montage-lm'),
-        'mortgageware': Service(PROTOCOLS['udp'], 367, 'mortgageware'),
-        'mos-aux': Service(PROTOCOLS['udp'], 10542, 'mos-aux'),
-        'mos-lower': Service(PROTOCOLS['udp'], 10540, 'mos-lower'),
-        'mos-soap': Service(PROTOCOLS['udp'], 10543, 'mos-soap'),
-        'mos-soap-opt': Service(PROTOCOLS['udp'], 10544, 'mos-soap-opt'),
-        'mos-upper': Service(PROTOCOLS['udp'], 10541, 'mos-upper'),
-        'mosaicsyssvc1': Service(PROTOCOLS['udp'], 1235, 'mosaicsyssvc1'),
-        'mosaixcc': Service(PROTOCOLS['udp'], 2561, 'mosaixcc'),
-        'moshebeeri': Service(PROTOCOLS['udp'], 2627, 'moshebeeri'),
-        'mountd': Service(PROTOCOLS['udp'], 20048, 'mountd'),
-        'movaz-ssc': Service(PROTOCOLS['udp'], 5252, 'movaz-ssc'),
-        'moy-corp': Service(PROTOCOLS['udp'], 2488, 'moy-corp'),
-        'mpc-lifenet': Service(PROTOCOLS['udp'], 1213, 'mpc-lifenet'),
-        'mpfoncl': Service(PROTOCOLS['udp'], 2579, 'mpfoncl'),
-        'mpfwsas': Service(PROTOCOLS['udp'], 2952, 'mpfwsas'),
-        'mphlpdmc': Service(PROTOCOLS['udp'], 9344, 'mphlpdmc'),
-        'mpidcagt': Service(PROTOCOLS['udp'], 9397, 'mpidcagt'),
-        'mpidcmgr': Service(PROTOCOLS['udp'], 9343, 'mpidcmgr'),
-        'mpl-gprs-port': Service(PROTOCOLS['udp'], 3924, 'mpl-gprs-port'),
-        'mpls-pm': Service(PROTOCOLS['udp'], 6634, 'mpls-pm'),
-        'mpls-udp': Service(PROTOCOLS['udp'], 6635, 'mpls-udp'),
-        'mpls-udp-dtls': Service(PROTOCOLS['udp'], 6636, 'mpls-udp-dtls'),
-        'mpm': Service(PROTOCOLS['udp'], 45, 'mpm'),
-        'mpm-flags': Service(PROTOCOLS['udp'], 44, 'mpm-flags'),
-        'mpm-snd': Service(PROTOCOLS['udp'], 46, 'mpm-snd'),
-        'mpnjsc': Service(PROTOCOLS['udp'], 1952, 'mpnjsc'),
-        'mpnjsocl': Service(PROTOCOLS['udp'], 2685, 'mpnjsocl'),
-        'mpnjsomb': Service(PROTOCOLS['udp'], 2681, 'mpnjsomb'),
-        'mpnjsomg': Service(PROTOCOLS['udp'], 2686, 'mpnjsomg'),
-        'mpnjsosv': Service(PROTOCOLS['udp'], 2684, 'mpnjsosv'),
-        'mpp': Service(PROTOCOLS['udp'], 218, 'mpp'),
-        'mppolicy-mgr': Service(PROTOCOLS['udp'], 5969, 'mppolicy-mgr'),
-        'mppolicy-v5': Service(PROTOCOLS['udp'], 5968, 'mppolicy-v5'),
-        'mps-raft': Service(PROTOCOLS['udp'], 1700, 'mps-raft'),
-        'mpshrsv': Service(PROTOCOLS['udp'], 1261, 'mpshrsv'),
-        'mpsserver': Service(PROTOCOLS['udp'], 6106, 'mpsserver'),
-        'mpsysrmsvr': Service(PROTOCOLS['udp'], 3358, 'mpsysrmsvr'),
-        'mptn': Service(PROTOCOLS['udp'], 397, 'mptn'),
-        'mqe-agent': Service(PROTOCOLS['udp'], 3958, 'mqe-agent'),
-        'mqe-broker': Service(PROTOCOLS['udp'], 3957, 'mqe-broker'),
-        'mqtt': Service(PROTOCOLS['udp'], 1883, 'mqtt'),
-        'mrip': Service(PROTOCOLS['udp'], 4986, 'mrip'),
-        'mrm': Service(PROTOCOLS['udp'], 679, 'mrm'),
-        'mrssrendezvous': Service(PROTOCOLS['udp'], 7392, 'mrssrendezvous'),
-        'ms-alerter': Service(PROTOCOLS['udp'], 5359, 'ms-alerter'),
-        'ms-cluster-net': Service(PROTOCOLS['udp'], 3343, 'ms-cluster-net'),
-        'ms-la': Service(PROTOCOLS['udp'], 3535, 'ms-la'),
-        'ms-licensing': Service(PROTOCOLS['udp'], 5720, 'ms-licensing'),
-        'ms-olap1': Service(PROTOCOLS['udp'], 2393, 'ms-olap1'),
-        'ms-olap2': Service(PROTOCOLS['udp'], 2394, 'ms-olap2'),
-        'ms-olap3': Service(PROTOCOLS['udp'], 2382, 'ms-olap3'),
-        'ms-olap4': Service(PROTOCOLS['udp'], 2383, 'ms-olap4'),
-        'ms-rome': Service(PROTOCOLS['udp'], 569, 'ms-rome'),
-        'ms-rule-engine': Service(PROTOCOLS['udp'], 3132, 'ms-rule-engine'),
-        'ms-s-sideshow': Service(PROTOCOLS['udp'], 5361, 'ms-s-sideshow'),
-        'ms-shuttle': Service(PROTOCOLS['udp'], 568, 'ms-shuttle'),
-        'ms-sideshow': Service(PROTOCOLS['udp'], 5360, 'ms-sideshow'),
-        'ms-smlbiz': Service(PROTOCOLS['udp'], 5356, 'ms-smlbiz'),
-        'ms-sna-base': Service(PROTOCOLS['udp'], 1478, 'ms-sna-base'),
-        'ms-sna-server': Service(PROTOCOLS['udp'], 1477, 'ms-sna-server'),
-        'ms-sql-m': Service(PROTOCOLS['udp'], 1434, 'ms-sql-m'),
-        'ms-sql-s': Service(PROTOCOLS['udp'], 1433, 'ms-sql-s'),
-        'ms-streaming': Service(PROTOCOLS['udp'], 1755, 'ms-streaming'),
-        'ms-theater': Service(PROTOCOLS['udp'], 2460, 'ms-theater'),
-        'ms-v-worlds': Service(PROTOCOLS['udp'], 2525, 'ms-v-worlds'),
-        'ms-wbt-server': Service(PROTOCOLS['udp'], 3389, 'ms-wbt-server'),
-        'msdfsr': Service(PROTOCOLS['udp'], 5722, 'msdfsr'),
-        'msdp': Service(PROTOCOLS['udp'], 639, 'msdp'),
-        'msdts1': Service(PROTOCOLS['udp'], 3882, 'msdts1'),
-        'msexch-routing': Service(PROTOCOLS['udp'], 691, 'msexch-routing'),
-        'msfrs': Service(PROTOCOLS['udp'], 4554, 'msfrs'),
-        'msft-gc': Service(PROTOCOLS['udp'], 3268, 'msft-gc'),
-        'msft-gc-ssl': Service(PROTOCOLS['udp'], 3269, 'msft-gc-ssl'),
-        'msfw-array': Service(PROTOCOLS['udp'], 2174, 'msfw-array'),
-        'msfw-control': Service(PROTOCOLS['udp'], 3847, 'msfw-control'),
-        'msfw-replica': Service(PROTOCOLS['udp'], 2173, 'msfw-replica'),
-        'msfw-s-storage': Service(PROTOCOLS['udp'], 2172, 'msfw-s-storage'),
-        'msfw-storage': Service(PROTOCOLS['udp'], 2171, 'msfw-storage'),
-        'msg-auth': Service(PROTOCOLS['udp'], 31, 'msg-auth'),
-        'msg-icp': Service(PROTOCOLS['udp'], 29, 'msg-icp'),
-        'msgclnt': Service(PROTOCOLS['udp'], 8786, 'msgclnt'),
-        'msgsrvr': Service(PROTOCOLS['udp'], 8787, 'msgsrvr'),
-        'msgsys': Service(PROTOCOLS['udp'], 9594, 'msgsys'),
-        'mshnet': Service(PROTOCOLS['udp'], 1989, 'mshnet'),
-        'msi-cps-rm-disc': Service(PROTOCOLS['udp'], 8675, 'msi-cps-rm-disc'),
-        'msi-selectplay': Service(PROTOCOLS['udp'], 2871, 'msi-selectplay'),
-        'msiccp': Service(PROTOCOLS['udp'], 1731, 'msiccp'),
-        'msims': Service(PROTOCOLS['udp'], 1582, 'msims'),
-        'msl-lmd': Service(PROTOCOLS['udp'], 1464, 'msl-lmd'),
-        'msl_lmd': Service(PROTOCOLS['udp'], 1464, 'msl_lmd'),
-        'msmq': Service(PROTOCOLS['udp'], 1801, 'msmq'),
-        'msnp': Service(PROTOCOLS['udp'], 1863, 'msnp'),
-        'msolap-ptp2': Service(PROTOCOLS['udp'], 2725, 'msolap-ptp2'),
-        'msp': Service(PROTOCOLS['udp'], 2438, 'msp'),
-        'msp-os': Service(PROTOCOLS['udp'], 4686, 'msp-os'),
-        'msr-plugin-port': Service(PROTOCOLS['udp'], 3931, 'msr-plugin-port'),
-        'msync': Service(PROTOCOLS['udp'], 2072, 'msync'),
-        'mt-scaleserver': Service(PROTOCOLS['udp'], 2305, 'mt-scaleserver'),
-        'mtcevrunqman': Service(PROTOCOLS['udp'], 4558, 'mtcevrunqman'),
-        'mtcevrunqss': Service(PROTOCOLS['udp'], 4557, 'mtcevrunqss'),
-        'mti-tcs-comm': Service(PROTOCOLS['udp'], 2469, 'mti-tcs-comm'),
-        'mtl8000-matrix': Service(PROTOCOLS['udp'], 8115, 'mtl8000-matrix'),
-        'mtn': Service(PROTOCOLS['udp'], 4691, 'mtn'),
-        'mtp': Service(PROTOCOLS['udp'], 1911, 'mtp'),
-        'mtport-regist': Service(PROTOCOLS['udp'], 2791, 'mtport-regist'),
-        'mtportmon': Service(PROTOCOLS['udp'], 7421, 'mtportmon'),
-        'mtqp': Service(PROTOCOLS['udp'], 1038, 'mtqp'),
-        'mtrace': Service(PROTOCOLS['udp'], 33435, 'mtrace'),
-        'mtrgtrans': Service(PROTOCOLS['udp'], 19398, 'mtrgtrans'),
-        'multicast-ping': Service(PROTOCOLS['udp'], 9903, 'multicast-ping'),
-        'multiling-http': Service(PROTOCOLS['udp'], 777, 'multiling-http'),
-        'multip-msg': Service(PROTOCOLS['udp'], 3733, 'multip-msg'),
-        'multiplex': Service(PROTOCOLS['udp'], 171, 'multiplex'),
-        'mumps': Service(PROTOCOLS['udp'], 188, 'mumps'),
-        'munin': Service(PROTOCOLS['udp'], 4949, 'munin'),
-        'mupdate': Service(PROTOCOLS['udp'], 3905, 'mupdate'),
-        'murray': Service(PROTOCOLS['udp'], 1123, 'murray'),
-        'murx': Service(PROTOCOLS['udp'], 2743, 'murx'),
-        'muse': Service(PROTOCOLS['udp'], 6888, 'muse'),
-        'musiconline': Service(PROTOCOLS['udp'], 1806, 'musiconline'),
-        'must-backplane': Service(PROTOCOLS['udp'], 3515, 'must-backplane'),
-        'must-p2p': Service(PROTOCOLS['udp'], 3514, 'must-p2p'),
-        'mvel-lm': Service(PROTOCOLS['udp'], 1574, 'mvel-lm'),
-        'mvs-capacity': Service(PROTOCOLS['udp'], 10007, 'mvs-capacity'),
-        'mvx-lm': Service(PROTOCOLS['udp'], 1510, 'mvx-lm'),
-        'mxi': Service(PROTOCOLS['udp'], 8005, 'mxi'),
-        'mxit': Service(PROTOCOLS['udp'], 9119, 'mxit'),
-        'mxomss': Service(PROTOCOLS['udp'], 1141, 'mxomss'),
-        'mxxrlogin': Service(PROTOCOLS['udp'], 1035, 'mxxrlogin'),
-        'myblast': Service(PROTOCOLS['udp'], 3795, 'myblast'),
-        'mylex-mapd': Service(PROTOCOLS['udp'], 467, 'mylex-mapd'),
-        'mylxamport': Service(PROTOCOLS['udp'], 2981, 'mylxamport'),
-        'mynahautostart': Service(PROTOCOLS['udp'], 2388, 'mynahautostart'),
-        'myq-termlink': Service(PROTOCOLS['udp'], 11108, 'myq-termlink'),
-        'myrtle': Service(PROTOCOLS['udp'], 1831, 'myrtle'),
-        'mysql': Service(PROTOCOLS['udp'], 3306, 'mysql'),
-        'mysql-cluster': Service(PROTOCOLS['udp'], 1186, 'mysql-cluster'),
-        'mysql-cm-agent': Service(PROTOCOLS['udp'], 1862, 'mysql-cm-agent'),
-        'mysql-im': Service(PROTOCOLS['udp'], 2273, 'mysql-im'),
-        'mysql-proxy': Service(PROTOCOLS['udp'], 6446, 'mysql-proxy'),
-        'mzap': Service(PROTOCOLS['udp'], 2106, 'mzap'),
-        'mzca-alert': Service(PROTOCOLS['udp'], 7282, 'mzca-alert'),
-        'n1-fwp': Service(PROTOCOLS['udp'], 4446, 'n1-fwp'),
-        'n1-rmgmt': Service(PROTOCOLS['udp'], 4447, 'n1-rmgmt'),
-        'n2h2server': Service(PROTOCOLS['udp'], 9285, 'n2h2server'),
-        'n2nremote': Service(PROTOCOLS['udp'], 1685, 'n2nremote'),
-        'n2receive': Service(PROTOCOLS['udp'], 9286, 'n2receive'),
-        'na-er-tip': Service(PROTOCOLS['udp'], 3725, 'na-er-tip'),
-        'na-localise': Service(PROTOCOLS['udp'], 5062, 'na-localise'),
-        'naap': Service(PROTOCOLS['udp'], 1340, 'naap'),
-        'nacnl': Service(PROTOCOLS['udp'], 4361, 'nacnl'),
-        'name': Service(PROTOCOLS['udp'], 42, 'name'),
-        'namemunge': Service(PROTOCOLS['udp'], 3950, 'namemunge'),
-        'nameserver': Service(PROTOCOLS['udp'], 42, 'nameserver'),
-        'namp': Service(PROTOCOLS['udp'], 167, 'namp'),
-        'nani': Service(PROTOCOLS['udp'], 2236, 'nani'),
-        'nas': Service(PROTOCOLS['udp'], 991, 'nas'),
-        'nas-metering': Service(PROTOCOLS['udp'], 2286, 'nas-metering'),
-        'nasmanager': Service(PROTOCOLS['udp'], 1960, 'nasmanager'),
-        'natdataservice': Service(PROTOCOLS['udp'], 3927, 'natdataservice'),
-        'nati-dstp': Service(PROTOCOLS['udp'], 3015, 'nati-dstp'),
-        'nati-logos': Service(PROTOCOLS['udp'], 2343, 'nati-logos'),
-        'nati-svrloc': Service(PROTOCOLS['udp'], 3580, 'nati-svrloc'),
-        'nati-vi-server': Service(PROTOCOLS['udp'], 3363, 'nati-vi-server'),
-        'nattyserver': Service(PROTOCOLS['udp'], 3753, 'nattyserver'),
-        'natuslink': Service(PROTOCOLS['udp'], 2895, 'natuslink'),
-        'nav-data': Service(PROTOCOLS['udp'], 6317, 'nav-data'),
-        'nav-port': Service(PROTOCOLS['udp'], 3859, 'nav-port'),
-        'navbuddy': Service(PROTOCOLS['udp'], 1288, 'navbuddy'),
-        'navegaweb-port': Service(PROTOCOLS['udp'], 3159, 'navegaweb-port'),
-        'navisphere': Service(PROTOCOLS['udp'], 2162, 'navisphere'),
-        'navisphere-sec': Service(PROTOCOLS['udp'], 2163, 'navisphere-sec'),
-        'nbdb': Service(PROTOCOLS['udp'], 13785, 'nbdb'),
-        'nbt-pc': Service(PROTOCOLS['udp'], 5133, 'nbt-pc'),
-        'nbt-wol': Service(PROTOCOLS['udp'], 6133, 'nbt-wol'),
-        'nburn-id': Service(PROTOCOLS['udp'], 20034, 'nburn-id'),
-        'nburn_id': Service(PROTOCOLS['udp'], 20034, 'nburn_id'),
-        'nbx-au': Service(PROTOCOLS['udp'], 2094, 'nbx-au'),
-        'nbx-cc': Service(PROTOCOLS['udp'], 2093, 'nbx-cc'),
-        'nbx-dir': Service(PROTOCOLS['udp'], 2096, 'nbx-dir'),
-        'nbx-ser': Service(PROTOCOLS['udp'], 2095, 'nbx-ser'),
-        'ncacn-ip-tcp': Service(PROTOCOLS['udp'], 3062, 'ncacn-ip-tcp'),
-        'ncadg-ip-udp': Service(PROTOCOLS['udp'], 3063, 'ncadg-ip-udp'),
-        'ncconfig': Service(PROTOCOLS['udp'], 1888, 'ncconfig'),
-        'ncdloadbalance': Service(PROTOCOLS['udp'], 2683, 'ncdloadbalance'),
-        'ncdmirroring': Service(PROTOCOLS['udp'], 2706, 'ncdmirroring'),
-        'nced': Service(PROTOCOLS['udp'], 404, 'nced'),
-        'ncl': Service(PROTOCOLS['udp'], 2397, 'ncl'),
-        'ncld': Service(PROTOCOLS['udp'], 405, 'ncld'),
-        'ncp': Service(PROTOCOLS['udp'], 524, 'ncp'),
-        'ncpm-ft': Service(PROTOCOLS['udp'], 1744, 'ncpm-ft'),
-        'ncpm-hip': Service(PROTOCOLS['udp'], 1683, 'ncpm-hip'),
-        'ncpm-pm': Service(PROTOCOLS['udp'], 1591, 'ncpm-pm'),
-        'ncr-ccl': Service(PROTOCOLS['udp'], 2528, 'ncr-ccl'),
-        'ncr_ccl': Service(PROTOCOLS['udp'], 2528, 'ncr_ccl'),
-        'ncu-1': Service(PROTOCOLS['udp'], 3195, 'ncu-1'),
-        'ncu-2': Service(PROTOCOLS['udp'], 3196, 'ncu-2'),
-        'ncube-lm': Service(PROTOCOLS['udp'], 1521, 'ncube-lm'),
-        'ncxcp': Service(PROTOCOLS['udp'], 5681, 'ncxcp'),
-        'ndl-aas': Service(PROTOCOLS['udp'], 3128, 'ndl-aas'),
-        'ndl-ahp-svc': Service(PROTOCOLS['udp'], 6064, 'ndl-ahp-svc'),
-        'ndl-als': Service(PROTOCOLS['udp'], 3431, 'ndl-als'),
-        'ndl-aps': Service(PROTOCOLS['udp'], 3096, 'ndl-aps'),
-        'ndl-tcp-ois-gw': Service(PROTOCOLS['udp'], 2738, 'ndl-tcp-ois-gw'),
-        'ndm-agent-port': Service(PROTOCOLS['udp'], 43189, 'ndm-agent-port'),
-        'ndm-requester': Service(PROTOCOLS['udp'], 1363, 'ndm-requester'),
-        'ndm-server': Service(PROTOCOLS['udp'], 1364, 'ndm-server'),
-        'ndmp': Service(PROTOCOLS['udp'], 10000, 'ndmp'),
-        'ndn': Service(PROTOCOLS['udp'], 6363, 'ndn'),
-        'ndnp': Service(PROTOCOLS['udp'], 2883, 'ndnp'),
-        'nds-sso': Service(PROTOCOLS['udp'], 3024, 'nds-sso'),
-        'nds_sso': Service(PROTOCOLS['udp'], 3024, 'nds_sso'),
-        'ndsauth': Service(PROTOCOLS['udp'], 353, 'ndsauth'),
-        'ndsconnect': Service(PROTOCOLS['udp'], 3890, 'ndsconnect'),
-        'ndsp': Service(PROTOCOLS['udp'], 2881, 'ndsp'),
-        'ndtp': Service(PROTOCOLS['udp'], 2882, 'ndtp'),
-        'nec-raidplus': Service(PROTOCOLS['udp'], 2730, 'nec-raidplus'),
-        'neckar': Service(PROTOCOLS['udp'], 37475, 'neckar'),
-        'necp': Service(PROTOCOLS['udp'], 3262, 'necp'),
-        'nei-management': Service(PROTOCOLS['udp'], 3886, 'nei-management'),
-        'neod1': Service(PROTOCOLS['udp'], 1047, 'neod1'),
-        'neod2': Service(PROTOCOLS['udp'], 1048, 'neod2'),
-        'neoiface': Service(PROTOCOLS['udp'], 1285, 'neoiface'),
-        'neon24x7': Service(PROTOCOLS['udp'], 3213, 'neon24x7'),
-        'nerv': Service(PROTOCOLS['udp'], 1222, 'nerv'),
-        'nesh-broker': Service(PROTOCOLS['udp'], 3507, 'nesh-broker'),
-        'nessus': Service(PROTOCOLS['udp'], 1241, 'nessus'),
-        'nest-protocol': Service(PROTOCOLS['udp'], 489, 'nest-protocol'),
-        'net-device': Service(PROTOCOLS['udp'], 4350, 'net-device'),
-        'net-projection': Service(PROTOCOLS['udp'], 5363, 'net-projection'),
-        'net-steward': Service(PROTOCOLS['udp'], 2128, 'net-steward'),
-        'net2display': Service(PROTOCOLS['udp'], 9086, 'net2display'),
-        'net8-cman': Service(PROTOCOLS['udp'], 1830, 'net8-cman'),
-        'netadmin': Service(PROTOCOLS['udp'], 2450, 'netadmin'),
-        'netagent': Service(PROTOCOLS['udp'], 5771, 'netagent'),
-        'netangel': Service(PROTOCOLS['udp'], 2442, 'netangel'),
-        'netarx': Service(PROTOCOLS['udp'], 1040, 'netarx'),
-        'netaspi': Service(PROTOCOLS['udp'], 2902, 'netaspi'),
-        'netattachsdmp': Service(PROTOCOLS['udp'], 3066, 'netattachsdmp'),
-        'netbill-auth': Service(PROTOCOLS['udp'], 1615, 'netbill-auth'),
-        'netbill-cred': Service(PROTOCOLS['udp'], 1614, 'netbill-cred'),
-        'netbill-keyrep': Service(PROTOCOLS['udp'], 1613, 'netbill-keyrep'),
-        'netbill-prod': Service(PROTOCOLS['udp'], 1616, 'netbill-prod'),
-        'netbill-trans': Service(PROTOCOLS['udp'], 1612, 'netbill-trans'),
-        'netbios-dgm': Service(PROTOCOLS['udp'], 138, 'netbios-dgm'),
-        'netbios-ns': Service(PROTOCOLS['udp'], 137, 'netbios-ns'),
-        'netbios-ssn': Service(PROTOCOLS['udp'], 139, 'netbios-ssn'),
-        'netblox': Service(PROTOCOLS['udp'], 4441, 'netblox'),
-        'netbookmark': Service(PROTOCOLS['udp'], 3131, 'netbookmark'),
-        'netboot-pxe': Service(PROTOCOLS['udp'], 3928, 'netboot-pxe'),
-        'netcelera': Service(PROTOCOLS['udp'], 3701, 'netcelera'),
-        'netchat': Service(PROTOCOLS['udp'], 2451, 'netchat'),
-        'netcheque': Service(PROTOCOLS['udp'], 4008, 'netcheque'),
-        'netclip': Service(PROTOCOLS['udp'], 2971, 'netclip'),
-        'netcomm2': Service(PROTOCOLS['udp'], 1676, 'netcomm2'),
-        'netconf-beep': Service(PROTOCOLS['udp'], 831, 'netconf-beep'),
-        'netconf-ssh': Service(PROTOCOLS['udp'], 830, 'netconf-ssh'),
-        'netconfsoapbeep': Service(PROTOCOLS['udp'], 833, 'netconfsoapbeep'),
-        'netconfsoaphttp': Service(PROTOCOLS['udp'], 832, 'netconfsoaphttp'),
-        'netcp': Service(PROTOCOLS['udp'], 395, 'netcp'),
-        'netdb-export': Service(PROTOCOLS['udp'], 1329, 'netdb-export'),
-        'neteh': Service(PROTOCOLS['udp'], 3828, 'neteh'),
-        'neteh-ext': Service(PROTOCOLS['udp'], 3829, 'neteh-ext'),
-        'netgw': Service(PROTOCOLS['udp'], 741, 'netgw'),
-        'netinfo-local': Service(PROTOCOLS['udp'], 1033, 'netinfo-local'),
-        'netiq': Service(PROTOCOLS['udp'], 2220, 'netiq'),
-        'netiq-endpoint': Service(PROTOCOLS['udp'], 10113, 'netiq-endpoint'),
-        'netiq-endpt': Service(PROTOCOLS['udp'], 10115, 'netiq-endpt'),
-        'netiq-mc': Service(PROTOCOLS['udp'], 2735, 'netiq-mc'),
-        'netiq-ncap': Service(PROTOCOLS['udp'], 2219, 'netiq-ncap'),
-        'netiq-qcheck': Service(PROTOCOLS['udp'], 10114, 'netiq-qcheck'),
-        'netiq-voipa': Service(PROTOCOLS['udp'], 10116, 'netiq-voipa'),
-        'netlabs-lm': Service(PROTOCOLS['udp'], 1406, 'netlabs-lm'),
-        'netmagic': Service(PROTOCOLS['udp'], 1196, 'netmagic'),
-        'netmap-lm': Service(PROTOCOLS['udp'], 1493, 'netmap-lm'),
-        'netmap_lm': Service(PROTOCOLS['udp'], 1493, 'netmap_lm'),
-        'netml': Service(PROTOCOLS['udp'], 2288, 'netml'),
-        'netmo-default': Service(PROTOCOLS['udp'], 6841, 'netmo-default'),
-        'netmo-http': Service(PROTOCOLS['udp'], 6842, 'netmo-http'),
-        'netmon': Service(PROTOCOLS['udp'], 2606, 'netmon'),
-        'netmount': Service(PROTOCOLS['udp'], 2061, 'netmount'),
-        'netmpi': Service(PROTOCOLS['udp'], 3827, 'netmpi'),
-        'netnews': Service(PROTOCOLS['udp'], 532, 'netnews'),
-        'neto-dcs': Service(PROTOCOLS['udp'], 3814, 'neto-dcs'),
-        'neto-wol-server': Service(PROTOCOLS['udp'], 3812, 'neto-wol-server'),
-        'netobjects1': Service(PROTOCOLS['udp'], 2485, 'netobjects1'),
-        'netobjects2': Service(PROTOCOLS['udp'], 2486, 'netobjects2'),
-        'netop-rc': Service(PROTOCOLS['udp'], 1970, 'netop-rc'),
-        'netop-school': Service(PROTOCOLS['udp'], 1971, 'netop-school'),
-        'netopia-vo1': Service(PROTOCOLS['udp'], 1839, 'netopia-vo1'),
-        'netopia-vo2': Service(PROTOCOLS['udp'], 1840, 'netopia-vo2'),
-        'netopia-vo3': Service(PROTOCOLS['udp'], 1841, 'netopia-vo3'),
-        'netopia-vo4': Service(PROTOCOLS['udp'], 1842, 'netopia-vo4'),
-        'netopia-vo5': Service(PROTOCOLS['udp'], 1843, 'netopia-vo5'),
-        'netops-broker': Service(PROTOCOLS['udp'], 5465, 'netops-broker'),
-        'netplan': Service(PROTOCOLS['udp'], 2983, 'netplan'),
-        'netplay-port1': Service(PROTOCOLS['udp'], 3640, 'netplay-port1'),
-        'netplay-port2': Service(PROTOCOLS['udp'], 3641, 'netplay-port2'),
-        'netport-id': Service(PROTOCOLS['udp'], 3129, 'netport-id'),
-        'netrcs': Service(PROTOCOLS['udp'], 742, 'netrcs'),
-        'netrek': Service(PROTOCOLS['udp'], 2592, 'netrek'),
-        'netrisk': Service(PROTOCOLS['udp'], 1799, 'netrisk'),
-        'netrix-sftm': Service(PROTOCOLS['udp'], 2328, 'netrix-sftm'),
-        'netrjs-1': Service(PROTOCOLS['udp'], 71, 'netrjs-1'),
-        'netrjs-2': Service(PROTOCOLS['udp'], 72, 'netrjs-2'),
-        'netrjs-3': Service(PROTOCOLS['udp'], 73, 'netrjs-3'),
-        'netrjs-4': Service(PROTOCOLS['udp'], 74, 'netrjs-4'),
-        'netrockey6': Service(PROTOCOLS['udp'], 4425, 'netrockey6'),
-        'netsc-dev': Service(PROTOCOLS['udp'], 155, 'netsc-dev'),
-        'netsc-prod': Service(PROTOCOLS['udp'], 154, 'netsc-prod'),
-        'netscript': Service(PROTOCOLS['udp'], 4118, 'netscript'),
-        'netserialext1': Service(PROTOCOLS['udp'], 16360, 'netserialext1'),
-        'netserialext2': Service(PROTOCOLS['udp'], 16361, 'netserialext2'),
-        'netserialext3': Service(PROTOCOLS['udp'], 16367, 'netserialext3'),
-        'netserialext4': Service(PROTOCOLS['udp'], 16368, 'netserialext4'),
-        'netspeak-acd': Service(PROTOCOLS['udp'], 21848, 'netspeak-acd'),
-        'netspeak-cps': Service(PROTOCOLS['udp'], 21849, 'netspeak-cps'),
-        'netspeak-cs': Service(PROTOCOLS['udp'], 21847, 'netspeak-cs'),
-        'netspeak-is': Service(PROTOCOLS['udp'], 21846, 'netspeak-is'),
-        'netsteward': Service(PROTOCOLS['udp'], 2810, 'netsteward'),
-        'netsupport': Service(PROTOCOLS['udp'], 5405, 'netsupport'),
-        'netsupport2': Service(PROTOCOLS['udp'], 5421, 'netsupport2'),
-        'nettest': Service(PROTOCOLS['udp'], 4138, 'nettest'),
-        'nettgain-nms': Service(PROTOCOLS['udp'], 1879, 'nettgain-nms'),
-        'netuitive': Service(PROTOCOLS['udp'], 1286, 'netuitive'),
-        'netview-aix-1': Service(PROTOCOLS['udp'], 1661, 'netview-aix-1'),
-        'netview-aix-10': Service(PROTOCOLS['udp'], 1670, 'netview-aix-10'),
-        'netview-aix-11': Service(PROTOCOLS['udp'], 1671, 'netview-aix-11'),
-        'netview-aix-12': Service(PROTOCOLS['udp'], 1672, 'netview-aix-12'),
-        'netview-aix-2': Service(PROTOCOLS['udp'], 1662, 'netview-aix-2'),
-        'netview-aix-3': Service(PROTOCOLS['udp'], 1663, 'netview-aix-3'),
-        'netview-aix-4': Service(PROTOCOLS['udp'], 1664, 'netview-aix-4'),
-        'netview-aix-5': Service(PROTOCOLS['udp'], 1665, 'netview-aix-5'),
-        'netview-aix-6': Service(PROTOCOLS['udp'], 1666, 'netview-aix-6'),
-        'netview-aix-7': Service(PROTOCOLS['udp'], 1667, 'netview-aix-7'),
-        'netview-aix-8': Service(PROTOCOLS['udp'], 1668, 'netview-aix-8'),
-        'netview-aix-9': Service(PROTOCOLS['udp'], 1669, 'netview-aix-9'),
-        'netviewdm1': Service(PROTOCOLS['udp'], 729, 'netviewdm1'),
-        'netviewdm2': Service(PROTOCOLS['udp'], 730, 'netviewdm2'),
-        'netviewdm3': Service(PROTOCOLS['udp'], 731, 'netviewdm3'),
-        'netwall': Service(PROTOCOLS['udp'], 533, 'netwall'),
-        'netware-csp': Service(PROTOCOLS['udp'], 1366, 'netware-csp'),
-        'netware-ip': Service(PROTOCOLS['udp'], 396, 'netware-ip'),
-        'netwatcher-db': Service(PROTOCOLS['udp'], 3204, 'netwatcher-db'),
-        'netwatcher-mon': Service(PROTOCOLS['udp'], 3203, 'netwatcher-mon'),
-        'netwave-ap-mgmt': Service(PROTOCOLS['udp'], 2411, 'netwave-ap-mgmt'),
-        'netwkpathengine': Service(PROTOCOLS['udp'], 3209, 'netwkpathengine'),
-        'networklens': Service(PROTOCOLS['udp'], 3409, 'networklens'),
-        'networklenss': Service(PROTOCOLS['udp'], 3410, 'networklenss'),
-        'netx-agent': Service(PROTOCOLS['udp'], 2586, 'netx-agent'),
-        'netx-server': Service(PROTOCOLS['udp'], 2585, 'netx-server'),
-        'netxms-agent': Service(PROTOCOLS['udp'], 4700, 'netxms-agent'),
-        'netxms-mgmt': Service(PROTOCOLS['udp'], 4701, 'netxms-mgmt'),
-        'netxms-sync': Service(PROTOCOLS['udp'], 4702, 'netxms-sync'),
-        'neveroffline': Service(PROTOCOLS['udp'], 2614, 'neveroffline'),
-        'new-rwho': Service(PROTOCOLS['udp'], 550, 'new-rwho'),
-        'newbay-snc-mc': Service(PROTOCOLS['udp'], 16900, 'newbay-snc-mc'),
-        'newgenpay': Service(PROTOCOLS['udp'], 3165, 'newgenpay'),
-        'newheights': Service(PROTOCOLS['udp'], 2114, 'newheights'),
-        'newlixconfig': Service(PROTOCOLS['udp'], 2076, 'newlixconfig'),
-        'newlixengine': Service(PROTOCOLS['udp'], 2075, 'newlixengine'),
-        'newlixreg': Service(PROTOCOLS['udp'], 2671, 'newlixreg'),
-        'newoak': Service(PROTOCOLS['udp'], 4001, 'newoak'),
-        'newwavesearch': Service(PROTOCOLS['udp'], 2058, 'newwavesearch'),
-        'nexgen': Service(PROTOCOLS['udp'], 6627, 'nexgen'),
-        'nexgen-aux': Service(PROTOCOLS['udp'], 6629, 'nexgen-aux'),
-        'nexstorindltd': Service(PROTOCOLS['udp'], 2360, 'nexstorindltd'),
-        'nextstep': Service(PROTOCOLS['udp'], 178, 'nextstep'),
-        'nexus-portal': Service(PROTOCOLS['udp'], 4021, 'nexus-portal'),
-        'nfa': Service(PROTOCOLS['udp'], 1155, 'nfa'),
-        'nfoldman': Service(PROTOCOLS['udp'], 7393, 'nfoldman'),
-        'nfs': Service(PROTOCOLS['udp'], 2049, 'nfs'),
-        'nfsd-keepalive': Service(PROTOCOLS['udp'], 1110, 'nfsd-keepalive'),
-        'nfsrdma': Service(PROTOCOLS['udp'], 20049, 'nfsrdma'),
-        'ng-umds': Service(PROTOCOLS['udp'], 1690, 'ng-umds'),
-        'ngr-t': Service(PROTOCOLS['udp'], 1528, 'ngr-t'),
-        'nhci': Service(PROTOCOLS['udp'], 3842, 'nhci'),
-        'nhserver': Service(PROTOCOLS['udp'], 2672, 'nhserver'),
-        'ni-visa-remote': Service(PROTOCOLS['udp'], 3537, 'ni-visa-remote'),
-        'nicelink': Service(PROTOCOLS['udp'], 1095, 'nicelink'),
-        'nicetec-mgmt': Service(PROTOCOLS['udp'], 2557, 'nicetec-mgmt'),
-        'nicetec-nmsvc': Service(PROTOCOLS['udp'], 2556, 'nicetec-nmsvc'),
-        'nicname': Service(PROTOCOLS['udp'], 43, 'nicname'),
-        'nifty-hmi': Service(PROTOCOLS['udp'], 4134, 'nifty-hmi'),
-        'nilinkanalyst': Service(PROTOCOLS['udp'], 25902, 'nilinkanalyst'),
-        'nim': Service(PROTOCOLS['udp'], 1058, 'nim'),
-        'nim-vdrshell': Service(PROTOCOLS['udp'], 6420, 'nim-vdrshell'),
-        'nim-wan': Service(PROTOCOLS['udp'], 6421, 'nim-wan'),
-        'nimaux': Service(PROTOCOLS['udp'], 3902, 'nimaux'),
-        'nimcontroller': Service(PROTOCOLS['udp'], 48000, 'nimcontroller'),
-        'nimgtw': Service(PROTOCOLS['udp'], 48003, 'nimgtw'),
-        'nimhub': Service(PROTOCOLS['udp'], 48002, 'nimhub'),
-        'nimreg': Service(PROTOCOLS['udp'], 1059, 'nimreg'),
-        'nimrod-agent': Service(PROTOCOLS['udp'], 1617, 'nimrod-agent'),
-        'nimsh': Service(PROTOCOLS['udp'], 3901, 'nimsh'),
-        'nimspooler': Service(PROTOCOLS['udp'], 48001, 'nimspooler'),
-        'ninaf': Service(PROTOCOLS['udp'], 5627, 'ninaf'),
-        'niobserver': Service(PROTOCOLS['udp'], 25901, 'niobserver'),
-        'nip': Service(PROTOCOLS['udp'], 376, 'nip'),
-        'niprobe': Service(PROTOCOLS['udp'], 25903, 'niprobe'),
-        'nirp': Service(PROTOCOLS['udp'], 4043, 'nirp'),
-        'nitrogen': Service(PROTOCOLS['udp'], 7725, 'nitrogen'),
-        'njenet-ssl': Service(PROTOCOLS['udp'], 2252, 'njenet-ssl'),
-        'nkd': Service(PROTOCOLS['udp'], 1650, 'nkd'),
-        'nlg-data': Service(PROTOCOLS['udp'], 5299, 'nlg-data'),
-        'nlogin': Service(PROTOCOLS['udp'], 758, 'nlogin'),
-        'nls-tl': Service(PROTOCOLS['udp'], 7549, 'nls-tl'),
-        'nm-asses-admin': Service(PROTOCOLS['udp'], 3150, 'nm-asses-admin'),
-        'nm-assessor': Service(PROTOCOLS['udp'], 3151, 'nm-assessor'),
-        'nm-game-admin': Service(PROTOCOLS['udp'], 3148, 'nm-game-admin'),
-        'nm-game-server': Service(PROTOCOLS['udp'], 3149, 'nm-game-server'),
-        'nmap': Service(PROTOCOLS['udp'], 689, 'nmap'),
-        'nmasoverip': Service(PROTOCOLS['udp'], 1242, 'nmasoverip'),
-        'nmc-disc': Service(PROTOCOLS['udp'], 10810, 'nmc-disc'),
-        'nmea-0183': Service(PROTOCOLS['udp'], 10110, 'nmea-0183'),
-        'nmea-onenet': Service(PROTOCOLS['udp'], 10111, 'nmea-onenet'),
-        'nmmp': Service(PROTOCOLS['udp'], 3649, 'nmmp'),
-        'nms': Service(PROTOCOLS['udp'], 1429, 'nms'),
-        'nms-dpnss': Service(PROTOCOLS['udp'], 2503, 'nms-dpnss'),
-        'nms-topo-serv': Service(PROTOCOLS['udp'], 1486, 'nms-topo-serv'),
-        'nms_topo_serv': Service(PROTOCOLS['udp'], 1486, 'nms_topo_serv'),
-        'nmsd': Service(PROTOCOLS['udp'], 1239, 'nmsd'),
-        'nmsigport': Service(PROTOCOLS['udp'], 2839, 'nmsigport'),
-        'nmsp': Service(PROTOCOLS['udp'], 1790, 'nmsp'),
-        'nmsserver': Service(PROTOCOLS['udp'], 2244, 'nmsserver'),
-        'nnp': Service(PROTOCOLS['udp'], 3780, 'nnp'),
-        'nnsp': Service(PROTOCOLS['udp'], 433, 'nnsp'),
-        'nntp': Service(PROTOCOLS['udp'], 119, 'nntp'),
-        'nntps': Service(PROTOCOLS['udp'], 563, 'nntps'),
-        'noaaport': Service(PROTOCOLS['udp'], 2210, 'noaaport'),
-        'noadmin': Service(PROTOCOLS['udp'], 1921, 'noadmin'),
-        'noagent': Service(PROTOCOLS['udp'], 1917, 'noagent'),
-        'nod-client': Service(PROTOCOLS['udp'], 8981, 'nod-client'),
-        'nod-provider': Service(PROTOCOLS['udp'], 8980, 'nod-provider'),
-        'nokia-ann-ch1': Service(PROTOCOLS['udp'], 3405, 'nokia-ann-ch1'),
-        'nokia-ann-ch2': Service(PROTOCOLS['udp'], 3406, 'nokia-ann-ch2'),
-        'nomdb': Service(PROTOCOLS['udp'], 13786, 'nomdb'),
-        'norton-lambert': Service(PROTOCOLS['udp'], 2338, 'norton-lambert'),
-        'notateit-disc': Service(PROTOCOLS['udp'], 4803, 'notateit-disc'),
-        'noteit': Service(PROTOCOLS['udp'], 4663, 'noteit'),
-        'noteshare': Service(PROTOCOLS['udp'], 8474, 'noteshare'),
-        'notify': Service(PROTOCOLS['udp'], 773, 'notify'),
-        'notify-srvr': Service(PROTOCOLS['udp'], 3016, 'notify-srvr'),
-        'notify_srvr': Service(PROTOCOLS['udp'], 3016, 'notify_srvr'),
-        'novar-alarm': Service(PROTOCOLS['udp'], 23401, 'novar-alarm'),
-        'novar-dbase': Service(PROTOCOLS['udp'], 23400, 'novar-dbase'),
-        'novar-global': Service(PROTOCOLS['udp'], 23402, 'novar-global'),
-        'novastorbakcup': Service(PROTOCOLS['udp'], 308, 'novastorbakcup'),
-        'novation': Service(PROTOCOLS['udp'], 1322, 'novation'),
-        'novell-ipx-cmd': Service(PROTOCOLS['udp'], 2645, 'novell-ipx-cmd'),
-        'novell-lu6-2': Service(PROTOCOLS['udp'], 1416, 'novell-lu6-2'),
-        'novell-lu6.2': Service(PROTOCOLS['udp'], 1416, 'novell-lu6.2'),
-        'novell-zen': Service(PROTOCOLS['udp'], 2544, 'novell-zen'),
-        'nowcontact': Service(PROTOCOLS['udp'], 3167, 'nowcontact'),
-        'npdbgmngr': Service(PROTOCOLS['udp'], 2293, 'npdbgmngr'),
-        'npds-tracker': Service(PROTOCOLS['udp'], 3680, 'npds-tracker'),
-        'npep-messaging': Service(PROTOCOLS['udp'], 2868, 'npep-messaging'),
-        'npmp': Service(PROTOCOLS['udp'], 8450, 'npmp'),
-        'npmp-gui': Service(PROTOCOLS['udp'], 611, 'npmp-gui'),
-        'npmp-local': Service(PROTOCOLS['udp'], 610, 'npmp-local'),
-        'npmp-trap': Service(PROTOCOLS['udp'], 609, 'npmp-trap'),
-        'npp': Service(PROTOCOLS['udp'], 4045, 'npp'),
-        'nppmp': Service(PROTOCOLS['udp'], 3476, 'nppmp'),
-        'nqs': Service(PROTOCOLS['udp'], 607, 'nqs'),
-        'nrcabq-lm': Service(PROTOCOLS['udp'], 1458, 'nrcabq-lm'),
-        'ns': Service(PROTOCOLS['udp'], 760, 'ns'),
-        'ns-cfg-server': Service(PROTOCOLS['udp'], 3266, 'ns-cfg-server'),
-        'ns-server': Service(PROTOCOLS['udp'], 5415, 'ns-server'),
-        'nsc-ccs': Service(PROTOCOLS['udp'], 2604, 'nsc-ccs'),
-        'nsc-posa': Service(PROTOCOLS['udp'], 2605, 'nsc-posa'),
-        'nsdeepfreezectl': Service(PROTOCOLS['udp'], 7724, 'nsdeepfreezectl'),
-        'nsiiops': Service(PROTOCOLS['udp'], 261, 'nsiiops'),
-        'nsjtp-ctrl': Service(PROTOCOLS['udp'], 1687, 'nsjtp-ctrl'),
-        'nsjtp-data': Service(PROTOCOLS['udp'], 1688, 'nsjtp-data'),
-        'nsp': Service(PROTOCOLS['udp'], 5012, 'nsp'),
-        'nsrmp': Service(PROTOCOLS['udp'], 359, 'nsrmp'),
-        'nsrp': Service(PROTOCOLS['udp'], 7170, 'nsrp'),
-        'nss': Service(PROTOCOLS['udp'], 4159, 'nss'),
-        'nss-routing': Service(PROTOCOLS['udp'], 159, 'nss-routing'),
-        'nssagentmgr': Service(PROTOCOLS['udp'], 4454, 'nssagentmgr'),
-        'nssalertmgr': Service(PROTOCOLS['udp'], 4453, 'nssalertmgr'),
-        'nssocketport': Service(PROTOCOLS['udp'], 3522, 'nssocketport'),
-        'nsstp': Service(PROTOCOLS['udp'], 1036, 'nsstp'),
-        'nst': Service(PROTOCOLS['udp'], 4687, 'nst'),
-        'nsw-fe': Service(PROTOCOLS['udp'], 27, 'nsw-fe'),
-        'nsws': Service(PROTOCOLS['udp'], 3049, 'nsws'),
-        'nta-ds': Service(PROTOCOLS['udp'], 7544, 'nta-ds'),
-        'nta-us': Service(PROTOCOLS['udp'], 7545, 'nta-us'),
-        'ntalk': Service(PROTOCOLS['udp'], 518, 'ntalk'),
-        'ntp': Service(PROTOCOLS['udp'], 123, 'ntp'),
-        'nuauth': Service(PROTOCOLS['udp'], 4129, 'nuauth'),
-        'nucleus': Service(PROTOCOLS['udp'], 1463, 'nucleus'),
-        'nucleus-sand': Service(PROTOCOLS['udp'], 1201, 'nucleus-sand'),
-        'nufw': Service(PROTOCOLS['udp'], 4128, 'nufw'),
-        'nupaper-ss': Service(PROTOCOLS['udp'], 12121, 'nupaper-ss'),
-        'nusdp-disc': Service(PROTOCOLS['udp'], 49001, 'nusdp-disc'),
-        'nut': Service(PROTOCOLS['udp'], 3493, 'nut'),
-        'nuts-bootp': Service(PROTOCOLS['udp'], 4133, 'nuts-bootp'),
-        'nuts-dem': Service(PROTOCOLS['udp'], 4132, 'nuts-dem'),
-        'nuts_bootp': Service(PROTOCOLS['udp'], 4133, 'nuts_bootp'),
-        'nuts_dem': Service(PROTOCOLS['udp'], 4132, 'nuts_dem'),
-        'nuxsl': Service(PROTOCOLS['udp'], 5991, 'nuxsl'),
-        'nv-video': Service(PROTOCOLS['udp'], 4444, 'nv-video'),
-        'nvcnet': Service(PROTOCOLS['udp'], 3999, 'nvcnet'),
-        'nvd': Service(PROTOCOLS['udp'], 2329, 'nvd'),
-        'nvm-express': Service(PROTOCOLS['udp'], 4420, 'nvm-express'),
-        'nw-license': Service(PROTOCOLS['udp'], 3697, 'nw-license'),
-        'nxedit': Service(PROTOCOLS['udp'], 126, 'nxedit'),
-        'nxlmd': Service(PROTOCOLS['udp'], 28000, 'nxlmd'),
-        'o2server-port': Service(PROTOCOLS['udp'], 1894, 'o2server-port'),
-        'oa-system': Service(PROTOCOLS['udp'], 8022, 'oa-system'),
-        'obex': Service(PROTOCOLS['udp'], 650, 'obex'),
-        'objcall': Service(PROTOCOLS['udp'], 94, 'objcall'),
-        'objective-dbc': Service(PROTOCOLS['udp'], 1388, 'objective-dbc'),
-        'objectmanager': Service(PROTOCOLS['udp'], 2038, 'objectmanager'),
-        'obrpd': Service(PROTOCOLS['udp'], 1092, 'obrpd'),
-        'oc-lm': Service(PROTOCOLS['udp'], 1448, 'oc-lm'),
-        'ocbinder': Service(PROTOCOLS['udp'], 183, 'ocbinder'),
-        'oce-snmp-trap': Service(PROTOCOLS['udp'], 2697, 'oce-snmp-trap'),
-        'oceansoft-lm': Service(PROTOCOLS['udp'], 1466, 'oceansoft-lm'),
-        'ocs-amu': Service(PROTOCOLS['udp'], 429, 'ocs-amu'),
-        'ocs-cmu': Service(PROTOCOLS['udp'], 428, 'ocs-cmu'),
-        'ocs_amu': Service(PROTOCOLS['udp'], 429, 'ocs_amu'),
-        'ocs_cmu': Service(PROTOCOLS['udp'], 428, 'ocs_cmu'),
-        'ocserver': Service(PROTOCOLS['udp'], 184, 'ocserver'),
-        'octopus': Service(PROTOCOLS['udp'], 10008, 'octopus'),
-        'odbcpathway': Service(PROTOCOLS['udp'], 9628, 'odbcpathway'),
-        'odette-ftp': Service(PROTOCOLS['udp'], 3305, 'odette-ftp'),
-        'odette-ftps': Service(PROTOCOLS['udp'], 6619, 'odette-ftps'),
-        'odeumservlink': Service(PROTOCOLS['udp'], 3523, 'odeumservlink'),
-        'odi-port': Service(PROTOCOLS['udp'], 3187, 'odi-port'),
-        'odmr': Service(PROTOCOLS['udp'], 366, 'odmr'),
-        'odn-castraq': Service(PROTOCOLS['udp'], 2498, 'odn-castraq'),
-        'odnsp': Service(PROTOCOLS['udp'], 9966, 'odnsp'),
-        'odsi': Service(PROTOCOLS['udp'], 1308, 'odsi'),
-        'oem-agent': Service(PROTOCOLS['udp'], 3872, 'oem-agent'),
-        'office-tools': Service(PROTOCOLS['udp'], 7789, 'office-tools'),
-        'officelink2000': Service(PROTOCOLS['udp'], 3320, 'officelink2000'),
-        'ofsd': Service(PROTOCOLS['udp'], 2322, 'ofsd'),
-        'ogs-client': Service(PROTOCOLS['udp'], 9007, 'ogs-client'),
-        'ohimsrv': Service(PROTOCOLS['udp'], 506, 'ohimsrv'),
-        'ohmtrigger': Service(PROTOCOLS['udp'], 4732, 'ohmtrigger'),
-        'ohsc': Service(PROTOCOLS['udp'], 18186, 'ohsc'),
-        'oi-2000': Service(PROTOCOLS['udp'], 2364, 'oi-2000'),
-        'oidocsvc': Service(PROTOCOLS['udp'], 4142, 'oidocsvc'),
-        'oidsr': Service(PROTOCOLS['udp'], 4143, 'oidsr'),
-        'oirtgsvc': Service(PROTOCOLS['udp'], 4141, 'oirtgsvc'),
-        'olhost': Service(PROTOCOLS['udp'], 2661, 'olhost'),
-        'olsr': Service(PROTOCOLS['udp'], 698, 'olsr'),
-        'olsv': Service(PROTOCOLS['udp'], 1160, 'olsv'),
-        'oma-dcdocbs': Service(PROTOCOLS['udp'], 7278, 'oma-dcdocbs'),
-        'oma-ilp': Service(PROTOCOLS['udp'], 7276, 'oma-ilp'),
-        'oma-ilp-s': Service(PROTOCOLS['udp'], 7277, 'oma-ilp-s'),
-        'oma-mlp': Service(PROTOCOLS['udp'], 9210, 'oma-mlp'),
-        'oma-mlp-s': Service(PROTOCOLS['udp'], 9211, 'oma-mlp-s'),
-        'oma-rlp': Service(PROTOCOLS['udp'], 7273, 'oma-rlp'),
-        'oma-rlp-s': Service(PROTOCOLS['udp'], 7274, 'oma-rlp-s'),
-        'oma-ulp': Service(PROTOCOLS['udp'], 7275, 'oma-ulp'),
-        'omabcastltkm': Service(PROTOCOLS['udp'], 4359, 'omabcastltkm'),
-        'omasgport': Service(PROTOCOLS['udp'], 4090, 'omasgport'),
-        'omginitialrefs': Service(PROTOCOLS['udp'], 900, 'omginitialrefs'),
-        'omhs': Service(PROTOCOLS['udp'], 5723, 'omhs'),
-        'omnilink-port': Service(PROTOCOLS['udp'], 3904, 'omnilink-port'),
-        'omnisky': Service(PROTOCOLS['udp'], 2056, 'omnisky'),
-        'omnivision': Service(PROTOCOLS['udp'], 1135, 'omnivision'),
-        'omnivisionesx': Service(PROTOCOLS['udp'], 4395, 'omnivisionesx'),
-        'oms': Service(PROTOCOLS['udp'], 4662, 'oms'),
-        'oms-nonsecure': Service(PROTOCOLS['udp'], 5102, 'oms-nonsecure'),
-        'omscontact': Service(PROTOCOLS['udp'], 4161, 'omscontact'),
-        'omsdk': Service(PROTOCOLS['udp'], 5724, 'omsdk'),
-        'omserv': Service(PROTOCOLS['udp'], 764, 'omserv'),
-        'omstopology': Service(PROTOCOLS['udp'], 4162, 'omstopology'),
-        'onbase-dds': Service(PROTOCOLS['udp'], 2185, 'onbase-dds'),
-        'onehome-help': Service(PROTOCOLS['udp'], 2199, 'onehome-help'),
-        'onehome-remote': Service(PROTOCOLS['udp'], 2198, 'onehome-remote'),
-        'onesaf': Service(PROTOCOLS['udp'], 3244, 'onesaf'),
-        'onmux': Service(PROTOCOLS['udp'], 417, 'onmux'),
-        'onpsocket': Service(PROTOCOLS['udp'], 5014, 'onpsocket'),
-        'onscreen': Service(PROTOCOLS['udp'], 5080, 'onscreen'),
-        'ontime': Service(PROTOCOLS['udp'], 1622, 'ontime'),
-        'ontobroker': Service(PROTOCOLS['udp'], 2267, 'ontobroker'),
-        'op-probe': Service(PROTOCOLS['udp'], 7030, 'op-probe'),
-        'opalis-rbt-ipc': Service(PROTOCOLS['udp'], 5314, 'opalis-rbt-ipc'),
-        'opalis-rdv': Service(PROTOCOLS['udp'], 536, 'opalis-rdv'),
-        'opalis-robot': Service(PROTOCOLS['udp'], 314, 'opalis-robot'),
-        'opc-job-start': Service(PROTOCOLS['udp'], 423, 'opc-job-start'),
-        'opc-job-track': Service(PROTOCOLS['udp'], 424, 'opc-job-track'),
-        'opcon-xps': Service(PROTOCOLS['udp'], 3100, 'opcon-xps'),
-        'opcua-tls': Service(PROTOCOLS['udp'], 4843, 'opcua-tls'),
-        'opcua-udp': Service(PROTOCOLS['udp'], 4840, 'opcua-udp'),
-        'opencm': Service(PROTOCOLS['udp'], 3434, 'opencm'),
-        'opencore': Service(PROTOCOLS['udp'], 4089, 'opencore'),
-        'opendeploy': Service(PROTOCOLS['udp'], 20014, 'opendeploy'),
-        'openflow': Service(PROTOCOLS['udp'], 6653, 'openflow'),
-        'openhpid': Service(PROTOCOLS['udp'], 4743, 'openhpid'),
-        'openmail': Service(PROTOCOLS['udp'], 5729, 'openmail'),
-        'openmailg': Service(PROTOCOLS['udp'], 5755, 'openmailg'),
-        'openmailns': Service(PROTOCOLS['udp'], 5766, 'openmailns'),
-        'openmailpxy': Service(PROTOCOLS['udp'], 5768, 'openmailpxy'),
-        'openmath': Service(PROTOCOLS['udp'], 1473, 'openmath'),
-        'opennl': Service(PROTOCOLS['udp'], 1258, 'opennl'),
-        'opennl-voice': Service(PROTOCOLS['udp'], 1259, 'opennl-voice'),
-        'openport': Service(PROTOCOLS['udp'], 260, 'openport'),
-        'openqueue': Service(PROTOCOLS['udp'], 8764, 'openqueue'),
-        'opentable': Service(PROTOCOLS['udp'], 2368, 'opentable'),
-        'opentrac': Service(PROTOCOLS['udp'], 3855, 'opentrac'),
-        'openvms-sysipc': Service(PROTOCOLS['udp'], 557, 'openvms-sysipc'),
-        'openvpn': Service(PROTOCOLS['udp'], 1194, 'openvpn'),
-        'openwebnet': Service(PROTOCOLS['udp'], 20005, 'openwebnet'),
-        'opequus-server': Service(PROTOCOLS['udp'], 2400, 'opequus-server'),
-        'opi-sock': Service(PROTOCOLS['udp'], 7429, 'opi-sock'),
-        'opnet-smp': Service(PROTOCOLS['udp'], 3433, 'opnet-smp'),
-        'opsec-cvp': Service(PROTOCOLS['udp'], 18181, 'opsec-cvp'),
-        'opsec-ela': Service(PROTOCOLS['udp'], 18187, 'opsec-ela'),
-        'opsec-lea': Service(PROTOCOLS['udp'], 18184, 'opsec-lea'),
-        'opsec-omi': Service(PROTOCOLS['udp'], 18185, 'opsec-omi'),
-        'opsec-sam': Service(PROTOCOLS['udp'], 18183, 'opsec-sam'),
-        'opsec-uaa': Service(PROTOCOLS['udp'], 19191, 'opsec-uaa'),
-        'opsec-ufp': Service(PROTOCOLS['udp'], 18182, 'opsec-ufp'),
-        'opsession-clnt': Service(PROTOCOLS['udp'], 3303, 'opsession-clnt'),
-        'opsession-prxy': Service(PROTOCOLS['udp'], 3307, 'opsession-prxy'),
-        'opsession-srvr': Service(PROTOCOLS['udp'], 3304, 'opsession-srvr'),
-        'opsmgr': Service(PROTOCOLS['udp'], 1270, 'opsmgr'),
-        'opsview-envoy': Service(PROTOCOLS['udp'], 4125, 'opsview-envoy'),
-        'opswagent': Service(PROTOCOLS['udp'], 3976, 'opswagent'),
-        'opswmanager': Service(PROTOCOLS['udp'], 3977, 'opswmanager'),
-        'optech-port1-lm': Service(PROTOCOLS['udp'], 2237, 'optech-port1-lm'),
-        'optika-emedia': Service(PROTOCOLS['udp'], 1829, 'optika-emedia'),
-        'optilogic': Service(PROTOCOLS['udp'], 2435, 'optilogic'),
-        'optima-vnet': Service(PROTOCOLS['udp'], 1051, 'optima-vnet'),
-        'optiwave-lm': Service(PROTOCOLS['udp'], 2524, 'optiwave-lm'),
-        'optocontrol': Service(PROTOCOLS['udp'], 22001, 'optocontrol'),
-        'optohost002': Service(PROTOCOLS['udp'], 22002, 'optohost002'),
-        'optohost003': Service(PROTOCOLS['udp'], 22003, 'optohost003'),
-        'optohost004': Service(PROTOCOLS['udp'], 22005, 'optohost004'),
-        'opus-services': Service(PROTOCOLS['udp'], 3718, 'opus-services'),
-        'ora-lm': Service(PROTOCOLS['udp'], 1446, 'ora-lm'),
-        'oracle': Service(PROTOCOLS['udp'], 2005, 'oracle'),
-        'oracle-em1': Service(PROTOCOLS['udp'], 1748, 'oracle-em1'),
-        'oracle-em2': Service(PROTOCOLS['udp'], 1754, 'oracle-em2'),
-        'oracle-oms': Service(PROTOCOLS['udp'], 1159, 'oracle-oms'),
-        'oracle-vp1': Service(PROTOCOLS['udp'], 1809, 'oracle-vp1'),
-        'oracle-vp2': Service(PROTOCOLS['udp'], 1808, 'oracle-vp2'),
-        'oracleas-https': Service(PROTOCOLS['udp'], 7443, 'oracleas-https'),
-        'oraclenames': Service(PROTOCOLS['udp'], 1575, 'oraclenames'),
-        'oraclenet8cman': Service(PROTOCOLS['udp'], 1630, 'oraclenet8cman'),
-        'orasrv': Service(PROTOCOLS['udp'], 1525, 'orasrv'),
-        'orbiter': Service(PROTOCOLS['udp'], 2398, 'orbiter'),
-        'orbix-cfg-ssl': Service(PROTOCOLS['udp'], 3078, 'orbix-cfg-ssl'),
-        'orbix-config': Service(PROTOCOLS['udp'], 3076, 'orbix-config'),
-        'orbix-loc-ssl': Service(PROTOCOLS['udp'], 3077, 'orbix-loc-ssl'),
-        'orbix-locator': Service(PROTOCOLS['udp'], 3075, 'orbix-locator'),
-        'orbixd': Service(PROTOCOLS['udp'], 1570, 'orbixd'),
-        'orbplus-iiop': Service(PROTOCOLS['udp'], 1597, 'orbplus-iiop'),
-        'ordinox-dbase': Service(PROTOCOLS['udp'], 3355, 'ordinox-dbase'),
-        'ordinox-server': Service(PROTOCOLS['udp'], 3274, 'ordinox-server'),
-        'orion': Service(PROTOCOLS['udp'], 2407, 'orion'),
-        'orion-rmi-reg': Service(PROTOCOLS['udp'], 2413, 'orion-rmi-reg'),
-        'ortec-disc': Service(PROTOCOLS['udp'], 40853, 'ortec-disc'),
-        'os-licman': Service(PROTOCOLS['udp'], 1384, 'os-licman'),
-        'osaut': Service(PROTOCOLS['udp'], 6679, 'osaut'),
-        'osb-sd': Service(PROTOCOLS['udp'], 400, 'osb-sd'),
-        'osdcp': Service(PROTOCOLS['udp'], 3432, 'osdcp'),
-        'osm-appsrvr': Service(PROTOCOLS['udp'], 9990, 'osm-appsrvr'),
-        'osm-oev': Service(PROTOCOLS['udp'], 9991, 'osm-oev'),
-        'osmosis-aeea': Service(PROTOCOLS['udp'], 3034, 'osmosis-aeea'),
-        'ospf-lite': Service(PROTOCOLS['udp'], 8899, 'ospf-lite'),
-        'osu-nms': Service(PROTOCOLS['udp'], 192, 'osu-nms'),
-        'osvr': Service(PROTOCOLS['udp'], 7728, 'osvr'),
-        'otlp': Service(PROTOCOLS['udp'], 6951, 'otlp'),
-        'otmp': Service(PROTOCOLS['udp'], 29167, 'otmp'),
-        'otpatch': Service(PROTOCOLS['udp'], 2936, 'otpatch'),
-        'ott': Service(PROTOCOLS['udp'], 2428, 'ott'),
-        'ottp': Service(PROTOCOLS['udp'], 2951, 'ottp'),
-        'otv': Service(PROTOCOLS['udp'], 8472, 'otv'),
-        'outlaws': Service(PROTOCOLS['udp'], 5310, 'outlaws'),
-        'ov-nnm-websrv': Service(PROTOCOLS['udp'], 3443, 'ov-nnm-websrv'),
-        'ovalarmsrv': Service(PROTOCOLS['udp'], 2953, 'ovalarmsrv'),
-        'ovalarmsrv-cmd': Service(PROTOCOLS['udp'], 2954, 'ovalarmsrv-cmd'),
-        'ovbus': Service(PROTOCOLS['udp'], 7501, 'ovbus'),
-        'oveadmgr': Service(PROTOCOLS['udp'], 7427, 'oveadmgr'),
-        'ovhpas': Service(PROTOCOLS['udp'], 7510, 'ovhpas'),
-        'ovladmgr': Service(PROTOCOLS['udp'], 7428, 'ovladmgr'),
-        'ovobs': Service(PROTOCOLS['udp'], 30999, 'ovobs'),
-        'ovrimosdbman': Service(PROTOCOLS['udp'], 2956, 'ovrimosdbman'),
-        'ovsam-d-agent': Service(PROTOCOLS['udp'], 3870, 'ovsam-d-agent'),
-        'ovsam-mgmt': Service(PROTOCOLS['udp'], 3869, 'ovsam-mgmt'),
-        'ovsessionmgr': Service(PROTOCOLS['udp'], 2389, 'ovsessionmgr'),
-        'ovtopmd': Service(PROTOCOLS['udp'], 2532, 'ovtopmd'),
-        'ovwdb': Service(PROTOCOLS['udp'], 2447, 'ovwdb'),
-        'owamp-control': Service(PROTOCOLS['udp'], 861, 'owamp-control'),
-        'owserver': Service(PROTOCOLS['udp'], 4304, 'owserver'),
-        'p-net-local': Service(PROTOCOLS['udp'], 34378, 'p-net-local'),
-        'p-net-remote': Service(PROTOCOLS['udp'], 34379, 'p-net-remote'),
-        'p25cai': Service(PROTOCOLS['udp'], 6082, 'p25cai'),
-        'p2pcommunity': Service(PROTOCOLS['udp'], 3955, 'p2pcommunity'),
-        'p2pgroup': Service(PROTOCOLS['udp'], 3587, 'p2pgroup'),
-        'p2pq': Service(PROTOCOLS['udp'], 1981, 'p2pq'),
-        'p4p-portal': Service(PROTOCOLS['udp'], 6671, 'p4p-portal'),
-        'pacerforum': Service(PROTOCOLS['udp'], 1480, 'pacerforum'),
-        'pacmand': Service(PROTOCOLS['udp'], 1307, 'pacmand'),
-        'pacom': Service(PROTOCOLS['udp'], 3435, 'pacom'),
-        'padl2sim': Service(PROTOCOLS['udp'], 5236, 'padl2sim'),
-        'pafec-lm': Service(PROTOCOLS['udp'], 7511, 'pafec-lm'),
-        'paging-port': Service(PROTOCOLS['udp'], 3771, 'paging-port'),
-        'pago-services1': Service(PROTOCOLS['udp'], 30001, 'pago-services1'),
-        'pago-services2': Service(PROTOCOLS['udp'], 30002, 'pago-services2'),
-        'palace-1': Service(PROTOCOLS['udp'], 9992, 'palace-1'),
-        'palace-2': Service(PROTOCOLS['udp'], 9993, 'palace-2'),
-        'palace-3': Service(PROTOCOLS['udp'], 9994, 'palace-3'),
-        'palace-4': Service(PROTOCOLS['udp'], 9995, 'palace-4'),
-        'palace-5': Service(PROTOCOLS['udp'], 9996, 'palace-5'),
-        'palace-6': Service(PROTOCOLS['udp'], 9997, 'palace-6'),
-        'palcom-disc': Service(PROTOCOLS['udp'], 6657, 'palcom-disc'),
-        'pammratc': Service(PROTOCOLS['udp'], 1632, 'pammratc'),
-        'pammrpc': Service(PROTOCOLS['udp'], 1633, 'pammrpc'),
-        'pana': Service(PROTOCOLS['udp'], 716, 'pana'),
-        'panagolin-ident': Service(PROTOCOLS['udp'], 9021, 'panagolin-ident'),
-        'panasas': Service(PROTOCOLS['udp'], 3095, 'panasas'),
-        'pando-pub': Service(PROTOCOLS['udp'], 7680, 'pando-pub'),
-        'pando-sec': Service(PROTOCOLS['udp'], 8276, 'pando-sec'),
-        'pangolin-laser': Service(PROTOCOLS['udp'], 3348, 'pangolin-laser'),
-        'paradym-31port': Service(PROTOCOLS['udp'], 1864, 'paradym-31port'),
-        'paragent': Service(PROTOCOLS['udp'], 9022, 'paragent'),
-        'parallel': Service(PROTOCOLS['udp'], 4989, 'parallel'),
-        'park-agent': Service(PROTOCOLS['udp'], 5431, 'park-agent'),
-        'parliant': Service(PROTOCOLS['udp'], 4681, 'parliant'),
-        'parsec-game': Service(PROTOCOLS['udp'], 6582, 'parsec-game'),
-        'parsec-master': Service(PROTOCOLS['udp'], 6580, 'parsec-master'),
-        'parsec-peer': Service(PROTOCOLS['udp'], 6581, 'parsec-peer'),
-        'partimage': Service(PROTOCOLS['udp'], 4025, 'partimage'),
-        'passgo': Service(PROTOCOLS['udp'], 511, 'passgo'),
-        'passgo-tivoli': Service(PROTOCOLS['udp'], 627, 'passgo-tivoli'),
-        'password-chg': Service(PROTOCOLS['udp'], 586, 'password-chg'),
-        'passwrd-policy': Service(PROTOCOLS['udp'], 1333, 'passwrd-policy'),
-        'patrol': Service(PROTOCOLS['udp'], 8160, 'patrol'),
-        'patrol-coll': Service(PROTOCOLS['udp'], 6162, 'patrol-coll'),
-        'patrol-ism': Service(PROTOCOLS['udp'], 6161, 'patrol-ism'),
-        'patrol-mq-gm': Service(PROTOCOLS['udp'], 2664, 'patrol-mq-gm'),
-        'patrol-mq-nm': Service(PROTOCOLS['udp'], 2665, 'patrol-mq-nm'),
-        'patrol-snmp': Service(PROTOCOLS['udp'], 8161, 'patrol-snmp'),
-        'patrolview': Service(PROTOCOLS['udp'], 4097, 'patrolview'),
-        'pawserv': Service(PROTOCOLS['udp'], 345, 'pawserv'),
-        'pay-per-view': Service(PROTOCOLS['udp'], 1564, 'pay-per-view'),
-        'paycash-online': Service(PROTOCOLS['udp'], 8128, 'paycash-online'),
-        'paycash-wbp': Service(PROTOCOLS['udp'], 8129, 'paycash-wbp'),
-        'payrouter': Service(PROTOCOLS['udp'], 1246, 'payrouter'),
-        'pc-mta-addrmap': Service(PROTOCOLS['udp'], 2246, 'pc-mta-addrmap'),
-        'pc-telecommute': Service(PROTOCOLS['udp'], 2299, 'pc-telecommute'),
-        'pcanywheredata': Service(PROTOCOLS['udp'], 5631, 'pcanywheredata'),
-        'pcanywherestat': Service(PROTOCOLS['udp'], 5632, 'pcanywherestat'),
-        'pcc-image-port': Service(PROTOCOLS['udp'], 3892, 'pcc-image-port'),
-        'pcc-mfp': Service(PROTOCOLS['udp'], 2256, 'pcc-mfp'),
-        'pcia-rxp-b': Service(PROTOCOLS['udp'], 1332, 'pcia-rxp-b'),
-        'pciarray': Service(PROTOCOLS['udp'], 1552, 'pciarray'),
-        'pcihreq': Service(PROTOCOLS['udp'], 3085, 'pcihreq'),
-        'pcle-infex': Service(PROTOCOLS['udp'], 3189, 'pcle-infex'),
-        'pclemultimedia': Service(PROTOCOLS['udp'], 2558, 'pclemultimedia'),
-        'pcmail-srv': Service(PROTOCOLS['udp'], 158, 'pcmail-srv'),
-        'pcoip': Service(PROTOCOLS['udp'], 4172, 'pcoip'),
-        'pconnectmgr': Service(PROTOCOLS['udp'], 1562, 'pconnectmgr'),
-        'pcp': Service(PROTOCOLS['udp'], 5351, 'pcp'),
-        'pcp-multicast': Service(PROTOCOLS['udp'], 5350, 'pcp-multicast'),
-        'pcptcpservice': Service(PROTOCOLS['udp'], 4182, 'pcptcpservice'),
-        'pcs-pcw': Service(PROTOCOLS['udp'], 2566, 'pcs-pcw'),
-        'pcsync-http': Service(PROTOCOLS['udp'], 8444, 'pcsync-http'),
-        'pcsync-https': Service(PROTOCOLS['udp'], 8443, 'pcsync-https'),
-        'pctrader': Service(PROTOCOLS['udp'], 3048, 'pctrader'),
-        'pcttunnell': Service(PROTOCOLS['udp'], 2274, 'pcttunnell'),
-        'pd-admin': Service(PROTOCOLS['udp'], 9597, 'pd-admin'),
-        'pda-data': Service(PROTOCOLS['udp'], 3253, 'pda-data'),
-        'pda-gate': Service(PROTOCOLS['udp'], 4012, 'pda-gate'),
-        'pda-sys': Service(PROTOCOLS['udp'], 3254, 'pda-sys'),
-        'pdap': Service(PROTOCOLS['udp'], 344, 'pdap'),
-        'pdap-np': Service(PROTOCOLS['udp'], 1526, 'pdap-np'),
-        'pdb': Service(PROTOCOLS['udp'], 3033, 'pdb'),
-        'pdefmns': Service(PROTOCOLS['udp'], 16311, 'pdefmns'),
-        'pdl-datastream': Service(PROTOCOLS['udp'], 9100, 'pdl-datastream'),
-        'pdnet': Service(PROTOCOLS['udp'], 2843, 'pdnet'),
-        'pdp': Service(PROTOCOLS['udp'], 1675, 'pdp'),
-        'pdps': Service(PROTOCOLS['udp'], 1314, 'pdps'),
-        'pdrncs': Service(PROTOCOLS['udp'], 3299, 'pdrncs'),
-        'pds': Service(PROTOCOLS['udp'], 9595, 'pds'),
-        'pdtp': Service(PROTOCOLS['udp'], 6086, 'pdtp'),
-        'pduncs': Service(PROTOCOLS['udp'], 16310, 'pduncs'),
-        'pe-mike': Service(PROTOCOLS['udp'], 1305, 'pe-mike'),
-        'pearldoc-xact': Service(PROTOCOLS['udp'], 1980, 'pearldoc-xact'),
-        'peerbook-port': Service(PROTOCOLS['udp'], 3135, 'peerbook-port'),
-        'peerwire': Service(PROTOCOLS['udp'], 9104, 'peerwire'),
-        'pegasus': Service(PROTOCOLS['udp'], 9278, 'pegasus'),
-        'pegasus-ctl': Service(PROTOCOLS['udp'], 9279, 'pegasus-ctl'),
-        'pegboard': Service(PROTOCOLS['udp'], 1357, 'pegboard'),
-        'pehelp': Service(PROTOCOLS['udp'], 2307, 'pehelp'),
-        'peport': Service(PROTOCOLS['udp'], 1449, 'peport'),
-        'perf-port': Service(PROTOCOLS['udp'], 1995, 'perf-port'),
-        'perfd': Service(PROTOCOLS['udp'], 5227, 'perfd'),
-        'perimlan': Service(PROTOCOLS['udp'], 4075, 'perimlan'),
-        'periscope': Service(PROTOCOLS['udp'], 1230, 'periscope'),
-        'permabit-cs': Service(PROTOCOLS['udp'], 5312, 'permabit-cs'),
-        'persona': Service(PROTOCOLS['udp'], 1916, 'persona'),
-        'personal-agent': Service(PROTOCOLS['udp'], 5555, 'personal-agent'),
-        'personal-link': Service(PROTOCOLS['udp'], 281, 'personal-link'),
-        'personalos-001': Service(PROTOCOLS['udp'], 3557, 'personalos-001'),
-        'personnel': Service(PROTOCOLS['udp'], 3109, 'personnel'),
-        'pfcp': Service(PROTOCOLS['udp'], 8805, 'pfcp'),
-        'pftp': Service(PROTOCOLS['udp'], 662, 'pftp'),
-        'pfu-prcallback': Service(PROTOCOLS['udp'], 3208, 'pfu-prcallback'),
-        'pgps': Service(PROTOCOLS['udp'], 9280, 'pgps'),
-        'ph': Service(PROTOCOLS['udp'], 481, 'ph'),
-        'pharmasoft': Service(PROTOCOLS['udp'], 1779, 'pharmasoft'),
-        'pharos': Service(PROTOCOLS['udp'], 4443, 'pharos'),
-        'philips-vc': Service(PROTOCOLS['udp'], 583, 'philips-vc'),
-        'phoenix-rpc': Service(PROTOCOLS['udp'], 3347, 'phoenix-rpc'),
-        'phonebook': Service(PROTOCOLS['udp'], 767, 'phonebook'),
-        'phonex-port': Service(PROTOCOLS['udp'], 3177, 'phonex-port'),
-        'photuris': Service(PROTOCOLS['udp'], 468, 'photuris'),
-        'phrelay': Service(PROTOCOLS['udp'], 4868, 'phrelay'),
-        'phrelaydbg': Service(PROTOCOLS['udp'], 4869, 'phrelaydbg'),
-        'piccolo': Service(PROTOCOLS['udp'], 2787, 'piccolo'),
-        'pichat': Service(PROTOCOLS['udp'], 9009, 'pichat'),
-        'picknfs': Service(PROTOCOLS['udp'], 1598, 'picknfs'),
-        'picodbc': Service(PROTOCOLS['udp'], 1603, 'picodbc'),
-        'pictrography': Service(PROTOCOLS['udp'], 1280, 'pictrography'),
-        'pim-rp-disc': Service(PROTOCOLS['udp'], 496, 'pim-rp-disc'),
-        'ping-pong': Service(PROTOCOLS['udp'], 3010, 'ping-pong'),
-        'pinghgl': Service(PROTOCOLS['udp'], 4306, 'pinghgl'),
-        'pip': Service(PROTOCOLS['udp'], 1321, 'pip'),
-        'pipe-server': Service(PROTOCOLS['udp'], 2010, 'pipe-server'),
-        'pipe_server': Service(PROTOCOLS['udp'], 2010, 'pipe_server'),
-        'pipes': Service(PROTOCOLS['udp'], 1465, 'pipes'),
-        'piranha1': Service(PROTOCOLS['udp'], 4600, 'piranha1'),
-        'piranha2': Service(PROTOCOLS['udp'], 4601, 'piranha2'),
-        'pirp': Service(PROTOCOLS['udp'], 553, 'pirp'),
-        'pit-vpn': Service(PROTOCOLS['udp'], 2865, 'pit-vpn'),
-        'pixelpusher': Service(PROTOCOLS['udp'], 5078, 'pixelpusher'),
-        'pjj-player-disc': Service(PROTOCOLS['udp'], 4416, 'pjj-player-disc'),
-        'pjlink': Service(PROTOCOLS['udp'], 4352, 'pjlink'),
-        'pk': Service(PROTOCOLS['udp'], 5272, 'pk'),
-        'pk-electronics': Service(PROTOCOLS['udp'], 2634, 'pk-electronics'),
-        'pkagent': Service(PROTOCOLS['udp'], 3118, 'pkagent'),
-        'pkix-3-ca-ra': Service(PROTOCOLS['udp'], 829, 'pkix-3-ca-ra'),
-        'pkix-timestamp': Service(PROTOCOLS['udp'], 318, 'pkix-timestamp'),
-        'pkt-krb-ipsec': Service(PROTOCOLS['udp'], 1293, 'pkt-krb-ipsec'),
-        'pktcable-cops': Service(PROTOCOLS['udp'], 2126, 'pktcable-cops'),
-        'pktcablemmcops': Service(PROTOCOLS['udp'], 3918, 'pktcablemmcops'),
-        'plato': Service(PROTOCOLS['udp'], 3285, 'plato'),
-        'plato-lm': Service(PROTOCOLS['udp'], 1819, 'plato-lm'),
-        'playsta2-app': Service(PROTOCOLS['udp'], 4658, 'playsta2-app'),
-        'playsta2-lob': Service(PROTOCOLS['udp'], 4659, 'playsta2-lob'),
-        'plbserve-port': Service(PROTOCOLS['udp'], 3933, 'plbserve-port'),
-        'plcy-net-svcs': Service(PROTOCOLS['udp'], 4351, 'plcy-net-svcs'),
-        'plethora': Service(PROTOCOLS['udp'], 3480, 'plethora'),
-        'plgproxy': Service(PROTOCOLS['udp'], 2790, 'plgproxy'),
-        'pluribus': Service(PROTOCOLS['udp'], 3469, 'pluribus'),
-        'plysrv-http': Service(PROTOCOLS['udp'], 6770, 'plysrv-http'),
-        'plysrv-https': Service(PROTOCOLS['udp'], 6771, 'plysrv-https'),
-        'pm-cmdsvr': Service(PROTOCOLS['udp'], 5112, 'pm-cmdsvr'),
-        'pmas': Service(PROTOCOLS['udp'], 4066, 'pmas'),
-        'pmcd': Service(PROTOCOLS['udp'], 44321, 'pmcd'),
-        'pmcdproxy': Service(PROTOCOLS['udp'], 44322, 'pmcdproxy'),
-        'pmcp': Service(PROTOCOLS['udp'], 3821, 'pmcp'),
-        'pmcs': Service(PROTOCOLS['udp'], 6355, 'pmcs'),
-        'pmd': Service(PROTOCOLS['udp'], 7431, 'pmd'),
-        'pmdfmgt': Service(PROTOCOLS['udp'], 7633, 'pmdfmgt'),
-        'pmdmgr': Service(PROTOCOLS['udp'], 7426, 'pmdmgr'),
-        'pmip6-cntl': Service(PROTOCOLS['udp'], 5436, 'pmip6-cntl'),
-        'pmip6-data': Service(PROTOCOLS['udp'], 5437, 'pmip6-data'),
-        'pmsm-webrctl': Service(PROTOCOLS['udp'], 2972, 'pmsm-webrctl'),
-        'pn-requester': Service(PROTOCOLS['udp'], 2717, 'pn-requester'),
-        'pn-requester2': Service(PROTOCOLS['udp'], 2718, 'pn-requester2'),
-        'pnaconsult-lm': Service(PROTOCOLS['udp'], 2937, 'pnaconsult-lm'),
-        'pnbs': Service(PROTOCOLS['udp'], 6124, 'pnbs'),
-        'pnbscada': Service(PROTOCOLS['udp'], 3875, 'pnbscada'),
-        'pnet-conn': Service(PROTOCOLS['udp'], 7797, 'pnet-conn'),
-        'pnet-enc': Service(PROTOCOLS['udp'], 7798, 'pnet-enc'),
-        'pnrp-port': Service(PROTOCOLS['udp'], 3540, 'pnrp-port'),
-        'pns': Service(PROTOCOLS['udp'], 2487, 'pns'),
-        'polestar': Service(PROTOCOLS['udp'], 1060, 'polestar'),
-        'policyserver': Service(PROTOCOLS['udp'], 3055, 'policyserver'),
-        'pop2': Service(PROTOCOLS['udp'], 109, 'pop2'),
-        'pop3': Service(PROTOCOLS['udp'], 110, 'pop3'),
-        'pop3s': Service(PROTOCOLS['udp'], 995, 'pop3s'),
-        'popup-reminders': Service(PROTOCOLS['udp'], 7787, 'popup-reminders'),
-        'portgate-auth': Service(PROTOCOLS['udp'], 3710, 'portgate-auth'),
-        'postgresql': Service(PROTOCOLS['udp'], 5432, 'postgresql'),
-        'pov-ray': Service(PROTOCOLS['udp'], 494, 'pov-ray'),
-        'poweralert-nsa': Service(PROTOCOLS['udp'], 4150, 'poweralert-nsa'),
-        'powerburst': Service(PROTOCOLS['udp'], 485, 'powerburst'),
-        'powerclientcsf': Service(PROTOCOLS['udp'], 2443, 'powerclientcsf'),
-        'powerexchange': Service(PROTOCOLS['udp'], 2480, 'powerexchange'),
-        'powergemplus': Service(PROTOCOLS['udp'], 2899, 'powergemplus'),
-        'powerguardian': Service(PROTOCOLS['udp'], 1777, 'powerguardian'),
-        'poweronnud': Service(PROTOCOLS['udp'], 3168, 'poweronnud'),
-        'powerschool': Service(PROTOCOLS['udp'], 5071, 'powerschool'),
-        'powwow-client': Service(PROTOCOLS['udp'], 13223, 'powwow-client'),
-        'powwow-server': Service(PROTOCOLS['udp'], 13224, 'powwow-server'),
-        'ppcontrol': Service(PROTOCOLS['udp'], 2505, 'ppcontrol'),
-        'ppsms': Service(PROTOCOLS['udp'], 3967, 'ppsms'),
-        'ppsuitemsg': Service(PROTOCOLS['udp'], 5863, 'ppsuitemsg'),
-        'pptconference': Service(PROTOCOLS['udp'], 1711, 'pptconference'),
-        'pptp': Service(PROTOCOLS['udp'], 1723, 'pptp'),
-        'pq-lic-mgmt': Service(PROTOCOLS['udp'], 2687, 'pq-lic-mgmt'),
-        'pra-elmd': Service(PROTOCOLS['udp'], 1587, 'pra-elmd'),
-        'pra_elmd': Service(PROTOCOLS['udp'], 1587, 'pra_elmd'),
-        'prat': Service(PROTOCOLS['udp'], 1264, 'prat'),
-        'prchat-server': Service(PROTOCOLS['udp'], 4456, 'prchat-server'),
-        'prchat-user': Service(PROTOCOLS['udp'], 4455, 'prchat-user'),
-        'precise-comm': Service(PROTOCOLS['udp'], 5630, 'precise-comm'),
-        'precise-i3': Service(PROTOCOLS['udp'], 3607, 'precise-i3'),
-        'precise-sft': Service(PROTOCOLS['udp'], 2315, 'precise-sft'),
-        'precise-vip': Service(PROTOCOLS['udp'], 2924, 'precise-vip'),
-        'prelude': Service(PROTOCOLS['udp'], 4690, 'prelude'),
-        'presence': Service(PROTOCOLS['udp'], 5298, 'presence'),
-        'presonus-ucnet': Service(PROTOCOLS['udp'], 47809, 'presonus-ucnet'),
-        'press': Service(PROTOCOLS['udp'], 3582, 'press'),
-        'prgp': Service(PROTOCOLS['udp'], 7747, 'prgp'),
-        'primaserver': Service(PROTOCOLS['udp'], 6105, 'primaserver'),
-        'print-srv': Service(PROTOCOLS['udp'], 170, 'print-srv'),
-        'printer': Service(PROTOCOLS['udp'], 515, 'printer'),
-        'printer-agent': Service(PROTOCOLS['udp'], 3396, 'printer-agent'),
-        'printer_agent': Service(PROTOCOLS['udp'], 3396, 'printer_agent'),
-        'priority-e-com': Service(PROTOCOLS['udp'], 2618, 'priority-e-com'),
-        'prism-deploy': Service(PROTOCOLS['udp'], 3133, 'prism-deploy'),
-        'prismiq-plugin': Service(PROTOCOLS['udp'], 3650, 'prismiq-plugin'),
-        'privateark': Service(PROTOCOLS['udp'], 1858, 'privateark'),
-        'privatechat': Service(PROTOCOLS['udp'], 1735, 'privatechat'),
-        'privatewire': Service(PROTOCOLS['udp'], 4449, 'privatewire'),
-        'privilege': Service(PROTOCOLS['udp'], 2588, 'privilege'),
-        'privoxy': Service(PROTOCOLS['udp'], 8118, 'privoxy'),
-        'prizma': Service(PROTOCOLS['udp'], 2039, 'prizma'),
-        'prm-nm': Service(PROTOCOLS['udp'], 409, 'prm-nm'),
-        'prm-nm-np': Service(PROTOCOLS['udp'], 1403, 'prm-nm-np'),
-        'prm-sm': Service(PROTOCOLS['udp'], 408, 'prm-sm'),
-        'prm-sm-np': Service(PROTOCOLS['udp'], 1402, 'prm-sm-np'),
-        'prnrequest': Service(PROTOCOLS['udp'], 3910, 'prnrequest'),
-        'prnstatus': Service(PROTOCOLS['udp'], 3911, 'prnstatus'),
-        'pro-ed': Service(PROTOCOLS['udp'], 8032, 'pro-ed'),
-        'proactivate': Service(PROTOCOLS['udp'], 24678, 'proactivate'),
-        'proactivesrvr': Service(PROTOCOLS['udp'], 2722, 'proactivesrvr'),
-        'proaxess': Service(PROTOCOLS['udp'], 3961, 'proaxess'),
-        'procos-lm': Service(PROTOCOLS['udp'], 3248, 'procos-lm'),
-        'prodigy-intrnet': Service(PROTOCOLS['udp'], 1778, 'prodigy-intrnet'),
-        'productinfo': Service(PROTOCOLS['udp'], 1283, 'productinfo'),
-        'profile': Service(PROTOCOLS['udp'], 136, 'profile'),
-        'profilemac': Service(PROTOCOLS['udp'], 4749, 'profilemac'),
-        'profinet-cm': Service(PROTOCOLS['udp'], 34964, 'profinet-cm'),
-        'profinet-rt': Service(PROTOCOLS['udp'], 34962, 'profinet-rt'),
-        'profinet-rtm': Service(PROTOCOLS['udp'], 34963, 'profinet-rtm'),
-        'progistics': Service(PROTOCOLS['udp'], 3973, 'progistics'),
-        'prolink': Service(PROTOCOLS['udp'], 1678, 'prolink'),
-        'proofd': Service(PROTOCOLS['udp'], 1093, 'proofd'),
-        'propel-msgsys': Service(PROTOCOLS['udp'], 1268, 'propel-msgsys'),
-        'proshare-mc-1': Service(PROTOCOLS['udp'], 1673, 'proshare-mc-1'),
-        'proshare-mc-2': Service(PROTOCOLS['udp'], 1674, 'proshare-mc-2'),
-        'proshare1': Service(PROTOCOLS['udp'], 1459, 'proshare1'),
-        'proshare2': Service(PROTOCOLS['udp'], 1460, 'proshare2'),
-        'proshareaudio': Service(PROTOCOLS['udp'], 5713, 'proshareaudio'),
-        'prosharedata': Service(PROTOCOLS['udp'], 5715, 'prosharedata'),
-        'prosharenotify': Service(PROTOCOLS['udp'], 5717, 'prosharenotify'),
-        'prosharerequest': Service(PROTOCOLS['udp'], 5716, 'prosharerequest'),
-        'prosharevideo': Service(PROTOCOLS['udp'], 5714, 'prosharevideo'),
-        'prospero': Service(PROTOCOLS['udp'], 191, 'prospero'),
-        'prospero-np': Service(PROTOCOLS['udp'], 1525, 'prospero-np'),
-        'proxim': Service(PROTOCOLS['udp'], 1732, 'proxim'),
-        'proxima-lm': Service(PROTOCOLS['udp'], 1445, 'proxima-lm'),
-        'proxy-gateway': Service(PROTOCOLS['udp'], 2303, 'proxy-gateway'),
-        'prp': Service(PROTOCOLS['udp'], 2091, 'prp'),
-        'prregister': Service(PROTOCOLS['udp'], 4457, 'prregister'),
-        'prsvp': Service(PROTOCOLS['udp'], 3455, 'prsvp'),
-        'ps-ams': Service(PROTOCOLS['udp'], 3658, 'ps-ams'),
-        'psbserver': Service(PROTOCOLS['udp'], 2350, 'psbserver'),
-        'pscribe': Service(PROTOCOLS['udp'], 6163, 'pscribe'),
-        'pscupd': Service(PROTOCOLS['udp'], 3453, 'pscupd'),
-        'psdbserver': Service(PROTOCOLS['udp'], 2355, 'psdbserver'),
-        'pserver': Service(PROTOCOLS['udp'], 3662, 'pserver'),
-        'pslicser': Service(PROTOCOLS['udp'], 4168, 'pslicser'),
-        'pslserver': Service(PROTOCOLS['udp'], 2352, 'pslserver'),
-        'psmond': Service(PROTOCOLS['udp'], 1788, 'psmond'),
-        'psprserver': Service(PROTOCOLS['udp'], 2354, 'psprserver'),
-        'pspserver': Service(PROTOCOLS['udp'], 2353, 'pspserver'),
-        'psrserver': Service(PROTOCOLS['udp'], 2351, 'psrserver'),
-        'pss': Service(PROTOCOLS['udp'], 7880, 'pss'),
-        'pssc': Service(PROTOCOLS['udp'], 645, 'pssc'),
-        'pt2-discover': Service(PROTOCOLS['udp'], 1101, 'pt2-discover'),
-        'ptcnameservice': Service(PROTOCOLS['udp'], 597, 'ptcnameservice'),
-        'ptk-alink': Service(PROTOCOLS['udp'], 3089, 'ptk-alink'),
-        'ptp': Service(PROTOCOLS['udp'], 15740, 'ptp'),
-        'ptp-event': Service(PROTOCOLS['udp'], 319, 'ptp-event'),
-        'ptp-general': Service(PROTOCOLS['udp'], 320, 'ptp-general'),
-        'pulsonixnls': Service(PROTOCOLS['udp'], 6140, 'pulsonixnls'),
-        'pump': Service(PROTOCOLS['udp'], 751, 'pump'),
-        'puparp': Service(PROTOCOLS['udp'], 998, 'puparp'),
-        'puprouter': Service(PROTOCOLS['udp'], 999, 'puprouter'),
-        'purenoise': Service(PROTOCOLS['udp'], 663, 'purenoise'),
-        'pvsw': Service(PROTOCOLS['udp'], 2520, 'pvsw'),
-        'pvsw-inet': Service(PROTOCOLS['udp'], 2441, 'pvsw-inet'),
-        'pvuniwien': Service(PROTOCOLS['udp'], 1081, 'pvuniwien'),
-        'pvxpluscs': Service(PROTOCOLS['udp'], 4093, 'pvxpluscs'),
-        'pwdgen': Service(PROTOCOLS['udp'], 129, 'pwdgen'),
-        'pwdis': Service(PROTOCOLS['udp'], 3735, 'pwdis'),
-        'pwgippfax': Service(PROTOCOLS['udp'], 3951, 'pwgippfax'),
-        'pwgpsi': Service(PROTOCOLS['udp'], 3800, 'pwgpsi'),
-        'pwgwims': Service(PROTOCOLS['udp'], 4951, 'pwgwims'),
-        'pwrsevent': Service(PROTOCOLS['udp'], 2694, 'pwrsevent'),
-        'pxc-epmap': Service(PROTOCOLS['udp'], 2434, 'pxc-epmap'),
-        'pxc-ntfy': Service(PROTOCOLS['udp'], 3009, 'pxc-ntfy'),
-        'pxc-pin': Service(PROTOCOLS['udp'], 4005, 'pxc-pin'),
-        'pxc-roid': Service(PROTOCOLS['udp'], 4004, 'pxc-roid'),
-        'pxc-sapxom': Service(PROTOCOLS['udp'], 2680, 'pxc-sapxom'),
-        'pxc-splr': Service(PROTOCOLS['udp'], 4007, 'pxc-splr'),
-        'pxc-splr-ft': Service(PROTOCOLS['udp'], 4003, 'pxc-splr-ft'),
-        'pxc-spvr': Service(PROTOCOLS['udp'], 4006, 'pxc-spvr'),
-        'pxc-spvr-ft': Service(PROTOCOLS['udp'], 4002, 'pxc-spvr-ft'),
-        'pyrrho': Service(PROTOCOLS['udp'], 5433, 'pyrrho'),
-        'q3ade': Service(PROTOCOLS['udp'], 7794, 'q3ade'),
-        'q55-pcc': Service(PROTOCOLS['udp'], 1253, 'q55-pcc'),
-        'qadmifevent': Service(PROTOCOLS['udp'], 2462, 'qadmifevent'),
-        'qadmifoper': Service(PROTOCOLS['udp'], 2461, 'qadmifoper'),
-        'qb-db-server': Service(PROTOCOLS['udp'], 10160, 'qb-db-server'),
-        'qbdb': Service(PROTOCOLS['udp'], 8019, 'qbdb'),
-        'qbikgdp': Service(PROTOCOLS['udp'], 368, 'qbikgdp'),
-        'qcp': Service(PROTOCOLS['udp'], 5082, 'qcp'),
-        'qdb2service': Service(PROTOCOLS['udp'], 45825, 'qdb2service'),
-        'qencp': Service(PROTOCOLS['udp'], 2120, 'qencp'),
-        'qfp': Service(PROTOCOLS['udp'], 5083, 'qfp'),
-        'qft': Service(PROTOCOLS['udp'], 189, 'qft'),
-        'qftest-lookup': Service(PROTOCOLS['udp'], 3543, 'qftest-lookup'),
-        'qip-audup': Service(PROTOCOLS['udp'], 2765, 'qip-audup'),
-        'qip-login': Service(PROTOCOLS['udp'], 2366, 'qip-login'),
-        'qip-msgd': Service(PROTOCOLS['udp'], 2468, 'qip-msgd'),
-        'qip-qdhcp': Service(PROTOCOLS['udp'], 2490, 'qip-qdhcp'),
-        'qke-llc-v3': Service(PROTOCOLS['udp'], 2523, 'qke-llc-v3'),
-        'qmqp': Service(PROTOCOLS['udp'], 628, 'qmqp'),
-        'qmtp': Service(PROTOCOLS['udp'], 209, 'qmtp'),
-        'qmtps': Service(PROTOCOLS['udp'], 6209, 'qmtps'),
-        'qmvideo': Service(PROTOCOLS['udp'], 5689, 'qmvideo'),
-        'qnts-orb': Service(PROTOCOLS['udp'], 1262, 'qnts-orb'),
-        'qnxnetman': Service(PROTOCOLS['udp'], 3385, 'qnxnetman'),
-        'qo-secure': Service(PROTOCOLS['udp'], 7913, 'qo-secure'),
-        'qotd': Service(PROTOCOLS['udp'], 17, 'qotd'),
-        'qotps': Service(PROTOCOLS['udp'], 2724, 'qotps'),
-        'qpasa-agent': Service(PROTOCOLS['udp'], 2612, 'qpasa-agent'),
-        'qrh': Service(PROTOCOLS['udp'], 752, 'qrh'),
-        'qsm-gui': Service(PROTOCOLS['udp'], 1165, 'qsm-gui'),
-        'qsm-proxy': Service(PROTOCOLS['udp'], 1164, 'qsm-proxy'),
-        'qsm-remote': Service(PROTOCOLS['udp'], 1166, 'qsm-remote'),
-        'qsnet-assist': Service(PROTOCOLS['udp'], 4356, 'qsnet-assist'),
-        'qsnet-cond': Service(PROTOCOLS['udp'], 4357, 'qsnet-cond'),
-        'qsnet-nucl': Service(PROTOCOLS['udp'], 4358, 'qsnet-nucl'),
-        'qsnet-trans': Service(PROTOCOLS['udp'], 4354, 'qsnet-trans'),
-        'qsnet-workst': Service(PROTOCOLS['udp'], 4355, 'qsnet-workst'),
-        'qsoft': Service(PROTOCOLS['udp'], 3059, 'qsoft'),
-        'qt-serveradmin': Service(PROTOCOLS['udp'], 1220, 'qt-serveradmin'),
-        'qtms-bootstrap': Service(PROTOCOLS['udp'], 3850, 'qtms-bootstrap'),
-        'qtp': Service(PROTOCOLS['udp'], 2935, 'qtp'),
-        'quaddb': Service(PROTOCOLS['udp'], 2497, 'quaddb'),
-        'quailnet': Service(PROTOCOLS['udp'], 5464, 'quailnet'),
-        'quake': Service(PROTOCOLS['udp'], 26000, 'quake'),
-        'quartus-tcl': Service(PROTOCOLS['udp'], 2589, 'quartus-tcl'),
-        'quasar-server': Service(PROTOCOLS['udp'], 3599, 'quasar-server'),
-        'qubes': Service(PROTOCOLS['udp'], 1341, 'qubes'),
-        'quest-agent': Service(PROTOCOLS['udp'], 3843, 'quest-agent'),
-        'quest-disc': Service(PROTOCOLS['udp'], 7040, 'quest-disc'),
-        'quest-vista': Service(PROTOCOLS['udp'], 7980, 'quest-vista'),
-        'questdb2-lnchr': Service(PROTOCOLS['udp'], 5677, 'questdb2-lnchr'),
-        'questnotify': Service(PROTOCOLS['udp'], 3554, 'questnotify'),
-        'queueadm': Service(PROTOCOLS['udp'], 2230, 'queueadm'),
-        'quickbooksrds': Service(PROTOCOLS['udp'], 3790, 'quickbooksrds'),
-        'quicksuite': Service(PROTOCOLS['udp'], 2900, 'quicksuite'),
-        'quosa': Service(PROTOCOLS['udp'], 4841, 'quosa'),
-        'quotad': Service(PROTOCOLS['udp'], 762, 'quotad'),
-        'qwave': Service(PROTOCOLS['udp'], 2177, 'qwave'),
-        'raadmin': Service(PROTOCOLS['udp'], 5676, 'raadmin'),
-        'radan-http': Service(PROTOCOLS['udp'], 8088, 'radan-http'),
-        'radclientport': Service(PROTOCOLS['udp'], 3178, 'radclientport'),
-        'radec-corp': Service(PROTOCOLS['udp'], 5430, 'radec-corp'),
-        'radio': Service(PROTOCOLS['udp'], 1595, 'radio'),
-        'radio-bc': Service(PROTOCOLS['udp'], 1596, 'radio-bc'),
-        'radius': Service(PROTOCOLS['udp'], 1812, 'radius'),
-        'radius-acct': Service(PROTOCOLS['udp'], 1813, 'radius-acct'),
-        'radius-dynauth': Service(PROTOCOLS['udp'], 3799, 'radius-dynauth'),
-        'radix': Service(PROTOCOLS['udp'], 2872, 'radix'),
-        'radmin-port': Service(PROTOCOLS['udp'], 4899, 'radmin-port'),
-        'radmind': Service(PROTOCOLS['udp'], 6222, 'radmind'),
-        'radsec': Service(PROTOCOLS['udp'], 2083, 'radsec'),
-        'radwiz-nms-srv': Service(PROTOCOLS['udp'], 2736, 'radwiz-nms-srv'),
-        'raid-ac': Service(PROTOCOLS['udp'], 2012, 'raid-ac'),
-        'raid-am': Service(PROTOCOLS['udp'], 2007, 'raid-am'),
-        'raid-cd': Service(PROTOCOLS['udp'], 2013, 'raid-cd'),
-        'raid-cs': Service(PROTOCOLS['udp'], 2015, 'raid-cs'),
-        'raid-sf': Service(PROTOCOLS['udp'], 2014, 'raid-sf'),
-        'ramp': Service(PROTOCOLS['udp'], 7227, 'ramp'),
-        'rap': Service(PROTOCOLS['udp'], 256, 'rap'),
-        'rap-ip': Service(PROTOCOLS['udp'], 3813, 'rap-ip'),
-        'rap-listen': Service(PROTOCOLS['udp'], 1531, 'rap-listen'),
-        'rap-service': Service(PROTOCOLS['udp'], 1530, 'rap-service'),
-        'rapi': Service(PROTOCOLS['udp'], 2176, 'rapi'),
-        'rapidbase': Service(PROTOCOLS['udp'], 1953, 'rapidbase'),
-        'rapidmq-center': Service(PROTOCOLS['udp'], 3093, 'rapidmq-center'),
-        'rapidmq-reg': Service(PROTOCOLS['udp'], 3094, 'rapidmq-reg'),
-        'rapido-ip': Service(PROTOCOLS['udp'], 2457, 'rapido-ip'),
-        'raqmon-pdu': Service(PROTOCOLS['udp'], 7744, 'raqmon-pdu'),
-        'rasadv': Service(PROTOCOLS['udp'], 9753, 'rasadv'),
-        'ratio-adp': Service(PROTOCOLS['udp'], 1108, 'ratio-adp'),
-        'ratl': Service(PROTOCOLS['udp'], 2449, 'ratl'),
-        'ravehd': Service(PROTOCOLS['udp'], 4037, 'ravehd'),
-        'raven-rdp': Service(PROTOCOLS['udp'], 3533, 'raven-rdp'),
-        'raven-rmp': Service(PROTOCOLS['udp'], 3532, 'raven-rmp'),
-        'raventbs': Service(PROTOCOLS['udp'], 2713, 'raventbs'),
-        'raventdm': Service(PROTOCOLS['udp'], 2714, 'raventdm'),
-        'raw-serial': Service(PROTOCOLS['udp'], 2167, 'raw-serial'),
-        'razor': Service(PROTOCOLS['udp'], 3555, 'razor'),
-        'rbakcup1': Service(PROTOCOLS['udp'], 2773, 'rbakcup1'),
-        'rbakcup2': Service(PROTOCOLS['udp'], 2774, 'rbakcup2'),
-        'rblcheckd': Service(PROTOCOLS['udp'], 3768, 'rblcheckd'),
-        'rbr-debug': Service(PROTOCOLS['udp'], 44553, 'rbr-debug'),
-        'rbr-discovery': Service(PROTOCOLS['udp'], 3553, 'rbr-discovery'),
-        'rbt-wanopt': Service(PROTOCOLS['udp'], 7810, 'rbt-wanopt'),
-        'rcc-host': Service(PROTOCOLS['udp'], 2332, 'rcc-host'),
-        'rcp': Service(PROTOCOLS['udp'], 469, 'rcp'),
-        'rcst': Service(PROTOCOLS['udp'], 3467, 'rcst'),
-        'rcts': Service(PROTOCOLS['udp'], 2258, 'rcts'),
-        'rda': Service(PROTOCOLS['udp'], 630, 'rda'),
-        'rdb-dbs-disp': Service(PROTOCOLS['udp'], 1571, 'rdb-dbs-disp'),
-        'rdc-wh-eos': Service(PROTOCOLS['udp'], 3142, 'rdc-wh-eos'),
-        'rdlap': Service(PROTOCOLS['udp'], 2321, 'rdlap'),
-        'rdmnet-device': Service(PROTOCOLS['udp'], 5569, 'rdmnet-device'),
-        'rdrmshc': Service(PROTOCOLS['udp'], 1075, 'rdrmshc'),
-        'rds': Service(PROTOCOLS['udp'], 1540, 'rds'),
-        'rds-ib': Service(PROTOCOLS['udp'], 18634, 'rds-ib'),
-        'rds-ip': Service(PROTOCOLS['udp'], 18635, 'rds-ip'),
-        'rds2': Service(PROTOCOLS['udp'], 1541, 'rds2'),
-        're-conn-proto': Service(PROTOCOLS['udp'], 1306, 're-conn-proto'),
-        're-mail-ck': Service(PROTOCOLS['udp'], 50, 're-mail-ck'),
-        're101': Service(PROTOCOLS['udp'], 1343, 're101'),
-        'reachout': Service(PROTOCOLS['udp'], 43188, 'reachout'),
-        'realm-rusd': Service(PROTOCOLS['udp'], 688, 'realm-rusd'),
-        'realsecure': Service(PROTOCOLS['udp'], 2998, 'realsecure'),
-        'rebol': Service(PROTOCOLS['udp'], 2997, 'rebol'),
-        'recipe': Service(PROTOCOLS['udp'], 2240, 'recipe'),
-        'recvr-rc-disc': Service(PROTOCOLS['udp'], 43000, 'recvr-rc-disc'),
-        'redstone-cpss': Service(PROTOCOLS['udp'], 2928, 'redstone-cpss'),
-        'redstorm-diag': Service(PROTOCOLS['udp'], 2349, 'redstorm-diag'),
-        'redstorm-find': Service(PROTOCOLS['udp'], 2347, 'redstorm-find'),
-        'redstorm-info': Service(PROTOCOLS['udp'], 2348, 'redstorm-info'),
-        'redstorm-join': Service(PROTOCOLS['udp'], 2346, 'redstorm-join'),
-        'redstorm_diag': Service(PROTOCOLS['udp'], 2349, 'redstorm_diag'),
-        'redstorm_find': Service(PROTOCOLS['udp'], 2347, 'redstorm_find'),
-        'redstorm_info': Service(PROTOCOLS['udp'], 2348, 'redstorm_info'),
-        'redstorm_join': Service(PROTOCOLS['udp'], 2346, 'redstorm_join'),
-        'redwood-chat': Service(PROTOCOLS['udp'], 3032, 'redwood-chat'),
-        'reftek': Service(PROTOCOLS['udp'], 2543, 'reftek'),
-        'registrar': Service(PROTOCOLS['udp'], 1712, 'registrar'),
-        'relief': Service(PROTOCOLS['udp'], 1353, 'relief'),
-        'rellpack': Service(PROTOCOLS['udp'], 2018, 'rellpack'),
-        'remctl': Service(PROTOCOLS['udp'], 4373, 'remctl'),
-        'remote-as': Service(PROTOCOLS['udp'], 1053, 'remote-as'),
-        'remote-collab': Service(PROTOCOLS['udp'], 2250, 'remote-collab'),
-        'remote-kis': Service(PROTOCOLS['udp'], 185, 'remote-kis'),
-        'remote-winsock': Service(PROTOCOLS['udp'], 1745, 'remote-winsock'),
-        'remotedeploy': Service(PROTOCOLS['udp'], 3789, 'remotedeploy'),
-        'remotefs': Service(PROTOCOLS['udp'], 556, 'remotefs'),
-        'remoteware-cl': Service(PROTOCOLS['udp'], 3000, 'remoteware-cl'),
-        'remoteware-srv': Service(PROTOCOLS['udp'], 3002, 'remoteware-srv'),
-        'remoteware-un': Service(PROTOCOLS['udp'], 2999, 'remoteware-un'),
-        'repcmd': Service(PROTOCOLS['udp'], 641, 'repcmd'),
-        'repliweb': Service(PROTOCOLS['udp'], 2837, 'repliweb'),
-        'repscmd': Service(PROTOCOLS['udp'], 653, 'repscmd'),
-        'repsvc': Service(PROTOCOLS['udp'], 6320, 'repsvc'),
-        'res': Service(PROTOCOLS['udp'], 1942, 'res'),
-        'res-sap': Service(PROTOCOLS['udp'], 3163, 'res-sap'),
-        'resacommunity': Service(PROTOCOLS['udp'], 1154, 'resacommunity'),
-        'rescap': Service(PROTOCOLS['udp'], 283, 'rescap'),
-        'resource-mgr': Service(PROTOCOLS['udp'], 3019, 'resource-mgr'),
-        'resource_mgr': Service(PROTOCOLS['udp'], 3019, 'resource_mgr'),
-        'responselogic': Service(PROTOCOLS['udp'], 2886, 'responselogic'),
-        'responsenet': Service(PROTOCOLS['udp'], 3045, 'responsenet'),
-        'retrospect': Service(PROTOCOLS['udp'], 497, 'retrospect'),
-        'rets': Service(PROTOCOLS['udp'], 6103, 'rets'),
-        'rets-ssl': Service(PROTOCOLS['udp'], 12109, 'rets-ssl'),
-        'rexecj': Service(PROTOCOLS['udp'], 8230, 'rexecj'),
-        'rfa': Service(PROTOCOLS['udp'], 4672, 'rfa'),
-        'rfb': Service(PROTOCOLS['udp'], 5900, 'rfb'),
-        'rfe': Service(PROTOCOLS['udp'], 5002, 'rfe'),
-        'rfid-rp1': Service(PROTOCOLS['udp'], 4684, 'rfid-rp1'),
-        'rfio': Service(PROTOCOLS['udp'], 3147, 'rfio'),
-        'rfmp': Service(PROTOCOLS['udp'], 2249, 'rfmp'),
-        'rfx-lm': Service(PROTOCOLS['udp'], 1497, 'rfx-lm'),
-        'rgtp': Service(PROTOCOLS['udp'], 1431, 'rgtp'),
-        'rhp-iibp': Service(PROTOCOLS['udp'], 1912, 'rhp-iibp'),
-        'rib-slm': Service(PROTOCOLS['udp'], 3296, 'rib-slm'),
-        'ricardo-lm': Service(PROTOCOLS['udp'], 6148, 'ricardo-lm'),
-        'rich-cp': Service(PROTOCOLS['udp'], 2057, 'rich-cp'),
-        'ridgeway1': Service(PROTOCOLS['udp'], 2776, 'ridgeway1'),
-        'ridgeway2': Service(PROTOCOLS['udp'], 2777, 'ridgeway2'),
-        'rimf-ps': Service(PROTOCOLS['udp'], 2209, 'rimf-ps'),
-        'rimsl': Service(PROTOCOLS['udp'], 2044, 'rimsl'),
-        'ripng': Service(PROTOCOLS['udp'], 521, 'ripng'),
-        'ris': Service(PROTOCOLS['udp'], 180, 'ris'),
-        'ris-cm': Service(PROTOCOLS['udp'], 748, 'ris-cm'),
-        'rise': Service(PROTOCOLS['udp'], 7473, 'rise'),
-        'rjcdb-vcards': Service(PROTOCOLS['udp'], 9208, 'rjcdb-vcards'),
-        'rje': Service(PROTOCOLS['udp'], 5, 'rje'),
-        'rkb-oscs': Service(PROTOCOLS['udp'], 1817, 'rkb-oscs'),
-        'rlm-disc': Service(PROTOCOLS['udp'], 5053, 'rlm-disc'),
-        'rlp': Service(PROTOCOLS['udp'], 39, 'rlp'),
-        'rlzdbase': Service(PROTOCOLS['udp'], 635, 'rlzdbase'),
-        'rmc': Service(PROTOCOLS['udp'], 657, 'rmc'),
-        'rmiactivation': Service(PROTOCOLS['udp'], 1098, 'rmiactivation'),
-        'rmiaux': Service(PROTOCOLS['udp'], 10990, 'rmiaux'),
-        'rmiregistry': Service(PROTOCOLS['udp'], 1099, 'rmiregistry'),
-        'rmlnk': Service(PROTOCOLS['udp'], 2818, 'rmlnk'),
-        'rmonitor': Service(PROTOCOLS['udp'], 560, 'rmonitor'),
-        'rmonitor-secure': Service(PROTOCOLS['udp'], 5145, 'rmonitor-secure'),
-        'rmonitor_secure': Service(PROTOCOLS['udp'], 5145, 'rmonitor_secure'),
-        'rmopagt': Service(PROTOCOLS['udp'], 2959, 'rmopagt'),
-        'rmpp': Service(PROTOCOLS['udp'], 1121, 'rmpp'),
-        'rmt': Service(PROTOCOLS['udp'], 411, 'rmt'),
-        'rmtserver': Service(PROTOCOLS['udp'], 2416, 'rmtserver'),
-        'rnm': Service(PROTOCOLS['udp'], 3844, 'rnm'),
-        'rnmap': Service(PROTOCOLS['udp'], 3418, 'rnmap'),
-        'rnrp': Service(PROTOCOLS['udp'], 2423, 'rnrp'),
-        'robcad-lm': Service(PROTOCOLS['udp'], 1509, 'robcad-lm'),
-        'robix': Service(PROTOCOLS['udp'], 9599, 'robix'),
-        'roboeda': Service(PROTOCOLS['udp'], 2920, 'roboeda'),
-        'roboer': Service(PROTOCOLS['udp'], 2919, 'roboer'),
-        'robotraconteur': Service(PROTOCOLS['udp'], 48653, 'robotraconteur'),
-        'roce': Service(PROTOCOLS['udp'], 4791, 'roce'),
-        'rockwell-csp2': Service(PROTOCOLS['udp'], 2223, 'rockwell-csp2'),
-        'roketz': Service(PROTOCOLS['udp'], 1730, 'roketz'),
-        'rootd': Service(PROTOCOLS['udp'], 1094, 'rootd'),
-        'routematch': Service(PROTOCOLS['udp'], 1287, 'routematch'),
-        'router': Service(PROTOCOLS['udp'], 520, 'router'),
-        'roverlog': Service(PROTOCOLS['udp'], 3677, 'roverlog'),
-        'rp-reputation': Service(PROTOCOLS['udp'], 6568, 'rp-reputation'),
-        'rpc2portmap': Service(PROTOCOLS['udp'], 369, 'rpc2portmap'),
-        'rpi': Service(PROTOCOLS['udp'], 2214, 'rpi'),
-        'rprt': Service(PROTOCOLS['udp'], 3064, 'rprt'),
-        'rrac': Service(PROTOCOLS['udp'], 5678, 'rrac'),
-        'rrdp': Service(PROTOCOLS['udp'], 5313, 'rrdp'),
-        'rrh': Service(PROTOCOLS['udp'], 753, 'rrh'),
-        'rrifmm': Service(PROTOCOLS['udp'], 1696, 'rrifmm'),
-        'rrilwm': Service(PROTOCOLS['udp'], 1695, 'rrilwm'),
-        'rrimwm': Service(PROTOCOLS['udp'], 1694, 'rrimwm'),
-        'rrirtr': Service(PROTOCOLS['udp'], 1693, 'rrirtr'),
-        'rrisat': Service(PROTOCOLS['udp'], 1697, 'rrisat'),
-        'rrp': Service(PROTOCOLS['udp'], 648, 'rrp'),
-        'rs-pias': Service(PROTOCOLS['udp'], 13217, 'rs-pias'),
-        'rs-rmi': Service(PROTOCOLS['udp'], 3736, 'rs-rmi'),
-        'rsap': Service(PROTOCOLS['udp'], 1647, 'rsap'),
-        'rsc-robot': Service(PROTOCOLS['udp'], 1793, 'rsc-robot'),
-        'rscd': Service(PROTOCOLS['udp'], 5750, 'rscd'),
-        'rscs': Service(PROTOCOLS['udp'], 10201, 'rscs'),
-        'rsf-1': Service(PROTOCOLS['udp'], 1195, 'rsf-1'),
-        'rsh-spx': Service(PROTOCOLS['udp'], 222, 'rsh-spx'),
-        'rsip': Service(PROTOCOLS['udp'], 4555, 'rsip'),
-        'rsisysaccess': Service(PROTOCOLS['udp'], 2752, 'rsisysaccess'),
-        'rsmtp': Service(PROTOCOLS['udp'], 2390, 'rsmtp'),
-        'rsom': Service(PROTOCOLS['udp'], 2889, 'rsom'),
-        'rsqlserver': Service(PROTOCOLS['udp'], 4430, 'rsqlserver'),
-        'rsvd': Service(PROTOCOLS['udp'], 168, 'rsvd'),
-        'rsvp-encap-1': Service(PROTOCOLS['udp'], 1698, 'rsvp-encap-1'),
-        'rsvp-encap-2': Service(PROTOCOLS['udp'], 1699, 'rsvp-encap-2'),
-        'rsvp-tunnel': Service(PROTOCOLS['udp'], 363, 'rsvp-tunnel'),
-        'rsvp_tunnel': Service(PROTOCOLS['udp'], 363, 'rsvp_tunnel'),
-        'rsync': Service(PROTOCOLS['udp'], 873, 'rsync'),
-        'rt-classmanager': Service(PROTOCOLS['udp'], 35004, 'rt-classmanager'),
-        'rt-event': Service(PROTOCOLS['udp'], 3706, 'rt-event'),
-        'rt-event-s': Service(PROTOCOLS['udp'], 3707, 'rt-event-s'),
-        'rt-viewer': Service(PROTOCOLS['udp'], 35001, 'rt-viewer'),
-        'rtc-pm-port': Service(PROTOCOLS['udp'], 3891, 'rtc-pm-port'),
-        'rtcm-sc104': Service(PROTOCOLS['udp'], 2101, 'rtcm-sc104'),
-        'rtelnet': Service(PROTOCOLS['udp'], 107, 'rtelnet'),
-        'rtip': Service(PROTOCOLS['udp'], 771, 'rtip'),
-        'rtmp-port': Service(PROTOCOLS['udp'], 3500, 'rtmp-port'),
-        'rtnt-1': Service(PROTOCOLS['udp'], 3137, 'rtnt-1'),
-        'rtnt-2': Service(PROTOCOLS['udp'], 3138, 'rtnt-2'),
-        'rtps-dd-mt': Service(PROTOCOLS['udp'], 7402, 'rtps-dd-mt'),
-        'rtps-dd-ut': Service(PROTOCOLS['udp'], 7401, 'rtps-dd-ut'),
-        'rtps-discovery': Service(PROTOCOLS['udp'], 7400, 'rtps-discovery'),
-        'rtraceroute': Service(PROTOCOLS['udp'], 3765, 'rtraceroute'),
-        'rtsclient': Service(PROTOCOLS['udp'], 2501, 'rtsclient'),
-        'rtsp': Service(PROTOCOLS['udp'], 554, 'rtsp'),
-        'rtsp-alt': Service(PROTOCOLS['udp'], 8554, 'rtsp-alt'),
-        'rtsps': Service(PROTOCOLS['udp'], 322, 'rtsps'),
-        'rtsserv': Service(PROTOCOLS['udp'], 2500, 'rtsserv'),
-        'rusb-sys-port': Service(PROTOCOLS['udp'], 3422, 'rusb-sys-port'),
-        'rushd': Service(PROTOCOLS['udp'], 696, 'rushd'),
-        'rvs-isdn-dcp': Service(PROTOCOLS['udp'], 2578, 'rvs-isdn-dcp'),
-        'rwhois': Service(PROTOCOLS['udp'], 4321, 'rwhois'),
-        'rxe': Service(PROTOCOLS['udp'], 761, 'rxe'),
-        'rxmon': Service(PROTOCOLS['udp'], 1311, 'rxmon'),
-        's-bfd': Service(PROTOCOLS['udp'], 7784, 's-bfd'),
-        's-net': Service(PROTOCOLS['udp'], 166, 's-net'),
-        's-openmail': Service(PROTOCOLS['udp'], 5767, 's-openmail'),
-        's102': Service(PROTOCOLS['udp'], 23272, 's102'),
-        's3db': Service(PROTOCOLS['udp'], 2278, 's3db'),
-        's8-client-port': Service(PROTOCOLS['udp'], 3153, 's8-client-port'),
-        'sa-msg-port': Service(PROTOCOLS['udp'], 1646, 'sa-msg-port'),
-        'sabams': Service(PROTOCOLS['udp'], 2760, 'sabams'),
-        'sabarsd': Service(PROTOCOLS['udp'], 8401, 'sabarsd'),
-        'sabp-signal': Service(PROTOCOLS['udp'], 3452, 'sabp-signal'),
-        'sac': Service(PROTOCOLS['udp'], 8097, 'sac'),
-        'sacred': Service(PROTOCOLS['udp'], 1118, 'sacred'),
-        'safetynetp': Service(PROTOCOLS['udp'], 40000, 'safetynetp'),
-        'saft': Service(PROTOCOLS['udp'], 487, 'saft'),
-        'sage-best-com1': Service(PROTOCOLS['udp'], 14033, 'sage-best-com1'),
-        'sage-best-com2': Service(PROTOCOLS['udp'], 14034, 'sage-best-com2'),
-        'sagectlpanel': Service(PROTOCOLS['udp'], 3698, 'sagectlpanel'),
-        'sagxtsds': Service(PROTOCOLS['udp'], 4952, 'sagxtsds'),
-        'sah-lm': Service(PROTOCOLS['udp'], 3291, 'sah-lm'),
-        'sais': Service(PROTOCOLS['udp'], 1426, 'sais'),
-        'saiscm': Service(PROTOCOLS['udp'], 1501, 'saiscm'),
-        'saiseh': Service(PROTOCOLS['udp'], 1644, 'saiseh'),
-        'saism': Service(PROTOCOLS['udp'], 1436, 'saism'),
-        'salient-dtasrv': Service(PROTOCOLS['udp'], 5409, 'salient-dtasrv'),
-        'salient-mux': Service(PROTOCOLS['udp'], 5422, 'salient-mux'),
-        'salient-usrmgr': Service(PROTOCOLS['udp'], 5410, 'salient-usrmgr'),
-        'samd': Service(PROTOCOLS['udp'], 3275, 'samd'),
-        'samsung-disc': Service(PROTOCOLS['udp'], 30832, 'samsung-disc'),
-        'samsung-unidex': Service(PROTOCOLS['udp'], 4010, 'samsung-unidex'),
-        'sanavigator': Service(PROTOCOLS['udp'], 4033, 'sanavigator'),
-        'sane-port': Service(PROTOCOLS['udp'], 6566, 'sane-port'),
-        'sanity': Service(PROTOCOLS['udp'], 643, 'sanity'),
-        'santak-ups': Service(PROTOCOLS['udp'], 3038, 'santak-ups'),
-        'santools': Service(PROTOCOLS['udp'], 4079, 'santools'),
-        'saphostctrl': Service(PROTOCOLS['udp'], 1128, 'saphostctrl'),
-        'saphostctrls': Service(PROTOCOLS['udp'], 1129, 'saphostctrls'),
-        'sapv1': Service(PROTOCOLS['udp'], 9875, 'sapv1'),
-        'saratoga': Service(PROTOCOLS['udp'], 7542, 'saratoga'),
-        'saris': Service(PROTOCOLS['udp'], 4442, 'saris'),
-        'sas-remote-hlp': Service(PROTOCOLS['udp'], 3755, 'sas-remote-hlp'),
-        'sasg': Service(PROTOCOLS['udp'], 3744, 'sasg'),
-        'sasggprs': Service(PROTOCOLS['udp'], 3964, 'sasggprs'),
-        'sasp': Service(PROTOCOLS['udp'], 3860, 'sasp'),
-        'savant': Service(PROTOCOLS['udp'], 3391, 'savant'),
-        'sbi-agent': Service(PROTOCOLS['udp'], 3962, 'sbi-agent'),
-        'sbl': Service(PROTOCOLS['udp'], 1039, 'sbl'),
-        'sbook': Service(PROTOCOLS['udp'], 1349, 'sbook'),
-        'scan-change': Service(PROTOCOLS['udp'], 2719, 'scan-change'),
-        'scanstat-1': Service(PROTOCOLS['udp'], 1215, 'scanstat-1'),
-        'scc-security': Service(PROTOCOLS['udp'], 582, 'scc-security'),
-        'sccip-media': Service(PROTOCOLS['udp'], 3499, 'sccip-media'),
-        'sceanics': Service(PROTOCOLS['udp'], 5435, 'sceanics'),
-        'scenccs': Service(PROTOCOLS['udp'], 7129, 'scenccs'),
-        'scenidm': Service(PROTOCOLS['udp'], 7128, 'scenidm'),
-        'scientia-sdb': Service(PROTOCOLS['udp'], 1811, 'scientia-sdb'),
-        'scientia-ssdb': Service(PROTOCOLS['udp'], 2121, 'scientia-ssdb'),
-        'scinet': Service(PROTOCOLS['udp'], 7708, 'scinet'),
-        'scintilla': Service(PROTOCOLS['udp'], 19007, 'scintilla'),
-        'scipticslsrvr': Service(PROTOCOLS['udp'], 2577, 'scipticslsrvr'),
-        'sco-aip': Service(PROTOCOLS['udp'], 5307, 'sco-aip'),
-        'sco-dtmgr': Service(PROTOCOLS['udp'], 617, 'sco-dtmgr'),
-        'sco-inetmgr': Service(PROTOCOLS['udp'], 615, 'sco-inetmgr'),
-        'sco-peer-tta': Service(PROTOCOLS['udp'], 5427, 'sco-peer-tta'),
-        'sco-sysmgr': Service(PROTOCOLS['udp'], 616, 'sco-sysmgr'),
-        'sco-websrvrmg3': Service(PROTOCOLS['udp'], 598, 'sco-websrvrmg3'),
-        'sco-websrvrmgr': Service(PROTOCOLS['udp'], 620, 'sco-websrvrmgr'),
-        'scohelp': Service(PROTOCOLS['udp'], 457, 'scohelp'),
-        'scoi2odialog': Service(PROTOCOLS['udp'], 360, 'scoi2odialog'),
-        'scol': Service(PROTOCOLS['udp'], 1200, 'scol'),
-        'scoremgr': Service(PROTOCOLS['udp'], 2034, 'scoremgr'),
-        'scotty-disc': Service(PROTOCOLS['udp'], 14002, 'scotty-disc'),
-        'scotty-ft': Service(PROTOCOLS['udp'], 14000, 'scotty-ft'),
-        'scp': Service(PROTOCOLS['udp'], 3820, 'scp'),
-        'scp-config': Service(PROTOCOLS['udp'], 10001, 'scp-config'),
-        'scpi-raw': Service(PROTOCOLS['udp'], 5025, 'scpi-raw'),
-        'scpi-telnet': Service(PROTOCOLS['udp'], 5024, 'scpi-telnet'),
-        'scrabble': Service(PROTOCOLS['udp'], 2026, 'scrabble'),
-        'screencast': Service(PROTOCOLS['udp'], 1368, 'screencast'),
-        'scriptview': Service(PROTOCOLS['udp'], 7741, 'scriptview'),
-        'scscp': Service(PROTOCOLS['udp'], 26133, 'scscp'),
-        'scservp': Service(PROTOCOLS['udp'], 3637, 'scservp'),
-        'scte104': Service(PROTOCOLS['udp'], 5167, 'scte104'),
-        'scte30': Service(PROTOCOLS['udp'], 5168, 'scte30'),
-        'sctp-tunneling': Service(PROTOCOLS['udp'], 9899, 'sctp-tunneling'),
-        'scup-disc': Service(PROTOCOLS['udp'], 6315, 'scup-disc'),
-        'scx-proxy': Service(PROTOCOLS['udp'], 470, 'scx-proxy'),
-        'sd-capacity': Service(PROTOCOLS['udp'], 2384, 'sd-capacity'),
-        'sd-data': Service(PROTOCOLS['udp'], 2385, 'sd-data'),
-        'sd-elmd': Service(PROTOCOLS['udp'], 1681, 'sd-elmd'),
-        'sdbproxy': Service(PROTOCOLS['udp'], 3562, 'sdbproxy'),
-        'sdclient': Service(PROTOCOLS['udp'], 2310, 'sdclient'),
-        'sddp': Service(PROTOCOLS['udp'], 1163, 'sddp'),
-        'sde-discovery': Service(PROTOCOLS['udp'], 5152, 'sde-discovery'),
-        'sdfunc': Service(PROTOCOLS['udp'], 2046, 'sdfunc'),
-        'sdhelp': Service(PROTOCOLS['udp'], 2308, 'sdhelp'),
-        'sdl-ets': Service(PROTOCOLS['udp'], 5081, 'sdl-ets'),
-        'sdmmp': Service(PROTOCOLS['udp'], 5573, 'sdmmp'),
-        'sdnskmp': Service(PROTOCOLS['udp'], 558, 'sdnskmp'),
-        'sdo': Service(PROTOCOLS['udp'], 3635, 'sdo'),
-        'sdo-ssh': Service(PROTOCOLS['udp'], 3897, 'sdo-ssh'),
-        'sdo-tls': Service(PROTOCOLS['udp'], 3896, 'sdo-tls'),
-        'sdp-id-port': Service(PROTOCOLS['udp'], 3242, 'sdp-id-port'),
-        'sdp-portmapper': Service(PROTOCOLS['udp'], 3935, 'sdp-portmapper'),
-        'sdproxy': Service(PROTOCOLS['udp'], 1297, 'sdproxy'),
-        'sds': Service(PROTOCOLS['udp'], 5059, 'sds'),
-        'sds-admin': Service(PROTOCOLS['udp'], 2705, 'sds-admin'),
-        'sdsc-lm': Service(PROTOCOLS['udp'], 1537, 'sdsc-lm'),
-        'sdserver': Service(PROTOCOLS['udp'], 2309, 'sdserver'),
-        'sdt': Service(PROTOCOLS['udp'], 5568, 'sdt'),
-        'sdt-lmd': Service(PROTOCOLS['udp'], 3319, 'sdt-lmd'),
-        'seagull-ais': Service(PROTOCOLS['udp'], 1208, 'seagull-ais'),
-        'seagulllms': Service(PROTOCOLS['udp'], 1291, 'seagulllms'),
-        'seaodbc': Service(PROTOCOLS['udp'], 2471, 'seaodbc'),
-        'search-agent': Service(PROTOCOLS['udp'], 1234, 'search-agent'),
-        'seaview': Service(PROTOCOLS['udp'], 3143, 'seaview'),
-        'sec-ntb-clnt': Service(PROTOCOLS['udp'], 32635, 'sec-ntb-clnt'),
-        'sec-pc2fax-srv': Service(PROTOCOLS['udp'], 9402, 'sec-pc2fax-srv'),
-        'sec-t4net-clt': Service(PROTOCOLS['udp'], 9401, 'sec-t4net-clt'),
-        'sec-t4net-srv': Service(PROTOCOLS['udp'], 9400, 'sec-t4net-srv'),
-        'seclayer-tcp': Service(PROTOCOLS['udp'], 3495, 'seclayer-tcp'),
-        'seclayer-tls': Service(PROTOCOLS['udp'], 3496, 'seclayer-tls'),
-        'secure-cfg-svr': Service(PROTOCOLS['udp'], 3978, 'secure-cfg-svr'),
-        'secure-mqtt': Service(PROTOCOLS['udp'], 8883, 'secure-mqtt'),
-        'secure-ts': Service(PROTOCOLS['udp'], 9318, 'secure-ts'),
-        'securitychase': Service(PROTOCOLS['udp'], 5399, 'securitychase'),
-        'seispoc': Service(PROTOCOLS['udp'], 2254, 'seispoc'),
-        'semantix': Service(PROTOCOLS['udp'], 361, 'semantix'),
-        'semaphore': Service(PROTOCOLS['udp'], 3255, 'semaphore'),
-        'send': Service(PROTOCOLS['udp'], 169, 'send'),
-        'senip': Service(PROTOCOLS['udp'], 3898, 'senip'),
-        'senomix01': Service(PROTOCOLS['udp'], 8052, 'senomix01'),
-        'senomix02': Service(PROTOCOLS['udp'], 8053, 'senomix02'),
-        'senomix03': Service(PROTOCOLS['udp'], 8054, 'senomix03'),
-        'senomix04': Service(PROTOCOLS['udp'], 8055, 'senomix04'),
-        'senomix05': Service(PROTOCOLS['udp'], 8056, 'senomix05'),
-        'senomix06': Service(PROTOCOLS['udp'], 8057, 'senomix06'),
-        'senomix07': Service(PROTOCOLS['udp'], 8058, 'senomix07'),
-        'senomix08': Service(PROTOCOLS['udp'], 8059, 'senomix08'),
-        'sent-lm': Service(PROTOCOLS['udp'], 2316, 'sent-lm'),
-        'sentinel': Service(PROTOCOLS['udp'], 3588, 'sentinel'),
-        'sentinel-ent': Service(PROTOCOLS['udp'], 3712, 'sentinel-ent'),
-        'sentinel-lm': Service(PROTOCOLS['udp'], 5093, 'sentinel-lm'),
-        'sentinelsrm': Service(PROTOCOLS['udp'], 1947, 'sentinelsrm'),
-        'sentlm-srv2srv': Service(PROTOCOLS['udp'], 5099, 'sentlm-srv2srv'),
-        'sep': Service(PROTOCOLS['udp'], 2089, 'sep'),
-        'seraph': Service(PROTOCOLS['udp'], 4076, 'seraph'),
-        'sercomm-scadmin': Service(PROTOCOLS['udp'], 6108, 'sercomm-scadmin'),
-        'sercomm-wlink': Service(PROTOCOLS['udp'], 2235, 'sercomm-wlink'),
-        'serialgateway': Service(PROTOCOLS['udp'], 1243, 'serialgateway'),
-        'server-find': Service(PROTOCOLS['udp'], 8351, 'server-find'),
-        'servergraph': Service(PROTOCOLS['udp'], 1251, 'servergraph'),
-        'serverstart': Service(PROTOCOLS['udp'], 9213, 'serverstart'),
-        'serverview-as': Service(PROTOCOLS['udp'], 3169, 'serverview-as'),
-        'serverview-asn': Service(PROTOCOLS['udp'], 3170, 'serverview-asn'),
-        'serverview-gf': Service(PROTOCOLS['udp'], 3171, 'serverview-gf'),
-        'serverview-icc': Service(PROTOCOLS['udp'], 3173, 'serverview-icc'),
-        'serverview-rm': Service(PROTOCOLS['udp'], 3172, 'serverview-rm'),
-        'serverviewdbms': Service(PROTOCOLS['udp'], 9212, 'serverviewdbms'),
-        'serverwsd2': Service(PROTOCOLS['udp'], 5362, 'serverwsd2'),
-        'service-ctrl': Service(PROTOCOLS['udp'], 2367, 'service-ctrl'),
-        'servicemeter': Service(PROTOCOLS['udp'], 2603, 'servicemeter'),
-        'servicetags': Service(PROTOCOLS['udp'], 6481, 'servicetags'),
-        'servistaitsm': Service(PROTOCOLS['udp'], 3636, 'servistaitsm'),
-        'servserv': Service(PROTOCOLS['udp'], 2011, 'servserv'),
-        'servstat': Service(PROTOCOLS['udp'], 633, 'servstat'),
-        'sesi-lm': Service(PROTOCOLS['udp'], 1714, 'sesi-lm'),
-        'set': Service(PROTOCOLS['udp'], 257, 'set'),
-        'sf-lm': Service(PROTOCOLS['udp'], 4546, 'sf-lm'),
-        'sflm': Service(PROTOCOLS['udp'], 3162, 'sflm'),
-        'sflow': Service(PROTOCOLS['udp'], 6343, 'sflow'),
-        'sfs-config': Service(PROTOCOLS['udp'], 452, 'sfs-config'),
-        'sfs-smp-net': Service(PROTOCOLS['udp'], 451, 'sfs-smp-net'),
-        'sftdst-port': Service(PROTOCOLS['udp'], 3230, 'sftdst-port'),
-        'sftp': Service(PROTOCOLS['udp'], 115, 'sftp'),
-        'sftsrv': Service(PROTOCOLS['udp'], 1303, 'sftsrv'),
-        'sftu': Service(PROTOCOLS['udp'], 3326, 'sftu'),
-        'sg-lm': Service(PROTOCOLS['udp'], 1659, 'sg-lm'),
-        'sgcip': Service(PROTOCOLS['udp'], 16950, 'sgcip'),
-        'sgcp': Service(PROTOCOLS['udp'], 440, 'sgcp'),
-        'sge-execd': Service(PROTOCOLS['udp'], 6445, 'sge-execd'),
-        'sge-qmaster': Service(PROTOCOLS['udp'], 6444, 'sge-qmaster'),
-        'sge_execd': Service(PROTOCOLS['udp'], 6445, 'sge_execd'),
-        'sge_qmaster': Service(PROTOCOLS['udp'], 6444, 'sge_qmaster'),
-        'sgi-arrayd': Service(PROTOCOLS['udp'], 5434, 'sgi-arrayd'),
-        'sgi-esphttp': Service(PROTOCOLS['udp'], 5554, 'sgi-esphttp'),
-        'sgi-eventmond': Service(PROTOCOLS['udp'], 5553, 'sgi-eventmond'),
-        'sgi-lk': Service(PROTOCOLS['udp'], 11106, 'sgi-lk'),
-        'sgi-storman': Service(PROTOCOLS['udp'], 1178, 'sgi-storman'),
-        'sgmp': Service(PROTOCOLS['udp'], 153, 'sgmp'),
-        'sgmp-traps': Service(PROTOCOLS['udp'], 160, 'sgmp-traps'),
-        'shadowserver': Service(PROTOCOLS['udp'], 2027, 'shadowserver'),
-        'shadowstream': Service(PROTOCOLS['udp'], 4366, 'shadowstream'),
-        'shaperai-disc': Service(PROTOCOLS['udp'], 43210, 'shaperai-disc'),
-        'shareapp': Service(PROTOCOLS['udp'], 3595, 'shareapp'),
-        'sharp-server': Service(PROTOCOLS['udp'], 3617, 'sharp-server'),
-        'shilp': Service(PROTOCOLS['udp'], 2049, 'shilp'),
-        'shiva-confsrvr': Service(PROTOCOLS['udp'], 1651, 'shiva-confsrvr'),
-        'shiva_confsrvr': Service(PROTOCOLS['udp'], 1651, 'shiva_confsrvr'),
-        'shivadiscovery': Service(PROTOCOLS['udp'], 1502, 'shivadiscovery'),
-        'shivasound': Service(PROTOCOLS['udp'], 1549, 'shivasound'),
-        'shockwave': Service(PROTOCOLS['udp'], 1626, 'shockwave'),
-        'shockwave2': Service(PROTOCOLS['udp'], 1257, 'shockwave2'),
-        'shofar': Service(PROTOCOLS['udp'], 4105, 'shofar'),
-        'shrewd-stream': Service(PROTOCOLS['udp'], 22335, 'shrewd-stream'),
-        'shrinkwrap': Service(PROTOCOLS['udp'], 358, 'shrinkwrap'),
-        'siam': Service(PROTOCOLS['udp'], 498, 'siam'),
-        'sicct-sdp': Service(PROTOCOLS['udp'], 4742, 'sicct-sdp'),
-        'siebel-ns': Service(PROTOCOLS['udp'], 2320, 'siebel-ns'),
-        'siemensgsm': Service(PROTOCOLS['udp'], 28240, 'siemensgsm'),
-        'sift-uft': Service(PROTOCOLS['udp'], 608, 'sift-uft'),
-        'sightline': Service(PROTOCOLS['udp'], 1645, 'sightline'),
-        'sigma-port': Service(PROTOCOLS['udp'], 3614, 'sigma-port'),
-        'signal': Service(PROTOCOLS['udp'], 2974, 'signal'),
-        'signet-ctf': Service(PROTOCOLS['udp'], 2733, 'signet-ctf'),
-        'siipat': Service(PROTOCOLS['udp'], 1733, 'siipat'),
-        'silc': Service(PROTOCOLS['udp'], 706, 'silc'),
-        'silhouette': Service(PROTOCOLS['udp'], 7500, 'silhouette'),
-        'silkmeter': Service(PROTOCOLS['udp'], 5461, 'silkmeter'),
-        'silkp1': Service(PROTOCOLS['udp'], 2829, 'silkp1'),
-        'silkp2': Service(PROTOCOLS['udp'], 2830, 'silkp2'),
-        'silkp3': Service(PROTOCOLS['udp'], 2831, 'silkp3'),
-        'silkp4': Service(PROTOCOLS['udp'], 2832, 'silkp4'),
-        'silverpeakcomm': Service(PROTOCOLS['udp'], 4164, 'silverpeakcomm'),
-        'silverpeakpeer': Service(PROTOCOLS['udp'], 4163, 'silverpeakpeer'),
-        'silverplatter': Service(PROTOCOLS['udp'], 416, 'silverplatter'),
-        'sim-control': Service(PROTOCOLS['udp'], 3110, 'sim-control'),
-        'simba-cs': Service(PROTOCOLS['udp'], 1543, 'simba-cs'),
-        'simbaexpress': Service(PROTOCOLS['udp'], 1583, 'simbaexpress'),
-        'simbaservices': Service(PROTOCOLS['udp'], 1599, 'simbaservices'),
-        'simctlp': Service(PROTOCOLS['udp'], 2857, 'simctlp'),
-        'simon-disc': Service(PROTOCOLS['udp'], 4753, 'simon-disc'),
-        'simp-all': Service(PROTOCOLS['udp'], 1959, 'simp-all'),
-        'simple-push': Service(PROTOCOLS['udp'], 3687, 'simple-push'),
-        'simple-push-s': Service(PROTOCOLS['udp'], 3688, 'simple-push-s'),
-        'simple-tx-rx': Service(PROTOCOLS['udp'], 2257, 'simple-tx-rx'),
-        'simplement-tie': Service(PROTOCOLS['udp'], 2756, 'simplement-tie'),
-        'simplifymedia': Service(PROTOCOLS['udp'], 8087, 'simplifymedia'),
-        'simslink': Service(PROTOCOLS['udp'], 2676, 'simslink'),
-        'sip': Service(PROTOCOLS['udp'], 5060, 'sip'),
-        'sips': Service(PROTOCOLS['udp'], 5061, 'sips'),
-        'sis-emt': Service(PROTOCOLS['udp'], 2545, 'sis-emt'),
-        'sitaradir': Service(PROTOCOLS['udp'], 2631, 'sitaradir'),
-        'sitaramgmt': Service(PROTOCOLS['udp'], 2630, 'sitaramgmt'),
-        'sitaraserver': Service(PROTOCOLS['udp'], 2629, 'sitaraserver'),
-        'sitewatch': Service(PROTOCOLS['udp'], 3792, 'sitewatch'),
-        'six-degrees': Service(PROTOCOLS['udp'], 3611, 'six-degrees'),
-        'sixnetudr': Service(PROTOCOLS['udp'], 1658, 'sixnetudr'),
-        'sixtrak': Service(PROTOCOLS['udp'], 1594, 'sixtrak'),
-        'sixxsconfig': Service(PROTOCOLS['udp'], 3874, 'sixxsconfig'),
-        'skip-cert-recv': Service(PROTOCOLS['udp'], 6455, 'skip-cert-recv'),
-        'skip-cert-send': Service(PROTOCOLS['udp'], 6456, 'skip-cert-send'),
-        'skip-mc-gikreq': Service(PROTOCOLS['udp'], 1660, 'skip-mc-gikreq'),
-        'skronk': Service(PROTOCOLS['udp'], 460, 'skronk'),
-        'sky-transport': Service(PROTOCOLS['udp'], 3556, 'sky-transport'),
-        'skytelnet': Service(PROTOCOLS['udp'], 1618, 'skytelnet'),
-        'slc-ctrlrloops': Service(PROTOCOLS['udp'], 2827, 'slc-ctrlrloops'),
-        'slc-systemlog': Service(PROTOCOLS['udp'], 2826, 'slc-systemlog'),
-        'slim-devices': Service(PROTOCOLS['udp'], 3483, 'slim-devices'),
-        'slingshot': Service(PROTOCOLS['udp'], 1705, 'slingshot'),
-        'slinkysearch': Service(PROTOCOLS['udp'], 1225, 'slinkysearch'),
-        'slinterbase': Service(PROTOCOLS['udp'], 3065, 'slinterbase'),
-        'slm-api': Service(PROTOCOLS['udp'], 1606, 'slm-api'),
-        'slp': Service(PROTOCOLS['udp'], 1605, 'slp'),
-        'slp-notify': Service(PROTOCOLS['udp'], 1847, 'slp-notify'),
-        'slslavemon': Service(PROTOCOLS['udp'], 3102, 'slslavemon'),
-        'slush': Service(PROTOCOLS['udp'], 1966, 'slush'),
-        'sm-disc': Service(PROTOCOLS['udp'], 4174, 'sm-disc'),
-        'sm-pas-1': Service(PROTOCOLS['udp'], 2938, 'sm-pas-1'),
-        'sm-pas-2': Service(PROTOCOLS['udp'], 2939, 'sm-pas-2'),
-        'sm-pas-3': Service(PROTOCOLS['udp'], 2940, 'sm-pas-3'),
-        'sm-pas-4': Service(PROTOCOLS['udp'], 2941, 'sm-pas-4'),
-        'sm-pas-5': Service(PROTOCOLS['udp'], 2942, 'sm-pas-5'),
-        'sma-spw': Service(PROTOCOLS['udp'], 9522, 'sma-spw'),
-        'smaclmgr': Service(PROTOCOLS['udp'], 4660, 'smaclmgr'),
-        'smakynet': Service(PROTOCOLS['udp'], 122, 'smakynet'),
-        'smallchat': Service(PROTOCOLS['udp'], 4412, 'smallchat'),
-        'smap': Service(PROTOCOLS['udp'], 3731, 'smap'),
-        'smar-se-port1': Service(PROTOCOLS['udp'], 4987, 'smar-se-port1'),
-        'smar-se-port2': Service(PROTOCOLS['udp'], 4988, 'smar-se-port2'),
-        'smart-diagnose': Service(PROTOCOLS['udp'], 2721, 'smart-diagnose'),
-        'smart-lm': Service(PROTOCOLS['udp'], 1608, 'smart-lm'),
-        'smartcard-port': Service(PROTOCOLS['udp'], 3516, 'smartcard-port'),
-        'smartcard-tls': Service(PROTOCOLS['udp'], 4116, 'smartcard-tls'),
-        'smartpackets': Service(PROTOCOLS['udp'], 3218, 'smartpackets'),
-        'smartsdp': Service(PROTOCOLS['udp'], 426, 'smartsdp'),
-        'smauth-port': Service(PROTOCOLS['udp'], 3929, 'smauth-port'),
-        'smc-admin': Service(PROTOCOLS['udp'], 6787, 'smc-admin'),
-        'smc-http': Service(PROTOCOLS['udp'], 6788, 'smc-http'),
-        'smc-jmx': Service(PROTOCOLS['udp'], 6786, 'smc-jmx'),
-        'smile': Service(PROTOCOLS['udp'], 3670, 'smile'),
-        'smip': Service(PROTOCOLS['udp'], 7734, 'smip'),
-        'smntubootstrap': Service(PROTOCOLS['udp'], 2613, 'smntubootstrap'),
-        'smpnameres': Service(PROTOCOLS['udp'], 901, 'smpnameres'),
-        'smpp': Service(PROTOCOLS['udp'], 2775, 'smpp'),
-        'smpppd': Service(PROTOCOLS['udp'], 3185, 'smpppd'),
-        'smpte': Service(PROTOCOLS['udp'], 420, 'smpte'),
-        'sms-chat': Service(PROTOCOLS['udp'], 2703, 'sms-chat'),
-        'sms-rcinfo': Service(PROTOCOLS['udp'], 2701, 'sms-rcinfo'),
-        'sms-remctrl': Service(PROTOCOLS['udp'], 2704, 'sms-remctrl'),
-        'sms-xfer': Service(PROTOCOLS['udp'], 2702, 'sms-xfer'),
-        'smsd': Service(PROTOCOLS['udp'], 596, 'smsd'),
-        'smsp': Service(PROTOCOLS['udp'], 413, 'smsp'),
-        'smsqp': Service(PROTOCOLS['udp'], 11201, 'smsqp'),
-        'smtp': Service(PROTOCOLS['udp'], 25, 'smtp'),
-        'smux': Service(PROTOCOLS['udp'], 199, 'smux'),
-        'smwan': Service(PROTOCOLS['udp'], 3979, 'smwan'),
-        'sna-cs': Service(PROTOCOLS['udp'], 1553, 'sna-cs'),
-        'snac': Service(PROTOCOLS['udp'], 3536, 'snac'),
-        'snagas': Service(PROTOCOLS['udp'], 108, 'snagas'),
-        'snap': Service(PROTOCOLS['udp'], 4752, 'snap'),
-        'snapd': Service(PROTOCOLS['udp'], 2599, 'snapd'),
-        'snapenetio': Service(PROTOCOLS['udp'], 22000, 'snapenetio'),
-        'snapp': Service(PROTOCOLS['udp'], 2333, 'snapp'),
-        'snare': Service(PROTOCOLS['udp'], 509, 'snare'),
-        'snaresecure': Service(PROTOCOLS['udp'], 1684, 'snaresecure'),
-        'sncp': Service(PROTOCOLS['udp'], 7560, 'sncp'),
-        'snifferclient': Service(PROTOCOLS['udp'], 2452, 'snifferclient'),
-        'snifferdata': Service(PROTOCOLS['udp'], 2892, 'snifferdata'),
-        'snifferserver': Service(PROTOCOLS['udp'], 2533, 'snifferserver'),
-        'snip-slave': Service(PROTOCOLS['udp'], 33656, 'snip-slave'),
-        'snmp': Service(PROTOCOLS['udp'], 161, 'snmp'),
-        'snmp-tcp-port': Service(PROTOCOLS['udp'], 1993, 'snmp-tcp-port'),
-        'snmpdtls': Service(PROTOCOLS['udp'], 10161, 'snmpdtls'),
-        'snmpdtls-trap': Service(PROTOCOLS['udp'], 10162, 'snmpdtls-trap'),
-        'snmptrap': Service(PROTOCOLS['udp'], 162, 'snmptrap'),
-        'snpp': Service(PROTOCOLS['udp'], 444, 'snpp'),
-        'sns-admin': Service(PROTOCOLS['udp'], 2658, 'sns-admin'),
-        'sns-agent': Service(PROTOCOLS['udp'], 5417, 'sns-agent'),
-        'sns-channels': Service(PROTOCOLS['udp'], 3380, 'sns-channels'),
-        'sns-dispatcher': Service(PROTOCOLS['udp'], 2657, 'sns-dispatcher'),
-        'sns-gateway': Service(PROTOCOLS['udp'], 5416, 'sns-gateway'),
-        'sns-protocol': Service(PROTOCOLS['udp'], 2409, 'sns-protocol'),
-        'sns-query': Service(PROTOCOLS['udp'], 2659, 'sns-query'),
-        'sns-quote': Service(PROTOCOLS['udp'], 1967, 'sns-quote'),
-        'snss': Service(PROTOCOLS['udp'], 11171, 'snss'),
-        'sntlkeyssrvr': Service(PROTOCOLS['udp'], 9450, 'sntlkeyssrvr'),
-        'sntp-heartbeat': Service(PROTOCOLS['udp'], 580, 'sntp-heartbeat'),
-        'soagateway': Service(PROTOCOLS['udp'], 5250, 'soagateway'),
-        'soap-beep': Service(PROTOCOLS['udp'], 605, 'soap-beep'),
-        'soap-http': Service(PROTOCOLS['udp'], 7627, 'soap-http'),
-        'socalia': Service(PROTOCOLS['udp'], 5100, 'socalia'),
-        'socks': Service(PROTOCOLS['udp'], 1080, 'socks'),
-        'socorfs': Service(PROTOCOLS['udp'], 3379, 'socorfs'),
-        'socp-c': Service(PROTOCOLS['udp'], 4882, 'socp-c'),
-        'socp-t': Service(PROTOCOLS['udp'], 4881, 'socp-t'),
-        'softaudit': Service(PROTOCOLS['udp'], 3419, 'softaudit'),
-        'softcm': Service(PROTOCOLS['udp'], 6110, 'softcm'),
-        'softdataphone': Service(PROTOCOLS['udp'], 1621, 'softdataphone'),
-        'softpc': Service(PROTOCOLS['udp'], 215, 'softpc'),
-        'softrack-meter': Service(PROTOCOLS['udp'], 3884, 'softrack-meter'),
-        'solera-epmap': Service(PROTOCOLS['udp'], 2132, 'solera-epmap'),
-        'solera-lpn': Service(PROTOCOLS['udp'], 4738, 'solera-lpn'),
-        'solid-e-engine': Service(PROTOCOLS['udp'], 1964, 'solid-e-engine'),
-        'solid-mux': Service(PROTOCOLS['udp'], 1029, 'solid-mux'),
-        'solve': Service(PROTOCOLS['udp'], 2636, 'solve'),
-        'sonar': Service(PROTOCOLS['udp'], 572, 'sonar'),
-        'sonardata': Service(PROTOCOLS['udp'], 2863, 'sonardata'),
-        'soniqsync': Service(PROTOCOLS['udp'], 3803, 'soniqsync'),
-        'sonus': Service(PROTOCOLS['udp'], 2653, 'sonus'),
-        'sonus-logging': Service(PROTOCOLS['udp'], 2290, 'sonus-logging'),
-        'sonuscallsig': Service(PROTOCOLS['udp'], 2569, 'sonuscallsig'),
-        'sophia-lm': Service(PROTOCOLS['udp'], 1408, 'sophia-lm'),
-        'sops': Service(PROTOCOLS['udp'], 3944, 'sops'),
-        'sor-update': Service(PROTOCOLS['udp'], 3922, 'sor-update'),
-        'sos': Service(PROTOCOLS['udp'], 3838, 'sos'),
-        'sossd-disc': Service(PROTOCOLS['udp'], 7982, 'sossd-disc'),
-        'sossecollector': Service(PROTOCOLS['udp'], 3166, 'sossecollector'),
-        'soundsvirtual': Service(PROTOCOLS['udp'], 17185, 'soundsvirtual'),
-        'spamtrap': Service(PROTOCOLS['udp'], 2568, 'spamtrap'),
-        'spandataport': Service(PROTOCOLS['udp'], 3193, 'spandataport'),
-        'spc': Service(PROTOCOLS['udp'], 6111, 'spc'),
-        'spcsdlobby': Service(PROTOCOLS['udp'], 2888, 'spcsdlobby'),
-        'spdp': Service(PROTOCOLS['udp'], 5794, 'spdp'),
-        'spearway': Service(PROTOCOLS['udp'], 2440, 'spearway'),
-        'spectardata': Service(PROTOCOLS['udp'], 3834, 'spectardata'),
-        'spectardb': Service(PROTOCOLS['udp'], 3835, 'spectardb'),
-        'spectraport': Service(PROTOCOLS['udp'], 3851, 'spectraport'),
-        'speedtrace-disc': Service(PROTOCOLS['udp'], 33334, 'speedtrace-disc'),
-        'spg': Service(PROTOCOLS['udp'], 7016, 'spg'),
-        'spice': Service(PROTOCOLS['udp'], 1923, 'spice'),
-        'spike': Service(PROTOCOLS['udp'], 4683, 'spike'),
-        'spiral-admin': Service(PROTOCOLS['udp'], 3438, 'spiral-admin'),
-        'splitlock': Service(PROTOCOLS['udp'], 3606, 'splitlock'),
-        'splitlock-gw': Service(PROTOCOLS['udp'], 3647, 'splitlock-gw'),
-        'spmp': Service(PROTOCOLS['udp'], 656, 'spmp'),
-        'spock': Service(PROTOCOLS['udp'], 2507, 'spock'),
-        'spocp': Service(PROTOCOLS['udp'], 4751, 'spocp'),
-        'spramsca': Service(PROTOCOLS['udp'], 5769, 'spramsca'),
-        'spramsd': Service(PROTOCOLS['udp'], 5770, 'spramsd'),
-        'sps-tunnel': Service(PROTOCOLS['udp'], 2876, 'sps-tunnel'),
-        'spsc': Service(PROTOCOLS['udp'], 478, 'spsc'),
-        'spss': Service(PROTOCOLS['udp'], 5443, 'spss'),
-        'spss-lm': Service(PROTOCOLS['udp'], 1759, 'spss-lm'),
-        'spt-automation': Service(PROTOCOLS['udp'], 5814, 'spt-automation'),
-        'spugna': Service(PROTOCOLS['udp'], 3807, 'spugna'),
-        'spw-dialer': Service(PROTOCOLS['udp'], 3796, 'spw-dialer'),
-        'spw-dnspreload': Service(PROTOCOLS['udp'], 3849, 'spw-dnspreload'),
-        'spytechphone': Service(PROTOCOLS['udp'], 8192, 'spytechphone'),
-        'sqdr': Service(PROTOCOLS['udp'], 2728, 'sqdr'),
-        'sql*net': Service(PROTOCOLS['udp'], 66, 'sql*net'),
-        'sql-net': Service(PROTOCOLS['udp'], 150, 'sql-net'),
-        'sqlexec': Service(PROTOCOLS['udp'], 9088, 'sqlexec'),
-        'sqlexec-ssl': Service(PROTOCOLS['udp'], 9089, 'sqlexec-ssl'),
-        'sqlserv': Service(PROTOCOLS['udp'], 118, 'sqlserv'),
-        'sqlsrv': Service(PROTOCOLS['udp'], 156, 'sqlsrv'),
-        'src': Service(PROTOCOLS['udp'], 200, 'src'),
-        'srcp': Service(PROTOCOLS['udp'], 4303, 'srcp'),
-        'srdp': Service(PROTOCOLS['udp'], 3942, 'srdp'),
-        'srmp': Service(PROTOCOLS['udp'], 193, 'srmp'),
-        'srp-feedback': Service(PROTOCOLS['udp'], 2737, 'srp-feedback'),
-        'srssend': Service(PROTOCOLS['udp'], 362, 'srssend'),
-        'srvc-registry': Service(PROTOCOLS['udp'], 3018, 'srvc-registry'),
-        'srvc_registry': Service(PROTOCOLS['udp'], 3018, 'srvc_registry'),
-        'ss-idi-disc': Service(PROTOCOLS['udp'], 20012, 'ss-idi-disc'),
-        'ss7ns': Service(PROTOCOLS['udp'], 477, 'ss7ns'),
-        'ssad': Service(PROTOCOLS['udp'], 4750, 'ssad'),
-        'ssc-agent': Service(PROTOCOLS['udp'], 2967, 'ssc-agent'),
-        'sscan': Service(PROTOCOLS['udp'], 3853, 'sscan'),
-        'ssdispatch': Service(PROTOCOLS['udp'], 3430, 'ssdispatch'),
-        'ssdp': Service(PROTOCOLS['udp'], 1900, 'ssdp'),
-        'ssdtp': Service(PROTOCOLS['udp'], 6071, 'ssdtp'),
-        'sse-app-config': Service(PROTOCOLS['udp'], 3852, 'sse-app-config'),
-        'ssh': Service(PROTOCOLS['udp'], 22, 'ssh'),
-        'ssh-mgmt': Service(PROTOCOLS['udp'], 17235, 'ssh-mgmt'),
-        'sshell': Service(PROTOCOLS['udp'], 614, 'sshell'),
-        'sslp': Service(PROTOCOLS['udp'], 1750, 'sslp'),
-        'ssm-cssps': Service(PROTOCOLS['udp'], 2478, 'ssm-cssps'),
-        'ssm-cvs': Service(PROTOCOLS['udp'], 2477, 'ssm-cvs'),
-        'ssm-els': Service(PROTOCOLS['udp'], 2479, 'ssm-els'),
-        'ssmd': Service(PROTOCOLS['udp'], 2187, 'ssmd'),
-        'ssmpp': Service(PROTOCOLS['udp'], 3550, 'ssmpp'),
-        'sso-control': Service(PROTOCOLS['udp'], 2711, 'sso-control'),
-        'sso-service': Service(PROTOCOLS['udp'], 2710, 'sso-service'),
-        'ssowatch': Service(PROTOCOLS['udp'], 3644, 'ssowatch'),
-        'ssp': Service(PROTOCOLS['udp'], 3249, 'ssp'),
-        'ssp-client': Service(PROTOCOLS['udp'], 7801, 'ssp-client'),
-        'ssports-bcast': Service(PROTOCOLS['udp'], 8808, 'ssports-bcast'),
-        'ssql': Service(PROTOCOLS['udp'], 3352, 'ssql'),
-        'ssr-servermgr': Service(PROTOCOLS['udp'], 45966, 'ssr-servermgr'),
-        'ssrip': Service(PROTOCOLS['udp'], 3318, 'ssrip'),
-        'ssslic-mgr': Service(PROTOCOLS['udp'], 1203, 'ssslic-mgr'),
-        'ssslog-mgr': Service(PROTOCOLS['udp'], 1204, 'ssslog-mgr'),
-        'sst': Service(PROTOCOLS['udp'], 266, 'sst'),
-        'sstp-1': Service(PROTOCOLS['udp'], 7743, 'sstp-1'),
-        'sstp-2': Service(PROTOCOLS['udp'], 9801, 'sstp-2'),
-        'sstsys-lm': Service(PROTOCOLS['udp'], 1692, 'sstsys-lm'),
-        'stanag-5066': Service(PROTOCOLS['udp'], 5066, 'stanag-5066'),
-        'starbot': Service(PROTOCOLS['udp'], 2838, 'starbot'),
-        'starfish': Service(PROTOCOLS['udp'], 3981, 'starfish'),
-        'stargatealerts': Service(PROTOCOLS['udp'], 1654, 'stargatealerts'),
-        'starquiz-port': Service(PROTOCOLS['udp'], 3526, 'starquiz-port'),
-        'stars': Service(PROTOCOLS['udp'], 4131, 'stars'),
-        'starschool': Service(PROTOCOLS['udp'], 2270, 'starschool'),
-        'start-network': Service(PROTOCOLS['udp'], 3615, 'start-network'),
-        'startron': Service(PROTOCOLS['udp'], 1057, 'startron'),
-        'stat-cc': Service(PROTOCOLS['udp'], 4158, 'stat-cc'),
-        'stat-results': Service(PROTOCOLS['udp'], 4156, 'stat-results'),
-        'stat-scanner': Service(PROTOCOLS['udp'], 4157, 'stat-scanner'),
-        'statsci1-lm': Service(PROTOCOLS['udp'], 6144, 'statsci1-lm'),
-        'statsci2-lm': Service(PROTOCOLS['udp'], 6145, 'statsci2-lm'),
-        'statsrv': Service(PROTOCOLS['udp'], 133, 'statsrv'),
-        'statusd': Service(PROTOCOLS['udp'], 5414, 'statusd'),
-        'stdptc': Service(PROTOCOLS['udp'], 2154, 'stdptc'),
-        'ste-smsc': Service(PROTOCOLS['udp'], 1836, 'ste-smsc'),
-        'stgxfws': Service(PROTOCOLS['udp'], 1226, 'stgxfws'),
-        'sti-envision': Service(PROTOCOLS['udp'], 1312, 'sti-envision'),
-        'stm-pproc': Service(PROTOCOLS['udp'], 3080, 'stm-pproc'),
-        'stm_pproc': Service(PROTOCOLS['udp'], 3080, 'stm_pproc'),
-        'stmf': Service(PROTOCOLS['udp'], 501, 'stmf'),
-        'stone-design-1': Service(PROTOCOLS['udp'], 1492, 'stone-design-1'),
-        'stonefalls': Service(PROTOCOLS['udp'], 2986, 'stonefalls'),
-        'storman': Service(PROTOCOLS['udp'], 4178, 'storman'),
-        'storview': Service(PROTOCOLS['udp'], 9293, 'storview'),
-        'streamcomm-ds': Service(PROTOCOLS['udp'], 9612, 'streamcomm-ds'),
-        'street-stream': Service(PROTOCOLS['udp'], 1736, 'street-stream'),
-        'streetperfect': Service(PROTOCOLS['udp'], 1330, 'streetperfect'),
-        'streettalk': Service(PROTOCOLS['udp'], 566, 'streettalk'),
-        'stresstester': Service(PROTOCOLS['udp'], 5397, 'stresstester'),
-        'strexec-d': Service(PROTOCOLS['udp'], 5026, 'strexec-d'),
-        'strexec-s': Service(PROTOCOLS['udp'], 5027, 'strexec-s'),
-        'stryker-com': Service(PROTOCOLS['udp'], 3854, 'stryker-com'),
-        'stss': Service(PROTOCOLS['udp'], 3090, 'stss'),
-        'stt': Service(PROTOCOLS['udp'], 1607, 'stt'),
-        'stun': Service(PROTOCOLS['udp'], 3478, 'stun'),
-        'stun-behavior': Service(PROTOCOLS['udp'], 3478, 'stun-behavior'),
-        'stun-behaviors': Service(PROTOCOLS['udp'], 5349, 'stun-behaviors'),
-        'stun-p1': Service(PROTOCOLS['udp'], 1990, 'stun-p1'),
-        'stun-p2': Service(PROTOCOLS['udp'], 1991, 'stun-p2'),
-        'stun-p3': Service(PROTOCOLS['udp'], 1992, 'stun-p3'),
-        'stun-port': Service(PROTOCOLS['udp'], 1994, 'stun-port'),
-        'stuns': Service(PROTOCOLS['udp'], 5349, 'stuns'),
-        'stvp': Service(PROTOCOLS['udp'], 3158, 'stvp'),
-        'stx': Service(PROTOCOLS['udp'], 527, 'stx'),
-        'su-mit-tg': Service(PROTOCOLS['udp'], 89, 'su-mit-tg'),
-        'sua': Service(PROTOCOLS['udp'], 14001, 'sua'),
-        'submission': Service(PROTOCOLS['udp'], 587, 'submission'),
-        'submitserver': Service(PROTOCOLS['udp'], 2028, 'submitserver'),
-        'subntbcst-tftp': Service(PROTOCOLS['udp'], 247, 'subntbcst-tftp'),
-        'subntbcst_tftp': Service(PROTOCOLS['udp'], 247, 'subntbcst_tftp'),
-        'sugp': Service(PROTOCOLS['udp'], 1905, 'sugp'),
-        'suitcase': Service(PROTOCOLS['udp'], 2903, 'suitcase'),
-        'suitjd': Service(PROTOCOLS['udp'], 3354, 'suitjd'),
-        'sum': Service(PROTOCOLS['udp'], 6551, 'sum'),
-        'sun-as-iiops': Service(PROTOCOLS['udp'], 3708, 'sun-as-iiops'),
-        'sun-as-iiops-ca': Service(PROTOCOLS['udp'], 3808, 'sun-as-iiops-ca'),
-        'sun-as-jmxrmi': Service(PROTOCOLS['udp'], 8686, 'sun-as-jmxrmi'),
-        'sun-as-jpda': Service(PROTOCOLS['udp'], 9191, 'sun-as-jpda'),
-        'sun-as-nodeagt': Service(PROTOCOLS['udp'], 4850, 'sun-as-nodeagt'),
-        'sun-dr': Service(PROTOCOLS['udp'], 665, 'sun-dr'),
-        'sun-lm': Service(PROTOCOLS['udp'], 7588, 'sun-lm'),
-        'sun-mc-grp': Service(PROTOCOLS['udp'], 5306, 'sun-mc-grp'),
-        'sun-sea-port': Service(PROTOCOLS['udp'], 16161, 'sun-sea-port'),
-        'sun-sr-admin': Service(PROTOCOLS['udp'], 6489, 'sun-sr-admin'),
-        'sun-sr-http': Service(PROTOCOLS['udp'], 6480, 'sun-sr-http'),
-        'sun-sr-https': Service(PROTOCOLS['udp'], 6443, 'sun-sr-https'),
-        'sun-sr-iiop': Service(PROTOCOLS['udp'], 6485, 'sun-sr-iiop'),
-        'sun-sr-iiop-aut': Service(PROTOCOLS['udp'], 6487, 'sun-sr-iiop-aut'),
-        'sun-sr-iiops': Service(PROTOCOLS['udp'], 6486, 'sun-sr-iiops'),
-        'sun-sr-jms': Service(PROTOCOLS['udp'], 6484, 'sun-sr-jms'),
-        'sun-sr-jmx': Service(PROTOCOLS['udp'], 6488, 'sun-sr-jmx'),
-        'sun-user-https': Service(PROTOCOLS['udp'], 7677, 'sun-user-https'),
-        'suncacao-csa': Service(PROTOCOLS['udp'], 11164, 'suncacao-csa'),
-        'suncacao-jmxmp': Service(PROTOCOLS['udp'], 11162, 'suncacao-jmxmp'),
-        'suncacao-rmi': Service(PROTOCOLS['udp'], 11163, 'suncacao-rmi'),
-        'suncacao-snmp': Service(PROTOCOLS['udp'], 11161, 'suncacao-snmp'),
-        'suncacao-websvc': Service(PROTOCOLS['udp'], 11165, 'suncacao-websvc'),
-        'sunclustergeo': Service(PROTOCOLS['udp'], 2084, 'sunclustergeo'),
-        'sunclustermgr': Service(PROTOCOLS['udp'], 1097, 'sunclustermgr'),
-        'sunfm-port': Service(PROTOCOLS['udp'], 3934, 'sunfm-port'),
-        'sunlps-http': Service(PROTOCOLS['udp'], 3816, 'sunlps-http'),
-        'sunproxyadmin': Service(PROTOCOLS['udp'], 8081, 'sunproxyadmin'),
-        'sunrpc': Service(PROTOCOLS['udp'], 111, 'sunrpc'),
-        'sunscalar-dns': Service(PROTOCOLS['udp'], 1870, 'sunscalar-dns'),
-        'sunscalar-svc': Service(PROTOCOLS['udp'], 1860, 'sunscalar-svc'),
-        'sunvts-rmi': Service(PROTOCOLS['udp'], 6483, 'sunvts-rmi'),
-        'sunwebadmin': Service(PROTOCOLS['udp'], 8800, 'sunwebadmin'),
-        'sunwebadmins': Service(PROTOCOLS['udp'], 8989, 'sunwebadmins'),
-        'supdup': Service(PROTOCOLS['udp'], 95, 'supdup'),
-        'supercell': Service(PROTOCOLS['udp'], 7967, 'supercell'),
-        'supermon': Service(PROTOCOLS['udp'], 2709, 'supermon'),
-        'sur-meas': Service(PROTOCOLS['udp'], 243, 'sur-meas'),
-        'surebox': Service(PROTOCOLS['udp'], 5453, 'surebox'),
-        'surf': Service(PROTOCOLS['udp'], 1010, 'surf'),
-        'surfcontrolcpa': Service(PROTOCOLS['udp'], 3909, 'surfcontrolcpa'),
-        'surfpass': Service(PROTOCOLS['udp'], 5030, 'surfpass'),
-        'surveyinst': Service(PROTOCOLS['udp'], 3212, 'surveyinst'),
-        'suucp': Service(PROTOCOLS['udp'], 4031, 'suucp'),
-        'svdrp-disc': Service(PROTOCOLS['udp'], 6419, 'svdrp-disc'),
-        'svn': Service(PROTOCOLS['udp'], 3690, 'svn'),
-        'svnet': Service(PROTOCOLS['udp'], 3413, 'svnet'),
-        'svnetworks': Service(PROTOCOLS['udp'], 2973, 'svnetworks'),
-        'svrloc': Service(PROTOCOLS['udp'], 427, 'svrloc'),
-        'svs-omagent': Service(PROTOCOLS['udp'], 1625, 'svs-omagent'),
-        'swa-1': Service(PROTOCOLS['udp'], 9023, 'swa-1'),
-        'swa-2': Service(PROTOCOLS['udp'], 9024, 'swa-2'),
-        'swa-3': Service(PROTOCOLS['udp'], 9025, 'swa-3'),
-        'swa-4': Service(PROTOCOLS['udp'], 9026, 'swa-4'),
-        'swdtp': Service(PROTOCOLS['udp'], 10104, 'swdtp'),
-        'swdtp-sv': Service(PROTOCOLS['udp'], 10009, 'swdtp-sv'),
-        'sweetware-apps': Service(PROTOCOLS['udp'], 1221, 'sweetware-apps'),
-        'swift-rvf': Service(PROTOCOLS['udp'], 97, 'swift-rvf'),
-        'swiftnet': Service(PROTOCOLS['udp'], 1751, 'swiftnet'),
-        'swismgr1': Service(PROTOCOLS['udp'], 6963, 'swismgr1'),
-        'swismgr2': Service(PROTOCOLS['udp'], 6964, 'swismgr2'),
-        'swispol': Service(PROTOCOLS['udp'], 6966, 'swispol'),
-        'swistrap': Service(PROTOCOLS['udp'], 6965, 'swistrap'),
-        'swldy-sias': Service(PROTOCOLS['udp'], 1250, 'swldy-sias'),
-        'swr-port': Service(PROTOCOLS['udp'], 3491, 'swr-port'),
-        'swrmi': Service(PROTOCOLS['udp'], 1866, 'swrmi'),
-        'swtp-port1': Service(PROTOCOLS['udp'], 9281, 'swtp-port1'),
-        'swtp-port2': Service(PROTOCOLS['udp'], 9282, 'swtp-port2'),
-        'swx-gate': Service(PROTOCOLS['udp'], 4538, 'swx-gate'),
-        'swxadmin': Service(PROTOCOLS['udp'], 5043, 'swxadmin'),
-        'sxmp': Service(PROTOCOLS['udp'], 3273, 'sxmp'),
-        'sxuptp': Service(PROTOCOLS['udp'], 19540, 'sxuptp'),
-        'syam-agent': Service(PROTOCOLS['udp'], 3894, 'syam-agent'),
-        'syam-smc': Service(PROTOCOLS['udp'], 3895, 'syam-smc'),
-        'syam-webserver': Service(PROTOCOLS['udp'], 3930, 'syam-webserver'),
-        'sybase-sqlany': Service(PROTOCOLS['udp'], 1498, 'sybase-sqlany'),
-        'sybaseanywhere': Service(PROTOCOLS['udp'], 2638, 'sybaseanywhere'),
-        'sybasedbsynch': Service(PROTOCOLS['udp'], 2439, 'sybasedbsynch'),
-        'sybasesrvmon': Service(PROTOCOLS['udp'], 4950, 'sybasesrvmon'),
-        'sychrond': Service(PROTOCOLS['udp'], 3723, 'sychrond'),
-        'symantec-sfdb': Service(PROTOCOLS['udp'], 5629, 'symantec-sfdb'),
-        'symantec-sim': Service(PROTOCOLS['udp'], 3547, 'symantec-sim'),
-        'symb-sb-port': Service(PROTOCOLS['udp'], 3923, 'symb-sb-port'),
-        'symplex': Service(PROTOCOLS['udp'], 1507, 'symplex'),
-        'synapse': Service(PROTOCOLS['udp'], 2880, 'synapse'),
-        'synapse-nhttp': Service(PROTOCOLS['udp'], 8280, 'synapse-nhttp'),
-        'synapse-nhttps': Service(PROTOCOLS['udp'], 8243, 'synapse-nhttps'),
-        'synapsis-edge': Service(PROTOCOLS['udp'], 5008, 'synapsis-edge'),
-        'sync-em7': Service(PROTOCOLS['udp'], 7707, 'sync-em7'),
-        'synchromesh': Service(PROTOCOLS['udp'], 4548, 'synchromesh'),
-        'synchronet-db': Service(PROTOCOLS['udp'], 6100, 'synchronet-db'),
-        'synchronet-rtc': Service(PROTOCOLS['udp'], 6101, 'synchronet-rtc'),
-        'synchronet-upd': Service(PROTOCOLS['udp'], 6102, 'synchronet-upd'),
-        'synchronite': Service(PROTOCOLS['udp'], 4106, 'synchronite'),
-        'syncserver': Service(PROTOCOLS['udp'], 2647, 'syncserver'),
-        'syncserverssl': Service(PROTOCOLS['udp'], 2679, 'syncserverssl'),
-        'synel-data': Service(PROTOCOLS['udp'], 3734, 'synel-data'),
-        'synoptics-trap': Service(PROTOCOLS['udp'], 412, 'synoptics-trap'),
-        'synotics-broker': Service(PROTOCOLS['udp'], 392, 'synotics-broker'),
-        'synotics-relay': Service(PROTOCOLS['udp'], 391, 'synotics-relay'),
-        'sype-transport': Service(PROTOCOLS['udp'], 9911, 'sype-transport'),
-        'syscomlan': Service(PROTOCOLS['udp'], 1065, 'syscomlan'),
-        'sysinfo-sp': Service(PROTOCOLS['udp'], 11967, 'sysinfo-sp'),
-        'syslog': Service(PROTOCOLS['udp'], 514, 'syslog'),
-        'syslog-conn': Service(PROTOCOLS['udp'], 601, 'syslog-conn'),
-        'syslog-tls': Service(PROTOCOLS['udp'], 6514, 'syslog-tls'),
-        'sysopt': Service(PROTOCOLS['udp'], 3281, 'sysopt'),
-        'sysorb': Service(PROTOCOLS['udp'], 3241, 'sysorb'),
-        'sysrqd': Service(PROTOCOLS['udp'], 4094, 'sysrqd'),
-        'sysscanner': Service(PROTOCOLS['udp'], 3251, 'sysscanner'),
-        'systat': Service(PROTOCOLS['udp'], 11, 'systat'),
-        'system-monitor': Service(PROTOCOLS['udp'], 2609, 'system-monitor'),
-        'systemics-sox': Service(PROTOCOLS['udp'], 5406, 'systemics-sox'),
-        't1-e1-over-ip': Service(PROTOCOLS['udp'], 3175, 't1-e1-over-ip'),
-        't128-gateway': Service(PROTOCOLS['udp'], 1627, 't128-gateway'),
-        't1distproc': Service(PROTOCOLS['udp'], 1274, 't1distproc'),
-        't1distproc60': Service(PROTOCOLS['udp'], 32249, 't1distproc60'),
-        't2-brm': Service(PROTOCOLS['udp'], 7933, 't2-brm'),
-        't2-drm': Service(PROTOCOLS['udp'], 7932, 't2-drm'),
-        'tabula': Service(PROTOCOLS['udp'], 1437, 'tabula'),
-        'tacacs': Service(PROTOCOLS['udp'], 49, 'tacacs'),
-        'tacacs-ds': Service(PROTOCOLS['udp'], 65, 'tacacs-ds'),
-        'tacnews': Service(PROTOCOLS['udp'], 98, 'tacnews'),
-        'tacticalauth': Service(PROTOCOLS['udp'], 2392, 'tacticalauth'),
-        'taep-as-svc': Service(PROTOCOLS['udp'], 5111, 'taep-as-svc'),
-        'tag-pm': Service(PROTOCOLS['udp'], 5073, 'tag-pm'),
-        'tag-ups-1': Service(PROTOCOLS['udp'], 3573, 'tag-ups-1'),
-        'taiclock': Service(PROTOCOLS['udp'], 4014, 'taiclock'),
-        'tal-pod': Service(PROTOCOLS['udp'], 6149, 'tal-pod'),
-        'talarian-mcast1': Service(PROTOCOLS['udp'], 4015, 'talarian-mcast1'),
-        'talarian-mcast2': Service(PROTOCOLS['udp'], 4016, 'talarian-mcast2'),
-        'talarian-mcast3': Service(PROTOCOLS['udp'], 4017, 'talarian-mcast3'),
-        'talarian-mcast4': Service(PROTOCOLS['udp'], 4018, 'talarian-mcast4'),
-        'talarian-mcast5': Service(PROTOCOLS['udp'], 4019, 'talarian-mcast5'),
-        'talarian-mqs': Service(PROTOCOLS['udp'], 2493, 'talarian-mqs'),
-        'talarian-udp': Service(PROTOCOLS['udp'], 5101, 'talarian-udp'),
-        'taligent-lm': Service(PROTOCOLS['udp'], 1475, 'taligent-lm'),
-        'talikaserver': Service(PROTOCOLS['udp'], 22763, 'talikaserver'),
-        'talk': Service(PROTOCOLS['udp'], 517, 'talk'),
-        'talnet': Service(PROTOCOLS['udp'], 1838, 'talnet'),
-        'talon-disc': Service(PROTOCOLS['udp'], 7011, 'talon-disc'),
-        'talon-engine': Service(PROTOCOLS['udp'], 7012, 'talon-engine'),
-        'talon-webserver': Service(PROTOCOLS['udp'], 7015, 'talon-webserver'),
-        'tambora': Service(PROTOCOLS['udp'], 9020, 'tambora'),
-        'tams': Service(PROTOCOLS['udp'], 2726, 'tams'),
-        'tapestry': Service(PROTOCOLS['udp'], 1922, 'tapestry'),
-        'tapeware': Service(PROTOCOLS['udp'], 3817, 'tapeware'),
-        'tappi-boxnet': Service(PROTOCOLS['udp'], 2306, 'tappi-boxnet'),
-        'tarantella': Service(PROTOCOLS['udp'], 3144, 'tarantella'),
-        'targus-getdata': Service(PROTOCOLS['udp'], 5200, 'targus-getdata'),
-        'targus-getdata1': Service(PROTOCOLS['udp'], 5201, 'targus-getdata1'),
-        'targus-getdata2': Service(PROTOCOLS['udp'], 5202, 'targus-getdata2'),
-        'targus-getdata3': Service(PROTOCOLS['udp'], 5203, 'targus-getdata3'),
-        'taserver': Service(PROTOCOLS['udp'], 3552, 'taserver'),
-        'taskman-port': Service(PROTOCOLS['udp'], 2470, 'taskman-port'),
-        'taskmaster2000': Service(PROTOCOLS['udp'], 2403, 'taskmaster2000'),
-        'tasp-net': Service(PROTOCOLS['udp'], 25900, 'tasp-net'),
-        'taurus-wh': Service(PROTOCOLS['udp'], 1610, 'taurus-wh'),
-        'tbrpf': Service(PROTOCOLS['udp'], 712, 'tbrpf'),
-        'tcc-http': Service(PROTOCOLS['udp'], 24680, 'tcc-http'),
-        'tcim-control': Service(PROTOCOLS['udp'], 2729, 'tcim-control'),
-        'tclprodebugger': Service(PROTOCOLS['udp'], 2576, 'tclprodebugger'),
-        'tcoaddressbook': Service(PROTOCOLS['udp'], 1977, 'tcoaddressbook'),
-        'tcoflashagent': Service(PROTOCOLS['udp'], 1975, 'tcoflashagent'),
-        'tcoregagent': Service(PROTOCOLS['udp'], 1976, 'tcoregagent'),
-        'tcp-id-port': Service(PROTOCOLS['udp'], 1999, 'tcp-id-port'),
-        'tcpdataserver': Service(PROTOCOLS['udp'], 3805, 'tcpdataserver'),
-        'tcpmux': Service(PROTOCOLS['udp'], 1, 'tcpmux'),
-        'tcpnethaspsrv': Service(PROTOCOLS['udp'], 475, 'tcpnethaspsrv'),
-        'td-postman': Service(PROTOCOLS['udp'], 1049, 'td-postman'),
-        'td-replica': Service(PROTOCOLS['udp'], 268, 'td-replica'),
-        'td-service': Service(PROTOCOLS['udp'], 267, 'td-service'),
-        'tdaccess': Service(PROTOCOLS['udp'], 2910, 'tdaccess'),
-        'tdmoip': Service(PROTOCOLS['udp'], 2142, 'tdmoip'),
-        'tdp-suite': Service(PROTOCOLS['udp'], 1814, 'tdp-suite'),
-        'teamcoherence': Service(PROTOCOLS['udp'], 9222, 'teamcoherence'),
-        'tec5-sdctp': Service(PROTOCOLS['udp'], 9668, 'tec5-sdctp'),
-        'teedtap': Service(PROTOCOLS['udp'], 559, 'teedtap'),
-        'tekpls': Service(PROTOCOLS['udp'], 1946, 'tekpls'),
-        'telaconsole': Service(PROTOCOLS['udp'], 5428, 'telaconsole'),
-        'telefinder': Service(PROTOCOLS['udp'], 1474, 'telefinder'),
-        'telelpathattack': Service(PROTOCOLS['udp'], 5011, 'telelpathattack'),
-        'telelpathstart': Service(PROTOCOLS['udp'], 5010, 'telelpathstart'),
-        'teleniumdaemon': Service(PROTOCOLS['udp'], 2060, 'teleniumdaemon'),
-        'telesis-licman': Service(PROTOCOLS['udp'], 1380, 'telesis-licman'),
-        'telindus': Service(PROTOCOLS['udp'], 1728, 'telindus'),
-        'tell': Service(PROTOCOLS['udp'], 754, 'tell'),
-        'tellumat-nms': Service(PROTOCOLS['udp'], 3549, 'tellumat-nms'),
-        'telnet': Service(PROTOCOLS['udp'], 23, 'telnet'),
-        'telnetcpcd': Service(PROTOCOLS['udp'], 3696, 'telnetcpcd'),
-        'telnets': Service(PROTOCOLS['udp'], 992, 'telnets'),
-        'telops-lmd': Service(PROTOCOLS['udp'], 7491, 'telops-lmd'),
-        'tempest-port': Service(PROTOCOLS['udp'], 11600, 'tempest-port'),
-        'tempo': Service(PROTOCOLS['udp'], 526, 'tempo'),
-        'tenfold': Service(PROTOCOLS['udp'], 658, 'tenfold'),
-        'terabase': Service(PROTOCOLS['udp'], 4000, 'terabase'),
-        'teradataordbms': Service(PROTOCOLS['udp'], 8002, 'teradataordbms'),
-        'teredo': Service(PROTOCOLS['udp'], 3544, 'teredo'),
-        'terminaldb': Service(PROTOCOLS['udp'], 2008, 'terminaldb'),
-        'tetrinet': Service(PROTOCOLS['udp'], 31457, 'tetrinet'),
-        'texar': Service(PROTOCOLS['udp'], 333, 'texar'),
-        'tftp': Service(PROTOCOLS['udp'], 69, 'tftp'),
-        'tftp-mcast': Service(PROTOCOLS['udp'], 1758, 'tftp-mcast'),
-        'tftps': Service(PROTOCOLS['udp'], 3713, 'tftps'),
-        'tgcconnect': Service(PROTOCOLS['udp'], 4146, 'tgcconnect'),
-        'tgp': Service(PROTOCOLS['udp'], 1223, 'tgp'),
-        'thermo-calc': Service(PROTOCOLS['udp'], 6201, 'thermo-calc'),
-        'theta-lm': Service(PROTOCOLS['udp'], 2296, 'theta-lm'),
-        'thrp': Service(PROTOCOLS['udp'], 3963, 'thrp'),
-        'thrtx': Service(PROTOCOLS['udp'], 4139, 'thrtx'),
-        'tht-treasure': Service(PROTOCOLS['udp'], 1832, 'tht-treasure'),
-        'ticf-1': Service(PROTOCOLS['udp'], 492, 'ticf-1'),
-        'ticf-2': Service(PROTOCOLS['udp'], 493, 'ticf-2'),
-        'tick-port': Service(PROTOCOLS['udp'], 3200, 'tick-port'),
-        'tidp': Service(PROTOCOLS['udp'], 7548, 'tidp'),
-        'tiepie-disc': Service(PROTOCOLS['udp'], 5450, 'tiepie-disc'),
-        'tig': Service(PROTOCOLS['udp'], 3943, 'tig'),
-        'tigv2': Service(PROTOCOLS['udp'], 4124, 'tigv2'),
-        'timbuktu': Service(PROTOCOLS['udp'], 407, 'timbuktu'),
-        'timbuktu-srv1': Service(PROTOCOLS['udp'], 1417, 'timbuktu-srv1'),
-        'timbuktu-srv2': Service(PROTOCOLS['udp'], 1418, 'timbuktu-srv2'),
-        'timbuktu-srv3': Service(PROTOCOLS['udp'], 1419, 'timbuktu-srv3'),
-        'timbuktu-srv4': Service(PROTOCOLS['udp'], 1420, 'timbuktu-srv4'),
-        'time': Service(PROTOCOLS['udp'], 37, 'time'),
-        'timed': Service(PROTOCOLS['udp'], 525, 'timed'),
-        'timeflies': Service(PROTOCOLS['udp'], 1362, 'timeflies'),
-        'timelot': Service(PROTOCOLS['udp'], 3243, 'timelot'),
-        'timestenbroker': Service(PROTOCOLS['udp'], 3754, 'timestenbroker'),
-        'tinc': Service(PROTOCOLS['udp'], 655, 'tinc'),
-        'tinymessage': Service(PROTOCOLS['udp'], 5104, 'tinymessage'),
-        'tip-app-server': Service(PROTOCOLS['udp'], 3160, 'tip-app-server'),
-        'tip2': Service(PROTOCOLS['udp'], 3372, 'tip2'),
-        'tipc': Service(PROTOCOLS['udp'], 6118, 'tipc'),
-        'tivoconnect': Service(PROTOCOLS['udp'], 2190, 'tivoconnect'),
-        'tivoli-npm': Service(PROTOCOLS['udp'], 1965, 'tivoli-npm'),
-        'tksocket': Service(PROTOCOLS['udp'], 2915, 'tksocket'),
-        'tl1': Service(PROTOCOLS['udp'], 2361, 'tl1'),
-        'tl1-lv': Service(PROTOCOLS['udp'], 3081, 'tl1-lv'),
-        'tl1-raw': Service(PROTOCOLS['udp'], 3082, 'tl1-raw'),
-        'tl1-raw-ssl': Service(PROTOCOLS['udp'], 6251, 'tl1-raw-ssl'),
-        'tl1-ssh': Service(PROTOCOLS['udp'], 6252, 'tl1-ssh'),
-        'tl1-telnet': Service(PROTOCOLS['udp'], 3083, 'tl1-telnet'),
-        'tlisrv': Service(PROTOCOLS['udp'], 1527, 'tlisrv'),
-        'tmesis-upshot': Service(PROTOCOLS['udp'], 2798, 'tmesis-upshot'),
-        'tmi': Service(PROTOCOLS['udp'], 8300, 'tmi'),
-        'tmo-icon-sync': Service(PROTOCOLS['udp'], 5583, 'tmo-icon-sync'),
-        'tmophl7mts': Service(PROTOCOLS['udp'], 20046, 'tmophl7mts'),
-        'tmosms0': Service(PROTOCOLS['udp'], 5580, 'tmosms0'),
-        'tmosms1': Service(PROTOCOLS['udp'], 5581, 'tmosms1'),
-        'tn-timing': Service(PROTOCOLS['udp'], 2739, 'tn-timing'),
-        'tn-tl-fd1': Service(PROTOCOLS['udp'], 476, 'tn-tl-fd1'),
-        'tn-tl-fd2': Service(PROTOCOLS['udp'], 1584, 'tn-tl-fd2'),
-        'tn-tl-r2': Service(PROTOCOLS['udp'], 1580, 'tn-tl-r2'),
-        'tn-tl-w2': Service(PROTOCOLS['udp'], 474, 'tn-tl-w2'),
-        'tnetos': Service(PROTOCOLS['udp'], 377, 'tnetos'),
-        'tnmpv2': Service(PROTOCOLS['udp'], 3686, 'tnmpv2'),
-        'tnos-dp': Service(PROTOCOLS['udp'], 7902, 'tnos-dp'),
-        'tnos-dps': Service(PROTOCOLS['udp'], 7903, 'tnos-dps'),
-        'tnos-sp': Service(PROTOCOLS['udp'], 7901, 'tnos-sp'),
-        'tnp': Service(PROTOCOLS['udp'], 8321, 'tnp'),
-        'tnp-discover': Service(PROTOCOLS['udp'], 8320, 'tnp-discover'),
-        'tnp1-port': Service(PROTOCOLS['udp'], 4024, 'tnp1-port'),
-        'tns-adv': Service(PROTOCOLS['udp'], 3309, 'tns-adv'),
-        'tns-cml': Service(PROTOCOLS['udp'], 590, 'tns-cml'),
-        'tns-server': Service(PROTOCOLS['udp'], 3308, 'tns-server'),
-        'toad': Service(PROTOCOLS['udp'], 2669, 'toad'),
-        'tolfab': Service(PROTOCOLS['udp'], 20167, 'tolfab'),
-        'tolteces': Service(PROTOCOLS['udp'], 4375, 'tolteces'),
-        'tomato-springs': Service(PROTOCOLS['udp'], 3040, 'tomato-springs'),
-        'tonidods': Service(PROTOCOLS['udp'], 24465, 'tonidods'),
-        'topflow': Service(PROTOCOLS['udp'], 2885, 'topflow'),
-        'topflow-ssl': Service(PROTOCOLS['udp'], 3885, 'topflow-ssl'),
-        'topovista-data': Service(PROTOCOLS['udp'], 3906, 'topovista-data'),
-        'topx': Service(PROTOCOLS['udp'], 2436, 'topx'),
-        'touchnetplus': Service(PROTOCOLS['udp'], 2158, 'touchnetplus'),
-        'tpcsrvr': Service(PROTOCOLS['udp'], 2078, 'tpcsrvr'),
-        'tpdu': Service(PROTOCOLS['udp'], 1430, 'tpdu'),
-        'tpip': Service(PROTOCOLS['udp'], 594, 'tpip'),
-        'tpmd': Service(PROTOCOLS['udp'], 1906, 'tpmd'),
-        'tqdata': Service(PROTOCOLS['udp'], 2700, 'tqdata'),
-        'tr-rsrb-p1': Service(PROTOCOLS['udp'], 1987, 'tr-rsrb-p1'),
-        'tr-rsrb-p2': Service(PROTOCOLS['udp'], 1988, 'tr-rsrb-p2'),
-        'tr-rsrb-p3': Service(PROTOCOLS['udp'], 1989, 'tr-rsrb-p3'),
-        'tr-rsrb-port': Service(PROTOCOLS['udp'], 1996, 'tr-rsrb-port'),
-        'traceroute': Service(PROTOCOLS['udp'], 33434, 'traceroute'),
-        'track': Service(PROTOCOLS['udp'], 20670, 'track'),
-        'tragic': Service(PROTOCOLS['udp'], 2642, 'tragic'),
-        'traingpsdata': Service(PROTOCOLS['udp'], 9277, 'traingpsdata'),
-        'tram': Service(PROTOCOLS['udp'], 4567, 'tram'),
-        'transact': Service(PROTOCOLS['udp'], 1869, 'transact'),
-        'transmit-port': Service(PROTOCOLS['udp'], 5282, 'transmit-port'),
-        'trap': Service(PROTOCOLS['udp'], 4020, 'trap'),
-        'trap-daemon': Service(PROTOCOLS['udp'], 3600, 'trap-daemon'),
-        'trap-port': Service(PROTOCOLS['udp'], 3857, 'trap-port'),
-        'trap-port-mom': Service(PROTOCOLS['udp'], 3858, 'trap-port-mom'),
-        'traversal': Service(PROTOCOLS['udp'], 4678, 'traversal'),
-        'travsoft-ipx-t': Service(PROTOCOLS['udp'], 2644, 'travsoft-ipx-t'),
-        'trc-netpoll': Service(PROTOCOLS['udp'], 2405, 'trc-netpoll'),
-        'trdp-md': Service(PROTOCOLS['udp'], 17225, 'trdp-md'),
-        'trdp-pd': Service(PROTOCOLS['udp'], 17224, 'trdp-pd'),
-        'treehopper': Service(PROTOCOLS['udp'], 3959, 'treehopper'),
-        'trendchip-dcp': Service(PROTOCOLS['udp'], 3608, 'trendchip-dcp'),
-        'tributary': Service(PROTOCOLS['udp'], 2580, 'tributary'),
-        'trident-data': Service(PROTOCOLS['udp'], 7727, 'trident-data'),
-        'trim': Service(PROTOCOLS['udp'], 1137, 'trim'),
-        'trim-event': Service(PROTOCOLS['udp'], 4322, 'trim-event'),
-        'trim-ice': Service(PROTOCOLS['udp'], 4323, 'trim-ice'),
-        'trinity-dist': Service(PROTOCOLS['udp'], 4711, 'trinity-dist'),
-        'triomotion': Service(PROTOCOLS['udp'], 3240, 'triomotion'),
-        'trip': Service(PROTOCOLS['udp'], 6069, 'trip'),
-        'tripe': Service(PROTOCOLS['udp'], 4070, 'tripe'),
-        'tripwire': Service(PROTOCOLS['udp'], 1169, 'tripwire'),
-        'triquest-lm': Service(PROTOCOLS['udp'], 1588, 'triquest-lm'),
-        'trisoap': Service(PROTOCOLS['udp'], 10200, 'trisoap'),
-        'trispen-sra': Service(PROTOCOLS['udp'], 9555, 'trispen-sra'),
-        'tritium-can': Service(PROTOCOLS['udp'], 4876, 'tritium-can'),
-        'trivnet1': Service(PROTOCOLS['udp'], 8200, 'trivnet1'),
-        'trivnet2': Service(PROTOCOLS['udp'], 8201, 'trivnet2'),
-        'trnsprntproxy': Service(PROTOCOLS['udp'], 3346, 'trnsprntproxy'),
-        'trp': Service(PROTOCOLS['udp'], 2156, 'trp'),
-        'truckstar': Service(PROTOCOLS['udp'], 4725, 'truckstar'),
-        'truecm': Service(PROTOCOLS['udp'], 8804, 'truecm'),
-        'trueconf': Service(PROTOCOLS['udp'], 4307, 'trueconf'),
-        'trusted-web': Service(PROTOCOLS['udp'], 3011, 'trusted-web'),
-        'trustestablish': Service(PROTOCOLS['udp'], 2573, 'trustestablish'),
-        'tsa': Service(PROTOCOLS['udp'], 6689, 'tsa'),
-        'tsaf': Service(PROTOCOLS['udp'], 12753, 'tsaf'),
-        'tsb': Service(PROTOCOLS['udp'], 2741, 'tsb'),
-        'tsb2': Service(PROTOCOLS['udp'], 2742, 'tsb2'),
-        'tscchat': Service(PROTOCOLS['udp'], 2330, 'tscchat'),
-        'tsdos390': Service(PROTOCOLS['udp'], 1237, 'tsdos390'),
-        'tserver': Service(PROTOCOLS['udp'], 450, 'tserver'),
-        'tsilb': Service(PROTOCOLS['udp'], 2489, 'tsilb'),
-        'tsp': Service(PROTOCOLS['udp'], 3653, 'tsp'),
-        'tsrmagt': Service(PROTOCOLS['udp'], 2077, 'tsrmagt'),
-        'tsspmap': Service(PROTOCOLS['udp'], 1568, 'tsspmap'),
-        'ttat3lb': Service(PROTOCOLS['udp'], 3579, 'ttat3lb'),
-        'ttc': Service(PROTOCOLS['udp'], 2483, 'ttc'),
-        'ttc-etap': Service(PROTOCOLS['udp'], 2675, 'ttc-etap'),
-        'ttc-etap-ds': Service(PROTOCOLS['udp'], 2978, 'ttc-etap-ds'),
-        'ttc-etap-ns': Service(PROTOCOLS['udp'], 2977, 'ttc-etap-ns'),
-        'ttc-ssl': Service(PROTOCOLS['udp'], 2484, 'ttc-ssl'),
-        'ttcmremotectrl': Service(PROTOCOLS['udp'], 3468, 'ttcmremotectrl'),
-        'ttg-protocol': Service(PROTOCOLS['udp'], 2862, 'ttg-protocol'),
-        'ttl-publisher': Service(PROTOCOLS['udp'], 5462, 'ttl-publisher'),
-        'ttlpriceproxy': Service(PROTOCOLS['udp'], 5463, 'ttlpriceproxy'),
-        'ttnrepository': Service(PROTOCOLS['udp'], 2943, 'ttnrepository'),
-        'ttntspauto': Service(PROTOCOLS['udp'], 3474, 'ttntspauto'),
-        'tunalyzer': Service(PROTOCOLS['udp'], 5748, 'tunalyzer'),
-        'tunatic': Service(PROTOCOLS['udp'], 5747, 'tunatic'),
-        'tungsten-http': Service(PROTOCOLS['udp'], 9762, 'tungsten-http'),
-        'tungsten-https': Service(PROTOCOLS['udp'], 9443, 'tungsten-https'),
-        'tunnel': Service(PROTOCOLS['udp'], 604, 'tunnel'),
-        'tunstall-pnc': Service(PROTOCOLS['udp'], 1846, 'tunstall-pnc'),
-        'turbonote-1': Service(PROTOCOLS['udp'], 39681, 'turbonote-1'),
-        'turbonote-2': Service(PROTOCOLS['udp'], 34249, 'turbonote-2'),
-        'turn': Service(PROTOCOLS['udp'], 3478, 'turn'),
-        'turns': Service(PROTOCOLS['udp'], 5349, 'turns'),
-        'tvbus': Service(PROTOCOLS['udp'], 2191, 'tvbus'),
-        'tvdumtray-port': Service(PROTOCOLS['udp'], 3492, 'tvdumtray-port'),
-        'tve-announce': Service(PROTOCOLS['udp'], 2670, 'tve-announce'),
-        'tvnetworkvideo': Service(PROTOCOLS['udp'], 3791, 'tvnetworkvideo'),
-        'tvpm': Service(PROTOCOLS['udp'], 21800, 'tvpm'),
-        'tw-auth-key': Service(PROTOCOLS['udp'], 27999, 'tw-auth-key'),
-        'twamp-control': Service(PROTOCOLS['udp'], 862, 'twamp-control'),
-        'twcss': Service(PROTOCOLS['udp'], 3428, 'twcss'),
-        'twrpc': Service(PROTOCOLS['udp'], 3479, 'twrpc'),
-        'twsdss': Service(PROTOCOLS['udp'], 3012, 'twsdss'),
-        'u-dbap': Service(PROTOCOLS['udp'], 3584, 'u-dbap'),
-        'ua-secureagent': Service(PROTOCOLS['udp'], 19194, 'ua-secureagent'),
-        'uaac': Service(PROTOCOLS['udp'], 145, 'uaac'),
-        'uacs': Service(PROTOCOLS['udp'], 2768, 'uacs'),
-        'uadtc': Service(PROTOCOLS['udp'], 2767, 'uadtc'),
-        'uaiact': Service(PROTOCOLS['udp'], 1470, 'uaiact'),
-        'uarps': Service(PROTOCOLS['udp'], 219, 'uarps'),
-        'ubroker': Service(PROTOCOLS['udp'], 7887, 'ubroker'),
-        'ubxd': Service(PROTOCOLS['udp'], 4034, 'ubxd'),
-        'ucentric-ds': Service(PROTOCOLS['udp'], 2879, 'ucentric-ds'),
-        'ucontrol': Service(PROTOCOLS['udp'], 13894, 'ucontrol'),
-        'udp-sr-port': Service(PROTOCOLS['udp'], 1624, 'udp-sr-port'),
-        'udpradio': Service(PROTOCOLS['udp'], 1833, 'udpradio'),
-        'udrawgraph': Service(PROTOCOLS['udp'], 2542, 'udrawgraph'),
-        'udrive': Service(PROTOCOLS['udp'], 1867, 'udrive'),
-        'udt-os': Service(PROTOCOLS['udp'], 3900, 'udt-os'),
-        'udt_os': Service(PROTOCOLS['udp'], 3900, 'udt_os'),
-        'ufastro-instr': Service(PROTOCOLS['udp'], 3720, 'ufastro-instr'),
-        'ufmp': Service(PROTOCOLS['udp'], 6306, 'ufmp'),
-        'uis': Service(PROTOCOLS['udp'], 390, 'uis'),
-        'ulistproc': Service(PROTOCOLS['udp'], 372, 'ulistproc'),
-        'ulp': Service(PROTOCOLS['udp'], 522, 'ulp'),
-        'ulpnet': Service(PROTOCOLS['udp'], 483, 'ulpnet'),
-        'ultimad': Service(PROTOCOLS['udp'], 1737, 'ultimad'),
-        'ultrabac': Service(PROTOCOLS['udp'], 1910, 'ultrabac'),
-        'ultraseek-http': Service(PROTOCOLS['udp'], 8765, 'ultraseek-http'),
-        'ultrex': Service(PROTOCOLS['udp'], 1327, 'ultrex'),
-        'uma': Service(PROTOCOLS['udp'], 1797, 'uma'),
-        'umm-port': Service(PROTOCOLS['udp'], 3098, 'umm-port'),
-        'ums': Service(PROTOCOLS['udp'], 2248, 'ums'),
-        'umsp': Service(PROTOCOLS['udp'], 2110, 'umsp'),
-        'unbind-cluster': Service(PROTOCOLS['udp'], 2138, 'unbind-cluster'),
-        'unet': Service(PROTOCOLS['udp'], 1189, 'unet'),
-        'unglue': Service(PROTOCOLS['udp'], 2655, 'unglue'),
-        'unicall': Service(PROTOCOLS['udp'], 4343, 'unicall'),
-        'unicontrol': Service(PROTOCOLS['udp'], 2499, 'unicontrol'),
-        'unidata-ldm': Service(PROTOCOLS['udp'], 388, 'unidata-ldm'),
-        'unieng': Service(PROTOCOLS['udp'], 5730, 'unieng'),
-        'unify': Service(PROTOCOLS['udp'], 181, 'unify'),
-        'unify-adapter': Service(PROTOCOLS['udp'], 1889, 'unify-adapter'),
-        'unify-debug': Service(PROTOCOLS['udp'], 4867, 'unify-debug'),
-        'unifyadmin': Service(PROTOCOLS['udp'], 2696, 'unifyadmin'),
-        'unihub-server': Service(PROTOCOLS['udp'], 2357, 'unihub-server'),
-        'unikeypro': Service(PROTOCOLS['udp'], 4127, 'unikeypro'),
-        'unimobilectrl': Service(PROTOCOLS['udp'], 2927, 'unimobilectrl'),
-        'uniport': Service(PROTOCOLS['udp'], 9629, 'uniport'),
-        'unisql': Service(PROTOCOLS['udp'], 1978, 'unisql'),
-        'unisql-java': Service(PROTOCOLS['udp'], 1979, 'unisql-java'),
-        'unisys-eportal': Service(PROTOCOLS['udp'], 37654, 'unisys-eportal'),
-        'unisys-lm': Service(PROTOCOLS['udp'], 1823, 'unisys-lm'),
-        'unite': Service(PROTOCOLS['udp'], 3217, 'unite'),
-        'univ-appserver': Service(PROTOCOLS['udp'], 1233, 'univ-appserver'),
-        'universe-suite': Service(PROTOCOLS['udp'], 4184, 'universe-suite'),
-        'universe_suite': Service(PROTOCOLS['udp'], 4184, 'universe_suite'),
-        'univision': Service(PROTOCOLS['udp'], 2820, 'univision'),
-        'unix-status': Service(PROTOCOLS['udp'], 1957, 'unix-status'),
-        'unizensus': Service(PROTOCOLS['udp'], 1151, 'unizensus'),
-        'unot': Service(PROTOCOLS['udp'], 5055, 'unot'),
-        'uohost': Service(PROTOCOLS['udp'], 3314, 'uohost'),
-        'uorb': Service(PROTOCOLS['udp'], 3313, 'uorb'),
-        'upgrade': Service(PROTOCOLS['udp'], 2537, 'upgrade'),
-        'upnotifyp': Service(PROTOCOLS['udp'], 4445, 'upnotifyp'),
-        'upnotifyps': Service(PROTOCOLS['udp'], 3356, 'upnotifyps'),
-        'ups': Service(PROTOCOLS['udp'], 401, 'ups'),
-        'ups-engine': Service(PROTOCOLS['udp'], 3664, 'ups-engine'),
-        'ups-onlinet': Service(PROTOCOLS['udp'], 7010, 'ups-onlinet'),
-        'upsnotifyprot': Service(PROTOCOLS['udp'], 2648, 'upsnotifyprot'),
-        'upstriggervsw': Service(PROTOCOLS['udp'], 3786, 'upstriggervsw'),
-        'urbisnet': Service(PROTOCOLS['udp'], 2745, 'urbisnet'),
-        'urld-port': Service(PROTOCOLS['udp'], 3534, 'urld-port'),
-        'urm': Service(PROTOCOLS['udp'], 606, 'urm'),
-        'us-cli': Service(PROTOCOLS['udp'], 8082, 'us-cli'),
-        'us-gv': Service(PROTOCOLS['udp'], 1370, 'us-gv'),
-        'us-srv': Service(PROTOCOLS['udp'], 8083, 'us-srv'),
-        'user-manager': Service(PROTOCOLS['udp'], 3272, 'user-manager'),
-        'usicontentpush': Service(PROTOCOLS['udp'], 7998, 'usicontentpush'),
-        'utcd': Service(PROTOCOLS['udp'], 1506, 'utcd'),
-        'utime': Service(PROTOCOLS['udp'], 519, 'utime'),
-        'utmpcd': Service(PROTOCOLS['udp'], 431, 'utmpcd'),
-        'utmpsd': Service(PROTOCOLS['udp'], 430, 'utmpsd'),
-        'utsftp': Service(PROTOCOLS['udp'], 2529, 'utsftp'),
-        'uucp': Service(PROTOCOLS['udp'], 540, 'uucp'),
-        'uucp-path': Service(PROTOCOLS['udp'], 117, 'uucp-path'),
-        'uucp-rlogin': Service(PROTOCOLS['udp'], 541, 'uucp-rlogin'),
-        'uuidgen': Service(PROTOCOLS['udp'], 697, 'uuidgen'),
-        'v-one-spp': Service(PROTOCOLS['udp'], 3845, 'v-one-spp'),
-        'v2g-secc': Service(PROTOCOLS['udp'], 15118, 'v2g-secc'),
-        'v5ua': Service(PROTOCOLS['udp'], 5675, 'v5ua'),
-        'va-pacbase': Service(PROTOCOLS['udp'], 3676, 'va-pacbase'),
-        'vacdsm-app': Service(PROTOCOLS['udp'], 671, 'vacdsm-app'),
-        'vacdsm-sws': Service(PROTOCOLS['udp'], 670, 'vacdsm-sws'),
-        'vad': Service(PROTOCOLS['udp'], 14154, 'vad'),
-        'valisys-lm': Service(PROTOCOLS['udp'], 1457, 'valisys-lm'),
-        'vantronix-mgmt': Service(PROTOCOLS['udp'], 8034, 'vantronix-mgmt'),
-        'vaprtm': Service(PROTOCOLS['udp'], 3654, 'vaprtm'),
-        'varadero-0': Service(PROTOCOLS['udp'], 4837, 'varadero-0'),
-        'varadero-1': Service(PROTOCOLS['udp'], 4838, 'varadero-1'),
-        'varadero-2': Service(PROTOCOLS['udp'], 4839, 'varadero-2'),
-        'vat': Service(PROTOCOLS['udp'], 3456, 'vat'),
-        'vat-control': Service(PROTOCOLS['udp'], 3457, 'vat-control'),
-        'vatata': Service(PROTOCOLS['udp'], 4188, 'vatata'),
-        'vatp': Service(PROTOCOLS['udp'], 690, 'vatp'),
-        'vaultbase': Service(PROTOCOLS['udp'], 1771, 'vaultbase'),
-        'vce': Service(PROTOCOLS['udp'], 11111, 'vce'),
-        'vchat': Service(PROTOCOLS['udp'], 1168, 'vchat'),
-        'vcmp': Service(PROTOCOLS['udp'], 2426, 'vcmp'),
-        'vcnet-link-v10': Service(PROTOCOLS['udp'], 2554, 'vcnet-link-v10'),
-        'vcom-tunnel': Service(PROTOCOLS['udp'], 8001, 'vcom-tunnel'),
-        'vcrp': Service(PROTOCOLS['udp'], 3073, 'vcrp'),
-        'vcs-app': Service(PROTOCOLS['udp'], 14141, 'vcs-app'),
-        'vdmmesh-disc': Service(PROTOCOLS['udp'], 18668, 'vdmmesh-disc'),
-        'vdmplay': Service(PROTOCOLS['udp'], 1707, 'vdmplay'),
-        'vemmi': Service(PROTOCOLS['udp'], 575, 'vemmi'),
-        'ventoso': Service(PROTOCOLS['udp'], 4621, 'ventoso'),
-        'venus': Service(PROTOCOLS['udp'], 2430, 'venus'),
-        'venus-se': Service(PROTOCOLS['udp'], 2431, 'venus-se'),
-        'veracity': Service(PROTOCOLS['udp'], 1062, 'veracity'),
-        'vergencecm': Service(PROTOCOLS['udp'], 2771, 'vergencecm'),
-        'verismart': Service(PROTOCOLS['udp'], 3270, 'verismart'),
-        'veritas-pbx': Service(PROTOCOLS['udp'], 1556, 'veritas-pbx'),
-        'veritas-ucl': Service(PROTOCOLS['udp'], 2148, 'veritas-ucl'),
-        'veritas-udp1': Service(PROTOCOLS['udp'], 2802, 'veritas-udp1'),
-        'veritas-vis1': Service(PROTOCOLS['udp'], 2993, 'veritas-vis1'),
-        'veritas-vis2': Service(PROTOCOLS['udp'], 2994, 'veritas-vis2'),
-        'veritas_pbx': Service(PROTOCOLS['udp'], 1556, 'veritas_pbx'),
-        'veronica': Service(PROTOCOLS['udp'], 2770, 'veronica'),
-        'versa-tek': Service(PROTOCOLS['udp'], 2610, 'versa-tek'),
-        'versatalk': Service(PROTOCOLS['udp'], 3738, 'versatalk'),
-        'vettcp': Service(PROTOCOLS['udp'], 78, 'vettcp'),
-        'vfbp-disc': Service(PROTOCOLS['udp'], 6678, 'vfbp-disc'),
-        'vfo': Service(PROTOCOLS['udp'], 1056, 'vfo'),
-        'vhd': Service(PROTOCOLS['udp'], 3802, 'vhd'),
-        'vid': Service(PROTOCOLS['udp'], 769, 'vid'),
-        'video-activmail': Service(PROTOCOLS['udp'], 1398, 'video-activmail'),
-        'videobeans': Service(PROTOCOLS['udp'], 3058, 'videobeans'),
-        'videotex': Service(PROTOCOLS['udp'], 516, 'videotex'),
-        'videte-cipc': Service(PROTOCOLS['udp'], 1927, 'videte-cipc'),
-        'vidigo': Service(PROTOCOLS['udp'], 3231, 'vidigo'),
-        'vids-avtp': Service(PROTOCOLS['udp'], 1853, 'vids-avtp'),
-        'vieo-fe': Service(PROTOCOLS['udp'], 3245, 'vieo-fe'),
-        'vinainstall': Service(PROTOCOLS['udp'], 4344, 'vinainstall'),
-        'vipera': Service(PROTOCOLS['udp'], 12012, 'vipera'),
-        'vipera-ssl': Service(PROTOCOLS['udp'], 12013, 'vipera-ssl'),
-        'vipremoteagent': Service(PROTOCOLS['udp'], 3752, 'vipremoteagent'),
-        'virprot-lm': Service(PROTOCOLS['udp'], 7121, 'virprot-lm'),
-        'virtual-places': Service(PROTOCOLS['udp'], 1533, 'virtual-places'),
-        'virtual-time': Service(PROTOCOLS['udp'], 1852, 'virtual-time'),
-        'virtualtape': Service(PROTOCOLS['udp'], 2386, 'virtualtape'),
-        'virtualuser': Service(PROTOCOLS['udp'], 5423, 'virtualuser'),
-        'visd': Service(PROTOCOLS['udp'], 9284, 'visd'),
-        'visinet-gui': Service(PROTOCOLS['udp'], 3601, 'visinet-gui'),
-        'vision-elmd': Service(PROTOCOLS['udp'], 6673, 'vision-elmd'),
-        'vision-server': Service(PROTOCOLS['udp'], 6672, 'vision-server'),
-        'vision_elmd': Service(PROTOCOLS['udp'], 6673, 'vision_elmd'),
-        'vision_server': Service(PROTOCOLS['udp'], 6672, 'vision_server'),
-        'visionpyramid': Service(PROTOCOLS['udp'], 1247, 'visionpyramid'),
-        'visitview': Service(PROTOCOLS['udp'], 1631, 'visitview'),
-        'vista-4gl': Service(PROTOCOLS['udp'], 24249, 'vista-4gl'),
-        'vistium-share': Service(PROTOCOLS['udp'], 1545, 'vistium-share'),
-        'vitalanalysis': Service(PROTOCOLS['udp'], 2474, 'vitalanalysis'),
-        'viziblebrowser': Service(PROTOCOLS['udp'], 1868, 'viziblebrowser'),
-        'vlsi-lm': Service(PROTOCOLS['udp'], 1500, 'vlsi-lm'),
-        'vmnet': Service(PROTOCOLS['udp'], 175, 'vmnet'),
-        'vmodem': Service(PROTOCOLS['udp'], 3141, 'vmodem'),
-        'vmpwscs': Service(PROTOCOLS['udp'], 214, 'vmpwscs'),
-        'vmrdp': Service(PROTOCOLS['udp'], 2179, 'vmrdp'),
-        'vmsvc': Service(PROTOCOLS['udp'], 7024, 'vmsvc'),
-        'vmsvc-2': Service(PROTOCOLS['udp'], 7025, 'vmsvc-2'),
-        'vmware-fdm': Service(PROTOCOLS['udp'], 8182, 'vmware-fdm'),
-        'vnas': Service(PROTOCOLS['udp'], 577, 'vnas'),
-        'vnetd': Service(PROTOCOLS['udp'], 13724, 'vnetd'),
-        'vns-tp': Service(PROTOCOLS['udp'], 7802, 'vns-tp'),
-        'vnsstr': Service(PROTOCOLS['udp'], 3321, 'vnsstr'),
-        'vnwk-prapi': Service(PROTOCOLS['udp'], 2538, 'vnwk-prapi'),
-        'vocaltec-admin': Service(PROTOCOLS['udp'], 1796, 'vocaltec-admin'),
-        'vocaltec-gold': Service(PROTOCOLS['udp'], 6670, 'vocaltec-gold'),
-        'vocaltec-hos': Service(PROTOCOLS['udp'], 25793, 'vocaltec-hos'),
-        'vocaltec-phone': Service(PROTOCOLS['udp'], 22555, 'vocaltec-phone'),
-        'vofr-gateway': Service(PROTOCOLS['udp'], 21590, 'vofr-gateway'),
-        'voispeed-port': Service(PROTOCOLS['udp'], 3541, 'voispeed-port'),
-        'volley': Service(PROTOCOLS['udp'], 3625, 'volley'),
-        'vopied': Service(PROTOCOLS['udp'], 13783, 'vopied'),
-        'voxelstorm': Service(PROTOCOLS['udp'], 28200, 'voxelstorm'),
-        'vp2p': Service(PROTOCOLS['udp'], 8473, 'vp2p'),
-        'vpa-disc': Service(PROTOCOLS['udp'], 5164, 'vpa-disc'),
-        'vpac': Service(PROTOCOLS['udp'], 1517, 'vpac'),
-        'vpad': Service(PROTOCOLS['udp'], 1516, 'vpad'),
-        'vpjp': Service(PROTOCOLS['udp'], 1345, 'vpjp'),
-        'vpm-udp': Service(PROTOCOLS['udp'], 5046, 'vpm-udp'),
-        'vpnz': Service(PROTOCOLS['udp'], 1224, 'vpnz'),
-        'vpp': Service(PROTOCOLS['udp'], 677, 'vpp'),
-        'vpps-qua': Service(PROTOCOLS['udp'], 672, 'vpps-qua'),
-        'vpps-via': Service(PROTOCOLS['udp'], 676, 'vpps-via'),
-        'vpsipport': Service(PROTOCOLS['udp'], 2649, 'vpsipport'),
-        'vpvc': Service(PROTOCOLS['udp'], 1519, 'vpvc'),
-        'vpvd': Service(PROTOCOLS['udp'], 1518, 'vpvd'),
-        'vqp': Service(PROTOCOLS['udp'], 1589, 'vqp'),
-        'vrace': Service(PROTOCOLS['udp'], 9300, 'vrace'),
-        'vrcommerce': Service(PROTOCOLS['udp'], 2530, 'vrcommerce'),
-        'vrpn': Service(PROTOCOLS['udp'], 3883, 'vrpn'),
-        'vrt': Service(PROTOCOLS['udp'], 4991, 'vrt'),
-        'vrtl-vmf-ds': Service(PROTOCOLS['udp'], 1956, 'vrtl-vmf-ds'),
-        'vrtl-vmf-sa': Service(PROTOCOLS['udp'], 2074, 'vrtl-vmf-sa'),
-        'vrtp': Service(PROTOCOLS['udp'], 2255, 'vrtp'),
-        'vrts-at-port': Service(PROTOCOLS['udp'], 2821, 'vrts-at-port'),
-        'vrts-auth-port': Service(PROTOCOLS['udp'], 4032, 'vrts-auth-port'),
-        'vrts-ipcserver': Service(PROTOCOLS['udp'], 1317, 'vrts-ipcserver'),
-        'vrts-registry': Service(PROTOCOLS['udp'], 2410, 'vrts-registry'),
-        'vrts-tdd': Service(PROTOCOLS['udp'], 14149, 'vrts-tdd'),
-        'vrtstrapserver': Service(PROTOCOLS['udp'], 1885, 'vrtstrapserver'),
-        'vrxpservman': Service(PROTOCOLS['udp'], 4147, 'vrxpservman'),
-        'vs-server': Service(PROTOCOLS['udp'], 3280, 'vs-server'),
-        'vsaiport': Service(PROTOCOLS['udp'], 3317, 'vsaiport'),
-        'vsamredirector': Service(PROTOCOLS['udp'], 2387, 'vsamredirector'),
-        'vsat-control': Service(PROTOCOLS['udp'], 1880, 'vsat-control'),
-        'vscp': Service(PROTOCOLS['udp'], 9598, 'vscp'),
-        'vseconnector': Service(PROTOCOLS['udp'], 2893, 'vseconnector'),
-        'vsi-omega': Service(PROTOCOLS['udp'], 7566, 'vsi-omega'),
-        'vsiadmin': Service(PROTOCOLS['udp'], 2539, 'vsiadmin'),
-        'vsinet': Service(PROTOCOLS['udp'], 996, 'vsinet'),
-        'vsixml': Service(PROTOCOLS['udp'], 2996, 'vsixml'),
-        'vslmp': Service(PROTOCOLS['udp'], 312, 'vslmp'),
-        'vsnm-agent': Service(PROTOCOLS['udp'], 3375, 'vsnm-agent'),
-        'vspread': Service(PROTOCOLS['udp'], 2695, 'vspread'),
-        'vstat': Service(PROTOCOLS['udp'], 7779, 'vstat'),
-        'vt-ssl': Service(PROTOCOLS['udp'], 3509, 'vt-ssl'),
-        'vtp': Service(PROTOCOLS['udp'], 16666, 'vtp'),
-        'vtr-emulator': Service(PROTOCOLS['udp'], 3122, 'vtr-emulator'),
-        'vtsas': Service(PROTOCOLS['udp'], 5070, 'vtsas'),
-        'vtu-comms': Service(PROTOCOLS['udp'], 2216, 'vtu-comms'),
-        'vulture': Service(PROTOCOLS['udp'], 3482, 'vulture'),
-        'vvr-control': Service(PROTOCOLS['udp'], 4145, 'vvr-control'),
-        'vvr-data': Service(PROTOCOLS['udp'], 8199, 'vvr-data'),
-        'vx-auth-port': Service(PROTOCOLS['udp'], 3207, 'vx-auth-port'),
-        'vxcrnbuport': Service(PROTOCOLS['udp'], 3652, 'vxcrnbuport'),
-        'vxlan': Service(PROTOCOLS['udp'], 4789, 'vxlan'),
-        'vxlan-gpe': Service(PROTOCOLS['udp'], 4790, 'vxlan-gpe'),
-        'vytalvaultbrtp': Service(PROTOCOLS['udp'], 2546, 'vytalvaultbrtp'),
-        'vytalvaultpipe': Service(PROTOCOLS['udp'], 2548, 'vytalvaultpipe'),
-        'vytalvaultvsmp': Service(PROTOCOLS['udp'], 2547, 'vytalvaultvsmp'),
-        'waascluster': Service(PROTOCOLS['udp'], 5787, 'waascluster'),
-        'wacp': Service(PROTOCOLS['udp'], 3633, 'wacp'),
-        'wafs': Service(PROTOCOLS['udp'], 4049, 'wafs'),
-        'wag-service': Service(PROTOCOLS['udp'], 2608, 'wag-service'),
-        'wago-io-system': Service(PROTOCOLS['udp'], 2455, 'wago-io-system'),
-        'wago-service': Service(PROTOCOLS['udp'], 6626, 'wago-service'),
-        'wanscaler': Service(PROTOCOLS['udp'], 2312, 'wanscaler'),
-        'wap-push': Service(PROTOCOLS['udp'], 2948, 'wap-push'),
-        'wap-push-http': Service(PROTOCOLS['udp'], 4035, 'wap-push-http'),
-        'wap-push-https': Service(PROTOCOLS['udp'], 4036, 'wap-push-https'),
-        'wap-pushsecure': Service(PROTOCOLS['udp'], 2949, 'wap-pushsecure'),
-        'wap-vcal': Service(PROTOCOLS['udp'], 9205, 'wap-vcal'),
-        'wap-vcal-s': Service(PROTOCOLS['udp'], 9207, 'wap-vcal-s'),
-        'wap-vcard': Service(PROTOCOLS['udp'], 9204, 'wap-vcard'),
-        'wap-vcard-s': Service(PROTOCOLS['udp'], 9206, 'wap-vcard-s'),
-        'wap-wsp': Service(PROTOCOLS['udp'], 9200, 'wap-wsp'),
-        'wap-wsp-s': Service(PROTOCOLS['udp'], 9202, 'wap-wsp-s'),
-        'wap-wsp-wtp': Service(PROTOCOLS['udp'], 9201, 'wap-wsp-wtp'),
-        'wap-wsp-wtp-s': Service(PROTOCOLS['udp'], 9203, 'wap-wsp-wtp-s'),
-        'warehouse': Service(PROTOCOLS['udp'], 12322, 'warehouse'),
-        'warehouse-sss': Service(PROTOCOLS['udp'], 12321, 'warehouse-sss'),
-        'warmspotmgmt': Service(PROTOCOLS['udp'], 1074, 'warmspotmgmt'),
-        'warmux': Service(PROTOCOLS['udp'], 3826, 'warmux'),
-        'warppipe': Service(PROTOCOLS['udp'], 8007, 'warppipe'),
-        'watchdoc': Service(PROTOCOLS['udp'], 5744, 'watchdoc'),
-        'watchdoc-pod': Service(PROTOCOLS['udp'], 5743, 'watchdoc-pod'),
-        'watchdog-nt': Service(PROTOCOLS['udp'], 2723, 'watchdog-nt'),
-        'watchme-7272': Service(PROTOCOLS['udp'], 7272, 'watchme-7272'),
-        'watcomdebug': Service(PROTOCOLS['udp'], 3563, 'watcomdebug'),
-        'watershed-lm': Service(PROTOCOLS['udp'], 6143, 'watershed-lm'),
-        'watilapp': Service(PROTOCOLS['udp'], 1269, 'watilapp'),
-        'wbem-exp-https': Service(PROTOCOLS['udp'], 5990, 'wbem-exp-https'),
-        'wbem-http': Service(PROTOCOLS['udp'], 5988, 'wbem-http'),
-        'wbem-https': Service(PROTOCOLS['udp'], 5989, 'wbem-https'),
-        'wbem-rmi': Service(PROTOCOLS['udp'], 5987, 'wbem-rmi'),
-        'wcbackup': Service(PROTOCOLS['udp'], 8912, 'wcbackup'),
-        'wcpp': Service(PROTOCOLS['udp'], 4185, 'wcpp'),
-        'wcr-remlib': Service(PROTOCOLS['udp'], 4845, 'wcr-remlib'),
-        'weave': Service(PROTOCOLS['udp'], 11095, 'weave'),
-        'web2host': Service(PROTOCOLS['udp'], 1559, 'web2host'),
-        'webaccess': Service(PROTOCOLS['udp'], 1739, 'webaccess'),
-        'webdata': Service(PROTOCOLS['udp'], 3748, 'webdata'),
-        'webemshttp': Service(PROTOCOLS['udp'], 2851, 'webemshttp'),
-        'weblogin': Service(PROTOCOLS['udp'], 2054, 'weblogin'),
-        'webmachine': Service(PROTOCOLS['udp'], 1963, 'webmachine'),
-        'webmail-2': Service(PROTOCOLS['udp'], 3511, 'webmail-2'),
-        'webmethods-b2b': Service(PROTOCOLS['udp'], 2907, 'webmethods-b2b'),
-        'webobjects': Service(PROTOCOLS['udp'], 1085, 'webobjects'),
-        'webphone': Service(PROTOCOLS['udp'], 21845, 'webphone'),
-        'websm': Service(PROTOCOLS['udp'], 9090, 'websm'),
-        'websphere-snmp': Service(PROTOCOLS['udp'], 3427, 'websphere-snmp'),
-        'webster': Service(PROTOCOLS['udp'], 765, 'webster'),
-        'webtie': Service(PROTOCOLS['udp'], 3342, 'webtie'),
-        'wello': Service(PROTOCOLS['udp'], 4177, 'wello'),
-        'westell-stats': Service(PROTOCOLS['udp'], 1875, 'westell-stats'),
-        'wfc': Service(PROTOCOLS['udp'], 4847, 'wfc'),
-        'wfm': Service(PROTOCOLS['udp'], 4057, 'wfm'),
-        'wfremotertm': Service(PROTOCOLS['udp'], 1046, 'wfremotertm'),
-        'wg-netforce': Service(PROTOCOLS['udp'], 3359, 'wg-netforce'),
-        'wherehoo': Service(PROTOCOLS['udp'], 5859, 'wherehoo'),
-        'whisker': Service(PROTOCOLS['udp'], 3233, 'whisker'),
-        'who': Service(PROTOCOLS['udp'], 513, 'who'),
-        'whoami': Service(PROTOCOLS['udp'], 565, 'whoami'),
-        'whois++': Service(PROTOCOLS['udp'], 63, 'whois++'),
-        'whoispp': Service(PROTOCOLS['udp'], 63, 'whoispp'),
-        'whosells': Service(PROTOCOLS['udp'], 2781, 'whosells'),
-        'whosockami': Service(PROTOCOLS['udp'], 2009, 'whosockami'),
-        'wibukey': Service(PROTOCOLS['udp'], 22347, 'wibukey'),
-        'wiegand': Service(PROTOCOLS['udp'], 4390, 'wiegand'),
-        'wifree': Service(PROTOCOLS['udp'], 11208, 'wifree'),
-        'wilkenlistener': Service(PROTOCOLS['udp'], 1890, 'wilkenlistener'),
-        'willy': Service(PROTOCOLS['udp'], 2518, 'willy'),
-        'wimaxasncp': Service(PROTOCOLS['udp'], 2231, 'wimaxasncp'),
-        'wimd': Service(PROTOCOLS['udp'], 2980, 'wimd'),
-        'wimsic': Service(PROTOCOLS['udp'], 1326, 'wimsic'),
-        'windb': Service(PROTOCOLS['udp'], 2522, 'windb'),
-        'winddlb': Service(PROTOCOLS['udp'], 1565, 'winddlb'),
-        'winddx': Service(PROTOCOLS['udp'], 1727, 'winddx'),
-        'windlm': Service(PROTOCOLS['udp'], 1785, 'windlm'),
-        'windream': Service(PROTOCOLS['udp'], 534, 'windream'),
-        'winfs': Service(PROTOCOLS['udp'], 5009, 'winfs'),
-        'wininstall-ipc': Service(PROTOCOLS['udp'], 3674, 'wininstall-ipc'),
-        'winjaserver': Service(PROTOCOLS['udp'], 1290, 'winjaserver'),
-        'winpcs': Service(PROTOCOLS['udp'], 5166, 'winpcs'),
-        'winpharaoh': Service(PROTOCOLS['udp'], 6065, 'winpharaoh'),
-        'winpoplanmess': Service(PROTOCOLS['udp'], 1152, 'winpoplanmess'),
-        'winport': Service(PROTOCOLS['udp'], 3926, 'winport'),
-        'winqedit': Service(PROTOCOLS['udp'], 7395, 'winqedit'),
-        'wins': Service(PROTOCOLS['udp'], 1512, 'wins'),
-        'winshadow': Service(PROTOCOLS['udp'], 3261, 'winshadow'),
-        'winshadow-hd': Service(PROTOCOLS['udp'], 3861, 'winshadow-hd'),
-        'wip-port': Service(PROTOCOLS['udp'], 3414, 'wip-port'),
-        'wired': Service(PROTOCOLS['udp'], 4871, 'wired'),
-        'wizard': Service(PROTOCOLS['udp'], 2001, 'wizard'),
-        'wkars': Service(PROTOCOLS['udp'], 2720, 'wkars'),
-        'wkstn-mon': Service(PROTOCOLS['udp'], 2991, 'wkstn-mon'),
-        'wlanauth': Service(PROTOCOLS['udp'], 3810, 'wlanauth'),
-        'wlbs': Service(PROTOCOLS['udp'], 2504, 'wlbs'),
-        'wlcp': Service(PROTOCOLS['udp'], 36411, 'wlcp'),
-        'wmc-log-svc': Service(PROTOCOLS['udp'], 1338, 'wmc-log-svc'),
-        'wms-messenger': Service(PROTOCOLS['udp'], 3219, 'wms-messenger'),
-        'wnn6': Service(PROTOCOLS['udp'], 22273, 'wnn6'),
-        'wnn6-ds': Service(PROTOCOLS['udp'], 26208, 'wnn6-ds'),
-        'workflow': Service(PROTOCOLS['udp'], 3466, 'workflow'),
-        'world-lm': Service(PROTOCOLS['udp'], 1462, 'world-lm'),
-        'worldfusion1': Service(PROTOCOLS['udp'], 2595, 'worldfusion1'),
-        'worldfusion2': Service(PROTOCOLS['udp'], 2596, 'worldfusion2'),
-        'worldscores': Service(PROTOCOLS['udp'], 4545, 'worldscores'),
-        'wpages': Service(PROTOCOLS['udp'], 776, 'wpages'),
-        'wpgs': Service(PROTOCOLS['udp'], 780, 'wpgs'),
-        'wpl-disc': Service(PROTOCOLS['udp'], 8006, 'wpl-disc'),
-        'writesrv': Service(PROTOCOLS['udp'], 1334, 'writesrv'),
-        'wrs-registry': Service(PROTOCOLS['udp'], 2340, 'wrs-registry'),
-        'wrs_registry': Service(PROTOCOLS['udp'], 2340, 'wrs_registry'),
-        'ws-discovery': Service(PROTOCOLS['udp'], 3702, 'ws-discovery'),
-        'wsdapi': Service(PROTOCOLS['udp'], 5357, 'wsdapi'),
-        'wsdapi-s': Service(PROTOCOLS['udp'], 5358, 'wsdapi-s'),
-        'wsicopy': Service(PROTOCOLS['udp'], 3378, 'wsicopy'),
-        'wsm-server': Service(PROTOCOLS['udp'], 5006, 'wsm-server'),
-        'wsm-server-ssl': Service(PROTOCOLS['udp'], 5007, 'wsm-server-ssl'),
-        'wsman': Service(PROTOCOLS['udp'], 5985, 'wsman'),
-        'wsmans': Service(PROTOCOLS['udp'], 5986, 'wsmans'),
-        'wsmlb': Service(PROTOCOLS['udp'], 3806, 'wsmlb'),
-        'wso2esb-console': Service(PROTOCOLS['udp'], 9444, 'wso2esb-console'),
-        'wssauthsvc': Service(PROTOCOLS['udp'], 4537, 'wssauthsvc'),
-        'wsynch': Service(PROTOCOLS['udp'], 3111, 'wsynch'),
-        'wta-wsp-s': Service(PROTOCOLS['udp'], 2805, 'wta-wsp-s'),
-        'wta-wsp-wtp-s': Service(PROTOCOLS['udp'], 2923, 'wta-wsp-wtp-s'),
-        'wusage': Service(PROTOCOLS['udp'], 2396, 'wusage'),
-        'wv-csp-sms': Service(PROTOCOLS['udp'], 3590, 'wv-csp-sms'),
-        'wv-csp-sms-cir': Service(PROTOCOLS['udp'], 3716, 'wv-csp-sms-cir'),
-        'wv-csp-udp-cir': Service(PROTOCOLS['udp'], 3717, 'wv-csp-udp-cir'),
-        'wwiotalk': Service(PROTOCOLS['udp'], 5413, 'wwiotalk'),
-        'www': Service(PROTOCOLS['udp'], 80, 'www'),
-        'www-dev': Service(PROTOCOLS['udp'], 2784, 'www-dev'),
-        'www-http': Service(PROTOCOLS['udp'], 80, 'www-http'),
-        'www-ldap-gw': Service(PROTOCOLS['udp'], 1760, 'www-ldap-gw'),
-        'wxbrief': Service(PROTOCOLS['udp'], 4368, 'wxbrief'),
-        'wysdma': Service(PROTOCOLS['udp'], 3741, 'wysdma'),
-        'wysdmc': Service(PROTOCOLS['udp'], 3916, 'wysdmc'),
-        'x-bone-api': Service(PROTOCOLS['udp'], 2165, 'x-bone-api'),
-        'x-bone-ctl': Service(PROTOCOLS['udp'], 265, 'x-bone-ctl'),
-        'x11': Service(PROTOCOLS['udp'], 6063, 'x11'),
-        'x25-svc-port': Service(PROTOCOLS['udp'], 1998, 'x25-svc-port'),
-        'x2e-disc': Service(PROTOCOLS['udp'], 11877, 'x2e-disc'),
-        'x500ms': Service(PROTOCOLS['udp'], 5757, 'x500ms'),
-        'x9-icue': Service(PROTOCOLS['udp'], 1145, 'x9-icue'),
-        'xaapi': Service(PROTOCOLS['udp'], 1934, 'xaapi'),
-        'xact-backup': Service(PROTOCOLS['udp'], 911, 'xact-backup'),
-        'xadmin': Service(PROTOCOLS['udp'], 9105, 'xadmin'),
-        'xandros-cms': Service(PROTOCOLS['udp'], 4389, 'xandros-cms'),
-        'xap-ha': Service(PROTOCOLS['udp'], 3639, 'xap-ha'),
-        'xbox': Service(PROTOCOLS['udp'], 3074, 'xbox'),
-        'xdas': Service(PROTOCOLS['udp'], 7629, 'xdas'),
-        'xdmcp': Service(PROTOCOLS['udp'], 177, 'xdmcp'),
-        'xds': Service(PROTOCOLS['udp'], 2130, 'xds'),
-        'xdsxdm': Service(PROTOCOLS['udp'], 6558, 'xdsxdm'),
-        'xdtp': Service(PROTOCOLS['udp'], 3088, 'xdtp'),
-        'xecp-node': Service(PROTOCOLS['udp'], 3940, 'xecp-node'),
-        'xfer': Service(PROTOCOLS['udp'], 82, 'xfer'),
-        'xfr': Service(PROTOCOLS['udp'], 682, 'xfr'),
-        'xgrid': Service(PROTOCOLS['udp'], 4111, 'xgrid'),
-        'xiip': Service(PROTOCOLS['udp'], 1924, 'xiip'),
-        'xingcsm': Service(PROTOCOLS['udp'], 2327, 'xingcsm'),
-        'xingmpeg': Service(PROTOCOLS['udp'], 1558, 'xingmpeg'),
-        'xinuexpansion1': Service(PROTOCOLS['udp'], 2021, 'xinuexpansion1'),
-        'xinuexpansion2': Service(PROTOCOLS['udp'], 2022, 'xinuexpansion2'),
-        'xinuexpansion3': Service(PROTOCOLS['udp'], 2023, 'xinuexpansion3'),
-        'xinuexpansion4': Service(PROTOCOLS['udp'], 2024, 'xinuexpansion4'),
-        'xinupageserver': Service(PROTOCOLS['udp'], 2020, 'xinupageserver'),
-        'xiostatus': Service(PROTOCOLS['udp'], 2341, 'xiostatus'),
-        'xkotodrcp': Service(PROTOCOLS['udp'], 5344, 'xkotodrcp'),
-        'xmapi': Service(PROTOCOLS['udp'], 1933, 'xmapi'),
-        'xmlblaster': Service(PROTOCOLS['udp'], 3412, 'xmlblaster'),
-        'xmlink-connect': Service(PROTOCOLS['udp'], 3953, 'xmlink-connect'),
-        'xmlipcregsvc': Service(PROTOCOLS['udp'], 9092, 'xmlipcregsvc'),
-        'xmlrpc-beep': Service(PROTOCOLS['udp'], 602, 'xmlrpc-beep'),
-        'xmltec-xmlmail': Service(PROTOCOLS['udp'], 9091, 'xmltec-xmlmail'),
-        'xmms2': Service(PROTOCOLS['udp'], 9667, 'xmms2'),
-        'xmpcr-interface': Service(PROTOCOLS['udp'], 3877, 'xmpcr-interface'),
-        'xmpv7': Service(PROTOCOLS['udp'], 7430, 'xmpv7'),
-        'xmquery': Service(PROTOCOLS['udp'], 2279, 'xmquery'),
-        'xmsg': Service(PROTOCOLS['udp'], 1716, 'xmsg'),
-        'xnds': Service(PROTOCOLS['udp'], 2157, 'xnds'),
-        'xnm-clear-text': Service(PROTOCOLS['udp'], 3221, 'xnm-clear-text'),
-        'xnm-ssl': Service(PROTOCOLS['udp'], 3220, 'xnm-ssl'),
-        'xnmp': Service(PROTOCOLS['udp'], 1652, 'xnmp'),
-        'xns-auth': Service(PROTOCOLS['udp'], 56, 'xns-auth'),
-        'xns-ch': Service(PROTOCOLS['udp'], 54, 'xns-ch'),
-        'xns-courier': Service(PROTOCOLS['udp'], 165, 'xns-courier'),
-        'xns-mail': Service(PROTOCOLS['udp'], 58, 'xns-mail'),
-        'xns-time': Service(PROTOCOLS['udp'], 52, 'xns-time'),
-        'xo-wave': Service(PROTOCOLS['udp'], 3763, 'xo-wave'),
-        'xoraya': Service(PROTOCOLS['udp'], 11876, 'xoraya'),
-        'xpilot': Service(PROTOCOLS['udp'], 15345, 'xpilot'),
-        'xpl': Service(PROTOCOLS['udp'], 3865, 'xpl'),
-        'xprint-server': Service(PROTOCOLS['udp'], 8100, 'xprint-server'),
-        'xprtld': Service(PROTOCOLS['udp'], 5634, 'xprtld'),
-        'xqosd': Service(PROTOCOLS['udp'], 31416, 'xqosd'),
-        'xribs': Service(PROTOCOLS['udp'], 2025, 'xribs'),
-        'xrl': Service(PROTOCOLS['udp'], 1104, 'xrl'),
-        'xrpc-registry': Service(PROTOCOLS['udp'], 3651, 'xrpc-registry'),
-        'xs-openstorage': Service(PROTOCOLS['udp'], 1619, 'xs-openstorage'),
-        'xserveraid': Service(PROTOCOLS['udp'], 3722, 'xserveraid'),
-        'xsip-network': Service(PROTOCOLS['udp'], 1354, 'xsip-network'),
-        'xsmsvc': Service(PROTOCOLS['udp'], 6936, 'xsmsvc'),
-        'xss-port': Service(PROTOCOLS['udp'], 3510, 'xss-port'),
-        'xss-srv-port': Service(PROTOCOLS['udp'], 3646, 'xss-srv-port'),
-        'xsync': Service(PROTOCOLS['udp'], 3721, 'xsync'),
-        'xtgui': Service(PROTOCOLS['udp'], 4095, 'xtgui'),
-        'xtreamx': Service(PROTOCOLS['udp'], 5793, 'xtreamx'),
-        'xtrm': Service(PROTOCOLS['udp'], 3423, 'xtrm'),
-        'xtrms': Service(PROTOCOLS['udp'], 3424, 'xtrms'),
-        'xvttp': Service(PROTOCOLS['udp'], 508, 'xvttp'),
-        'xxnetserver': Service(PROTOCOLS['udp'], 3832, 'xxnetserver'),
-        'xyplex-mux': Service(PROTOCOLS['udp'], 173, 'xyplex-mux'),
-        'yawn': Service(PROTOCOLS['udp'], 31029, 'yawn'),
-        'yo-main': Service(PROTOCOLS['udp'], 4040, 'yo-main'),
-        'z-wave': Service(PROTOCOLS['udp'], 4123, 'z-wave'),
-        'z-wave-s': Service(PROTOCOLS['udp'], 41230, 'z-wave-s'),
-        'z39-50': Service(PROTOCOLS['udp'], 210, 'z39-50'),
-        'z39.50': Service(PROTOCOLS['udp'], 210, 'z39.50'),
-        'zabbix-agent': Service(PROTOCOLS['udp'], 10050, 'zabbix-agent'),
-        'zabbix-trapper': Service(PROTOCOLS['udp'], 10051, 'zabbix-trapper'),
-        'zannet': Service(PROTOCOLS['udp'], 317, 'zannet'),
-        'zarkov': Service(PROTOCOLS['udp'], 2989, 'zarkov'),
-        'zen-pawn': Service(PROTOCOLS['udp'], 7628, 'zen-pawn'),
-        'zenginkyo-1': Service(PROTOCOLS['udp'], 5020, 'zenginkyo-1'),
-        'zenginkyo-2': Service(PROTOCOLS['udp'], 5021, 'zenginkyo-2'),
-        'zented': Service(PROTOCOLS['udp'], 1229, 'zented'),
-        'zep': Service(PROTOCOLS['udp'], 17754, 'zep'),
-        'zephyr-clt': Service(PROTOCOLS['udp'], 2103, 'zephyr-clt'),
-        'zephyr-hm': Service(PROTOCOLS['udp'], 2104, 'zephyr-hm'),
-        'zephyr-srv': Service(PROTOCOLS['udp'], 2102, 'zephyr-srv'),
-        'zicom': Service(PROTOCOLS['udp'], 3774, 'zicom'),
-        'zieto-sock': Service(PROTOCOLS['udp'], 4072, 'zieto-sock'),
-        'zigbee-ip': Service(PROTOCOLS['udp'], 17755, 'zigbee-ip'),
-        'zigbee-ips': Service(PROTOCOLS['udp'], 17756, 'zigbee-ips'),
-        'zion-lm': Service(PROTOCOLS['udp'], 1425, 'zion-lm'),
-        'zixi-transport': Service(PROTOCOLS['udp'], 7088, 'zixi-transport'),
-        'zmp': Service(PROTOCOLS['udp'], 3925, 'zmp'),
-        'zre-disc': Service(PROTOCOLS['udp'], 5670, 'zre-disc'),
-        'zserv': Service(PROTOCOLS['udp'], 346, 'zserv'),
-        'zymed-zpp': Service(PROTOCOLS['udp'], 2133, 'zymed-zpp'),
-    },
-}
+PROTOCOLS = ProtocolRegistry(protocol_table)
+PROTOCOLS_BY_NUMBER = ProtocolsByNumber(PROTOCOLS)
+SERVICES = ServiceRegistries(service_tables)
+SERVICES_BY_NUMBER = ServicesByNumber()
@@ -0,0 +1,178 @@
+from firewall_translator.iptables import Chain, Rule
+from firewall_translator.optimizer import collapse, evaluation_cost, rule_key
+
+DIRECTIONS = {'-s': 'src', '-d': 'dst'}
+FAMILIES = {4: 'inet', 6: 'inet6'}
+MAX_NAME = 31
+MAX_ELEMENTS = 65536
+
+
+class IPSet:
+    name = None
+    type = None
+    family = None
+    members = None
+
+    def __init__(self, name, members):
+        self.name = name
+        self.members = members
+        self.family = FAMILIES[members[0].version]
+
+        if any(FAMILIES[member.version] != self.family for member in members):
+            raise ValueError('Set {} mixes IPv4 and IPv6 members'.format(name))
+
+        if all(member.prefixlen == member.max_prefixlen for member in members):
+            self.type = 'hash:ip'
+        else:
+            self.type = 'hash:net'
+
+    def __len__(self):
+        return len(self.members)
+
+    def __repr__(self):
+        return '<{} {} {} {} members>'.format(self.__class__.__name__, self.name, self.type, len(self.members))
+
+    def __str__(self):
+        return '\n'.join(self.restore_lines())
+
+    def restore_lines(self):
+        hash_size = 1024
+        while hash_size < len(self.members):
+            hash_size <<= 1
+
+        maximum = max(MAX_ELEMENTS, len(self.members))
+        yield 'create {} {} family {} hashsize {} maxelem {} -exist'.format(self.name, self.type, self.family,
+                                                                             hash_size, maximum)
+        yield 'flush {}'.format(self.name)
+
+        for member in self.members:
+            if self.type == 'hash:ip':
+                yield 'add {} {}'.format(self.name, member.network_address)
+            else:
+                yield 'add {} {}'.format(self.name, member)
+
+
+class Extraction:
+    chain = None
+    extracted = None
+    sets = None
+    before = None
+    after = None
+
+    def __init__(self, chain, extracted, sets, weights):
+        self.chain = chain
+        self.extracted = extracted
+        self.sets = sets
+        self.before = evaluation_cost(chain.rules)
+        self.after = evaluation_cost(extracted.rules, weights)
+
+    def __repr__(self):
+        return '<{} {} {} -> {} rules, {} sets>'.format(self.__class__.__name__, self.chain.name, len(self.chain),
+                                                        len(self.extracted), len(self.sets))
+
+
+class SetExtractor:
+    minimum = 16
+    prefix = None
+    names = None
+
+    def __init__(self, minimum=16, prefix=None):
+        self.minimum = minimum
+        self.prefix = prefix
+        self.names = set()
+
+    def __repr__(self):
+        return '<{} minimum={}>'.format(self.__class__.__name__, self.minimum)
+
+    def set_name(self, chain, option):
+        base = '{}_{}'.format(self.prefix or chain.name, DIRECTIONS[option])
+        index = 0
+
+        while True:
+            index += 1
+            suffix = '_{}'.format(index)
+            name = base[:MAX_NAME - len(suffix)] + suffix
+
+            if name not in self.names:
+                self.names.add(name)
+                return name
+
+    def group(self, rules, position, option):
+        key, values = rule_key(rules[position], option)
+        if key is None:
+            return None
+
+        members = list(values)
+        end = position + 1
+
+        while end < len(rules):
+            other_key, other_values = rule_key(rules[end], option)
+            if other_key != key:
+                break
+
+            members.extend(other_values)
+            end += 1
+
+        if end - position < self.minimum or len(set(member.version for member in members)) != 1:
+            return None
+
+        if all(member.prefixlen == member.max_prefixlen for member in members):
+            return key, end, sorted(set(members))
+
+        return key, end, collapse(members)
+
+    def extract(self, chain):
+        rules = chain.rules
+        extracted = []
+        weights = []
+        sets = []
+        position = 0
+
+        while position < len(rules):
+            for option in DIRECTIONS:
+                group = self.group(rules, position, option)
+
+                if group is not None:
+                    break
+            else:
+                extracted.append(rules[position])
+                weights.append(1)
+                position += 1
+                continue
+
+            (params, index, action, action_params, goto), end, members = group
+            ipset = IPSet(self.set_name(chain, option), members)
+            match = (('-m', 'set'), ('--match-set', (ipset.name, DIRECTIONS[option])))
+
+            extracted.append(Rule(params[:index] + match + params[index:], action, action_params, goto))
+            weights.append(end - position)
+            sets.append(ipset)
+            position = end
+
+        result = Chain(chain.name, extracted, chain.action)
+        result.packets, result.bytes = chain.packets, chain.bytes
+
+        return Extraction(chain, result, sets, weights)
+
+
+def extract_sets(rule_set, table='filter', minimum=16):
+    extractor = SetExtractor(minimum)
+    extractions = []
+
+    for chain in list(rule_set[table]):
+        extraction = extractor.extract(chain)
+        rule_set[table][chain.name] = extraction.extracted
+        extractions.append(extraction)
+
+    return extractions
+
+
+def restore_script(extractions):
+    lines = []
+
+    for extraction in extractions:
+        for ipset in extraction.sets:
+            lines.extend(ipset.restore_lines())
+
+    lines.append('')
+    return '\n'.join(lines)
@@ -1,10 +1,22 @@
-import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import gc
+import io
 import logging
+import marshal
+import operator
+import re
 
 import firewall_translator.generic
+from firewall_translator.trie import PrefixTrie, to_network
+
+log = logging.getLogger(__name__)
 
 
 class Action(firewall_translator.generic.Action):
+    __slots__ = ()
+
     def __init__(self, allow=False, reply=False, log=False):
         if log:
             raise NotImplementedError
@@ -23,15 +35,340 @@ class Action(firewall_translator.generic.Action):
         return 'DROP'
 
 
+WORD = re.compile(r'(?:"(?:[^"\\]|\\.)*"|\'[^\']*\'|[^\s"\'])+')
+QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"|\'([^\']*)\'')
+ESCAPED = re.compile(r'\\(.)')
+SAFE = re.compile(r'[\w@%+=:,./][\w@%+=:,./-]*$')
+
+TERMINAL = frozenset(['ACCEPT', 'DROP', 'REJECT', 'QUEUE', 'NFQUEUE', 'DNAT', 'SNAT', 'MASQUERADE', 'REDIRECT',
+                      'NETMAP'])
+
+STATEFUL = frozenset(['limit', 'hashlimit', 'recent', 'statistic', 'quota', 'connlimit'])
+
+option_name = operator.itemgetter(0)
+
+
+def add_value(value, word):
+    if value is None:
+        return word
+
+    if isinstance(value, str):
+        return value, word
+
+    return value + (word,)
+
+
+def unquote(match):
+    if match.group(2) is not None:
+        return match.group(2)
+
+    return ESCAPED.sub(r'\1', match.group(1))
+
+
+def quote(value):
+    if SAFE.match(value):
+        return value
+
+    return '"{}"'.format(value.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+def tokenize(line):
+    if '"' in line or "'" in line:
+        return tokenize_quoted(line)
+
+    words = line.split()
+
+    if '!' not in line:
+        options = words[::2]
+
+        if len(options) * 2 == len(words) and line[:1] == '-' and line.count(' -') == len(options) - 1:
+            values = words[1::2]
+
+            if ' -' not in ' ' + ' '.join(values):
+                return list(zip(options, values))
+
+    tokens = []
+    option = None
+    value = None
+    negate = False
+
+    for word in words:
+        if word[0] == '-':
+            if option is not None:
+                tokens.append((option, value))
+
+            option = '! ' + word if negate else word
+            value = None
+            negate = False
+
+        elif word == '!':
+            negate = True
+
+        else:
+            if option is None:
+                raise ValueError('Value {} has no option in {}'.format(word, line))
+
+            if negate:
+                option = '! ' + option
+                negate = False
+
+            value = add_value(value, word)
+
+    if negate:
+        raise ValueError('Trailing ! has no option in {}'.format(line))
+
+    if option is not None:
+        tokens.append((option, value))
+
+    return tokens
+
+
+def tokenize_quoted(line):
+    tokens = []
+    option = None
+    value = None
+    negate = False
+
+    for word in WORD.findall(line):
+        if word[0] == '-':
+            if option is not None:
+                tokens.append((option, value))
+
+            option = '! ' + word if negate else word
+            value = None
+            negate = False
+
+        elif word == '!':
+            negate = True
+
+        else:
+            if option is None:
+                raise ValueError('Value {} has no option in {}'.format(word, line))
+
+            if negate:
+                option = '! ' + option
+                negate = False
+
+            value = add_value(value, QUOTED.sub(unquote, word))
+
+    if negate:
+        raise ValueError('Trailing ! has no option in {}'.format(line))
+
+    if option is not None:
+        tokens.append((option, value))
+
+    return tokens
+
+
+def format_option(option, value):
+    if value is None:
+        return option
+
+    if isinstance(value, str):
+        return '{} {}'.format(option, quote(value))
+
+    return '{} {}'.format(option, ' '.join(quote(v) for v in value))
+
+
+def canonical(params):
+    core = []
+    modules = []
+    start = None
+
+    for pair in params:
+        option = pair[0]
+
+        if option == '-m' or option == '--match':
+            if start is not None:
+                modules[start:] = sorted(modules[start:], key=option_name)
+
+            modules.append(pair)
+            start = len(modules)
+
+        elif start is not None and option.lstrip('! ').startswith('--'):
+            modules.append(pair)
+
+        else:
+            core.append(pair)
+
+    if start is not None:
+        modules[start:] = sorted(modules[start:], key=option_name)
+
+    core.sort(key=option_name)
+    core.extend(modules)
+    return core
+
+
+def final(rule):
+    if rule.action not in TERMINAL and rule.action != 'RETURN' and not rule.goto:
+        return False
+
+    return not any(key == '-m' and value in STATEFUL for key, value in rule.match_params)
+
+
+def parse_counters(counters):
+    if len(counters) < 5 or counters[0] != '[' or counters[-1] != ']':
+        raise ValueError('Invalid counters {}'.format(counters))
+
+    packets, _, octets = counters[1:-1].partition(':')
+    return int(packets), int(octets)
+
+
+def split_tables(lines):
+    segments = []
+    segment = None
+
+    for number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode()
+
+        line = line.rstrip('\r\n')
+        stripped = line.strip()
+
+        if segment is None or stripped[:1] == '*':
+            segment = (number, [])
+            segments.append(segment)
+
+        segment[1].append(line)
+
+        if stripped == 'COMMIT':
+            segment = None
+
+    return segments
+
+
+@contextlib.contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def read_table(name, chains, text, start, trace_size):
+    table = Table(name)
+
+    for chain_name, action, packets, chain_bytes in chains:
+        table.new_chain(chain_name, action=action)
+        table[chain_name].packets = packets
+        table[chain_name].bytes = chain_bytes
+
+    trace = None if trace_size is None else ParseTrace(trace_size)
+
+    with gc_paused():
+        RuleSet({name: table}).read_lines(text.split('\n'), trace, start)
+
+    rows = [(chain.name, chain.action, chain.packets, chain.bytes,
+             [(rule.match_params, rule.action, rule.action_params, rule.goto, rule.counters) for rule in chain])
+            for chain in table]
+
+    return marshal.dumps(rows), None if trace is None else list(trace)
+
+
+class Symbols:
+    symbols = None
+    pairs = None
+
+    def __contains__(self, symbol):
+        return symbol in self.symbols
+
+    def __init__(self):
+        self.symbols = {}
+        self.pairs = {}
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return '<{} {} symbols, {} pairs>'.format(self.__class__.__name__, len(self.symbols), len(self.pairs))
+
+    def intern(self, symbol):
+        return self.symbols.setdefault(symbol, symbol)
+
+    def intern_pair(self, pair):
+        try:
+            return self.pairs[pair]
+        except KeyError:
+            symbols = self.symbols
+            option, value = pair
+            pair = (symbols.setdefault(option, option), symbols.setdefault(value, value))
+            self.pairs[pair] = pair
+            return pair
+
+    def intern_params(self, params):
+        get = self.pairs.get
+        return [get(pair) or self.intern_pair(pair) for pair in params]
+
+
+class ParseTrace(collections.abc.Sequence):
+    events = None
+
+    def __getitem__(self, index):
+        return self.events[index]
+
+    def __init__(self, size=1024):
+        self.events = collections.deque(maxlen=size)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __repr__(self):
+        return '<{} {}/{}>'.format(self.__class__.__name__, len(self.events), self.events.maxlen)
+
+    def __str__(self):
+        string = []
+
+        for number, event, table, chain in self.events:
+            if chain is None:
+                string.append('{}: {} {}'.format(number, event, table))
+            else:
+                string.append('{}: {} {}/{}'.format(number, event, table, chain))
+
+        return '\n'.join(string)
+
+    def record(self, number, event, table, chain):
+        self.events.append((number, event, table, chain))
+
+
 class Rule:
     match_params = None
     action = None
     action_params = None
+    goto = False
+    counters = None
+    _source = None
+    _key = None
+    _hash = None
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self is other or hash(self) == hash(other) and self.key == other.key
+
+    def __hash__(self):
+        self.key
+        return self._hash
 
-    def __init__(self, match_params=None, action=None, action_params=None):
-        self.match_params = match_params
+    def __init__(self, match_params=None, action=None, action_params=None, goto=False, counters=None):
+        if isinstance(match_params, dict):
+            match_params = match_params.items()
+
+        if isinstance(action_params, dict):
+            action_params = action_params.items()
+
+        self.match_params = tuple(match_params) if match_params else ()
         self.action = action
-        self.action_params = action_params
+        self.action_params = tuple(action_params) if action_params else ()
+        self.goto = goto
+        self.counters = counters
+
+    def __reduce__(self):
+        return Rule, (self.match_params, self.action, self.action_params, self.goto, self.counters)
 
     def __repr__(self):
         string = '<{}'.format(self.__class__.__name__)
@@ -51,53 +388,61 @@ class Rule:
     def __str__(self):
         string = []
 
-        if self.match_params:
-            for k, v in self.match_params.items():
-                string.append(' '.join([k, v]))
+        for option, value in self.match_params:
+            string.append(format_option(option, value))
 
         if self.action:
-            string.append('-j {}'.format(self.action))
+            string.append('{} {}'.format('-g' if self.goto else '-j', self.action))
 
-        if self.action_params:
-            for k, v in self.action_params.items():
-                string.append(' '.join([k, v]))
+        for option, value in self.action_params:
+            string.append(format_option(option, value))
 
         return ' '.join(string)
 
-    @staticmethod
-    def from_cli(string):
-        match_params, action = string.partition(' -j ')[::2]
+    @property
+    def key(self):
+        source = (self.match_params, self.action, self.action_params, self.goto)
 
-        match_params = match_params.strip().split(' ')
-        match_params_keys = match_params[::2]
-        match_params_values = match_params[1::2]
-        match_params = dict(zip(match_params_keys, match_params_values))
+        if self._source != source:
+            key = canonical(self.match_params)
+            key.append((self.action, self.goto))
+            key.extend(sorted(self.action_params, key=option_name))
 
-        action_params = None
+            self._key = tuple(key)
+            self._hash = hash(self._key)
+            self._source = source
 
-        if action:
-            action = action.strip()
-            if ' ' in action:
-                info(action)
-                action, action_params = action.split(' ', 1)
+        return self._key
 
-        if action_params:
-            action_params = action_params.strip().split(' ')
-            action_params_keys = action_params[::2]
-            action_params_values = action_params[1::2]
-            action_params = dict(zip(action_params_keys, action_params_values))
+    def get(self, option, default=None):
+        for key, value in self.match_params:
+            if key == option:
+                return value
 
-        rule = Rule(match_params, action, action_params)
+        return default
 
-        info('Table: {}, Chain: {}, Action: {}, Params: {}, Matches: {}'.format(table, chain, action, action_params,
-                                                                                match_params))
-        self.tables[table].chains[chain].append(rule)
+    @staticmethod
+    def from_cli(string):
+        return Rule.from_tokens(tokenize(string))
 
+    @staticmethod
+    def from_tokens(tokens):
+        index = 0
+        for option, value in tokens:
+            if option == '-j' or option == '-g':
+                return Rule(tokens[:index], value, tokens[index + 1:], option == '-g')
 
-class Chain(collections.MutableSequence, collections.Iterable):
+            index += 1
+
+        return Rule(tokens)
+
+
+class Chain(collections.abc.MutableSequence):
     name = None
     rules = None
     action = None
+    packets = 0
+    bytes = 0
 
     def __delitem__(self, index):
         del(self.rules[index])
@@ -128,7 +473,7 @@ class Chain(collections.MutableSequence, collections.Iterable):
         self.rules[index] = value
 
     def __str__(self):
-        string = [':{} {} [0:0]'.format(self.name, self.action)]
+        string = [self.header()]
 
         for rule in self.rules:
             string.append('-A {} {}'.format(self.name, rule))
@@ -141,11 +486,311 @@ class Chain(collections.MutableSequence, collections.Iterable):
     def insert(self, rule, position=0):
         self.rules.insert(position, rule)
 
+    def deduplicate(self):
+        seen = set()
+        rules = []
+        removed = []
+
+        for rule in self.rules:
+            if rule in seen:
+                removed.append(rule)
+                continue
+
+            if final(rule):
+                seen.add(rule)
+
+            rules.append(rule)
+
+        self.rules = rules
+        return removed
+
     def delete(self, rule):
         self.rules.remove(rule)
 
+    def header(self):
+        return ':{} {} [{}:{}]'.format(self.name, self.action, self.packets, self.bytes)
+
+
+class Handle:
+    __slots__ = ('rule', 'block')
+
+    def __init__(self, rule, block):
+        self.rule = rule
+        self.block = block
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.rule)
+
+
+class Block:
+    __slots__ = ('handles', 'index')
+
+    def __init__(self, handles):
+        self.handles = handles
+        self.index = 0
+
+        for handle in handles:
+            handle.block = self
+
+    def __repr__(self):
+        return '<{} {} rules>'.format(self.__class__.__name__, len(self.handles))
+
+
+class IndexedChain(Chain):
+    block_size = 512
+    blocks = None
+    lookup = None
+    sizes = None
+    size = 0
+
+    def __contains__(self, rule):
+        return rule in self.lookup
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            rules = self.rules
+            del(rules[index])
+            self.rules = rules
+        else:
+            self.delete_handle(self.handle(index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.rules[index]
+
+        return self.handle(index).rule
+
+    def __init__(self, name, rules=None, action='-', block_size=512):
+        self.block_size = block_size
+        super(IndexedChain, self).__init__(name, rules, action)
+
+    def __iter__(self):
+        for block in self.blocks:
+            for handle in block.handles:
+                yield handle.rule
+
+    def __len__(self):
+        return self.size
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            rules = self.rules
+            rules[index] = value
+            self.rules = rules
+        else:
+            self.replace(self.handle(index), value)
+
+    @property
+    def rules(self):
+        return list(self)
 
-class Table(collections.MutableMapping):
+    @rules.setter
+    def rules(self, rules):
+        self.blocks = []
+        self.lookup = {}
+        self.size = 0
+
+        handles = [Handle(rule, None) for rule in rules or ()]
+        starts = list(range(0, len(handles), self.block_size))
+
+        if len(starts) > 1 and len(handles) - starts[-1] < self.block_size // 2:
+            del(starts[-1])
+
+        for start, stop in zip(starts, starts[1:] + [len(handles)]):
+            self.blocks.append(Block(handles[start:stop]))
+
+        if not self.blocks:
+            self.blocks.append(Block([]))
+
+        for handle in handles:
+            self.index_handle(handle)
+
+        self.reindex()
+
+    def index_handle(self, handle):
+        handles = self.lookup.get(handle.rule)
+
+        if handles is None:
+            self.lookup[handle.rule] = {handle: None}
+        else:
+            handles[handle] = None
+
+        self.size += 1
+
+    def unindex_handle(self, handle):
+        handles = self.lookup[handle.rule]
+        del(handles[handle])
+
+        if not handles:
+            del(self.lookup[handle.rule])
+
+        self.size -= 1
+
+    def reindex(self):
+        sizes = [0] * (len(self.blocks) + 1)
+
+        for index, block in enumerate(self.blocks):
+            block.index = index
+            node = index + 1
+            sizes[node] += len(block.handles)
+            parent = node + (node & -node)
+
+            if parent < len(sizes):
+                sizes[parent] += sizes[node]
+
+        self.sizes = sizes
+
+    def resize(self, block, delta):
+        sizes = self.sizes
+        node = block.index + 1
+
+        while node < len(sizes):
+            sizes[node] += delta
+            node += node & -node
+
+    def offset(self, block):
+        sizes = self.sizes
+        node = block.index
+        offset = 0
+
+        while node:
+            offset += sizes[node]
+            node -= node & -node
+
+        return offset
+
+    def locate(self, position):
+        if position < 0:
+            position += self.size
+
+        if position < 0 or position >= self.size:
+            raise IndexError('Chain {} has no rule at position {}'.format(self.name, position))
+
+        sizes = self.sizes
+        node = 0
+        step = 1 << len(self.blocks).bit_length()
+
+        while step:
+            child = node + step
+
+            if child < len(sizes) and sizes[child] <= position:
+                node = child
+                position -= sizes[child]
+
+            step >>= 1
+
+        return self.blocks[node], position
+
+    def handle(self, position):
+        block, offset = self.locate(position)
+        return block.handles[offset]
+
+    def position(self, handle):
+        block = handle.block
+
+        if block is not None and block.index < len(self.blocks) and self.blocks[block.index] is block:
+            try:
+                return self.offset(block) + block.handles.index(handle)
+            except ValueError:
+                pass
+
+        raise ValueError('{!r} is not in chain {}'.format(handle, self.name))
+
+    def find(self, rule):
+        handles = self.lookup.get(rule)
+        if not handles:
+            return None
+
+        if len(handles) == 1:
+            return next(iter(handles))
+
+        return min(handles, key=self.position)
+
+    def find_all(self, rule):
+        return sorted(self.lookup.get(rule, ()), key=self.position)
+
+    def insert(self, rule, position=0):
+        if position < 0:
+            position = max(position + self.size, 0)
+
+        if position >= self.size:
+            block = self.blocks[-1]
+            offset = len(block.handles)
+        else:
+            block, offset = self.locate(position)
+
+        handle = Handle(rule, block)
+        block.handles.insert(offset, handle)
+        self.index_handle(handle)
+
+        if len(block.handles) > 2 * self.block_size:
+            half = len(block.handles) // 2
+            self.blocks.insert(block.index + 1, Block(block.handles[half:]))
+            del(block.handles[half:])
+            self.reindex()
+        else:
+            self.resize(block, 1)
+
+        return handle
+
+    def append(self, rule):
+        return self.insert(rule, self.size)
+
+    def replace(self, handle, rule):
+        self.unindex_handle(handle)
+        handle.rule = rule
+        self.index_handle(handle)
+
+        return handle
+
+    def delete_handle(self, handle):
+        block = handle.block
+        block.handles.remove(handle)
+        self.unindex_handle(handle)
+
+        if len(block.handles) >= self.block_size // 2 or len(self.blocks) == 1:
+            self.resize(block, -1)
+        elif block.index + 1 < len(self.blocks):
+            self.merge(block.index)
+        else:
+            self.merge(block.index - 1)
+
+    def merge(self, index):
+        handles = self.blocks[index].handles + self.blocks[index + 1].handles
+
+        if len(handles) > 2 * self.block_size:
+            half = len(handles) // 2
+            self.blocks[index:index + 2] = [Block(handles[:half]), Block(handles[half:])]
+        else:
+            self.blocks[index:index + 2] = [Block(handles)]
+
+        self.reindex()
+
+    def delete(self, rule):
+        handle = self.find(rule)
+        if handle is None:
+            raise ValueError('{} is not in chain {}'.format(rule, self.name))
+
+        self.delete_handle(handle)
+
+    def remove(self, rule):
+        self.delete(rule)
+
+    def index(self, rule, start=0, stop=None):
+        if start or stop is not None:
+            return super(IndexedChain, self).index(rule, start, stop)
+
+        handle = self.find(rule)
+        if handle is None:
+            raise ValueError('{} is not in chain {}'.format(rule, self.name))
+
+        return self.position(handle)
+
+    def count(self, rule):
+        return len(self.lookup.get(rule, ()))
+
+
+class Table(collections.abc.MutableMapping):
     name = None
     chains = None
 
@@ -177,14 +822,10 @@ class Table(collections.MutableMapping):
         self.chains[key] = value
 
     def __str__(self):
-        string = ['*{}'.format(self.name)]
-
-        for chain in self.chains.values():
-            string.append(str(chain))
+        output = io.StringIO()
+        RestoreWriter(output).write_table(self)
 
-        string.append('COMMIT')
-
-        return '\n'.join(string)
+        return output.getvalue().rstrip('\n')
 
     def new_chain(self, name, rules=None, action='-'):
         if name in self.chains:
@@ -196,8 +837,9 @@ class Table(collections.MutableMapping):
         del(self.chains[name])
 
 
-class RuleSet(collections.MutableMapping):
+class RuleSet(collections.abc.MutableMapping):
     tables = None
+    symbols = None
 
     def __delitem__(self, key):
         del(self.tables[key])
@@ -206,6 +848,8 @@ class RuleSet(collections.MutableMapping):
         return self.tables[key]
 
     def __init__(self, tables=None):
+        self.symbols = Symbols()
+
         if tables is None:
             self.tables = {
                 'filter': Table('filter', {
@@ -244,84 +888,356 @@ class RuleSet(collections.MutableMapping):
         self.tables[key] = value
 
     def __str__(self):
-        string = []
+        output = io.StringIO()
+        self.write(output)
 
-        for table in self.tables.values():
-            string.append(str(table))
+        return output.getvalue().rstrip('\n')
 
-        return '\n'.join(string)
+    def deduplicate(self):
+        removed = 0
+
+        for table in self:
+            for chain in table:
+                removed += len(chain.deduplicate())
+
+        return removed
+
+    def intersection(self, *others):
+        tables = {}
+
+        for table in self:
+            chains = {}
+
+            for chain in table:
+                others_chains = [other.tables[table.name].chains.get(chain.name) for other in others
+                                 if table.name in other.tables]
+
+                if len(others_chains) != len(others) or None in others_chains:
+                    continue
+
+                counts = collections.Counter(chain.rules)
+                for other_chain in others_chains:
+                    counts &= collections.Counter(other_chain.rules)
+
+                rules = []
+                for rule in chain.rules:
+                    if counts[rule] > 0:
+                        counts[rule] -= 1
+                        rules.append(rule)
+
+                chains[chain.name] = Chain(chain.name, rules, chain.action)
 
-    def read(self, rule_def):
+            if chains:
+                tables[table.name] = Table(table.name, chains)
+
+        return RuleSet(tables)
+
+    def read(self, rule_def, trace=None):
+        self.read_lines(rule_def.splitlines(), trace)
+
+    def read_lines(self, lines, trace=None, start=1):
+        debug = log.isEnabledFor(logging.DEBUG)
+        symbols = self.symbols
         table = None
 
-        for line in rule_def.splitlines():
+        for number, line in enumerate(lines, start):
+            if isinstance(line, bytes):
+                line = line.decode()
+
+            line = line.strip()
             if not line:
                 continue
 
-            if line.strip().startswith('#'):
-                debug('Found a comment: {}'.format(line))
-                continue
+            if line[0] == '#':
+                if debug:
+                    log.debug('Line %d: found a comment: %s', number, line)
 
-            elif line.strip().startswith('*'):
-                debug('Found a table definition: {}'.format(line))
+                if trace is not None:
+                    trace.record(number, 'comment', table, None)
 
+                continue
+
+            elif line[0] == '*':
                 table = line[1:]
-                info('Table: {}'.format(table))
+                log.info('Line %d: table %s', number, table)
 
-                if table not in self.tables.keys():
-                    raise KeyError
+                if trace is not None:
+                    trace.record(number, 'table', table, None)
 
-            elif line.strip().startswith(':'):
-                debug('Found a chain definition: {}'.format(line))
+                if table not in self.tables.keys():
+                    raise KeyError(table)
 
+            elif line[0] == ':':
                 name, action, counters = line[1:].split(' ')
-                info('Table: {}, Chain: {}'.format(table, name))
+
+                if symbols is not None:
+                    name = symbols.intern(name)
+                    action = symbols.intern(action)
+
+                if debug:
+                    log.debug('Line %d: table %s, chain %s, policy %s', number, table, name, action)
+
+                if trace is not None:
+                    trace.record(number, 'chain', table, name)
 
                 if name not in self.tables[table].chains.keys():
                     self.tables[table].new_chain(name, action=action)
+                else:
+                    self.tables[table].chains[name].action = action
+
+                chain = self.tables[table].chains[name]
+                chain.packets, chain.bytes = parse_counters(counters)
+
+            elif line == 'COMMIT':
+                if debug:
+                    log.debug('Line %d: finished reading table %s', number, table)
+
+                if trace is not None:
+                    trace.record(number, 'commit', table, None)
 
-            elif line.strip() == 'COMMIT':
-                debug('Finished reading table {}'.format(table))
                 table = None
 
             else:
-                debug('Found a rule definition: {}'.format(line))
-                operation, rule = line.split(' ', 1)
-                if operation != '-A':
-                    raise RuntimeError
+                counters = None
 
-                chain, rule = rule.split(' ', 1)
+                if line[0] == '[':
+                    counters, line = line.split(' ', 1)
+                    counters = parse_counters(counters)
 
-                if '-j' in rule:
-                    match_params, action = rule.split('-j')
-                else:
-                    match_params = rule
-                    action = None
+                tokens = tokenize(line)
 
-                match_params = match_params.strip().split(' ')
-                match_params_keys = match_params[::2]
-                match_params_values = match_params[1::2]
-                match_params = dict(zip(match_params_keys, match_params_values))
+                if symbols is not None:
+                    tokens = symbols.intern_params(tokens)
 
-                action_params = None
+                operation, chain = tokens[0]
+                if operation != '-A':
+                    raise RuntimeError('Line {}: unsupported operation {}'.format(number, operation))
 
-                if action:
-                    action = action.strip()
-                    if ' ' in action:
-                        info(action)
-                        action, action_params = action.split(' ', 1)
+                rule = Rule.from_tokens(tokens[1:])
+                rule.counters = counters
 
-                if action_params:
-                    action_params = action_params.strip().split(' ')
-                    action_params_keys = action_params[::2]
-                    action_params_values = action_params[1::2]
-                    action_params = dict(zip(action_params_keys, action_params_values))
+                if debug:
+                    log.debug('Line %d: table %s, chain %s, rule %r', number, table, chain, rule)
 
-                rule = Rule(match_params, action, action_params)
+                if trace is not None:
+                    trace.record(number, 'rule', table, chain)
 
-                info('Table: {}, Chain: {}, Action: {}, Params: {}, Matches: {}'.format(table, chain, action, action_params, match_params))
                 self.tables[table].chains[chain].append(rule)
 
-    def read_from_file(self, file):
+    def read_parallel(self, lines, workers=None, trace=None):
+        segments = split_tables(lines)
+        seen = set()
+        jobs = []
+
+        for start, segment in segments:
+            name = segment[0].strip()[1:]
+
+            if segment[0].strip()[:1] != '*' or name in seen or name not in self.tables:
+                jobs.append(None)
+                continue
+
+            seen.add(name)
+            chains = [(chain.name, chain.action, chain.packets, chain.bytes) for chain in self.tables[name]]
+            jobs.append((name, chains, '\n'.join(segment), start, None if trace is None else trace.events.maxlen))
+
+        if sum(job is not None for job in jobs) < 2:
+            for start, segment in segments:
+                self.read_lines(segment, trace, start)
+
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [None if job is None else executor.submit(read_table, *job) for job in jobs]
+
+            for (start, segment), job, future in zip(segments, jobs, futures):
+                if future is None or future.exception() is not None:
+                    self.read_lines(segment, trace, start)
+                    continue
+
+                data, events = future.result()
+                table = self.tables[job[0]]
+
+                with gc_paused():
+                    for name, action, packets, chain_bytes, rows in marshal.loads(data):
+                        if name not in table.chains:
+                            table.new_chain(name, action=action)
+
+                        chain = table[name]
+                        chain.action = action
+                        chain.packets = packets
+                        chain.bytes = chain_bytes
+
+                        if self.symbols is None:
+                            chain.extend([Rule(*row) for row in rows])
+                        else:
+                            chain.extend([self.intern_rule(*row) for row in rows])
+
+                for event in events or ():
+                    trace.record(*event)
+
+    def intern_rule(self, match_params, action, action_params, goto, counters):
+        symbols = self.symbols
+        return Rule(symbols.intern_params(match_params), symbols.intern(action),
+                    symbols.intern_params(action_params), goto, counters)
+
+    def read_from_file(self, file, trace=None, workers=1):
         with open(file) as r:
-            self.read(r.read())
+            if workers == 1:
+                self.read_lines(r, trace)
+            else:
+                self.read_parallel(r, workers, trace)
+
+    def write(self, file, counters=False):
+        writer = RestoreWriter(file, counters)
+
+        for table in self.tables.values():
+            writer.write_table(table)
+
+        writer.flush()
+
+    def write_to_file(self, file, counters=False):
+        with open(file, 'w') as w:
+            self.write(w, counters)
+
+
+class RestoreWriter:
+    file = None
+    counters = False
+    binary = False
+    chunk_size = 1024
+    buffer = None
+
+    def __init__(self, file, counters=False, chunk_size=1024):
+        self.file = file
+        self.counters = counters
+        self.binary = not hasattr(file, 'encoding')
+        self.chunk_size = chunk_size
+        self.buffer = []
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.file)
+
+    def flush(self):
+        if not self.buffer:
+            return
+
+        self.buffer.append('')
+        data = '\n'.join(self.buffer)
+        self.buffer = []
+
+        self.file.write(data.encode() if self.binary else data)
+
+    def write_line(self, line):
+        self.buffer.append(line)
+
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_chain(self, chain):
+        prefix = '-A {} '.format(chain.name)
+
+        for rule in chain.rules:
+            if self.counters and rule.counters is not None:
+                self.write_line('[{}:{}] {}{}'.format(rule.counters[0], rule.counters[1], prefix, rule))
+            else:
+                self.write_line(prefix + str(rule))
+
+    def write_table(self, table):
+        self.write_line('*{}'.format(table.name))
+
+        for chain in table.chains.values():
+            self.write_line(chain.header())
+
+        for chain in table.chains.values():
+            self.write_chain(chain)
+
+        self.write_line('COMMIT')
+        self.flush()
+
+
+class AddressIndex:
+    option = None
+    entries = None
+    prefixes = None
+    negated = None
+    negated_entries = None
+    wildcard = None
+    unparsed = None
+
+    def __init__(self, rule_set, option='-s'):
+        self.option = option
+        self.entries = []
+        self.prefixes = PrefixTrie()
+        self.negated = PrefixTrie()
+        self.negated_entries = []
+        self.wildcard = []
+        self.unparsed = []
+
+        for table in rule_set:
+            for chain in table:
+                for position, rule in enumerate(chain):
+                    self.add(table.name, chain.name, position, rule)
+
+    def __repr__(self):
+        return '<{} {} {} rules>'.format(self.__class__.__name__, self.option, len(self.entries))
+
+    def add(self, table, chain, position, rule):
+        index = len(self.entries)
+        self.entries.append((table, chain, position, rule))
+
+        address = rule.get(self.option)
+        negated = rule.get('! ' + self.option)
+
+        if address is None and negated is None:
+            self.wildcard.append(index)
+            return
+
+        try:
+            networks = [to_network(network) for network in (negated if address is None else address).split(',')]
+        except (AttributeError, ValueError):
+            self.unparsed.append(index)
+            return
+
+        for network in networks:
+            if address is not None:
+                self.prefixes.insert(network, index)
+            else:
+                self.negated.insert(network, index)
+
+        if address is None:
+            self.negated_entries.append(index)
+
+    def collect(self, found):
+        return [index for network, indexes in found for index in indexes]
+
+    def result(self, indexes):
+        return [self.entries[index] for index in sorted(set(indexes).union(self.unparsed))]
+
+    def covered_by(self, network):
+        return self.result(self.collect(self.prefixes.covered_by(network)))
+
+    def covering(self, network):
+        return self.result(self.collect(self.prefixes.covering(network)))
+
+    def longest_match(self, address):
+        found = self.prefixes.longest_match(address)
+
+        if found is None:
+            return self.result([])
+
+        return self.result(found[1])
+
+    def matching(self, address):
+        network = to_network(address)
+
+        excluded = set(self.collect(self.negated.covering(network)))
+        excluded.update(self.collect(self.negated.covered_by(network)))
+
+        indexes = self.wildcard + self.collect(self.prefixes.covering(network))
+        indexes.extend(index for index in self.negated_entries if index not in excluded)
+
+        return self.result(indexes)
+
+    def overlapping(self, network):
+        return self.result(self.collect(self.prefixes.covering(network)) +
+                           self.collect(self.prefixes.covered_by(network)))
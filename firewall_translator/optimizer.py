@@ -0,0 +1,305 @@
+import ipaddress
+
+from firewall_translator.classifier import parse_ports
+from firewall_translator.generic import IPAddress
+from firewall_translator.iptables import Chain, Rule, final
+
+ADDRESS_OPTIONS = ('-s', '-d')
+PORT_OPTIONS = {'--sport': '--sports', '--sports': '--sports', '--dport': '--dports', '--dports': '--dports'}
+PORT_MODULES = frozenset(['tcp', 'udp', 'sctp', 'udplite', 'dccp', 'multiport'])
+MULTIPORT_SLOTS = 15
+
+
+def collapse(networks):
+    collapsed = []
+
+    for version in (4, 6):
+        collapsed.extend(ipaddress.collapse_addresses(network for network in networks if network.version == version))
+
+    return collapsed
+
+
+def merge_ranges(ranges):
+    merged = []
+
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+
+    return merged
+
+
+def format_range(port_range):
+    start, stop = port_range
+
+    if start == stop:
+        return str(start)
+
+    return '{}:{}'.format(start, stop)
+
+
+def port_lists(ranges):
+    lists = []
+    current = []
+    slots = 0
+
+    for port_range in ranges:
+        size = 1 if port_range[0] == port_range[1] else 2
+
+        if slots + size > MULTIPORT_SLOTS:
+            lists.append(current)
+            current = []
+            slots = 0
+
+        current.append(port_range)
+        slots += size
+
+    if current:
+        lists.append(current)
+
+    return lists
+
+
+def split(rule, option):
+    params = rule.match_params
+
+    for index, (key, value) in enumerate(params):
+        if key == option or option in PORT_OPTIONS and PORT_OPTIONS.get(key) == PORT_OPTIONS[option]:
+            break
+    else:
+        return None
+
+    if option in ADDRESS_OPTIONS:
+        try:
+            values = [IPAddress(address).address for address in value.split(',')]
+        except ValueError:
+            return None
+
+        return params[:index] + params[index + 1:], index, values
+
+    protocol = rule.get('-p')
+
+    if index == 0 or params[index - 1][0] != '-m' or params[index - 1][1] not in PORT_MODULES or not protocol:
+        return None
+
+    if index + 1 < len(params) and params[index + 1][0].startswith('--'):
+        return None
+
+    try:
+        ranges = parse_ports(value, protocol)
+    except (KeyError, ValueError):
+        return None
+
+    return params[:index - 1] + params[index + 1:], index - 1, ranges
+
+
+def rule_key(rule, option):
+    parts = split(rule, option) if final(rule) else None
+
+    if parts is None:
+        return None, None
+
+    params, index, values = parts
+    return (params, index, rule.action, rule.action_params, rule.goto), values
+
+
+def build(key, option, values):
+    params, index, action, action_params, goto = key
+    rules = []
+
+    if option in ADDRESS_OPTIONS:
+        for network in collapse(values):
+            match = ((option, str(network)),)
+            rules.append(Rule(params[:index] + match + params[index:], action, action_params, goto))
+
+        return rules
+
+    protocol = dict(params).get('-p')
+
+    for ports in port_lists(merge_ranges(values)):
+        if len(ports) == 1 and protocol in PORT_MODULES:
+            match = (('-m', protocol), (option.rstrip('s'), format_range(ports[0])))
+        else:
+            match = (('-m', 'multiport'), (PORT_OPTIONS[option], ','.join(format_range(port) for port in ports)))
+
+        rules.append(Rule(params[:index] + match + params[index:], action, action_params, goto))
+
+    return rules
+
+
+def evaluation_cost(rules, weights=None):
+    if weights is None:
+        weights = [1] * len(rules)
+
+    total = sum(weights) + 1
+    walked = sum(weight * (position + 1) for position, weight in enumerate(weights)) + len(rules)
+
+    return Cost(len(rules), walked / total)
+
+
+class Cost:
+    __slots__ = ('worst', 'average')
+
+    def __init__(self, worst, average):
+        self.worst = worst
+        self.average = average
+
+    def __repr__(self):
+        return '<{} worst={} average={:.2f}>'.format(self.__class__.__name__, self.worst, self.average)
+
+
+class Merge:
+    __slots__ = ('option', 'original', 'merged')
+
+    def __init__(self, option, original, merged):
+        self.option = option
+        self.original = original
+        self.merged = merged
+
+    def __repr__(self):
+        return '<{} {} {} -> {} rules>'.format(self.__class__.__name__, self.option, len(self.original),
+                                               len(self.merged))
+
+    def verify(self):
+        keys = set()
+        before = []
+        after = []
+
+        for rules, values in [(self.original, before), (self.merged, after)]:
+            for rule in rules:
+                key, rule_values = rule_key(rule, self.option)
+
+                if key is None:
+                    raise RuntimeError('Rule {} has no {} to merge on'.format(rule, self.option))
+
+                keys.add(key)
+                values.extend(rule_values)
+
+        if len(keys) != 1:
+            raise RuntimeError('Merged rules differ outside {}: {}'.format(self.option, self))
+
+        if self.option in ADDRESS_OPTIONS:
+            same = set(collapse(before)) == set(collapse(after))
+        else:
+            same = merge_ranges(before) == merge_ranges(after)
+
+        if not same:
+            raise RuntimeError('Merged rules do not match the same {} values: {}'.format(self.option, self))
+
+
+class Optimization:
+    chain = None
+    optimized = None
+    merges = None
+    before = None
+    after = None
+
+    def __init__(self, chain, optimized, merges, weights):
+        self.chain = chain
+        self.optimized = optimized
+        self.merges = merges
+        self.before = evaluation_cost(chain.rules)
+        self.after = evaluation_cost(optimized.rules, weights)
+
+    def __repr__(self):
+        return '<{} {} {} -> {} rules>'.format(self.__class__.__name__, self.chain.name, len(self.chain),
+                                               len(self.optimized))
+
+    def verify(self):
+        for merge in self.merges:
+            merge.verify()
+
+
+class Optimizer:
+    options = ('-s', '-d', '--dport', '--sport')
+
+    def __init__(self, options=None):
+        if options is not None:
+            self.options = tuple(options)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(self.options))
+
+    def merge_pass(self, rules, weights, merges):
+        merged_rules = []
+        merged_weights = []
+        position = 0
+
+        while position < len(rules):
+            group = None
+
+            for option in self.options:
+                key, values = rule_key(rules[position], option)
+                if key is None:
+                    continue
+
+                end = position + 1
+                group_values = list(values)
+
+                while end < len(rules):
+                    other_key, other_values = rule_key(rules[end], option)
+                    if other_key != key:
+                        break
+
+                    group_values.extend(other_values)
+                    end += 1
+
+                if end - position < 2:
+                    continue
+
+                replacement = build(key, option, group_values)
+
+                if len(replacement) < end - position:
+                    group = option, end, replacement
+                    break
+
+            if group is None:
+                merged_rules.append(rules[position])
+                merged_weights.append(weights[position])
+                position += 1
+                continue
+
+            option, end, replacement = group
+            merges.append(Merge(option, rules[position:end], replacement))
+
+            weight = sum(weights[position:end]) / len(replacement)
+            merged_rules.extend(replacement)
+            merged_weights.extend([weight] * len(replacement))
+            position = end
+
+        return merged_rules, merged_weights
+
+    def optimize(self, chain):
+        rules = list(chain.rules)
+        weights = [1] * len(rules)
+        merges = []
+
+        while True:
+            count = len(rules)
+            rules, weights = self.merge_pass(rules, weights, merges)
+
+            if len(rules) == count:
+                break
+
+        optimized = Chain(chain.name, rules, chain.action)
+        optimized.packets, optimized.bytes = chain.packets, chain.bytes
+
+        return Optimization(chain, optimized, merges, weights)
+
+
+def optimize(rule_set, table='filter', verify=True):
+    optimizer = Optimizer()
+    optimizations = []
+
+    for chain in list(rule_set[table]):
+        optimization = optimizer.optimize(chain)
+
+        if verify:
+            optimization.verify()
+
+        rule_set[table][chain.name] = optimization.optimized
+        optimizations.append(optimization)
+
+    return optimizations
@@ -0,0 +1,345 @@
+import array
+import itertools
+import operator
+import struct
+import sys
+
+from firewall_translator.iptables import Chain, Rule, RuleSet, Table, gc_paused
+
+MAGIC = b'FWRS'
+VERSION = 2
+HEADER = struct.Struct('<4sHB')
+SECTION = struct.Struct('<cQ')
+
+KINDS = (RuleSet, Table, Chain, Rule)
+
+SECTIONS = (
+    ('tuple_lengths', 'I'),
+    ('tuple_items', 'I'),
+    ('pairs', 'I'),
+    ('tables', 'I'),
+    ('chains', 'I'),
+    ('chain_counters', 'Q'),
+    ('param_lengths', 'I'),
+    ('param_pairs', 'I'),
+    ('matches', 'I'),
+    ('actions', 'I'),
+    ('gotos', 'B'),
+    ('action_params', 'I'),
+    ('counted', 'B'),
+    ('counters', 'Q'),
+)
+
+
+def wrap(item):
+    if isinstance(item, RuleSet):
+        return list(item)
+
+    if isinstance(item, Table):
+        return [item]
+
+    if isinstance(item, Chain):
+        return [Table(None, {item.name: item})]
+
+    if isinstance(item, Rule):
+        return [Table(None, {None: Chain(None, [item])})]
+
+    raise TypeError('Cannot serialize {!r}'.format(item))
+
+
+def numbered(keys):
+    return dict(zip(keys, itertools.count()))
+
+
+def encode(item):
+    tables = wrap(item)
+    kind = next(index for index, kind in enumerate(KINDS) if isinstance(item, kind))
+    chains = list(itertools.chain.from_iterable(tables))
+    rules = list(itertools.chain.from_iterable(map(operator.attrgetter('rules'), chains)))
+
+    matches = list(map(operator.attrgetter('match_params'), rules))
+    actions = list(map(operator.attrgetter('action'), rules))
+    action_params = list(map(operator.attrgetter('action_params'), rules))
+    counters = list(map(operator.attrgetter('counters'), rules))
+
+    params = numbered(dict.fromkeys(itertools.chain(matches, action_params)))
+    pairs = numbered(dict.fromkeys(itertools.chain.from_iterable(params)))
+    values = dict.fromkeys(itertools.chain(map(operator.itemgetter(1), pairs), actions,
+                                           map(operator.attrgetter('name'), chains),
+                                           map(operator.attrgetter('action'), chains),
+                                           map(operator.attrgetter('name'), tables)))
+    values.pop(None, None)
+    tuples = [value for value in values if not isinstance(value, str)]
+    strings = dict.fromkeys(itertools.chain([''], map(operator.itemgetter(0), pairs),
+                                            [value for value in values if isinstance(value, str)],
+                                            itertools.chain.from_iterable(tuples)))
+    objects = numbered(itertools.chain([None], strings, tuples))
+    object_id = objects.__getitem__
+
+    sections = {name: array.array(typecode) for name, typecode in SECTIONS}
+    sections['tuple_lengths'].extend(map(len, tuples))
+    sections['tuple_items'].extend(map(object_id, itertools.chain.from_iterable(tuples)))
+    sections['pairs'].extend(map(object_id, itertools.chain.from_iterable(pairs)))
+    sections['param_lengths'].extend(map(len, params))
+    sections['param_pairs'].extend(map(pairs.__getitem__, itertools.chain.from_iterable(params)))
+
+    for table in tables:
+        sections['tables'].extend((object_id(table.name), len(table)))
+
+    for chain in chains:
+        sections['chains'].extend((object_id(chain.name), object_id(chain.action), len(chain)))
+        sections['chain_counters'].extend((chain.packets, chain.bytes))
+
+    sections['matches'].extend(map(params.__getitem__, matches))
+    sections['actions'].extend(map(object_id, actions))
+    sections['gotos'].extend(map(bool, map(operator.attrgetter('goto'), rules)))
+    sections['action_params'].extend(map(params.__getitem__, action_params))
+    sections['counted'].extend(map(operator.is_not, counters, itertools.repeat(None)))
+    sections['counters'].extend(itertools.chain.from_iterable(filter(None, counters)))
+
+    return pack(kind, strings, sections)
+
+
+def pack(kind, strings, sections):
+    joined = '\0'.join(strings)
+
+    if joined.count('\0') != len(strings) - 1:
+        raise ValueError('Cannot serialize a string containing NUL: {!r}'.format(
+            next(string for string in strings if '\0' in string)))
+
+    strings = joined.encode()
+    parts = [HEADER.pack(MAGIC, VERSION, kind), SECTION.pack(b's', len(strings)), strings]
+
+    for name, typecode in SECTIONS:
+        section = sections[name]
+
+        if sys.byteorder != 'little':
+            section = array.array(typecode, section)
+            section.byteswap()
+
+        parts.append(SECTION.pack(typecode.encode(), len(section)))
+        parts.append(section.tobytes())
+
+    return b''.join(parts)
+
+
+def read_sections(data):
+    magic, version, kind = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or kind >= len(KINDS):
+        raise ValueError('Not a version {} rule set encoding'.format(VERSION))
+
+    offset = HEADER.size
+    _, size = SECTION.unpack_from(data, offset)
+    offset += SECTION.size
+    strings = bytes(data[offset:offset + size]).decode().split('\0')
+    offset += size
+
+    sections = {}
+
+    for name, typecode in SECTIONS:
+        code, count = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+
+        if code != typecode.encode():
+            raise ValueError('Section {} has type {!r}, expected {!r}'.format(name, code, typecode))
+
+        section = array.array(typecode)
+        end = offset + count * section.itemsize
+        section.frombytes(data[offset:end])
+        offset = end
+
+        if len(section) != count:
+            raise ValueError('Section {} is truncated'.format(name))
+
+        if sys.byteorder != 'little':
+            section.byteswap()
+
+        sections[name] = section
+
+    if offset != len(data):
+        raise ValueError('Trailing data after the rule set encoding')
+
+    return kind, strings, sections
+
+
+def check_count(name, section, count):
+    if len(section) != count:
+        raise ValueError('Section {} has {} entries, expected {}'.format(name, len(section), count))
+
+
+def check_indices(name, indices, limit):
+    if len(indices) and max(indices) >= limit:
+        raise ValueError('Section {} refers past the {} entries it indexes'.format(name, limit))
+
+
+def check_sections(strings, sections):
+    rules = len(sections['matches'])
+    chains = len(sections['chains']) // 3
+    objects = len(strings) + len(sections['tuple_lengths']) + 1
+    params = len(sections['param_lengths'])
+
+    for name in ('actions', 'gotos', 'action_params', 'counted'):
+        check_count(name, sections[name], rules)
+
+    check_count('tuple_items', sections['tuple_items'], sum(sections['tuple_lengths']))
+    check_count('pairs', sections['pairs'], len(sections['pairs']) // 2 * 2)
+    check_count('param_pairs', sections['param_pairs'], sum(sections['param_lengths']))
+    check_count('chains', sections['chains'], chains * 3)
+    check_count('chain_counters', sections['chain_counters'], chains * 2)
+    check_count('tables', sections['tables'], len(sections['tables']) // 2 * 2)
+    check_count('counters', sections['counters'], sum(sections['counted']) * 2)
+
+    if sum(sections['chains'][2::3]) != rules or sum(sections['tables'][1::2]) != chains:
+        raise ValueError('Tables and chains do not cover all {} rules'.format(rules))
+
+    check_indices('tuple_items', sections['tuple_items'], len(strings) + 1)
+    check_indices('pairs', sections['pairs'], objects)
+    check_indices('param_pairs', sections['param_pairs'], len(sections['pairs']) // 2)
+    check_indices('tables', sections['tables'][0::2], objects)
+    check_indices('chains', sections['chains'][0::3] + sections['chains'][1::3], objects)
+    check_indices('matches', sections['matches'], params)
+    check_indices('actions', sections['actions'], objects)
+    check_indices('action_params', sections['action_params'], params)
+    check_indices('gotos', sections['gotos'], 2)
+    check_indices('counted', sections['counted'], 2)
+
+
+def decode_tuples(items, lengths, indices):
+    items = map(items.__getitem__, indices)
+
+    return list(map(tuple, map(itertools.islice, itertools.repeat(items), lengths)))
+
+
+class Decoder:
+    sections = None
+    objects = None
+    params = None
+    counters = None
+
+    def __init__(self, strings, sections):
+        self.sections = sections
+        self.objects = [None] + strings
+        self.objects.extend(decode_tuples(self.objects, sections['tuple_lengths'], sections['tuple_items']))
+
+    def __repr__(self):
+        return '<{} {} objects>'.format(self.__class__.__name__, len(self.objects))
+
+    def decode(self):
+        if self.params is not None:
+            return
+
+        sections = self.sections
+        pair_items = map(self.objects.__getitem__, sections['pairs'])
+        pairs = list(zip(pair_items, pair_items))
+        self.params = decode_tuples(pairs, sections['param_lengths'], sections['param_pairs'])
+
+        counter_items = iter(sections['counters'])
+        counter_table = [None]
+        counter_table.extend(zip(counter_items, counter_items))
+        counted = sections['counted']
+        self.counters = list(map(counter_table.__getitem__,
+                                 map(operator.mul, itertools.accumulate(counted), counted)))
+
+    def rules(self, start, stop):
+        with gc_paused():
+            self.decode()
+            sections = self.sections
+            params = self.params.__getitem__
+
+            return list(map(Rule, map(params, sections['matches'][start:stop]),
+                            map(self.objects.__getitem__, sections['actions'][start:stop]),
+                            map(params, sections['action_params'][start:stop]),
+                            map(bool, sections['gotos'][start:stop]), self.counters[start:stop]))
+
+
+class LazyChain(Chain):
+    decoder = None
+    start = 0
+    stop = 0
+    loaded = None
+
+    def __init__(self, name, decoder, start, stop, action='-'):
+        self.name = name
+        self.action = action
+        self.decoder = decoder
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        if self.loaded is None:
+            return self.stop - self.start
+
+        return len(self.loaded)
+
+    def __reduce__(self):
+        return Chain, (self.name, self.rules, self.action), {'packets': self.packets, 'bytes': self.bytes}
+
+    @property
+    def rules(self):
+        if self.loaded is None:
+            self.loaded = self.decoder.rules(self.start, self.stop)
+            self.decoder = None
+
+        return self.loaded
+
+    @rules.setter
+    def rules(self, rules):
+        self.loaded = rules
+        self.decoder = None
+
+
+def loads(data):
+    try:
+        kind, strings, sections = read_sections(memoryview(data))
+    except struct.error as error:
+        raise ValueError('Truncated rule set encoding: {}'.format(error))
+
+    check_sections(strings, sections)
+    decoder = Decoder(strings, sections)
+    objects = decoder.objects
+
+    chain_items = iter(sections['chains'])
+    chain_counters = iter(sections['chain_counters'])
+    chains = []
+    start = 0
+
+    for (name, action, length), counters in zip(zip(chain_items, chain_items, chain_items),
+                                                zip(chain_counters, chain_counters)):
+        chain = LazyChain(objects[name], decoder, start, start + length, objects[action])
+        chain.packets, chain.bytes = counters
+        chains.append(chain)
+        start += length
+
+    table_items = iter(sections['tables'])
+    tables = []
+    start = 0
+
+    for name, length in zip(table_items, table_items):
+        tables.append(Table(objects[name], {chain.name: chain for chain in chains[start:start + length]}))
+        start += length
+
+    if KINDS[kind] is RuleSet:
+        return RuleSet({table.name: table for table in tables})
+
+    if KINDS[kind] is Table:
+        return tables[0]
+
+    chain, = tables[0]
+
+    if KINDS[kind] is Chain:
+        return chain
+
+    return chain[0]
+
+
+def dumps(item):
+    with gc_paused():
+        return encode(item)
+
+
+def dump(item, file):
+    file.write(dumps(item))
+
+
+def load(file):
+    return loads(file.read())
@@ -0,0 +1,272 @@
+import collections
+
+from firewall_translator import iana
+from firewall_translator.classifier import OPTIONS, CompiledRule
+from firewall_translator.iptables import Rule
+from firewall_translator.optimizer import Cost
+
+MAX_CHAIN_NAME = 28
+
+
+def dispatch_keys(rule, field, prefix_length):
+    constraint = rule.constraints.get(field)
+    if constraint is None or constraint[0]:
+        return ()
+
+    values = constraint[1]
+
+    if field == 'in_iface' or field == 'out_iface':
+        return [value for value in values if not value.endswith('+')]
+
+    if field == 'src' or field == 'dst':
+        return [value.supernet(new_prefix=prefix_length) if value.prefixlen > prefix_length else value
+                for value in values if value.prefixlen >= prefix_length]
+
+    return values
+
+
+def can_match(rule, field, key):
+    constraint = rule.constraints.get(field)
+    if constraint is None or constraint[0]:
+        return True
+
+    for value in constraint[1]:
+        if field == 'in_iface' or field == 'out_iface':
+            if value == key or value.endswith('+') and key.startswith(value[:-1]):
+                return True
+
+        elif field == 'src' or field == 'dst':
+            if value.version == key.version and value.overlaps(key):
+                return True
+
+        elif value == key:
+            return True
+
+    return False
+
+
+def outside(rule, field, keys):
+    constraint = rule.constraints.get(field)
+    if constraint is None or constraint[0]:
+        return True
+
+    for value in constraint[1]:
+        if field == 'in_iface' or field == 'out_iface':
+            if value.endswith('+') or value not in keys:
+                return True
+
+        elif field == 'src' or field == 'dst':
+            if not any(value.version == key.version and value.subnet_of(key) for key in keys):
+                return True
+
+        elif value not in keys:
+            return True
+
+    return False
+
+
+def bound(rule, field):
+    constraint = rule.constraints.get(field)
+    return constraint is not None and not constraint[0]
+
+
+def path_costs(entries, rules, targets, offset, costs):
+    targets = set(targets)
+
+    for position, entry in enumerate(entries, offset + 1):
+        if entry.__class__ is Dispatch:
+            descending = [index for index in entry.members if index in targets and bound(rules[index], entry.field)]
+
+            if descending:
+                targets.difference_update(descending)
+                path_costs(entry.entries, rules, descending, position, costs)
+
+        elif entry in targets:
+            costs[entry] = position
+            targets.discard(entry)
+
+    return costs
+
+
+def worst_cost(entries):
+    worst = len(entries)
+
+    for position, entry in enumerate(entries, 1):
+        if entry.__class__ is Dispatch:
+            worst = max(worst, position + worst_cost(entry.entries))
+
+    return worst
+
+
+def tree_cost(entries, rules, indices):
+    worst = worst_cost(entries)
+    costs = path_costs(entries, rules, indices, 0, {})
+
+    return Cost(worst, (sum(costs.values()) + worst) / (len(indices) + 1))
+
+
+class Dispatch:
+    __slots__ = ('option', 'field', 'key', 'members', 'entries', 'name')
+
+    def __init__(self, option, key, members, entries=None):
+        self.option = option
+        self.field = OPTIONS[option]
+        self.key = key
+        self.members = members
+        self.entries = members if entries is None else entries
+        self.name = None
+
+    def __repr__(self):
+        return '<{} {} {} -> {}>'.format(self.__class__.__name__, self.option, self.key, self.name)
+
+    @property
+    def value(self):
+        if self.field == 'proto':
+            return iana.PROTOCOLS_BY_NUMBER[self.key].name
+
+        return str(self.key)
+
+
+class Split:
+    table = None
+    chain = None
+    original = None
+    entries = None
+    chains = None
+    before = None
+    after = None
+
+    def __init__(self, table, chain, original, entries, chains, before, after):
+        self.table = table
+        self.chain = chain
+        self.original = original
+        self.entries = entries
+        self.chains = chains
+        self.before = before
+        self.after = after
+
+    def __repr__(self):
+        return '<{} {} {} rules -> {} chains>'.format(self.__class__.__name__, self.chain.name, len(self.original),
+                                                      len(self.chains))
+
+
+class ChainSplitter:
+    options = ('-i', '-o', '-p')
+    minimum = 8
+    max_depth = 3
+    prefix_length = None
+
+    def __init__(self, options=None, minimum=8, max_depth=3, prefix_length=None):
+        if options is not None:
+            self.options = tuple(options)
+        elif prefix_length is not None:
+            self.options = self.options + ('-s', '-d')
+
+        self.minimum = minimum
+        self.max_depth = max_depth
+        self.prefix_length = prefix_length
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(self.options))
+
+    def candidate(self, rules, indices, option):
+        field = OPTIONS[option]
+        counts = collections.Counter()
+
+        for index in indices:
+            counts.update(set(dispatch_keys(rules[index], field, self.prefix_length)))
+
+        keys = [key for key, count in counts.most_common() if count >= self.minimum]
+        if not keys:
+            return None
+
+        branches = [Dispatch(option, key, [index for index in indices if can_match(rules[index], field, key)])
+                    for key in keys]
+        remainder = [index for index in indices if outside(rules[index], field, keys)]
+
+        return branches, remainder
+
+    def build(self, rules, indices, used, depth):
+        if depth >= self.max_depth or len(indices) < 2 * self.minimum:
+            return list(indices)
+
+        best = tree_cost(indices, rules, indices).average
+        split = None
+
+        for option in self.options:
+            if option in used:
+                continue
+
+            candidate = self.candidate(rules, indices, option)
+            if candidate is None:
+                continue
+
+            branches, remainder = candidate
+            average = tree_cost(branches + remainder, rules, indices).average
+
+            if average < best:
+                best = average
+                split = option, branches, remainder
+
+        if split is None:
+            return list(indices)
+
+        option, branches, remainder = split
+        used = used | {option}
+
+        for branch in branches:
+            branch.entries = self.build(rules, branch.members, used, depth + 1)
+
+        return branches + self.build(rules, remainder, used, depth)
+
+    def name_chains(self, table, entries, parent, names):
+        for entry in entries:
+            if entry.__class__ is not Dispatch:
+                continue
+
+            name = '{}_{}_{}'.format(parent, entry.option.lstrip('-'), entry.value.replace('/', '-'))
+            index = len(names)
+            while len(name) > MAX_CHAIN_NAME or name in table.chains or name in names:
+                index += 1
+                name = '{}_{}'.format(parent[:MAX_CHAIN_NAME - len(str(index)) - 1], index)
+
+            entry.name = name
+            names.append(name)
+            self.name_chains(table, entry.entries, name, names)
+
+        return names
+
+    @staticmethod
+    def render(entries, chain):
+        rules = []
+
+        for entry in entries:
+            if entry.__class__ is Dispatch:
+                rules.append(Rule(((entry.option, entry.value),), entry.name, goto=True))
+            else:
+                rule = chain[entry]
+                rules.append(Rule(rule.match_params, rule.action, rule.action_params, rule.goto))
+
+        return rules
+
+    def create_chains(self, table, entries, chain):
+        for entry in entries:
+            if entry.__class__ is Dispatch:
+                table.new_chain(entry.name, self.render(entry.entries, chain))
+                self.create_chains(table, entry.entries, chain)
+
+    def split(self, table, name):
+        chain = table[name]
+        original = list(chain.rules)
+        rules = [CompiledRule(rule, position) for position, rule in enumerate(original)]
+        indices = list(range(len(rules)))
+
+        entries = self.build(rules, indices, frozenset(), 0)
+        before = tree_cost(indices, rules, indices)
+        after = tree_cost(entries, rules, indices)
+
+        chains = self.name_chains(table, entries, name, [])
+        self.create_chains(table, entries, original)
+        chain.rules = self.render(entries, original)
+
+        return Split(table, chain, original, entries, chains, before, after)
@@ -0,0 +1,139 @@
+import ipaddress
+
+import firewall_translator.generic
+
+
+def to_network(address):
+    if isinstance(address, firewall_translator.generic.IPAddress):
+        return address.address
+
+    if isinstance(address, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return address
+
+    return ipaddress.ip_interface(address).network
+
+
+class Node:
+    __slots__ = ('children', 'network', 'values')
+
+    def __init__(self):
+        self.children = [None, None]
+        self.network = None
+        self.values = None
+
+
+class PrefixTrie:
+    roots = None
+    size = 0
+
+    def __init__(self, items=None):
+        self.roots = {4: Node(), 6: Node()}
+
+        if items is not None:
+            for network, value in items:
+                self.insert(network, value)
+
+    def __contains__(self, network):
+        node = self.find(to_network(network))
+        return node is not None and node.values is not None
+
+    def __getitem__(self, network):
+        node = self.find(to_network(network))
+
+        if node is None or node.values is None:
+            raise KeyError(network)
+
+        return node.values
+
+    def __iter__(self):
+        for root in self.roots.values():
+            for node in self.walk(root):
+                yield node.network, node.values
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return '<{} {} prefixes>'.format(self.__class__.__name__, self.size)
+
+    @staticmethod
+    def bits(network):
+        address = int(network.network_address)
+        width = network.max_prefixlen
+
+        for index in range(network.prefixlen):
+            yield address >> (width - 1 - index) & 1
+
+    def find(self, network):
+        node = self.roots[network.version]
+
+        for bit in self.bits(network):
+            node = node.children[bit]
+            if node is None:
+                return None
+
+        return node
+
+    def insert(self, network, value):
+        network = to_network(network)
+        node = self.roots[network.version]
+
+        for bit in self.bits(network):
+            child = node.children[bit]
+            if child is None:
+                child = node.children[bit] = Node()
+            node = child
+
+        if node.values is None:
+            node.network = network
+            node.values = []
+            self.size += 1
+
+        node.values.append(value)
+
+    def covering(self, network):
+        network = to_network(network)
+        node = self.roots[network.version]
+        found = []
+
+        if node.values is not None:
+            found.append((node.network, node.values))
+
+        for bit in self.bits(network):
+            node = node.children[bit]
+            if node is None:
+                break
+
+            if node.values is not None:
+                found.append((node.network, node.values))
+
+        return found
+
+    def covered_by(self, network):
+        node = self.find(to_network(network))
+
+        if node is None:
+            return []
+
+        return [(node.network, node.values) for node in self.walk(node)]
+
+    def longest_match(self, network):
+        found = self.covering(network)
+
+        if not found:
+            return None
+
+        return found[-1]
+
+    def walk(self, node):
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            if node.values is not None:
+                yield node
+
+            for child in reversed(node.children):
+                if child is not None:
+                    stack.append(child)
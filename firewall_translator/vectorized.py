@@ -0,0 +1,256 @@
+import ipaddress
+
+import numpy
+
+from firewall_translator import iana
+from firewall_translator.classifier import FIELDS, MAX_DEPTH, CompiledRule
+from firewall_translator.iptables import TERMINAL
+
+
+def ipv4_array(addresses):
+    if isinstance(addresses, numpy.ndarray) and addresses.dtype.kind in 'iu':
+        return addresses.astype(numpy.uint32, copy=False)
+
+    return numpy.array([int(ipaddress.IPv4Address(address)) for address in addresses], dtype=numpy.uint32)
+
+
+def protocol_array(protocols):
+    if isinstance(protocols, numpy.ndarray) and protocols.dtype.kind in 'iu':
+        return protocols.astype(numpy.int16, copy=False)
+
+    numbers = {}
+    for protocol in set(protocols):
+        numbers[protocol] = -1 if protocol is None else iana.get_protocol(protocol).number
+
+    return numpy.array([numbers[protocol] for protocol in protocols], dtype=numpy.int16)
+
+
+def port_array(ports):
+    return numpy.asarray(ports, dtype=numpy.int32)
+
+
+def interface_array(interfaces):
+    return numpy.asarray(interfaces, dtype=str)
+
+
+CONVERTERS = {
+    'in_iface': interface_array,
+    'out_iface': interface_array,
+    'src': ipv4_array,
+    'dst': ipv4_array,
+    'proto': protocol_array,
+    'sport': port_array,
+    'dport': port_array,
+}
+
+
+def selectivity(test):
+    field, negated, values = test
+
+    if negated:
+        return 5
+
+    if field == 'src' or field == 'dst':
+        return 0 if all(netmask >= 0xffffff00 for netmask, network in values) else 2
+
+    if field == 'sport' or field == 'dport':
+        return 1
+
+    if field == 'proto':
+        return 3
+
+    return 4
+
+
+class VectorRule:
+    __slots__ = ('rule', 'position', 'tests', 'supported')
+
+    def __init__(self, compiled):
+        self.rule = compiled.rule
+        self.position = compiled.position
+        self.supported = compiled.supported
+        self.tests = []
+
+        for field, (negated, values) in compiled.constraints.items():
+            if field == 'src' or field == 'dst':
+                values = [(int(network.netmask), int(network.network_address))
+                          for network in values if network.version == 4]
+
+            elif field == 'in_iface' or field == 'out_iface':
+                values = [(name[:-1], True) if name.endswith('+') else (name, False) for name in values]
+
+            self.tests.append((field, negated, values))
+
+        self.tests.sort(key=selectivity)
+
+    def __repr__(self):
+        return '<{} {} {!r}>'.format(self.__class__.__name__, self.position, self.tests)
+
+    def match(self, columns):
+        candidates = None
+
+        for field, negated, values in self.tests:
+            column = columns[field]
+
+            if column is None:
+                if negated:
+                    continue
+
+                return numpy.zeros(0, dtype=numpy.intp)
+
+            if candidates is not None:
+                column = column[candidates]
+
+            hit = numpy.zeros(len(column), dtype=bool)
+
+            if field == 'src' or field == 'dst':
+                for netmask, network in values:
+                    hit |= (column & netmask) == network
+
+            elif field == 'in_iface' or field == 'out_iface':
+                for name, prefix in values:
+                    hit |= numpy.char.startswith(column, name) if prefix else column == name
+
+            elif field == 'proto':
+                hit = numpy.isin(column, values)
+
+            else:
+                for start, stop in values:
+                    hit |= (column >= start) & (column <= stop)
+
+            if negated:
+                hit = ~hit
+
+            candidates = numpy.flatnonzero(hit) if candidates is None else candidates[hit]
+
+            if not len(candidates):
+                break
+
+        return candidates
+
+
+class BatchResult:
+    verdicts = None
+    chains = None
+    positions = None
+
+    def __init__(self, size):
+        self.verdicts = numpy.full(size, '', dtype='U16')
+        self.chains = numpy.full(size, '', dtype='U32')
+        self.positions = numpy.full(size, -1, dtype=numpy.int32)
+
+    def __len__(self):
+        return len(self.verdicts)
+
+    def __repr__(self):
+        return '<{} {} packets>'.format(self.__class__.__name__, len(self))
+
+    def record(self, indexes, verdict, chain, position):
+        self.verdicts[indexes] = verdict
+        self.chains[indexes] = chain
+        self.positions[indexes] = position
+
+    def counts(self):
+        verdicts, counts = numpy.unique(self.verdicts, return_counts=True)
+        return dict(zip(verdicts.tolist(), counts.tolist()))
+
+
+class BatchClassifier:
+    table = None
+    assume_match = False
+    compiled = None
+
+    def __init__(self, rule_set, table='filter', assume_match=False):
+        self.table = rule_set[table]
+        self.assume_match = assume_match
+        self.compiled = {}
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.table.name)
+
+    def compile(self, name):
+        try:
+            return self.compiled[name]
+        except KeyError:
+            rules = [VectorRule(CompiledRule(rule, position)) for position, rule in enumerate(self.table[name])]
+            rules = [rule for rule in rules if self.assume_match or rule.supported]
+            self.compiled[name] = rules
+            return rules
+
+    def evaluate(self, chain, src=None, dst=None, proto=None, sport=None, dport=None, in_iface=None,
+                 out_iface=None):
+        columns = dict(zip(FIELDS, [in_iface, out_iface, src, dst, proto, sport, dport]))
+        columns = {field: None if values is None else CONVERTERS[field](values) for field, values in columns.items()}
+
+        sizes = set(len(values) for values in columns.values() if values is not None)
+        if len(sizes) != 1:
+            raise ValueError('All packet columns must have the same, non-zero length')
+
+        size = sizes.pop()
+        result = BatchResult(size)
+        start = self.table[chain]
+
+        continuing = self.run(chain, numpy.arange(size), columns, result, 0)
+        result.record(numpy.flatnonzero(continuing), start.action, start.name, -1)
+
+        return result
+
+    def run(self, name, indexes, columns, result, depth):
+        if depth > MAX_DEPTH:
+            raise RuntimeError('Chain recursion deeper than {} in {}'.format(MAX_DEPTH, name))
+
+        continuing = numpy.zeros(len(indexes), dtype=bool)
+        work = numpy.arange(len(indexes))
+        alive = numpy.ones(len(work), dtype=bool)
+        dead = 0
+        local = self.gather(columns, indexes)
+
+        for rule in self.compile(name):
+            if dead * 2 > len(work):
+                work = work[alive]
+                local = self.gather(local, alive)
+                alive = numpy.ones(len(work), dtype=bool)
+                dead = 0
+
+            if dead == len(work):
+                break
+
+            hit = rule.match(local)
+
+            if hit is None:
+                hit = numpy.flatnonzero(alive)
+            else:
+                hit = hit[alive[hit]]
+
+            if not len(hit):
+                continue
+
+            target = rule.rule.action
+            selected = work[hit]
+
+            if target in TERMINAL:
+                result.record(indexes[selected], target, name, rule.position)
+
+            elif target == 'RETURN':
+                continuing[selected] = True
+
+            elif target in self.table.chains:
+                returned = self.run(target, indexes[selected], columns, result, depth + 1)
+
+                if rule.rule.goto:
+                    continuing[selected[returned]] = True
+                else:
+                    hit = hit[~returned]
+
+            else:
+                continue
+
+            alive[hit] = False
+            dead += len(hit)
+
+        continuing[work[alive]] = True
+        return continuing
+
+    @staticmethod
+    def gather(columns, selection):
+        return {field: None if values is None else values[selection] for field, values in columns.items()}
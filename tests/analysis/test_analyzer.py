@@ -0,0 +1,130 @@
+import os
+import random
+
+import pytest
+
+from firewall_translator.analysis import Analyzer, analyze, covers, overlaps, outcome
+from firewall_translator.iptables import Rule, RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+RULES = '''*filter
+:INPUT DROP [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [0:0]
+-A FORWARD -s 10.0.0.0/8 -p tcp -m multiport --dports 20:30,80 -j ACCEPT
+-A FORWARD -s 10.1.0.0/16 -p tcp -m tcp --dport 22 -j DROP
+-A FORWARD -s 10.1.2.3/32 -p tcp -m tcp --dport 80 -j ACCEPT
+-A FORWARD -s 10.0.0.0/8 -p tcp -m tcp --dport 25:443 -j REJECT --reject-with tcp-reset
+-A FORWARD -i eth+ -p udp -j DROP
+-A FORWARD -i eth1 -p udp -m udp --dport 53 -j ACCEPT
+-A FORWARD -i eth1 -p udp -m state --state NEW -j DROP
+-A FORWARD -p udp ! --dport 53 -j ACCEPT
+-A FORWARD -i ppp0 -p udp -m udp --dport 123 -j ACCEPT
+-A FORWARD -j DROP
+-A FORWARD -s 192.168.0.0/24 -j ACCEPT
+-A FORWARD -s 192.168.0.0/24 -j LOG
+COMMIT
+'''
+
+
+def rules():
+    rule_set = RuleSet()
+    rule_set.read(RULES)
+    return rule_set
+
+
+@pytest.mark.parametrize('c_position, c_kind, c_other',
+                         [
+                             (1, 'shadowed', 0),
+                             (2, 'redundant', 0),
+                             (3, 'correlated', 0),
+                             (5, 'shadowed', 4),
+                             (6, 'redundant', 4),
+                             (7, 'correlated', 4),
+                             (8, 'redundant', 7),
+                             (10, 'shadowed', 9),
+                             (11, 'shadowed', 9),
+                         ])
+def test_anomalies(c_position, c_kind, c_other):
+    found = [(anomaly.kind, anomaly.other_position) for anomaly in Analyzer(rules()['filter']['FORWARD']).anomalies()
+             if anomaly.position == c_position]
+    assert found == [(c_kind, c_other)]
+
+
+def test_filters():
+    analyzer = Analyzer(rules()['filter']['FORWARD'])
+    assert [anomaly.position for anomaly in analyzer.shadowed()] == [1, 5, 10, 11]
+    assert [anomaly.position for anomaly in analyzer.redundant()] == [2, 6, 8]
+    assert [anomaly.position for anomaly in analyzer.correlated()] == [3, 7]
+
+
+def test_example():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+
+    assert [repr(anomaly) for anomaly in analyze(rule_set)] == [
+        '<Anomaly correlated FORWARD:10 by 8>',
+    ]
+
+    analyzer = Analyzer(rule_set['filter']['FORWARD'])
+    assert list(analyzer.correlated_with(analyzer.rules[10])) == [8, 9]
+
+    rule_set['filter']['FORWARD'].append(Rule.from_cli('-s 10.0.0.0/8 -i lan -j ACCEPT'))
+    assert [repr(anomaly) for anomaly in analyze(rule_set)][-1] == '<Anomaly shadowed FORWARD:12 by 11>'
+
+
+def random_rule(generator):
+    options = []
+
+    if generator.random() < 0.5:
+        options.append('-i {}'.format(generator.choice(['eth0', 'eth1', 'eth+', 'ppp0'])))
+    if generator.random() < 0.5:
+        options.append('{}-s 10.{}.0.0/{}'.format(generator.choice(['', '! ']), generator.randrange(3),
+                                                  generator.choice([8, 16])))
+    if generator.random() < 0.5:
+        options.append('-d 192.168.{}.{}/{}'.format(generator.randrange(3), generator.randrange(0, 256, 64),
+                                                    generator.choice([16, 24, 26, 32])))
+    if generator.random() < 0.7:
+        options.append('-p {}'.format(generator.choice(['tcp', 'udp'])))
+        if generator.random() < 0.7:
+            start = generator.randrange(1, 100)
+            options.append('-m multiport {}--dports {}:{},{}'.format(generator.choice(['', '! ']), start,
+                                                                    start + generator.randrange(50),
+                                                                    generator.randrange(1, 200)))
+
+    options.append('-j {}'.format(generator.choice(['ACCEPT', 'DROP', 'LOG'])))
+    return '-A FORWARD {}'.format(' '.join(options))
+
+
+def test_pairwise():
+    generator = random.Random(3)
+    rule_set = RuleSet()
+    rule_set.read('*filter\n:FORWARD ACCEPT [0:0]\n{}\nCOMMIT\n'.format(
+        '\n'.join(random_rule(generator) for _ in range(300))))
+
+    analyzer = Analyzer(rule_set['filter']['FORWARD'])
+    compiled = analyzer.rules
+    expected = []
+
+    for rule in compiled:
+        earlier = [other for other in compiled[:rule.position] if analyzer.is_final(other)]
+        coverers = [other.position for other in earlier if covers(other, rule)]
+
+        if coverers:
+            other = compiled[coverers[0]]
+            kind = 'redundant' if outcome(other.rule) == outcome(rule.rule) else 'shadowed'
+            expected.append((kind, rule.position, other.position))
+            continue
+
+        if analyzer.is_final(rule):
+            correlated = [other.position for other in earlier if outcome(other.rule) != outcome(rule.rule) and
+                          overlaps(other, rule) and not covers(rule, other)]
+            assert list(analyzer.correlated_with(rule)) == correlated
+
+            if correlated:
+                expected.append(('correlated', rule.position, correlated[0]))
+
+    found = [(anomaly.kind, anomaly.position, anomaly.other_position) for anomaly in analyzer.anomalies()]
+    assert found == expected
+    assert set(kind for kind, position, other in found) == {'shadowed', 'redundant', 'correlated'}
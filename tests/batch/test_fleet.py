@@ -0,0 +1,115 @@
+import os
+import shutil
+
+import pytest
+
+from firewall_translator.batch import BatchTranslator, find_hosts, main, read_manifest, translate
+from firewall_translator.iptables import RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    hosts = tmp_path / 'hosts'
+    hosts.mkdir()
+
+    for name in ('alpha', 'beta', 'gamma'):
+        shutil.copy(EXAMPLE, str(hosts / '{}.txt'.format(name)))
+
+    (hosts / 'broken.txt').write_text('*filter\n-A MISSING -j DROP\nCOMMIT\n')
+    (hosts / '.hidden').write_text('')
+
+    return hosts
+
+
+def test_find_hosts(fleet, tmp_path):
+    manifest = tmp_path / 'manifest'
+    manifest.write_text('# fleet\nhosts/alpha.txt\n\nedge-1 hosts/beta.txt\n')
+
+    assert [host for host, path in find_hosts([str(fleet)])] == ['alpha', 'beta', 'broken', 'gamma']
+    assert read_manifest(str(manifest)) == [('alpha', str(tmp_path / 'hosts/alpha.txt')),
+                                            ('edge-1', str(tmp_path / 'hosts/beta.txt'))]
+
+
+def test_translate(fleet, tmp_path):
+    result = translate('alpha', str(fleet / 'alpha.txt'), str(tmp_path), optimize=True, analyze=True)
+
+    expected = RuleSet()
+    expected.read_from_file(EXAMPLE)
+
+    assert result.error is None
+    assert result.rules == sum(len(chain) for table in expected for chain in table)
+    assert result.optimized < result.rules
+    assert result.anomalies is not None
+    assert os.path.exists(result.output)
+
+    failed = translate('broken', str(fleet / 'broken.txt'))
+    assert failed.error == "KeyError: 'MISSING'"
+    assert str(failed) == "broken FAILED KeyError: 'MISSING'"
+
+
+@pytest.mark.parametrize('c_workers', [1, 2])
+def test_batch(fleet, tmp_path, c_workers):
+    output = str(tmp_path / 'out')
+    report = BatchTranslator(c_workers, output, optimize=True).run(find_hosts([str(fleet)]))
+
+    assert [result.host for result in report.results] == ['alpha', 'beta', 'broken', 'gamma']
+    assert [result.host for result in report.failed] == ['broken']
+    assert sorted(os.listdir(output)) == ['alpha.rules', 'beta.rules', 'gamma.rules']
+    assert report.rules == 3 * report.results[0].rules
+    assert report.hosts_per_second > 0
+    assert repr(report) == '<BatchReport 4 hosts, 1 failed>'
+    assert str(report).splitlines()[-2].startswith('4 hosts, 1 failed, {} rules in '.format(report.rules))
+
+    with open(os.path.join(output, 'alpha.rules')) as r:
+        translated = r.read()
+
+    with open(os.path.join(output, 'gamma.rules')) as r:
+        assert r.read() == translated
+
+
+def test_duplicate_hosts(fleet, tmp_path, capsys):
+    other = tmp_path / 'other'
+    other.mkdir()
+    shutil.copy(EXAMPLE, str(other / 'alpha.rules'))
+    output = str(tmp_path / 'out')
+    hosts = find_hosts([str(fleet), str(other)])
+
+    with pytest.raises(ValueError, match='would both write alpha.rules'):
+        BatchTranslator(1, output).run(hosts)
+
+    assert not os.path.exists(output)
+    assert len(BatchTranslator(1).run(hosts).results) == 5
+
+    with pytest.raises(SystemExit):
+        main([str(fleet), str(other), '-o', output])
+
+    assert 'would both write alpha.rules' in capsys.readouterr().err
+
+
+def test_main(fleet, capsys):
+    assert main([str(fleet), '-j', '2']) == 1
+    assert 'broken FAILED' in capsys.readouterr().out
+
+    os.remove(str(fleet / 'broken.txt'))
+    assert main([str(fleet), '-j', '1', '--analyze']) == 0
+
+
+def test_cache(fleet, tmp_path):
+    directory = str(tmp_path / 'cache')
+    hosts = find_hosts([str(fleet)])
+
+    first = BatchTranslator(2, cache=directory).run(hosts)
+    second = BatchTranslator(2, cache=directory).run(hosts)
+
+    assert [str(result).rsplit(' ', 1)[0] for result in first.results] == \
+        [str(result).rsplit(' ', 1)[0] for result in second.results]
+    assert len([name for name in os.listdir(directory) if not name.startswith('.')]) == 1
+
+
+def test_positional_arguments():
+    translator = BatchTranslator(4, 'out', False, False, 8)
+
+    assert translator.chunk_size == 8
+    assert translator.cache is None
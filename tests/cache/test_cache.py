@@ -0,0 +1,108 @@
+import concurrent.futures
+import multiprocessing
+import os
+
+import pytest
+
+from firewall_translator import cache
+from firewall_translator.cache import ParseCache, content_key
+from firewall_translator.iptables import RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+
+def dump(index):
+    return '*filter\n:INPUT ACCEPT [0:0]\n-A INPUT -s 10.0.0.{}/32 -j DROP\nCOMMIT\n'.format(index)
+
+
+def cached_text(directory, index):
+    parse_cache = ParseCache(directory, max_entries=4)
+    return [str(parse_cache.read(dump(index % 6))) for _ in range(3)]
+
+
+def test_hit(tmp_path):
+    parse_cache = ParseCache(str(tmp_path))
+    expected = RuleSet()
+    expected.read_from_file(EXAMPLE)
+
+    first = parse_cache.read_from_file(EXAMPLE)
+    second = parse_cache.read_from_file(EXAMPLE)
+
+    assert str(first) == str(second) == str(expected)
+    assert first is not second
+    assert (parse_cache.hits, parse_cache.misses) == (1, 1)
+    assert len(parse_cache.entries()) == 1
+    assert repr(parse_cache).endswith('1 hits, 1 misses>')
+
+
+def test_key(monkeypatch):
+    key = content_key(b'data')
+
+    assert key != content_key(b'other')
+
+    monkeypatch.setattr(cache, '__version__', '0.0.0')
+    assert content_key(b'data') != key
+
+    monkeypatch.undo()
+    monkeypatch.setattr(cache, 'CACHE_FORMAT', cache.CACHE_FORMAT + 1)
+    assert content_key(b'data') != key
+
+
+@pytest.mark.parametrize('c_content', [b'', b'garbage', b'\x80\x05\x95'])
+def test_corrupt(tmp_path, c_content):
+    parse_cache = ParseCache(str(tmp_path))
+    parse_cache.read(dump(1))
+
+    entry, = parse_cache.entries()
+    with open(entry.path, 'wb') as w:
+        w.write(c_content)
+
+    assert str(parse_cache.read(dump(1))) == str(ParseCache(str(tmp_path / 'fresh')).read(dump(1)))
+    assert parse_cache.misses == 2
+
+
+def test_evict_entries(tmp_path):
+    parse_cache = ParseCache(str(tmp_path), max_entries=3)
+
+    for index in range(3):
+        parse_cache.read(dump(index))
+
+    for age, entry in enumerate(parse_cache.entries()):
+        os.utime(entry.path, (1000 + age, 1000 + age))
+
+    parse_cache.read(dump(0))
+    parse_cache.read(dump(3))
+
+    keys = {os.path.basename(entry.path) for entry in parse_cache.entries()}
+    assert keys == {content_key(dump(index).encode()) + cache.SUFFIX for index in (0, 2, 3)}
+
+
+def test_evict_size(tmp_path):
+    parse_cache = ParseCache(str(tmp_path))
+    parse_cache.read(dump(0))
+    size = parse_cache.entries()[0].size
+
+    parse_cache.max_size = 2 * size + size // 2
+
+    for index in range(1, 5):
+        parse_cache.read(dump(index))
+
+    assert len(parse_cache.entries()) == 2
+    assert sum(entry.size for entry in parse_cache.entries()) <= parse_cache.max_size
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
+
+
+def test_concurrent(tmp_path):
+    directory = str(tmp_path)
+    context = multiprocessing.get_context('fork')
+
+    with concurrent.futures.ProcessPoolExecutor(4, context) as pool:
+        results = list(pool.map(cached_text, [directory] * 48, range(48)))
+
+    for index, texts in enumerate(results):
+        expected = RuleSet()
+        expected.read(dump(index % 6))
+        assert texts == [str(expected)] * 3
+
+    assert len(ParseCache(directory).entries()) <= 4
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
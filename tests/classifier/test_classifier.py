@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from firewall_translator.classifier import Classifier
+from firewall_translator.iptables import RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+RULES = '''*filter
+:INPUT DROP [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [0:0]
+:SERVICES - [0:0]
+:ADMIN - [0:0]
+-A INPUT -i lo -j ACCEPT
+-A INPUT -p tcp -m multiport --dports 80,443,8000:8999 -j SERVICES
+-A INPUT -s 10.0.0.0/8 -j ADMIN
+-A INPUT -m state --state ESTABLISHED -j ACCEPT
+-A INPUT -p udp ! --dport 53 -j REJECT --reject-with icmp-port-unreachable
+-A INPUT -i eth+ -p icmp -j ACCEPT
+-A SERVICES ! -s 192.168.0.0/16 -j RETURN
+-A SERVICES -j LOG
+-A SERVICES -p tcp -m tcp --dport 443 -j ACCEPT
+-A SERVICES -p tcp -m tcp --dport 8000:8100 -j ACCEPT
+-A ADMIN -p tcp -m tcp --dport 22 -g SERVICES
+-A ADMIN -p tcp -m tcp --dport 23 -j DROP
+COMMIT
+'''
+
+
+def example():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+    return rule_set
+
+
+def rules():
+    rule_set = RuleSet()
+    rule_set.read(RULES)
+    return rule_set
+
+
+@pytest.mark.parametrize('indexed', [True, False])
+@pytest.mark.parametrize('c_packet, c_action, c_chain, c_position',
+                         [
+                             (('internet', 'lan', '1.2.3.4', '192.168.0.123', 'tcp', 1234, 443), 'ACCEPT', 'FORWARD', 1),
+                             (('internet', 'lan', '1.2.3.4', '192.168.0.123', 'tcp', 1234, 22), 'DROP', 'FORWARD', 11),
+                             (('lan', 'internet', '192.168.0.5', '8.8.8.8', 'udp', 1234, 53), 'REJECT', 'FORWARD', 9),
+                             (('lan', 'internet', '192.168.0.1', '8.8.8.8', 'udp', 1234, 53), 'ACCEPT', 'FORWARD', 7),
+                             (('wan', 'lan', '192.168.1.7', '192.168.0.7', 6, 1234, 3306), 'ACCEPT', 'FORWARD', 5),
+                         ])
+def test_example(indexed, c_packet, c_action, c_chain, c_position):
+    verdict = Classifier(example(), indexed=indexed).classify('FORWARD', *c_packet)
+    assert verdict.action == c_action
+    assert verdict.chain == c_chain
+    assert verdict.position == c_position
+
+
+@pytest.mark.parametrize('indexed', [True, False])
+@pytest.mark.parametrize('c_packet, c_action, c_chain, c_position',
+                         [
+                             (('lo', None, '127.0.0.1', '127.0.0.1', 'tcp', 1234, 80), 'ACCEPT', 'INPUT', 0),
+                             (('eth0', None, '192.168.1.1', '192.168.0.1', 'tcp', 1234, 443), 'ACCEPT', 'SERVICES', 2),
+                             (('eth0', None, '192.168.1.1', '192.168.0.1', 'tcp', 1234, 8050), 'ACCEPT', 'SERVICES', 3),
+                             (('eth0', None, '192.168.1.1', '192.168.0.1', 'tcp', 1234, 8200), 'DROP', 'INPUT', None),
+                             (('eth0', None, '172.16.0.1', '192.168.0.1', 'tcp', 1234, 443), 'DROP', 'INPUT', None),
+                             (('eth0', None, '10.0.0.1', '192.168.0.1', 'tcp', 1234, 22), 'DROP', 'INPUT', None),
+                             (('eth0', None, '10.0.0.1', '192.168.0.1', 'tcp', 1234, 23), 'DROP', 'ADMIN', 1),
+                             (('eth0', None, '10.0.0.1', '192.168.0.1', 'udp', 1234, 123), 'REJECT', 'INPUT', 4),
+                             (('eth0', None, '172.16.0.1', '192.168.0.1', 'udp', 1234, 53), 'DROP', 'INPUT', None),
+                             (('eth1', None, '172.16.0.1', '192.168.0.1', 'icmp', None, None), 'ACCEPT', 'INPUT', 5),
+                             (('ppp0', None, '172.16.0.1', '192.168.0.1', 'icmp', None, None), 'DROP', 'INPUT', None),
+                         ])
+def test_jumps(indexed, c_packet, c_action, c_chain, c_position):
+    verdict = Classifier(rules(), indexed=indexed).classify('INPUT', *c_packet)
+    assert verdict.action == c_action
+    assert verdict.chain == c_chain
+    assert verdict.position == c_position
+
+
+def test_assume_match():
+    classifier = Classifier(rules(), assume_match=True)
+    verdict = classifier.classify('INPUT', 'eth0', None, '172.16.0.1', '192.168.0.1', 'udp', 1234, 53)
+    assert verdict.action == 'ACCEPT'
+    assert verdict.position == 3
+    assert str(verdict.rule) == '-m state --state ESTABLISHED -j ACCEPT'
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from firewall_translator.columnar import ColumnarRuleSet, SymbolIds  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+RULES = '''*filter
+:INPUT DROP [120:9000]
+:FORWARD DROP [0:0]
+:LOGDROP - [0:0]
+[10:600] -A INPUT -i lo -j ACCEPT
+[5:400] -A INPUT -i lan -p tcp -m tcp --dport 22 -j ACCEPT
+-A INPUT ! -i lan -m set --match-set blocked src -j DROP
+-A INPUT -m recent --update --seconds 60 -g LOGDROP
+-A FORWARD -i lan -o lan -j ACCEPT
+[1:100] -A FORWARD -i lan -o internet -j ACCEPT
+-A LOGDROP -j LOG --log-prefix "dropped: "
+-A LOGDROP -j DROP
+COMMIT
+*nat
+:POSTROUTING ACCEPT [0:0]
+-A POSTROUTING -o internet -j MASQUERADE
+COMMIT
+'''
+
+
+def parse(text):
+    rule_set = RuleSet()
+    rule_set.read(text)
+    return rule_set
+
+
+def state(rule_set):
+    return [(table.name, [(chain.name, chain.action, chain.packets, chain.bytes,
+                           [rule.__reduce__() for rule in chain]) for chain in table])
+            for table in rule_set]
+
+
+def test_symbol_ids():
+    symbols = SymbolIds()
+
+    assert symbols.add('-i') == symbols.add('-i') == 1
+    assert symbols.add(('blocked', 'src')) == 2
+    assert symbols.add_pair(('-i', 'lan')) == (1, 3)
+    assert symbols[3] == 'lan'
+    assert symbols.id(None) == 0
+    assert symbols.id('missing') == -1
+    assert 'lan' in symbols
+    assert len(symbols) == 4
+
+
+@pytest.mark.parametrize('c_rule_set',
+                         [
+                             parse(RULES),
+                             parse(open(EXAMPLE).read()),
+                             RuleSet(),
+                             RuleSet({}),
+                         ])
+def test_round_trip(c_rule_set):
+    columns = ColumnarRuleSet(c_rule_set)
+    rules = [rule for table in c_rule_set for chain in table for rule in chain]
+
+    assert len(columns) == len(rules)
+    assert state(columns.to_rule_set()) == state(c_rule_set)
+    assert [columns.rule(row).__reduce__() for row in range(len(columns))] == [rule.__reduce__() for rule in rules]
+
+
+def test_counts():
+    columns = ColumnarRuleSet(parse(RULES))
+
+    assert columns.count_by_action() == {'ACCEPT': 4, 'DROP': 2, 'LOGDROP': 1, 'LOG': 1, 'MASQUERADE': 1}
+    assert columns.count_by_interface() == {'lo': 1, 'lan': 4, 'internet': 2}
+    assert columns.count_by_option('-o') == {'lan': 1, 'internet': 2}
+    assert columns.count_by_option('--match-set') == {('blocked', 'src'): 1}
+    assert columns.count_by_option('--missing') == {}
+    assert {chain: count for chain, count in columns.count_by_chain().items() if count} == {
+        ('filter', 'INPUT'): 4, ('filter', 'FORWARD'): 2, ('filter', 'LOGDROP'): 2, ('nat', 'POSTROUTING'): 1}
+    assert columns.count_by_chain()[('mangle', 'PREROUTING')] == 0
+    assert columns.counters_by_action() == {'ACCEPT': (16, 1100), 'DROP': (0, 0), 'LOGDROP': (0, 0),
+                                            'LOG': (0, 0), 'MASQUERADE': (0, 0)}
+
+
+def test_queries():
+    columns = ColumnarRuleSet(parse(RULES))
+
+    assert columns.matching('-i').tolist() == [0, 1, 2, 3]
+    assert columns.matching('-i', 'lan').tolist() == [0, 1, 3]
+    assert columns.matching(('-i', '! -i'), 'lan').tolist() == [0, 1, 3, 4]
+    assert columns.matching('-i', 'missing').tolist() == []
+    assert columns.chain_rows('filter', 'FORWARD').tolist() == [0, 1]
+    assert columns.chain_rows('nat', 'FORWARD').tolist() == []
+    assert columns.count_by_action(columns.chain_rows('filter', 'INPUT')) == {'ACCEPT': 2, 'DROP': 1, 'LOGDROP': 1}
+
+    groups = columns.group_by_action()
+    assert {action: rows.tolist() for action, rows in groups.items()} == {
+        'ACCEPT': [0, 1, 2, 3], 'DROP': [4, 7], 'LOGDROP': [5], 'LOG': [6], 'MASQUERADE': [8]}
+
+    groups = columns.group_by_action(columns.matching('-i', 'lan'))
+    assert {action: rows.tolist() for action, rows in groups.items()} == {'ACCEPT': [0, 1, 3]}
+
+
+def test_empty():
+    columns = ColumnarRuleSet()
+
+    assert len(columns) == 0
+    assert columns.nbytes == 0
+    assert columns.count_by_action() == {}
+    assert columns.count_by_interface() == {}
+    assert columns.group_by_action() == {}
+    assert columns.counters_by_action() == {}
+    assert len(columns.to_rule_set()) == 0
@@ -0,0 +1,184 @@
+import os
+import random
+
+import pytest
+
+from firewall_translator.diff import ChainDiff, diff, opcodes
+from firewall_translator.iptables import Chain, Rule, RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+
+def rule_set(*chains):
+    lines = ['*filter', ':INPUT ACCEPT [0:0]', ':FORWARD DROP [0:0]', ':OUTPUT ACCEPT [0:0]']
+
+    for name, rules in chains:
+        if name not in ('INPUT', 'FORWARD', 'OUTPUT'):
+            lines.append(':{} - [0:0]'.format(name))
+
+    for name, rules in chains:
+        lines.extend('-A {} {}'.format(name, rule) for rule in rules)
+
+    lines.append('COMMIT')
+
+    result = RuleSet()
+    result.read_lines(lines)
+    return result
+
+
+def chain(rules):
+    return Chain('FORWARD', [Rule.from_cli(rule) for rule in rules])
+
+
+def lcs(a, b):
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+
+    for i in range(len(a) - 1, -1, -1):
+        for j in range(len(b) - 1, -1, -1):
+            if a[i] == b[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+
+    return lengths[0][0]
+
+
+def rebuild(a, b, codes):
+    rebuilt = []
+
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == 'equal':
+            assert a[i1:i2] == b[j1:j2]
+            rebuilt.extend(a[i1:i2])
+        elif tag == 'insert':
+            rebuilt.extend(b[j1:j2])
+
+    return rebuilt
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_opcodes_minimal(seed):
+    generator = random.Random(seed)
+    a = [generator.randrange(6) for _ in range(generator.randrange(12))]
+    b = [generator.randrange(6) for _ in range(generator.randrange(12))]
+    codes = opcodes(a, b)
+
+    assert rebuild(a, b, codes) == b
+    assert sum(i2 - i1 for tag, i1, i2, j1, j2 in codes if tag == 'equal') == lcs(a, b)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_opcodes_fallback(seed):
+    generator = random.Random(seed)
+    a = list(range(200))
+    b = list(a)
+
+    for _ in range(30):
+        b.insert(generator.randrange(len(b)), generator.randrange(200, 400))
+        del b[generator.randrange(len(b))]
+
+    assert rebuild(a, b, opcodes(a, b, max_edits=4)) == b
+
+
+@pytest.mark.parametrize('c_old, c_new, c_edits',
+                         [
+                             (['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP'],
+                              ['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP'],
+                              ['-A FORWARD -s 10.0.0.3/32 -j DROP']),
+                             (['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP'],
+                              ['-s 10.0.0.3/32 -j DROP', '-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP'],
+                              ['-I FORWARD 1 -s 10.0.0.3/32 -j DROP']),
+                             (['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP'],
+                              ['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.3/32 -j DROP'],
+                              ['-D FORWARD 2']),
+                             (['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP'],
+                              ['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j ACCEPT', '-s 10.0.0.3/32 -j DROP'],
+                              ['-R FORWARD 2 -s 10.0.0.2/32 -j ACCEPT']),
+                             (['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP'],
+                              ['-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP', '-s 10.0.0.1/32 -j DROP'],
+                              ['-D FORWARD 1', '-A FORWARD -s 10.0.0.1/32 -j DROP']),
+                             (['-s 10.0.0.1/32 -j DROP'], ['-s 10.0.0.1/32 -j DROP'], []),
+                         ])
+def test_chain_edits(c_old, c_new, c_edits):
+    chain_diff = ChainDiff('filter', chain(c_old), chain(c_new))
+    assert [str(edit) for edit in chain_diff.edits] == c_edits
+
+
+def test_chain_changes():
+    chain_diff = ChainDiff('filter', chain(['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP',
+                                            '-s 10.0.0.3/32 -j DROP', '-s 10.0.0.4/32 -j DROP']),
+                           chain(['-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP', '-s 10.0.0.1/32 -j DROP',
+                                  '-s 10.0.0.5/32 -j DROP']))
+
+    assert [str(rule) for rule in chain_diff.moved] == ['-s 10.0.0.1/32 -j DROP']
+    assert [str(rule) for rule in chain_diff.added] == ['-s 10.0.0.5/32 -j DROP']
+    assert [str(rule) for rule in chain_diff.removed] == ['-s 10.0.0.4/32 -j DROP']
+    assert repr(chain_diff) == '<ChainDiff filter/FORWARD +1 -1 ~1>'
+
+
+def test_chains_and_policies():
+    old = rule_set(('FORWARD', ['-j OLD']), ('OLD', ['-j DROP']))
+    new = rule_set(('FORWARD', ['-j NEW']), ('NEW', ['-j ACCEPT']))
+    new['filter']['INPUT'].action = 'DROP'
+
+    rule_set_diff = diff(old, new)
+    assert rule_set_diff.commands() == [
+        'iptables -t filter -N NEW',
+        'iptables -t filter -P INPUT DROP',
+        'iptables -t filter -R FORWARD 1 -j NEW',
+        'iptables -t filter -A NEW -j ACCEPT',
+        'iptables -t filter -F OLD',
+        'iptables -t filter -X OLD',
+    ]
+    assert rule_set_diff.restore_script() == '\n'.join([
+        '*filter',
+        ':NEW - [0:0]',
+        ':INPUT DROP [0:0]',
+        '-R FORWARD 1 -j NEW',
+        '-A NEW -j ACCEPT',
+        '-F OLD',
+        '-X OLD',
+        'COMMIT',
+        '',
+    ])
+
+    rule_set_diff.apply(old)
+    assert str(old) == str(new)
+
+
+def test_no_changes():
+    old = RuleSet()
+    old.read_from_file(EXAMPLE)
+    new = RuleSet()
+    new.read_from_file(EXAMPLE)
+
+    rule_set_diff = diff(old, new)
+    assert len(rule_set_diff) == 0
+    assert rule_set_diff.restore_script() == ''
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_apply(seed):
+    generator = random.Random(seed)
+    rules = ['-s 10.0.{}.{}/32 -j {}'.format(generator.randrange(4), generator.randrange(8),
+                                             generator.choice(['ACCEPT', 'DROP'])) for _ in range(300)]
+    edited = list(rules)
+
+    for _ in range(generator.randrange(1, 40)):
+        operation = generator.randrange(3)
+        position = generator.randrange(len(edited))
+
+        if operation == 0:
+            edited.insert(position, '-d 192.168.0.{}/32 -j ACCEPT'.format(generator.randrange(256)))
+        elif operation == 1:
+            del edited[position]
+        else:
+            edited.insert(generator.randrange(len(edited)), edited.pop(position))
+
+    old = rule_set(('FORWARD', rules))
+    new = rule_set(('FORWARD', edited))
+
+    for max_edits in (1000, 3):
+        target = rule_set(('FORWARD', rules))
+        diff(old, new, max_edits).apply(target)
+        assert str(target) == str(new)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from firewall_translator.generic import Action
@@ -26,3 +28,24 @@ def test_action_allow(a_allow, a_reply, a_log, a_repr, a_str):
         assert a.log is a_log
         assert repr(a) == a_repr
         assert str(a) == a_str
+
+
+def test_action_intern():
+    a = Action.intern(True)
+    assert Action.intern(True, False, False) is a
+    assert Action.intern(False) is not a
+    assert Action(True) == a
+    assert Action(False) != a
+    assert len({a, Action(True), Action(False)}) == 2
+
+
+def test_action_immutable():
+    shared = Action.intern(True)
+
+    with pytest.raises(AttributeError):
+        shared.allow = None
+
+    with pytest.raises(AttributeError):
+        del shared.allow
+
+    assert pickle.loads(pickle.dumps(shared)) == shared
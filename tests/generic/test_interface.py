@@ -1,5 +1,9 @@
+import gc
+import pickle
+
 import pytest
 
+from firewall_translator import generic
 from firewall_translator.generic import Interface
 
 
@@ -12,3 +16,35 @@ def test_interface(i_name, i_repr, i_str):
     assert i.name == i_name
     assert repr(i) == i_repr
     assert str(i) == i_str
+
+
+def test_interface_intern():
+    i = Interface.intern('lan')
+    assert Interface.intern('lan') is i
+    assert Interface.intern('wan') is not i
+    assert Interface('lan') == i
+    assert Interface('wan') != i
+    assert {i: 1}[Interface('lan')] == 1
+
+
+def test_interface_immutable():
+    shared = Interface.intern('lan')
+
+    with pytest.raises(AttributeError):
+        shared.name = None
+
+    with pytest.raises(AttributeError):
+        del shared.name
+
+    assert pickle.loads(pickle.dumps(shared)) == shared
+
+
+def test_interface_intern_released():
+    shared = Interface.intern('veth-released')
+    key = (Interface, 'veth-released')
+
+    assert generic.INTERNED[key] is shared
+
+    del shared
+    gc.collect()
+    assert key not in generic.INTERNED
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from firewall_translator.generic import Protocol
@@ -15,3 +17,24 @@ def test_protocol(p_num, p_name, p_repr, p_str):
     assert p.number == p_num
     assert repr(p) == p_repr
     assert str(p) == p_str
+
+
+def test_protocol_intern():
+    p = Protocol.intern(6, 'tcp')
+    assert Protocol.intern(6, 'tcp') is p
+    assert Protocol.intern(6) is not p
+    assert Protocol(6, 'tcp') == p
+    assert Protocol(6) != p
+    assert len({p, Protocol(6, 'tcp'), Protocol(17, 'udp')}) == 2
+
+
+def test_protocol_immutable():
+    shared = Protocol.intern(6, 'tcp')
+
+    with pytest.raises(AttributeError):
+        shared.number = None
+
+    with pytest.raises(AttributeError):
+        del shared.number
+
+    assert pickle.loads(pickle.dumps(shared)) == shared
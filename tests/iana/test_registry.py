@@ -0,0 +1,69 @@
+import pytest
+
+from firewall_translator.iana import (PROTOCOLS, PROTOCOLS_BY_NUMBER, SERVICES, SERVICES_BY_NUMBER, SNAPSHOT_FILE,
+                                      load_module, load_snapshot, preload)
+
+
+@pytest.mark.parametrize('p_name, p_num',
+                         [
+                             ('icmp', 1),
+                             ('tcp', 6),
+                             ('udp', 17),
+                         ])
+def test_protocols(p_name, p_num):
+    p = PROTOCOLS[p_name]
+    assert p.name == p_name
+    assert p.number == p_num
+    assert PROTOCOLS[p_name] is p
+
+
+@pytest.mark.parametrize('s_protocol, s_name, s_num',
+                         [
+                             ('tcp', 'http', 80),
+                             ('tcp', 'https', 443),
+                             ('udp', 'domain', 53),
+                         ])
+def test_services(s_protocol, s_name, s_num):
+    s = SERVICES[s_protocol][s_name]
+    assert s.name == s_name
+    assert s.number == s_num
+    assert s.protocol is PROTOCOLS[s_protocol]
+    assert SERVICES[s_protocol][s_name] is s
+
+
+def test_missing():
+    assert 'nonexistent' not in PROTOCOLS
+    assert SERVICES['tcp'].get('nonexistent') is None
+
+    with pytest.raises(KeyError):
+        PROTOCOLS['nonexistent']
+
+
+def test_snapshot_matches_module():
+    snapshot_protocols, snapshot_services = load_snapshot(SNAPSHOT_FILE)
+    module_protocols, module_services = load_module()
+
+    assert dict(snapshot_protocols) == dict(module_protocols)
+    assert list(snapshot_services) == list(module_services)
+
+    for protocol, table in snapshot_services.items():
+        assert dict(table) == dict(module_services[protocol])
+
+
+def test_snapshot_invalid(tmp_path):
+    file_path = tmp_path / 'iana.dat'
+    file_path.write_bytes(b'IANA\xff\xff' + bytes(10))
+
+    with pytest.raises(ValueError):
+        load_snapshot(str(file_path))
+
+
+def test_preload():
+    preload()
+
+    assert len(PROTOCOLS.objects) == len(PROTOCOLS)
+    assert len(PROTOCOLS_BY_NUMBER.objects) == len(PROTOCOLS_BY_NUMBER)
+
+    for protocol in SERVICES:
+        assert len(SERVICES[protocol].objects) == len(SERVICES[protocol])
+        assert len(SERVICES_BY_NUMBER[protocol].objects) == len(SERVICES_BY_NUMBER[protocol])
@@ -0,0 +1,52 @@
+import pytest
+
+from firewall_translator.generic import Protocol
+from firewall_translator.iana import PROTOCOLS, PROTOCOLS_BY_NUMBER, SERVICES, SERVICES_BY_NUMBER, get_protocol, \
+    get_services, load_module
+
+
+@pytest.mark.parametrize('p_num, p_name',
+                         [
+                             (1, 'icmp'),
+                             (6, 'tcp'),
+                             (17, 'udp'),
+                             (84, 'iptm'),
+                         ])
+def test_protocols_by_number(p_num, p_name):
+    assert PROTOCOLS_BY_NUMBER[p_num] is PROTOCOLS[p_name]
+
+
+@pytest.mark.parametrize('s_protocol, s_num, s_names',
+                         [
+                             ('tcp', 22, ['ssh']),
+                             ('tcp', 443, ['https']),
+                             ('udp', 53, ['domain']),
+                             ('tcp', 80, ['http', 'www', 'www-http']),
+                         ])
+def test_services_by_number(s_protocol, s_num, s_names):
+    services = SERVICES_BY_NUMBER[s_protocol][s_num]
+    assert [s.name for s in services] == s_names
+    assert all(s is SERVICES[s_protocol][s.name] for s in services)
+
+
+@pytest.mark.parametrize('p_protocol, p_name',
+                         [
+                             ('6', 'tcp'),
+                             (6, 'tcp'),
+                             ('TCP', 'tcp'),
+                             (Protocol(17), 'udp'),
+                             (Protocol(1, 'icmp'), 'icmp'),
+                         ])
+def test_get_protocol(p_protocol, p_name):
+    assert get_protocol(p_protocol) is PROTOCOLS[p_name]
+
+
+def test_get_services():
+    assert get_services('6', '443') == [SERVICES['tcp']['https']]
+    assert get_services('tcp', 0) == []
+    assert get_services('icmp', 8) == []
+
+
+def test_reverse_index_matches_module():
+    for protocol, table in load_module()[1].items():
+        assert sorted(SERVICES_BY_NUMBER[protocol]) == sorted(table.reverse_index())
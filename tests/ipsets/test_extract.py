@@ -0,0 +1,86 @@
+import pytest
+
+from firewall_translator.ipsets import SetExtractor, extract_sets, restore_script
+from firewall_translator.iptables import RuleSet
+
+
+def rule_set(lines, table='filter'):
+    rules = RuleSet()
+    rules.read('*{}\n:INPUT ACCEPT [7:420]\n:FORWARD ACCEPT [0:0]\n{}\nCOMMIT\n'.format(table, '\n'.join(lines)))
+    return rules
+
+
+def blocklist(count, template='-A INPUT -s 10.0.{}.{}/32 -j DROP'):
+    return [template.format(index >> 8, index & 255) for index in range(count)]
+
+
+def test_extract():
+    rules = rule_set(['-A INPUT -i lo -j ACCEPT'] + blocklist(20) + ['-A INPUT -p tcp -m tcp --dport 22 -j ACCEPT'])
+    extractions = {extraction.chain.name: extraction for extraction in extract_sets(rules, minimum=16)}
+    extraction = extractions['INPUT']
+
+    assert [str(rule) for rule in rules['filter']['INPUT']] == [
+        '-i lo -j ACCEPT',
+        '-m set --match-set INPUT_src_1 src -j DROP',
+        '-p tcp -m tcp --dport 22 -j ACCEPT',
+    ]
+    assert repr(extraction) == '<Extraction INPUT 22 -> 3 rules, 1 sets>'
+    assert extraction.before.worst == 22
+    assert extraction.after.worst == 3
+    assert extraction.after.average < extraction.before.average
+    assert not extractions['FORWARD'].sets
+    assert rules['filter']['INPUT'].header() == ':INPUT ACCEPT [7:420]'
+
+    ipset, = extraction.sets
+    assert repr(ipset) == '<IPSet INPUT_src_1 hash:ip 20 members>'
+
+    script = restore_script(extractions.values()).splitlines()
+    assert script[0] == 'create INPUT_src_1 hash:ip family inet hashsize 1024 maxelem 65536 -exist'
+    assert script[1] == 'flush INPUT_src_1'
+    assert script[2:4] == ['add INPUT_src_1 10.0.0.0', 'add INPUT_src_1 10.0.0.1']
+    assert len(script) == 22
+
+
+@pytest.mark.parametrize('c_lines, c_rules',
+                         [
+                             (blocklist(10), 10),
+                             (blocklist(20) + blocklist(20, '-A INPUT -d 10.1.{}.{}/32 -j DROP'), 2),
+                             (blocklist(20, '-A INPUT -s 10.0.{}.{}/32 -j LOG'), 20),
+                             (blocklist(20, '-A INPUT -s 10.0.{}.{}/32 -m limit --limit 1/sec -j DROP'), 20),
+                             (blocklist(8) + ['-A INPUT -s 10.9.9.9/32 -j ACCEPT'] + blocklist(8), 17),
+                             (blocklist(20, '-A INPUT -s 10.0.{}.{}/32 -i eth0 -p tcp -j REJECT'), 1),
+                             (blocklist(8) + ['-A INPUT -s blocked.example.com -j DROP'] + blocklist(16), 10),
+                         ])
+def test_groups(c_lines, c_rules):
+    rules = rule_set(c_lines)
+    extract_sets(rules)
+    assert len(rules['filter']['INPUT']) == c_rules
+
+
+def test_networks():
+    rules = rule_set(['-A FORWARD -s 10.0.{}.0/25 -o wan -j DROP'.format(index) for index in range(32)] +
+                     ['-A FORWARD -s 10.0.{}.128/25 -o wan -j DROP'.format(index) for index in range(32)])
+    extraction, = [extraction for extraction in extract_sets(rules) if extraction.sets]
+    ipset, = extraction.sets
+
+    assert str(rules['filter']['FORWARD'][0]) == '-m set --match-set FORWARD_src_1 src -o wan -j DROP'
+    assert ipset.type == 'hash:net'
+    assert str(ipset).splitlines()[1:] == ['flush FORWARD_src_1', 'add FORWARD_src_1 10.0.0.0/19']
+
+
+def test_ipv6():
+    rules = rule_set(['-A INPUT -s 2001:db8::{:x}/128 -j DROP'.format(index) for index in range(16)])
+    extraction = SetExtractor(prefix='v6_blocklist').extract(rules['filter']['INPUT'])
+
+    assert str(extraction.sets[0]).splitlines()[0] == \
+        'create v6_blocklist_src_1 hash:ip family inet6 hashsize 1024 maxelem 65536 -exist'
+    assert str(extraction.sets[0]).splitlines()[2] == 'add v6_blocklist_src_1 2001:db8::'
+
+
+def test_names():
+    extractor = SetExtractor(prefix='a_very_long_prefix_for_a_set_name')
+    names = [extractor.set_name(None, '-s') for _ in range(12)]
+
+    assert len(set(names)) == 12
+    assert max(len(name) for name in names) == 31
+    assert names[-1].endswith('_12')
@@ -0,0 +1,60 @@
+from firewall_translator.iptables import AddressIndex, RuleSet
+
+RULES = '''*filter
+:FORWARD DROP [0:0]
+-A FORWARD -d 192.168.0.123/32 -p tcp -m tcp --dport 80 -j ACCEPT
+-A FORWARD -s 192.168.0.0/24 -d 192.168.1.0/24 -j ACCEPT
+-A FORWARD ! -s 10.0.0.0/8 -d 192.168.0.0/16 -j DROP
+-A FORWARD -s 10.0.0.0/8 -j ACCEPT
+-A FORWARD -j LOG
+COMMIT
+'''
+
+
+def positions(entries):
+    return [position for table, chain, position, rule in entries]
+
+
+def rule_set():
+    rules = RuleSet()
+    rules.read(RULES)
+    return rules
+
+
+def test_source_index():
+    index = AddressIndex(rule_set(), '-s')
+
+    assert positions(index.matching('192.168.0.10')) == [0, 1, 2, 4]
+    assert positions(index.matching('10.1.1.1')) == [0, 3, 4]
+    assert positions(index.covering('192.168.0.0/25')) == [1]
+    assert positions(index.covered_by('0.0.0.0/0')) == [1, 3]
+    assert positions(index.longest_match('10.9.9.9')) == [3]
+
+
+def test_destination_index():
+    index = AddressIndex(rule_set(), '-d')
+
+    assert positions(index.matching('192.168.0.123')) == [0, 2, 3, 4]
+    assert positions(index.overlapping('192.168.0.0/24')) == [0, 2]
+    assert positions(index.longest_match('192.168.1.1')) == [1]
+
+
+def test_address_lists():
+    rules = RuleSet()
+    rules.read('*filter\n:FORWARD DROP [0:0]\n'
+               '-A FORWARD -s 10.0.0.1,10.0.0.2 -j ACCEPT\n'
+               '-A FORWARD ! -s 172.16.0.0/12,192.168.0.0/16 -j DROP\n'
+               '-A FORWARD -s example.com -j DROP\n'
+               '-A FORWARD -s 192.168.1.1 -j ACCEPT\n'
+               'COMMIT\n')
+    index = AddressIndex(rules, '-s')
+
+    assert index.unparsed == [2]
+    assert positions(index.matching('192.168.1.1')) == [2, 3]
+    assert positions(index.matching('10.0.0.2')) == [0, 1, 2]
+    assert positions(index.matching('172.16.5.5')) == [2]
+    assert positions(index.covered_by('10.0.0.0/8')) == [0, 2]
+    assert positions(index.covering('10.0.0.1/32')) == [0, 2]
+    assert positions(index.longest_match('10.0.0.1')) == [0, 2]
+    assert positions(index.longest_match('8.8.8.8')) == [2]
+    assert positions(index.overlapping('192.168.0.0/16')) == [2, 3]
@@ -0,0 +1,133 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from firewall_translator.iptables import Rule, RuleSet
+
+
+def rule_set(rules, chain='FORWARD'):
+    result = RuleSet()
+    result.read('*filter\n:FORWARD DROP [0:0]\n:LOGDROP - [0:0]\n{}\nCOMMIT\n'.format(
+        '\n'.join('-A {} {}'.format(chain, rule) for rule in rules)))
+    return result
+
+
+@pytest.mark.parametrize('c_first, c_second, c_equal',
+                         [
+                             ('-s 10.0.0.1/32 -j DROP', '-s 10.0.0.1/32 -j DROP', True),
+                             ('-s 10.0.0.1/32 -p tcp -j DROP', '-p tcp -s 10.0.0.1/32 -j DROP', True),
+                             ('-p tcp -m tcp --dport 22 --sport 1024 -j ACCEPT',
+                              '-p tcp -m tcp --sport 1024 --dport 22 -j ACCEPT', True),
+                             ('-p tcp -m tcp --dport 22 -s 10.0.0.1/32 -j ACCEPT',
+                              '-s 10.0.0.1/32 -p tcp -m tcp --dport 22 -j ACCEPT', True),
+                             ('-j REJECT --reject-with tcp-reset', '-j REJECT --reject-with tcp-reset', True),
+                             ('-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', False),
+                             ('-s 10.0.0.1/32 -j DROP', '! -s 10.0.0.1/32 -j DROP', False),
+                             ('-s 10.0.0.1/32 -j DROP', '-s 10.0.0.1/32 -j ACCEPT', False),
+                             ('-j LOGDROP', '-g LOGDROP', False),
+                             ('-m state --state NEW -m limit --limit 5/sec -j ACCEPT',
+                              '-m limit --limit 5/sec -m state --state NEW -j ACCEPT', False),
+                             ('-m tcp --dport 22 -m udp -j ACCEPT', '-m tcp -m udp --dport 22 -j ACCEPT', False),
+                         ])
+def test_identity(c_first, c_second, c_equal):
+    first = Rule.from_cli(c_first)
+    second = Rule.from_cli(c_second)
+
+    assert (first == second) is c_equal
+    assert (first != second) is not c_equal
+
+    if c_equal:
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+
+def test_counters_ignored():
+    rule = Rule.from_cli('-s 10.0.0.1/32 -j DROP')
+    counted = Rule.from_cli('-s 10.0.0.1/32 -j DROP')
+    counted.counters = (10, 600)
+
+    assert rule == counted
+    assert rule != '-s 10.0.0.1/32 -j DROP'
+
+
+def test_mutation():
+    rule = Rule.from_cli('-s 10.0.0.1/32 -j DROP')
+    other = Rule.from_cli('-s 10.0.0.1/32 -j ACCEPT')
+    first_hash = hash(rule)
+
+    assert rule != other
+
+    rule.action = 'ACCEPT'
+    assert rule == other
+    assert hash(rule) == hash(other) != first_hash
+
+    rule.match_params = (('-s', '10.0.0.2/32'),)
+    assert rule != other
+
+
+def test_delete():
+    chain = rule_set(['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP'])['filter']['FORWARD']
+    chain.delete(Rule.from_cli('-s 10.0.0.2/32 -j DROP'))
+
+    assert [str(rule) for rule in chain] == ['-s 10.0.0.1/32 -j DROP']
+
+
+def test_deduplicate():
+    rules = rule_set([
+        '-s 10.0.0.1/32 -j DROP',
+        '-s 10.0.0.1/32 -j LOG',
+        '-s 10.0.0.2/32 -j ACCEPT',
+        '-s 10.0.0.1/32 -j DROP',
+        '-s 10.0.0.1/32 -j LOG',
+        '-m limit --limit 5/sec -j ACCEPT',
+        '-m limit --limit 5/sec -j ACCEPT',
+        '-j LOGDROP',
+        '-j LOGDROP',
+        '-g LOGDROP',
+        '-g LOGDROP',
+    ])
+
+    assert rules.deduplicate() == 2
+    assert [str(rule) for rule in rules['filter']['FORWARD']] == [
+        '-s 10.0.0.1/32 -j DROP',
+        '-s 10.0.0.1/32 -j LOG',
+        '-s 10.0.0.2/32 -j ACCEPT',
+        '-s 10.0.0.1/32 -j LOG',
+        '-m limit --limit 5/sec -j ACCEPT',
+        '-m limit --limit 5/sec -j ACCEPT',
+        '-j LOGDROP',
+        '-j LOGDROP',
+        '-g LOGDROP',
+    ]
+    assert rules.deduplicate() == 0
+
+
+def test_intersection():
+    first = rule_set(['-s 10.0.0.1/32 -j DROP', '-s 10.0.0.2/32 -j DROP', '-s 10.0.0.3/32 -j DROP',
+                      '-j LOG', '-j LOG'])
+    second = rule_set(['-j LOG', '-s 10.0.0.3/32 -j DROP', '-s 10.0.0.1/32 -j DROP'])
+    third = rule_set(['-s 10.0.0.3/32 -j DROP', '-j LOG', '-s 10.0.0.1/32 -j DROP', '-s 10.0.0.4/32 -j DROP'])
+    third['filter'].delete_chain('LOGDROP')
+
+    common = first.intersection(second, third)
+
+    assert sorted(common.tables) == ['filter', 'mangle', 'nat']
+    assert sorted(common['filter'].chains) == ['FORWARD', 'INPUT', 'OUTPUT']
+    assert [str(rule) for rule in common['filter']['FORWARD']] == [
+        '-s 10.0.0.1/32 -j DROP',
+        '-s 10.0.0.3/32 -j DROP',
+        '-j LOG',
+    ]
+    assert common['filter']['FORWARD'].action == 'DROP'
+    assert len(first.intersection()['filter']['FORWARD']) == 5
+
+
+def test_model_import():
+    modules = subprocess.check_output([sys.executable, '-c', 'import sys, firewall_translator.iptables; '
+                                       'print(" ".join(sorted(sys.modules)))'],
+                                      cwd=os.path.join(os.path.dirname(__file__), '..', '..')).decode().split()
+
+    assert 'firewall_translator.classifier' not in modules
+    assert 'firewall_translator.iana' not in modules
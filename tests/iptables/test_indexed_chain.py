@@ -0,0 +1,162 @@
+import random
+
+import pytest
+
+from firewall_translator.diff import diff
+from firewall_translator.iptables import Chain, IndexedChain, Rule, RuleSet, Table
+
+
+def rules(count, start=0):
+    return [Rule.from_cli('-s 10.0.{}.{}/32 -j DROP'.format(index // 256, index % 256))
+            for index in range(start, start + count)]
+
+
+def test_render():
+    chain = IndexedChain('FORWARD', rules(3), 'DROP', block_size=2)
+    plain = Chain('FORWARD', rules(3), 'DROP')
+
+    assert str(chain) == str(plain)
+    assert len(chain) == 3
+    assert chain[-1] == plain[-1]
+    assert chain[1:] == plain[1:]
+    assert repr(chain) == '<IndexedChain FORWARD DROP>'
+
+
+def test_handles():
+    chain = IndexedChain('FORWARD', rules(10), block_size=2)
+    handle = chain.find(Rule.from_cli('-s 10.0.0.5/32 -j DROP'))
+
+    assert chain.position(handle) == 5
+
+    chain.insert(Rule.from_cli('-j LOG'), 0)
+    chain.delete(Rule.from_cli('-s 10.0.0.8/32 -j DROP'))
+    del chain[1]
+
+    assert chain.position(handle) == 5
+    assert handle.rule == chain[5]
+
+    chain.replace(handle, Rule.from_cli('-j ACCEPT'))
+    assert chain.find(Rule.from_cli('-s 10.0.0.5/32 -j DROP')) is None
+    assert chain.index(Rule.from_cli('-j ACCEPT')) == 5
+    assert Rule.from_cli('-j ACCEPT') in chain
+
+    chain.delete_handle(handle)
+    assert Rule.from_cli('-j ACCEPT') not in chain
+
+    with pytest.raises(ValueError):
+        chain.position(handle)
+
+    with pytest.raises(ValueError):
+        chain.delete(Rule.from_cli('-j ACCEPT'))
+
+    with pytest.raises(IndexError):
+        chain[len(chain)]
+
+
+def test_duplicates():
+    rule = Rule.from_cli('-j LOG')
+    chain = IndexedChain('FORWARD', rules(5) + [rule], block_size=2)
+    first = chain.insert(Rule.from_cli('-j LOG'), 1)
+
+    assert chain.count(rule) == 2
+    assert chain.find(rule) is first
+    assert [chain.position(handle) for handle in chain.find_all(rule)] == [1, 6]
+
+    chain.remove(rule)
+    assert chain.count(rule) == 1
+    assert chain.index(rule) == 5
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_random_edits(seed):
+    generator = random.Random(seed)
+    model = rules(200)
+    chain = IndexedChain('FORWARD', list(model), block_size=4)
+    extra = rules(200, 1000)
+
+    for _ in range(500):
+        operation = generator.randrange(5)
+
+        if operation == 0 or not model:
+            position = generator.randrange(len(model) + 1)
+            rule = generator.choice(extra)
+            model.insert(position, rule)
+            chain.insert(rule, position)
+
+        elif operation == 1:
+            position = generator.randrange(len(model))
+            del model[position]
+            del chain[position]
+
+        elif operation == 2:
+            rule = generator.choice(model)
+            model.remove(rule)
+            chain.delete(rule)
+
+        elif operation == 3:
+            position = generator.randrange(len(model))
+            rule = generator.choice(extra)
+            model[position] = rule
+            chain[position] = rule
+
+        else:
+            rule = generator.choice(model)
+            assert chain.index(rule) == model.index(rule)
+
+        assert len(chain) == len(model)
+
+    assert chain.rules == model
+    assert [chain.position(chain.find(rule)) for rule in model] == [model.index(rule) for rule in model]
+    assert [chain.offset(block) for block in chain.blocks] == \
+        [sum(len(block.handles) for block in chain.blocks[:index]) for index in range(len(chain.blocks))]
+
+
+def test_merge_blocks():
+    generator = random.Random(1)
+    chain = IndexedChain('FORWARD', rules(1000), block_size=8)
+    model = list(chain)
+
+    assert min(len(block.handles) for block in chain.blocks) >= 4
+
+    while len(model) > 1:
+        position = generator.randrange(len(model))
+        del model[position]
+        del chain[position]
+
+        assert all(len(block.handles) >= 4 for block in chain.blocks) or len(chain.blocks) == 1
+        assert chain[generator.randrange(len(model))] in model
+
+    assert len(chain.blocks) == 1
+    assert chain.rules == model
+    assert chain.position(chain.handle(0)) == 0
+
+
+def test_rules_assignment():
+    chain = IndexedChain('FORWARD', rules(10), block_size=2)
+    chain.rules = rules(3, 20)
+
+    assert [len(block.handles) for block in IndexedChain('FORWARD', rules(9), block_size=4).blocks] == [4, 5]
+
+    assert len(chain) == 3
+    assert chain.index(Rule.from_cli('-s 10.0.0.21/32 -j DROP')) == 1
+
+    del chain[:]
+    assert len(chain) == 0
+    assert chain.append(Rule.from_cli('-j LOG')).rule == chain[0]
+
+
+def test_diff_apply():
+    old = RuleSet()
+    old.read('*filter\n:FORWARD DROP [0:0]\n{}\nCOMMIT\n'.format(
+        '\n'.join('-A FORWARD {}'.format(rule) for rule in rules(50))))
+    new = RuleSet()
+    new.read('*filter\n:FORWARD DROP [0:0]\n{}\nCOMMIT\n'.format(
+        '\n'.join('-A FORWARD {}'.format(rule) for rule in rules(20) + rules(10, 100) + rules(25, 25))))
+
+    target = RuleSet({'filter': Table('filter', {
+        name: IndexedChain(name, list(chain.rules), chain.action, block_size=4)
+        for name, chain in old['filter'].chains.items()
+    })})
+    diff(old, new).apply(target)
+
+    assert str(target['filter']) == str(new['filter'])
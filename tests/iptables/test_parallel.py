@@ -0,0 +1,122 @@
+import os
+
+import pytest
+
+from firewall_translator.iptables import ParseTrace, RuleSet, split_tables
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+RULES = '''# Generated by iptables-save
+*nat
+:PREROUTING ACCEPT [5:300]
+:POSTROUTING ACCEPT [0:0]
+:PORTFW - [0:0]
+-A PREROUTING -i internet -j PORTFW
+-A PORTFW -p tcp -m tcp --dport 80 -j DNAT --to-destination 192.168.0.123
+-A POSTROUTING -o internet -j MASQUERADE
+COMMIT
+# Completed
+*filter
+:INPUT DROP [120:9000]
+:FORWARD DROP [0:0]
+:LOGDROP - [0:0]
+[10:600] -A INPUT -i lo -j ACCEPT
+-A INPUT -m comment --comment "ssh from lan" -i lan -p tcp -m tcp --dport 22 -j ACCEPT
+-A INPUT -j LOGDROP
+-A LOGDROP -j LOG --log-prefix "dropped: "
+-A LOGDROP -j DROP
+COMMIT
+*mangle
+:PREROUTING ACCEPT [0:0]
+-A PREROUTING -i lan -j MARK --set-xmark 0x1/0xffffffff
+COMMIT
+'''
+
+
+def parse(text, parallel, trace=None):
+    rule_set = RuleSet()
+
+    if parallel:
+        rule_set.read_parallel(text.splitlines(), 2, trace)
+    else:
+        rule_set.read_lines(text.splitlines(), trace)
+
+    return rule_set
+
+
+def state(rule_set):
+    return [(table.name, [(chain.name, chain.action, chain.packets, chain.bytes,
+                           [(str(rule), rule.counters) for rule in chain]) for chain in table])
+            for table in rule_set]
+
+
+def test_split_tables():
+    segments = split_tables(RULES.splitlines())
+
+    assert [(start, lines[0], lines[-1]) for start, lines in segments] == [
+        (1, '# Generated by iptables-save', '# Generated by iptables-save'),
+        (2, '*nat', 'COMMIT'),
+        (10, '# Completed', '# Completed'),
+        (11, '*filter', 'COMMIT'),
+        (21, '*mangle', 'COMMIT'),
+    ]
+
+
+@pytest.mark.parametrize('c_text',
+                         [
+                             RULES,
+                             RULES + '*filter\n:INPUT ACCEPT [0:0]\n:NEW - [0:0]\n-A NEW -j RETURN\n'
+                                     '-A LOGDROP -j ACCEPT\nCOMMIT\n',
+                             RULES.replace('COMMIT\n# Completed\n', ''),
+                             open(EXAMPLE).read(),
+                         ])
+def test_identical(c_text):
+    serial_trace = ParseTrace(16)
+    parallel_trace = ParseTrace(16)
+
+    serial = parse(c_text, False, serial_trace)
+    parallel = parse(c_text, True, parallel_trace)
+
+    assert state(parallel) == state(serial)
+    assert str(parallel) == str(serial)
+    assert list(parallel_trace) == list(serial_trace)
+
+
+@pytest.mark.parametrize('c_text, c_error',
+                         [
+                             (RULES.replace('-A LOGDROP -j DROP', '-A MISSING -j DROP'), KeyError),
+                             (RULES.replace('-A LOGDROP -j DROP', '-I LOGDROP -j DROP'), RuntimeError),
+                             (RULES.replace('*mangle', '*raw'), KeyError),
+                             (RULES.replace('[10:600]', '[10:x]'), ValueError),
+                         ])
+def test_errors(c_text, c_error):
+    serial = RuleSet()
+    parallel = RuleSet()
+
+    with pytest.raises(c_error) as serial_error:
+        serial.read_lines(c_text.splitlines())
+
+    with pytest.raises(c_error) as parallel_error:
+        parallel.read_parallel(c_text.splitlines(), 2)
+
+    assert str(parallel_error.value) == str(serial_error.value)
+    assert state(parallel) == state(serial)
+
+
+def test_read_from_file():
+    serial_trace = ParseTrace(64)
+    parallel_trace = ParseTrace(64)
+
+    serial = RuleSet()
+    serial.read_from_file(EXAMPLE, serial_trace)
+    parallel = RuleSet()
+    parallel.read_from_file(EXAMPLE, parallel_trace, workers=2)
+
+    assert str(parallel) == str(serial)
+    assert list(parallel_trace) == list(serial_trace)
+
+
+def test_split_tables_line_endings():
+    segments = split_tables(['*filter\r\n', ':INPUT ACCEPT [0:0]\n', 'COMMIT\n', '# Completed'])
+
+    assert segments == [(1, ['*filter', ':INPUT ACCEPT [0:0]', 'COMMIT']), (4, ['# Completed'])]
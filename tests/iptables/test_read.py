@@ -0,0 +1,35 @@
+import gzip
+import io
+import os
+
+from firewall_translator.iptables import RuleSet
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+
+def read_example():
+    with open(EXAMPLE) as f:
+        return f.read()
+
+
+def test_read_from_file():
+    expected = RuleSet()
+    expected.read(read_example())
+
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+
+    assert str(rule_set) == str(expected)
+    assert len(rule_set['filter']['FORWARD']) == 12
+    assert len(rule_set['nat']['PREROUTING']) == 3
+
+
+def test_read_lines_stream():
+    expected = RuleSet()
+    expected.read(read_example())
+
+    data = gzip.compress(read_example().encode())
+    rule_set = RuleSet()
+    rule_set.read_lines(gzip.GzipFile(fileobj=io.BytesIO(data)))
+
+    assert str(rule_set) == str(expected)
@@ -0,0 +1,78 @@
+import pytest
+
+from firewall_translator.iptables import RuleSet, Symbols
+
+RULES = '''*filter
+:INPUT DROP [0:0]
+:LOGDROP - [0:0]
+-A INPUT -i lan -p tcp -m tcp --dport 22 -j ACCEPT
+-A INPUT -i lan -p tcp -m tcp --dport 80 -j ACCEPT
+-A INPUT ! -i lan -m set --match-set blocked src -j LOGDROP
+-A INPUT -m set --match-set blocked src -j LOGDROP
+-A LOGDROP -m comment --comment "lan drop" -j LOG --log-prefix "dropped: "
+-A LOGDROP -j DROP
+COMMIT
+*nat
+:POSTROUTING ACCEPT [0:0]
+-A POSTROUTING -o lan -p tcp -j MASQUERADE
+COMMIT
+'''
+
+
+def parse(text, parallel=False, interned=True):
+    rule_set = RuleSet()
+
+    if not interned:
+        rule_set.symbols = None
+
+    if parallel:
+        rule_set.read_parallel(text.splitlines(), 2)
+    else:
+        rule_set.read(text)
+
+    return rule_set
+
+
+def test_symbols():
+    symbols = Symbols()
+    first = symbols.intern_pair(('-i', ''.join(['l', 'an'])))
+    second = symbols.intern_pair((''.join(['-', 'i']), 'lan'))
+
+    assert first is second
+    assert symbols.intern(''.join(['la', 'n'])) is first[1]
+    assert symbols.intern_params([('-i', 'lan'), ('-p', 'tcp')])[0] is first
+    assert symbols.intern(('blocked', 'src')) == ('blocked', 'src')
+    assert 'tcp' in symbols
+    assert len(symbols) == 5
+    assert len(symbols.pairs) == 2
+
+
+@pytest.mark.parametrize('c_parallel', [False, True])
+def test_shared(c_parallel):
+    rule_set = parse(RULES, c_parallel)
+    ssh, http, negated, blocked = rule_set['filter']['INPUT']
+    masquerade, = rule_set['nat']['POSTROUTING']
+
+    assert ssh.match_params[0] is http.match_params[0]
+    assert ssh.match_params[1] is masquerade.match_params[1]
+    assert ssh.match_params[0][1] is negated.match_params[0][1] is masquerade.match_params[0][1]
+    assert negated.match_params[2] is blocked.match_params[1]
+    assert ssh.action is http.action
+    assert negated.action is next(name for name in rule_set['filter'].chains if name == 'LOGDROP')
+    assert str(rule_set) == str(parse(RULES, interned=False))
+
+
+def test_disabled():
+    rule_set = parse(RULES, interned=False)
+    ssh, http, _, _ = rule_set['filter']['INPUT']
+
+    assert rule_set.symbols is None
+    assert ssh.match_params[0] == http.match_params[0]
+    assert ssh.match_params[0] is not http.match_params[0]
+
+
+def test_read_again():
+    rule_set = parse(RULES)
+    rule_set.read('*filter\n-A LOGDROP -i lan -p tcp -j DROP\nCOMMIT\n')
+
+    assert rule_set['filter']['LOGDROP'][-1].match_params[0] is rule_set['filter']['INPUT'][0].match_params[0]
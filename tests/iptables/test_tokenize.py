@@ -0,0 +1,68 @@
+import pytest
+
+from firewall_translator.iptables import Rule, tokenize
+
+
+@pytest.mark.parametrize('t_line, t_tokens',
+                         [
+                             ('-A FORWARD -i lan -j ACCEPT',
+                              [('-A', 'FORWARD'), ('-i', 'lan'), ('-j', 'ACCEPT')]),
+                             ('-p tcp -m tcp --dport 22 -m comment --comment "ssh access" -j ACCEPT',
+                              [('-p', 'tcp'), ('-m', 'tcp'), ('--dport', '22'), ('-m', 'comment'),
+                               ('--comment', 'ssh access'), ('-j', 'ACCEPT')]),
+                             ('! -s 10.0.0.0/8 -p tcp ! --syn -j DROP',
+                              [('! -s', '10.0.0.0/8'), ('-p', 'tcp'), ('! --syn', None), ('-j', 'DROP')]),
+                             ('-s ! 10.0.0.0/8 -j DROP',
+                              [('! -s', '10.0.0.0/8'), ('-j', 'DROP')]),
+                             ('-p tcp --tcp-flags SYN,RST SYN -j LOG --log-prefix \'a "b" \'',
+                              [('-p', 'tcp'), ('--tcp-flags', ('SYN,RST', 'SYN')), ('-j', 'LOG'),
+                               ('--log-prefix', 'a "b" ')]),
+                             ('-m comment --comment "-x \\"y\\"" -j ACCEPT',
+                              [('-m', 'comment'), ('--comment', '-x "y"'), ('-j', 'ACCEPT')]),
+                         ])
+def test_tokenize(t_line, t_tokens):
+    assert tokenize(t_line) == t_tokens
+
+
+@pytest.mark.parametrize('t_line, t_error',
+                         [
+                             ('! foo -j DROP', 'Value foo has no option'),
+                             ('foo -A X', 'Value foo has no option'),
+                             ('-A X -j DROP !', 'Trailing ! has no option'),
+                             ('! "foo" -j DROP', 'Value "foo" has no option'),
+                             ('-m comment --comment "x" !', 'Trailing ! has no option'),
+                         ])
+def test_tokenize_invalid(t_line, t_error):
+    with pytest.raises(ValueError, match=t_error):
+        tokenize(t_line)
+
+
+@pytest.mark.parametrize('r_line, r_match, r_action, r_action_params, r_goto',
+                         [
+                             ('-i lan -o wan -j ACCEPT', (('-i', 'lan'), ('-o', 'wan')), 'ACCEPT', (), False),
+                             ('-p udp -m udp --dport 53 -j REJECT --reject-with icmp-port-unreachable',
+                              (('-p', 'udp'), ('-m', 'udp'), ('--dport', '53')), 'REJECT',
+                              (('--reject-with', 'icmp-port-unreachable'),), False),
+                             ('-s 10.0.0.0/8 -g OTHER', (('-s', '10.0.0.0/8'),), 'OTHER', (), True),
+                             ('-s 10.0.0.0/8', (('-s', '10.0.0.0/8'),), None, (), False),
+                         ])
+def test_rule_from_cli(r_line, r_match, r_action, r_action_params, r_goto):
+    rule = Rule.from_cli(r_line)
+    assert rule.match_params == r_match
+    assert rule.action == r_action
+    assert rule.action_params == r_action_params
+    assert rule.goto is r_goto
+    assert str(rule) == r_line
+
+
+@pytest.mark.parametrize('r_line',
+                         [
+                             '-m comment --comment "a b" -j ACCEPT',
+                             '! -d 10.0.0.1/32 -m comment --comment "" -j LOG --log-prefix "x \\"y\\" "',
+                             '-m comment --comment "-x" -j ACCEPT',
+                             '-m comment --comment "--y" -j LOG --log-prefix "!"',
+                             '-m comment --comment "!" -j ACCEPT',
+                         ])
+def test_rule_round_trip(r_line):
+    assert tokenize(str(Rule.from_cli(r_line))) == tokenize(r_line)
+    assert str(Rule.from_cli(r_line)) == r_line
@@ -0,0 +1,39 @@
+import logging
+
+from firewall_translator.iptables import ParseTrace, RuleSet
+
+RULES = '''*filter
+:INPUT ACCEPT [0:0]
+-A INPUT -i lo -j ACCEPT
+-A INPUT -j DROP
+COMMIT
+'''
+
+
+def test_trace():
+    trace = ParseTrace()
+    RuleSet().read(RULES, trace)
+
+    assert list(trace) == [
+        (1, 'table', 'filter', None),
+        (2, 'chain', 'filter', 'INPUT'),
+        (3, 'rule', 'filter', 'INPUT'),
+        (4, 'rule', 'filter', 'INPUT'),
+        (5, 'commit', 'filter', None),
+    ]
+    assert str(trace).splitlines()[2] == '3: rule filter/INPUT'
+
+
+def test_trace_ring_buffer():
+    trace = ParseTrace(2)
+    RuleSet().read(RULES, trace)
+
+    assert len(trace) == 2
+    assert trace[0] == (4, 'rule', 'filter', 'INPUT')
+
+
+def test_debug_logging(caplog):
+    with caplog.at_level(logging.DEBUG, logger='firewall_translator.iptables'):
+        RuleSet().read(RULES)
+
+    assert 'Line 3: table filter, chain INPUT, rule' in caplog.text
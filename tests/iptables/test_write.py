@@ -0,0 +1,106 @@
+import io
+import os
+
+import pytest
+
+from firewall_translator.iptables import RestoreWriter, RuleSet, parse_counters
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+COUNTERS = '''*filter
+:INPUT DROP [120:9000]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [7:640]
+:LOGDROP - [0:0]
+[10:600] -A INPUT -i lo -j ACCEPT
+[3:180] -A INPUT -p tcp -m tcp --dport 22 -j LOGDROP
+-A LOGDROP -j LOG
+[3:180] -A LOGDROP -j DROP
+COMMIT
+'''
+
+
+class ChunkRecorder(io.StringIO):
+    def __init__(self):
+        super(ChunkRecorder, self).__init__()
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return super(ChunkRecorder, self).write(data)
+
+
+def example():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+    return rule_set
+
+
+def test_round_trip():
+    output = io.StringIO()
+    example().write(output)
+
+    rule_set = RuleSet()
+    rule_set.read(output.getvalue())
+
+    assert str(rule_set) == str(example())
+    assert output.getvalue().endswith('COMMIT\n')
+
+
+def test_headers_first():
+    lines = str(example()).splitlines()
+
+    assert lines[:5] == ['*filter', ':FORWARD ACCEPT [0:0]', ':INPUT ACCEPT [49:3480]', ':OUTPUT ACCEPT [28:2428]',
+                         ':NEWCHAIN - [0:0]']
+    assert lines[5].startswith('-A FORWARD ')
+
+
+@pytest.mark.parametrize('c_counters, c_lines',
+                         [
+                             (False, ['-A INPUT -i lo -j ACCEPT', '-A LOGDROP -j LOG']),
+                             (True, ['[10:600] -A INPUT -i lo -j ACCEPT', '-A LOGDROP -j LOG']),
+                         ])
+def test_counters(c_counters, c_lines):
+    rule_set = RuleSet()
+    rule_set.read(COUNTERS)
+
+    assert rule_set['filter']['INPUT'].packets == 120
+    assert rule_set['filter']['INPUT'].bytes == 9000
+    assert rule_set['filter']['INPUT'][1].counters == (3, 180)
+    assert rule_set['filter']['LOGDROP'][0].counters is None
+
+    output = io.StringIO()
+    rule_set.write(output, counters=c_counters)
+    lines = output.getvalue().splitlines()
+
+    assert ':INPUT DROP [120:9000]' in lines
+    assert ':OUTPUT ACCEPT [7:640]' in lines
+    assert c_lines[0] in lines
+    assert c_lines[1] in lines
+
+
+def test_binary():
+    output = io.BytesIO()
+    example().write(output)
+
+    assert output.getvalue().decode() == str(example()) + '\n'
+
+
+def test_chunks():
+    rule_set = RuleSet()
+    rule_set.read_lines(['*filter', ':INPUT ACCEPT [0:0]'] +
+                        ['-A INPUT -s 10.0.{}.{}/32 -j DROP'.format(index >> 8, index & 255) for index in range(100)] +
+                        ['COMMIT'])
+
+    output = ChunkRecorder()
+    writer = RestoreWriter(output, chunk_size=16)
+    writer.write_table(rule_set['filter'])
+
+    assert max(chunk.count('\n') for chunk in output.chunks) == 16
+    assert output.getvalue().count('\n') == 105
+
+
+@pytest.mark.parametrize('c_counters', ['', '[]', '[1:2', '1:2]', '[a:b]'])
+def test_invalid_counters(c_counters):
+    with pytest.raises(ValueError):
+        parse_counters(c_counters)
@@ -0,0 +1,158 @@
+import os
+import random
+
+import pytest
+
+from firewall_translator.classifier import Classifier
+from firewall_translator.iptables import Rule, RuleSet
+from firewall_translator.optimizer import Merge, Optimizer, evaluation_cost, optimize
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+
+def chain(lines):
+    rule_set = RuleSet()
+    rule_set.read('*filter\n:FORWARD DROP [0:0]\n{}\nCOMMIT\n'.format(
+        '\n'.join('-A FORWARD {}'.format(line) for line in lines)))
+    return rule_set
+
+
+@pytest.mark.parametrize('c_rules, c_optimized',
+                         [
+                             (['-d 10.0.0.0/32 -p tcp -m tcp --dport 80 -j ACCEPT',
+                               '-d 10.0.0.1/32 -p tcp -m tcp --dport 80 -j ACCEPT',
+                               '-d 10.0.0.2/31 -p tcp -m tcp --dport 80 -j ACCEPT',
+                               '-d 10.0.0.4/30 -p tcp -m tcp --dport 81 -j ACCEPT'],
+                              ['-d 10.0.0.0/30 -p tcp -m tcp --dport 80 -j ACCEPT',
+                               '-d 10.0.0.4/30 -p tcp -m tcp --dport 81 -j ACCEPT']),
+                             (['-s 10.0.0.0/25 -j DROP',
+                               '-s 10.0.0.128/25 -j DROP',
+                               '-s 10.0.1.0/24 -j DROP',
+                               '-s 10.0.3.0/24 -j DROP'],
+                              ['-s 10.0.0.0/23 -j DROP',
+                               '-s 10.0.3.0/24 -j DROP']),
+                             (['-p udp -m udp --dport 53 -j ACCEPT',
+                               '-p udp -m udp --dport 54 -j ACCEPT',
+                               '-p udp -m multiport --dports 55,60:70 -j ACCEPT'],
+                              ['-p udp -m multiport --dports 53:55,60:70 -j ACCEPT']),
+                             (['-p tcp -m tcp --dport 1000 -j ACCEPT',
+                               '-p tcp -m tcp --dport 1001 -j ACCEPT',
+                               '-p tcp -m tcp --dport 1002 -j ACCEPT'],
+                              ['-p tcp -m tcp --dport 1000:1002 -j ACCEPT']),
+                             (['-s 10.0.0.1/32 -p tcp -m tcp --dport 22 -j ACCEPT',
+                               '-s 10.0.0.0/32 -p tcp -m tcp --dport 22 -j ACCEPT',
+                               '-s 10.0.0.0/32 -p tcp -m tcp --dport 23 -j ACCEPT',
+                               '-s 10.0.0.1/32 -p tcp -m tcp --dport 23 -j ACCEPT'],
+                              ['-s 10.0.0.0/31 -p tcp -m tcp --dport 22:23 -j ACCEPT']),
+                             (['-s 10.0.0.0/32 -j LOG',
+                               '-s 10.0.0.1/32 -j LOG',
+                               '-s 10.0.0.0/32 -m limit --limit 5/sec -j ACCEPT',
+                               '-s 10.0.0.1/32 -m limit --limit 5/sec -j ACCEPT',
+                               '-s 10.0.0.0/32 -j ACCEPT',
+                               '-s 10.0.0.2/32 -j ACCEPT'],
+                              ['-s 10.0.0.0/32 -j LOG',
+                               '-s 10.0.0.1/32 -j LOG',
+                               '-s 10.0.0.0/32 -m limit --limit 5/sec -j ACCEPT',
+                               '-s 10.0.0.1/32 -m limit --limit 5/sec -j ACCEPT',
+                               '-s 10.0.0.0/32 -j ACCEPT',
+                               '-s 10.0.0.2/32 -j ACCEPT']),
+                             (['-s gateway.example.com -j ACCEPT',
+                               '-s 10.0.0.0/32 -j ACCEPT',
+                               '-s 10.0.0.1/32 -j ACCEPT'],
+                              ['-s gateway.example.com -j ACCEPT',
+                               '-s 10.0.0.0/31 -j ACCEPT']),
+                         ])
+def test_optimize(c_rules, c_optimized):
+    rule_set = chain(c_rules)
+    optimization, = [optimization for optimization in optimize(rule_set) if optimization.chain.name == 'FORWARD']
+
+    assert [str(rule) for rule in rule_set['filter']['FORWARD']] == c_optimized
+    assert optimization.before.worst == len(c_rules)
+    assert optimization.after.worst == len(c_optimized)
+
+
+def test_ports_split():
+    rule_set = chain(['-p tcp -m tcp --dport {} -j ACCEPT'.format(port) for port in range(1, 40, 2)])
+    optimize(rule_set)
+
+    assert [str(rule) for rule in rule_set['filter']['FORWARD']] == [
+        '-p tcp -m multiport --dports {} -j ACCEPT'.format(','.join(str(port) for port in range(1, 30, 2))),
+        '-p tcp -m multiport --dports {} -j ACCEPT'.format(','.join(str(port) for port in range(31, 40, 2))),
+    ]
+
+
+def test_cost():
+    cost = evaluation_cost([None] * 4)
+    assert cost.worst == 4
+    assert cost.average == pytest.approx((1 + 2 + 3 + 4 + 4) / 5)
+
+    cost = evaluation_cost([None] * 2, [3, 1])
+    assert cost.average == pytest.approx((3 * 1 + 1 * 2 + 2) / 5)
+
+
+def test_verify():
+    merge = Merge('-s', [Rule.from_cli('-s 10.0.0.0/32 -j DROP'), Rule.from_cli('-s 10.0.0.1/32 -j DROP')],
+                  [Rule.from_cli('-s 10.0.0.0/30 -j DROP')])
+
+    with pytest.raises(RuntimeError):
+        merge.verify()
+
+    merge.merged = [Rule.from_cli('-s 10.0.0.0/31 -j ACCEPT')]
+    with pytest.raises(RuntimeError):
+        merge.verify()
+
+    merge.merged = [Rule.from_cli('-s 10.0.0.0/31 -j DROP')]
+    merge.verify()
+
+
+def test_semantics():
+    generator = random.Random(5)
+    lines = []
+
+    while len(lines) < 400:
+        interface = generator.choice(['eth0', 'eth1'])
+        protocol = generator.choice(['tcp', 'udp'])
+        action = generator.choice(['ACCEPT', 'DROP'])
+        subnet = generator.randrange(4)
+        port = generator.randrange(20, 30)
+
+        for _ in range(generator.randrange(1, 8)):
+            if generator.random() < 0.5:
+                source = '10.0.{}.{}/{}'.format(subnet, generator.randrange(0, 256, 32), generator.choice([27, 32]))
+            else:
+                source = '10.0.{}.0/24'.format(subnet)
+                port = generator.randrange(20, 30)
+
+            lines.append('-s {} -i {} -p {} -m {} --dport {} -j {}'.format(source, interface, protocol, protocol, port,
+                                                                          action))
+
+    original = chain(lines)
+    optimized = chain(lines)
+    optimization = Optimizer().optimize(optimized['filter']['FORWARD'])
+    optimization.verify()
+    optimized['filter']['FORWARD'] = optimization.optimized
+
+    assert len(optimization.optimized) < len(lines)
+    assert optimization.after.average < optimization.before.average
+
+    before = Classifier(original)
+    after = Classifier(optimized)
+
+    for _ in range(2000):
+        packet = (generator.choice(['eth0', 'eth1']), None, '10.0.{}.{}'.format(generator.randrange(4),
+                                                                                 generator.randrange(256)),
+                  '192.168.0.1', generator.choice(['tcp', 'udp']), 1234, generator.randrange(18, 32))
+        assert before.classify('FORWARD', *packet).action == after.classify('FORWARD', *packet).action
+
+
+def test_example():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+
+    optimizations = {optimization.chain.name: optimization for optimization in optimize(rule_set)}
+    assert repr(optimizations['FORWARD']) == '<Optimization FORWARD 12 -> 11 rules>'
+    assert not optimizations['INPUT'].merges
+    assert rule_set['filter']['INPUT'].header() == ':INPUT ACCEPT [49:3480]'
+    assert str(rule_set['filter']['FORWARD'][0]) == \
+        '-d 192.168.0.123/32 -i internet -o lan -p tcp -m multiport --dports 80,443 -j ACCEPT'
+    assert sum(len(optimization.merges) for optimization in optimize(rule_set, 'nat')) == 0
@@ -0,0 +1,180 @@
+import io
+import os
+import pickle
+
+import pytest
+
+from firewall_translator import serialize
+from firewall_translator.iptables import Chain, IndexedChain, Rule, RuleSet, Table
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+RULES = '''*filter
+:INPUT DROP [120:9000]
+:FORWARD DROP [0:0]
+:LOGDROP - [0:0]
+[10:600] -A INPUT -i lo -j ACCEPT
+-A INPUT -m comment --comment "ssh from lan" -i lan -p tcp -m tcp --dport 22 -j ACCEPT
+-A INPUT ! -s 10.0.0.0/8 -m state --state RELATED,ESTABLISHED -j ACCEPT
+-A INPUT -g LOGDROP
+-A LOGDROP -j LOG --log-prefix "dropped: "
+-A LOGDROP -j DROP
+COMMIT
+*nat
+:PREROUTING ACCEPT [5:300]
+-A PREROUTING -p tcp -m tcp --dport 80 -j DNAT --to-destination 192.168.0.123
+COMMIT
+'''
+
+
+def state(rule_set):
+    return [(table.name, [(chain.name, chain.action, chain.packets, chain.bytes,
+                           [rule.__reduce__() for rule in chain]) for chain in table])
+            for table in rule_set]
+
+
+def parse(text):
+    rule_set = RuleSet()
+    rule_set.read(text)
+    return rule_set
+
+
+@pytest.mark.parametrize('c_rule_set',
+                         [
+                             parse(RULES),
+                             parse(open(EXAMPLE).read()),
+                             RuleSet(),
+                             RuleSet({}),
+                         ])
+def test_rule_set(c_rule_set):
+    loaded = serialize.loads(serialize.dumps(c_rule_set))
+
+    assert isinstance(loaded, RuleSet)
+    assert state(loaded) == state(c_rule_set)
+    assert str(loaded) == str(c_rule_set)
+
+
+@pytest.mark.parametrize('c_rule',
+                         [
+                             Rule(),
+                             Rule([('-s', '10.0.0.1/32')], 'DROP'),
+                             Rule([('! -s', '10.0.0.1/32'), ('-m', 'tcp'), ('--dport', '22')], 'ACCEPT'),
+                             Rule([('-m', 'recent'), ('--update', None), ('--seconds', '60')], 'DROP'),
+                             Rule([('-m', 'set'), ('--match-set', ('blocked', 'src'))], 'DROP'),
+                             Rule([('-m', 'multi'), ('--empty', ())], 'DROP'),
+                             Rule(action='LOGDROP', goto=True),
+                             Rule(action='LOG', action_params=[('--log-prefix', '"dropped: "')], counters=(10, 600)),
+                             Rule([('-i', 'ünïcode')], 'ACCEPT', counters=(2 ** 64 - 1, 0)),
+                             Rule([('-p', '')], ''),
+                         ])
+def test_rule(c_rule):
+    loaded = serialize.loads(serialize.dumps(c_rule))
+
+    assert isinstance(loaded, Rule)
+    assert loaded.__reduce__() == c_rule.__reduce__()
+    assert loaded == c_rule
+
+
+def test_table_and_chain():
+    rule_set = parse(RULES)
+    table = rule_set['filter']
+    chain = IndexedChain('INPUT', list(table['INPUT']), 'DROP')
+    chain.packets, chain.bytes = 120, 9000
+
+    loaded_table = serialize.loads(serialize.dumps(table))
+    loaded_chain = serialize.loads(serialize.dumps(chain))
+
+    assert isinstance(loaded_table, Table)
+    assert str(loaded_table) == str(table)
+    assert isinstance(loaded_chain, Chain)
+    assert (loaded_chain.name, loaded_chain.action, loaded_chain.packets, loaded_chain.bytes) == \
+        ('INPUT', 'DROP', 120, 9000)
+    assert list(loaded_chain) == list(chain)
+
+
+def test_shared_params():
+    chain = Chain('FORWARD', [Rule([('-i', 'lan'), ('-p', 'tcp')], 'ACCEPT'),
+                              Rule([('-i', 'lan'), ('-p', 'tcp')], 'LOG', [('--log-prefix', 'lan')])])
+    first, second = serialize.loads(serialize.dumps(chain))
+
+    assert first.match_params is second.match_params
+    assert first.match_params[1] is second.match_params[1]
+
+
+def test_lazy_chains():
+    rule_set = parse(RULES)
+    loaded = serialize.loads(serialize.dumps(rule_set))
+    chain = loaded['filter']['INPUT']
+    logdrop = loaded['filter']['LOGDROP']
+
+    assert isinstance(chain, serialize.LazyChain)
+    assert len(chain) == 4
+    assert chain.loaded is None
+
+    assert chain[0] == rule_set['filter']['INPUT'][0]
+    assert chain.decoder is None
+    assert logdrop.loaded is None
+
+    logdrop.append(Rule(action='RETURN'))
+    assert len(logdrop) == 3
+    assert str(logdrop[0]) == str(rule_set['filter']['LOGDROP'][0])
+
+    copied = pickle.loads(pickle.dumps(loaded['nat']['PREROUTING']))
+    assert type(copied) is Chain
+    assert (copied.packets, copied.bytes) == (5, 300)
+    assert list(copied) == list(rule_set['nat']['PREROUTING'])
+
+
+def test_file():
+    rule_set = parse(RULES)
+    buffer = io.BytesIO()
+    serialize.dump(rule_set, buffer)
+    buffer.seek(0)
+
+    assert str(serialize.load(buffer)) == str(rule_set)
+
+
+@pytest.mark.parametrize('c_item, c_error',
+                         [
+                             ('text', TypeError),
+                             (Rule([('--comment', 'a\0b')]), ValueError),
+                         ])
+def test_dumps_errors(c_item, c_error):
+    with pytest.raises(c_error):
+        serialize.dumps(c_item)
+
+
+@pytest.mark.parametrize('c_mangle',
+                         [
+                             lambda data: b'',
+                             lambda data: b'PICK' + data[4:],
+                             lambda data: data[:4] + b'\xff\xff' + data[6:],
+                             lambda data: data[:len(data) // 2],
+                             lambda data: data[:-1],
+                             lambda data: data + b'\0',
+                         ])
+def test_loads_errors(c_mangle):
+    with pytest.raises(ValueError):
+        serialize.loads(c_mangle(serialize.dumps(parse(RULES))))
+
+
+@pytest.mark.parametrize('c_section, c_index, c_value',
+                         [
+                             ('matches', 0, 1000),
+                             ('actions', -1, 1000),
+                             ('action_params', 2, 1000),
+                             ('param_pairs', 0, 1000),
+                             ('pairs', 1, 1000),
+                             ('chains', 0, 1000),
+                             ('counted', 1, 1),
+                             ('counted', 0, 2),
+                             ('gotos', 0, 7),
+                             ('chains', 2, 5),
+                             ('tables', 1, 1),
+                         ])
+def test_loads_corrupt_sections(c_section, c_index, c_value):
+    kind, strings, sections = serialize.read_sections(serialize.dumps(parse(RULES)))
+    sections[c_section][c_index] = c_value
+
+    with pytest.raises(ValueError):
+        serialize.loads(serialize.pack(kind, strings, sections))
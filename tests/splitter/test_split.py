@@ -0,0 +1,110 @@
+import os
+import random
+
+import pytest
+
+from firewall_translator.classifier import Classifier
+from firewall_translator.iptables import RuleSet
+from firewall_translator.splitter import ChainSplitter
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', '..', 'example', 'iptables-save.txt')
+
+INTERFACES = ['lan', 'wan', 'internet', 'dmz']
+
+
+def random_lines(generator, count):
+    for _ in range(count):
+        options = []
+
+        if generator.random() < 0.8:
+            options.append('-i {}'.format(generator.choice(INTERFACES + ['eth+'])))
+        if generator.random() < 0.6:
+            options.append('-o {}'.format(generator.choice(INTERFACES)))
+        if generator.random() < 0.5:
+            options.append('-s 10.{}.{}.0/24'.format(generator.randrange(4), generator.randrange(4)))
+        if generator.random() < 0.8:
+            protocol = generator.choice(['tcp', 'udp', 'icmp', '! tcp'])
+            options.append('-p {}'.format(protocol))
+            if protocol in ('tcp', 'udp'):
+                options.append('-m {} --dport {}'.format(protocol, generator.randrange(20, 30)))
+
+        options.append('-j {}'.format(generator.choice(['ACCEPT', 'ACCEPT', 'DROP', 'RETURN'])))
+        yield '-A FORWARD {}'.format(' '.join(options))
+
+
+def rule_set(lines):
+    rules = RuleSet()
+    rules.read('*filter\n:FORWARD DROP [0:0]\n{}\nCOMMIT\n'.format('\n'.join(lines)))
+    return rules
+
+
+def packets(generator, count):
+    for _ in range(count):
+        yield (generator.choice(INTERFACES + ['eth0', 'ppp0']), generator.choice(INTERFACES + ['eth1']),
+               '10.{}.{}.{}'.format(generator.randrange(5), generator.randrange(5), generator.randrange(256)),
+               '192.168.0.1', generator.choice(['tcp', 'udp', 'icmp', 'gre']), 1234, generator.randrange(18, 32))
+
+
+@pytest.mark.parametrize('c_options',
+                         [
+                             {},
+                             {'minimum': 2, 'max_depth': 1},
+                             {'minimum': 4, 'prefix_length': 16},
+                             {'options': ['-p', '-o'], 'minimum': 3},
+                         ])
+def test_semantics(c_options):
+    generator = random.Random(7)
+    lines = list(random_lines(generator, 600))
+    original = rule_set(lines)
+    split_rules = rule_set(lines)
+
+    split = ChainSplitter(**c_options).split(split_rules['filter'], 'FORWARD')
+
+    assert split.chains
+    assert set(split.chains) <= set(split_rules['filter'].chains)
+    assert max(len(name) for name in split.chains) <= 28
+    assert split.after.average < split.before.average
+    assert split.before.worst == len(lines)
+
+    before = Classifier(original)
+    after = Classifier(split_rules)
+
+    for packet in packets(generator, 3000):
+        expected = before.classify('FORWARD', *packet)
+        verdict = after.classify('FORWARD', *packet)
+        assert verdict.action == expected.action
+        assert str(verdict.rule) == str(expected.rule)
+
+
+def test_layout():
+    lines = ['-A FORWARD -i lan -p tcp -m tcp --dport {} -j ACCEPT'.format(port) for port in range(1, 5)]
+    lines += ['-A FORWARD -i wan -p udp -m udp --dport {} -j ACCEPT'.format(port) for port in range(1, 5)]
+    lines += ['-A FORWARD -p icmp -j ACCEPT', '-A FORWARD -i lan -j DROP']
+    rules = rule_set(lines)
+
+    split = ChainSplitter(options=['-i'], minimum=2).split(rules['filter'], 'FORWARD')
+
+    assert str(rules['filter']['FORWARD']).splitlines() == [
+        ':FORWARD DROP [0:0]',
+        '-A FORWARD -i lan -g FORWARD_i_lan',
+        '-A FORWARD -i wan -g FORWARD_i_wan',
+        '-A FORWARD -p icmp -j ACCEPT',
+    ]
+    assert str(rules['filter']['FORWARD_i_lan']).splitlines()[-2:] == [
+        '-A FORWARD_i_lan -p icmp -j ACCEPT',
+        '-A FORWARD_i_lan -i lan -j DROP',
+    ]
+    assert len(rules['filter']['FORWARD_i_wan']) == 5
+    assert split.before.worst == 10
+    assert split.after.worst == 7
+
+
+def test_small_chain():
+    rules = RuleSet()
+    rules.read_from_file(EXAMPLE)
+
+    split = ChainSplitter().split(rules['filter'], 'FORWARD')
+
+    assert split.chains == []
+    assert len(rules['filter']['FORWARD']) == 12
+    assert split.after.average == split.before.average
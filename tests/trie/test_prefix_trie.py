@@ -0,0 +1,57 @@
+import ipaddress
+
+import pytest
+
+from firewall_translator.generic import IPAddress
+from firewall_translator.trie import PrefixTrie
+
+PREFIXES = ['0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.2.0/24', '192.168.0.0/24', '2001:db8::/32']
+
+
+@pytest.fixture
+def trie():
+    return PrefixTrie((prefix, prefix) for prefix in PREFIXES)
+
+
+def networks(found):
+    return [str(network) for network, values in found]
+
+
+@pytest.mark.parametrize('t_address, t_longest',
+                         [
+                             ('10.1.2.3', '10.1.2.0/24'),
+                             ('10.1.3.3', '10.1.0.0/16'),
+                             ('10.2.0.0/16', '10.0.0.0/8'),
+                             ('172.16.0.1', '0.0.0.0/0'),
+                             ('2001:db8::1', '2001:db8::/32'),
+                             ('2001:db9::1', None),
+                         ])
+def test_longest_match(trie, t_address, t_longest):
+    found = trie.longest_match(t_address)
+
+    if t_longest is None:
+        assert found is None
+    else:
+        assert str(found[0]) == t_longest
+        assert found[1] == [t_longest]
+
+
+def test_covering(trie):
+    assert networks(trie.covering('10.1.2.0/25')) == ['0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.2.0/24']
+    assert networks(trie.covering(IPAddress('192.168.0.7'))) == ['0.0.0.0/0', '192.168.0.0/24']
+
+
+def test_covered_by(trie):
+    assert networks(trie.covered_by('10.0.0.0/8')) == ['10.0.0.0/8', '10.1.0.0/16', '10.1.2.0/24']
+    assert networks(trie.covered_by(ipaddress.ip_network('10.1.2.128/25'))) == []
+    assert len(trie.covered_by('0.0.0.0/0')) == 5
+
+
+def test_mapping(trie):
+    assert len(trie) == len(PREFIXES)
+    assert '10.1.0.0/16' in trie
+    assert '10.1.0.0/17' not in trie
+    assert trie['192.168.0.0/24'] == ['192.168.0.0/24']
+
+    with pytest.raises(KeyError):
+        trie['10.1.0.0/17']
@@ -0,0 +1,88 @@
+import os
+import random
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from firewall_translator.classifier import Classifier  # noqa: E402
+from firewall_translator.iptables import RuleSet  # noqa: E402
+from firewall_translator.vectorized import BatchClassifier  # noqa: E402
+
+TESTS = os.path.join(os.path.dirname(__file__), '..')
+EXAMPLE = os.path.join(TESTS, '..', 'example', 'iptables-save.txt')
+
+RULES = '''*filter
+:INPUT DROP [0:0]
+:SERVICES - [0:0]
+:ADMIN - [0:0]
+-A INPUT -i lo -j ACCEPT
+-A INPUT -p tcp -m multiport --dports 80,443,8000:8999 -j SERVICES
+-A INPUT -s 10.0.0.0/8 -j ADMIN
+-A INPUT -p udp ! --dport 53 -j REJECT --reject-with icmp-port-unreachable
+-A INPUT -i eth+ -p icmp -j ACCEPT
+-A SERVICES ! -s 192.168.0.0/16 -j RETURN
+-A SERVICES -j LOG
+-A SERVICES -p tcp -m tcp --dport 443 -j ACCEPT
+-A SERVICES -p tcp -m tcp --dport 8000:8100 -j ACCEPT
+-A ADMIN -p tcp -m tcp --dport 22 -g SERVICES
+-A ADMIN -p tcp -m tcp --dport 23 -j DROP
+COMMIT
+'''
+
+INTERFACES = ['internet', 'lan', 'wan', 'lo', 'eth0']
+ADDRESSES = ['192.168.0.123', '192.168.0.1', '192.168.0.7', '192.168.1.7', '10.0.0.1', '8.8.8.8', '127.0.0.1']
+
+
+def packets(count):
+    generator = random.Random(1)
+
+    return {
+        'in_iface': [generator.choice(INTERFACES) for _ in range(count)],
+        'out_iface': [generator.choice(INTERFACES) for _ in range(count)],
+        'src': [generator.choice(ADDRESSES) for _ in range(count)],
+        'dst': [generator.choice(ADDRESSES) for _ in range(count)],
+        'proto': [generator.choice(['tcp', 'udp', 'icmp']) for _ in range(count)],
+        'sport': [generator.randrange(1024, 65536) for _ in range(count)],
+        'dport': [generator.choice([22, 23, 53, 80, 123, 443, 8050, 8200]) for _ in range(count)],
+    }
+
+
+def compare(rule_set, chain, columns):
+    result = BatchClassifier(rule_set).evaluate(chain, **columns)
+    classifier = Classifier(rule_set)
+
+    for index in range(len(result)):
+        verdict = classifier.classify(chain, *[None if columns[field] is None else columns[field][index] for field in
+                                               ['in_iface', 'out_iface', 'src', 'dst', 'proto', 'sport', 'dport']])
+        assert result.verdicts[index] == verdict.action
+        assert result.chains[index] == verdict.chain
+        assert result.positions[index] == (-1 if verdict.position is None else verdict.position)
+
+    return result
+
+
+def test_example():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+
+    result = compare(rule_set, 'FORWARD', packets(500))
+    assert set(result.counts()) == {'ACCEPT', 'DROP', 'REJECT'}
+
+
+def test_jumps():
+    rule_set = RuleSet()
+    rule_set.read(RULES)
+
+    columns = packets(500)
+    columns['out_iface'] = None
+    result = compare(rule_set, 'INPUT', columns)
+    assert set(result.chains) == {'INPUT', 'SERVICES', 'ADMIN'}
+
+
+def test_mismatched_columns():
+    rule_set = RuleSet()
+    rule_set.read_from_file(EXAMPLE)
+
+    with pytest.raises(ValueError):
+        BatchClassifier(rule_set).evaluate('FORWARD', src=['10.0.0.1'], dst=['10.0.0.1', '10.0.0.2'])
@@ -1,7 +1,12 @@
+import array
 import os
+import sys
+
 import requests
 import lxml.etree
 
+from firewall_translator import iana
+
 PROTOCOLS_URL = 'https://www.iana.org/assignments/protocol-numbers/protocol-numbers.xml'
 SERVICES_URL = 'https://www.iana.org/assignments/service-names-port-numbers/service-names-port-numbers.xml'
 XML_NS = {None: 'http://www.iana.org/assignments'}
@@ -58,43 +63,124 @@ def get_services_from_iana():
                 yield protocol, name, number
 
 
-def protocols_gen():
-    protocols_list = sorted(get_protocols_from_iana())
+def get_protocols():
+    protocols = {}
+    for name, number in sorted(get_protocols_from_iana()):
+        protocols[name] = number
 
-    yield 'PROTOCOLS = {'
-    for name, number in protocols_list:
-        yield '    \'{}\': Protocol({}, \'{}\'),'.format(name, number, name)
-    yield '}'
+    return protocols
 
 
-def services_gen():
-    services_dict = {}
+def get_services():
+    services = {}
     for protocol, name, number in get_services_from_iana():
-        if protocol not in services_dict:
-            services_dict[protocol] = {name: number}
-        else:
-            services_dict[protocol].update({name: number})
+        services.setdefault(protocol, {})[name] = number
+
+    return services
+
+
+def table_gen(numbers, indent=''):
+    line = []
+    width = len(indent) + 2
+
+    for name, number in sorted(numbers.items()):
+        field = '{} {}'.format(name, number)
+
+        if line and width + len(field) + 1 > 100:
+            yield '{}\'{} \''.format(indent, ' '.join(line))
+            line = []
+            width = len(indent) + 2
 
+        line.append(field)
+        width += len(field) + 1
+
+    if line:
+        yield '{}\'{}\''.format(indent, ' '.join(line))
+
+
+def protocols_gen(protocols):
+    yield 'PROTOCOLS = ('
+    for line in table_gen(protocols, '    '):
+        yield line
+    yield ')'
+
+
+def services_gen(services):
     yield 'SERVICES = {'
-    for protocol, services in sorted(services_dict.items()):
-        yield '    \'{}\': {{'.format(protocol)
-        for name, number in sorted(services.items()):
-            yield '        \'{}\': Service(PROTOCOLS[\'{}\'], {}, \'{}\'),'.format(name, protocol, number, name)
-        yield '    },'
+    for protocol, numbers in sorted(services.items()):
+        yield '    \'{}\': ('.format(protocol)
+        for line in table_gen(numbers, '        '):
+            yield line
+        yield '    ),'
     yield '}'
 
 
-def main():
-    file_path = os.path.join(os.path.dirname(__file__), 'firewall_translator', 'iana.py')
+def write_module(file_path, protocols, services):
     with open(file_path, 'w') as f:
-        f.write('from firewall_translator.generic import Protocol, Service\n')
+        f.write('# Generated by update_iana.py, do not edit.\n')
+        f.write('#\n')
+        f.write('# Each table is a flat "name number name number ..." string decoded on demand\n')
+        f.write('# by firewall_translator.iana.\n')
         f.write('\n')
 
-        for generator in [protocols_gen, services_gen]:
-            for line in generator():
+        for lines in [protocols_gen(protocols), services_gen(services)]:
+            for line in lines:
                 f.write(line)
                 f.write('\n')
 
 
+def little_endian(values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def write_snapshot(file_path, protocols, services):
+    groups = [('', protocols)] + sorted(services.items())
+    records_start = iana.SNAPSHOT_HEADER.size + len(groups) * iana.SNAPSHOT_GROUP.size
+
+    pool = bytearray()
+    directory = []
+    records = bytearray()
+
+    for group, numbers in groups:
+        names = sorted(numbers)
+        order = sorted(range(len(names)), key=lambda index: (numbers[names[index]], names[index]))
+
+        directory.append((len(pool), len(group), len(names), records_start + len(records)))
+        pool += group.encode('ascii')
+
+        offsets = array.array('I')
+        for name in names:
+            offsets.append(len(pool))
+            pool += name.encode('ascii')
+        offsets.append(len(pool))
+
+        records += little_endian(offsets)
+        records += little_endian(array.array('H', [numbers[name] for name in names]))
+        records += bytes(-len(records) % 4)
+        records += little_endian(array.array('I', order))
+
+    with open(file_path, 'wb') as f:
+        f.write(iana.SNAPSHOT_HEADER.pack(iana.SNAPSHOT_MAGIC, iana.SNAPSHOT_VERSION, len(groups),
+                                          records_start + len(records), len(pool)))
+
+        for entry in directory:
+            f.write(iana.SNAPSHOT_GROUP.pack(*entry))
+
+        f.write(records)
+        f.write(pool)
+
+
+def main():
+    directory = os.path.join(os.path.dirname(__file__), 'firewall_translator')
+    protocols = get_protocols()
+    services = get_services()
+
+    write_snapshot(os.path.join(directory, 'iana.dat'), protocols, services)
+    write_module(os.path.join(directory, 'iana_data.py'), protocols, services)
+
+
 if __name__ == '__main__':
     main()